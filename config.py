@@ -55,6 +55,10 @@ supported_servers = {
 
 SSO_LOGOFF_SERENITY='https://login.evepc.163.com/account/logoff'
 ESI_CACHE = 'esi_cache'
+# Persistent cache of ESI dynamic (mutated) item data, see service.port.muta
+ESI_DYNAMIC_ITEM_CACHE = 'esi_dynamic_items'
+# Compiled item name -> type ID map, see service.itemNameResolver
+ITEM_NAME_CACHE = 'item_names.json'
 
 LOGLEVEL_MAP = {
     "critical": CRITICAL,
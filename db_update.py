@@ -19,6 +19,7 @@
 #======================================================================
 
 
+import argparse
 import functools
 import itertools
 import json
@@ -27,8 +28,9 @@ import re
 import sqlite3
 import sys
 
-import sqlalchemy.orm
-from sqlalchemy import or_, and_
+import sqlalchemy
+from sqlalchemy import Boolean, Float, Integer, String, and_, bindparam, select
+from sqlalchemy.orm import ColumnProperty, SynonymProperty
 
 
 # todo: need to set the EOS language to en, becasuse this assumes it's being run within an English context
@@ -39,6 +41,36 @@ JSON_DIR = os.path.join(ROOT_DIR, 'staticdata')
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 GAMEDATA_SCHEMA_VERSION = 4
+# Amount of rows passed to a single executemany() call
+INSERT_BATCH_SIZE = 50000
+# Amount of characters read from JSON dumps at once
+JSON_READ_CHUNK = 1024 * 1024
+# Fresh DB is thrown away if build fails, so we can trade durability guarantees for speed while
+# writing it; not used on incremental updates, which rewrite existing DB in place
+BUILD_PRAGMAS = (
+    'PRAGMA synchronous = OFF',
+    'PRAGMA journal_mode = MEMORY',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -262144')
+
+
+def _get_db_versions():
+    """Return (data version, schema version) of existing gamedata DB; raise if we cannot fetch them."""
+    db_data_version = None
+    db_schema_version = None
+    db = sqlite3.connect(DB_PATH)
+    try:
+        cursor = db.cursor()
+        cursor.execute('SELECT field_value FROM metadata WHERE field_name = \'client_build\'')
+        for row in cursor:
+            db_data_version = int(row[0])
+        cursor.execute('SELECT field_value FROM metadata WHERE field_name = \'schema_version\'')
+        for row in cursor:
+            db_schema_version = int(row[0])
+        cursor.close()
+    finally:
+        db.close()
+    return db_data_version, db_schema_version
 
 
 def db_needs_update():
@@ -54,19 +86,8 @@ def db_needs_update():
     if not os.path.isfile(DB_PATH):
         print('Gamedata DB not found')
         return True
-    db_data_version = None
-    db_schema_version = None
     try:
-        db = sqlite3.connect(DB_PATH)
-        cursor = db.cursor()
-        cursor.execute('SELECT field_value FROM metadata WHERE field_name = \'client_build\'')
-        for row in cursor:
-            db_data_version = int(row[0])
-        cursor.execute('SELECT field_value FROM metadata WHERE field_name = \'schema_version\'')
-        for row in cursor:
-            db_schema_version = int(row[0])
-        cursor.close()
-        db.close()
+        db_data_version, db_schema_version = _get_db_versions()
     except (KeyboardInterrupt, SystemExit):
         raise
     except:
@@ -81,137 +102,334 @@ def db_needs_update():
     return False
 
 
-def update_db():
+def findRemovedTypes(categoryIDs, groupRows, itemRows):
+    """
+    Return IDs of types which go away together with removed categories.
+
+    Categories used to be deleted via ORM session, and cascades of gamedata
+    mappers took their groups, types of those groups, variations of those types
+    (recursively), and type attributes and effects along with them; this
+    reproduces the same set of types on raw rows.
+
+    :param categoryIDs: IDs of removed categories
+    :param groupRows: rows of groups table
+    :param itemRows: {type ID: row of types table}
+    """
+    groupIDs = {r['groupID'] for r in groupRows if r['categoryID'] in categoryIDs}
+    typeIDs = {t for t, r in itemRows.items() if r['groupID'] in groupIDs}
+    # Variations go away together with their parent
+    while True:
+        children = {t for t, r in itemRows.items() if r.get('variationParentTypeID') in typeIDs} - typeIDs
+        if not children:
+            break
+        typeIDs.update(children)
+    return typeIDs
+
+
+def _iterJsonEntries(path):
+    """
+    Iterate over top-level container of JSON file without loading all of it at once.
+    Yield (key, value) pairs for objects and values for arrays.
+    """
+    decoder = json.JSONDecoder()
+    skipWs = re.compile(r'\s*').match
+    with open(path, encoding='utf-8') as f:
+        buf = f.read(JSON_READ_CHUNK)
+        pos = skipWs(buf).end()
+        isDict = buf[pos] == '{'
+        closing = '}' if isDict else ']'
+        pos += 1
+        first = True
+        eof = False
+        while True:
+            try:
+                p = skipWs(buf, pos).end()
+                if buf[p] == closing:
+                    return
+                if not first:
+                    if buf[p] != ',':
+                        raise json.JSONDecodeError('Expecting \',\' delimiter', buf, p)
+                    p = skipWs(buf, p + 1).end()
+                if isDict:
+                    key, p = decoder.raw_decode(buf, p)
+                    p = skipWs(buf, p).end()
+                    if buf[p] != ':':
+                        raise json.JSONDecodeError('Expecting \':\' delimiter', buf, p)
+                    p = skipWs(buf, p + 1).end()
+                value, p = decoder.raw_decode(buf, p)
+                # Make sure value has not been cut short by end of buffer
+                p = skipWs(buf, p).end()
+                if p >= len(buf):
+                    raise json.JSONDecodeError('Unexpected end of data', buf, p)
+            except (json.JSONDecodeError, IndexError):
+                # Entry does not fit into what we have read so far
+                if eof:
+                    raise
+                chunk = f.read(JSON_READ_CHUNK)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield (key, value) if isDict else value
+            first = False
+            pos = p
+
+
+def _columnCoercer(column):
+    """Return function which converts source value into what SQLite gives back for given column."""
+    colType = column.type
+    if isinstance(colType, Boolean):
+        converter = bool
+    elif isinstance(colType, Integer):
+        converter = int
+    elif isinstance(colType, Float):
+        converter = float
+    elif isinstance(colType, String):
+        converter = str
+    else:
+        return lambda v: v
+    return lambda v: None if v is None else converter(v)
+
+
+def _normalizeRows(table, rows):
+    """Convert dicts keyed by column names into tuples ordered like table columns."""
+    coercers = [(c.key, _columnCoercer(c)) for c in table.columns]
+    for row in rows:
+        yield tuple(coercer(row.get(key)) for key, coercer in coercers)
+
+
+def _insertRows(conn, table, rows):
+    columnNames = table.columns.keys()
+    stmt = table.insert()
+    rows = iter(rows)
+    while True:
+        batch = [dict(zip(columnNames, row)) for row in itertools.islice(rows, INSERT_BATCH_SIZE)]
+        if not batch:
+            break
+        conn.execute(stmt, batch)
+
+
+def _diffKeyColumns(table):
+    """
+    Rows are compared in groups sharing value of these columns. Per-type tables are grouped
+    by type ID, so that everything we know about a type is rewritten at once.
+    """
+    pkColumns = list(table.primary_key.columns)
+    if 'typeID' in table.columns and table.columns['typeID'] in pkColumns:
+        return [table.columns['typeID']]
+    return pkColumns or list(table.columns)
+
+
+def _syncTable(conn, table, rows):
+    """Rewrite only those row groups of the table which differ from passed rows. Return amount of changed groups."""
+    columnNames = table.columns.keys()
+    keyColumns = _diffKeyColumns(table)
+    keyIndices = [columnNames.index(c.key) for c in keyColumns]
+
+    def groupRows(rowIter):
+        groups = {}
+        for row in rowIter:
+            groups.setdefault(tuple(row[i] for i in keyIndices), set()).add(tuple(row))
+        return groups
+
+    newGroups = groupRows(rows)
+    oldGroups = groupRows(conn.execute(select(table)))
+    changedKeys = [k for k in newGroups.keys() | oldGroups.keys() if newGroups.get(k) != oldGroups.get(k)]
+    if not changedKeys:
+        return 0
+    deleteStmt = table.delete().where(and_(*(c == bindparam('_key_{}'.format(c.key)) for c in keyColumns)))
+    for i in range(0, len(changedKeys), INSERT_BATCH_SIZE):
+        conn.execute(deleteStmt, [
+            {'_key_{}'.format(c.key): v for c, v in zip(keyColumns, key)}
+            for key in changedKeys[i:i + INSERT_BATCH_SIZE]])
+    _insertRows(conn, table, [row for k in changedKeys for row in newGroups.get(k, ())])
+    return len(changedKeys)
+
+
+def update_db(incremental=False):
+    """
+    Compose gamedata DB out of JSON dumps in staticdata folder.
+
+    In incremental mode, existing DB is compared against the new data and only
+    changed types (and rows of other tables) are rewritten. If existing DB
+    cannot be updated this way, it is rebuilt from scratch.
+    """
+    if incremental:
+        db_schema_version = None
+        if os.path.isfile(DB_PATH):
+            try:
+                _, db_schema_version = _get_db_versions()
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except:
+                pass
+        if db_schema_version != GAMEDATA_SCHEMA_VERSION:
+            print('Gamedata DB cannot be updated incrementally, rebuilding it')
+            incremental = False
 
-    print('Building gamedata DB...')
+    print('Updating gamedata DB...' if incremental else 'Building gamedata DB...')
 
-    if os.path.isfile(DB_PATH):
+    if not incremental and os.path.isfile(DB_PATH):
         os.remove(DB_PATH)
 
     import eos.db
     import eos.gamedata
     import eos.config
+    from eos.db.gamedata.attribute import attributes_table, typeattributes_table
+    from eos.db.gamedata.category import categories_table
+    from eos.db.gamedata.effect import effects_table, typeeffects_table
+    from eos.db.gamedata.group import groups_table
+    from eos.db.gamedata.item import items_table
 
     # Create the database tables
     eos.db.gamedata_meta.create_all()
 
-    def _readData(minerName, jsonName, keyIdName=None):
-        compiled_data = None
+    # Rows of tables which need post-processing before they are written, format: {table: [{column name: value}]}
+    tableRows = {}
+
+    def _iterData(minerName, jsonName, keyIdName=None):
+        # Yields rows one by one; for objects w/o keyIdName, (key, row) pairs are yielded
         for i in itertools.count(0):
-            try:
-                with open(os.path.join(JSON_DIR, minerName, '{}.{}.json'.format(jsonName, i)), encoding='utf-8') as f:
-                    rawData = json.load(f)
-                    if i == 0:
-                        compiled_data = {} if type(rawData) == dict else []
-                    if type(rawData) == dict:
-                        compiled_data.update(rawData)
-                    else:
-                        compiled_data.extend(rawData)
-            except FileNotFoundError:
+            path = os.path.join(JSON_DIR, minerName, '{}.{}.json'.format(jsonName, i))
+            if not os.path.isfile(path):
                 break
+            for entry in _iterJsonEntries(path):
+                if not keyIdName:
+                    yield entry
+                    continue
+                # IDs in keys, rows in values
+                k, row = entry
+                row[keyIdName] = int(k)
+                yield row
+
+    def _columnName(mapper, attrName):
+        # Resolve mapped attribute name (which can be a synonym) into column name,
+        # None if it's not something stored in the class' table
+        prop = mapper.attrs.get(attrName)
+        while isinstance(prop, SynonymProperty):
+            prop = mapper.attrs.get(prop.name)
+        if isinstance(prop, ColumnProperty):
+            return prop.columns[0].key
+        return None
 
-        if not keyIdName:
-            return compiled_data
-        # IDs in keys, rows in values
-        data = []
-        for k, v in compiled_data.items():
-            row = {}
-            row.update(v)
-            row[keyIdName] = int(k)
-            data.append(row)
-        return data
-
-    def _addRows(data, cls, fieldMap=None):
+    def _convertRows(data, mapper, fieldMap=None):
         if fieldMap is None:
             fieldMap = {}
+        columnNames = {}
         for row in data:
-            instance = cls()
+            newRow = {}
             for k, v in row.items():
+                try:
+                    columnName = columnNames[k]
+                except KeyError:
+                    columnName = columnNames[k] = _columnName(mapper, fieldMap.get(k, k))
+                if columnName is None:
+                    continue
                 if isinstance(v, str):
                     v = v.strip()
-                setattr(instance, fieldMap.get(k, k), v)
-            eos.db.gamedata_session.add(instance)
+                newRow[columnName] = v
+            yield newRow
+
+    def _addRows(data, cls, fieldMap=None):
+        # Keep rows around for post-processing, they are written at the very end
+        mapper = sqlalchemy.inspect(cls)
+        tableRows.setdefault(mapper.local_table, []).extend(_convertRows(data, mapper, fieldMap))
+
+    def _writeRows(data, cls, fieldMap=None):
+        # Stream rows straight into the DB; every table should be written only once
+        mapper = sqlalchemy.inspect(cls)
+        _flushTable(mapper.local_table, _convertRows(data, mapper, fieldMap))
+
+    def _flushTable(table, rows):
+        rows = _normalizeRows(table, rows)
+        if incremental:
+            changed = _syncTable(conn, table, rows)
+            print('{}: {} changed'.format(table.name, changed))
+        else:
+            _insertRows(conn, table, rows)
 
     def processEveTypes():
         print('processing evetypes')
-        data = _readData('fsd_built', 'types', keyIdName='typeID')
-        for row in data:
-            if (
-                # Apparently people really want Civilian modules available
-                (row['typeName_en-us'].startswith('Civilian') and "Shuttle" not in row['typeName_en-us'])
-                or row['typeName_en-us'] == 'Capsule'
-                or row['groupID'] == 4033  # destructible effect beacons
-                or row['typeID'] == 82941  # Metenox service
-                or re.match(r'AIR .+Booster.*', row['typeName_en-us'])
-            ):
-                row['published'] = True
-            # Nearly useless and clutter search results too much
-            elif (
-                row['typeName_en-us'].startswith('Limited Synth ')
-                or row['typeName_en-us'].startswith('Expired ')
-                or re.match(r'Mining Blitz .+ Booster Dose .+', row['typeName_en-us'])
-                or row['typeName_en-us'].endswith(' Filament') and (
-                    "'Needlejack'" not in row['typeName_en-us'] and
-                    "'Devana'" not in row['typeName_en-us'] and
-                    "'Pochven'" not in row['typeName_en-us'] and
-                    "'Extraction'" not in row['typeName_en-us'] and
-                    "'Krai Veles'" not in row['typeName_en-us'] and
-                    "'Krai Perun'" not in row['typeName_en-us'] and
-                    "'Krai Svarog'" not in row['typeName_en-us']
-                )
-            ):
-                row['published'] = False
 
-        newData = []
-        for row in data:
-            if (
-                row['published'] or
-                # group Ship Modifiers, for items like tactical t3 ship modes
-                row['groupID'] == 1306 or
-                # Micro Bombs (Fighters)
-                row['typeID'] in (41549, 41548, 41551, 41550) or
-                # Abyssal weather (environment)
-                row['groupID'] in (
-                    1882,
-                    1975,
-                    1971,
-                    1983)  # the "container" for the abyssal environments
-            ):
-                newData.append(row)
+        def filterTypes(data):
+            for row in data:
+                if (
+                    # Apparently people really want Civilian modules available
+                    (row['typeName_en-us'].startswith('Civilian') and "Shuttle" not in row['typeName_en-us'])
+                    or row['typeName_en-us'] == 'Capsule'
+                    or row['groupID'] == 4033  # destructible effect beacons
+                    or row['typeID'] == 82941  # Metenox service
+                    or re.match(r'AIR .+Booster.*', row['typeName_en-us'])
+                ):
+                    row['published'] = True
+                # Nearly useless and clutter search results too much
+                elif (
+                    row['typeName_en-us'].startswith('Limited Synth ')
+                    or row['typeName_en-us'].startswith('Expired ')
+                    or re.match(r'Mining Blitz .+ Booster Dose .+', row['typeName_en-us'])
+                    or row['typeName_en-us'].endswith(' Filament') and (
+                        "'Needlejack'" not in row['typeName_en-us'] and
+                        "'Devana'" not in row['typeName_en-us'] and
+                        "'Pochven'" not in row['typeName_en-us'] and
+                        "'Extraction'" not in row['typeName_en-us'] and
+                        "'Krai Veles'" not in row['typeName_en-us'] and
+                        "'Krai Perun'" not in row['typeName_en-us'] and
+                        "'Krai Svarog'" not in row['typeName_en-us']
+                    )
+                ):
+                    row['published'] = False
+
+                if (
+                    row['published'] or
+                    # group Ship Modifiers, for items like tactical t3 ship modes
+                    row['groupID'] == 1306 or
+                    # Micro Bombs (Fighters)
+                    row['typeID'] in (41549, 41548, 41551, 41550) or
+                    # Abyssal weather (environment)
+                    row['groupID'] in (
+                        1882,
+                        1975,
+                        1971,
+                        1983)  # the "container" for the abyssal environments
+                ):
+                    # These are stored on types, but we expose them as regular attributes
+                    for attrId, attrName in {4: 'mass', 38: 'capacity', 161: 'volume', 162: 'radius'}.items():
+                        if attrName in row:
+                            typesBaseAttribs.setdefault(row['typeID'], {})[attrId] = row[attrName]
+                    yield row
+
         map = {'typeName_en-us': 'typeName', 'description_en-us': '_description'}
         map.update({'description'+v: '_description'+v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
-        _addRows(newData, eos.gamedata.Item, fieldMap=map)
-        return newData
+        _addRows(filterTypes(_iterData('fsd_built', 'types', keyIdName='typeID')), eos.gamedata.Item, fieldMap=map)
 
     def processEveGroups():
         print('processing evegroups')
-        data = _readData('fsd_built', 'groups', keyIdName='groupID')
+        data = _iterData('fsd_built', 'groups', keyIdName='groupID')
         map = {'groupName_en-us': 'name'}
         map.update({'groupName'+v: 'name'+v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
         _addRows(data, eos.gamedata.Group, fieldMap=map)
-        return data
 
     def processEveCategories():
         print('processing evecategories')
-        data = _readData('fsd_built', 'categories', keyIdName='categoryID')
+        data = _iterData('fsd_built', 'categories', keyIdName='categoryID')
         map = { 'categoryName_en-us': 'name' }
         map.update({'categoryName'+v: 'name'+v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
         _addRows(data, eos.gamedata.Category, fieldMap=map)
 
     def processDogmaAttributes():
         print('processing dogmaattributes')
-        data = _readData('fsd_built', 'dogmaattributes', keyIdName='attributeID')
+        data = _iterData('fsd_built', 'dogmaattributes', keyIdName='attributeID')
         map = {
             'displayName_en-us': 'displayName',
             # 'tooltipDescription_en-us': 'tooltipDescription'
         }
         _addRows(data, eos.gamedata.AttributeInfo, fieldMap=map)
 
-    def processDogmaTypeAttributes(eveTypesData):
-        print('processing dogmatypeattributes')
-        data = _readData('fsd_built', 'typedogma', keyIdName='typeID')
-        eveTypeIds = set(r['typeID'] for r in eveTypesData)
-        newData = []
+    def processDogmaTypes():
+        # Attributes and effects are stored in the same file, go through it only once
+        print('processing dogmatypeattributes and dogmatypeeffects')
+        attrData = []
+        effectData = []
         seenKeys = set()
 
         def checkKey(key):
@@ -220,100 +438,82 @@ def update_db():
             seenKeys.add(key)
             return True
 
-        for typeData in data:
-            if typeData['typeID'] not in eveTypeIds:
+        for typeData in _iterData('fsd_built', 'typedogma', keyIdName='typeID'):
+            typeID = typeData['typeID']
+            if typeID not in itemRows:
                 continue
             for row in typeData.get('dogmaAttributes', ()):
-                row['typeID'] = typeData['typeID']
-                if checkKey((row['typeID'], row['attributeID'])):
-                    newData.append(row)
-        for row in eveTypesData:
-            for attrId, attrName in {4: 'mass', 38: 'capacity', 161: 'volume', 162: 'radius'}.items():
-                if attrName in row and checkKey((row['typeID'], attrId)):
-                    newData.append({'typeID': row['typeID'], 'attributeID': attrId, 'value': row[attrName]})
+                row['typeID'] = typeID
+                if checkKey((typeID, row['attributeID'])):
+                    attrData.append(row)
+            for row in typeData.get('dogmaEffects', ()):
+                row['typeID'] = typeID
+                effectData.append(row)
+        for typeID, baseAttribs in typesBaseAttribs.items():
+            for attrId, value in baseAttribs.items():
+                if checkKey((typeID, attrId)):
+                    attrData.append({'typeID': typeID, 'attributeID': attrId, 'value': value})
 
-        _addRows(newData, eos.gamedata.Attribute)
-        return newData
+        _addRows(attrData, eos.gamedata.Attribute)
+        _addRows(effectData, eos.gamedata.ItemEffect)
 
     def processDynamicItemAttributes():
         print('processing dynamicitemattributes')
-        data = _readData('fsd_built', 'dynamicitemattributes')
-        for mutaID, mutaData in data.items():
-            muta = eos.gamedata.DynamicItem()
-            muta.typeID = mutaID
-            muta.resultingTypeID = mutaData['inputOutputMapping'][0]['resultingType']
-            eos.db.gamedata_session.add(muta)
-
-            for x in mutaData['inputOutputMapping'][0]['applicableTypes']:
-                item = eos.gamedata.DynamicItemItem()
-                item.typeID = mutaID
-                item.applicableTypeID = x
-                eos.db.gamedata_session.add(item)
-
-            for attrID, attrData in mutaData['attributeIDs'].items():
-                attr = eos.gamedata.DynamicItemAttribute()
-                attr.typeID = mutaID
-                attr.attributeID = attrID
-                attr.min = attrData['min']
-                attr.max = attrData['max']
-                eos.db.gamedata_session.add(attr)
+        mutaData = []
+        mutaItemData = []
+        mutaAttrData = []
+        for mutaID, mutaRow in _iterData('fsd_built', 'dynamicitemattributes'):
+            mutaID = int(mutaID)
+            mutaData.append({'typeID': mutaID, 'resultingTypeID': mutaRow['inputOutputMapping'][0]['resultingType']})
+            for x in mutaRow['inputOutputMapping'][0]['applicableTypes']:
+                mutaItemData.append({'typeID': mutaID, 'applicableTypeID': x})
+            for attrID, attrData in mutaRow['attributeIDs'].items():
+                mutaAttrData.append({'typeID': mutaID, 'attributeID': int(attrID), 'min': attrData['min'], 'max': attrData['max']})
+        _writeRows(mutaData, eos.gamedata.DynamicItem)
+        _writeRows(mutaItemData, eos.gamedata.DynamicItemItem)
+        _writeRows(mutaAttrData, eos.gamedata.DynamicItemAttribute)
 
     def processDogmaEffects():
         print('processing dogmaeffects')
-        data = _readData('fsd_built', 'dogmaeffects', keyIdName='effectID')
+        data = _iterData('fsd_built', 'dogmaeffects', keyIdName='effectID')
         _addRows(data, eos.gamedata.Effect, fieldMap={'resistanceAttributeID': 'resistanceID'})
 
-    def processDogmaTypeEffects(eveTypesData):
-        print('processing dogmatypeeffects')
-        data = _readData('fsd_built', 'typedogma', keyIdName='typeID')
-        eveTypeIds = set(r['typeID'] for r in eveTypesData)
-        newData = []
-        for typeData in data:
-            if typeData['typeID'] not in eveTypeIds:
-                continue
-            for row in typeData.get('dogmaEffects', ()):
-                row['typeID'] = typeData['typeID']
-                newData.append(row)
-        _addRows(newData, eos.gamedata.ItemEffect)
-        return newData
-
     def processDogmaUnits():
         print('processing dogmaunits')
-        data = _readData('fsd_built', 'dogmaunits', keyIdName='unitID')
-        _addRows(data, eos.gamedata.Unit, fieldMap={
+        data = _iterData('fsd_built', 'dogmaunits', keyIdName='unitID')
+        _writeRows(data, eos.gamedata.Unit, fieldMap={
             'name': 'unitName',
             'displayName_en-us': 'displayName'
         })
 
     def processMarketGroups():
         print('processing marketgroups')
-        data = _readData('fsd_built', 'marketgroups', keyIdName='marketGroupID')
+        data = _iterData('fsd_built', 'marketgroups', keyIdName='marketGroupID')
         map = {
             'name_en-us': 'marketGroupName',
             'description_en-us': '_description',
         }
         map.update({'name'+v: 'marketGroupName'+v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
         map.update({'description' + v: '_description' + v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
-        _addRows(data, eos.gamedata.MarketGroup, fieldMap=map)
+        _writeRows(data, eos.gamedata.MarketGroup, fieldMap=map)
 
     def processMetaGroups():
         print('processing metagroups')
-        data = _readData('fsd_built', 'metagroups', keyIdName='metaGroupID')
+        data = _iterData('fsd_built', 'metagroups', keyIdName='metaGroupID')
         map = {'name_en-us': 'metaGroupName'}
         map.update({'name' + v: 'metaGroupName' + v for (k, v) in eos.config.translation_mapping.items() if k != 'en'})
-        _addRows(data, eos.gamedata.MetaGroup, fieldMap=map)
+        _writeRows(data, eos.gamedata.MetaGroup, fieldMap=map)
 
     def processCloneGrades():
         print('processing clonegrades')
-        data = _readData('fsd_lite', 'clonegrades')
 
         newData = []
         # December, 2017 - CCP decided to use only one set of skill levels for alpha clones. However, this is still
         # represented in the data as a skillset per race. To ensure that all skills are the same, we store them in a way
         # that we can check to make sure all races have the same skills, as well as skill levels
         check = {}
-        for ID in data:
-            for skill in data[ID]['skills']:
+        for ID, cloneGradeData in _iterData('fsd_lite', 'clonegrades'):
+            for skill in cloneGradeData['skills']:
                 newData.append({
                     'alphaCloneID': int(ID),
                     'alphaCloneName': 'Alpha Clone',
@@ -328,19 +528,15 @@ def update_db():
         if len(newData) == 0:
             raise Exception('Alpha Clone processing failed')
 
-        tmp = []
+        cloneData = []
         for row in newData:
-            if row['alphaCloneID'] not in tmp:
-                cloneParent = eos.gamedata.AlphaClone()
-                setattr(cloneParent, 'alphaCloneID', row['alphaCloneID'])
-                setattr(cloneParent, 'alphaCloneName', row['alphaCloneName'])
-                eos.db.gamedata_session.add(cloneParent)
-                tmp.append(row['alphaCloneID'])
-        _addRows(newData, eos.gamedata.AlphaCloneSkill)
+            if row['alphaCloneID'] not in [r['alphaCloneID'] for r in cloneData]:
+                cloneData.append({'alphaCloneID': row['alphaCloneID'], 'alphaCloneName': row['alphaCloneName']})
+        _writeRows(cloneData, eos.gamedata.AlphaClone)
+        _writeRows(newData, eos.gamedata.AlphaCloneSkill)
 
     def processTraits():
         print('processing traits')
-        data = _readData('phobos', 'traits')
 
         def convertSection(sectionData):
             sectionLines = []
@@ -353,37 +549,40 @@ def update_db():
             sectionLine = '<br />\n'.join(sectionLines)
             return sectionLine
 
-        newData = []
-        for row in data:
-            try:
-                newRow = {
-                    'typeID': row['typeID'],
-                }
-                for (k, v) in eos.config.translation_mapping.items():
-                    if v == '':
-                        v = '_en-us'
-                    typeLines = []
-                    traitData = row['traits{}'.format(v)]
-                    for skillData in sorted(traitData.get('skills', ()), key=lambda i: i['header']):
-                        typeLines.append(convertSection(skillData))
-                    if 'role' in traitData:
-                        typeLines.append(convertSection(traitData['role']))
-                    if 'misc' in traitData:
-                        typeLines.append(convertSection(traitData['misc']))
-                    traitLine = '<br />\n<br />\n'.join(typeLines)
-                    newRow['traitText{}'.format(v)] = traitLine
-
-                newData.append(newRow)
-            except:
-                pass
-        _addRows(newData, eos.gamedata.Traits, fieldMap={'traitText_en-us': 'traitText'})
+        def convertTraits(data):
+            for row in data:
+                try:
+                    # Traits of types we are going to remove are not needed
+                    if row['typeID'] in removedTypeIDs:
+                        continue
+                    newRow = {
+                        'typeID': row['typeID'],
+                    }
+                    for (k, v) in eos.config.translation_mapping.items():
+                        if v == '':
+                            v = '_en-us'
+                        typeLines = []
+                        traitData = row['traits{}'.format(v)]
+                        for skillData in sorted(traitData.get('skills', ()), key=lambda i: i['header']):
+                            typeLines.append(convertSection(skillData))
+                        if 'role' in traitData:
+                            typeLines.append(convertSection(traitData['role']))
+                        if 'misc' in traitData:
+                            typeLines.append(convertSection(traitData['misc']))
+                        traitLine = '<br />\n<br />\n'.join(typeLines)
+                        newRow['traitText{}'.format(v)] = traitLine
+                except:
+                    continue
+                yield newRow
+
+        _writeRows(convertTraits(_iterData('phobos', 'traits')), eos.gamedata.Traits, fieldMap={'traitText_en-us': 'traitText'})
 
     def processMetadata():
         print('processing metadata')
-        data = _readData('phobos', 'metadata')
+        data = _iterData('phobos', 'metadata')
         _addRows(data, eos.gamedata.MetaData)
 
-    def processReqSkills(eveTypesData):
+    def processReqSkills():
         print('processing requiredskillsfortypes')
 
         def composeReqSkills(raw):
@@ -392,24 +591,22 @@ def update_db():
                 reqSkills[int(skillTypeID)] = skillLevel
             return reqSkills
 
-        eveTypeIds = set(r['typeID'] for r in eveTypesData)
-        data = _readData('fsd_built', 'requiredskillsfortypes')
         reqsByItem = {}
         itemsByReq = {}
-        for typeID, skillreqData in data.items():
+        for typeID, skillreqData in _iterData('fsd_built', 'requiredskillsfortypes'):
             typeID = int(typeID)
-            if typeID not in eveTypeIds:
+            if typeID not in itemRows:
                 continue
             for skillTypeID, skillLevel in composeReqSkills(skillreqData).items():
                 reqsByItem.setdefault(typeID, {})[skillTypeID] = skillLevel
                 itemsByReq.setdefault(skillTypeID, {})[typeID] = skillLevel
-        for item in eos.db.gamedata_session.query(eos.gamedata.Item).all():
-            if item.typeID in reqsByItem:
-                item.reqskills = json.dumps(reqsByItem[item.typeID])
-            if item.typeID in itemsByReq:
-                item.requiredfor = json.dumps(itemsByReq[item.typeID])
+        for typeID, itemRow in itemRows.items():
+            if typeID in reqsByItem:
+                itemRow['reqskills'] = json.dumps(reqsByItem[typeID])
+            if typeID in itemsByReq:
+                itemRow['requiredfor'] = json.dumps(itemsByReq[typeID])
 
-    def processReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData):
+    def processReplacements():
         print('finding item replacements')
 
         def compareAttrs(attrs1, attrs2):
@@ -430,21 +627,16 @@ def update_db():
             1289: 1287,
             1290: 1288}
         skillReqAttribsFlat = set(skillReqAttribs.keys()).union(skillReqAttribs.values())
-        # Get data on type groups
-        # Format: {type ID: group ID}
-        typesGroups = {}
-        for row in eveTypesData:
-            typesGroups[row['typeID']] = row['groupID']
         # Get data on item effects
         # Format: {type ID: set(effect, IDs)}
         typesEffects = {}
-        for row in dogmaTypeEffectsData:
+        for row in tableRows[typeeffects_table]:
             typesEffects.setdefault(row['typeID'], set()).add(row['effectID'])
         # Get data on type attributes
         # Format: {type ID: {attribute ID: attribute value}}
         typesNormalAttribs = {}
         typesSkillAttribs = {}
-        for row in dogmaTypeAttributesData:
+        for row in tableRows[typeattributes_table]:
             attributeID = row['attributeID']
             if attributeID in skillReqAttribsFlat:
                 typeSkillAttribs = typesSkillAttribs.setdefault(row['typeID'], {})
@@ -483,16 +675,16 @@ def update_db():
                 typeSkillReqs[skillType] = skillLevel
         # Format: {group ID: category ID}
         groupCategories = {}
-        for row in eveGroupsData:
+        for row in tableRows[groups_table]:
             groupCategories[row['groupID']] = row['categoryID']
         # As EVE affects various types mostly depending on their group or skill requirements,
         # we're going to group various types up this way
         # Format: {(group ID, frozenset(skillreq, type, IDs), frozenset(type, effect, IDs): [type ID, {attribute ID: attribute value}]}
         groupedData = {}
-        for row in eveTypesData:
-            typeID = row['typeID']
+        for typeID, row in itemRows.items():
+            typeGroup = row['groupID']
             # Ignore items outside of categories we need
-            if groupCategories[typesGroups[typeID]] not in (
+            if groupCategories[typeGroup] not in (
                 6,  # Ship
                 7,  # Module
                 8,  # Charge
@@ -513,7 +705,6 @@ def update_db():
                 continue
             # We need only skill types, not levels for keys
             typeSkillreqs = frozenset(typesSkillReqs.get(typeID, {}))
-            typeGroup = typesGroups[typeID]
             typeEffects = frozenset(typesEffects.get(typeID, ()))
             groupData = groupedData.setdefault((typeGroup, typeSkillreqs, typeEffects), [])
             groupData.append((typeID, typeAttribs))
@@ -526,24 +717,24 @@ def update_db():
                 if compareAttrs(type1[1], type2[1]):
                     replacements.setdefault(type1[0], set()).add(type2[0])
                     replacements.setdefault(type2[0], set()).add(type1[0])
-        # Update DB session with data we generated
-        for item in eos.db.gamedata_session.query(eos.gamedata.Item).all():
-            itemReplacements = replacements.get(item.typeID)
-            if itemReplacements is not None:
-                item.replacements = ','.join('{}'.format(tid) for tid in sorted(itemReplacements))
+        # Update rows with data we generated
+        for typeID, itemReplacements in replacements.items():
+            itemRow = itemRows.get(typeID)
+            if itemRow is not None:
+                itemRow['replacements'] = ','.join('{}'.format(tid) for tid in sorted(itemReplacements))
 
-    def processImplantSets(eveTypesData):
+    def processImplantSets():
         print('composing implant sets')
         # Includes only implants which can be considered part of sets, not all implants
         implant_groups = (300, 1730)
         specials = {'Genolution': ('Genolution Core Augmentation', r'CA-\d+')}
         implantSets = {}
-        for row in eveTypesData:
+        for row in itemRows.values():
             if not row.get('published'):
                 continue
             if row.get('groupID') not in implant_groups:
                 continue
-            typeName = row.get('typeName_en-us', '')
+            typeName = row.get('typeName') or ''
             # Regular sets matching
             m = re.match(r'(?P<grade>(High|Mid|Low)-grade) (?P<set>\w+) (?P<implant>(Alpha|Beta|Gamma|Delta|Epsilon|Omega))', typeName, re.IGNORECASE)
             if m:
@@ -560,18 +751,36 @@ def update_db():
             if len(implants) < 2:
                 continue
             implants = ','.join('{}'.format(tid) for tid in sorted(implants))
-            row = {'setName': setName, 'gradeName': gradeName, 'implants': implants}
+            # Assign IDs ourselves, so that they stay the same between incremental updates
+            row = {'setID': len(data) + 1, 'setName': setName, 'gradeName': gradeName, 'implants': implants}
             data.append(row)
-        _addRows(data, eos.gamedata.ImplantSet)
-
-    eveTypesData = processEveTypes()
-    eveGroupsData = processEveGroups()
+        _writeRows(data, eos.gamedata.ImplantSet)
+
+    # Categories we do not need at all, together with their groups and types
+    removedCategoryIDs = (
+        30,  # Apparel
+    )
+
+    # Do not let session opened on eos.db import keep the DB locked
+    eos.db.gamedata_session.close()
+    conn = eos.db.gamedata_engine.connect()
+    if not incremental:
+        for pragma in BUILD_PRAGMAS:
+            conn.exec_driver_sql(pragma)
+    transaction = conn.begin()
+
+    # Format: {type ID: base attribute ID: value}
+    typesBaseAttribs = {}
+    processEveTypes()
+    # Format: {type ID: row}, rows are shared with the table data
+    itemRows = {row['typeID']: row for row in tableRows[items_table]}
+    processEveGroups()
     processEveCategories()
+    removedTypeIDs = findRemovedTypes(removedCategoryIDs, tableRows[groups_table], itemRows)
     processDogmaAttributes()
-    dogmaTypeAttributesData = processDogmaTypeAttributes(eveTypesData)
+    processDogmaTypes()
     processDynamicItemAttributes()
     processDogmaEffects()
-    dogmaTypeEffectsData = processDogmaTypeEffects(eveTypesData)
     processDogmaUnits()
     processMarketGroups()
     processMetaGroups()
@@ -579,82 +788,82 @@ def update_db():
     processTraits()
     processMetadata()
 
-    eos.db.gamedata_session.flush()
-    processReqSkills(eveTypesData)
-    processReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData)
-    processImplantSets(eveTypesData)
+    processReqSkills()
+    processReplacements()
+    processImplantSets()
 
     # Add schema version to prevent further updates
-    metadata_schema_version = eos.gamedata.MetaData()
-    metadata_schema_version.field_name = 'schema_version'
-    metadata_schema_version.field_value = GAMEDATA_SCHEMA_VERSION
-    eos.db.gamedata_session.add(metadata_schema_version)
-
-    eos.db.gamedata_session.flush()
+    _addRows([{'field_name': 'schema_version', 'field_value': GAMEDATA_SCHEMA_VERSION}], eos.gamedata.MetaData)
 
     # CCP still has 5 subsystems assigned to T3Cs, even though only 4 are available / usable. They probably have some
     # old legacy requirement or assumption that makes it difficult for them to change this value in the data. But for
     # pyfa, we can do it here as a post-processing step
-    for attr in eos.db.gamedata_session.query(eos.gamedata.Attribute).filter(eos.gamedata.Attribute.ID == 1367).all():
-        attr.value = 4.0
-    for item in eos.db.gamedata_session.query(eos.gamedata.Item).filter(or_(
-        eos.gamedata.Item.name.like('%abyssal%'),
-        eos.gamedata.Item.name.like('%mutated%'),
-        eos.gamedata.Item.name.like('%_PLACEHOLDER%'),
-        # Drifter weapons are published for some reason
-        eos.gamedata.Item.name.in_(('Lux Kontos', 'Lux Xiphos', 'Lux Ballistra', 'Lux Kopis'))
-    )).all():
-        if 'Asteroid Mining Crystal' in item.name:
+    for attrRow in tableRows[typeattributes_table]:
+        if attrRow['attributeID'] == 1367:
+            attrRow['value'] = 4.0
+    # Mirrors case-insensitive LIKE patterns '%abyssal%', '%mutated%' and '%_PLACEHOLDER%'
+    hiddenNamePattern = re.compile(r'abyssal|mutated|.placeholder', re.IGNORECASE)
+    for itemRow in itemRows.values():
+        typeName = itemRow.get('typeName') or ''
+        if not (
+            hiddenNamePattern.search(typeName)
+            # Drifter weapons are published for some reason
+            or typeName in ('Lux Kontos', 'Lux Xiphos', 'Lux Ballistra', 'Lux Kopis')
+        ):
+            continue
+        if 'Asteroid Mining Crystal' in typeName:
             continue
-        if 'Mutated Drone Specialization' in item.name:
+        if 'Mutated Drone Specialization' in typeName:
             continue
-        item.published = False
+        itemRow['published'] = False
 
-    for x in [
-        30  # Apparel
-    ]:
-        cat = eos.db.gamedata_session.query(eos.gamedata.Category).filter(eos.gamedata.Category.ID == x).first()
-        print ('Removing Category: {}'.format(cat.name))
-        eos.db.gamedata_session.delete(cat)
+    for cat in [r for r in tableRows[categories_table] if r['categoryID'] in removedCategoryIDs]:
+        print ('Removing Category: {}'.format(cat['name']))
+        tableRows[categories_table].remove(cat)
+    tableRows[groups_table] = [r for r in tableRows[groups_table] if r['categoryID'] not in removedCategoryIDs]
+    for typeID in removedTypeIDs:
+        del itemRows[typeID]
+    for table in (items_table, typeattributes_table, typeeffects_table):
+        tableRows[table] = [r for r in tableRows[table] if r['typeID'] not in removedTypeIDs]
+
+    # Format: {(type ID, attribute ID): row}
+    typeAttrRows = {(r['typeID'], r['attributeID']): r for r in tableRows[typeattributes_table]}
 
     # Unused normally, can be useful for customizing items
     def _copyItem(srcName, tgtTypeID, tgtName):
-        eveType = eos.db.gamedata_session.query(eos.gamedata.Item).filter(eos.gamedata.Item.name == srcName).one()
-        eos.db.gamedata_session.expunge(eveType)
-        sqlalchemy.orm.make_transient(eveType)
-        eveType.ID = tgtTypeID
+        srcRow = next(r for r in itemRows.values() if r.get('typeName') == srcName)
+        srcTypeID = srcRow['typeID']
+        tgtRow = dict(srcRow, typeID=tgtTypeID)
         for suffix in eos.config.translation_mapping.values():
-            setattr(eveType, f'typeName{suffix}', tgtName)
-        eos.db.gamedata_session.add(eveType)
-        eos.db.gamedata_session.flush()
+            tgtRow[f'typeName{suffix}'] = tgtName
+        itemRows[tgtTypeID] = tgtRow
+        tableRows[items_table].append(tgtRow)
+        for table in (typeattributes_table, typeeffects_table):
+            rows = tableRows[table]
+            copies = [dict(r, typeID=tgtTypeID) for r in rows if r['typeID'] == srcTypeID]
+            rows.extend(copies)
+            if table is typeattributes_table:
+                typeAttrRows.update({(tgtTypeID, r['attributeID']): r for r in copies})
 
     def _hardcodeAttribs(typeID, attrMap):
         for attrName, value in attrMap.items():
-            try:
-                attr = eos.db.gamedata_session.query(eos.gamedata.Attribute).filter(and_(
-                    eos.gamedata.Attribute.name == attrName, eos.gamedata.Attribute.typeID == typeID)).one()
-            except sqlalchemy.orm.exc.NoResultFound:
-                attrInfo = eos.db.gamedata_session.query(eos.gamedata.AttributeInfo).filter(eos.gamedata.AttributeInfo.name == attrName).one()
-                attr = eos.gamedata.Attribute()
-                attr.attributeID = attrInfo.ID
-                attr.typeID = typeID
-                attr.value = value
-                eos.db.gamedata_session.add(attr)
-            else:
-                attr.value = value
+            attrID = next(r['attributeID'] for r in tableRows[attributes_table] if r.get('attributeName') == attrName)
+            attrRow = typeAttrRows.get((typeID, attrID))
+            if attrRow is None:
+                attrRow = typeAttrRows[(typeID, attrID)] = {'typeID': typeID, 'attributeID': attrID}
+                tableRows[typeattributes_table].append(attrRow)
+            attrRow['value'] = value
 
     def _hardcodeEffects(typeID, effectMap, clearEffects=True):
-        item = eos.db.gamedata_session.query(eos.gamedata.Item).filter(eos.gamedata.Item.ID == typeID).one()
+        if typeID not in itemRows:
+            raise LookupError('Type {} not found'.format(typeID))
         if clearEffects:
-            item.effects.clear()
+            tableRows[typeeffects_table] = [r for r in tableRows[typeeffects_table] if r['typeID'] != typeID]
         for effectID, effectName in effectMap.items():
-            try:
-                effect = eos.db.gamedata_session.query(eos.gamedata.Effect).filter(eos.gamedata.Effect.ID == effectID).one()
-            except sqlalchemy.orm.exc.NoResultFound:
-                effect = eos.gamedata.Effect()
-                effect.effectID = effectID
-                effect.effectName = effectName
-            item.effects[effectName] = effect
+            if not any(r['effectID'] == effectID for r in tableRows[effects_table]):
+                tableRows[effects_table].append({'effectID': effectID, 'effectName': effectName})
+            if not any(r['typeID'] == typeID and r['effectID'] == effectID for r in tableRows[typeeffects_table]):
+                tableRows[typeeffects_table].append({'typeID': typeID, 'effectID': effectID})
 
     def hardcodeSuppressionTackleRange():
         beaconTypeID = 79839
@@ -664,7 +873,6 @@ def update_db():
         effectMap = {100000: 'pyfaCustomSuppressionTackleRange'}
         _hardcodeAttribs(beaconTypeID, attrMap)
         _hardcodeEffects(beaconTypeID, effectMap)
-        eos.db.gamedata_session.flush()
 
     def hardcodeSovUpgradeBuffs():
         typeBuffMap = {
@@ -700,7 +908,6 @@ def update_db():
         for typeID, attrMap in typeBuffMap.items():
             _hardcodeAttribs(typeID, attrMap)
             _hardcodeEffects(typeID, effectMap, clearEffects=False)
-            eos.db.gamedata_session.flush()
 
 
     def hardcodeShapash():
@@ -849,11 +1056,19 @@ def update_db():
     hardcodeSuppressionTackleRange()
     hardcodeSovUpgradeBuffs()
 
-    eos.db.gamedata_session.commit()
-    eos.db.gamedata_engine.execute('VACUUM')
+    print('writing post-processed data')
+    for table, rows in tableRows.items():
+        _flushTable(table, rows)
+    transaction.commit()
+    if not incremental:
+        conn.exec_driver_sql('VACUUM')
+    conn.close()
 
     print('done')
 
 
 if __name__ == '__main__':
-    update_db()
+    parser = argparse.ArgumentParser(description='Build gamedata DB out of staticdata JSON dumps')
+    parser.add_argument('-i', '--incremental', action='store_true', help='rewrite only data which changed in existing DB')
+    args = parser.parse_args()
+    update_db(incremental=args.incremental)
@@ -0,0 +1,81 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import threading
+
+import eos.config
+import eos.db
+
+
+class ChargeIndex:
+    """
+    Charge compatibility index: maps charge groups, charge size and capacity of a
+    module to charges which can be loaded into it. Same rules as Module.isValidCharge
+    are applied, but every combination is evaluated only once per gamedata version.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.gamedataVersion = None
+        # Format: {groupID: [(charge item, volume, charge size), ...]}
+        self.groupCharges = {}
+        # Format: {(groupIDs, charge size, capacity): frozenset of charge items}
+        self.charges = {}
+
+    def getCharges(self, groupIDs, chargeSize, capacity):
+        """
+        :param groupIDs: sorted tuple of charge group IDs
+        :param chargeSize: charge size module requires, 0 if any
+        :param capacity: capacity of module, None if unlimited
+        """
+        key = (groupIDs, chargeSize, capacity)
+        with self.lock:
+            if self.gamedataVersion != eos.config.gamedata_version:
+                self.gamedataVersion = eos.config.gamedata_version
+                self.groupCharges.clear()
+                self.charges.clear()
+            charges = self.charges.get(key)
+            if charges is None:
+                charges = self.charges[key] = frozenset(self.__findCharges(groupIDs, chargeSize, capacity))
+        return charges
+
+    def __findCharges(self, groupIDs, chargeSize, capacity):
+        for groupID in groupIDs:
+            for charge, chargeVolume, groupChargeSize in self.__getGroupCharges(groupID):
+                if chargeVolume is not None and capacity is not None and chargeVolume > capacity:
+                    continue
+                if chargeSize > 0 and chargeSize != groupChargeSize:
+                    continue
+                yield charge
+
+    def __getGroupCharges(self, groupID):
+        groupCharges = self.groupCharges.get(groupID)
+        if groupCharges is None:
+            groupCharges = self.groupCharges[groupID] = []
+            group = eos.db.getGroup(groupID, eager="items.attributes")
+            if group is not None:
+                for charge in group.items:
+                    if not charge.published:
+                        continue
+                    volume = charge.attributes['volume'].value if 'volume' in charge.attributes else None
+                    groupCharges.append((charge, volume, charge.getAttribute('chargeSize')))
+        return groupCharges
+
+
+chargeIndex = ChargeIndex()
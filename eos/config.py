@@ -9,7 +9,12 @@ pyfalog = Logger(__name__)
 
 debug = False
 gamedataCache = True
+# Per query function overrides of cached result limits, see eos.utils.queryCache
+# Format: {query function name: max amount of cached results}
+gamedataCacheLimits = {}
 saveddataCache = True
+# Keep whole saveddata prices table in memory once price service is up
+priceTableCache = True
 gamedata_version = ""
 gamedata_date = ""
 gamedata_connectionstring = 'sqlite:///' + realpath(join(dirname(abspath(__file__)), "..", "eve.db"))
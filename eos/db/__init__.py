@@ -102,6 +102,16 @@ if saveddata_connectionstring is not None:
     else:
         saveddata_engine = create_engine(saveddata_connectionstring, echo=config.debug)
 
+    if not callable(saveddata_connectionstring) and ':memory:' not in saveddata_connectionstring:
+        # WAL keeps database consistent if pyfa is killed mid-write, and with it
+        # sqlite does not need to sync to disk on every commit
+        @event.listens_for(saveddata_engine, 'connect')
+        def set_saveddata_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
     saveddata_meta = MetaData()
     saveddata_meta.bind = saveddata_engine
     saveddata_session = sessionmaker(bind=saveddata_engine, autoflush=False, expire_on_commit=False)()
@@ -27,26 +27,50 @@ from eos.db.gamedata.item import items_table
 from eos.db.gamedata.group import groups_table
 from eos.db.util import processEager, processWhere
 from eos.gamedata import AlphaClone, Attribute, AttributeInfo, Category, DynamicItem, Group, Item, MarketGroup, MetaData, MetaGroup, ImplantSet
+from eos.utils.queryCache import queryCaches
 
-cache = {}
 configVal = getattr(eos.config, "gamedataCache", None)
 if configVal is True:
     def cachedQuery(amount, *keywords):
         def deco(function):
-            def checkAndReturn(*args, **kwargs):
-                useCache = kwargs.pop("useCache", True)
+            # Every query function gets its own bounded cache, see eos.utils.queryCache
+            cache = queryCaches.register(function.__name__)
+
+            def makeKey(args, kwargs):
                 cacheKey = []
                 cacheKey.extend(args)
                 for keyword in keywords:
                     cacheKey.append(kwargs.get(keyword))
-
                 cacheKey = tuple(cacheKey)
-                handler = cache.get(cacheKey)
-                if handler is None or not useCache:
-                    handler = cache[cacheKey] = function(*args, **kwargs)
+                try:
+                    hash(cacheKey)
+                except TypeError:
+                    return None
+                return cacheKey
 
+            def checkAndReturn(*args, **kwargs):
+                useCache = kwargs.pop("useCache", True)
+                cacheKey = makeKey(args, kwargs)
+                if cacheKey is None:
+                    return function(*args, **kwargs)
+                if useCache:
+                    found, handler = cache.get(cacheKey)
+                    if found:
+                        return handler
+                handler = function(*args, **kwargs)
+                # Misses are not remembered, same as before
+                if handler is not None:
+                    cache.set(cacheKey, handler)
                 return handler
 
+            def prime(value, *args, **kwargs):
+                """Store value as result of call with passed arguments"""
+                cacheKey = makeKey(args, kwargs)
+                if cacheKey is not None and value is not None:
+                    cache.set(cacheKey, value)
+
+            checkAndReturn.cache = cache
+            checkAndReturn.prime = prime
             return checkAndReturn
 
         return deco
@@ -149,18 +173,21 @@ def getItems(lookfor, eager=None):
 
     toGet = []
     results = []
+    itemCache = getattr(getItem, "cache", None)
 
     for id in lookfor:
-        if (id, None) in cache:
-            results.append(cache.get((id, None)))
+        found, item = itemCache.get((id, None)) if itemCache is not None else (False, None)
+        if found:
+            results.append(item)
         else:
             toGet.append(id)
 
     if len(toGet) > 0:
         # Get items that aren't currently cached, and store them in the cache
         items = get_gamedata_session().query(Item).filter(Item.ID.in_(toGet)).all()
-        for item in items:
-            cache[(item.ID, None)] = item
+        if itemCache is not None:
+            for item in items:
+                itemCache.set((item.ID, None), item)
         results += items
 
     # sort the results based on the original indexing
@@ -397,6 +424,12 @@ def getVariations(itemids, groupIDs=None, where=None, eager=None):
     return vars
 
 
+def getAllVariations(eager=None):
+    """Get all items which are variations of some other item"""
+    return get_gamedata_session().query(Item).options(*processEager(eager)).filter(
+            items_table.c.variationParentTypeID.isnot(None)).all()
+
+
 @cachedQuery(1, "attr")
 def getAttributeInfo(attr, eager=None):
     if isinstance(attr, str):
@@ -438,6 +471,12 @@ def directAttributeRequest(itemIDs, attrIDs):
     return result
 
 
+def getMarketTypeIDs():
+    """Return IDs of all published types which can be traded on the market"""
+    q = select((items_table.c.typeID,), and_(items_table.c.published == True, items_table.c.marketGroupID != None))  # noqa: E711,E712
+    return [r.typeID for r in get_gamedata_session().execute(q)]
+
+
 def getAbyssalTypes():
     return set([r.resultingTypeID for r in get_gamedata_session().query(DynamicItem.resultingTypeID).distinct()])
 
@@ -461,3 +500,26 @@ def getDynamicItem(itemID, eager=None):
 def getAllImplantSets():
     implantSets = get_gamedata_session().query(ImplantSet).all()
     return implantSets
+
+
+def warmUpCache(itemIDs=None):
+    """
+    Fill caches of the hottest lookups in bulk: all attribute infos (by ID and by
+    name), all groups and either passed items or all published ones. Does nothing
+    when gamedata query caching is disabled.
+    """
+    if not hasattr(getItem, "prime"):
+        return
+    session = get_gamedata_session()
+    for info in session.query(AttributeInfo).all():
+        getAttributeInfo.prime(info, info.ID)
+        getAttributeInfo.prime(info, info.name)
+    for group in session.query(Group).all():
+        getGroup.prime(group, group.ID)
+    query = session.query(Item)
+    if itemIDs is None:
+        query = query.filter(Item.published == True)  # noqa: E712
+    else:
+        query = query.filter(Item.ID.in_(list(itemIDs)))
+    for item in query.all():
+        getItem.prime(item, item.ID)
@@ -0,0 +1,26 @@
+"""
+Migration 51
+
+- Add price snapshots table and snapshotID to prices
+"""
+
+import sqlalchemy
+
+
+def upgrade(saveddata_engine):
+    try:
+        saveddata_engine.execute("SELECT ID FROM priceSnapshots LIMIT 1")
+    except sqlalchemy.exc.DatabaseError:
+        saveddata_engine.execute("""
+            CREATE TABLE "priceSnapshots" (
+                "ID" INTEGER NOT NULL PRIMARY KEY,
+                time INTEGER NOT NULL,
+                source VARCHAR NOT NULL,
+                "typeCount" INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+    try:
+        saveddata_engine.execute("SELECT snapshotID FROM prices LIMIT 1")
+    except sqlalchemy.exc.DatabaseError:
+        saveddata_engine.execute("ALTER TABLE prices ADD COLUMN snapshotID INTEGER REFERENCES priceSnapshots(ID)")
@@ -18,18 +18,26 @@
 # ===============================================================================
 
 
-from sqlalchemy import Table, Column, Float, Integer
+from sqlalchemy import Table, Column, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import mapper
 
 from eos.db import saveddata_meta
-from eos.saveddata.price import Price
+from eos.saveddata.price import Price, PriceSnapshot
 
 
+priceSnapshots_table = Table("priceSnapshots", saveddata_meta,
+                             Column("ID", Integer, primary_key=True),
+                             Column("time", Integer, nullable=False),
+                             Column("source", String, nullable=False),
+                             Column("typeCount", Integer, nullable=False, default=0))
+
 prices_table = Table("prices", saveddata_meta,
                      Column("typeID", Integer, primary_key=True),
                      Column("price", Float, default=0.0),
                      Column("time", Integer, nullable=False),
-                     Column("status", Integer, nullable=False))
+                     Column("status", Integer, nullable=False),
+                     Column("snapshotID", Integer, ForeignKey("priceSnapshots.ID"), nullable=True))
 
 
+mapper(PriceSnapshot, priceSnapshots_table)
 mapper(Price, prices_table)
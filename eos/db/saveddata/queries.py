@@ -17,7 +17,6 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
-import sys
 
 from sqlalchemy.sql import and_
 from sqlalchemy import desc, select
@@ -25,8 +24,9 @@ from sqlalchemy import func
 
 from eos.db import saveddata_session, sd_lock
 from eos.db.saveddata.fit import fits_table, projectedFits_table
+from eos.db.saveddata.writeBehind import writeBehind
 from eos.db.util import processEager, processWhere
-from eos.saveddata.price import Price
+from eos.saveddata.price import Price, PriceSnapshot
 from eos.saveddata.user import User
 from eos.saveddata.ssocharacter import SsoCharacter
 from eos.saveddata.damagePattern import DamagePattern
@@ -47,28 +47,37 @@ if configVal is True:
 
     itemCache = {}
     queryCache = {}
+    # Inverted index of queryCache, so that invalidation does not need to scan
+    # every cached query. Format: {type: {ID: {(function, cache key)}}}
+    keyIndex = {}
 
     def cachedQuery(type, amount, *keywords):
-        itemCache[type] = localItemCache = weakref.WeakValueDictionary()
-        queryCache[type] = typeQueryCache = {}
+        localItemCache = itemCache.setdefault(type, weakref.WeakValueDictionary())
+        typeQueryCache = queryCache.setdefault(type, {})
+        typeKeyIndex = keyIndex.setdefault(type, {})
 
         def deco(function):
             localQueryCache = typeQueryCache[function] = {}
 
             def setCache(cacheKey, args, kwargs):
                 items = function(*args, **kwargs)
+                dropCachedQuery(type, function, cacheKey)
                 IDs = set()
-                localQueryCache[cacheKey] = (isinstance(items, list), IDs)
                 stuff = items if isinstance(items, list) else (items,)
                 for item in stuff:
                     ID = getattr(item, "ID", None)
                     if ID is None:
                         # Some uncachable data, don't cache this query
-                        del localQueryCache[cacheKey]
-                        break
+                        return items
                     localItemCache[ID] = item
                     IDs.add(ID)
 
+                localQueryCache[cacheKey] = (isinstance(items, list), IDs)
+                for ID in IDs:
+                    keys = typeKeyIndex.get(ID)
+                    if keys is None:
+                        keys = typeKeyIndex[ID] = set()
+                    keys.add((function, cacheKey))
                 return items
 
             def checkAndReturn(*args, **kwargs):
@@ -107,22 +116,27 @@ if configVal is True:
 
         return deco
 
+    def dropCachedQuery(type, function, cacheKey):
+        info = queryCache[type][function].pop(cacheKey, None)
+        if info is None:
+            return
+        typeKeyIndex = keyIndex[type]
+        for ID in info[1]:
+            keys = typeKeyIndex.get(ID)
+            if keys is None:
+                continue
+            keys.discard((function, cacheKey))
+            if not keys:
+                del typeKeyIndex[ID]
+
     def removeCachedEntry(type, ID):
         if type not in queryCache:
             return
-        functionCache = queryCache[type]
-        for _, localCache in functionCache.items():
-            toDelete = set()
-            for cacheKey, info in localCache.items():
-                IDs = info[1]
-                if ID in IDs:
-                    toDelete.add(cacheKey)
-
-            for cacheKey in toDelete:
-                del localCache[cacheKey]
-
-            if ID in itemCache[type]:
-                del itemCache[type][ID]
+        # Only queries which returned the ID are touched
+        for function, cacheKey in list(keyIndex[type].get(ID, ())):
+            dropCachedQuery(type, function, cacheKey)
+        keyIndex[type].pop(ID, None)
+        itemCache[type].pop(ID, None)
 
 elif callable(configVal):
     cachedQuery, removeCachedEntry = eos.config.gamedataCache
@@ -358,19 +372,98 @@ def getFitListLite(vaultID=None):
     return fits
 
 
+def getFitListChanges(vaultID=None):
+    """
+    Get ID, name, ship ID and time of last change of all fits in one query. Used
+    by exports which render only fits changed since previous run.
+    """
+    with sd_lock:
+        stmt = select([
+            fits_table.c.ID, fits_table.c.name, fits_table.c.shipID,
+            fits_table.c.modified, fits_table.c.created, fits_table.c.timestamp])
+        if vaultID is not None:
+            stmt = stmt.where(fits_table.c.vaultID == vaultID)
+        data = eos.db.saveddata_session.execute(stmt).fetchall()
+    return [
+        (fitID, fitName, shipID, modified or created or timestamp)
+        for fitID, fitName, shipID, modified, created, timestamp in data]
+
+
+class PriceTable:
+    """
+    In-memory copy of prices table. Price objects are shared with the session, so
+    updates are reflected automatically; additions and removals are tracked by
+    functions in this module.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.prices = {}
+
+    def load(self):
+        with sd_lock:
+            self.prices = {p.typeID: p for p in saveddata_session.query(Price).all()}
+            self.loaded = True
+
+    def unload(self):
+        with sd_lock:
+            self.prices = {}
+            self.loaded = False
+
+
+priceTable = PriceTable()
+
+
+def loadPriceTable():
+    priceTable.load()
+
+
+# SQLite limits amount of variables in a single statement
+PRICE_QUERY_CHUNK = 500
+
+
 @cachedQuery(Price, 1, "typeID")
 def getPrice(typeID):
     if isinstance(typeID, int):
         with sd_lock:
+            if priceTable.loaded:
+                return priceTable.prices.get(typeID)
             price = saveddata_session.query(Price).get(typeID)
     else:
         raise TypeError("Need integer as argument")
     return price
 
 
+def getPrices(typeIDs):
+    """Return {typeID: price} for all passed type IDs which have price stored"""
+    typeIDs = list(set(typeIDs))
+    if not all(isinstance(typeID, int) for typeID in typeIDs):
+        raise TypeError("Need integers as argument")
+    with sd_lock:
+        if priceTable.loaded:
+            return {typeID: priceTable.prices[typeID] for typeID in typeIDs if typeID in priceTable.prices}
+        prices = {}
+        for i in range(0, len(typeIDs), PRICE_QUERY_CHUNK):
+            for price in saveddata_session.query(Price).filter(Price.typeID.in_(typeIDs[i:i + PRICE_QUERY_CHUNK])).all():
+                prices[price.typeID] = price
+    return prices
+
+
+def getLatestPriceSnapshot():
+    with sd_lock:
+        return saveddata_session.query(PriceSnapshot).order_by(desc(PriceSnapshot.ID)).first()
+
+
+def getSnapshotPrices(snapshotID):
+    with sd_lock:
+        return saveddata_session.query(Price).filter(Price.snapshotID == snapshotID).all()
+
+
 def clearPrices():
     with sd_lock:
         deleted_rows = saveddata_session.query(Price).delete()
+        saveddata_session.query(PriceSnapshot).delete()
+        priceTable.prices.clear()
     commit()
     return deleted_rows
 
@@ -645,7 +738,7 @@ def removeInvalid(fits):
     if invalids:
         list(map(fits.remove, invalids))
         list(map(saveddata_session.delete, invalids))
-        saveddata_session.commit()
+        commit()
 
     return fits
 
@@ -653,6 +746,8 @@ def removeInvalid(fits):
 def add(stuff):
     with sd_lock:
         saveddata_session.add(stuff)
+        if isinstance(stuff, Price) and priceTable.loaded:
+            priceTable.prices[stuff.typeID] = stuff
 
 
 def save(stuff):
@@ -668,24 +763,17 @@ def remove(stuff):
 
 
 def commit():
-    with sd_lock:
-        try:
-            saveddata_session.commit()
-        except (KeyboardInterrupt, SystemExit):
-            raise
-        except Exception:
-            saveddata_session.rollback()
-            exc_info = sys.exc_info()
-            raise exc_info[0](exc_info[1]).with_traceback(exc_info[2])
+    writeBehind.commit()
+
+
+def sync():
+    """
+    Durability point: make sure everything saved so far is on disk. Should be called
+    before data leaves pyfa (exports), on close and before accessing saveddata DB
+    bypassing the session.
+    """
+    writeBehind.sync()
 
 
 def flush():
-    with sd_lock:
-        try:
-            saveddata_session.flush()
-        except (KeyboardInterrupt, SystemExit):
-            raise
-        except Exception:
-            saveddata_session.rollback()
-            exc_info = sys.exc_info()
-            raise exc_info[0](exc_info[1]).with_traceback(exc_info[2])
+    writeBehind.flush()
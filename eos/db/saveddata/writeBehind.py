@@ -0,0 +1,199 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import atexit
+import sys
+import time
+
+from logbook import Logger
+
+from eos.db import saveddata_session, sd_lock
+
+
+pyfalog = Logger(__name__)
+
+
+class WriteBehind:
+    """
+    Deferred saveddata commits.
+
+    Committing is the expensive part of saving (sqlite has to sync data to disk), and
+    it's requested after almost every change done to a fit. When write-behind is
+    enabled, commit() only flushes changes into the open transaction, so that queries
+    see them right away; the transaction itself is committed once there were no new
+    changes for `delay` seconds (but no later than `maxDelay` seconds after the first
+    pending change), or on explicit sync(). Timers are set up via scheduler passed on
+    enabling, which has to call passed function on the thread which owns the session.
+
+    If pyfa dies before pending changes are committed, sqlite discards the open
+    transaction on next start, i.e. database ends up in state of last sync.
+
+    Changes made after those already pending go into a savepoint, so a flush which
+    fails is undone on its own; pending changes were reported as committed, thus
+    they are committed right away instead of being rolled back with it.
+    """
+
+    def __init__(self, session, lock):
+        """
+        :param session: saveddata session
+        :param lock: lock guarding the session
+        """
+        self.session = session
+        self.lock = lock
+        self.scheduler = None
+        self.delay = None
+        self.maxDelay = None
+        self.pending = False
+        self.firstPendingTime = None
+        # Session transaction of savepoint opened after last flush with pending changes
+        self.savepoint = None
+        self.generation = 0
+        self.commits = 0
+        self.deferredCommits = 0
+        self.__atexitRegistered = False
+
+    @property
+    def enabled(self):
+        return self.scheduler is not None
+
+    def enable(self, scheduler, delay=0.5, maxDelay=5):
+        """
+        :param scheduler: callable(delay, function), has to be safe to call from any thread
+        """
+        with self.lock:
+            self.scheduler = scheduler
+            self.delay = delay
+            self.maxDelay = maxDelay
+            if not self.__atexitRegistered:
+                atexit.register(self.sync)
+                self.__atexitRegistered = True
+
+    def disable(self):
+        with self.lock:
+            self.sync()
+            self.scheduler = None
+
+    def markPending(self):
+        with self.lock:
+            self.deferredCommits += 1
+            if not self.pending:
+                self.pending = True
+                self.firstPendingTime = time.monotonic()
+            self.generation += 1
+            generation = self.generation
+        self.scheduler(self.delay, lambda: self.__onTimer(generation))
+
+    def __onTimer(self, generation):
+        with self.lock:
+            if not self.pending:
+                return
+            # Newer changes have their own timer, unless we've been waiting for too long already
+            if generation != self.generation and time.monotonic() - self.firstPendingTime < self.maxDelay:
+                return
+            try:
+                self.sync()
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception:
+                pyfalog.critical("Failed to commit pending saveddata changes.")
+                pyfalog.critical(sys.exc_info()[1])
+
+    def sync(self):
+        """Commit pending changes right away; no-op if there's nothing to commit."""
+        with self.lock:
+            if not self.pending:
+                return
+            self.pending = False
+            self.firstPendingTime = None
+            self.__commit()
+
+    def commit(self):
+        with self.lock:
+            if self.enabled:
+                self.__flush()
+                # Changes are reported as committed from now on, move them out of savepoint
+                self.__releaseSavepoint()
+                self.markPending()
+                self.__openSavepoint()
+            else:
+                self.__commit()
+
+    def flush(self):
+        """Flush changes into open transaction, without committing it."""
+        with self.lock:
+            self.__flush()
+            if self.pending:
+                self.__openSavepoint()
+
+    def __openSavepoint(self):
+        if self.savepoint is not None and self.savepoint.is_active:
+            return
+        # pysqlite begins transaction only on first statement changing data, while
+        # SAVEPOINT outside of transaction starts one which its RELEASE commits; until
+        # something was written, there's nothing pending to protect anyway
+        if not self.session.in_transaction() or not self.session.connection().connection.in_transaction:
+            return
+        # Nothing left to flush here, so this does not flush anything either
+        self.savepoint = self.session.begin_nested()
+
+    def __releaseSavepoint(self):
+        savepoint = self.savepoint
+        self.savepoint = None
+        if savepoint is not None and savepoint.is_active:
+            savepoint.commit()
+
+    def __commit(self):
+        self.commits += 1
+        try:
+            self.__releaseSavepoint()
+            self.session.commit()
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def __flush(self):
+        try:
+            self.session.flush()
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            savepoint = self.savepoint
+            self.savepoint = None
+            if self.pending and savepoint is not None and self.session.get_nested_transaction() is savepoint:
+                pyfalog.error("Failed to flush saveddata changes, committing changes pending before them.")
+                # Failed flush deactivates savepoint, but rolling it back is still possible
+                savepoint.rollback()
+                try:
+                    self.sync()
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except Exception:
+                    pyfalog.critical("Failed to commit pending saveddata changes.")
+                    pyfalog.critical(sys.exc_info()[1])
+            else:
+                # Nothing was reported as committed yet, drop the whole transaction
+                self.pending = False
+                self.firstPendingTime = None
+                self.session.rollback()
+            raise
+
+
+writeBehind = WriteBehind(saveddata_session, sd_lock)
@@ -18,6 +18,8 @@
 # ===============================================================================
 
 
+from itertools import count
+
 from logbook import Logger
 from sqlalchemy.orm.attributes import flag_dirty
 from sqlalchemy.orm.collections import collection
@@ -25,8 +27,50 @@ from sqlalchemy.orm.collections import collection
 
 pyfalog = Logger(__name__)
 
+# Revisions are unique across all lists, so that list which replaced another one
+# never has revision which was seen before
+revisionCounter = count(1)
+
 
 class HandledList(list):
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        # Changes on every change of list contents, lets owners tell if something
+        # they derived from the list is outdated
+        self.revision = next(revisionCounter)
+
+    def __setitem__(self, *args):
+        self.revision = next(revisionCounter)
+        list.__setitem__(self, *args)
+
+    def __delitem__(self, *args):
+        self.revision = next(revisionCounter)
+        list.__delitem__(self, *args)
+
+    def __iadd__(self, other):
+        self.revision = next(revisionCounter)
+        return list.__iadd__(self, other)
+
+    def append(self, thing):
+        self.revision = next(revisionCounter)
+        list.append(self, thing)
+
+    def insert(self, idx, thing):
+        self.revision = next(revisionCounter)
+        list.insert(self, idx, thing)
+
+    def extend(self, things):
+        self.revision = next(revisionCounter)
+        list.extend(self, things)
+
+    def pop(self, *args):
+        self.revision = next(revisionCounter)
+        return list.pop(self, *args)
+
+    def clear(self):
+        self.revision = next(revisionCounter)
+        list.clear(self)
+
     def filteredItemPreAssign(self, filter, *args, **kwargs):
         for element in self:
             try:
@@ -110,6 +154,7 @@ class HandledList(list):
     def remove(self, thing):
         # We must flag it as modified, otherwise it not be removed from the database
         flag_dirty(thing)
+        self.revision = next(revisionCounter)
         list.remove(self, thing)
 
     def sort(self, *args, **kwargs):
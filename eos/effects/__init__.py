@@ -0,0 +1,54 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Effect handlers are split into shard modules by effect ID range. Shards are
+imported only when one of their effects is requested as eos.effects.Effect<ID>,
+using generated registry to find them (see scripts/effect_shards.py).
+"""
+
+import importlib
+import re
+
+from eos.effects._registry import effectShards
+
+
+class BaseEffect:
+
+    dealsDamage = False
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        pass
+
+
+class DummyEffect(BaseEffect):
+    pass
+
+
+def __getattr__(name):
+    m = re.fullmatch(r'Effect(\d+)', name)
+    shardName = effectShards.get(int(m.group(1))) if m is not None else None
+    if shardName is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    shard = importlib.import_module('{}.{}'.format(__name__, shardName))
+    effectDef = getattr(shard, name)
+    # Next time it will be found without going through this function
+    globals()[name] = effectDef
+    return effectDef
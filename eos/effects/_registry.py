@@ -0,0 +1,2351 @@
+# Generated by scripts/effect_shards.py, do not edit manually
+# Format: {effect ID: name of eos.effects module which defines its class}
+effectShards = {
+    4: 'effects_000000',
+    10: 'effects_000000',
+    17: 'effects_000000',
+    21: 'effects_000000',
+    25: 'effects_000000',
+    26: 'effects_000000',
+    27: 'effects_000000',
+    34: 'effects_000000',
+    38: 'effects_000000',
+    39: 'effects_000000',
+    46: 'effects_000000',
+    47: 'effects_000000',
+    48: 'effects_000000',
+    50: 'effects_000000',
+    51: 'effects_000000',
+    54: 'effects_000000',
+    55: 'effects_000000',
+    56: 'effects_000000',
+    57: 'effects_000000',
+    58: 'effects_000000',
+    59: 'effects_000000',
+    60: 'effects_000000',
+    61: 'effects_000000',
+    63: 'effects_000000',
+    67: 'effects_000000',
+    89: 'effects_000000',
+    91: 'effects_000000',
+    92: 'effects_000000',
+    93: 'effects_000000',
+    95: 'effects_000000',
+    96: 'effects_000000',
+    101: 'effects_000000',
+    118: 'effects_000000',
+    157: 'effects_000000',
+    159: 'effects_000000',
+    160: 'effects_000000',
+    161: 'effects_000000',
+    162: 'effects_000000',
+    172: 'effects_000000',
+    173: 'effects_000000',
+    174: 'effects_000000',
+    212: 'effects_000000',
+    214: 'effects_000000',
+    223: 'effects_000000',
+    227: 'effects_000000',
+    230: 'effects_000000',
+    235: 'effects_000000',
+    242: 'effects_000000',
+    244: 'effects_000000',
+    271: 'effects_000000',
+    272: 'effects_000000',
+    273: 'effects_000000',
+    277: 'effects_000000',
+    279: 'effects_000000',
+    287: 'effects_000000',
+    290: 'effects_000000',
+    298: 'effects_000000',
+    315: 'effects_000000',
+    391: 'effects_000000',
+    392: 'effects_000000',
+    394: 'effects_000000',
+    395: 'effects_000000',
+    396: 'effects_000000',
+    397: 'effects_000000',
+    408: 'effects_000000',
+    414: 'effects_000000',
+    446: 'effects_000000',
+    485: 'effects_000000',
+    486: 'effects_000000',
+    490: 'effects_000000',
+    494: 'effects_000000',
+    504: 'effects_000500',
+    506: 'effects_000500',
+    507: 'effects_000500',
+    508: 'effects_000500',
+    511: 'effects_000500',
+    512: 'effects_000500',
+    514: 'effects_000500',
+    516: 'effects_000500',
+    521: 'effects_000500',
+    527: 'effects_000500',
+    529: 'effects_000500',
+    536: 'effects_000500',
+    542: 'effects_000500',
+    549: 'effects_000500',
+    550: 'effects_000500',
+    553: 'effects_000500',
+    562: 'effects_000500',
+    581: 'effects_000500',
+    582: 'effects_000500',
+    584: 'effects_000500',
+    587: 'effects_000500',
+    588: 'effects_000500',
+    589: 'effects_000500',
+    590: 'effects_000500',
+    596: 'effects_000500',
+    598: 'effects_000500',
+    599: 'effects_000500',
+    600: 'effects_000500',
+    602: 'effects_000500',
+    604: 'effects_000500',
+    607: 'effects_000500',
+    623: 'effects_000500',
+    627: 'effects_000500',
+    657: 'effects_000500',
+    660: 'effects_000500',
+    661: 'effects_000500',
+    662: 'effects_000500',
+    668: 'effects_000500',
+    675: 'effects_000500',
+    677: 'effects_000500',
+    699: 'effects_000500',
+    706: 'effects_000500',
+    726: 'effects_000500',
+    727: 'effects_000500',
+    728: 'effects_000500',
+    729: 'effects_000500',
+    730: 'effects_000500',
+    732: 'effects_000500',
+    736: 'effects_000500',
+    744: 'effects_000500',
+    754: 'effects_000500',
+    757: 'effects_000500',
+    760: 'effects_000500',
+    763: 'effects_000500',
+    784: 'effects_000500',
+    804: 'effects_000500',
+    836: 'effects_000500',
+    848: 'effects_000500',
+    854: 'effects_000500',
+    856: 'effects_000500',
+    882: 'effects_000500',
+    887: 'effects_000500',
+    889: 'effects_000500',
+    891: 'effects_000500',
+    892: 'effects_000500',
+    896: 'effects_000500',
+    898: 'effects_000500',
+    899: 'effects_000500',
+    907: 'effects_000500',
+    909: 'effects_000500',
+    912: 'effects_000500',
+    918: 'effects_000500',
+    919: 'effects_000500',
+    958: 'effects_000500',
+    959: 'effects_000500',
+    960: 'effects_000500',
+    961: 'effects_000500',
+    968: 'effects_000500',
+    980: 'effects_000500',
+    989: 'effects_000500',
+    991: 'effects_000500',
+    996: 'effects_000500',
+    998: 'effects_000500',
+    999: 'effects_000500',
+    1001: 'effects_001000',
+    1003: 'effects_001000',
+    1004: 'effects_001000',
+    1005: 'effects_001000',
+    1006: 'effects_001000',
+    1007: 'effects_001000',
+    1008: 'effects_001000',
+    1009: 'effects_001000',
+    1010: 'effects_001000',
+    1011: 'effects_001000',
+    1012: 'effects_001000',
+    1013: 'effects_001000',
+    1014: 'effects_001000',
+    1015: 'effects_001000',
+    1016: 'effects_001000',
+    1017: 'effects_001000',
+    1018: 'effects_001000',
+    1019: 'effects_001000',
+    1020: 'effects_001000',
+    1021: 'effects_001000',
+    1024: 'effects_001000',
+    1030: 'effects_001000',
+    1033: 'effects_001000',
+    1034: 'effects_001000',
+    1035: 'effects_001000',
+    1036: 'effects_001000',
+    1046: 'effects_001000',
+    1047: 'effects_001000',
+    1048: 'effects_001000',
+    1049: 'effects_001000',
+    1058: 'effects_001000',
+    1060: 'effects_001000',
+    1061: 'effects_001000',
+    1062: 'effects_001000',
+    1080: 'effects_001000',
+    1084: 'effects_001000',
+    1087: 'effects_001000',
+    1099: 'effects_001000',
+    1176: 'effects_001000',
+    1179: 'effects_001000',
+    1181: 'effects_001000',
+    1182: 'effects_001000',
+    1183: 'effects_001000',
+    1184: 'effects_001000',
+    1185: 'effects_001000',
+    1190: 'effects_001000',
+    1200: 'effects_001000',
+    1212: 'effects_001000',
+    1215: 'effects_001000',
+    1218: 'effects_001000',
+    1219: 'effects_001000',
+    1220: 'effects_001000',
+    1221: 'effects_001000',
+    1222: 'effects_001000',
+    1228: 'effects_001000',
+    1230: 'effects_001000',
+    1232: 'effects_001000',
+    1233: 'effects_001000',
+    1234: 'effects_001000',
+    1239: 'effects_001000',
+    1240: 'effects_001000',
+    1255: 'effects_001000',
+    1256: 'effects_001000',
+    1261: 'effects_001000',
+    1264: 'effects_001000',
+    1268: 'effects_001000',
+    1281: 'effects_001000',
+    1318: 'effects_001000',
+    1360: 'effects_001000',
+    1361: 'effects_001000',
+    1370: 'effects_001000',
+    1372: 'effects_001000',
+    1395: 'effects_001000',
+    1397: 'effects_001000',
+    1409: 'effects_001000',
+    1410: 'effects_001000',
+    1412: 'effects_001000',
+    1434: 'effects_001000',
+    1441: 'effects_001000',
+    1442: 'effects_001000',
+    1443: 'effects_001000',
+    1445: 'effects_001000',
+    1446: 'effects_001000',
+    1448: 'effects_001000',
+    1449: 'effects_001000',
+    1450: 'effects_001000',
+    1451: 'effects_001000',
+    1452: 'effects_001000',
+    1453: 'effects_001000',
+    1472: 'effects_001000',
+    1500: 'effects_001500',
+    1550: 'effects_001500',
+    1551: 'effects_001500',
+    1577: 'effects_001500',
+    1579: 'effects_001500',
+    1581: 'effects_001500',
+    1585: 'effects_001500',
+    1586: 'effects_001500',
+    1587: 'effects_001500',
+    1588: 'effects_001500',
+    1590: 'effects_001500',
+    1592: 'effects_001500',
+    1593: 'effects_001500',
+    1594: 'effects_001500',
+    1595: 'effects_001500',
+    1596: 'effects_001500',
+    1597: 'effects_001500',
+    1615: 'effects_001500',
+    1616: 'effects_001500',
+    1617: 'effects_001500',
+    1634: 'effects_001500',
+    1635: 'effects_001500',
+    1638: 'effects_001500',
+    1643: 'effects_001500',
+    1644: 'effects_001500',
+    1645: 'effects_001500',
+    1646: 'effects_001500',
+    1650: 'effects_001500',
+    1657: 'effects_001500',
+    1668: 'effects_001500',
+    1669: 'effects_001500',
+    1670: 'effects_001500',
+    1671: 'effects_001500',
+    1672: 'effects_001500',
+    1673: 'effects_001500',
+    1674: 'effects_001500',
+    1675: 'effects_001500',
+    1720: 'effects_001500',
+    1722: 'effects_001500',
+    1730: 'effects_001500',
+    1738: 'effects_001500',
+    1763: 'effects_001500',
+    1764: 'effects_001500',
+    1773: 'effects_001500',
+    1804: 'effects_001500',
+    1805: 'effects_001500',
+    1806: 'effects_001500',
+    1807: 'effects_001500',
+    1812: 'effects_001500',
+    1813: 'effects_001500',
+    1814: 'effects_001500',
+    1815: 'effects_001500',
+    1816: 'effects_001500',
+    1817: 'effects_001500',
+    1819: 'effects_001500',
+    1820: 'effects_001500',
+    1848: 'effects_001500',
+    1851: 'effects_001500',
+    1862: 'effects_001500',
+    1863: 'effects_001500',
+    1864: 'effects_001500',
+    1882: 'effects_001500',
+    1885: 'effects_001500',
+    1886: 'effects_001500',
+    1910: 'effects_001500',
+    1911: 'effects_001500',
+    1912: 'effects_001500',
+    1913: 'effects_001500',
+    1914: 'effects_001500',
+    1921: 'effects_001500',
+    1922: 'effects_001500',
+    1959: 'effects_001500',
+    1964: 'effects_001500',
+    1969: 'effects_001500',
+    1996: 'effects_001500',
+    2000: 'effects_002000',
+    2008: 'effects_002000',
+    2013: 'effects_002000',
+    2014: 'effects_002000',
+    2015: 'effects_002000',
+    2016: 'effects_002000',
+    2017: 'effects_002000',
+    2019: 'effects_002000',
+    2020: 'effects_002000',
+    2029: 'effects_002000',
+    2041: 'effects_002000',
+    2052: 'effects_002000',
+    2053: 'effects_002000',
+    2054: 'effects_002000',
+    2055: 'effects_002000',
+    2056: 'effects_002000',
+    2105: 'effects_002000',
+    2106: 'effects_002000',
+    2107: 'effects_002000',
+    2108: 'effects_002000',
+    2109: 'effects_002000',
+    2110: 'effects_002000',
+    2111: 'effects_002000',
+    2112: 'effects_002000',
+    2130: 'effects_002000',
+    2131: 'effects_002000',
+    2132: 'effects_002000',
+    2133: 'effects_002000',
+    2134: 'effects_002000',
+    2135: 'effects_002000',
+    2143: 'effects_002000',
+    2152: 'effects_002000',
+    2155: 'effects_002000',
+    2156: 'effects_002000',
+    2157: 'effects_002000',
+    2160: 'effects_002000',
+    2179: 'effects_002000',
+    2181: 'effects_002000',
+    2186: 'effects_002000',
+    2187: 'effects_002000',
+    2188: 'effects_002000',
+    2189: 'effects_002000',
+    2201: 'effects_002000',
+    2215: 'effects_002000',
+    2232: 'effects_002000',
+    2249: 'effects_002000',
+    2250: 'effects_002000',
+    2251: 'effects_002000',
+    2252: 'effects_002000',
+    2253: 'effects_002000',
+    2255: 'effects_002000',
+    2296: 'effects_002000',
+    2297: 'effects_002000',
+    2298: 'effects_002000',
+    2302: 'effects_002000',
+    2305: 'effects_002000',
+    2354: 'effects_002000',
+    2355: 'effects_002000',
+    2356: 'effects_002000',
+    2402: 'effects_002000',
+    2422: 'effects_002000',
+    2432: 'effects_002000',
+    2444: 'effects_002000',
+    2445: 'effects_002000',
+    2456: 'effects_002000',
+    2465: 'effects_002000',
+    2479: 'effects_002000',
+    2485: 'effects_002000',
+    2488: 'effects_002000',
+    2489: 'effects_002000',
+    2490: 'effects_002000',
+    2491: 'effects_002000',
+    2492: 'effects_002000',
+    2503: 'effects_002500',
+    2504: 'effects_002500',
+    2561: 'effects_002500',
+    2589: 'effects_002500',
+    2602: 'effects_002500',
+    2603: 'effects_002500',
+    2604: 'effects_002500',
+    2605: 'effects_002500',
+    2611: 'effects_002500',
+    2644: 'effects_002500',
+    2645: 'effects_002500',
+    2646: 'effects_002500',
+    2647: 'effects_002500',
+    2648: 'effects_002500',
+    2649: 'effects_002500',
+    2670: 'effects_002500',
+    2688: 'effects_002500',
+    2689: 'effects_002500',
+    2690: 'effects_002500',
+    2691: 'effects_002500',
+    2693: 'effects_002500',
+    2694: 'effects_002500',
+    2695: 'effects_002500',
+    2696: 'effects_002500',
+    2697: 'effects_002500',
+    2698: 'effects_002500',
+    2706: 'effects_002500',
+    2707: 'effects_002500',
+    2708: 'effects_002500',
+    2712: 'effects_002500',
+    2713: 'effects_002500',
+    2714: 'effects_002500',
+    2716: 'effects_002500',
+    2717: 'effects_002500',
+    2718: 'effects_002500',
+    2726: 'effects_002500',
+    2727: 'effects_002500',
+    2734: 'effects_002500',
+    2735: 'effects_002500',
+    2736: 'effects_002500',
+    2737: 'effects_002500',
+    2739: 'effects_002500',
+    2741: 'effects_002500',
+    2745: 'effects_002500',
+    2746: 'effects_002500',
+    2747: 'effects_002500',
+    2748: 'effects_002500',
+    2749: 'effects_002500',
+    2756: 'effects_002500',
+    2757: 'effects_002500',
+    2760: 'effects_002500',
+    2763: 'effects_002500',
+    2766: 'effects_002500',
+    2776: 'effects_002500',
+    2778: 'effects_002500',
+    2791: 'effects_002500',
+    2792: 'effects_002500',
+    2794: 'effects_002500',
+    2795: 'effects_002500',
+    2796: 'effects_002500',
+    2797: 'effects_002500',
+    2798: 'effects_002500',
+    2799: 'effects_002500',
+    2801: 'effects_002500',
+    2802: 'effects_002500',
+    2803: 'effects_002500',
+    2804: 'effects_002500',
+    2805: 'effects_002500',
+    2809: 'effects_002500',
+    2812: 'effects_002500',
+    2837: 'effects_002500',
+    2847: 'effects_002500',
+    2848: 'effects_002500',
+    2849: 'effects_002500',
+    2850: 'effects_002500',
+    2851: 'effects_002500',
+    2853: 'effects_002500',
+    2857: 'effects_002500',
+    2858: 'effects_002500',
+    2865: 'effects_002500',
+    2866: 'effects_002500',
+    2867: 'effects_002500',
+    2868: 'effects_002500',
+    2872: 'effects_002500',
+    2881: 'effects_002500',
+    2882: 'effects_002500',
+    2883: 'effects_002500',
+    2884: 'effects_002500',
+    2885: 'effects_002500',
+    2887: 'effects_002500',
+    2888: 'effects_002500',
+    2889: 'effects_002500',
+    2890: 'effects_002500',
+    2891: 'effects_002500',
+    2892: 'effects_002500',
+    2893: 'effects_002500',
+    2894: 'effects_002500',
+    2899: 'effects_002500',
+    2900: 'effects_002500',
+    2901: 'effects_002500',
+    2902: 'effects_002500',
+    2903: 'effects_002500',
+    2904: 'effects_002500',
+    2905: 'effects_002500',
+    2906: 'effects_002500',
+    2907: 'effects_002500',
+    2908: 'effects_002500',
+    2909: 'effects_002500',
+    2910: 'effects_002500',
+    2911: 'effects_002500',
+    2967: 'effects_002500',
+    2979: 'effects_002500',
+    2980: 'effects_002500',
+    2982: 'effects_002500',
+    3001: 'effects_003000',
+    3002: 'effects_003000',
+    3024: 'effects_003000',
+    3025: 'effects_003000',
+    3026: 'effects_003000',
+    3027: 'effects_003000',
+    3028: 'effects_003000',
+    3029: 'effects_003000',
+    3030: 'effects_003000',
+    3031: 'effects_003000',
+    3032: 'effects_003000',
+    3035: 'effects_003000',
+    3036: 'effects_003000',
+    3046: 'effects_003000',
+    3047: 'effects_003000',
+    3061: 'effects_003000',
+    3169: 'effects_003000',
+    3172: 'effects_003000',
+    3173: 'effects_003000',
+    3174: 'effects_003000',
+    3175: 'effects_003000',
+    3182: 'effects_003000',
+    3196: 'effects_003000',
+    3200: 'effects_003000',
+    3201: 'effects_003000',
+    3212: 'effects_003000',
+    3234: 'effects_003000',
+    3235: 'effects_003000',
+    3236: 'effects_003000',
+    3237: 'effects_003000',
+    3241: 'effects_003000',
+    3242: 'effects_003000',
+    3243: 'effects_003000',
+    3244: 'effects_003000',
+    3264: 'effects_003000',
+    3267: 'effects_003000',
+    3297: 'effects_003000',
+    3298: 'effects_003000',
+    3299: 'effects_003000',
+    3313: 'effects_003000',
+    3331: 'effects_003000',
+    3335: 'effects_003000',
+    3336: 'effects_003000',
+    3339: 'effects_003000',
+    3340: 'effects_003000',
+    3343: 'effects_003000',
+    3355: 'effects_003000',
+    3356: 'effects_003000',
+    3366: 'effects_003000',
+    3367: 'effects_003000',
+    3369: 'effects_003000',
+    3370: 'effects_003000',
+    3371: 'effects_003000',
+    3374: 'effects_003000',
+    3379: 'effects_003000',
+    3380: 'effects_003000',
+    3392: 'effects_003000',
+    3415: 'effects_003000',
+    3416: 'effects_003000',
+    3417: 'effects_003000',
+    3424: 'effects_003000',
+    3425: 'effects_003000',
+    3427: 'effects_003000',
+    3439: 'effects_003000',
+    3447: 'effects_003000',
+    3466: 'effects_003000',
+    3467: 'effects_003000',
+    3468: 'effects_003000',
+    3473: 'effects_003000',
+    3478: 'effects_003000',
+    3480: 'effects_003000',
+    3483: 'effects_003000',
+    3484: 'effects_003000',
+    3487: 'effects_003000',
+    3489: 'effects_003000',
+    3493: 'effects_003000',
+    3495: 'effects_003000',
+    3496: 'effects_003000',
+    3498: 'effects_003000',
+    3499: 'effects_003000',
+    3513: 'effects_003500',
+    3514: 'effects_003500',
+    3519: 'effects_003500',
+    3520: 'effects_003500',
+    3526: 'effects_003500',
+    3532: 'effects_003500',
+    3561: 'effects_003500',
+    3568: 'effects_003500',
+    3569: 'effects_003500',
+    3570: 'effects_003500',
+    3571: 'effects_003500',
+    3586: 'effects_003500',
+    3587: 'effects_003500',
+    3588: 'effects_003500',
+    3589: 'effects_003500',
+    3590: 'effects_003500',
+    3591: 'effects_003500',
+    3592: 'effects_003500',
+    3593: 'effects_003500',
+    3597: 'effects_003500',
+    3598: 'effects_003500',
+    3599: 'effects_003500',
+    3600: 'effects_003500',
+    3601: 'effects_003500',
+    3602: 'effects_003500',
+    3617: 'effects_003500',
+    3648: 'effects_003500',
+    3649: 'effects_003500',
+    3650: 'effects_003500',
+    3651: 'effects_003500',
+    3652: 'effects_003500',
+    3653: 'effects_003500',
+    3655: 'effects_003500',
+    3656: 'effects_003500',
+    3657: 'effects_003500',
+    3659: 'effects_003500',
+    3660: 'effects_003500',
+    3668: 'effects_003500',
+    3669: 'effects_003500',
+    3670: 'effects_003500',
+    3671: 'effects_003500',
+    3672: 'effects_003500',
+    3674: 'effects_003500',
+    3677: 'effects_003500',
+    3678: 'effects_003500',
+    3679: 'effects_003500',
+    3680: 'effects_003500',
+    3681: 'effects_003500',
+    3682: 'effects_003500',
+    3683: 'effects_003500',
+    3686: 'effects_003500',
+    3703: 'effects_003500',
+    3705: 'effects_003500',
+    3706: 'effects_003500',
+    3726: 'effects_003500',
+    3727: 'effects_003500',
+    3739: 'effects_003500',
+    3740: 'effects_003500',
+    3744: 'effects_003500',
+    3765: 'effects_003500',
+    3766: 'effects_003500',
+    3771: 'effects_003500',
+    3773: 'effects_003500',
+    3774: 'effects_003500',
+    3782: 'effects_003500',
+    3783: 'effects_003500',
+    3797: 'effects_003500',
+    3799: 'effects_003500',
+    3807: 'effects_003500',
+    3808: 'effects_003500',
+    3810: 'effects_003500',
+    3811: 'effects_003500',
+    3831: 'effects_003500',
+    3857: 'effects_003500',
+    3859: 'effects_003500',
+    3860: 'effects_003500',
+    3861: 'effects_003500',
+    3863: 'effects_003500',
+    3864: 'effects_003500',
+    3865: 'effects_003500',
+    3866: 'effects_003500',
+    3867: 'effects_003500',
+    3868: 'effects_003500',
+    3869: 'effects_003500',
+    3872: 'effects_003500',
+    3875: 'effects_003500',
+    3893: 'effects_003500',
+    3895: 'effects_003500',
+    3897: 'effects_003500',
+    3900: 'effects_003500',
+    3959: 'effects_003500',
+    3961: 'effects_003500',
+    3962: 'effects_003500',
+    3964: 'effects_003500',
+    3976: 'effects_003500',
+    3979: 'effects_003500',
+    3980: 'effects_003500',
+    3982: 'effects_003500',
+    3992: 'effects_003500',
+    3993: 'effects_003500',
+    3995: 'effects_003500',
+    3996: 'effects_003500',
+    3997: 'effects_003500',
+    3998: 'effects_003500',
+    3999: 'effects_003500',
+    4002: 'effects_004000',
+    4003: 'effects_004000',
+    4016: 'effects_004000',
+    4017: 'effects_004000',
+    4018: 'effects_004000',
+    4019: 'effects_004000',
+    4020: 'effects_004000',
+    4021: 'effects_004000',
+    4022: 'effects_004000',
+    4023: 'effects_004000',
+    4033: 'effects_004000',
+    4034: 'effects_004000',
+    4035: 'effects_004000',
+    4036: 'effects_004000',
+    4037: 'effects_004000',
+    4038: 'effects_004000',
+    4039: 'effects_004000',
+    4040: 'effects_004000',
+    4041: 'effects_004000',
+    4042: 'effects_004000',
+    4043: 'effects_004000',
+    4044: 'effects_004000',
+    4045: 'effects_004000',
+    4046: 'effects_004000',
+    4047: 'effects_004000',
+    4048: 'effects_004000',
+    4049: 'effects_004000',
+    4054: 'effects_004000',
+    4055: 'effects_004000',
+    4056: 'effects_004000',
+    4057: 'effects_004000',
+    4058: 'effects_004000',
+    4059: 'effects_004000',
+    4060: 'effects_004000',
+    4061: 'effects_004000',
+    4062: 'effects_004000',
+    4063: 'effects_004000',
+    4086: 'effects_004000',
+    4088: 'effects_004000',
+    4089: 'effects_004000',
+    4090: 'effects_004000',
+    4091: 'effects_004000',
+    4093: 'effects_004000',
+    4104: 'effects_004000',
+    4106: 'effects_004000',
+    4114: 'effects_004000',
+    4115: 'effects_004000',
+    4122: 'effects_004000',
+    4135: 'effects_004000',
+    4136: 'effects_004000',
+    4137: 'effects_004000',
+    4138: 'effects_004000',
+    4152: 'effects_004000',
+    4153: 'effects_004000',
+    4154: 'effects_004000',
+    4155: 'effects_004000',
+    4158: 'effects_004000',
+    4159: 'effects_004000',
+    4161: 'effects_004000',
+    4162: 'effects_004000',
+    4165: 'effects_004000',
+    4166: 'effects_004000',
+    4167: 'effects_004000',
+    4168: 'effects_004000',
+    4187: 'effects_004000',
+    4188: 'effects_004000',
+    4189: 'effects_004000',
+    4190: 'effects_004000',
+    4215: 'effects_004000',
+    4216: 'effects_004000',
+    4217: 'effects_004000',
+    4248: 'effects_004000',
+    4250: 'effects_004000',
+    4251: 'effects_004000',
+    4256: 'effects_004000',
+    4264: 'effects_004000',
+    4265: 'effects_004000',
+    4269: 'effects_004000',
+    4270: 'effects_004000',
+    4271: 'effects_004000',
+    4272: 'effects_004000',
+    4273: 'effects_004000',
+    4274: 'effects_004000',
+    4275: 'effects_004000',
+    4277: 'effects_004000',
+    4278: 'effects_004000',
+    4280: 'effects_004000',
+    4282: 'effects_004000',
+    4283: 'effects_004000',
+    4286: 'effects_004000',
+    4288: 'effects_004000',
+    4290: 'effects_004000',
+    4292: 'effects_004000',
+    4321: 'effects_004000',
+    4327: 'effects_004000',
+    4330: 'effects_004000',
+    4331: 'effects_004000',
+    4342: 'effects_004000',
+    4343: 'effects_004000',
+    4347: 'effects_004000',
+    4351: 'effects_004000',
+    4358: 'effects_004000',
+    4360: 'effects_004000',
+    4362: 'effects_004000',
+    4366: 'effects_004000',
+    4370: 'effects_004000',
+    4372: 'effects_004000',
+    4373: 'effects_004000',
+    4377: 'effects_004000',
+    4378: 'effects_004000',
+    4379: 'effects_004000',
+    4380: 'effects_004000',
+    4384: 'effects_004000',
+    4385: 'effects_004000',
+    4393: 'effects_004000',
+    4394: 'effects_004000',
+    4395: 'effects_004000',
+    4396: 'effects_004000',
+    4398: 'effects_004000',
+    4413: 'effects_004000',
+    4415: 'effects_004000',
+    4416: 'effects_004000',
+    4417: 'effects_004000',
+    4451: 'effects_004000',
+    4452: 'effects_004000',
+    4453: 'effects_004000',
+    4454: 'effects_004000',
+    4456: 'effects_004000',
+    4457: 'effects_004000',
+    4458: 'effects_004000',
+    4459: 'effects_004000',
+    4460: 'effects_004000',
+    4461: 'effects_004000',
+    4462: 'effects_004000',
+    4463: 'effects_004000',
+    4464: 'effects_004000',
+    4471: 'effects_004000',
+    4472: 'effects_004000',
+    4473: 'effects_004000',
+    4474: 'effects_004000',
+    4475: 'effects_004000',
+    4476: 'effects_004000',
+    4477: 'effects_004000',
+    4478: 'effects_004000',
+    4479: 'effects_004000',
+    4482: 'effects_004000',
+    4484: 'effects_004000',
+    4485: 'effects_004000',
+    4489: 'effects_004000',
+    4490: 'effects_004000',
+    4491: 'effects_004000',
+    4492: 'effects_004000',
+    4510: 'effects_004500',
+    4512: 'effects_004500',
+    4513: 'effects_004500',
+    4515: 'effects_004500',
+    4516: 'effects_004500',
+    4527: 'effects_004500',
+    4555: 'effects_004500',
+    4556: 'effects_004500',
+    4557: 'effects_004500',
+    4558: 'effects_004500',
+    4559: 'effects_004500',
+    4575: 'effects_004500',
+    4576: 'effects_004500',
+    4577: 'effects_004500',
+    4579: 'effects_004500',
+    4619: 'effects_004500',
+    4620: 'effects_004500',
+    4621: 'effects_004500',
+    4622: 'effects_004500',
+    4623: 'effects_004500',
+    4624: 'effects_004500',
+    4625: 'effects_004500',
+    4626: 'effects_004500',
+    4635: 'effects_004500',
+    4636: 'effects_004500',
+    4637: 'effects_004500',
+    4640: 'effects_004500',
+    4643: 'effects_004500',
+    4645: 'effects_004500',
+    4648: 'effects_004500',
+    4649: 'effects_004500',
+    4667: 'effects_004500',
+    4668: 'effects_004500',
+    4669: 'effects_004500',
+    4670: 'effects_004500',
+    4728: 'effects_004500',
+    4760: 'effects_004500',
+    4775: 'effects_004500',
+    4782: 'effects_004500',
+    4789: 'effects_004500',
+    4793: 'effects_004500',
+    4794: 'effects_004500',
+    4795: 'effects_004500',
+    4799: 'effects_004500',
+    4804: 'effects_004500',
+    4809: 'effects_004500',
+    4810: 'effects_004500',
+    4811: 'effects_004500',
+    4812: 'effects_004500',
+    4814: 'effects_004500',
+    4817: 'effects_004500',
+    4820: 'effects_004500',
+    4821: 'effects_004500',
+    4822: 'effects_004500',
+    4823: 'effects_004500',
+    4824: 'effects_004500',
+    4825: 'effects_004500',
+    4826: 'effects_004500',
+    4827: 'effects_004500',
+    4867: 'effects_004500',
+    4868: 'effects_004500',
+    4869: 'effects_004500',
+    4871: 'effects_004500',
+    4896: 'effects_004500',
+    4897: 'effects_004500',
+    4898: 'effects_004500',
+    4901: 'effects_004500',
+    4902: 'effects_004500',
+    4906: 'effects_004500',
+    4911: 'effects_004500',
+    4921: 'effects_004500',
+    4923: 'effects_004500',
+    4928: 'effects_004500',
+    4934: 'effects_004500',
+    4936: 'effects_004500',
+    4941: 'effects_004500',
+    4945: 'effects_004500',
+    4950: 'effects_004500',
+    4951: 'effects_004500',
+    4961: 'effects_004500',
+    4967: 'effects_004500',
+    4970: 'effects_004500',
+    4972: 'effects_004500',
+    4973: 'effects_004500',
+    4974: 'effects_004500',
+    4975: 'effects_004500',
+    4976: 'effects_004500',
+    4989: 'effects_004500',
+    4990: 'effects_004500',
+    4991: 'effects_004500',
+    4994: 'effects_004500',
+    4995: 'effects_004500',
+    4996: 'effects_004500',
+    4997: 'effects_004500',
+    4999: 'effects_004500',
+    5000: 'effects_005000',
+    5008: 'effects_005000',
+    5009: 'effects_005000',
+    5011: 'effects_005000',
+    5012: 'effects_005000',
+    5013: 'effects_005000',
+    5014: 'effects_005000',
+    5015: 'effects_005000',
+    5016: 'effects_005000',
+    5017: 'effects_005000',
+    5018: 'effects_005000',
+    5019: 'effects_005000',
+    5020: 'effects_005000',
+    5021: 'effects_005000',
+    5028: 'effects_005000',
+    5030: 'effects_005000',
+    5035: 'effects_005000',
+    5036: 'effects_005000',
+    5045: 'effects_005000',
+    5048: 'effects_005000',
+    5051: 'effects_005000',
+    5058: 'effects_005000',
+    5066: 'effects_005000',
+    5067: 'effects_005000',
+    5068: 'effects_005000',
+    5069: 'effects_005000',
+    5079: 'effects_005000',
+    5080: 'effects_005000',
+    5081: 'effects_005000',
+    5087: 'effects_005000',
+    5090: 'effects_005000',
+    5103: 'effects_005000',
+    5104: 'effects_005000',
+    5105: 'effects_005000',
+    5106: 'effects_005000',
+    5107: 'effects_005000',
+    5108: 'effects_005000',
+    5109: 'effects_005000',
+    5110: 'effects_005000',
+    5111: 'effects_005000',
+    5119: 'effects_005000',
+    5121: 'effects_005000',
+    5122: 'effects_005000',
+    5123: 'effects_005000',
+    5124: 'effects_005000',
+    5125: 'effects_005000',
+    5126: 'effects_005000',
+    5127: 'effects_005000',
+    5128: 'effects_005000',
+    5129: 'effects_005000',
+    5131: 'effects_005000',
+    5132: 'effects_005000',
+    5133: 'effects_005000',
+    5136: 'effects_005000',
+    5139: 'effects_005000',
+    5153: 'effects_005000',
+    5162: 'effects_005000',
+    5165: 'effects_005000',
+    5168: 'effects_005000',
+    5180: 'effects_005000',
+    5181: 'effects_005000',
+    5182: 'effects_005000',
+    5183: 'effects_005000',
+    5185: 'effects_005000',
+    5187: 'effects_005000',
+    5188: 'effects_005000',
+    5189: 'effects_005000',
+    5190: 'effects_005000',
+    5201: 'effects_005000',
+    5205: 'effects_005000',
+    5206: 'effects_005000',
+    5207: 'effects_005000',
+    5208: 'effects_005000',
+    5209: 'effects_005000',
+    5212: 'effects_005000',
+    5213: 'effects_005000',
+    5214: 'effects_005000',
+    5215: 'effects_005000',
+    5216: 'effects_005000',
+    5217: 'effects_005000',
+    5218: 'effects_005000',
+    5219: 'effects_005000',
+    5220: 'effects_005000',
+    5221: 'effects_005000',
+    5222: 'effects_005000',
+    5223: 'effects_005000',
+    5224: 'effects_005000',
+    5225: 'effects_005000',
+    5226: 'effects_005000',
+    5227: 'effects_005000',
+    5228: 'effects_005000',
+    5229: 'effects_005000',
+    5230: 'effects_005000',
+    5231: 'effects_005000',
+    5234: 'effects_005000',
+    5237: 'effects_005000',
+    5240: 'effects_005000',
+    5243: 'effects_005000',
+    5259: 'effects_005000',
+    5260: 'effects_005000',
+    5261: 'effects_005000',
+    5262: 'effects_005000',
+    5263: 'effects_005000',
+    5264: 'effects_005000',
+    5265: 'effects_005000',
+    5266: 'effects_005000',
+    5267: 'effects_005000',
+    5268: 'effects_005000',
+    5275: 'effects_005000',
+    5293: 'effects_005000',
+    5294: 'effects_005000',
+    5295: 'effects_005000',
+    5300: 'effects_005000',
+    5303: 'effects_005000',
+    5304: 'effects_005000',
+    5305: 'effects_005000',
+    5306: 'effects_005000',
+    5307: 'effects_005000',
+    5308: 'effects_005000',
+    5309: 'effects_005000',
+    5310: 'effects_005000',
+    5311: 'effects_005000',
+    5316: 'effects_005000',
+    5317: 'effects_005000',
+    5318: 'effects_005000',
+    5319: 'effects_005000',
+    5320: 'effects_005000',
+    5321: 'effects_005000',
+    5322: 'effects_005000',
+    5323: 'effects_005000',
+    5324: 'effects_005000',
+    5325: 'effects_005000',
+    5326: 'effects_005000',
+    5331: 'effects_005000',
+    5332: 'effects_005000',
+    5333: 'effects_005000',
+    5334: 'effects_005000',
+    5335: 'effects_005000',
+    5336: 'effects_005000',
+    5337: 'effects_005000',
+    5338: 'effects_005000',
+    5339: 'effects_005000',
+    5340: 'effects_005000',
+    5341: 'effects_005000',
+    5342: 'effects_005000',
+    5343: 'effects_005000',
+    5348: 'effects_005000',
+    5349: 'effects_005000',
+    5350: 'effects_005000',
+    5351: 'effects_005000',
+    5352: 'effects_005000',
+    5353: 'effects_005000',
+    5354: 'effects_005000',
+    5355: 'effects_005000',
+    5356: 'effects_005000',
+    5357: 'effects_005000',
+    5358: 'effects_005000',
+    5359: 'effects_005000',
+    5360: 'effects_005000',
+    5361: 'effects_005000',
+    5364: 'effects_005000',
+    5365: 'effects_005000',
+    5366: 'effects_005000',
+    5367: 'effects_005000',
+    5378: 'effects_005000',
+    5379: 'effects_005000',
+    5380: 'effects_005000',
+    5381: 'effects_005000',
+    5382: 'effects_005000',
+    5383: 'effects_005000',
+    5384: 'effects_005000',
+    5385: 'effects_005000',
+    5386: 'effects_005000',
+    5387: 'effects_005000',
+    5388: 'effects_005000',
+    5397: 'effects_005000',
+    5398: 'effects_005000',
+    5399: 'effects_005000',
+    5402: 'effects_005000',
+    5403: 'effects_005000',
+    5410: 'effects_005000',
+    5411: 'effects_005000',
+    5417: 'effects_005000',
+    5418: 'effects_005000',
+    5419: 'effects_005000',
+    5420: 'effects_005000',
+    5424: 'effects_005000',
+    5427: 'effects_005000',
+    5428: 'effects_005000',
+    5429: 'effects_005000',
+    5430: 'effects_005000',
+    5433: 'effects_005000',
+    5437: 'effects_005000',
+    5440: 'effects_005000',
+    5444: 'effects_005000',
+    5445: 'effects_005000',
+    5456: 'effects_005000',
+    5457: 'effects_005000',
+    5459: 'effects_005000',
+    5460: 'effects_005000',
+    5461: 'effects_005000',
+    5468: 'effects_005000',
+    5469: 'effects_005000',
+    5470: 'effects_005000',
+    5471: 'effects_005000',
+    5477: 'effects_005000',
+    5478: 'effects_005000',
+    5479: 'effects_005000',
+    5480: 'effects_005000',
+    5482: 'effects_005000',
+    5483: 'effects_005000',
+    5484: 'effects_005000',
+    5485: 'effects_005000',
+    5486: 'effects_005000',
+    5496: 'effects_005000',
+    5497: 'effects_005000',
+    5499: 'effects_005000',
+    5500: 'effects_005500',
+    5501: 'effects_005500',
+    5505: 'effects_005500',
+    5514: 'effects_005500',
+    5521: 'effects_005500',
+    5539: 'effects_005500',
+    5540: 'effects_005500',
+    5541: 'effects_005500',
+    5542: 'effects_005500',
+    5552: 'effects_005500',
+    5553: 'effects_005500',
+    5554: 'effects_005500',
+    5555: 'effects_005500',
+    5556: 'effects_005500',
+    5557: 'effects_005500',
+    5558: 'effects_005500',
+    5559: 'effects_005500',
+    5560: 'effects_005500',
+    5564: 'effects_005500',
+    5568: 'effects_005500',
+    5570: 'effects_005500',
+    5572: 'effects_005500',
+    5573: 'effects_005500',
+    5574: 'effects_005500',
+    5575: 'effects_005500',
+    5607: 'effects_005500',
+    5610: 'effects_005500',
+    5611: 'effects_005500',
+    5618: 'effects_005500',
+    5619: 'effects_005500',
+    5620: 'effects_005500',
+    5621: 'effects_005500',
+    5622: 'effects_005500',
+    5628: 'effects_005500',
+    5629: 'effects_005500',
+    5630: 'effects_005500',
+    5631: 'effects_005500',
+    5632: 'effects_005500',
+    5633: 'effects_005500',
+    5634: 'effects_005500',
+    5635: 'effects_005500',
+    5636: 'effects_005500',
+    5637: 'effects_005500',
+    5638: 'effects_005500',
+    5639: 'effects_005500',
+    5644: 'effects_005500',
+    5647: 'effects_005500',
+    5650: 'effects_005500',
+    5657: 'effects_005500',
+    5673: 'effects_005500',
+    5695: 'effects_005500',
+    5717: 'effects_005500',
+    5721: 'effects_005500',
+    5723: 'effects_005500',
+    5724: 'effects_005500',
+    5725: 'effects_005500',
+    5726: 'effects_005500',
+    5733: 'effects_005500',
+    5734: 'effects_005500',
+    5735: 'effects_005500',
+    5736: 'effects_005500',
+    5737: 'effects_005500',
+    5738: 'effects_005500',
+    5754: 'effects_005500',
+    5757: 'effects_005500',
+    5758: 'effects_005500',
+    5769: 'effects_005500',
+    5778: 'effects_005500',
+    5779: 'effects_005500',
+    5793: 'effects_005500',
+    5802: 'effects_005500',
+    5803: 'effects_005500',
+    5804: 'effects_005500',
+    5805: 'effects_005500',
+    5806: 'effects_005500',
+    5807: 'effects_005500',
+    5808: 'effects_005500',
+    5809: 'effects_005500',
+    5810: 'effects_005500',
+    5811: 'effects_005500',
+    5812: 'effects_005500',
+    5813: 'effects_005500',
+    5814: 'effects_005500',
+    5815: 'effects_005500',
+    5816: 'effects_005500',
+    5817: 'effects_005500',
+    5818: 'effects_005500',
+    5819: 'effects_005500',
+    5820: 'effects_005500',
+    5821: 'effects_005500',
+    5822: 'effects_005500',
+    5823: 'effects_005500',
+    5824: 'effects_005500',
+    5825: 'effects_005500',
+    5826: 'effects_005500',
+    5827: 'effects_005500',
+    5852: 'effects_005500',
+    5853: 'effects_005500',
+    5854: 'effects_005500',
+    5862: 'effects_005500',
+    5863: 'effects_005500',
+    5864: 'effects_005500',
+    5865: 'effects_005500',
+    5866: 'effects_005500',
+    5867: 'effects_005500',
+    5868: 'effects_005500',
+    5869: 'effects_005500',
+    5870: 'effects_005500',
+    5871: 'effects_005500',
+    5872: 'effects_005500',
+    5873: 'effects_005500',
+    5874: 'effects_005500',
+    5881: 'effects_005500',
+    5888: 'effects_005500',
+    5889: 'effects_005500',
+    5890: 'effects_005500',
+    5891: 'effects_005500',
+    5892: 'effects_005500',
+    5893: 'effects_005500',
+    5896: 'effects_005500',
+    5899: 'effects_005500',
+    5900: 'effects_005500',
+    5901: 'effects_005500',
+    5911: 'effects_005500',
+    5912: 'effects_005500',
+    5913: 'effects_005500',
+    5914: 'effects_005500',
+    5915: 'effects_005500',
+    5916: 'effects_005500',
+    5917: 'effects_005500',
+    5918: 'effects_005500',
+    5919: 'effects_005500',
+    5920: 'effects_005500',
+    5921: 'effects_005500',
+    5922: 'effects_005500',
+    5923: 'effects_005500',
+    5924: 'effects_005500',
+    5925: 'effects_005500',
+    5926: 'effects_005500',
+    5927: 'effects_005500',
+    5929: 'effects_005500',
+    5934: 'effects_005500',
+    5939: 'effects_005500',
+    5944: 'effects_005500',
+    5945: 'effects_005500',
+    5951: 'effects_005500',
+    5956: 'effects_005500',
+    5957: 'effects_005500',
+    5958: 'effects_005500',
+    5959: 'effects_005500',
+    5994: 'effects_005500',
+    5995: 'effects_005500',
+    5998: 'effects_005500',
+    6001: 'effects_006000',
+    6006: 'effects_006000',
+    6007: 'effects_006000',
+    6008: 'effects_006000',
+    6009: 'effects_006000',
+    6010: 'effects_006000',
+    6011: 'effects_006000',
+    6012: 'effects_006000',
+    6014: 'effects_006000',
+    6015: 'effects_006000',
+    6016: 'effects_006000',
+    6017: 'effects_006000',
+    6020: 'effects_006000',
+    6021: 'effects_006000',
+    6025: 'effects_006000',
+    6027: 'effects_006000',
+    6032: 'effects_006000',
+    6036: 'effects_006000',
+    6037: 'effects_006000',
+    6038: 'effects_006000',
+    6039: 'effects_006000',
+    6040: 'effects_006000',
+    6041: 'effects_006000',
+    6045: 'effects_006000',
+    6046: 'effects_006000',
+    6047: 'effects_006000',
+    6048: 'effects_006000',
+    6051: 'effects_006000',
+    6052: 'effects_006000',
+    6053: 'effects_006000',
+    6054: 'effects_006000',
+    6055: 'effects_006000',
+    6056: 'effects_006000',
+    6057: 'effects_006000',
+    6058: 'effects_006000',
+    6059: 'effects_006000',
+    6060: 'effects_006000',
+    6061: 'effects_006000',
+    6062: 'effects_006000',
+    6063: 'effects_006000',
+    6076: 'effects_006000',
+    6077: 'effects_006000',
+    6083: 'effects_006000',
+    6085: 'effects_006000',
+    6088: 'effects_006000',
+    6093: 'effects_006000',
+    6096: 'effects_006000',
+    6098: 'effects_006000',
+    6104: 'effects_006000',
+    6110: 'effects_006000',
+    6111: 'effects_006000',
+    6112: 'effects_006000',
+    6113: 'effects_006000',
+    6128: 'effects_006000',
+    6129: 'effects_006000',
+    6130: 'effects_006000',
+    6131: 'effects_006000',
+    6135: 'effects_006000',
+    6144: 'effects_006000',
+    6148: 'effects_006000',
+    6149: 'effects_006000',
+    6150: 'effects_006000',
+    6151: 'effects_006000',
+    6152: 'effects_006000',
+    6153: 'effects_006000',
+    6154: 'effects_006000',
+    6155: 'effects_006000',
+    6163: 'effects_006000',
+    6164: 'effects_006000',
+    6166: 'effects_006000',
+    6170: 'effects_006000',
+    6171: 'effects_006000',
+    6172: 'effects_006000',
+    6173: 'effects_006000',
+    6174: 'effects_006000',
+    6175: 'effects_006000',
+    6176: 'effects_006000',
+    6177: 'effects_006000',
+    6178: 'effects_006000',
+    6184: 'effects_006000',
+    6185: 'effects_006000',
+    6186: 'effects_006000',
+    6187: 'effects_006000',
+    6188: 'effects_006000',
+    6195: 'effects_006000',
+    6197: 'effects_006000',
+    6201: 'effects_006000',
+    6208: 'effects_006000',
+    6214: 'effects_006000',
+    6216: 'effects_006000',
+    6222: 'effects_006000',
+    6230: 'effects_006000',
+    6232: 'effects_006000',
+    6233: 'effects_006000',
+    6234: 'effects_006000',
+    6237: 'effects_006000',
+    6238: 'effects_006000',
+    6241: 'effects_006000',
+    6242: 'effects_006000',
+    6245: 'effects_006000',
+    6246: 'effects_006000',
+    6253: 'effects_006000',
+    6256: 'effects_006000',
+    6257: 'effects_006000',
+    6260: 'effects_006000',
+    6267: 'effects_006000',
+    6272: 'effects_006000',
+    6273: 'effects_006000',
+    6278: 'effects_006000',
+    6281: 'effects_006000',
+    6285: 'effects_006000',
+    6287: 'effects_006000',
+    6291: 'effects_006000',
+    6294: 'effects_006000',
+    6299: 'effects_006000',
+    6300: 'effects_006000',
+    6301: 'effects_006000',
+    6305: 'effects_006000',
+    6307: 'effects_006000',
+    6308: 'effects_006000',
+    6309: 'effects_006000',
+    6310: 'effects_006000',
+    6315: 'effects_006000',
+    6316: 'effects_006000',
+    6317: 'effects_006000',
+    6318: 'effects_006000',
+    6319: 'effects_006000',
+    6320: 'effects_006000',
+    6321: 'effects_006000',
+    6322: 'effects_006000',
+    6323: 'effects_006000',
+    6324: 'effects_006000',
+    6325: 'effects_006000',
+    6326: 'effects_006000',
+    6327: 'effects_006000',
+    6328: 'effects_006000',
+    6329: 'effects_006000',
+    6330: 'effects_006000',
+    6331: 'effects_006000',
+    6332: 'effects_006000',
+    6333: 'effects_006000',
+    6334: 'effects_006000',
+    6335: 'effects_006000',
+    6336: 'effects_006000',
+    6337: 'effects_006000',
+    6338: 'effects_006000',
+    6339: 'effects_006000',
+    6340: 'effects_006000',
+    6341: 'effects_006000',
+    6342: 'effects_006000',
+    6343: 'effects_006000',
+    6350: 'effects_006000',
+    6351: 'effects_006000',
+    6352: 'effects_006000',
+    6353: 'effects_006000',
+    6354: 'effects_006000',
+    6357: 'effects_006000',
+    6358: 'effects_006000',
+    6359: 'effects_006000',
+    6360: 'effects_006000',
+    6361: 'effects_006000',
+    6362: 'effects_006000',
+    6368: 'effects_006000',
+    6369: 'effects_006000',
+    6370: 'effects_006000',
+    6371: 'effects_006000',
+    6372: 'effects_006000',
+    6373: 'effects_006000',
+    6374: 'effects_006000',
+    6377: 'effects_006000',
+    6378: 'effects_006000',
+    6379: 'effects_006000',
+    6380: 'effects_006000',
+    6381: 'effects_006000',
+    6384: 'effects_006000',
+    6385: 'effects_006000',
+    6386: 'effects_006000',
+    6395: 'effects_006000',
+    6396: 'effects_006000',
+    6400: 'effects_006000',
+    6401: 'effects_006000',
+    6402: 'effects_006000',
+    6403: 'effects_006000',
+    6404: 'effects_006000',
+    6405: 'effects_006000',
+    6406: 'effects_006000',
+    6407: 'effects_006000',
+    6408: 'effects_006000',
+    6409: 'effects_006000',
+    6410: 'effects_006000',
+    6411: 'effects_006000',
+    6412: 'effects_006000',
+    6413: 'effects_006000',
+    6417: 'effects_006000',
+    6422: 'effects_006000',
+    6423: 'effects_006000',
+    6424: 'effects_006000',
+    6425: 'effects_006000',
+    6426: 'effects_006000',
+    6427: 'effects_006000',
+    6428: 'effects_006000',
+    6431: 'effects_006000',
+    6434: 'effects_006000',
+    6435: 'effects_006000',
+    6436: 'effects_006000',
+    6437: 'effects_006000',
+    6439: 'effects_006000',
+    6440: 'effects_006000',
+    6441: 'effects_006000',
+    6443: 'effects_006000',
+    6447: 'effects_006000',
+    6448: 'effects_006000',
+    6449: 'effects_006000',
+    6465: 'effects_006000',
+    6470: 'effects_006000',
+    6472: 'effects_006000',
+    6473: 'effects_006000',
+    6474: 'effects_006000',
+    6475: 'effects_006000',
+    6476: 'effects_006000',
+    6477: 'effects_006000',
+    6478: 'effects_006000',
+    6479: 'effects_006000',
+    6481: 'effects_006000',
+    6482: 'effects_006000',
+    6484: 'effects_006000',
+    6485: 'effects_006000',
+    6487: 'effects_006000',
+    6488: 'effects_006000',
+    6501: 'effects_006500',
+    6502: 'effects_006500',
+    6503: 'effects_006500',
+    6504: 'effects_006500',
+    6505: 'effects_006500',
+    6506: 'effects_006500',
+    6507: 'effects_006500',
+    6508: 'effects_006500',
+    6509: 'effects_006500',
+    6510: 'effects_006500',
+    6511: 'effects_006500',
+    6513: 'effects_006500',
+    6526: 'effects_006500',
+    6527: 'effects_006500',
+    6533: 'effects_006500',
+    6534: 'effects_006500',
+    6535: 'effects_006500',
+    6536: 'effects_006500',
+    6537: 'effects_006500',
+    6545: 'effects_006500',
+    6546: 'effects_006500',
+    6548: 'effects_006500',
+    6549: 'effects_006500',
+    6551: 'effects_006500',
+    6552: 'effects_006500',
+    6555: 'effects_006500',
+    6556: 'effects_006500',
+    6557: 'effects_006500',
+    6558: 'effects_006500',
+    6559: 'effects_006500',
+    6560: 'effects_006500',
+    6561: 'effects_006500',
+    6562: 'effects_006500',
+    6563: 'effects_006500',
+    6565: 'effects_006500',
+    6566: 'effects_006500',
+    6567: 'effects_006500',
+    6570: 'effects_006500',
+    6571: 'effects_006500',
+    6572: 'effects_006500',
+    6573: 'effects_006500',
+    6574: 'effects_006500',
+    6575: 'effects_006500',
+    6576: 'effects_006500',
+    6577: 'effects_006500',
+    6578: 'effects_006500',
+    6580: 'effects_006500',
+    6581: 'effects_006500',
+    6582: 'effects_006500',
+    6591: 'effects_006500',
+    6592: 'effects_006500',
+    6593: 'effects_006500',
+    6594: 'effects_006500',
+    6595: 'effects_006500',
+    6596: 'effects_006500',
+    6597: 'effects_006500',
+    6598: 'effects_006500',
+    6599: 'effects_006500',
+    6600: 'effects_006500',
+    6601: 'effects_006500',
+    6602: 'effects_006500',
+    6603: 'effects_006500',
+    6604: 'effects_006500',
+    6605: 'effects_006500',
+    6606: 'effects_006500',
+    6607: 'effects_006500',
+    6608: 'effects_006500',
+    6609: 'effects_006500',
+    6610: 'effects_006500',
+    6611: 'effects_006500',
+    6612: 'effects_006500',
+    6613: 'effects_006500',
+    6614: 'effects_006500',
+    6615: 'effects_006500',
+    6616: 'effects_006500',
+    6617: 'effects_006500',
+    6618: 'effects_006500',
+    6619: 'effects_006500',
+    6620: 'effects_006500',
+    6621: 'effects_006500',
+    6622: 'effects_006500',
+    6623: 'effects_006500',
+    6624: 'effects_006500',
+    6625: 'effects_006500',
+    6626: 'effects_006500',
+    6627: 'effects_006500',
+    6628: 'effects_006500',
+    6629: 'effects_006500',
+    6634: 'effects_006500',
+    6635: 'effects_006500',
+    6636: 'effects_006500',
+    6637: 'effects_006500',
+    6638: 'effects_006500',
+    6639: 'effects_006500',
+    6640: 'effects_006500',
+    6641: 'effects_006500',
+    6642: 'effects_006500',
+    6647: 'effects_006500',
+    6648: 'effects_006500',
+    6649: 'effects_006500',
+    6650: 'effects_006500',
+    6651: 'effects_006500',
+    6652: 'effects_006500',
+    6653: 'effects_006500',
+    6654: 'effects_006500',
+    6655: 'effects_006500',
+    6657: 'effects_006500',
+    6658: 'effects_006500',
+    6660: 'effects_006500',
+    6661: 'effects_006500',
+    6662: 'effects_006500',
+    6663: 'effects_006500',
+    6664: 'effects_006500',
+    6665: 'effects_006500',
+    6667: 'effects_006500',
+    6669: 'effects_006500',
+    6670: 'effects_006500',
+    6671: 'effects_006500',
+    6672: 'effects_006500',
+    6679: 'effects_006500',
+    6681: 'effects_006500',
+    6682: 'effects_006500',
+    6683: 'effects_006500',
+    6684: 'effects_006500',
+    6685: 'effects_006500',
+    6686: 'effects_006500',
+    6687: 'effects_006500',
+    6688: 'effects_006500',
+    6689: 'effects_006500',
+    6690: 'effects_006500',
+    6691: 'effects_006500',
+    6692: 'effects_006500',
+    6693: 'effects_006500',
+    6694: 'effects_006500',
+    6695: 'effects_006500',
+    6697: 'effects_006500',
+    6698: 'effects_006500',
+    6699: 'effects_006500',
+    6700: 'effects_006500',
+    6701: 'effects_006500',
+    6702: 'effects_006500',
+    6703: 'effects_006500',
+    6704: 'effects_006500',
+    6705: 'effects_006500',
+    6706: 'effects_006500',
+    6708: 'effects_006500',
+    6709: 'effects_006500',
+    6710: 'effects_006500',
+    6711: 'effects_006500',
+    6712: 'effects_006500',
+    6713: 'effects_006500',
+    6714: 'effects_006500',
+    6720: 'effects_006500',
+    6721: 'effects_006500',
+    6722: 'effects_006500',
+    6723: 'effects_006500',
+    6724: 'effects_006500',
+    6725: 'effects_006500',
+    6726: 'effects_006500',
+    6727: 'effects_006500',
+    6730: 'effects_006500',
+    6731: 'effects_006500',
+    6732: 'effects_006500',
+    6733: 'effects_006500',
+    6734: 'effects_006500',
+    6735: 'effects_006500',
+    6736: 'effects_006500',
+    6737: 'effects_006500',
+    6753: 'effects_006500',
+    6762: 'effects_006500',
+    6763: 'effects_006500',
+    6764: 'effects_006500',
+    6765: 'effects_006500',
+    6766: 'effects_006500',
+    6769: 'effects_006500',
+    6770: 'effects_006500',
+    6771: 'effects_006500',
+    6772: 'effects_006500',
+    6773: 'effects_006500',
+    6774: 'effects_006500',
+    6776: 'effects_006500',
+    6777: 'effects_006500',
+    6778: 'effects_006500',
+    6779: 'effects_006500',
+    6780: 'effects_006500',
+    6782: 'effects_006500',
+    6783: 'effects_006500',
+    6786: 'effects_006500',
+    6789: 'effects_006500',
+    6793: 'effects_006500',
+    6794: 'effects_006500',
+    6796: 'effects_006500',
+    6797: 'effects_006500',
+    6798: 'effects_006500',
+    6799: 'effects_006500',
+    6800: 'effects_006500',
+    6801: 'effects_006500',
+    6807: 'effects_006500',
+    6844: 'effects_006500',
+    6845: 'effects_006500',
+    6851: 'effects_006500',
+    6852: 'effects_006500',
+    6853: 'effects_006500',
+    6855: 'effects_006500',
+    6856: 'effects_006500',
+    6857: 'effects_006500',
+    6858: 'effects_006500',
+    6859: 'effects_006500',
+    6860: 'effects_006500',
+    6861: 'effects_006500',
+    6862: 'effects_006500',
+    6865: 'effects_006500',
+    6866: 'effects_006500',
+    6867: 'effects_006500',
+    6871: 'effects_006500',
+    6872: 'effects_006500',
+    6873: 'effects_006500',
+    6874: 'effects_006500',
+    6877: 'effects_006500',
+    6878: 'effects_006500',
+    6879: 'effects_006500',
+    6880: 'effects_006500',
+    6881: 'effects_006500',
+    6883: 'effects_006500',
+    6894: 'effects_006500',
+    6895: 'effects_006500',
+    6896: 'effects_006500',
+    6897: 'effects_006500',
+    6898: 'effects_006500',
+    6899: 'effects_006500',
+    6900: 'effects_006500',
+    6908: 'effects_006500',
+    6909: 'effects_006500',
+    6910: 'effects_006500',
+    6911: 'effects_006500',
+    6920: 'effects_006500',
+    6921: 'effects_006500',
+    6923: 'effects_006500',
+    6924: 'effects_006500',
+    6925: 'effects_006500',
+    6926: 'effects_006500',
+    6927: 'effects_006500',
+    6928: 'effects_006500',
+    6929: 'effects_006500',
+    6930: 'effects_006500',
+    6931: 'effects_006500',
+    6932: 'effects_006500',
+    6933: 'effects_006500',
+    6934: 'effects_006500',
+    6935: 'effects_006500',
+    6936: 'effects_006500',
+    6937: 'effects_006500',
+    6938: 'effects_006500',
+    6939: 'effects_006500',
+    6940: 'effects_006500',
+    6941: 'effects_006500',
+    6942: 'effects_006500',
+    6943: 'effects_006500',
+    6944: 'effects_006500',
+    6945: 'effects_006500',
+    6946: 'effects_006500',
+    6947: 'effects_006500',
+    6949: 'effects_006500',
+    6951: 'effects_006500',
+    6953: 'effects_006500',
+    6954: 'effects_006500',
+    6955: 'effects_006500',
+    6956: 'effects_006500',
+    6957: 'effects_006500',
+    6958: 'effects_006500',
+    6959: 'effects_006500',
+    6960: 'effects_006500',
+    6961: 'effects_006500',
+    6962: 'effects_006500',
+    6963: 'effects_006500',
+    6964: 'effects_006500',
+    6965: 'effects_006500',
+    6981: 'effects_006500',
+    6982: 'effects_006500',
+    6983: 'effects_006500',
+    6984: 'effects_006500',
+    6985: 'effects_006500',
+    6986: 'effects_006500',
+    6987: 'effects_006500',
+    6992: 'effects_006500',
+    6993: 'effects_006500',
+    6994: 'effects_006500',
+    6995: 'effects_006500',
+    6996: 'effects_006500',
+    6997: 'effects_006500',
+    6999: 'effects_006500',
+    7000: 'effects_007000',
+    7001: 'effects_007000',
+    7002: 'effects_007000',
+    7003: 'effects_007000',
+    7008: 'effects_007000',
+    7009: 'effects_007000',
+    7012: 'effects_007000',
+    7013: 'effects_007000',
+    7014: 'effects_007000',
+    7015: 'effects_007000',
+    7016: 'effects_007000',
+    7017: 'effects_007000',
+    7018: 'effects_007000',
+    7020: 'effects_007000',
+    7021: 'effects_007000',
+    7026: 'effects_007000',
+    7027: 'effects_007000',
+    7028: 'effects_007000',
+    7029: 'effects_007000',
+    7030: 'effects_007000',
+    7031: 'effects_007000',
+    7032: 'effects_007000',
+    7033: 'effects_007000',
+    7034: 'effects_007000',
+    7035: 'effects_007000',
+    7036: 'effects_007000',
+    7037: 'effects_007000',
+    7038: 'effects_007000',
+    7039: 'effects_007000',
+    7040: 'effects_007000',
+    7042: 'effects_007000',
+    7043: 'effects_007000',
+    7044: 'effects_007000',
+    7045: 'effects_007000',
+    7046: 'effects_007000',
+    7047: 'effects_007000',
+    7050: 'effects_007000',
+    7051: 'effects_007000',
+    7052: 'effects_007000',
+    7055: 'effects_007000',
+    7058: 'effects_007000',
+    7059: 'effects_007000',
+    7060: 'effects_007000',
+    7061: 'effects_007000',
+    7062: 'effects_007000',
+    7063: 'effects_007000',
+    7064: 'effects_007000',
+    7071: 'effects_007000',
+    7072: 'effects_007000',
+    7073: 'effects_007000',
+    7074: 'effects_007000',
+    7075: 'effects_007000',
+    7076: 'effects_007000',
+    7077: 'effects_007000',
+    7078: 'effects_007000',
+    7079: 'effects_007000',
+    7080: 'effects_007000',
+    7085: 'effects_007000',
+    7086: 'effects_007000',
+    7087: 'effects_007000',
+    7088: 'effects_007000',
+    7091: 'effects_007000',
+    7092: 'effects_007000',
+    7093: 'effects_007000',
+    7094: 'effects_007000',
+    7097: 'effects_007000',
+    7098: 'effects_007000',
+    7111: 'effects_007000',
+    7112: 'effects_007000',
+    7116: 'effects_007000',
+    7117: 'effects_007000',
+    7118: 'effects_007000',
+    7119: 'effects_007000',
+    7142: 'effects_007000',
+    7154: 'effects_007000',
+    7155: 'effects_007000',
+    7156: 'effects_007000',
+    7157: 'effects_007000',
+    7158: 'effects_007000',
+    7159: 'effects_007000',
+    7160: 'effects_007000',
+    7161: 'effects_007000',
+    7162: 'effects_007000',
+    7166: 'effects_007000',
+    7167: 'effects_007000',
+    7168: 'effects_007000',
+    7169: 'effects_007000',
+    7170: 'effects_007000',
+    7171: 'effects_007000',
+    7172: 'effects_007000',
+    7173: 'effects_007000',
+    7176: 'effects_007000',
+    7177: 'effects_007000',
+    7183: 'effects_007000',
+    7184: 'effects_007000',
+    7185: 'effects_007000',
+    7186: 'effects_007000',
+    7193: 'effects_007000',
+    7202: 'effects_007000',
+    7203: 'effects_007000',
+    7204: 'effects_007000',
+    7205: 'effects_007000',
+    7206: 'effects_007000',
+    7207: 'effects_007000',
+    7209: 'effects_007000',
+    7210: 'effects_007000',
+    7211: 'effects_007000',
+    7216: 'effects_007000',
+    7223: 'effects_007000',
+    7227: 'effects_007000',
+    7228: 'effects_007000',
+    7230: 'effects_007000',
+    7231: 'effects_007000',
+    7232: 'effects_007000',
+    7233: 'effects_007000',
+    7234: 'effects_007000',
+    7237: 'effects_007000',
+    7238: 'effects_007000',
+    7239: 'effects_007000',
+    7240: 'effects_007000',
+    7242: 'effects_007000',
+    7247: 'effects_007000',
+    7248: 'effects_007000',
+    8011: 'effects_008000',
+    8013: 'effects_008000',
+    8017: 'effects_008000',
+    8018: 'effects_008000',
+    8020: 'effects_008000',
+    8021: 'effects_008000',
+    8023: 'effects_008000',
+    8024: 'effects_008000',
+    8025: 'effects_008000',
+    8026: 'effects_008000',
+    8029: 'effects_008000',
+    8031: 'effects_008000',
+    8032: 'effects_008000',
+    8033: 'effects_008000',
+    8034: 'effects_008000',
+    8035: 'effects_008000',
+    8036: 'effects_008000',
+    8037: 'effects_008000',
+    8039: 'effects_008000',
+    8041: 'effects_008000',
+    8042: 'effects_008000',
+    8044: 'effects_008000',
+    8045: 'effects_008000',
+    8046: 'effects_008000',
+    8047: 'effects_008000',
+    8048: 'effects_008000',
+    8052: 'effects_008000',
+    8053: 'effects_008000',
+    8054: 'effects_008000',
+    8056: 'effects_008000',
+    8057: 'effects_008000',
+    8062: 'effects_008000',
+    8064: 'effects_008000',
+    8065: 'effects_008000',
+    8066: 'effects_008000',
+    8068: 'effects_008000',
+    8070: 'effects_008000',
+    8071: 'effects_008000',
+    8072: 'effects_008000',
+    8073: 'effects_008000',
+    8074: 'effects_008000',
+    8076: 'effects_008000',
+    8082: 'effects_008000',
+    8091: 'effects_008000',
+    8092: 'effects_008000',
+    8094: 'effects_008000',
+    8095: 'effects_008000',
+    8096: 'effects_008000',
+    8097: 'effects_008000',
+    8098: 'effects_008000',
+    8099: 'effects_008000',
+    8100: 'effects_008000',
+    8101: 'effects_008000',
+    8102: 'effects_008000',
+    8103: 'effects_008000',
+    8104: 'effects_008000',
+    8106: 'effects_008000',
+    8107: 'effects_008000',
+    8108: 'effects_008000',
+    8109: 'effects_008000',
+    8111: 'effects_008000',
+    8112: 'effects_008000',
+    8113: 'effects_008000',
+    8114: 'effects_008000',
+    8117: 'effects_008000',
+    8119: 'effects_008000',
+    8120: 'effects_008000',
+    8121: 'effects_008000',
+    8123: 'effects_008000',
+    8128: 'effects_008000',
+    8129: 'effects_008000',
+    8130: 'effects_008000',
+    8131: 'effects_008000',
+    8132: 'effects_008000',
+    8133: 'effects_008000',
+    8134: 'effects_008000',
+    8135: 'effects_008000',
+    8136: 'effects_008000',
+    8151: 'effects_008000',
+    8152: 'effects_008000',
+    8154: 'effects_008000',
+    8155: 'effects_008000',
+    8156: 'effects_008000',
+    8157: 'effects_008000',
+    8158: 'effects_008000',
+    8199: 'effects_008000',
+    8206: 'effects_008000',
+    8210: 'effects_008000',
+    8223: 'effects_008000',
+    8224: 'effects_008000',
+    8225: 'effects_008000',
+    8226: 'effects_008000',
+    8227: 'effects_008000',
+    8228: 'effects_008000',
+    8229: 'effects_008000',
+    8230: 'effects_008000',
+    8231: 'effects_008000',
+    8243: 'effects_008000',
+    8244: 'effects_008000',
+    8249: 'effects_008000',
+    8251: 'effects_008000',
+    8253: 'effects_008000',
+    8261: 'effects_008000',
+    8263: 'effects_008000',
+    8264: 'effects_008000',
+    8267: 'effects_008000',
+    8268: 'effects_008000',
+    8269: 'effects_008000',
+    8270: 'effects_008000',
+    8275: 'effects_008000',
+    8278: 'effects_008000',
+    8279: 'effects_008000',
+    8291: 'effects_008000',
+    8294: 'effects_008000',
+    8295: 'effects_008000',
+    8296: 'effects_008000',
+    8297: 'effects_008000',
+    8300: 'effects_008000',
+    8301: 'effects_008000',
+    8303: 'effects_008000',
+    8304: 'effects_008000',
+    8305: 'effects_008000',
+    8306: 'effects_008000',
+    8309: 'effects_008000',
+    8311: 'effects_008000',
+    8313: 'effects_008000',
+    8315: 'effects_008000',
+    8317: 'effects_008000',
+    8323: 'effects_008000',
+    8360: 'effects_008000',
+    8362: 'effects_008000',
+    8364: 'effects_008000',
+    8372: 'effects_008000',
+    8377: 'effects_008000',
+    8467: 'effects_008000',
+    8468: 'effects_008000',
+    8470: 'effects_008000',
+    8474: 'effects_008000',
+    8477: 'effects_008000',
+    8478: 'effects_008000',
+    8479: 'effects_008000',
+    11055: 'effects_011000',
+    11056: 'effects_011000',
+    11057: 'effects_011000',
+    11059: 'effects_011000',
+    11060: 'effects_011000',
+    11061: 'effects_011000',
+    11063: 'effects_011000',
+    11064: 'effects_011000',
+    11065: 'effects_011000',
+    11067: 'effects_011000',
+    11068: 'effects_011000',
+    11069: 'effects_011000',
+    11070: 'effects_011000',
+    11072: 'effects_011000',
+    11358: 'effects_011000',
+    11359: 'effects_011000',
+    11373: 'effects_011000',
+    11374: 'effects_011000',
+    11376: 'effects_011000',
+    11380: 'effects_011000',
+    11381: 'effects_011000',
+    11382: 'effects_011000',
+    11387: 'effects_011000',
+    11388: 'effects_011000',
+    11390: 'effects_011000',
+    11391: 'effects_011000',
+    11392: 'effects_011000',
+    11393: 'effects_011000',
+    11394: 'effects_011000',
+    11395: 'effects_011000',
+    11396: 'effects_011000',
+    11397: 'effects_011000',
+    11398: 'effects_011000',
+    11399: 'effects_011000',
+    11400: 'effects_011000',
+    11401: 'effects_011000',
+    11402: 'effects_011000',
+    11404: 'effects_011000',
+    11405: 'effects_011000',
+    11406: 'effects_011000',
+    11407: 'effects_011000',
+    11408: 'effects_011000',
+    11410: 'effects_011000',
+    11411: 'effects_011000',
+    11412: 'effects_011000',
+    11413: 'effects_011000',
+    11414: 'effects_011000',
+    11415: 'effects_011000',
+    11416: 'effects_011000',
+    11417: 'effects_011000',
+    11419: 'effects_011000',
+    11420: 'effects_011000',
+    11421: 'effects_011000',
+    11422: 'effects_011000',
+    11423: 'effects_011000',
+    11424: 'effects_011000',
+    11425: 'effects_011000',
+    11426: 'effects_011000',
+    11428: 'effects_011000',
+    11429: 'effects_011000',
+    11430: 'effects_011000',
+    11431: 'effects_011000',
+    11432: 'effects_011000',
+    11445: 'effects_011000',
+    11446: 'effects_011000',
+    11450: 'effects_011000',
+    11452: 'effects_011000',
+    11454: 'effects_011000',
+    11512: 'effects_011500',
+    11513: 'effects_011500',
+    11514: 'effects_011500',
+    11515: 'effects_011500',
+    11516: 'effects_011500',
+    11517: 'effects_011500',
+    11518: 'effects_011500',
+    11519: 'effects_011500',
+    11528: 'effects_011500',
+    11529: 'effects_011500',
+    11530: 'effects_011500',
+    11531: 'effects_011500',
+    11532: 'effects_011500',
+    11691: 'effects_011500',
+    11696: 'effects_011500',
+    11697: 'effects_011500',
+    11698: 'effects_011500',
+    11700: 'effects_011500',
+    11701: 'effects_011500',
+    11702: 'effects_011500',
+    11704: 'effects_011500',
+    11705: 'effects_011500',
+    11706: 'effects_011500',
+    11707: 'effects_011500',
+    11714: 'effects_011500',
+    11743: 'effects_011500',
+    11745: 'effects_011500',
+    11746: 'effects_011500',
+    11747: 'effects_011500',
+    11748: 'effects_011500',
+    11750: 'effects_011500',
+    11751: 'effects_011500',
+    11752: 'effects_011500',
+    11753: 'effects_011500',
+    11763: 'effects_011500',
+    11764: 'effects_011500',
+    11767: 'effects_011500',
+    11919: 'effects_011500',
+    11938: 'effects_011500',
+    11939: 'effects_011500',
+    11940: 'effects_011500',
+    11941: 'effects_011500',
+    11942: 'effects_011500',
+    11943: 'effects_011500',
+    11944: 'effects_011500',
+    11945: 'effects_011500',
+    11946: 'effects_011500',
+    11947: 'effects_011500',
+    11948: 'effects_011500',
+    11953: 'effects_011500',
+    11992: 'effects_011500',
+    11993: 'effects_011500',
+    11994: 'effects_011500',
+    11995: 'effects_011500',
+    11996: 'effects_011500',
+    11997: 'effects_011500',
+    11998: 'effects_011500',
+    11999: 'effects_011500',
+    12003: 'effects_012000',
+    12038: 'effects_012000',
+    12050: 'effects_012000',
+    12051: 'effects_012000',
+    12052: 'effects_012000',
+    12053: 'effects_012000',
+    12054: 'effects_012000',
+    12057: 'effects_012000',
+    12058: 'effects_012000',
+    12060: 'effects_012000',
+    12061: 'effects_012000',
+    12062: 'effects_012000',
+    12063: 'effects_012000',
+    12069: 'effects_012000',
+    12071: 'effects_012000',
+    12072: 'effects_012000',
+    12098: 'effects_012000',
+    12102: 'effects_012000',
+    12126: 'effects_012000',
+    12127: 'effects_012000',
+    12165: 'effects_012000',
+    12176: 'effects_012000',
+    12179: 'effects_012000',
+    12180: 'effects_012000',
+    12181: 'effects_012000',
+    12183: 'effects_012000',
+    12184: 'effects_012000',
+    12185: 'effects_012000',
+    12188: 'effects_012000',
+    12189: 'effects_012000',
+    12190: 'effects_012000',
+    12191: 'effects_012000',
+    12192: 'effects_012000',
+    12193: 'effects_012000',
+    12194: 'effects_012000',
+    12195: 'effects_012000',
+    12202: 'effects_012000',
+    12203: 'effects_012000',
+    12213: 'effects_012000',
+    12214: 'effects_012000',
+    12217: 'effects_012000',
+    12218: 'effects_012000',
+    12219: 'effects_012000',
+    12220: 'effects_012000',
+    12221: 'effects_012000',
+    12244: 'effects_012000',
+    12245: 'effects_012000',
+    12246: 'effects_012000',
+    12249: 'effects_012000',
+    12250: 'effects_012000',
+    12251: 'effects_012000',
+    12252: 'effects_012000',
+    12253: 'effects_012000',
+    12267: 'effects_012000',
+    12275: 'effects_012000',
+    12276: 'effects_012000',
+    12278: 'effects_012000',
+    12279: 'effects_012000',
+    12283: 'effects_012000',
+    12284: 'effects_012000',
+    12286: 'effects_012000',
+    12287: 'effects_012000',
+    12288: 'effects_012000',
+    12296: 'effects_012000',
+    12329: 'effects_012000',
+    12330: 'effects_012000',
+    12331: 'effects_012000',
+    12529: 'effects_012500',
+    12530: 'effects_012500',
+    12531: 'effects_012500',
+    12537: 'effects_012500',
+    12538: 'effects_012500',
+    12539: 'effects_012500',
+    12540: 'effects_012500',
+    12541: 'effects_012500',
+    12542: 'effects_012500',
+    12543: 'effects_012500',
+    12554: 'effects_012500',
+    12555: 'effects_012500',
+    12556: 'effects_012500',
+    12557: 'effects_012500',
+    12559: 'effects_012500',
+    12560: 'effects_012500',
+    12563: 'effects_012500',
+    12565: 'effects_012500',
+    12566: 'effects_012500',
+    12567: 'effects_012500',
+    12568: 'effects_012500',
+    12569: 'effects_012500',
+    12573: 'effects_012500',
+    12575: 'effects_012500',
+    12576: 'effects_012500',
+    12577: 'effects_012500',
+    12578: 'effects_012500',
+    12579: 'effects_012500',
+    12591: 'effects_012500',
+    12592: 'effects_012500',
+    12593: 'effects_012500',
+    12594: 'effects_012500',
+    12595: 'effects_012500',
+    12596: 'effects_012500',
+    12597: 'effects_012500',
+    12739: 'effects_012500',
+    12740: 'effects_012500',
+    12753: 'effects_012500',
+    12755: 'effects_012500',
+    12757: 'effects_012500',
+    12758: 'effects_012500',
+    12759: 'effects_012500',
+    12760: 'effects_012500',
+    12761: 'effects_012500',
+    12764: 'effects_012500',
+    12766: 'effects_012500',
+    12767: 'effects_012500',
+    12771: 'effects_012500',
+    12772: 'effects_012500',
+    12773: 'effects_012500',
+    12774: 'effects_012500',
+    12777: 'effects_012500',
+    12790: 'effects_012500',
+    12794: 'effects_012500',
+    12795: 'effects_012500',
+    12796: 'effects_012500',
+    12798: 'effects_012500',
+    12799: 'effects_012500',
+    12802: 'effects_012500',
+    100000: 'effects_100000',
+    100001: 'effects_100000',
+}
@@ -0,0 +1,1387 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect4(BaseEffect):
+    """
+    shieldBoosting
+
+    Used by:
+    Modules from group: Shield Booster (94 of 94)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        amount = module.getModifiedItemAttr('shieldBonus')
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        fit.extraAttributes.increase('shieldRepair', amount / speed, **kwargs)
+
+
+class Effect10(BaseEffect):
+    """
+    targetAttack
+
+    Used by:
+    Celestials from group: Destructible Effect Beacon (6 of 6)
+    Drones from group: Combat Drone (80 of 80)
+    Modules from group: Energy Weapon (216 of 220)
+    Celestial: BH Sentry Gun
+    Celestial: EDENCOM Stockpile Non-Interactable (Do not translate)
+    Celestial: Liberation Games Firework Sentry ( DO NOT TRANSLATE)
+    Celestial: Minmatar Sentry Gun (DO NOT TRANSLATE)
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set reload time to 1 second
+        module.reloadTime = 1000
+
+
+class Effect17(BaseEffect):
+    """
+    mining
+
+    Used by:
+    Drones from group: Mining Drone (14 of 14)
+    """
+
+    grouped = True
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        miningDroneAmountPercent = container.getModifiedItemAttr('miningDroneAmountPercent')
+        if (miningDroneAmountPercent is None) or (miningDroneAmountPercent == 0):
+            pass
+        else:
+            container.multiplyItemAttr('miningAmount', miningDroneAmountPercent / 100, **kwargs)
+
+
+class Effect21(BaseEffect):
+    """
+    shieldCapacityBonusOnline
+
+    Used by:
+    Modules from group: Shield Extender (36 of 36)
+    Modules from group: Shield Resistance Amplifier (84 of 84)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('shieldCapacity', module.getModifiedItemAttr('capacityBonus'), **kwargs)
+
+
+class Effect25(BaseEffect):
+    """
+    capacitorCapacityBonus
+
+    Used by:
+    Modules from group: Capacitor Battery (30 of 30)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('capacitorCapacity', ship.getModifiedItemAttr('capacitorBonus'), **kwargs)
+
+
+class Effect26(BaseEffect):
+    """
+    structureRepair
+
+    Used by:
+    Modules from group: Hull Repair Unit (25 of 25)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        amount = module.getModifiedItemAttr('structureDamageAmount')
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        fit.extraAttributes.increase('hullRepair', amount / speed, **kwargs)
+
+
+class Effect27(BaseEffect):
+    """
+    armorRepair
+
+    Used by:
+    Modules from group: Armor Repair Unit (105 of 105)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        amount = module.getModifiedItemAttr('armorDamageAmount')
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        rps = amount / speed
+        fit.extraAttributes.increase('armorRepair', rps, **kwargs)
+        fit.extraAttributes.increase('armorRepairPreSpool', rps, **kwargs)
+        fit.extraAttributes.increase('armorRepairFullSpool', rps, **kwargs)
+
+
+class Effect34(BaseEffect):
+    """
+    projectileFired
+
+    Used by:
+    Modules from group: Hybrid Weapon (223 of 223)
+    Modules from group: Projectile Weapon (167 of 167)
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        rt = module.getModifiedItemAttr('reloadTime')
+        if not rt:
+            # Set reload time to 10 seconds
+            module.reloadTime = 10000
+        else:
+            module.reloadTime = rt
+
+
+class Effect38(BaseEffect):
+    """
+    empWave
+
+    Used by:
+    Modules from group: Smart Bomb (137 of 137)
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+
+class Effect39(BaseEffect):
+    """
+    warpDisrupt
+
+    Used by:
+    Modules named like: Warp Disruptor (29 of 29)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if module.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
+
+
+class Effect46(BaseEffect):
+    """
+    shipScan
+
+    Used by:
+    Modules from group: Ship Scanner (3 of 3)
+    """
+
+    type = 'active'
+
+
+class Effect47(BaseEffect):
+    """
+    cargoScan
+
+    Used by:
+    Modules from group: Cargo Scanner (4 of 4)
+    """
+
+    type = 'active'
+
+
+class Effect48(BaseEffect):
+    """
+    powerBooster
+
+    Used by:
+    Modules from group: Capacitor Booster (43 of 43)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set reload time to 10 seconds
+        module.reloadTime = 10000
+        # Make so that reloads are always taken into account during clculations
+        module.forceReload = True
+
+        if module.charge is None:
+            return
+        capAmount = module.getModifiedChargeAttr('capacitorBonus') or 0
+        module.itemModifiedAttributes['capacitorNeed'] = -capAmount
+
+
+class Effect50(BaseEffect):
+    """
+    modifyShieldRechargeRate
+
+    Used by:
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Power Diagnostic System (23 of 23)
+    Modules from group: Reactor Control Unit (22 of 22)
+    Modules from group: Shield Recharger (4 of 4)
+    Modules named like: Flux Coil (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('shieldRechargeRate', module.getModifiedItemAttr('shieldRechargeRateMultiplier') or 1, **kwargs)
+
+
+class Effect51(BaseEffect):
+    """
+    modifyPowerRechargeRate
+
+    Used by:
+    Modules from group: Capacitor Flux Coil (6 of 6)
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Capacitor Recharger (18 of 18)
+    Modules from group: Power Diagnostic System (23 of 23)
+    Modules from group: Reactor Control Unit (22 of 22)
+    Modules from group: Shield Power Relay (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('rechargeRate', module.getModifiedItemAttr('capacitorRechargeRateMultiplier'), **kwargs)
+
+
+class Effect54(BaseEffect):
+    """
+    targetPassively
+
+    Used by:
+    Modules from group: Passive Targeting System (6 of 6)
+    """
+
+    type = 'active'
+
+
+class Effect55(BaseEffect):
+    """
+    targetHostiles
+
+    Used by:
+    Modules from group: Automated Targeting System (6 of 6)
+    """
+
+    type = 'active'
+
+
+class Effect56(BaseEffect):
+    """
+    powerOutputMultiply
+
+    Used by:
+    Modules from group: Capacitor Flux Coil (6 of 6)
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Power Diagnostic System (23 of 23)
+    Modules from group: Reactor Control Unit (22 of 22)
+    Variations of structure module: Standup Reactor Control Unit I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # We default this to None as there are times when the source attribute doesn't exist (for example, Cap Power Relay).
+        # It will return 0 as it doesn't exist, which would nullify whatever the target attribute is
+        fit.ship.multiplyItemAttr('powerOutput', module.getModifiedItemAttr('powerOutputMultiplier', None), **kwargs)
+
+
+class Effect57(BaseEffect):
+    """
+    shieldCapacityMultiply
+
+    Used by:
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Power Diagnostic System (23 of 23)
+    Modules from group: Reactor Control Unit (22 of 22)
+    Modules named like: Flux Coil (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # We default this to None as there are times when the source attribute doesn't exist (for example, Cap Power Relay).
+        # It will return 0 as it doesn't exist, which would nullify whatever the target attribute is
+        fit.ship.multiplyItemAttr('shieldCapacity', module.getModifiedItemAttr('shieldCapacityMultiplier', None), **kwargs)
+
+
+class Effect58(BaseEffect):
+    """
+    capacitorCapacityMultiply
+
+    Used by:
+    Modules from group: Capacitor Flux Coil (6 of 6)
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Power Diagnostic System (23 of 23)
+    Modules from group: Propulsion Module (73 of 147)
+    Modules from group: Reactor Control Unit (22 of 22)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # We default this to None as there are times when the source attribute doesn't exist (for example, Cap Power Relay).
+        # It will return 0 as it doesn't exist, which would nullify whatever the target attribute is
+        fit.ship.multiplyItemAttr('capacitorCapacity', module.getModifiedItemAttr('capacitorCapacityMultiplier', None), **kwargs)
+
+
+class Effect59(BaseEffect):
+    """
+    cargoCapacityMultiply
+
+    Used by:
+    Modules from group: Expanded Cargohold (7 of 7)
+    Modules from group: Overdrive Injector System (7 of 7)
+    Modules from group: Reinforced Bulkhead (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('capacity', module.getModifiedItemAttr('cargoCapacityMultiplier'), **kwargs)
+
+
+class Effect60(BaseEffect):
+    """
+    structureHPMultiply
+
+    Used by:
+    Modules from group: Nanofiber Internal Structure (7 of 7)
+    Modules from group: Reinforced Bulkhead (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('hp', module.getModifiedItemAttr('structureHPMultiplier'), **kwargs)
+
+
+class Effect61(BaseEffect):
+    """
+    agilityBonus
+
+    Used by:
+    Subsystems named like: Propulsion Interdiction Nullifier (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('agility', src.getModifiedItemAttr('agilityBonusAdd'), **kwargs)
+
+
+class Effect63(BaseEffect):
+    """
+    armorHPMultiply
+
+    Used by:
+    Modules from group: Armor Coating (184 of 184)
+    Modules from group: Energized Armor Membrane (169 of 169)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('armorHP', module.getModifiedItemAttr('armorHPMultiplier'), **kwargs)
+
+
+class Effect67(BaseEffect):
+    """
+    miningLaser
+
+    Used by:
+    Modules from group: Frequency Mining Laser (6 of 6)
+    Modules from group: Mining Laser (18 of 18)
+    Modules from group: Strip Miner (9 of 9)
+    Module: Citizen Miner
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set reload time to 1 second
+        module.reloadTime = 1000
+
+
+class Effect89(BaseEffect):
+    """
+    projectileWeaponSpeedMultiply
+
+    Used by:
+    Modules from group: Gyrostabilizer (14 of 14)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect91(BaseEffect):
+    """
+    energyWeaponDamageMultiply
+
+    Used by:
+    Modules from group: Heat Sink (20 of 20)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect92(BaseEffect):
+    """
+    projectileWeaponDamageMultiply
+
+    Used by:
+    Modules from group: Gyrostabilizer (14 of 14)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect93(BaseEffect):
+    """
+    hybridWeaponDamageMultiply
+
+    Used by:
+    Modules from group: Magnetic Field Stabilizer (15 of 15)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect95(BaseEffect):
+    """
+    energyWeaponSpeedMultiply
+
+    Used by:
+    Modules from group: Heat Sink (20 of 20)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect96(BaseEffect):
+    """
+    hybridWeaponSpeedMultiply
+
+    Used by:
+    Modules from group: Magnetic Field Stabilizer (15 of 15)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect101(BaseEffect):
+    """
+    useMissiles
+
+    Used by:
+    Modules from group: Missile Launcher Heavy (12 of 12)
+    Modules from group: Missile Launcher Rocket (16 of 16)
+    Modules named like: Launcher (158 of 158)
+    Structure Modules named like: Standup Launcher (7 of 7)
+    """
+
+    dealsDamage = True
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        # Set reload time to 10 seconds
+        src.reloadTime = 10000
+        if 'projected' not in context:
+            return
+        if src.item.group.name == 'Missile Launcher Bomb':
+            # Bomb Launcher Cooldown Timer
+            moduleReactivationDelay = src.getModifiedItemAttr('moduleReactivationDelay')
+            speed = src.getModifiedItemAttr('speed')
+            # Void and Focused Void Bombs
+            neutAmount = src.getModifiedChargeAttr('energyNeutralizerAmount')
+            if moduleReactivationDelay and neutAmount and speed:
+                fit.addDrain(src, speed + moduleReactivationDelay, neutAmount, 0)
+            # Lockbreaker Bombs
+            ecmStrengthBonus = src.getModifiedChargeAttr('scan{0}StrengthBonus'.format(fit.scanType))
+            if ecmStrengthBonus:
+                fit.addProjectedEcm(ecmStrengthBonus)
+        elif src.item.group.name == 'Interdiction Sphere Launcher':
+            speedFactor = src.getModifiedChargeAttr('speedFactor')
+            if speedFactor:
+                fit.ship.boostItemAttr('maxVelocity', speedFactor, **kwargs)
+
+
+class Effect118(BaseEffect):
+    """
+    electronicAttributeModifyOnline
+
+    Used by:
+    Modules from group: Automated Targeting System (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('maxLockedTargets', module.getModifiedItemAttr('maxLockedTargetsBonus'), **kwargs)
+
+
+class Effect157(BaseEffect):
+    """
+    largeHybridTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringLargeHybridTurret
+
+    Used by:
+    Implants named like: Zainou 'Deadeye' Large Hybrid Turret LH (6 of 6)
+    Implant: Festival-only 'Longbow' HD4 Dose
+    Implant: Festival-only 'Longbow' HD6 Dose
+    Skill: Large Hybrid Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect159(BaseEffect):
+    """
+    mediumEnergyTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringMediumEnergyTurret
+
+    Used by:
+    Implants named like: Inherent Implants 'Lancer' Medium Energy Turret ME (6 of 6)
+    Implant: Festival-only 'Longbow' ED3 Dose
+    Implant: Festival-only 'Longbow' ED6 Dose
+    Skill: Medium Energy Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect160(BaseEffect):
+    """
+    mediumHybridTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringMediumHybridTurret
+
+    Used by:
+    Implants named like: Zainou 'Deadeye' Medium Hybrid Turret MH (6 of 6)
+    Implant: Festival-only 'Longbow' HD3 Dose
+    Implant: Festival-only 'Longbow' HD6 Dose
+    Skill: Medium Hybrid Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect161(BaseEffect):
+    """
+    mediumProjectileTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringMediumProjectileTurret
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Gunslinger' Medium Projectile Turret MP (6 of 6)
+    Implant: Festival-only 'Longbow' PD3 Dose
+    Implant: Festival-only 'Longbow' PD6 Dose
+    Skill: Medium Projectile Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect162(BaseEffect):
+    """
+    largeEnergyTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringLargeEnergyTurret
+
+    Used by:
+    Implants named like: Inherent Implants 'Lancer' Large Energy Turret LE (6 of 6)
+    Implant: Festival-only 'Longbow' ED4 Dose
+    Implant: Festival-only 'Longbow' ED6 Dose
+    Implant: Pashan's Turret Handling Mindlink
+    Skill: Large Energy Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect172(BaseEffect):
+    """
+    smallEnergyTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringSmallEnergyTurret
+
+    Used by:
+    Implants named like: Inherent Implants 'Lancer' Small Energy Turret SE (6 of 6)
+    Implant: Festival-only 'Longbow' ED2 Dose
+    Implant: Festival-only 'Longbow' ED6 Dose
+    Skill: Small Energy Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect173(BaseEffect):
+    """
+    smallHybridTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringSmallHybridTurret
+
+    Used by:
+    Implants named like: Zainou 'Deadeye' Small Hybrid Turret SH (6 of 6)
+    Implant: Festival-only 'Longbow' HD2 Dose
+    Implant: Festival-only 'Longbow' HD6 Dose
+    Skill: Small Hybrid Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect174(BaseEffect):
+    """
+    smallProjectileTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringSmallProjectileTurret
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Gunslinger' Small Projectile Turret SP (6 of 6)
+    Implant: Festival-only 'Longbow' PD2 Dose
+    Implant: Festival-only 'Longbow' PD6 Dose
+    Skill: Small Projectile Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect212(BaseEffect):
+    """
+    sensorUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringSensorUpgrades
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Electronics Upgrades EU (6 of 6)
+    Modules named like: Liquid Cooled Electronics (8 of 8)
+    Skill: Electronics Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronics Upgrades'),
+                                      'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
+
+
+class Effect214(BaseEffect):
+    """
+    targetingMaxTargetBonusModAddMaxLockedTargetsLocationChar
+
+    Used by:
+    Skills named like: Target Management (2 of 2)
+    """
+
+    type = 'passive', 'structure'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = skill.getModifiedItemAttr('maxTargetBonus') * skill.level
+        fit.extraAttributes.increase('maxTargetsLockedFromSkills', amount, **kwargs)
+
+
+class Effect223(BaseEffect):
+    """
+    navigationVelocityBonusPostPercentMaxVelocityLocationShip
+
+    Used by:
+    Implant: Low-grade Snake Alpha
+    Implant: Mid-grade Snake Alpha
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', implant.getModifiedItemAttr('velocityBonus'), **kwargs)
+
+
+class Effect227(BaseEffect):
+    """
+    accerationControlCapNeedBonusPostPercentCapacitorNeedLocationShipGroupAfterburner
+
+    Used by:
+    Modules named like: Dynamic Fuel Valve (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus'), **kwargs)
+
+
+class Effect230(BaseEffect):
+    """
+    afterburnerDurationBonusPostPercentDurationLocationShipModulesRequiringAfterburner
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Afterburner AB (6 of 6)
+    Implants named like: Eifyr and Co. 'Rogue' Agility (2 of 2)
+    Implants named like: Serenity Limited 'Overclocker' Dose (3 of 3)
+    Implant: Zor's Custom Navigation Link
+    Skill: Afterburner
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
+
+
+class Effect235(BaseEffect):
+    """
+    warpdriveoperationWarpCapacitorNeedBonusPostPercentWarpCapacitorNeedLocationShip
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Warp Drive Operation WD (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', implant.getModifiedItemAttr('warpCapacitorNeedBonus'), **kwargs)
+
+
+class Effect242(BaseEffect):
+    """
+    accerationControlSpeedFBonusPostPercentSpeedFactorLocationShipGroupAfterburner
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Acceleration Control AC (6 of 6)
+    Implants named like: Eifyr and Co. 'Rogue' Agility (2 of 2)
+    Implants named like: Serenity Limited 'Overclocker' Dose (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'speedFactor', implant.getModifiedItemAttr('speedFBonus'), **kwargs)
+
+
+class Effect244(BaseEffect):
+    """
+    highSpeedManuveringCapacitorNeedMultiplierPostPercentCapacitorNeedLocationShipModulesRequiringHighSpeedManuvering
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' High Speed Maneuvering HS (6 of 6)
+    Skill: High Speed Maneuvering
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect271(BaseEffect):
+    """
+    hullUpgradesArmorHpBonusPostPercentHpLocationShip
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: grade Amulet (15 of 18)
+    Modules named like: Trimark Armor Pump (8 of 8)
+    Implant: Low-grade Snake Epsilon
+    Implant: Mid-grade Snake Epsilon
+    Skill: Hull Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('armorHP', (container.getModifiedItemAttr('armorHpBonus') or 0) * level, **kwargs)
+
+
+class Effect272(BaseEffect):
+    """
+    repairSystemsDurationBonusPostPercentDurationLocationShipModulesRequiringRepairSystems
+
+    Used by:
+    Implants named like: Chemal Tech Repair Booster (3 of 3)
+    Implants named like: Inherent Implants 'Noble' Repair Systems RS (6 of 6)
+    Modules named like: Nanobot Accelerator (8 of 8)
+    Implant: AIR Repairer Booster III
+    Implant: Numon Family Heirloom
+    Skill: Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'duration',
+            container.getModifiedItemAttr('durationSkillBonus') * level, **kwargs)
+
+
+class Effect273(BaseEffect):
+    """
+    shieldUpgradesPowerNeedBonusPostPercentPowerLocationShipModulesRequiringShieldUpgrades
+
+    Used by:
+    Implants named like: Zainou 'Gnome' Shield Upgrades SU (6 of 6)
+    Modules named like: Core Defense Charge Economizer (8 of 8)
+    Skill: Shield Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'),
+                                      'power', container.getModifiedItemAttr('powerNeedBonus') * level, **kwargs)
+
+
+class Effect277(BaseEffect):
+    """
+    tacticalshieldManipulationSkillBoostUniformityBonus
+
+    Used by:
+    Skill: Tactical Shield Manipulation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('shieldUniformity', skill.getModifiedItemAttr('uniformityBonus') * skill.level, **kwargs)
+
+
+class Effect279(BaseEffect):
+    """
+    shieldEmmisionSystemsCapNeedBonusPostPercentCapacitorNeedLocationShipModulesRequiringShieldEmmisionSystems
+
+    Used by:
+    Implants named like: Zainou 'Gnome' Shield Emission Systems SE (6 of 6)
+    Skill: Shield Emission Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Capital Shield Emission Systems'),
+            'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect287(BaseEffect):
+    """
+    controlledBurstsCapNeedBonusPostPercentCapacitorNeedLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: Inherent Implants 'Lancer' Controlled Bursts CB (6 of 6)
+    Skill: Controlled Bursts
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect290(BaseEffect):
+    """
+    sharpshooterRangeSkillBonusPostPercentMaxRangeLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: Frentix Booster (4 of 4)
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Zainou 'Deadeye' Sharpshooter ST (6 of 6)
+    Skill: Sharpshooter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level, **kwargs)
+
+
+class Effect298(BaseEffect):
+    """
+    surgicalStrikeFalloffBonusPostPercentFalloffLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Sooth Sayer Booster (4 of 4)
+    Implants named like: Zainou 'Deadeye' Trajectory Analysis TA (6 of 6)
+    Skill: Trajectory Analysis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'falloff', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
+
+
+class Effect315(BaseEffect):
+    """
+    dronesSkillBoostMaxActiveDroneBonus
+
+    Used by:
+    Skill: Drones
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = skill.getModifiedItemAttr('maxActiveDroneBonus') * skill.level
+        fit.extraAttributes.increase('maxActiveDrones', amount, **kwargs)
+
+
+class Effect391(BaseEffect):
+    """
+    astrogeologyMiningAmountBonusPostPercentMiningAmountLocationShipModulesRequiringMining
+
+    Used by:
+    Implants named like: Inherent Implants 'Highwall' Mining MX (3 of 3)
+    Implants named like: Mining Booster (6 of 8)
+    Implants named like: ORE 'Harvester' Efficiency (2 of 2)
+    Implants named like: Serenity Limited 'Efficiency' Dose (3 of 3)
+    Implants named like: Serenity Poteque 'Prospector' Harvesting MC (3 of 3)
+    Implant: Michi's Excavation Augmentor
+    Skill: Astrogeology
+    Skill: Mining
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+                                      'miningAmount', container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
+
+
+class Effect392(BaseEffect):
+    """
+    mechanicHullHpBonusPostPercentHpShip
+
+    Used by:
+    Implants named like: Capsuleer Defense Augmentation Chip (3 of 3)
+    Implants named like: Festival only 'Rock' HH Dose (4 of 4)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Inherent Implants 'Noble' Mechanic MC (6 of 6)
+    Implants named like: Serenity Limited 'Hardshell' Dose (3 of 3)
+    Modules named like: Transverse Bulkhead (8 of 8)
+    Skill: Mechanics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('hp', container.getModifiedItemAttr('hullHpBonus') * level, **kwargs)
+
+
+class Effect394(BaseEffect):
+    """
+    navigationVelocityBonusPostPercentMaxVelocityShip
+
+    Used by:
+    Modules from group: Rig Anchor (4 of 4)
+    Implants named like: Agency 'Overclocker' SB Dose (4 of 4)
+    Implants named like: Grand Prix Booster (5 of 6)
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: grade Snake (16 of 18)
+    Modules named like: Auxiliary Thrusters (8 of 8)
+    Implant: AIR Overclocker Booster II
+    Implant: Quafe Zero Classic
+    Implant: Serenity YC122.9 Season Booster - Max Velocity
+    Implant: Starsi Blast! Classic
+    Implant: Wisdom of Gheinok
+    Skill: Navigation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        amount = container.getModifiedItemAttr('velocityBonus') or 0
+        penalties = 'skill' not in context and 'implant' not in context and 'booster' not in context
+        fit.ship.boostItemAttr('maxVelocity', amount * level,
+                               stackingPenalties=penalties, **kwargs)
+
+
+class Effect395(BaseEffect):
+    """
+    evasiveManeuveringAgilityBonusPostPercentAgilityShip
+
+    Used by:
+    Modules from group: Rig Anchor (4 of 4)
+    Implants named like: Eifyr and Co. 'Rogue' Evasive Maneuvering EM (6 of 6)
+    Implants named like: Grand Prix Booster (4 of 6)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: grade Nomad (10 of 12)
+    Modules named like: Low Friction Nozzle Joints (8 of 8)
+    Implant: AIR Agility Booster II
+    Implant: AIR Overclocker Booster III
+    Implant: Genolution Core Augmentation CA-4
+    Implant: Quafe Zero Green Apple
+    Implant: Serenity YC122.9 Season Booster - Agility
+    Implant: Starsi Blast! Classic
+    Skill: Evasive Maneuvering
+    Skill: Spaceship Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalties = 'skill' not in context and 'implant' not in context and 'booster' not in context
+        fit.ship.boostItemAttr('agility', container.getModifiedItemAttr('agilityBonus') * level,
+                               stackingPenalties=penalties, **kwargs)
+
+
+class Effect396(BaseEffect):
+    """
+    energyGridUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringEnergyGridUpgrades
+
+    Used by:
+    Implants named like: Inherent Implants 'Squire' Energy Grid Upgrades EU (6 of 6)
+    Modules named like: Powergrid Subroutine Maximizer (8 of 8)
+    Skill: Energy Grid Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Grid Upgrades'),
+                                      'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
+
+
+class Effect397(BaseEffect):
+    """
+    electronicsCpuOutputBonusPostPercentCpuOutputLocationShipGroupComputer
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' CPU Management EE (6 of 6)
+    Modules named like: Processor Overclocking Unit (8 of 8)
+    Subsystems named like: Core Electronic Efficiency Gate (2 of 2)
+    Implant: Basic Capsuleer Engineering Augmentation Chip
+    Implant: Genolution Core Augmentation CA-2
+    Skill: CPU Management
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('cpuOutput', container.getModifiedItemAttr('cpuOutputBonus2') * level, **kwargs)
+
+
+class Effect408(BaseEffect):
+    """
+    largeProjectileTurretDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringLargeProjectileTurret
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Gunslinger' Large Projectile Turret LP (6 of 6)
+    Implant: Festival-only 'Longbow' PD4 Dose
+    Implant: Festival-only 'Longbow' PD6 Dose
+    Skill: Large Projectile Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect414(BaseEffect):
+    """
+    gunneryTurretSpeeBonusPostPercentSpeedLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Inherent Implants 'Lancer' Gunnery RF (6 of 6)
+    Implant: Pashan's Turret Customization Mindlink
+    Skill: Gunnery
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'speed', container.getModifiedItemAttr('turretSpeeBonus') * level, **kwargs)
+
+
+class Effect446(BaseEffect):
+    """
+    shieldManagementShieldCapacityBonusPostPercentCapacityLocationShipGroupShield
+
+    Used by:
+    Implants named like: Capsuleer Defense Augmentation Chip (3 of 3)
+    Implants named like: Festival only 'Rock' SH Dose (4 of 4)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Serenity Limited 'Hardshell' Dose (3 of 3)
+    Implants named like: Wightstorm Nirvana Booster (4 of 4)
+    Implants named like: Zainou 'Gnome' Shield Management SM (6 of 6)
+    Modules named like: Core Defense Field Extender (8 of 8)
+    Implant: AIR Nirvana Booster II
+    Implant: Genolution Core Augmentation CA-3
+    Implant: Sansha Modified 'Gnome' Implant
+    Skill: Shield Management
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('shieldCapacity', container.getModifiedItemAttr('shieldCapacityBonus') * level, **kwargs)
+
+
+class Effect485(BaseEffect):
+    """
+    capacitorRechargeTimeBonusPostPercentPassive
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Inherent Implants 'Squire' Capacitor Systems Operation EO (6 of 6)
+    Implants named like: Rapture Booster (5 of 5)
+    Implants named like: grade Rapture (15 of 18)
+    Modules named like: Capacitor Control Circuit (8 of 8)
+    Implant: AIR Overclocker Booster III
+    Implant: Basic Capsuleer Engineering Augmentation Chip
+    Implant: Genolution Core Augmentation CA-2
+    Implant: Quafe Zero Green Apple
+    Implant: Starsi Blast! Orange
+    Skill: Capacitor Systems Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('rechargeRate', container.getModifiedItemAttr('capRechargeBonus') * level, **kwargs)
+
+
+class Effect486(BaseEffect):
+    """
+    shieldOperationRechargeratebonusPostPercentRechargeRateLocationShipGroupShield
+
+    Used by:
+    Implants named like: Zainou 'Gnome' Shield Operation SP (6 of 6)
+    Modules named like: Core Defense Field Purger (8 of 8)
+    Implant: Sansha Modified 'Gnome' Implant
+    Skill: Shield Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('shieldRechargeRate', container.getModifiedItemAttr('rechargeratebonus') * level, **kwargs)
+
+
+class Effect490(BaseEffect):
+    """
+    engineeringPowerEngineeringOutputBonusPostPercentPowerOutputLocationShipGroupPowerCore
+
+    Used by:
+    Implants named like: Inherent Implants 'Squire' Power Grid Management EG (6 of 6)
+    Modules named like: Ancillary Current Router (8 of 8)
+    Subsystems named like: Core Augmented Reactor (4 of 4)
+    Implant: Basic Capsuleer Engineering Augmentation Chip
+    Implant: Genolution Core Augmentation CA-1
+    Skill: Power Grid Management
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('powerOutput', container.getModifiedItemAttr('powerEngineeringOutputBonus') * level, **kwargs)
+
+
+class Effect494(BaseEffect):
+    """
+    warpDriveOperationWarpCapacitorNeedBonusPostPercentWarpCapacitorNeedLocationShipGroupPropulsion
+
+    Used by:
+    Modules named like: Warp Core Optimizer (8 of 8)
+    Skill: Warp Drive Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('warpCapacitorNeed', container.getModifiedItemAttr('warpCapacitorNeedBonus') * level,
+                               stackingPenalties='skill' not in context, **kwargs)
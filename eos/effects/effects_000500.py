@@ -0,0 +1,1561 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect504(BaseEffect):
+    """
+    scoutDroneOperationDroneRangeBonusModAddDroneControlDistanceChar
+
+    Used by:
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Modules named like: Drone Control Range Augmentor (8 of 8)
+    Skills named like: Drone Avionics (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        amount = container.getModifiedItemAttr('droneRangeBonus') * level
+        fit.extraAttributes.increase('droneControlRange', amount, **kwargs)
+
+
+class Effect506(BaseEffect):
+    """
+    fuelConservationCapNeedBonusPostPercentCapacitorNeedLocationShipModulesRequiringAfterburner
+
+    Used by:
+    Skill: Afterburner
+    Skill: Fuel Conservation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
+
+
+class Effect507(BaseEffect):
+    """
+    longRangeTargetingMaxTargetRangeBonusPostPercentMaxTargetRangeLocationShipGroupElectronic
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: Zainou 'Gypsy' Long Range Targeting LT (6 of 6)
+    Skill: Long Range Targeting
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('maxTargetRange', container.getModifiedItemAttr('maxTargetRangeBonus') * level, **kwargs)
+
+
+class Effect508(BaseEffect):
+    """
+    shipPDmgBonusMF
+
+    Used by:
+    Ship: Freki
+    Ship: Republic Fleet Firetail
+    Ship: Slasher
+    Ship: Stiletto
+    Ship: Wolf
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect511(BaseEffect):
+    """
+    shipEnergyTCapNeedBonusAF
+
+    Used by:
+    Ship: Crusader
+    Ship: Executioner
+    Ship: Gold Magnate
+    Ship: Punisher
+    Ship: Retribution
+    Ship: Silver Magnate
+    Ship: Tormentor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonus2AF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect512(BaseEffect):
+    """
+    shipSHTDmgBonusGF
+
+    Used by:
+    Variations of ship: Incursus (3 of 3)
+    Ship: Atron
+    Ship: Federation Navy Comet
+    Ship: Pacifier
+    Ship: Shapash
+    Ship: Taranis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect514(BaseEffect):
+    """
+    shipSETDmgBonusAF
+
+    Used by:
+    Variations of ship: Magnate (3 of 5)
+    Ship: Executioner
+    Ship: Tormentor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect516(BaseEffect):
+    """
+    shipTCapNeedBonusAC
+
+    Used by:
+    Ship: Devoter
+    Ship: Omen
+    Ship: Zealot
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusAC'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect521(BaseEffect):
+    """
+    shipHRangeBonusCC
+
+    Used by:
+    Ship: Eagle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCC'),
+                                      skill='Caldari Cruiser', **kwargs)
+
+
+class Effect527(BaseEffect):
+    """
+    shipVelocityBonusMI
+
+    Used by:
+    Variations of ship: Mammoth (2 of 2)
+    Ship: Hoarder
+    Ship: Prowler
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('shipBonusMI'),
+                               skill='Minmatar Hauler', **kwargs)
+
+
+class Effect529(BaseEffect):
+    """
+    shipCargoBonusAI
+
+    Used by:
+    Variations of ship: Sigil (2 of 2)
+    Ship: Bestower
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('shipBonusAI'),
+                               skill='Amarr Hauler', **kwargs)
+
+
+class Effect536(BaseEffect):
+    """
+    cpuMultiplierPostMulCpuOutputShip
+
+    Used by:
+    Modules from group: CPU Enhancer (19 of 19)
+    Variations of structure module: Standup Co-Processor Array I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('cpuOutput', module.getModifiedItemAttr('cpuMultiplier'), **kwargs)
+
+
+class Effect542(BaseEffect):
+    """
+    shipCapNeedBonusAB
+
+    Used by:
+    Ships named like: Imperial Issue (2 of 2)
+    Ship: Redeemer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect549(BaseEffect):
+    """
+    shipPTDmgBonusMB
+
+    Used by:
+    Variations of ship: Tempest (3 of 4)
+    Ship: Machariel
+    Ship: Panther
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB'),
+                                      skill='Minmatar Battleship', **kwargs)
+
+
+class Effect550(BaseEffect):
+    """
+    shipHTDmgBonusGB
+
+    Used by:
+    Ships from group: Black Ops (3 of 6)
+    Ship: Dominix Navy Issue
+    Ship: Hyperion
+    Ship: Kronos
+    Ship: Megathron Federate Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB'),
+                                      skill='Gallente Battleship', **kwargs)
+
+
+class Effect553(BaseEffect):
+    """
+    shipHTTrackingBonusGB
+
+    Used by:
+    Ship: Vindicator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'),
+                                      skill='Gallente Battleship', **kwargs)
+
+
+class Effect562(BaseEffect):
+    """
+    shipHTDmgBonusfixedGC
+
+    Used by:
+    Variations of ship: Vexor (3 of 4)
+    Ship: Adrestia
+    Ship: Arazu
+    Ship: Cobra
+    Ship: Cybele
+    Ship: Deimos
+    Ship: Enforcer
+    Ship: Exequror Navy Issue
+    Ship: Thorax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect581(BaseEffect):
+    """
+    weaponUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: Zainou 'Gnome' Weapon Upgrades WU (6 of 6)
+    Skill: Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery') or mod.item.requiresSkill('Vorton Projector Operation'),
+                                      'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
+
+
+class Effect582(BaseEffect):
+    """
+    rapidFiringRofBonusPostPercentSpeedLocationShipModulesRequiringGunnery
+
+    Used by:
+    Skill: Rapid Firing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
+
+
+class Effect584(BaseEffect):
+    """
+    surgicalStrikeDamageMultiplierBonusPostPercentDamageMultiplierLocationShipModulesRequiringGunnery
+
+    Used by:
+    Implants named like: 'Pyrolancea' Dose (7 of 7)
+    Implants named like: Chemal Tech Turret Booster (3 of 3)
+    Implants named like: Eifyr and Co. 'Gunslinger' Surgical Strike SS (6 of 6)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'damageMultiplier', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect587(BaseEffect):
+    """
+    surgicalStrikeDamageMultiplierBonusPostPercentDamageMultiplierLocationShipGroupEnergyWeapon
+
+    Used by:
+    Skill: Surgical Strike
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect588(BaseEffect):
+    """
+    surgicalStrikeDamageMultiplierBonusPostPercentDamageMultiplierLocationShipGroupProjectileWeapon
+
+    Used by:
+    Skill: Surgical Strike
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect589(BaseEffect):
+    """
+    surgicalStrikeDamageMultiplierBonusPostPercentDamageMultiplierLocationShipGroupHybridWeapon
+
+    Used by:
+    Skill: Surgical Strike
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect590(BaseEffect):
+    """
+    energyPulseWeaponsDurationBonusPostPercentDurationLocationShipModulesRequiringEnergyPulseWeapons
+
+    Used by:
+    Implants named like: Inherent Implants 'Squire' Energy Pulse Weapons EP (6 of 6)
+    Skill: Energy Pulse Weapons
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+                                      'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
+
+
+class Effect596(BaseEffect):
+    """
+    ammoInfluenceRange
+
+    Used by:
+    Items from category: Charge (608 of 1023)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('maxRange', module.getModifiedChargeAttr('weaponRangeMultiplier'), **kwargs)
+
+
+class Effect598(BaseEffect):
+    """
+    ammoSpeedMultiplier
+
+    Used by:
+    Charges from group: Festival Charges (40 of 40)
+    Charges from group: Interdiction Probe (2 of 2)
+    Charges from group: Structure Festival Charges (2 of 2)
+    Special Edition Assetss from group: Festival Charges Expired (4 of 4)
+    Charge: Stasis Webification Probe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('speed', module.getModifiedChargeAttr('speedMultiplier') or 1, **kwargs)
+
+
+class Effect599(BaseEffect):
+    """
+    ammoFallofMultiplier
+
+    Used by:
+    Charges from group: Advanced Artillery Ammo (8 of 8)
+    Charges from group: Advanced Autocannon Ammo (8 of 8)
+    Charges from group: Advanced Beam Laser Crystal (8 of 8)
+    Charges from group: Advanced Blaster Charge (8 of 8)
+    Charges from group: Advanced Pulse Laser Crystal (8 of 8)
+    Charges from group: Advanced Railgun Charge (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('falloff', module.getModifiedChargeAttr('fallofMultiplier') or 1, **kwargs)
+
+
+class Effect600(BaseEffect):
+    """
+    ammoTrackingMultiplier
+
+    Used by:
+    Charges from group: Advanced Artillery Ammo (8 of 8)
+    Charges from group: Advanced Autocannon Ammo (8 of 8)
+    Charges from group: Advanced Beam Laser Crystal (8 of 8)
+    Charges from group: Advanced Blaster Charge (8 of 8)
+    Charges from group: Advanced Exotic Plasma Charge (6 of 6)
+    Charges from group: Advanced Pulse Laser Crystal (8 of 8)
+    Charges from group: Advanced Railgun Charge (8 of 8)
+    Charges from group: Projectile Ammo (128 of 128)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('trackingSpeed', module.getModifiedChargeAttr('trackingSpeedMultiplier'), **kwargs)
+
+
+class Effect602(BaseEffect):
+    """
+    shipPTurretSpeedBonusMC
+
+    Used by:
+    Variations of ship: Stabber (3 of 3)
+    Ship: Broadsword
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Huginn
+    Ship: Scythe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect604(BaseEffect):
+    """
+    shipPTspeedBonusMB2
+
+    Used by:
+    Ships from group: Black Ops (3 of 6)
+    Variations of ship: Tempest (3 of 4)
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMB2'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect607(BaseEffect):
+    """
+    cloaking
+
+    Used by:
+    Modules from group: Cloaking Device (10 of 14)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set flag which is used to determine if ship is cloaked or not
+        # This is used to apply cloak-only bonuses, like Black Ops' speed bonus
+        fit.extraAttributes['cloaked'] = True
+        # Apply speed penalty
+        fit.ship.multiplyItemAttr('maxVelocity', module.getModifiedItemAttr('maxVelocityModifier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect623(BaseEffect):
+    """
+    miningDroneOperationMiningAmountBonusPostPercentMiningDroneAmountPercentChar
+
+    Used by:
+    Modules named like: Drone Mining Augmentor (8 of 8)
+    Skill: Mining Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+                                     'miningAmount',
+                                     container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
+
+
+class Effect627(BaseEffect):
+    """
+    powerIncrease
+
+    Used by:
+    Modules from group: Auxiliary Power Core (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('powerOutput', module.getModifiedItemAttr('powerIncrease'), **kwargs)
+
+
+class Effect657(BaseEffect):
+    """
+    agilityMultiplierEffect
+
+    Used by:
+    Modules from group: Inertial Stabilizer (7 of 7)
+    Modules from group: Nanofiber Internal Structure (7 of 7)
+    Modules from group: Reinforced Bulkhead (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility',
+                               module.getModifiedItemAttr('agilityMultiplier'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect660(BaseEffect):
+    """
+    missileEMDmgBonus
+
+    Used by:
+    Skills named like: Missiles (5 of 7)
+    Skill: Rockets
+    Skill: Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+                                        'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect661(BaseEffect):
+    """
+    missileExplosiveDmgBonus
+
+    Used by:
+    Skills named like: Missiles (5 of 7)
+    Skill: Rockets
+    Skill: Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+                                        'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect662(BaseEffect):
+    """
+    missileThermalDmgBonus
+
+    Used by:
+    Skills named like: Missiles (5 of 7)
+    Skill: Rockets
+    Skill: Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+                                        'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect668(BaseEffect):
+    """
+    missileKineticDmgBonus2
+
+    Used by:
+    Skills named like: Missiles (5 of 7)
+    Skill: Rockets
+    Skill: Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+                                        'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect675(BaseEffect):
+    """
+    weaponUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringEnergyPulseWeapons
+
+    Used by:
+    Skill: Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+                                      'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
+
+
+class Effect677(BaseEffect):
+    """
+    weaponUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringMissileLauncherOperation
+
+    Used by:
+    Implants named like: Zainou 'Gnome' Launcher CPU Efficiency LE (6 of 6)
+    Skill: Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
+
+
+class Effect699(BaseEffect):
+    """
+    signatureAnalysisScanResolutionBonusPostPercentScanResolutionShip
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Zainou 'Gypsy' Signature Analysis SA (6 of 6)
+    Modules named like: Targeting System Subcontroller (8 of 8)
+    Implant: Quafe Zero Classic
+    Implant: Starsi Blast! Orange
+    Skill: Signature Analysis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.ship.boostItemAttr('scanResolution', container.getModifiedItemAttr('scanResolutionBonus') * level,
+                               stackingPenalties=penalized, **kwargs)
+
+
+class Effect706(BaseEffect):
+    """
+    covertOpsWarpResistance
+
+    Used by:
+    Ships from group: Covert Ops (5 of 9)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpFactor', src.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops', **kwargs)
+
+
+class Effect726(BaseEffect):
+    """
+    shipBonusCargo2GI
+
+    Used by:
+    Variations of ship: Miasmos (3 of 4)
+    Variations of ship: Nereus (2 of 2)
+    Ship: Iteron Mark V
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # TODO: investigate if we can live without such ifs or hardcoding
+        # Viator doesn't have GI bonus
+        if 'shipBonusGI' in fit.ship.item.attributes:
+            bonusAttr = 'shipBonusGI'
+        else:
+            bonusAttr = 'shipBonusGI2'
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr(bonusAttr), skill='Gallente Hauler', **kwargs)
+
+
+class Effect727(BaseEffect):
+    """
+    shipBonusCargoCI
+
+    Used by:
+    Variations of ship: Badger (2 of 2)
+    Ship: Tayra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('shipBonusCI'), skill='Caldari Hauler', **kwargs)
+
+
+class Effect728(BaseEffect):
+    """
+    shipBonusCargoMI
+
+    Used by:
+    Variations of ship: Wreathe (2 of 2)
+    Ship: Mammoth
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('shipBonusMI'), skill='Minmatar Hauler', **kwargs)
+
+
+class Effect729(BaseEffect):
+    """
+    shipBonusVelocityGI
+
+    Used by:
+    Variations of ship: Epithal (2 of 2)
+    Variations of ship: Miasmos (4 of 4)
+    Ship: Iteron Mark V
+    Ship: Kryos
+    Ship: Viator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # TODO: investigate if we can live without such ifs or hardcoding
+        # Viator doesn't have GI bonus
+        if 'shipBonusGI' in fit.ship.item.attributes:
+            bonusAttr = 'shipBonusGI'
+        else:
+            bonusAttr = 'shipBonusGI2'
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr(bonusAttr), skill='Gallente Hauler', **kwargs)
+
+
+class Effect730(BaseEffect):
+    """
+    shipBonusVelocityCI
+
+    Used by:
+    Variations of ship: Tayra (2 of 2)
+    Ship: Crane
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('shipBonusCI'), skill='Caldari Hauler', **kwargs)
+
+
+class Effect732(BaseEffect):
+    """
+    shipVelocityBonusAI
+
+    Used by:
+    Variations of ship: Bestower (2 of 2)
+    Ship: Prorator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('shipBonusAI'), skill='Amarr Hauler', **kwargs)
+
+
+class Effect736(BaseEffect):
+    """
+    shipBonusCapCapAB
+
+    Used by:
+    Ship: Apocalypse Imperial Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacitorCapacity', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect744(BaseEffect):
+    """
+    surveyScanspeedBonusPostPercentDurationLocationShipModulesRequiringElectronics
+
+    Used by:
+    Modules named like: Signal Focusing Kit (8 of 8)
+    Skill: Survey
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('CPU Management'),
+                                      'duration', container.getModifiedItemAttr('scanspeedBonus') * level, **kwargs)
+
+
+class Effect754(BaseEffect):
+    """
+    shipHybridDamageBonusCF
+
+    Used by:
+    Ship: Raptor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect757(BaseEffect):
+    """
+    shipETDamageAF
+
+    Used by:
+    Ship: Crucifier Navy Issue
+    Ship: Crusader
+    Ship: Imperial Navy Slicer
+    Ship: Pacifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect760(BaseEffect):
+    """
+    shipBonusSmallMissileRoFCF2
+
+    Used by:
+    Ship: Hawk
+    Ship: Pacifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect763(BaseEffect):
+    """
+    missileDMGBonus
+
+    Used by:
+    Modules from group: Ballistic Control System (22 of 22)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation') or
+                                                           mod.charge.requiresSkill('Defender Missiles'),
+                                               '%sDamage' % dmgType,
+                                               container.getModifiedItemAttr('missileDamageMultiplierBonus'),
+                                               stackingPenalties=True, **kwargs)
+
+
+class Effect784(BaseEffect):
+    """
+    missileBombardmentMaxFlightTimeBonusPostPercentExplosionDelayOwnerCharModulesRequiringMissileLauncherOperation
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Zainou 'Deadeye' Missile Bombardment MB (6 of 6)
+    Modules named like: Rocket Fuel Cache Partition (8 of 8)
+    Implant: Antipharmakon Toxot
+    Skill: Missile Bombardment
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosionDelay', container.getModifiedItemAttr('maxFlightTimeBonus') * level,
+                                        stackingPenalties=penalized, **kwargs)
+
+
+class Effect804(BaseEffect):
+    """
+    ammoInfluenceCapNeed
+
+    Used by:
+    Items from category: Charge (544 of 1023)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Dirty hack to work around cap charges setting cap booster
+        # injection amount to zero
+        rawAttr = module.item.getAttribute('capacitorNeed')
+        if rawAttr is not None and rawAttr >= 0:
+            module.boostItemAttr('capacitorNeed', module.getModifiedChargeAttr('capNeedBonus') or 0, **kwargs)
+
+
+class Effect836(BaseEffect):
+    """
+    skillFreightBonus
+
+    Used by:
+    Modules named like: Cargohold Optimization (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', module.getModifiedItemAttr('cargoCapacityBonus'), **kwargs)
+
+
+class Effect848(BaseEffect):
+    """
+    cloakingTargetingDelayBonusPostPercentCloakingTargetingDelayBonusForShipModulesRequiringCloaking
+
+    Used by:
+    Skill: Cloaking
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+                                      'cloakingTargetingDelay',
+                                      skill.getModifiedItemAttr('cloakingTargetingDelayBonus') * skill.level, **kwargs)
+
+
+class Effect854(BaseEffect):
+    """
+    cloakingScanResolutionMultiplier
+
+    Used by:
+    Modules from group: Cloaking Device (12 of 14)
+    """
+
+    type = 'offline'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('scanResolution',
+                                  module.getModifiedItemAttr('scanResolutionMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='cloakingScanResolutionMultiplier', **kwargs)
+
+
+class Effect856(BaseEffect):
+    """
+    warpSkillSpeed
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Agility (2 of 2)
+    Implants named like: Eifyr and Co. 'Rogue' Warp Drive Speed WS (6 of 6)
+    Implants named like: Grand Prix Booster (5 of 6)
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Serenity Limited 'Overclocker' Dose (3 of 3)
+    Implants named like: grade Ascendancy (10 of 12)
+    Modules named like: Hyperspatial Velocity Optimizer (8 of 8)
+    Implant: Serenity YC122.9 Season Booster - Warp Speed
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.ship.boostItemAttr('warpSpeedMultiplier', container.getModifiedItemAttr('WarpSBonus'),
+                               stackingPenalties=penalized, **kwargs)
+
+
+class Effect882(BaseEffect):
+    """
+    shipHybridRangeBonusCF2
+
+    Used by:
+    Ship: Harpy
+    Ship: Raptor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect887(BaseEffect):
+    """
+    shipETspeedBonusAB2
+
+    Used by:
+    Ship: Armageddon Imperial Issue
+    Ship: Redeemer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect889(BaseEffect):
+    """
+    missileLauncherSpeedMultiplier
+
+    Used by:
+    Modules from group: Ballistic Control System (22 of 22)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect891(BaseEffect):
+    """
+    shipCruiseMissileVelocityBonusCB3
+
+    Used by:
+    Variations of ship: Raven (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Battleship'
+            penalties = False
+        else:
+            skill = None
+            penalties = True
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusCB3'), skill=skill, stackingPenalties=penalties, **kwargs)
+
+
+class Effect892(BaseEffect):
+    """
+    shipTorpedosVelocityBonusCB3
+
+    Used by:
+    Variations of ship: Raven (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Battleship'
+            penalties = False
+        else:
+            skill = None
+            penalties = True
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Torpedoes'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusCB3'), skill=skill, stackingPenalties=penalties, **kwargs)
+
+
+class Effect896(BaseEffect):
+    """
+    covertOpsCpuBonus1
+
+    Used by:
+    Ships from group: Stealth Bomber (4 of 5)
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cloaking Device',
+                                         'cpu', container.getModifiedItemAttr('cloakingCpuNeedBonus'), **kwargs)
+
+
+class Effect898(BaseEffect):
+    """
+    shipMissileKineticDamageCF
+
+    Used by:
+    Ship: Condor
+    Ship: Hawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCF'),
+                                        skill='Caldari Frigate', **kwargs)
+
+
+class Effect899(BaseEffect):
+    """
+    shipMissileKineticDamageCC
+
+    Used by:
+    Ship: Cerberus
+    Ship: Laelaps
+    Ship: Onyx
+    Ship: Orthrus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCC'),
+                                        skill='Caldari Cruiser', **kwargs)
+
+
+class Effect907(BaseEffect):
+    """
+    shipLaserRofAC2
+
+    Used by:
+    Ship: Omen
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusAC2'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect909(BaseEffect):
+    """
+    shipArmorHpAC2
+
+    Used by:
+    Ship: Augoror Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', ship.getModifiedItemAttr('shipBonusAC2'),
+                               skill='Amarr Cruiser', **kwargs)
+
+
+class Effect912(BaseEffect):
+    """
+    shipMissileLauncherRofCC2
+
+    Used by:
+    Ship: Laelaps
+    Ship: Onyx
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusCC2'),
+                                      skill='Caldari Cruiser', **kwargs)
+
+
+class Effect918(BaseEffect):
+    """
+    shipDronesMaxGC2
+
+    Used by:
+    Ship: Guardian-Vexor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.extraAttributes.increase('maxActiveDrones', ship.getModifiedItemAttr('shipBonusGC2'),
+                                     skill='Gallente Cruiser', **kwargs)
+
+
+class Effect919(BaseEffect):
+    """
+    shipHybridTrackingGC2
+
+    Used by:
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Thorax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect958(BaseEffect):
+    """
+    shipArmorEmResistanceAC2
+
+    Used by:
+    Ship: Maller
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusAC2'),
+                               skill='Amarr Cruiser', **kwargs)
+
+
+class Effect959(BaseEffect):
+    """
+    shipArmorExplosiveResistanceAC2
+
+    Used by:
+    Ship: Maller
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusAC2'),
+                               skill='Amarr Cruiser', **kwargs)
+
+
+class Effect960(BaseEffect):
+    """
+    shipArmorKineticResistanceAC2
+
+    Used by:
+    Ship: Maller
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusAC2'),
+                               skill='Amarr Cruiser', **kwargs)
+
+
+class Effect961(BaseEffect):
+    """
+    shipArmorThermalResistanceAC2
+
+    Used by:
+    Ship: Maller
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusAC2'),
+                               skill='Amarr Cruiser', **kwargs)
+
+
+class Effect968(BaseEffect):
+    """
+    shipProjectileDmgMC2
+
+    Used by:
+    Ship: Broadsword
+    Ship: Cynabal
+    Ship: Moracha
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC2'),
+                                      skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect980(BaseEffect):
+    """
+    cloakingWarpSafe
+
+    Used by:
+    Modules named like: Covert Ops Cloaking Device II (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.extraAttributes['cloaked'] = True
+        fit.ship.multiplyItemAttr('maxVelocity', module.getModifiedItemAttr('maxVelocityModifier'), **kwargs)
+
+
+class Effect989(BaseEffect):
+    """
+    eliteBonusGunshipHybridOptimal1
+
+    Used by:
+    Ship: Enyo
+    Ship: Harpy
+    Ship: Ishkur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect991(BaseEffect):
+    """
+    eliteBonusGunshipLaserOptimal1
+
+    Used by:
+    Ship: Retribution
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect996(BaseEffect):
+    """
+    eliteBonusGunshipHybridTracking2
+
+    Used by:
+    Ship: Enyo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect998(BaseEffect):
+    """
+    eliteBonusGunshipProjectileFalloff2
+
+    Used by:
+    Ship: Wolf
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect999(BaseEffect):
+    """
+    eliteBonusGunshipShieldBoost2
+
+    Used by:
+    Ship: Hawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
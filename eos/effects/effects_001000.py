@@ -0,0 +1,1608 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect1001(BaseEffect):
+    """
+    eliteBonusGunshipCapRecharge2
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('rechargeRate', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                               skill='Assault Frigates', **kwargs)
+
+
+class Effect1003(BaseEffect):
+    """
+    selfT2SmallLaserPulseDamageBonus
+
+    Used by:
+    Skill: Small Pulse Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Pulse Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1004(BaseEffect):
+    """
+    selfT2SmallLaserBeamDamageBonus
+
+    Used by:
+    Skill: Small Beam Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Beam Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1005(BaseEffect):
+    """
+    selfT2SmallHybridBlasterDamageBonus
+
+    Used by:
+    Skill: Small Blaster Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Blaster Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1006(BaseEffect):
+    """
+    selfT2SmallHybridRailDamageBonus
+
+    Used by:
+    Skill: Small Railgun Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Railgun Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1007(BaseEffect):
+    """
+    selfT2SmallProjectileACDamageBonus
+
+    Used by:
+    Skill: Small Autocannon Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Autocannon Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1008(BaseEffect):
+    """
+    selfT2SmallProjectileArtyDamageBonus
+
+    Used by:
+    Skill: Small Artillery Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Artillery Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1009(BaseEffect):
+    """
+    selfT2MediumLaserPulseDamageBonus
+
+    Used by:
+    Skill: Medium Pulse Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Pulse Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1010(BaseEffect):
+    """
+    selfT2MediumLaserBeamDamageBonus
+
+    Used by:
+    Skill: Medium Beam Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Beam Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1011(BaseEffect):
+    """
+    selfT2MediumHybridBlasterDamageBonus
+
+    Used by:
+    Skill: Medium Blaster Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Blaster Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1012(BaseEffect):
+    """
+    selfT2MediumHybridRailDamageBonus
+
+    Used by:
+    Skill: Medium Railgun Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Railgun Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1013(BaseEffect):
+    """
+    selfT2MediumProjectileACDamageBonus
+
+    Used by:
+    Skill: Medium Autocannon Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Autocannon Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1014(BaseEffect):
+    """
+    selfT2MediumProjectileArtyDamageBonus
+
+    Used by:
+    Skill: Medium Artillery Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Artillery Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1015(BaseEffect):
+    """
+    selfT2LargeLaserPulseDamageBonus
+
+    Used by:
+    Skill: Large Pulse Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Pulse Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1016(BaseEffect):
+    """
+    selfT2LargeLaserBeamDamageBonus
+
+    Used by:
+    Skill: Large Beam Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Beam Laser Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1017(BaseEffect):
+    """
+    selfT2LargeHybridBlasterDamageBonus
+
+    Used by:
+    Skill: Large Blaster Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Blaster Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1018(BaseEffect):
+    """
+    selfT2LargeHybridRailDamageBonus
+
+    Used by:
+    Skill: Large Railgun Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Railgun Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1019(BaseEffect):
+    """
+    selfT2LargeProjectileACDamageBonus
+
+    Used by:
+    Skill: Large Autocannon Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Autocannon Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1020(BaseEffect):
+    """
+    selfT2LargeProjectileArtyDamageBonus
+
+    Used by:
+    Skill: Large Artillery Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Artillery Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1021(BaseEffect):
+    """
+    eliteBonusGunshipHybridDmg2
+
+    Used by:
+    Ship: Harpy
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect1024(BaseEffect):
+    """
+    shipMissileHeavyVelocityBonusCC2
+
+    Used by:
+    Ship: Caracal
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Cruiser'
+            penalties = False
+        else:
+            skill = None
+            penalties = True
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusCC2'), skill=skill, stackingPenalties=penalties, **kwargs)
+
+
+class Effect1030(BaseEffect):
+    """
+    remoteArmorSystemsCapNeedBonusPostPercentCapacitorNeedLocationShipModulesRequiringRemoteArmorSystems
+
+    Used by:
+    Implants named like: Inherent Implants 'Noble' Remote Armor Repair Systems RA (6 of 6)
+    Modules named like: Remote Repair Augmentor (6 of 8)
+    Skill: Remote Armor Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1033(BaseEffect):
+    """
+    eliteBonusLogisticRemoteArmorRepairCapNeed1
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1034(BaseEffect):
+    """
+    eliteBonusLogisticRemoteArmorRepairCapNeed2
+
+    Used by:
+    Ship: Guardian
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1035(BaseEffect):
+    """
+    eliteBonusLogisticShieldTransferCapNeed2
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1036(BaseEffect):
+    """
+    eliteBonusLogisticShieldTransferCapNeed1
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1046(BaseEffect):
+    """
+    shipRemoteArmorRangeGC1
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect1047(BaseEffect):
+    """
+    shipRemoteArmorRangeAC2
+
+    Used by:
+    Ship: Guardian
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect1048(BaseEffect):
+    """
+    shipShieldTransferRangeCC1
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1049(BaseEffect):
+    """
+    shipShieldTransferRangeMC2
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect1058(BaseEffect):
+    """
+    eliteBonusHeavyGunshipLaserOptimal1
+
+    Used by:
+    Ship: Zealot
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1060(BaseEffect):
+    """
+    eliteBonusHeavyGunshipProjectileFallOff1
+
+    Used by:
+    Ship: Vagabond
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1061(BaseEffect):
+    """
+    eliteBonusHeavyGunshipHybridDmg2
+
+    Used by:
+    Ship: Deimos
+    Ship: Eagle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1062(BaseEffect):
+    """
+    eliteBonusHeavyGunshipLaserDmg2
+
+    Used by:
+    Ship: Zealot
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1080(BaseEffect):
+    """
+    eliteBonusHeavyGunshipHybridFallOff1
+
+    Used by:
+    Ship: Deimos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1084(BaseEffect):
+    """
+    eliteBonusHeavyGunshipDroneControlRange1
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.extraAttributes.increase('droneControlRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                     skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1087(BaseEffect):
+    """
+    eliteBonusHeavyGunshipProjectileDmg2
+
+    Used by:
+    Ship: Vagabond
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect1099(BaseEffect):
+    """
+    shipProjectileTrackingMF2
+
+    Used by:
+    Variations of ship: Slasher (3 of 3)
+    Ship: Republic Fleet Firetail
+    Ship: Wolf
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusMF2'),
+                                      skill='Minmatar Frigate', **kwargs)
+
+
+class Effect1176(BaseEffect):
+    """
+    accerationControlSkillAb&MwdSpeedBoost
+
+    Used by:
+    Implant: Zor's Custom Navigation Hyper-Link
+    Skill: Acceleration Control
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'speedFactor', container.getModifiedItemAttr('speedFBonus') * level, **kwargs)
+
+
+class Effect1179(BaseEffect):
+    """
+    eliteBonusGunshipLaserDamage2
+
+    Used by:
+    Ship: Retribution
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect1181(BaseEffect):
+    """
+    eliteBonusLogisticEnergyTransferCapNeed1
+
+    Used by:
+    Ship: Guardian
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1182(BaseEffect):
+    """
+    shipEnergyTransferRange1
+
+    Used by:
+    Ship: Guardian
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusAC'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect1183(BaseEffect):
+    """
+    eliteBonusLogisticEnergyTransferCapNeed2
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics2'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect1184(BaseEffect):
+    """
+    shipEnergyTransferRange2
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCC2'),
+                                      skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1185(BaseEffect):
+    """
+    structureStealthEmitterArraySigDecrease
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: X Instinct Booster (4 of 4)
+    Implants named like: grade Halo (15 of 18)
+    Implant: Serenity YC122.9 Season Booster - Signature Radius
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', implant.getModifiedItemAttr('signatureRadiusBonus'), **kwargs)
+
+
+class Effect1190(BaseEffect):
+    """
+    iceHarvestCycleTimeModulesRequiringIceHarvesting
+
+    Used by:
+    Implants named like: Inherent Implants 'Yeti' Ice Harvesting IH (3 of 3)
+    Implants named like: ORE 'Harvester' Efficiency (2 of 2)
+    Implants named like: Serenity Limited 'Efficiency' Dose (3 of 3)
+    Implants named like: Serenity Poteque 'Prospector' Harvesting MC (3 of 3)
+    Module: Medium Ice Harvester Accelerator I
+    Skill: Ice Harvesting
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+                                      'duration', container.getModifiedItemAttr('iceHarvestCycleBonus') * level, **kwargs)
+
+
+class Effect1200(BaseEffect):
+    """
+    miningCrystalsMiningAtributesAdjustments
+
+    Used by:
+    Charges from group: Mercoxit Mining Crystal (6 of 6)
+    Charges from group: Mining Crystal (66 of 66)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr(
+            'miningAmount',
+            module.getModifiedChargeAttr('specializationAsteroidYieldMultiplier'),
+            **kwargs)
+        module.increaseItemAttr(
+            'miningWastedVolumeMultiplier',
+            module.getModifiedChargeAttr('specializationCrystalMiningWastedVolumeMultiplierBonus'),
+            **kwargs)
+        module.increaseItemAttr(
+            'miningWasteProbability',
+            module.getModifiedChargeAttr('specializationCrystalMiningWasteProbabilityBonus'),
+            **kwargs)
+
+
+class Effect1212(BaseEffect):
+    """
+    crystalMiningamountInfo2
+
+    Used by:
+    Modules from group: Frequency Mining Laser (6 of 6)
+    """
+
+    runTime = 'late'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.preAssignItemAttr('specialtyMiningAmount', module.getModifiedItemAttr('miningAmount'), **kwargs)
+
+
+class Effect1215(BaseEffect):
+    """
+    shipEnergyDrainAmountAF1
+
+    Used by:
+    Ship: Caedes
+    Ship: Cruor
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect1218(BaseEffect):
+    """
+    shipBonusPirateSmallHybridDmg
+
+    Used by:
+    Ship: Daredevil
+    Ship: Hecate
+    Ship: Metamorphosis
+    Ship: Sunesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1219(BaseEffect):
+    """
+    shipEnergyVampireTransferAmountBonusAB
+
+    Used by:
+    Ship: Bhaalgorn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAB'),
+                                      skill='Amarr Battleship', **kwargs)
+
+
+class Effect1220(BaseEffect):
+    """
+    shipEnergyVampireTransferAmountBonusAc
+
+    Used by:
+    Ship: Ashimmu
+    Ship: Rabisu
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAC'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect1221(BaseEffect):
+    """
+    shipStasisWebRangeBonusMB
+
+    Used by:
+    Ship: Bhaalgorn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusMB'),
+                                      skill='Minmatar Battleship', **kwargs)
+
+
+class Effect1222(BaseEffect):
+    """
+    shipStasisWebRangeBonusMC2
+
+    Used by:
+    Ship: Ashimmu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusMC2'),
+                                      skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect1228(BaseEffect):
+    """
+    shipProjectileTrackingGF
+
+    Used by:
+    Ship: Chremoas
+    Ship: Dramiel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect1230(BaseEffect):
+    """
+    shipMissileVelocityPirateFactionFrigate
+
+    Used by:
+    Ship: Barghest
+    Ship: Garmur
+    Ship: Laelaps
+    Ship: Orthrus
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        penalties = 'ship' not in context
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusRole7'), stackingPenalties=penalties, **kwargs)
+
+
+class Effect1232(BaseEffect):
+    """
+    shipProjectileRofPirateCruiser
+
+    Used by:
+    Ship: Cynabal
+    Ship: Moracha
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1233(BaseEffect):
+    """
+    shipHybridDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    Ship: Vigilant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1234(BaseEffect):
+    """
+    shipMissileVelocityPirateFactionLight
+
+    Used by:
+    Ship: Corax
+    Ship: Talwar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1239(BaseEffect):
+    """
+    shipProjectileRofPirateBattleship
+
+    Used by:
+    Ship: Machariel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1240(BaseEffect):
+    """
+    shipHybridDmgPirateBattleship
+
+    Used by:
+    Ship: Vindicator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect1255(BaseEffect):
+    """
+    setBonusBloodraider
+
+    Used by:
+    Implants named like: grade Talisman (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'durationBonus', implant.getModifiedItemAttr('implantSetBloodraider'), **kwargs)
+
+
+class Effect1256(BaseEffect):
+    """
+    setBonusBloodraiderNosferatu
+
+    Used by:
+    Implants named like: grade Talisman (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+                                      'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect1261(BaseEffect):
+    """
+    setBonusSerpentis
+
+    Used by:
+    Implants named like: grade Snake (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'velocityBonus', implant.getModifiedItemAttr('implantSetSerpentis'), **kwargs)
+
+
+class Effect1264(BaseEffect):
+    """
+    interceptor2HybridTracking
+
+    Used by:
+    Ship: Taranis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
+                                      skill='Interceptors', **kwargs)
+
+
+class Effect1268(BaseEffect):
+    """
+    interceptor2LaserTracking
+
+    Used by:
+    Ship: Crusader
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
+                                      skill='Interceptors', **kwargs)
+
+
+class Effect1281(BaseEffect):
+    """
+    structuralAnalysisEffect
+
+    Used by:
+    Implants named like: Inherent Implants 'Noble' Repair Proficiency RP (6 of 6)
+    Modules named like: Auxiliary Nano Pump (8 of 8)
+    Implant: Imperial Navy Modified 'Noble' Implant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        penalized = 'implant' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', container.getModifiedItemAttr('repairBonus'),
+                                      stackingPenalties=penalized, **kwargs)
+
+
+class Effect1318(BaseEffect):
+    """
+    ewSkillScanStrengthBonus
+
+    Used by:
+    Modules named like: Particle Dispersion Augmentor (8 of 8)
+    Skill: Signal Dispersion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        groups = ('ECM', 'Burst Jammer')
+        level = container.level if 'skill' in context else 1
+        for scanType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                          'scan{0}StrengthBonus'.format(scanType),
+                                          container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
+                                          stackingPenalties=False if 'skill' in context else True, **kwargs)
+
+
+class Effect1360(BaseEffect):
+    """
+    ewSkillRsdCapNeedBonusSkillLevel
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Sensor Linking SL (6 of 6)
+    Skill: Sensor Linking
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1361(BaseEffect):
+    """
+    ewSkillTdCapNeedBonusSkillLevel
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Weapon Disruption WD (6 of 6)
+    Skill: Weapon Disruption
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1370(BaseEffect):
+    """
+    ewSkillTpCapNeedBonusSkillLevel
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Target Painting TG (6 of 6)
+    Skill: Target Painting
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1372(BaseEffect):
+    """
+    ewSkillEwCapNeedSkillLevel
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Electronic Warfare EW (6 of 6)
+    Modules named like: Signal Disruption Amplifier (8 of 8)
+    Skill: Electronic Warfare
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1395(BaseEffect):
+    """
+    shieldBoostAmplifierPassive
+
+    Used by:
+    Implants named like: grade Crystal (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
+
+
+class Effect1397(BaseEffect):
+    """
+    setBonusGuristas
+
+    Used by:
+    Implants named like: grade Crystal (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'shieldBoostMultiplier', implant.getModifiedItemAttr('implantSetGuristas'), **kwargs)
+
+
+class Effect1409(BaseEffect):
+    """
+    systemScanDurationSkillAstrometrics
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Poteque 'Prospector' Astrometric Acquisition AQ (3 of 3)
+    Implants named like: Poteque 'Prospector' Sharpeye (2 of 2)
+    Implants named like: Serenity Limited 'Sharpeye' Dose (3 of 3)
+    Implant: AIR Astro-Acquisition II Booster
+    Skill: Astrometric Acquisition
+    Skill: Astrometrics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+                                      'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
+
+
+class Effect1410(BaseEffect):
+    """
+    propulsionSkillCapNeedBonusSkillLevel
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Propulsion Jamming PJ (6 of 6)
+    Skill: Propulsion Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect1412(BaseEffect):
+    """
+    shipBonusHybridOptimalCB
+
+    Used by:
+    Ship: Rokh
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect1434(BaseEffect):
+    """
+    caldariShipEwStrengthCB
+
+    Used by:
+    Ship: Scorpion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for sensorType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronic Warfare'),
+                                          'scan{0}StrengthBonus'.format(sensorType),
+                                          ship.getModifiedItemAttr('shipBonusCB'),
+                                          skill='Caldari Battleship', **kwargs)
+
+
+class Effect1441(BaseEffect):
+    """
+    caldariShipEwOptimalRangeCB3
+
+    Used by:
+    Ship: Scorpion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCB3'),
+                                      skill='Caldari Battleship', **kwargs)
+
+
+class Effect1442(BaseEffect):
+    """
+    caldariShipEwOptimalRangeCC2
+
+    Used by:
+    Ship: Blackbird
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1443(BaseEffect):
+    """
+    caldariShipEwCapacitorNeedCC
+
+    Used by:
+    Ship: Chameleon
+    Ship: Falcon
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusCC'),
+                                      skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1445(BaseEffect):
+    """
+    ewSkillRsdMaxRangeBonus
+
+    Used by:
+    Modules named like: Particle Dispersion Projector (8 of 8)
+    Skill: Long Distance Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalize = False if 'skill' in context or 'booster' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+                                      'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect1446(BaseEffect):
+    """
+    ewSkillTpMaxRangeBonus
+
+    Used by:
+    Modules named like: Particle Dispersion Projector (8 of 8)
+    Skill: Long Distance Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalize = False if 'skill' in context or 'booster' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect1448(BaseEffect):
+    """
+    ewSkillTdMaxRangeBonus
+
+    Used by:
+    Modules named like: Particle Dispersion Projector (8 of 8)
+    Skill: Long Distance Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalize = False if 'skill' in context or 'booster' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+                                      'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect1449(BaseEffect):
+    """
+    ewSkillRsdFallOffBonus
+
+    Used by:
+    Skill: Frequency Modulation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Sensor Linking'),
+            'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
+
+
+class Effect1450(BaseEffect):
+    """
+    ewSkillTpFallOffBonus
+
+    Used by:
+    Skill: Frequency Modulation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
+
+
+class Effect1451(BaseEffect):
+    """
+    ewSkillTdFallOffBonus
+
+    Used by:
+    Skill: Frequency Modulation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+                                      'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
+
+
+class Effect1452(BaseEffect):
+    """
+    ewSkillEwMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Centurion (10 of 12)
+    Modules named like: Particle Dispersion Projector (8 of 8)
+    Implant: Serenity YC122.9 Season Booster - EW Range
+    Skill: Long Distance Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
+                                      stackingPenalties='skill' not in context and 'implant' not in context, **kwargs)
+
+
+class Effect1453(BaseEffect):
+    """
+    ewSkillEwFallOffBonus
+
+    Used by:
+    Skill: Frequency Modulation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
+
+
+class Effect1472(BaseEffect):
+    """
+    missileSkillAoeCloudSizeBonus
+
+    Used by:
+    Implants named like: Zainou 'Deadeye' Guided Missile Precision GP (6 of 6)
+    Modules named like: Warhead Rigor Catalyst (8 of 8)
+    Skill: Guided Missile Precision
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalize = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level,
+                                        stackingPenalties=penalize, **kwargs)
@@ -0,0 +1,1392 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect1500(BaseEffect):
+    """
+    shieldOperationSkillBoostCapacitorNeedBonus
+
+    Used by:
+    Modules named like: Core Defense Capacitor Safeguard (8 of 8)
+    Skill: Shield Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
+
+
+class Effect1550(BaseEffect):
+    """
+    ewSkillTargetPaintingStrengthBonus
+
+    Used by:
+    Skill: Signature Focusing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        level = skill.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus',
+                                      skill.getModifiedItemAttr('scanSkillTargetPaintStrengthBonus') * level, **kwargs)
+
+
+class Effect1551(BaseEffect):
+    """
+    minmatarShipEwTargetPainterMF2
+
+    Used by:
+    Ship: Hyena
+    Ship: Vigil
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMF2'),
+                                      skill='Minmatar Frigate', **kwargs)
+
+
+class Effect1577(BaseEffect):
+    """
+    haloSetBonus
+
+    Used by:
+    Implants named like: grade Halo (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(
+            lambda implant: implant.item.requiresSkill('Cybernetics'),
+            'signatureRadiusBonus', implant.getModifiedItemAttr('implantSetHalo'), **kwargs)
+
+
+class Effect1579(BaseEffect):
+    """
+    setBonusSansha
+
+    Used by:
+    Implants named like: grade Amulet (18 of 18)
+    Implant: High-grade Halo Omega
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'armorHpBonus', implant.getModifiedItemAttr('implantSetAmulet') or 1, **kwargs)
+
+
+class Effect1581(BaseEffect):
+    """
+    jumpDriveSkillsRangeBonus
+
+    Used by:
+    Skill: Jump Drive Calibration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('jumpDriveRange', skill.getModifiedItemAttr('jumpDriveRangeBonus') * skill.level, **kwargs)
+
+
+class Effect1585(BaseEffect):
+    """
+    capitalTurretSkillLaserDamage
+
+    Used by:
+    Skill: Capital Energy Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1586(BaseEffect):
+    """
+    capitalTurretSkillProjectileDamage
+
+    Used by:
+    Skill: Capital Projectile Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1587(BaseEffect):
+    """
+    capitalTurretSkillHybridDamage
+
+    Used by:
+    Skill: Capital Hybrid Turret
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1588(BaseEffect):
+    """
+    capitalLauncherSkillCitadelKineticDamage
+
+    Used by:
+    Implants named like: Hardwiring Zainou 'Sharpshooter' ZMX (6 of 6)
+    Skill: XL Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect1590(BaseEffect):
+    """
+    missileSkillAoeVelocityBonus
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Zainou 'Deadeye' Target Navigation Prediction TN (6 of 6)
+    Modules named like: Warhead Flare Catalyst (8 of 8)
+    Skill: Target Navigation Prediction
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalize = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level,
+                                        stackingPenalties=penalize, **kwargs)
+
+
+class Effect1592(BaseEffect):
+    """
+    capitalLauncherSkillCitadelEmDamage
+
+    Used by:
+    Implants named like: Hardwiring Zainou 'Sharpshooter' ZMX (6 of 6)
+    Skill: XL Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+                                        'emDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect1593(BaseEffect):
+    """
+    capitalLauncherSkillCitadelExplosiveDamage
+
+    Used by:
+    Implants named like: Hardwiring Zainou 'Sharpshooter' ZMX (6 of 6)
+    Skill: XL Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect1594(BaseEffect):
+    """
+    capitalLauncherSkillCitadelThermalDamage
+
+    Used by:
+    Implants named like: Hardwiring Zainou 'Sharpshooter' ZMX (6 of 6)
+    Skill: XL Torpedoes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect1595(BaseEffect):
+    """
+    missileSkillWarheadUpgradesEmDamageBonus
+
+    Used by:
+    Implants named like: 'Pyrolancea' Dose (7 of 7)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    Skill: Warhead Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        mod = src.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'emDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
+
+
+class Effect1596(BaseEffect):
+    """
+    missileSkillWarheadUpgradesExplosiveDamageBonus
+
+    Used by:
+    Implants named like: 'Pyrolancea' Dose (7 of 7)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    Skill: Warhead Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        mod = src.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
+
+
+class Effect1597(BaseEffect):
+    """
+    missileSkillWarheadUpgradesKineticDamageBonus
+
+    Used by:
+    Implants named like: 'Pyrolancea' Dose (7 of 7)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    Skill: Warhead Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        mod = src.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
+
+
+class Effect1615(BaseEffect):
+    """
+    shipAdvancedSpaceshipCommandAgilityBonus
+
+    Used by:
+    Items from market group: Ships > Capital Ships (52 of 52)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        skillName = 'Advanced Spaceship Command'
+        skill = fit.character.getSkill(skillName)
+        fit.ship.boostItemAttr('agility', skill.getModifiedItemAttr('agilityBonus'), skill=skillName, **kwargs)
+
+
+class Effect1616(BaseEffect):
+    """
+    skillCapitalShipsAdvancedAgility
+
+    Used by:
+    Skill: Capital Ships
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        if fit.ship.item.requiresSkill('Capital Ships'):
+            fit.ship.boostItemAttr('agility', skill.getModifiedItemAttr('agilityBonus') * skill.level, **kwargs)
+
+
+class Effect1617(BaseEffect):
+    """
+    shipCapitalAgilityBonus
+
+    Used by:
+    Ships from group: Carrier (4 of 4)
+    Ships from group: Dreadnought (13 of 13)
+    Ships from group: Force Auxiliary (6 of 6)
+    Ships from group: Lancer Dreadnought (4 of 4)
+    Ships from group: Supercarrier (6 of 6)
+    Ships from group: Titan (8 of 8)
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('agility', src.getModifiedItemAttr('advancedCapitalAgility'),
+                                  stackingPenalties=True, **kwargs)
+
+
+class Effect1634(BaseEffect):
+    """
+    capitalShieldOperationSkillCapacitorNeedBonus
+
+    Used by:
+    Modules named like: Core Defense Capacitor Safeguard (8 of 8)
+    Skill: Capital Shield Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+                                      'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
+
+
+class Effect1635(BaseEffect):
+    """
+    capitalRepairSystemsSkillDurationBonus
+
+    Used by:
+    Implants named like: Chemal Tech Repair Booster (3 of 3)
+    Modules named like: Nanobot Accelerator (8 of 8)
+    Implant: AIR Repairer Booster III
+    Skill: Capital Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+            container.getModifiedItemAttr('durationSkillBonus') * level, **kwargs)
+
+
+class Effect1638(BaseEffect):
+    """
+    skillAdvancedWeaponUpgradesPowerNeedBonus
+
+    Used by:
+    Skill: Advanced Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: (mod.item.requiresSkill('Gunnery') or
+                         mod.item.requiresSkill('Missile Launcher Operation') or
+                         mod.item.requiresSkill('Vorton Projector Operation')),
+            'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level, **kwargs)
+
+
+class Effect1643(BaseEffect):
+    """
+    armoredCommandMindlink
+
+    Used by:
+    Implants from group: Cyber Leadership (4 of 13)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect1644(BaseEffect):
+    """
+    skirmishCommandMindlink
+
+    Used by:
+    Implants from group: Cyber Leadership (4 of 13)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect1645(BaseEffect):
+    """
+    shieldCommandMindlink
+
+    Used by:
+    Implants from group: Cyber Leadership (4 of 13)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect1646(BaseEffect):
+    """
+    informationCommandMindlink
+
+    Used by:
+    Implants from group: Cyber Leadership (4 of 13)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect1650(BaseEffect):
+    """
+    skillSiegeModuleConsumptionQuantityBonus
+
+    Used by:
+    Skill: Tactical Weapon Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+                                         'consumptionQuantity', amount * skill.level, **kwargs)
+
+
+class Effect1657(BaseEffect):
+    """
+    missileSkillWarheadUpgradesThermalDamageBonus
+
+    Used by:
+    Implants named like: 'Pyrolancea' Dose (7 of 7)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    Skill: Warhead Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        mod = src.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
+
+
+class Effect1668(BaseEffect):
+    """
+    freighterCargoBonusA2
+
+    Used by:
+    Variations of ship: Providence (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('freighterBonusA2'), skill='Amarr Freighter', **kwargs)
+
+
+class Effect1669(BaseEffect):
+    """
+    freighterCargoBonusC2
+
+    Used by:
+    Variations of ship: Charon (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('freighterBonusC2'), skill='Caldari Freighter', **kwargs)
+
+
+class Effect1670(BaseEffect):
+    """
+    freighterCargoBonusG2
+
+    Used by:
+    Variations of ship: Obelisk (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('freighterBonusG2'), skill='Gallente Freighter', **kwargs)
+
+
+class Effect1671(BaseEffect):
+    """
+    freighterCargoBonusM2
+
+    Used by:
+    Variations of ship: Fenrir (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', ship.getModifiedItemAttr('freighterBonusM2'), skill='Minmatar Freighter', **kwargs)
+
+
+class Effect1672(BaseEffect):
+    """
+    freighterMaxVelocityBonusA1
+
+    Used by:
+    Ship: Providence
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('freighterBonusA1'), skill='Amarr Freighter', **kwargs)
+
+
+class Effect1673(BaseEffect):
+    """
+    freighterMaxVelocityBonusC1
+
+    Used by:
+    Ship: Charon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('freighterBonusC1'), skill='Caldari Freighter', **kwargs)
+
+
+class Effect1674(BaseEffect):
+    """
+    freighterMaxVelocityBonusG1
+
+    Used by:
+    Ship: Obelisk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('freighterBonusG1'), skill='Gallente Freighter', **kwargs)
+
+
+class Effect1675(BaseEffect):
+    """
+    freighterMaxVelocityBonusM1
+
+    Used by:
+    Ship: Fenrir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('freighterBonusM1'), skill='Minmatar Freighter', **kwargs)
+
+
+class Effect1720(BaseEffect):
+    """
+    shieldBoostAmplifier
+
+    Used by:
+    Modules from group: Capacitor Power Relay (20 of 20)
+    Modules from group: Shield Boost Amplifier (23 of 23)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            'shieldBonus', module.getModifiedItemAttr('shieldBoostMultiplier'),
+            stackingPenalties=True, **kwargs)
+
+
+class Effect1722(BaseEffect):
+    """
+    jumpDriveSkillsCapacitorNeedBonus
+
+    Used by:
+    Skill: Jump Drive Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('jumpDriveCapacitorNeed',
+                               skill.getModifiedItemAttr('jumpDriveCapacitorNeedBonus') * skill.level, **kwargs)
+
+
+class Effect1730(BaseEffect):
+    """
+    droneDmgBonus
+
+    Used by:
+    Skills from group: Drones (9 of 28)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill(skill),
+                                     'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect1738(BaseEffect):
+    """
+    doHacking
+
+    Used by:
+    Modules from group: Data Miners (11 of 11)
+    """
+
+    type = 'active'
+
+
+class Effect1763(BaseEffect):
+    """
+    missileSkillRapidLauncherRoF
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Zainou 'Deadeye' Rapid Launch RL (6 of 6)
+    Implant: Whelan Machorin's Ballistic Smartlink
+    Skill: Missile Launcher Operation
+    Skill: Rapid Launch
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', container.getModifiedItemAttr('rofBonus') * level, **kwargs)
+
+
+class Effect1764(BaseEffect):
+    """
+    missileSkillMissileProjectileVelocityBonus
+
+    Used by:
+    Implants named like: Zainou 'Deadeye' Missile Projection MP (6 of 6)
+    Modules named like: Hydraulic Bay Thrusters (8 of 8)
+    Skill: Missile Projection
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', container.getModifiedItemAttr('speedFactor') * level,
+                                        stackingPenalties=penalized, **kwargs)
+
+
+class Effect1773(BaseEffect):
+    """
+    shipBonusSHTFalloffGF2
+
+    Used by:
+    Ship: Atron
+    Ship: Daredevil
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect1804(BaseEffect):
+    """
+    shipArmorEMResistanceAF1
+
+    Used by:
+    Ship: Astero
+    Ship: Malice
+    Ship: Punisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect1805(BaseEffect):
+    """
+    shipArmorTHResistanceAF1
+
+    Used by:
+    Ship: Astero
+    Ship: Malice
+    Ship: Punisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusAF'),
+                               skill='Amarr Frigate', **kwargs)
+
+
+class Effect1806(BaseEffect):
+    """
+    shipArmorKNResistanceAF1
+
+    Used by:
+    Ship: Astero
+    Ship: Malice
+    Ship: Punisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusAF'),
+                               skill='Amarr Frigate', **kwargs)
+
+
+class Effect1807(BaseEffect):
+    """
+    shipArmorEXResistanceAF1
+
+    Used by:
+    Ship: Astero
+    Ship: Malice
+    Ship: Punisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusAF'),
+                               skill='Amarr Frigate', **kwargs)
+
+
+class Effect1812(BaseEffect):
+    """
+    shipShieldEMResistanceCC2
+
+    Used by:
+    Variations of ship: Moa (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('shipBonusCC2'),
+                               skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1813(BaseEffect):
+    """
+    shipShieldThermalResistanceCC2
+
+    Used by:
+    Variations of ship: Moa (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('shipBonusCC2'),
+                               skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1814(BaseEffect):
+    """
+    shipShieldKineticResistanceCC2
+
+    Used by:
+    Variations of ship: Moa (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('shipBonusCC2'),
+                               skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1815(BaseEffect):
+    """
+    shipShieldExplosiveResistanceCC2
+
+    Used by:
+    Variations of ship: Moa (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusCC2'),
+                               skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1816(BaseEffect):
+    """
+    shipShieldEMResistanceCF2
+
+    Used by:
+    Variations of ship: Merlin (3 of 4)
+    Ship: Cambion
+    Ship: Whiptail
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('shipBonusCF'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect1817(BaseEffect):
+    """
+    shipShieldThermalResistanceCF2
+
+    Used by:
+    Variations of ship: Merlin (3 of 4)
+    Ship: Cambion
+    Ship: Whiptail
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('shipBonusCF'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect1819(BaseEffect):
+    """
+    shipShieldKineticResistanceCF2
+
+    Used by:
+    Variations of ship: Merlin (3 of 4)
+    Ship: Cambion
+    Ship: Whiptail
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('shipBonusCF'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect1820(BaseEffect):
+    """
+    shipShieldExplosiveResistanceCF2
+
+    Used by:
+    Variations of ship: Merlin (3 of 4)
+    Ship: Cambion
+    Ship: Whiptail
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusCF'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect1848(BaseEffect):
+    """
+    miningForemanMindlink
+
+    Used by:
+    Implant: Mining Foreman Mindlink
+    Implant: ORE Mining Director Mindlink
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+                                      src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect1851(BaseEffect):
+    """
+    selfRof
+
+    Used by:
+    Skills named like: Missile Specialization (4 of 5)
+    Skill: Rocket Specialization
+    Skill: Torpedo Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill),
+                                      'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
+
+
+class Effect1862(BaseEffect):
+    """
+    shipMissileEMDamageCF2
+
+    Used by:
+    Ship: Garmur
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusCF2'),
+                                        skill='Caldari Frigate', **kwargs)
+
+
+class Effect1863(BaseEffect):
+    """
+    shipMissileThermalDamageCF2
+
+    Used by:
+    Ship: Garmur
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'),
+                                        skill='Caldari Frigate', **kwargs)
+
+
+class Effect1864(BaseEffect):
+    """
+    shipMissileExplosiveDamageCF2
+
+    Used by:
+    Ship: Garmur
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'),
+                                        skill='Caldari Frigate', **kwargs)
+
+
+class Effect1882(BaseEffect):
+    """
+    miningYieldMultiplyPercent
+
+    Used by:
+    Modules from group: Mining Upgrade (7 of 12)
+    Variations of module: Mining Laser Upgrade I (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+                                      'miningAmount', module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
+
+
+class Effect1885(BaseEffect):
+    """
+    shipCruiseLauncherROFBonus2CB
+
+    Used by:
+    Ship: Raven
+    Ship: Raven State Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Battleship'
+            penalties = False
+            penaltyGroup = None
+        else:
+            skill = None
+            penalties = True
+            penaltyGroup = 'postPerc'
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Missile Launcher Cruise', 'speed',
+            ship.getModifiedItemAttr('shipBonus2CB'), skill=skill,
+            stackingPenalties=penalties, penaltyGroup=penaltyGroup, **kwargs)
+
+
+class Effect1886(BaseEffect):
+    """
+    shipSiegeLauncherROFBonus2CB
+
+    Used by:
+    Ship: Raven
+    Ship: Raven State Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Battleship'
+            penalties = False
+            penaltyGroup = None
+        else:
+            skill = None
+            penalties = True
+            penaltyGroup = 'postPerc'
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed',
+            ship.getModifiedItemAttr('shipBonus2CB'), skill=skill,
+            stackingPenalties=penalties, penaltyGroup=penaltyGroup, **kwargs)
+
+
+class Effect1910(BaseEffect):
+    """
+    eliteBonusVampireDrainAmount2
+
+    Used by:
+    Ship: Curse
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1911(BaseEffect):
+    """
+    eliteReconBonusGravimetricStrength2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Falcon
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanGravimetricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1912(BaseEffect):
+    """
+    eliteReconBonusMagnetometricStrength2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Falcon
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanMagnetometricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1913(BaseEffect):
+    """
+    eliteReconBonusRadarStrength2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Falcon
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanRadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1914(BaseEffect):
+    """
+    eliteReconBonusLadarStrength2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Falcon
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanLadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1921(BaseEffect):
+    """
+    eliteReconStasisWebBonus2
+
+    Used by:
+    Ship: Huginn
+    Ship: Moracha
+    Ship: Rapier
+    Ship: Victor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1922(BaseEffect):
+    """
+    eliteReconScramblerRangeBonus2
+
+    Used by:
+    Ship: Arazu
+    Ship: Enforcer
+    Ship: Lachesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect1959(BaseEffect):
+    """
+    armorReinforcerMassAdd
+
+    Used by:
+    Modules from group: Armor Plate (51 of 51)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('mass', module.getModifiedItemAttr('massAddition'), **kwargs)
+
+
+class Effect1964(BaseEffect):
+    """
+    shipBonusShieldTransferCapneed1
+
+    Used by:
+    Ship: Osprey
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect1969(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairCapNeedGC1
+
+    Used by:
+    Ship: Exequror
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect1996(BaseEffect):
+    """
+    caldariShipEwCapacitorNeedCF2
+
+    Used by:
+    Ship: Griffin
+    Ship: Kitsune
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF2'),
+                                      skill='Caldari Frigate', **kwargs)
@@ -0,0 +1,1361 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect2000(BaseEffect):
+    """
+    droneRangeBonusAdd
+
+    Used by:
+    Modules from group: Drone Control Range Module (7 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        amount = module.getModifiedItemAttr('droneRangeBonus')
+        fit.extraAttributes.increase('droneControlRange', amount, **kwargs)
+
+
+class Effect2008(BaseEffect):
+    """
+    cynosuralDurationBonus
+
+    Used by:
+    Ships from group: Black Ops (6 of 6)
+    Ships from group: Force Recon Ship (9 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+                                      'duration', ship.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect2013(BaseEffect):
+    """
+    droneMaxVelocityBonus
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Modules named like: Drone Speed Augmentor (6 of 8)
+    Implant: Overmind 'Goliath' Drone Tuner T25-10S
+    Implant: Overmind 'Hawkmoth' Drone Tuner S10-25T
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalties = False if 'implant' in context or 'booster' in context else True
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', container.getModifiedItemAttr('droneMaxVelocityBonus') * level,
+                                     stackingPenalties=penalties, **kwargs)
+
+
+class Effect2014(BaseEffect):
+    """
+    droneMaxRangeBonus
+
+    Used by:
+    Modules named like: Drone Scope Chip (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context else True
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxRange',
+                                     container.getModifiedItemAttr('rangeSkillBonus') * level,
+                                     stackingPenalties=penalized, **kwargs)
+
+
+class Effect2015(BaseEffect):
+    """
+    droneDurabilityShieldCapBonus
+
+    Used by:
+    Modules named like: Drone Durability Enhancer (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'shieldCapacity', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
+
+
+class Effect2016(BaseEffect):
+    """
+    droneDurabilityArmorHPBonus
+
+    Used by:
+    Modules named like: Drone Durability Enhancer (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'armorHP', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
+
+
+class Effect2017(BaseEffect):
+    """
+    droneDurabilityHPBonus
+
+    Used by:
+    Modules named like: Drone Durability Enhancer (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'hp', container.getModifiedItemAttr('hullHpBonus') * level, **kwargs)
+
+
+class Effect2019(BaseEffect):
+    """
+    repairDroneShieldBonusBonus
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Repair Drone Operation DR (3 of 3)
+    Modules named like: Drone Repair Augmentor (8 of 8)
+    Skill: Repair Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context else True
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+                                     'shieldBonus', container.getModifiedItemAttr('damageHP') * level,
+                                     stackingPenalties=penalized, **kwargs)
+
+
+class Effect2020(BaseEffect):
+    """
+    repairDroneArmorDamageAmountBonus
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Repair Drone Operation DR (3 of 3)
+    Modules named like: Drone Repair Augmentor (8 of 8)
+    Skill: Repair Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context else True
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+                                     'armorDamageAmount', container.getModifiedItemAttr('damageHP') * level,
+                                     stackingPenalties=penalized, **kwargs)
+
+
+class Effect2029(BaseEffect):
+    """
+    addToSignatureRadius2
+
+    Used by:
+    Modules from group: Missile Launcher Bomb (2 of 2)
+    Modules from group: Shield Extender (36 of 36)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusAdd'), **kwargs)
+
+
+class Effect2041(BaseEffect):
+    """
+    modifyArmorResonancePostPercent
+
+    Used by:
+    Modules from group: Armor Coating (184 of 184)
+    Modules from group: Energized Armor Membrane (169 of 169)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('armor%sDamageResonance' % type.capitalize(),
+                                   module.getModifiedItemAttr('%sDamageResistanceBonus' % type),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect2052(BaseEffect):
+    """
+    modifyShieldResonancePostPercent
+
+    Used by:
+    Modules from group: Shield Resistance Amplifier (84 of 84)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('shield%sDamageResonance' % type.capitalize(),
+                                   module.getModifiedItemAttr('%sDamageResistanceBonus' % type),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect2053(BaseEffect):
+    """
+    emShieldCompensationHardeningBonusGroupShieldAmp
+
+    Used by:
+    Skill: EM Shield Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+                                      'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2054(BaseEffect):
+    """
+    explosiveShieldCompensationHardeningBonusGroupShieldAmp
+
+    Used by:
+    Skill: Explosive Shield Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+                                      'explosiveDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2055(BaseEffect):
+    """
+    kineticShieldCompensationHardeningBonusGroupShieldAmp
+
+    Used by:
+    Skill: Kinetic Shield Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+                                      'kineticDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2056(BaseEffect):
+    """
+    thermalShieldCompensationHardeningBonusGroupShieldAmp
+
+    Used by:
+    Skill: Thermal Shield Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+                                      'thermalDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2105(BaseEffect):
+    """
+    emArmorCompensationHardeningBonusGroupArmorCoating
+
+    Used by:
+    Skill: EM Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+                                      'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2106(BaseEffect):
+    """
+    explosiveArmorCompensationHardeningBonusGroupArmorCoating
+
+    Used by:
+    Skill: Explosive Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+                                      'explosiveDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2107(BaseEffect):
+    """
+    kineticArmorCompensationHardeningBonusGroupArmorCoating
+
+    Used by:
+    Skill: Kinetic Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+                                      'kineticDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2108(BaseEffect):
+    """
+    thermicArmorCompensationHardeningBonusGroupArmorCoating
+
+    Used by:
+    Skill: Thermal Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+                                      'thermalDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2109(BaseEffect):
+    """
+    emArmorCompensationHardeningBonusGroupEnergized
+
+    Used by:
+    Skill: EM Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+                                      'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2110(BaseEffect):
+    """
+    explosiveArmorCompensationHardeningBonusGroupEnergized
+
+    Used by:
+    Skill: Explosive Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+                                      'explosiveDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2111(BaseEffect):
+    """
+    kineticArmorCompensationHardeningBonusGroupEnergized
+
+    Used by:
+    Skill: Kinetic Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+                                      'kineticDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2112(BaseEffect):
+    """
+    thermicArmorCompensationHardeningBonusGroupEnergized
+
+    Used by:
+    Skill: Thermal Armor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+                                      'thermalDamageResistanceBonus',
+                                      skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
+
+
+class Effect2130(BaseEffect):
+    """
+    smallHybridMaxRangeBonus
+
+    Used by:
+    Ship: Catalyst
+    Ship: Cormorant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect2131(BaseEffect):
+    """
+    smallEnergyMaxRangeBonus
+
+    Used by:
+    Ship: Coercer
+    Ship: Gold Magnate
+    Ship: Silver Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect2132(BaseEffect):
+    """
+    smallProjectileMaxRangeBonus
+
+    Used by:
+    Ship: Thrasher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect2133(BaseEffect):
+    """
+    energyTransferArrayMaxRangeBonus
+
+    Used by:
+    Ship: Augoror
+    Ship: Osprey
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'maxRange', ship.getModifiedItemAttr('maxRangeBonus2'), **kwargs)
+
+
+class Effect2134(BaseEffect):
+    """
+    shieldTransporterMaxRangeBonus
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Osprey
+    Ship: Rorqual
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'maxRange',
+                                      ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster', 'maxRange',
+                                      ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect2135(BaseEffect):
+    """
+    armorRepairProjectorMaxRangeBonus
+
+    Used by:
+    Variations of ship: Navitas (2 of 2)
+    Ship: Augoror
+    Ship: Deacon
+    Ship: Exequror
+    Ship: Inquisitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'maxRange',
+                                      src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer', 'maxRange',
+                                      src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect2143(BaseEffect):
+    """
+    minmatarShipEwTargetPainterMC2
+
+    Used by:
+    Ship: Huginn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC2'),
+                                      skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect2152(BaseEffect):
+    """
+    jumpPortalGeneration
+
+    Used by:
+    Module: Industrial Jump Portal Generator I
+    Module: Jump Portal Generator I
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect2155(BaseEffect):
+    """
+    eliteBonusCommandShipProjectileDamageCS1
+
+    Used by:
+    Ship: Sleipnir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
+                                      skill='Command Ships', **kwargs)
+
+
+class Effect2156(BaseEffect):
+    """
+    eliteBonusCommandShipProjectileFalloffCS2
+
+    Used by:
+    Ship: Sleipnir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                      skill='Command Ships', **kwargs)
+
+
+class Effect2157(BaseEffect):
+    """
+    eliteBonusCommandShipLaserDamageCS1
+
+    Used by:
+    Ship: Absolution
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
+                                      skill='Command Ships', **kwargs)
+
+
+class Effect2160(BaseEffect):
+    """
+    eliteBonusCommandShipHybridFalloffCS2
+
+    Used by:
+    Ship: Astarte
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                      skill='Command Ships', **kwargs)
+
+
+class Effect2179(BaseEffect):
+    """
+    shipBonusDroneHitpointsGC2
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Vexor
+    Ship: Vexor Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         type, ship.getModifiedItemAttr('shipBonusGC2'),
+                                         skill='Gallente Cruiser', **kwargs)
+
+
+class Effect2181(BaseEffect):
+    """
+    shipBonusDroneHitpointsFixedAC2
+
+    Used by:
+    Variations of ship: Arbitrator (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         type, ship.getModifiedItemAttr('shipBonusAC2'),
+                                         skill='Amarr Cruiser', **kwargs)
+
+
+class Effect2186(BaseEffect):
+    """
+    shipBonusDroneHitpointsGB2
+
+    Used by:
+    Variations of ship: Dominix (3 of 3)
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         type, ship.getModifiedItemAttr('shipBonusGB2'),
+                                         skill='Gallente Battleship', **kwargs)
+
+
+class Effect2187(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierGB2
+
+    Used by:
+    Variations of ship: Dominix (3 of 3)
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB2'),
+                                     skill='Gallente Battleship', **kwargs)
+
+
+class Effect2188(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierGC2
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Vexor
+    Ship: Vexor Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'),
+                                     skill='Gallente Cruiser', **kwargs)
+
+
+class Effect2189(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierAC2
+
+    Used by:
+    Variations of ship: Arbitrator (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'),
+                                     skill='Amarr Cruiser', **kwargs)
+
+
+class Effect2201(BaseEffect):
+    """
+    eliteBonusInterdictorsProjectileFalloff1
+
+    Used by:
+    Ship: Sabre
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
+                                      skill='Interdictors', **kwargs)
+
+
+class Effect2215(BaseEffect):
+    """
+    shipBonusPirateFrigateProjDamage
+
+    Used by:
+    Ship: Chremoas
+    Ship: Dramiel
+    Ship: Mekubal
+    Ship: Metamorphosis
+    Ship: Sunesis
+    Ship: Svipul
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect2232(BaseEffect):
+    """
+    scanStrengthBonusPercentOnline
+
+    Used by:
+    Modules from group: Signal Amplifier (7 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            fit.ship.boostItemAttr('scan%sStrength' % type,
+                                   module.getModifiedItemAttr('scan%sStrengthPercent' % type),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect2249(BaseEffect):
+    """
+    shipBonusDroneMiningAmountAC2
+
+    Used by:
+    Ship: Arbitrator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'miningAmount', ship.getModifiedItemAttr('shipBonusAC2'),
+                                     skill='Amarr Cruiser', **kwargs)
+
+
+class Effect2250(BaseEffect):
+    """
+    shipBonusDroneMiningAmountGC2
+
+    Used by:
+    Ship: Vexor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+                                     'miningAmount', ship.getModifiedItemAttr('shipBonusGC2'),
+                                     skill='Gallente Cruiser', **kwargs)
+
+
+class Effect2251(BaseEffect):
+    """
+    commandshipMultiRelayEffect
+
+    Used by:
+    Ships from group: Command Ship (8 of 8)
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Odysseus
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('maxGangModules'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('maxGangModules'), **kwargs)
+
+
+class Effect2252(BaseEffect):
+    """
+    covertOpsAndReconOpsCloakModuleDelayBonus
+
+    Used by:
+    Ships from group: Black Ops (6 of 6)
+    Ships from group: Blockade Runner (5 of 5)
+    Ships from group: Covert Ops (9 of 9)
+    Ships from group: Expedition Frigate (2 of 2)
+    Ships from group: Force Recon Ship (10 of 10)
+    Ships from group: Stealth Bomber (5 of 5)
+    Ships named like: Stratios (2 of 2)
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    Ship: Astero
+    Ship: Cenotaph
+    Ship: Metamorphosis
+    Ship: Odysseus
+    Ship: Rabisu
+    Ship: Tholos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemForce(lambda mod: mod.item.requiresSkill('Cloaking'),
+                                      'moduleReactivationDelay',
+                                      container.getModifiedItemAttr('covertOpsAndReconOpsCloakModuleDelay'), **kwargs)
+
+
+class Effect2253(BaseEffect):
+    """
+    covertOpsStealthBomberTargettingDelayBonus
+
+    Used by:
+    Ships from group: Black Ops (6 of 6)
+    Ships from group: Stealth Bomber (5 of 5)
+    Ship: Caedes
+    Ship: Chremoas
+    Ship: Endurance
+    Ship: Etana
+    Ship: Rabisu
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+                                      'cloakingTargetingDelay',
+                                      ship.getModifiedItemAttr('covertOpsStealthBomberTargettingDelay'), **kwargs)
+
+
+class Effect2255(BaseEffect):
+    """
+    tractorBeamCan
+
+    Used by:
+    Deployables from group: Mobile Tractor Unit (5 of 5)
+    Modules from group: Tractor Beam (6 of 6)
+    """
+
+    type = 'active'
+
+
+class Effect2296(BaseEffect):
+    """
+    modifyArmorResonancePassivePostPercentPassive
+
+    Used by:
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: Tetrimon Resistance Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        for srcResType, tgtResType in (
+                ('Em', 'Em'),
+                ('Explosive', 'Explosive'),
+                ('Kinetic', 'Kinetic'),
+                ('Thermic', 'Thermal')
+        ):
+            fit.ship.boostItemAttr(f'armor{tgtResType}DamageResonance',
+                                   booster.getModifiedItemAttr(f'passive{srcResType}DamageResistanceBonus'), **kwargs)
+
+
+class Effect2297(BaseEffect):
+    """
+    modifyShieldResonancePassivePostPercentPassive
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for srcResType, tgtResType in (
+                ('Em', 'Em'),
+                ('Explosive', 'Explosive'),
+                ('Kinetic', 'Kinetic'),
+                ('Thermic', 'Thermal')
+        ):
+            fit.ship.boostItemAttr(f'shield{tgtResType}DamageResonance',
+                                   ship.getModifiedItemAttr(f'passive{srcResType}DamageResistanceBonus'), **kwargs)
+
+
+class Effect2298(BaseEffect):
+    """
+    scanStrengthBonusPercentPassive
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: High grade Grail (5 of 6)
+    Implants named like: High grade Jackal (5 of 6)
+    Implants named like: High grade Spur (5 of 6)
+    Implants named like: High grade Talon (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        for type in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            sensorType = 'scan{0}Strength'.format(type)
+            sensorBoost = 'scan{0}StrengthPercent'.format(type)
+            if sensorBoost in implant.item.attributes:
+                fit.ship.boostItemAttr(sensorType, implant.getModifiedItemAttr(sensorBoost), **kwargs)
+
+
+class Effect2302(BaseEffect):
+    """
+    damageControl
+
+    Used by:
+    Modules from group: Damage Control (25 of 30)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for layer, attrPrefix in (('shield', 'shield'), ('armor', 'armor'), ('hull', '')):
+            for damageType in ('Kinetic', 'Thermal', 'Explosive', 'Em'):
+                bonus = '%s%sDamageResonance' % (attrPrefix, damageType)
+                bonus = '%s%s' % (bonus[0].lower(), bonus[1:])
+                booster = '%s%sDamageResonance' % (layer, damageType)
+                fit.ship.multiplyItemAttr(bonus, module.getModifiedItemAttr(booster),
+                                          stackingPenalties=True, penaltyGroup='preMul', **kwargs)
+
+
+class Effect2305(BaseEffect):
+    """
+    eliteReconBonusEnergyNeutAmount2
+
+    Used by:
+    Ship: Curse
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect2354(BaseEffect):
+    """
+    capitalRemoteArmorRepairerCapNeedBonusSkill
+
+    Used by:
+    Variations of module: Capital Remote Repair Augmentor I (2 of 2)
+    Skill: Capital Remote Armor Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect2355(BaseEffect):
+    """
+    capitalRemoteShieldTransferCapNeedBonusSkill
+
+    Used by:
+    Skill: Capital Shield Emission Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect2356(BaseEffect):
+    """
+    capitalRemoteEnergyTransferCapNeedBonusSkill
+
+    Used by:
+    Skill: Capital Capacitor Emission Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+                                      'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
+
+
+class Effect2402(BaseEffect):
+    """
+    skillSuperWeaponDmgBonus
+
+    Used by:
+    Skill: Advanced Doomsday Operation
+    Skill: Doomsday Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for dmgType in damageTypes:
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Doomsday Operation'), f'{dmgType}Damage',
+                skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect2422(BaseEffect):
+    """
+    implantVelocityBonus
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Navigation NN (6 of 6)
+    Implant: Genolution Core Augmentation CA-3
+    Implant: Shaqil's Speed Enhancer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', implant.getModifiedItemAttr('implantBonusVelocity'), **kwargs)
+
+
+class Effect2432(BaseEffect):
+    """
+    energyManagementCapacitorCapacityBonusPostPercentPassive
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: Inherent Implants 'Squire' Capacitor Management EM (6 of 6)
+    Implants named like: Mindflood Booster (4 of 4)
+    Implants named like: Tetrimon Capacitor Booster (4 of 4)
+    Modules named like: Semiconductor Memory Cell (8 of 8)
+    Implant: Antipharmakon Aeolis
+    Implant: Basic Capsuleer Engineering Augmentation Chip
+    Implant: Genolution Core Augmentation CA-1
+    Skill: Capacitor Management
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.ship.boostItemAttr('capacitorCapacity', container.getModifiedItemAttr('capacitorCapacityBonus') * level, **kwargs)
+
+
+class Effect2444(BaseEffect):
+    """
+    minerCpuUsageMultiplyPercent2
+
+    Used by:
+    Modules from group: Mining Upgrade (7 of 12)
+    Variations of module: Mining Laser Upgrade I (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+                                      'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
+
+
+class Effect2445(BaseEffect):
+    """
+    iceMinerCpuUsagePercent
+
+    Used by:
+    Variations of module: Ice Harvester Upgrade I (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+                                      'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
+
+
+class Effect2456(BaseEffect):
+    """
+    miningUpgradeCPUPenaltyReductionModulesRequiringMiningUpgradePercent
+
+    Used by:
+    Implants named like: Inherent Implants 'Highwall' Mining Upgrades MU (3 of 3)
+    Skill: Mining Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Upgrades'),
+                                      'cpuPenaltyPercent',
+                                      container.getModifiedItemAttr('miningUpgradeCPUReductionBonus') * level, **kwargs)
+
+
+class Effect2465(BaseEffect):
+    """
+    shipBonusArmorResistAB
+
+    Used by:
+    Ship: Abaddon
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('Em', 'Explosive', 'Kinetic', 'Thermal'):
+            fit.ship.boostItemAttr('armor{0}DamageResonance'.format(type), ship.getModifiedItemAttr('shipBonusAB'),
+                                   skill='Amarr Battleship', **kwargs)
+
+
+class Effect2479(BaseEffect):
+    """
+    iceHarvestCycleTimeModulesRequiringIceHarvestingOnline
+
+    Used by:
+    Variations of module: Ice Harvester Upgrade I (5 of 5)
+    Module: Frostline 'Omnivore' Harvester Upgrade
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+                                      'duration', module.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
+
+
+class Effect2485(BaseEffect):
+    """
+    implantArmorHpBonus2
+
+    Used by:
+    Implants named like: Capsuleer Defense Augmentation Chip (3 of 3)
+    Implants named like: Festival only 'Rock' AH Dose (4 of 4)
+    Implants named like: Inherent Implants 'Noble' Hull Upgrades HG (7 of 7)
+    Implants named like: Serenity Limited 'Hardshell' Dose (3 of 3)
+    Implant: Genolution Core Augmentation CA-4
+    Implant: Imperial Navy Modified 'Noble' Implant
+    Implant: Imperial Special Ops Field Enhancer - Standard
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', implant.getModifiedItemAttr('armorHpBonus2'), **kwargs)
+
+
+class Effect2488(BaseEffect):
+    """
+    implantVelocityBonus2
+
+    Used by:
+    Implant: Republic Special Ops Field Enhancer - Gamma
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', implant.getModifiedItemAttr('velocityBonus2'), **kwargs)
+
+
+class Effect2489(BaseEffect):
+    """
+    shipBonusRemoteTrackingComputerFalloffMC
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusMC'),
+                                      skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect2490(BaseEffect):
+    """
+    shipBonusRemoteTrackingComputerFalloffGC2
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect2491(BaseEffect):
+    """
+    ewSkillEcmBurstRangeBonus
+
+    Used by:
+    Modules named like: Particle Dispersion Projector (8 of 8)
+    Skill: Long Distance Jamming
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+                                      'ecmBurstRange', container.getModifiedItemAttr('rangeSkillBonus') * level, **kwargs)
+
+
+class Effect2492(BaseEffect):
+    """
+    ewSkillEcmBurstCapNeedBonus
+
+    Used by:
+    Implants named like: Zainou 'Gypsy' Electronic Warfare EW (6 of 6)
+    Modules named like: Signal Disruption Amplifier (8 of 8)
+    Skill: Electronic Warfare
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
@@ -0,0 +1,2089 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect2503(BaseEffect):
+    """
+    shipHTTrackingBonusGB2
+
+    Used by:
+    Ships named like: Megathron (3 of 3)
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB2'),
+                                      skill='Gallente Battleship', **kwargs)
+
+
+class Effect2504(BaseEffect):
+    """
+    shipBonusHybridTrackingGF2
+
+    Used by:
+    Ship: Ares
+    Ship: Federation Navy Comet
+    Ship: Pacifier
+    Ship: Sidewinder
+    Ship: Tristan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect2561(BaseEffect):
+    """
+    eliteBonusAssaultShipMissileVelocity1
+
+    Used by:
+    Ship: Hawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                                        skill='Assault Frigates', **kwargs)
+
+
+class Effect2589(BaseEffect):
+    """
+    modifyBoosterEffectChanceWithBoosterChanceBonusPostPercent
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Recovery NR (2 of 2)
+    Skill: Neurotoxin Recovery
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        for i in range(5):
+            attr = 'boosterEffectChance{0}'.format(i + 1)
+            fit.boosters.filteredItemBoost(lambda booster: attr in booster.itemModifiedAttributes,
+                                           attr, container.getModifiedItemAttr('boosterChanceBonus') * level, **kwargs)
+
+
+class Effect2602(BaseEffect):
+    """
+    shipBonusEmShieldResistanceCB2
+
+    Used by:
+    Ship: Rattlesnake
+    Ship: Rokh
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('shipBonus2CB'),
+                               skill='Caldari Battleship', **kwargs)
+
+
+class Effect2603(BaseEffect):
+    """
+    shipBonusExplosiveShieldResistanceCB2
+
+    Used by:
+    Ship: Rattlesnake
+    Ship: Rokh
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonus2CB'),
+                               skill='Caldari Battleship', **kwargs)
+
+
+class Effect2604(BaseEffect):
+    """
+    shipBonusKineticShieldResistanceCB2
+
+    Used by:
+    Ship: Rattlesnake
+    Ship: Rokh
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('shipBonus2CB'),
+                               skill='Caldari Battleship', **kwargs)
+
+
+class Effect2605(BaseEffect):
+    """
+    shipBonusThermicShieldResistanceCB2
+
+    Used by:
+    Ship: Rattlesnake
+    Ship: Rokh
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('shipBonus2CB'),
+                               skill='Caldari Battleship', **kwargs)
+
+
+class Effect2611(BaseEffect):
+    """
+    eliteBonusGunshipProjectileDamage1
+
+    Used by:
+    Ship: Wolf
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect2644(BaseEffect):
+    """
+    increaseSignatureRadiusOnline
+
+    Used by:
+    Modules from group: Inertial Stabilizer (7 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2645(BaseEffect):
+    """
+    scanResolutionMultiplierOnline
+
+    Used by:
+    Modules from group: Interdiction Nullifier (4 of 4)
+    Modules from group: Warp Core Stabilizer (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionMultiplier'),
+                                  stackingPenalties=True, **kwargs)
+
+
+class Effect2646(BaseEffect):
+    """
+    maxTargetRangeBonus
+
+    Used by:
+    Modules from group: Interdiction Nullifier (4 of 4)
+    Modules from group: Warp Core Stabilizer (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2647(BaseEffect):
+    """
+    eliteBonusHeavyGunshipHeavyMissileLauncherRof2
+
+    Used by:
+    Ship: Cerberus
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect2648(BaseEffect):
+    """
+    eliteBonusHeavyGunshipHeavyAssaultMissileLauncherRof2
+
+    Used by:
+    Ship: Cerberus
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect2649(BaseEffect):
+    """
+    eliteBonusHeavyGunshipAssaultMissileLauncherRof2
+
+    Used by:
+    Ship: Cerberus
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect2670(BaseEffect):
+    """
+    sensorBoosterActivePercentage
+
+    Used by:
+    Modules from group: Sensor Booster (16 of 16)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            fit.ship.boostItemAttr(
+                'scan{}Strength'.format(scanType),
+                module.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType)),
+                stackingPenalties=True, **kwargs)
+
+
+class Effect2688(BaseEffect):
+    """
+    capNeedBonusEffectLasers
+
+    Used by:
+    Modules named like: Energy Discharge Elutriation (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
+
+
+class Effect2689(BaseEffect):
+    """
+    capNeedBonusEffectHybrids
+
+    Used by:
+    Modules named like: Hybrid Discharge Elutriation (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
+
+
+class Effect2690(BaseEffect):
+    """
+    cpuNeedBonusEffectLasers
+
+    Used by:
+    Modules named like: Algid Energy Administrations Unit (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
+
+
+class Effect2691(BaseEffect):
+    """
+    cpuNeedBonusEffectHybrid
+
+    Used by:
+    Modules named like: Algid Hybrid Administrations Unit (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
+
+
+class Effect2693(BaseEffect):
+    """
+    falloffBonusEffectLasers
+
+    Used by:
+    Modules named like: Energy Ambit Extension (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = False if 'booster' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'falloff', module.getModifiedItemAttr('falloffBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect2694(BaseEffect):
+    """
+    falloffBonusEffectHybrids
+
+    Used by:
+    Modules named like: Hybrid Ambit Extension (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'falloff', module.getModifiedItemAttr('falloffBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect2695(BaseEffect):
+    """
+    falloffBonusEffectProjectiles
+
+    Used by:
+    Modules named like: Projectile Ambit Extension (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                      'falloff', module.getModifiedItemAttr('falloffBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect2696(BaseEffect):
+    """
+    maxRangeBonusEffectLasers
+
+    Used by:
+    Implants named like: Tetrimon Precision Booster (4 of 4)
+    Modules named like: Energy Locus Coordinator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalties = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
+                                      stackingPenalties=penalties, **kwargs)
+
+
+class Effect2697(BaseEffect):
+    """
+    maxRangeBonusEffectHybrids
+
+    Used by:
+    Modules named like: Hybrid Locus Coordinator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalties = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
+                                      stackingPenalties=penalties, **kwargs)
+
+
+class Effect2698(BaseEffect):
+    """
+    maxRangeBonusEffectProjectiles
+
+    Used by:
+    Modules named like: Projectile Locus Coordinator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = False if 'booster' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                      'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect2706(BaseEffect):
+    """
+    drawbackPowerNeedLasers
+
+    Used by:
+    Modules from group: Rig Energy Weapon (56 of 56)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'power', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2707(BaseEffect):
+    """
+    drawbackPowerNeedHybrids
+
+    Used by:
+    Modules from group: Rig Hybrid Weapon (56 of 56)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'power', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2708(BaseEffect):
+    """
+    drawbackPowerNeedProjectiles
+
+    Used by:
+    Modules from group: Rig Projectile Weapon (40 of 40)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                      'power', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2712(BaseEffect):
+    """
+    drawbackArmorHP
+
+    Used by:
+    Modules from group: Rig Navigation (48 of 64)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2713(BaseEffect):
+    """
+    drawbackCPUOutput
+
+    Used by:
+    Modules from group: Rig Drones (58 of 64)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('cpuOutput', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2714(BaseEffect):
+    """
+    drawbackCPUNeedLaunchers
+
+    Used by:
+    Modules from group: Rig Launcher (48 of 48)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'cpu', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2716(BaseEffect):
+    """
+    drawbackSigRad
+
+    Used by:
+    Modules from group: Rig Shield (72 of 72)
+    Modules named like: Optimizer (16 of 16)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('drawback'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2717(BaseEffect):
+    """
+    drawbackAgility
+
+    Used by:
+    Modules from group: Rig Armor (48 of 72)
+    Modules from group: Rig Resource Processing (8 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', module.getModifiedItemAttr('drawback'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2718(BaseEffect):
+    """
+    drawbackShieldCapacity
+
+    Used by:
+    Modules from group: Rig Electronic Systems (40 of 48)
+    Modules from group: Rig Targeting (16 of 16)
+    Modules named like: Signal Focusing Kit (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect2726(BaseEffect):
+    """
+    miningClouds
+
+    Used by:
+    Modules named like: Gas Cloud (10 of 10)
+    """
+
+    type = 'active'
+
+
+class Effect2727(BaseEffect):
+    """
+    gasCloudHarvestingMaxGroupSkillLevel
+
+    Used by:
+    Skill: Gas Cloud Harvesting
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Gas Cloud Scoops',
+                                         'maxGroupActive', skill.level, **kwargs)
+
+
+class Effect2734(BaseEffect):
+    """
+    shipECMScanStrengthBonusCF
+
+    Used by:
+    Ship: Griffin
+    Ship: Kitsune
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                          'scan{0}StrengthBonus'.format(type),
+                                          ship.getModifiedItemAttr('shipBonusCF'),
+                                          skill='Caldari Frigate', **kwargs)
+
+
+class Effect2735(BaseEffect):
+    """
+    boosterArmorHpPenalty
+
+    Used by:
+    Implants named like: Crash Booster (3 of 4)
+    Implants named like: Exile Booster (3 of 4)
+    Implants named like: Frentix Booster (3 of 4)
+    Implants named like: X Instinct Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterArmorHPPenalty'
+    displayName = 'Armor Capacity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2736(BaseEffect):
+    """
+    boosterArmorRepairAmountPenalty
+
+    Used by:
+    Implants named like: Drop Booster (3 of 4)
+    Implants named like: Mindflood Booster (3 of 4)
+    Implants named like: Sooth Sayer Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterArmorRepairAmountPenalty'
+    displayName = 'Armor Repair Amount'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Armor Repair Unit', 'Ancillary Armor Repairer'),
+                                      'armorDamageAmount', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2737(BaseEffect):
+    """
+    boosterShieldCapacityPenalty
+
+    Used by:
+    Implants named like: Blue Pill Booster (3 of 5)
+    Implants named like: Drop Booster (3 of 4)
+    Implants named like: Sooth Sayer Booster (3 of 4)
+    Implants named like: X Instinct Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterShieldCapacityPenalty'
+    displayName = 'Shield Capacity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2739(BaseEffect):
+    """
+    boosterTurretOptimalRangePenalty
+
+    Used by:
+    Implants named like: Blue Pill Booster (3 of 5)
+    Implants named like: Mindflood Booster (3 of 4)
+    Implants named like: Sooth Sayer Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterTurretOptimalRangePenalty'
+    displayName = 'Turret Optimal Range'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'maxRange', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2741(BaseEffect):
+    """
+    boosterTurretFalloffPenalty
+
+    Used by:
+    Implants named like: Drop Booster (3 of 4)
+    Implants named like: X Instinct Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterTurretFalloffPenalty'
+    displayName = 'Turret Falloff'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'falloff', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2745(BaseEffect):
+    """
+    boosterCapacitorCapacityPenalty
+
+    Used by:
+    Implants named like: Blue Pill Booster (3 of 5)
+    Implants named like: Exile Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterCapacitorCapacityPenalty'
+    displayName = 'Cap Capacity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacitorCapacity', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2746(BaseEffect):
+    """
+    boosterMaxVelocityPenalty
+
+    Used by:
+    Implants named like: Crash Booster (3 of 4)
+    Items from market group: Implants & Boosters > Booster > Booster Slot 02 (9 of 13)
+    """
+
+    runTime = 'late'
+    attr = 'boosterMaxVelocityPenalty'
+    displayName = 'Velocity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2747(BaseEffect):
+    """
+    boosterTurretTrackingPenalty
+
+    Used by:
+    Implants named like: Exile Booster (3 of 4)
+    Implants named like: Frentix Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterTurretTrackingPenalty'
+    displayName = 'Turret Tracking'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'trackingSpeed', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2748(BaseEffect):
+    """
+    boosterMissileVelocityPenalty
+
+    Used by:
+    Implants named like: Crash Booster (3 of 4)
+    Implants named like: X Instinct Booster (3 of 4)
+    """
+
+    runTime = 'late'
+    attr = 'boosterMissileVelocityPenalty'
+    displayName = 'Missile Velocity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2749(BaseEffect):
+    """
+    boosterMissileExplosionVelocityPenalty
+
+    Used by:
+    Implants named like: Blue Pill Booster (3 of 5)
+    """
+
+    runTime = 'late'
+    attr = 'boosterAOEVelocityPenalty'
+    displayName = 'Missile Explosion Velocity'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2756(BaseEffect):
+    """
+    shipBonusECMStrengthBonusCC
+
+    Used by:
+    Ship: Blackbird
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('Gravimetric', 'Magnetometric', 'Ladar', 'Radar'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                          'scan{0}StrengthBonus'.format(type), ship.getModifiedItemAttr('shipBonusCC'),
+                                          skill='Caldari Cruiser', **kwargs)
+
+
+class Effect2757(BaseEffect):
+    """
+    salvaging
+
+    Used by:
+    Modules from group: Salvager (3 of 3)
+    """
+
+    type = 'active'
+
+
+class Effect2760(BaseEffect):
+    """
+    boosterModifyBoosterArmorPenalties
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Control NC (2 of 2)
+    Implants named like: grade Edge (10 of 12)
+    Skill: Neurotoxin Control
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        attrs = ('boosterArmorHPPenalty', 'boosterArmorRepairAmountPenalty')
+        for attr in attrs:
+            fit.boosters.filteredItemBoost(lambda booster: True, attr,
+                                           container.getModifiedItemAttr('boosterAttributeModifier') * level, **kwargs)
+
+
+class Effect2763(BaseEffect):
+    """
+    boosterModifyBoosterShieldPenalty
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Control NC (2 of 2)
+    Implants named like: grade Edge (10 of 12)
+    Skill: Neurotoxin Control
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        attrs = ('boosterShieldBoostAmountPenalty', 'boosterShieldCapacityPenalty', 'shieldBoostMultiplier')
+        for attr in attrs:
+            # shieldBoostMultiplier can be positive (Blue Pill) and negative value (other boosters)
+            # We're interested in decreasing only side-effects
+            fit.boosters.filteredItemBoost(lambda booster: booster.getModifiedItemAttr(attr) < 0,
+                                           attr, container.getModifiedItemAttr('boosterAttributeModifier') * level, **kwargs)
+
+
+class Effect2766(BaseEffect):
+    """
+    boosterModifyBoosterMaxVelocityAndCapacitorPenalty
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Control NC (2 of 2)
+    Implants named like: grade Edge (10 of 12)
+    Skill: Neurotoxin Control
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        attrs = ('boosterCapacitorCapacityPenalty', 'boosterMaxVelocityPenalty')
+        for attr in attrs:
+            fit.boosters.filteredItemBoost(lambda booster: True, attr,
+                                           container.getModifiedItemAttr('boosterAttributeModifier') * level, **kwargs)
+
+
+class Effect2776(BaseEffect):
+    """
+    boosterModifyBoosterMissilePenalty
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Control NC (2 of 2)
+    Implants named like: grade Edge (10 of 12)
+    Skill: Neurotoxin Control
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        attrs = ('boosterAOEVelocityPenalty', 'boosterMissileAOECloudPenalty', 'boosterMissileVelocityPenalty')
+        for attr in attrs:
+            fit.boosters.filteredItemBoost(lambda booster: True, attr,
+                                           container.getModifiedItemAttr('boosterAttributeModifier') * level, **kwargs)
+
+
+class Effect2778(BaseEffect):
+    """
+    boosterModifyBoosterTurretPenalty
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Neurotoxin Control NC (2 of 2)
+    Implants named like: grade Edge (10 of 12)
+    Skill: Neurotoxin Control
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        attrs = ('boosterTurretFalloffPenalty', 'boosterTurretOptimalRangePenalty', 'boosterTurretTrackingPenalty')
+        for attr in attrs:
+            fit.boosters.filteredItemBoost(lambda booster: True, attr,
+                                           container.getModifiedItemAttr('boosterAttributeModifier') * level, **kwargs)
+
+
+class Effect2791(BaseEffect):
+    """
+    boosterMissileExplosionCloudPenaltyFixed
+
+    Used by:
+    Implants named like: Exile Booster (3 of 4)
+    Implants named like: Mindflood Booster (3 of 4)
+    """
+
+    attr = 'boosterMissileAOECloudPenalty'
+    displayName = 'Missile Explosion Radius'
+    type = 'boosterSideEffect'
+
+    @classmethod
+    def handler(cls, fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeCloudSize', booster.getModifiedItemAttr(cls.attr), **kwargs)
+
+
+class Effect2792(BaseEffect):
+    """
+    modifyArmorResonancePostPercentPassive
+
+    Used by:
+    Modules named like: Armor Reinforcer (32 of 32)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('armor' + type.capitalize() + 'DamageResonance',
+                                   module.getModifiedItemAttr(type + 'DamageResistanceBonus') or 0,
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect2794(BaseEffect):
+    """
+    salvagingAccessDifficultyBonusEffectPassive
+
+    Used by:
+    Modules from group: Rig Resource Processing (8 of 10)
+    Implant: Poteque 'Prospector' Salvaging SV-905
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                         'accessDifficultyBonus', container.getModifiedItemAttr('accessDifficultyBonus'),
+                                         position='post', **kwargs)
+
+
+class Effect2795(BaseEffect):
+    """
+    modifyShieldResonancePostPercentPassive
+
+    Used by:
+    Modules named like: Shield Reinforcer (32 of 32)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('shield' + type.capitalize() + 'DamageResonance',
+                                   module.getModifiedItemAttr(type + 'DamageResistanceBonus') or 0,
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect2796(BaseEffect):
+    """
+    massReductionBonusPassive
+
+    Used by:
+    Modules from group: Rig Anchor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('mass', module.getModifiedItemAttr('massBonusPercentage'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2797(BaseEffect):
+    """
+    projectileWeaponSpeedMultiplyPassive
+
+    Used by:
+    Modules named like: Projectile Burst Aerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect2798(BaseEffect):
+    """
+    projectileWeaponDamageMultiplyPassive
+
+    Used by:
+    Modules named like: Projectile Collision Accelerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=penalize, **kwargs)
+
+
+class Effect2799(BaseEffect):
+    """
+    missileLauncherSpeedMultiplierPassive
+
+    Used by:
+    Modules named like: Bay Loading Accelerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect2801(BaseEffect):
+    """
+    energyWeaponSpeedMultiplyPassive
+
+    Used by:
+    Modules named like: Energy Burst Aerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect2802(BaseEffect):
+    """
+    hybridWeaponDamageMultiplyPassive
+
+    Used by:
+    Modules named like: Hybrid Collision Accelerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=penalize, **kwargs)
+
+
+class Effect2803(BaseEffect):
+    """
+    energyWeaponDamageMultiplyPassive
+
+    Used by:
+    Implants named like: Harvest Damage Booster (4 of 4)
+    Implants named like: Wightstorm Vitarka Booster (4 of 4)
+    Modules named like: Energy Collision Accelerator (8 of 8)
+    Implant: Wisdom of Gheinok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalties = 'booster' not in context
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=penalties, **kwargs)
+
+
+class Effect2804(BaseEffect):
+    """
+    hybridWeaponSpeedMultiplyPassive
+
+    Used by:
+    Modules named like: Hybrid Burst Aerator (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect2805(BaseEffect):
+    """
+    shipBonusLargeEnergyWeaponDamageAB2
+
+    Used by:
+    Ship: Abaddon
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB2'),
+                                      skill='Amarr Battleship', **kwargs)
+
+
+class Effect2809(BaseEffect):
+    """
+    shipMissileAssaultMissileVelocityBonusCC2
+
+    Used by:
+    Ship: Caracal
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
+                                        skill='Caldari Cruiser', **kwargs)
+
+
+class Effect2812(BaseEffect):
+    """
+    caldariShipECMBurstOptimalRangeCB3
+
+    Used by:
+    Ship: Scorpion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+                                      'ecmBurstRange', ship.getModifiedItemAttr('shipBonusCB3'),
+                                      skill='Caldari Battleship', **kwargs)
+
+
+class Effect2837(BaseEffect):
+    """
+    armorHPBonusAdd
+
+    Used by:
+    Modules from group: Armor Plate (51 of 51)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('armorHP', module.getModifiedItemAttr('armorHPBonusAdd'), **kwargs)
+
+
+class Effect2847(BaseEffect):
+    """
+    trackingSpeedBonusPassiveRequiringGunneryTrackingSpeedBonus
+
+    Used by:
+    Implants named like: Chemal Tech Turret Booster (3 of 3)
+    Implants named like: Drop Booster (4 of 4)
+    Implants named like: Eifyr and Co. 'Gunslinger' Motion Prediction MR (6 of 6)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implant: Antipharmakon Iokira
+    Implant: Ogdin's Eye Coordination Enhancer
+    Skill: Motion Prediction
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'trackingSpeed', container.getModifiedItemAttr('trackingSpeedBonus') * level, **kwargs)
+
+
+class Effect2848(BaseEffect):
+    """
+    accessDifficultyBonusModifierRequiringArchaelogy
+
+    Used by:
+    Modules named like: Emission Scope Sharpener (8 of 8)
+    Implant: Poteque 'Prospector' Archaeology AC-905
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda module: module.item.requiresSkill('Archaeology'), 'accessDifficultyBonus',
+            container.getModifiedItemAttr('accessDifficultyBonusModifier'), **kwargs)
+
+
+class Effect2849(BaseEffect):
+    """
+    accessDifficultyBonusModifierRequiringHacking
+
+    Used by:
+    Modules named like: Memetic Algorithm Bank (8 of 8)
+    Implant: Neural Lace 'Blackglass' Net Intrusion 920-40
+    Implant: Neural Lace 'Bluefire' Net Ablation 960-10
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    Implant: Poteque 'Prospector' Hacking HC-905
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda c: c.item.requiresSkill('Hacking'), 'accessDifficultyBonus',
+            container.getModifiedItemAttr('accessDifficultyBonusModifier'), **kwargs)
+
+
+class Effect2850(BaseEffect):
+    """
+    durationBonusForGroupAfterburner
+
+    Used by:
+    Modules named like: Engine Thermal Shielding (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'duration', module.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect2851(BaseEffect):
+    """
+    missileDMGBonusPassive
+
+    Used by:
+    Modules named like: Warhead Calefaction Catalyst (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        penalize = False if 'booster' in context else True
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                               '%sDamage' % dmgType,
+                                               container.getModifiedItemAttr('missileDamageMultiplierBonus'),
+                                               stackingPenalties=penalize, **kwargs)
+
+
+class Effect2853(BaseEffect):
+    """
+    cloakingTargetingDelayBonusLRSMCloakingPassive
+
+    Used by:
+    Modules named like: Targeting Systems Stabilizer (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Cloaking'),
+                                      'cloakingTargetingDelay', module.getModifiedItemAttr('cloakingTargetingDelayBonus'), **kwargs)
+
+
+class Effect2857(BaseEffect):
+    """
+    cynosuralGeneration
+
+    Used by:
+    Modules from group: Cynosural Field Generator (3 of 3)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('speedFactor'), **kwargs)
+
+
+class Effect2858(BaseEffect):
+    """
+    cloneJumpAccepting
+
+    Used by:
+    Module: Clone Vat Bay I
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+        fit.ship.forceItemAttr('canCloak', mod.getModifiedChargeAttr('canCloak'), **kwargs)
+
+
+class Effect2865(BaseEffect):
+    """
+    velocityBonusOnline
+
+    Used by:
+    Modules from group: Entosis Link (6 of 6)
+    Modules from group: Nanofiber Internal Structure (7 of 7)
+    Modules from group: Overdrive Injector System (7 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('implantBonusVelocity'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect2866(BaseEffect):
+    """
+    biologyTimeBonusFixed
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Biology BY (2 of 2)
+    Skill: Biology
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.boosters.filteredItemBoost(lambda bst: True, 'boosterDuration',
+                                       container.getModifiedItemAttr('durationBonus') * level, **kwargs)
+
+
+class Effect2867(BaseEffect):
+    """
+    sentryDroneDamageBonus
+
+    Used by:
+    Modules named like: Sentry Damage Augmentor (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'damageMultiplier', module.getModifiedItemAttr('damageMultiplierBonus'),
+                                     stackingPenalties=True, **kwargs)
+
+
+class Effect2868(BaseEffect):
+    """
+    armorDamageAmountBonusCapitalArmorRepairers
+
+    Used by:
+    Modules named like: Auxiliary Nano Pump (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+                                      'armorDamageAmount', implant.getModifiedItemAttr('repairBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect2872(BaseEffect):
+    """
+    missileVelocityBonusDefender
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Defender Missiles DM (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+                                        'maxVelocity', container.getModifiedItemAttr('missileVelocityBonus'), **kwargs)
+
+
+class Effect2881(BaseEffect):
+    """
+    missileEMDmgBonusCruise3
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Cruise Missiles CM (6 of 6)
+    Implant: Festival-only 'Longbow' CM3 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2882(BaseEffect):
+    """
+    missileExplosiveDmgBonusCruise3
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Cruise Missiles CM (6 of 6)
+    Implant: Festival-only 'Longbow' CM3 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2883(BaseEffect):
+    """
+    missileKineticDmgBonusCruise3
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Cruise Missiles CM (6 of 6)
+    Implant: Festival-only 'Longbow' CM3 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2884(BaseEffect):
+    """
+    missileThermalDmgBonusCruise3
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Cruise Missiles CM (6 of 6)
+    Implant: Festival-only 'Longbow' CM3 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2885(BaseEffect):
+    """
+    gasHarvestingCycleTimeModulesRequiringGasCloudHarvesting
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Alchemist' Gas Harvesting GH (3 of 3)
+    Implants named like: ORE 'Harvester' Efficiency (2 of 2)
+    Implants named like: Serenity Limited 'Efficiency' Dose (3 of 3)
+    Implants named like: Serenity Poteque 'Prospector' Harvesting MC (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'),
+                                      'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect2887(BaseEffect):
+    """
+    missileEMDmgBonusRocket
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Rockets RD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' RD2 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2888(BaseEffect):
+    """
+    missileExplosiveDmgBonusRocket
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Rockets RD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' RD2 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2889(BaseEffect):
+    """
+    missileKineticDmgBonusRocket
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Rockets RD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' RD2 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2890(BaseEffect):
+    """
+    missileThermalDmgBonusRocket
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Rockets RD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' RD2 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2891(BaseEffect):
+    """
+    missileEMDmgBonusStandard
+
+    Used by:
+    Implants named like: Festival only 'Longbow' MD Dose (2 of 2)
+    Implants named like: Zainou 'Snapshot' Light Missiles LM (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2892(BaseEffect):
+    """
+    missileExplosiveDmgBonusStandard
+
+    Used by:
+    Implants named like: Festival only 'Longbow' MD Dose (2 of 2)
+    Implants named like: Zainou 'Snapshot' Light Missiles LM (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2893(BaseEffect):
+    """
+    missileKineticDmgBonusStandard
+
+    Used by:
+    Implants named like: Festival only 'Longbow' MD Dose (2 of 2)
+    Implants named like: Zainou 'Snapshot' Light Missiles LM (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2894(BaseEffect):
+    """
+    missileThermalDmgBonusStandard
+
+    Used by:
+    Implants named like: Festival only 'Longbow' MD Dose (2 of 2)
+    Implants named like: Zainou 'Snapshot' Light Missiles LM (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2899(BaseEffect):
+    """
+    missileEMDmgBonusHeavy
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Missiles HM (6 of 6)
+    Implant: Festival-only 'Longbow' HM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2900(BaseEffect):
+    """
+    missileExplosiveDmgBonusHeavy
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Missiles HM (6 of 6)
+    Implant: Festival-only 'Longbow' HM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2901(BaseEffect):
+    """
+    missileKineticDmgBonusHeavy
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Missiles HM (6 of 6)
+    Implant: Festival-only 'Longbow' HM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2902(BaseEffect):
+    """
+    missileThermalDmgBonusHeavy
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Missiles HM (6 of 6)
+    Implant: Festival-only 'Longbow' HM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2903(BaseEffect):
+    """
+    missileEMDmgBonusHAM
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Assault Missiles AM (6 of 6)
+    Implant: Festival-only 'Longbow' HAM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2904(BaseEffect):
+    """
+    missileExplosiveDmgBonusHAM
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Assault Missiles AM (6 of 6)
+    Implant: Festival-only 'Longbow' HAM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2905(BaseEffect):
+    """
+    missileKineticDmgBonusHAM
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Assault Missiles AM (6 of 6)
+    Implant: Festival-only 'Longbow' HAM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2906(BaseEffect):
+    """
+    missileThermalDmgBonusHAM
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Heavy Assault Missiles AM (6 of 6)
+    Implant: Festival-only 'Longbow' HAM4 Dose
+    Implant: Festival-only 'Longbow' MD6 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2907(BaseEffect):
+    """
+    missileEMDmgBonusTorpedo
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Torpedoes TD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' TP3 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2908(BaseEffect):
+    """
+    missileExplosiveDmgBonusTorpedo
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Torpedoes TD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' TP3 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2909(BaseEffect):
+    """
+    missileKineticDmgBonusTorpedo
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Torpedoes TD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' TP3 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2910(BaseEffect):
+    """
+    missileThermalDmgBonusTorpedo
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Torpedoes TD (6 of 6)
+    Implant: Festival-only 'Longbow' MD6 Dose
+    Implant: Festival-only 'Longbow' TP3 Dose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect2911(BaseEffect):
+    """
+    dataminerModuleDurationReduction
+
+    Used by:
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Data Miners',
+                                      'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect2967(BaseEffect):
+    """
+    skillTriageModuleConsumptionQuantityBonus
+
+    Used by:
+    Skill: Tactical Logistics Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+                                         'consumptionQuantity', amount * skill.level, **kwargs)
+
+
+class Effect2979(BaseEffect):
+    """
+    skillRemoteHullRepairSystemsCapNeedBonus
+
+    Used by:
+    Skill: Remote Hull Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Hull Repair Systems'),
+                                      'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
+
+
+class Effect2980(BaseEffect):
+    """
+    skillCapitalRemoteHullRepairSystemsCapNeedBonus
+
+    Used by:
+    Skill: Capital Remote Hull Repair Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Hull Repair Systems'),
+                                      'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
+
+
+class Effect2982(BaseEffect):
+    """
+    skillRemoteECMDurationBonus
+
+    Used by:
+    Skill: Burst Projector Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        # We need to make sure that the attribute exists, otherwise we add attributes that don't belong.  See #927
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation') and
+                                                  mod.item.getAttribute('duration'),
+                                      'duration',
+                                      skill.getModifiedItemAttr('projECMDurationBonus') * skill.level, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation') and
+                                                  mod.item.getAttribute('durationECMJammerBurstProjector'),
+                                      'durationECMJammerBurstProjector',
+                                      skill.getModifiedItemAttr('projECMDurationBonus') * skill.level, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation') and
+                                                  mod.item.getAttribute('durationTargetIlluminationBurstProjector'),
+                                      'durationTargetIlluminationBurstProjector',
+                                      skill.getModifiedItemAttr('projECMDurationBonus') * skill.level, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation') and
+                                                  mod.item.getAttribute('durationSensorDampeningBurstProjector'),
+                                      'durationSensorDampeningBurstProjector',
+                                      skill.getModifiedItemAttr('projECMDurationBonus') * skill.level, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation') and
+                                                  mod.item.getAttribute('durationWeaponDisruptionBurstProjector'),
+                                      'durationWeaponDisruptionBurstProjector',
+                                      skill.getModifiedItemAttr('projECMDurationBonus') * skill.level, **kwargs)
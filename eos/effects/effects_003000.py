@@ -0,0 +1,1417 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect3001(BaseEffect):
+    """
+    overloadRofBonus
+
+    Used by:
+    Modules from group: Missile Launcher Torpedo (22 of 22)
+    Items from market group: Ship Equipment > Turrets & Launchers (446 of 930)
+    Module: Interdiction Sphere Launcher I
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('speed', module.getModifiedItemAttr('overloadRofBonus'),
+                             stackingPenalties=True, penaltyGroup='postPerc', **kwargs)
+
+
+class Effect3002(BaseEffect):
+    """
+    overloadSelfDurationBonus
+
+    Used by:
+    Modules from group: Armor Resistance Shift Hardener (2 of 2)
+    Modules from group: Capacitor Booster (43 of 43)
+    Modules from group: Energy Neutralizer (57 of 57)
+    Modules from group: Energy Nosferatu (58 of 58)
+    Modules from group: Hull Repair Unit (25 of 25)
+    Modules from group: Remote Capacitor Transmitter (37 of 37)
+    Modules from group: Remote Hull Repairer (8 of 8)
+    Modules from group: Smart Bomb (137 of 137)
+    Modules from group: Warp Disrupt Field Generator (8 of 8)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('duration', module.getModifiedItemAttr('overloadSelfDurationBonus') or 0, **kwargs)
+
+
+class Effect3024(BaseEffect):
+    """
+    eliteBonusCoverOpsBombExplosiveDmg1
+
+    Used by:
+    Ship: Hound
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect3025(BaseEffect):
+    """
+    overloadSelfDamageBonus
+
+    Used by:
+    Modules from group: Energy Weapon (105 of 220)
+    Modules from group: Hybrid Weapon (107 of 223)
+    Modules from group: Precursor Weapon (19 of 19)
+    Modules from group: Projectile Weapon (101 of 167)
+    Modules named like: Pulse Laser (89 of 90)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('damageMultiplier', module.getModifiedItemAttr('overloadDamageModifier'), **kwargs)
+
+
+class Effect3026(BaseEffect):
+    """
+    eliteBonusCoverOpsBombKineticDmg1
+
+    Used by:
+    Ship: Manticore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                        'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect3027(BaseEffect):
+    """
+    eliteBonusCoverOpsBombThermalDmg1
+
+    Used by:
+    Ship: Nemesis
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                        'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect3028(BaseEffect):
+    """
+    eliteBonusCoverOpsBombEmDmg1
+
+    Used by:
+    Ship: Purifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                        'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect3029(BaseEffect):
+    """
+    overloadSelfEmHardeningBonus
+
+    Used by:
+    Variations of module: EM Armor Hardener I (37 of 37)
+    Variations of module: EM Shield Hardener I (20 of 20)
+    Module: Civilian EM Shield Hardener
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('emDamageResistanceBonus', module.getModifiedItemAttr('overloadHardeningBonus'), **kwargs)
+
+
+class Effect3030(BaseEffect):
+    """
+    overloadSelfThermalHardeningBonus
+
+    Used by:
+    Variations of module: Thermal Armor Hardener I (37 of 37)
+    Variations of module: Thermal Shield Hardener I (20 of 20)
+    Module: Civilian Thermal Shield Hardener
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('thermalDamageResistanceBonus', module.getModifiedItemAttr('overloadHardeningBonus'), **kwargs)
+
+
+class Effect3031(BaseEffect):
+    """
+    overloadSelfExplosiveHardeningBonus
+
+    Used by:
+    Variations of module: Explosive Armor Hardener I (37 of 37)
+    Variations of module: Explosive Shield Hardener I (20 of 20)
+    Module: Civilian Explosive Shield Hardener
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('explosiveDamageResistanceBonus', module.getModifiedItemAttr('overloadHardeningBonus'), **kwargs)
+
+
+class Effect3032(BaseEffect):
+    """
+    overloadSelfKineticHardeningBonus
+
+    Used by:
+    Variations of module: Kinetic Armor Hardener I (37 of 37)
+    Variations of module: Kinetic Shield Hardener I (20 of 20)
+    Module: Civilian Kinetic Shield Hardener
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('kineticDamageResistanceBonus', module.getModifiedItemAttr('overloadHardeningBonus'), **kwargs)
+
+
+class Effect3035(BaseEffect):
+    """
+    overloadSelfHardeningInvulnerabilityBonus
+
+    Used by:
+    Modules named like: Capital Flex Hardener (9 of 9)
+    Variations of module: Multispectrum Shield Hardener I (19 of 19)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            module.boostItemAttr('%sDamageResistanceBonus' % type,
+                                 module.getModifiedItemAttr('overloadHardeningBonus'), **kwargs)
+
+
+class Effect3036(BaseEffect):
+    """
+    skillBombDeploymentModuleReactivationDelayBonus
+
+    Used by:
+    Skill: Bomb Deployment
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Bomb',
+                                      'moduleReactivationDelay', skill.getModifiedItemAttr('reactivationDelayBonus') * skill.level, **kwargs)
+
+
+class Effect3046(BaseEffect):
+    """
+    modifyMaxVelocityOfShipPassive
+
+    Used by:
+    Modules from group: Expanded Cargohold (7 of 7)
+    """
+
+    type = 'offline'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('maxVelocity', module.getModifiedItemAttr('maxVelocityModifier'), stackingPenalties=True, **kwargs)
+
+
+class Effect3047(BaseEffect):
+    """
+    structureHPMultiplyPassive
+
+    Used by:
+    Modules from group: Expanded Cargohold (7 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('hp', module.getModifiedItemAttr('structureHPMultiplier'), **kwargs)
+
+
+class Effect3061(BaseEffect):
+    """
+    heatDamageBonus
+
+    Used by:
+    Modules from group: Shield Boost Amplifier (23 of 23)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'heatDamage', module.getModifiedItemAttr('heatDamageBonus'), **kwargs)
+
+
+class Effect3169(BaseEffect):
+    """
+    shieldTransportCpuNeedBonusEffect
+
+    Used by:
+    Ships from group: Logistics (3 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'cpu',
+                                      src.getModifiedItemAttr('shieldTransportCpuNeedBonus'), **kwargs)
+
+
+class Effect3172(BaseEffect):
+    """
+    droneArmorDamageBonusEffect
+
+    Used by:
+    Ships from group: Logistics (6 of 7)
+    Ship: Exequror
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # This is actually level-less bonus, anyway you have to train cruisers 5
+        # and will get 100% (20%/lvl as stated by description)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+                                     'armorDamageAmount', ship.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
+
+
+class Effect3173(BaseEffect):
+    """
+    droneShieldBonusBonusEffect
+
+    Used by:
+    Ships from group: Logistics (6 of 7)
+    Ship: Exequror
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # This is actually level-less bonus, anyway you have to train cruisers 5
+        # and will get 100% (20%/lvl as stated by description)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+                                     'shieldBonus', ship.getModifiedItemAttr('droneShieldBonusBonus'), **kwargs)
+
+
+class Effect3174(BaseEffect):
+    """
+    overloadSelfRangeBonus
+
+    Used by:
+    Modules from group: Stasis Grappler (8 of 8)
+    Modules from group: Stasis Web (19 of 19)
+    Modules from group: Warp Scrambler (56 of 57)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxRange', module.getModifiedItemAttr('overloadRangeBonus'),
+                             stackingPenalties=True, **kwargs)
+
+
+class Effect3175(BaseEffect):
+    """
+    overloadSelfSpeedBonus
+
+    Used by:
+    Modules from group: Propulsion Module (147 of 147)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('speedFactor', module.getModifiedItemAttr('overloadSpeedFactorBonus'),
+                             stackingPenalties=True, **kwargs)
+
+
+class Effect3182(BaseEffect):
+    """
+    overloadSelfECMStrenghtBonus
+
+    Used by:
+    Modules from group: Burst Jammer (11 of 11)
+    Modules from group: ECM (43 of 43)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            module.boostItemAttr('scan{0}StrengthBonus'.format(scanType),
+                                 module.getModifiedItemAttr('overloadECMStrengthBonus'),
+                                 stackingPenalties=True, **kwargs)
+
+
+class Effect3196(BaseEffect):
+    """
+    thermodynamicsSkillDamageBonus
+
+    Used by:
+    Implants named like: Wightstorm Sunyata Booster (4 of 4)
+    Skill: Thermodynamics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(
+            lambda mod: 'heatDamage' in mod.item.attributes, 'heatDamage',
+            container.getModifiedItemAttr('thermodynamicsHeatDamage') * level, **kwargs)
+
+
+class Effect3200(BaseEffect):
+    """
+    overloadSelfArmorDamageAmountDurationBonus
+
+    Used by:
+    Modules from group: Ancillary Armor Repairer (12 of 12)
+    Modules from group: Armor Repair Unit (105 of 105)
+    Modules from group: Remote Armor Repairer (43 of 43)
+    Modules named like: Remote Armor Repairer (52 of 52)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('duration', module.getModifiedItemAttr('overloadSelfDurationBonus'))
+        module.boostItemAttr('armorDamageAmount', module.getModifiedItemAttr('overloadArmorDamageAmount'),
+                             stackingPenalties=True, **kwargs)
+
+
+class Effect3201(BaseEffect):
+    """
+    overloadSelfShieldBonusDurationBonus
+
+    Used by:
+    Modules from group: Ancillary Remote Shield Booster (4 of 4)
+    Modules from group: Ancillary Shield Booster (14 of 14)
+    Modules from group: Remote Shield Booster (42 of 42)
+    Modules from group: Shield Booster (94 of 94)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('duration', module.getModifiedItemAttr('overloadSelfDurationBonus'))
+        module.boostItemAttr('shieldBonus', module.getModifiedItemAttr('overloadShieldBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect3212(BaseEffect):
+    """
+    missileSkillFoFAoeCloudSizeBonus
+
+    Used by:
+    Implants named like: Zainou 'Snapshot' Auto Targeting Explosion Radius FR (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Auto-Targeting Missiles'),
+                                        'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level, **kwargs)
+
+
+class Effect3234(BaseEffect):
+    """
+    shipRocketExplosiveDmgAF
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusAF'),
+                                        skill='Amarr Frigate', **kwargs)
+
+
+class Effect3235(BaseEffect):
+    """
+    shipRocketKineticDmgAF
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusAF'),
+                                        skill='Amarr Frigate', **kwargs)
+
+
+class Effect3236(BaseEffect):
+    """
+    shipRocketThermalDmgAF
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusAF'),
+                                        skill='Amarr Frigate', **kwargs)
+
+
+class Effect3237(BaseEffect):
+    """
+    shipRocketEmDmgAF
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusAF'),
+                                        skill='Amarr Frigate', **kwargs)
+
+
+class Effect3241(BaseEffect):
+    """
+    eliteBonusGunshipArmorEmResistance1
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                               skill='Assault Frigates', **kwargs)
+
+
+class Effect3242(BaseEffect):
+    """
+    eliteBonusGunshipArmorThermalResistance1
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                               skill='Assault Frigates', **kwargs)
+
+
+class Effect3243(BaseEffect):
+    """
+    eliteBonusGunshipArmorKineticResistance1
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                               skill='Assault Frigates', **kwargs)
+
+
+class Effect3244(BaseEffect):
+    """
+    eliteBonusGunshipArmorExplosiveResistance1
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                               skill='Assault Frigates', **kwargs)
+
+
+class Effect3264(BaseEffect):
+    """
+    skillCapitalIndustrialReconfigurationConsumptionQuantityBonus
+
+    Used by:
+    Skill: Capital Industrial Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+                                         'consumptionQuantity', amount * skill.level, **kwargs)
+
+
+class Effect3267(BaseEffect):
+    """
+    shipConsumptionQuantityBonusIndustrialReconfigurationORECapital1
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'),
+                                      'consumptionQuantity', ship.getModifiedItemAttr('shipBonusORECapital1'),
+                                      skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect3297(BaseEffect):
+    """
+    shipEnergyNeutralizerTransferAmountBonusAB
+
+    Used by:
+    Ship: Bhaalgorn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAB'),
+                                      skill='Amarr Battleship', **kwargs)
+
+
+class Effect3298(BaseEffect):
+    """
+    shipEnergyNeutralizerTransferAmountBonusAC
+
+    Used by:
+    Ship: Ashimmu
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAC'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect3299(BaseEffect):
+    """
+    shipEnergyNeutralizerTransferAmountBonusAF
+
+    Used by:
+    Ship: Caedes
+    Ship: Cruor
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect3313(BaseEffect):
+    """
+    cloneVatMaxJumpCloneBonusSkillNew
+
+    Used by:
+    Skill: Cloning Facility Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxJumpClones', skill.getModifiedItemAttr('maxJumpClonesBonus') * skill.level, **kwargs)
+
+
+class Effect3331(BaseEffect):
+    """
+    eliteBonusCommandShipArmorHP1
+
+    Used by:
+    Ship: Damnation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
+
+
+class Effect3335(BaseEffect):
+    """
+    shipArmorEmResistanceMC2
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3336(BaseEffect):
+    """
+    shipArmorExplosiveResistanceMC2
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusMC2'),
+                               skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3339(BaseEffect):
+    """
+    shipArmorKineticResistanceMC2
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusMC2'),
+                               skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3340(BaseEffect):
+    """
+    shipArmorThermalResistanceMC2
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusMC2'),
+                               skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3343(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorsProjectileFalloff1
+
+    Used by:
+    Ship: Broadsword
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
+                                      skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect3355(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorHeavyMissileVelocityBonus1
+
+    Used by:
+    Ship: Onyx
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
+                                        skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect3356(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorHeavyAssaultMissileVelocityBonus
+
+    Used by:
+    Ship: Onyx
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
+                                        skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect3366(BaseEffect):
+    """
+    shipRemoteSensorDampenerCapNeedGF
+
+    Used by:
+    Ship: Keres
+    Ship: Maulus
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect3367(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipWarpScramblerMaxRange1
+
+    Used by:
+    Ship: Keres
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3369(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipECMOptimalRange1
+
+    Used by:
+    Ship: Kitsune
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3370(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipStasisWebMaxRange1
+
+    Used by:
+    Ship: Hyena
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3371(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipWarpScramblerCapNeed2
+
+    Used by:
+    Ship: Keres
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'capacitorNeed', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3374(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipSignatureRadius2
+
+    Used by:
+    Ship: Hyena
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
+                               skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3379(BaseEffect):
+    """
+    implantHardwiringABcapacitorNeed
+
+    Used by:
+    Implants named like: Eifyr and Co. 'Rogue' Fuel Conservation FC (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'capacitorNeed', implant.getModifiedItemAttr('capNeedBonus'), **kwargs)
+
+
+class Effect3380(BaseEffect):
+    """
+    warpDisruptSphere
+
+    Used by:
+    Modules from group: Warp Disrupt Field Generator (8 of 8)
+    """
+
+    runTime = 'early'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' in context:
+            if module.charge is None:
+                return
+            if module.getModifiedItemAttr('warpScrambleRange', 0) < (projectionRange or 0):
+                return
+            if module.charge.ID in (29003, 45010):
+                fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
+            if module.charge.ID == 45010:
+                fit.modules.filteredItemIncrease(
+                    lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+                    'activationBlocked', 1, **kwargs)
+        else:
+            fit.ship.forceItemAttr('disallowAssistance', 1, **kwargs)
+            if module.charge is not None:
+                return
+            fit.ship.boostItemAttr('mass', module.getModifiedItemAttr('massBonusPercentage'), **kwargs)
+            fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'), **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                          'speedBoostFactor', module.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'speedFactor', module.getModifiedItemAttr('speedFactorBonus'), **kwargs)
+
+
+class Effect3392(BaseEffect):
+    """
+    eliteBonusBlackOpsLargeEnergyTurretTracking1
+
+    Used by:
+    Ship: Redeemer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
+
+
+class Effect3415(BaseEffect):
+    """
+    eliteBonusViolatorsLargeEnergyTurretDamageRole1
+
+    Used by:
+    Ship: Paladin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect3416(BaseEffect):
+    """
+    eliteBonusViolatorsLargeHybridTurretDamageRole1
+
+    Used by:
+    Ship: Kronos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect3417(BaseEffect):
+    """
+    eliteBonusViolatorsLargeProjectileTurretDamageRole1
+
+    Used by:
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect3424(BaseEffect):
+    """
+    eliteBonusViolatorsLargeHybridTurretTracking1
+
+    Used by:
+    Ship: Kronos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
+
+
+class Effect3425(BaseEffect):
+    """
+    eliteBonusViolatorsLargeProjectileTurretTracking1
+
+    Used by:
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
+
+
+class Effect3427(BaseEffect):
+    """
+    eliteBonusViolatorsTractorBeamMaxRangeRole2
+
+    Used by:
+    Ships from group: Marauder (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusViolatorsRole2'), **kwargs)
+
+
+class Effect3439(BaseEffect):
+    """
+    eliteBonusViolatorsEwTargetPainting1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusViolators1'),
+                                      skill='Marauders', **kwargs)
+
+
+class Effect3447(BaseEffect):
+    """
+    shipBonusPTFalloffMB1
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect3466(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipRechargeRate2
+
+    Used by:
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('rechargeRate', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
+                               skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3467(BaseEffect):
+    """
+    eliteBonusElectronicAttackShipCapacitorCapacity2
+
+    Used by:
+    Ship: Kitsune
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacitorCapacity', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
+                               skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect3468(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorsWarpDisruptFieldGeneratorWarpScrambleRange2
+
+    Used by:
+    Ships from group: Heavy Interdiction Cruiser (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+                                      'warpScrambleRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors2'),
+                                      skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect3473(BaseEffect):
+    """
+    eliteBonusViolatorsTractorBeamMaxTractorVelocityRole3
+
+    Used by:
+    Ships from group: Marauder (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+                                      'maxTractorVelocity', ship.getModifiedItemAttr('eliteBonusViolatorsRole3'), **kwargs)
+
+
+class Effect3478(BaseEffect):
+    """
+    shipLaserDamagePirateBattleship
+
+    Used by:
+    Ship: Bhaalgorn
+    Ship: Nightmare
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect3480(BaseEffect):
+    """
+    shipTrackingBonusAB
+
+    Used by:
+    Ship: Nightmare
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect3483(BaseEffect):
+    """
+    shipBonusMediumEnergyTurretDamagePirateFaction
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Ashimmu
+    Ship: Fiend
+    Ship: Gnosis
+    Ship: Phantasm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect3484(BaseEffect):
+    """
+    shipBonusMediumEnergyTurretTrackingAC2
+
+    Used by:
+    Ship: Fiend
+    Ship: Phantasm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect3487(BaseEffect):
+    """
+    shipBonusSmallEnergyTurretDamagePirateFaction
+
+    Used by:
+    Ship: Caedes
+    Ship: Confessor
+    Ship: Cruor
+    Ship: Imp
+    Ship: Metamorphosis
+    Ship: Succubus
+    Ship: Sunesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect3489(BaseEffect):
+    """
+    shipBonusSmallEnergyTurretTracking2AF
+
+    Used by:
+    Ship: Imp
+    Ship: Succubus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect3493(BaseEffect):
+    """
+    rorqualCargoScanRangeBonus
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cargo Scanner',
+                                      'cargoScanRange', ship.getModifiedItemAttr('cargoScannerRangeBonus'), **kwargs)
+
+
+class Effect3495(BaseEffect):
+    """
+    shipCapPropulsionJamming
+
+    Used by:
+    Ships from group: Interceptor (10 of 10)
+    Ship: Atron
+    Ship: Condor
+    Ship: Executioner
+    Ship: Slasher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        groups = ('Stasis Web', 'Warp Scrambler')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'capacitorNeed', ship.getModifiedItemAttr('eliteBonusInterceptorRole'), **kwargs)
+
+
+class Effect3496(BaseEffect):
+    """
+    setBonusThukker
+
+    Used by:
+    Implants named like: grade Nomad (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'agilityBonus', implant.getModifiedItemAttr('implantSetThukker'), **kwargs)
+
+
+class Effect3498(BaseEffect):
+    """
+    setBonusSisters
+
+    Used by:
+    Implants named like: grade Virtue (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'scanStrengthBonus', implant.getModifiedItemAttr('implantSetSisters'), **kwargs)
+
+
+class Effect3499(BaseEffect):
+    """
+    setBonusSyndicate
+
+    Used by:
+    Implants named like: grade Edge (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'boosterAttributeModifier',
+                                                 implant.getModifiedItemAttr('implantSetSyndicate'), **kwargs)
@@ -0,0 +1,1792 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect3513(BaseEffect):
+    """
+    setBonusMordus
+
+    Used by:
+    Implants named like: grade Centurion (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'rangeSkillBonus', implant.getModifiedItemAttr('implantSetMordus'), **kwargs)
+
+
+class Effect3514(BaseEffect):
+    """
+    Interceptor2WarpScrambleRange
+
+    Used by:
+    Ships from group: Interceptor (6 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusInterceptor2'), skill='Interceptors', **kwargs)
+
+
+class Effect3519(BaseEffect):
+    """
+    weaponUpgradesCpuNeedBonusPostPercentCpuLocationShipModulesRequiringBombLauncher
+
+    Used by:
+    Skill: Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+                                      'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
+
+
+class Effect3520(BaseEffect):
+    """
+    skillAdvancedWeaponUpgradesPowerNeedBonusBombLaunchers
+
+    Used by:
+    Skill: Advanced Weapon Upgrades
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+                                      'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level, **kwargs)
+
+
+class Effect3526(BaseEffect):
+    """
+    cynosuralTheoryConsumptionBonus
+
+    Used by:
+    Ships from group: Force Recon Ship (9 of 10)
+    Ships named like: Venture (2 of 2)
+    Skill: Cynosural Field Theory
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+                                      'consumptionQuantity',
+                                      container.getModifiedItemAttr('consumptionQuantityBonusPercentage') * level, **kwargs)
+
+
+class Effect3532(BaseEffect):
+    """
+    skillJumpDriveConsumptionAmountBonusPercentage
+
+    Used by:
+    Skill: Jump Fuel Conservation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('jumpDriveConsumptionAmount',
+                               skill.getModifiedItemAttr('consumptionQuantityBonusPercentage') * skill.level, **kwargs)
+
+
+class Effect3561(BaseEffect):
+    """
+    ewSkillTrackingDisruptionTrackingSpeedBonus
+
+    Used by:
+    Modules named like: Tracking Diagnostic Subroutines (8 of 8)
+    Skill: Weapon Destabilization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+                                      'trackingSpeedBonus',
+                                      container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
+
+
+class Effect3568(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkMaxRangeBonus1
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect3569(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkMaxRangeBonus2
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect3570(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkTrackingSpeedBonus2
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect3571(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkTrackingSpeedBonus1
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect3586(BaseEffect):
+    """
+    ewSkillSignalSuppressionScanResolutionBonus
+
+    Used by:
+    Modules named like: Inverted Signal Field Projector (8 of 8)
+    Skill: Signal Suppression
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context else True
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'scanResolutionBonus',
+                                      container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
+                                      stackingPenalties=penalized, **kwargs)
+
+
+class Effect3587(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerMaxTargetRangeBonusGC2
+
+    Used by:
+    Variations of ship: Celestis (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect3588(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerMaxTargetRangeBonusGF2
+
+    Used by:
+    Ship: Keres
+    Ship: Maulus
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect3589(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerScanResolutionBonusGF2
+
+    Used by:
+    Ship: Keres
+    Ship: Maulus
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect3590(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerScanResolutionBonusGC2
+
+    Used by:
+    Variations of ship: Celestis (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect3591(BaseEffect):
+    """
+    ewSkillSignalSuppressionMaxTargetRangeBonus
+
+    Used by:
+    Modules named like: Inverted Signal Field Projector (8 of 8)
+    Skill: Signal Suppression
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxTargetRangeBonus',
+                                      container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
+
+
+class Effect3592(BaseEffect):
+    """
+    eliteBonusJumpFreighterHullHP1
+
+    Used by:
+    Ships from group: Jump Freighter (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('hp', ship.getModifiedItemAttr('eliteBonusJumpFreighter1'), skill='Jump Freighters', **kwargs)
+
+
+class Effect3593(BaseEffect):
+    """
+    eliteBonusJumpFreighterJumpDriveConsumptionAmount2
+
+    Used by:
+    Ships from group: Jump Freighter (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('jumpDriveConsumptionAmount', ship.getModifiedItemAttr('eliteBonusJumpFreighter2'),
+                               skill='Jump Freighters', **kwargs)
+
+
+class Effect3597(BaseEffect):
+    """
+    scriptSensorBoosterScanResolutionBonusBonus
+
+    Used by:
+    Charges from group: Sensor Booster Script (3 of 3)
+    Charges from group: Sensor Dampener Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('scanResolutionBonus', module.getModifiedChargeAttr('scanResolutionBonusBonus'), **kwargs)
+
+
+class Effect3598(BaseEffect):
+    """
+    scriptSensorBoosterMaxTargetRangeBonusBonus
+
+    Used by:
+    Charges from group: Sensor Booster Script (3 of 3)
+    Charges from group: Sensor Dampener Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxTargetRangeBonus', module.getModifiedChargeAttr('maxTargetRangeBonusBonus'), **kwargs)
+
+
+class Effect3599(BaseEffect):
+    """
+    scriptTrackingComputerTrackingSpeedBonusBonus
+
+    Used by:
+    Charges from group: Tracking Disruption Script (2 of 2)
+    Charges from group: Tracking Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('trackingSpeedBonus', module.getModifiedChargeAttr('trackingSpeedBonusBonus'), **kwargs)
+
+
+class Effect3600(BaseEffect):
+    """
+    scriptTrackingComputerMaxRangeBonusBonus
+
+    Used by:
+    Charges from group: Tracking Disruption Script (2 of 2)
+    Charges from group: Tracking Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxRangeBonus', module.getModifiedChargeAttr('maxRangeBonusBonus'), **kwargs)
+
+
+class Effect3601(BaseEffect):
+    """
+    scriptWarpDisruptionFieldGeneratorSetDisallowInEmpireandHazardSpace
+
+    Used by:
+    Charges from group: Warp Disruption Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.forceItemAttr('disallowInEmpireSpace', module.getModifiedChargeAttr('disallowInEmpireSpace'), **kwargs)
+        module.forceItemAttr('disallowInHazardSystem', module.getModifiedChargeAttr('disallowInHazardSystem'), **kwargs)
+
+
+class Effect3602(BaseEffect):
+    """
+    scriptDurationBonus
+
+    Used by:
+    Charges from group: Warp Disruption Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('duration', module.getModifiedChargeAttr('durationBonus'), **kwargs)
+
+
+class Effect3617(BaseEffect):
+    """
+    scriptSignatureRadiusBonusBonus
+
+    Used by:
+    Charges from group: Warp Disruption Script (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('signatureRadiusBonus', module.getModifiedChargeAttr('signatureRadiusBonusBonus'), **kwargs)
+
+
+class Effect3648(BaseEffect):
+    """
+    scriptWarpScrambleRangeBonus
+
+    Used by:
+    Charges from group: Warp Disruption Script (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('warpScrambleRange', module.getModifiedChargeAttr('warpScrambleRangeBonus'), **kwargs)
+
+
+class Effect3649(BaseEffect):
+    """
+    eliteBonusViolatorsLargeEnergyTurretDamage1
+
+    Used by:
+    Ship: Paladin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolators1'),
+                                      skill='Marauders', **kwargs)
+
+
+class Effect3650(BaseEffect):
+    """
+    ewGroupRsdMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Centurion (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - EW Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+
+
+class Effect3651(BaseEffect):
+    """
+    ewGroupTpMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Centurion (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - EW Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+
+
+class Effect3652(BaseEffect):
+    """
+    ewGroupTdMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Centurion (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - EW Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+                                      'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+
+
+class Effect3653(BaseEffect):
+    """
+    ewGroupEcmBurstMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Centurion (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - EW Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Projectors',
+                                      'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+
+
+class Effect3655(BaseEffect):
+    """
+    gunneryMaxRangeBonusOnline
+
+    Used by:
+    Modules from group: Tracking Enhancer (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect3656(BaseEffect):
+    """
+    gunneryTrackingSpeedBonusOnline
+
+    Used by:
+    Modules from group: Tracking Enhancer (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect3657(BaseEffect):
+    """
+    shipScanResolutionBonusOnline
+
+    Used by:
+    Modules from group: Signal Amplifier (7 of 7)
+    Structure Modules from group: Structure Signal Amplifier (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3659(BaseEffect):
+    """
+    shipMaxTargetRangeBonusOnline
+
+    Used by:
+    Modules from group: Signal Amplifier (7 of 7)
+    Structure Modules from group: Structure Signal Amplifier (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3660(BaseEffect):
+    """
+    shipMaxLockedTargetsBonusAddOnline
+
+    Used by:
+    Modules from group: Signal Amplifier (7 of 7)
+    Structure Modules from group: Structure Signal Amplifier (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('maxLockedTargets', module.getModifiedItemAttr('maxLockedTargetsBonus'), **kwargs)
+
+
+class Effect3668(BaseEffect):
+    """
+    miningLaserRangeBonus
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: grade Harvest (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - Mining Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+                                      'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect3669(BaseEffect):
+    """
+    frequencyMiningLaserMaxRangeBonus
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: grade Harvest (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - Mining Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Frequency Mining Laser',
+                                      'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect3670(BaseEffect):
+    """
+    stripMinerMaxRangeBonus
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: grade Harvest (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - Mining Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+                                      'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect3671(BaseEffect):
+    """
+    gasHarvesterMaxRangeBonus
+
+    Used by:
+    Implants named like: grade Harvest (10 of 12)
+    Implant: Serenity YC122.9 Season Booster - Mining Range
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Scoops',
+                                      'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect3672(BaseEffect):
+    """
+    setBonusOre
+
+    Used by:
+    Implants named like: grade Harvest (12 of 12)
+    Implant: Serenity YC122.9 Season Booster - Mining Range
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'maxRangeBonus', implant.getModifiedItemAttr('implantSetORE'), **kwargs)
+
+
+class Effect3674(BaseEffect):
+    """
+    jumpPortalGenerationBO
+
+    Used by:
+    Module: Covert Jump Portal Generator I
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect3677(BaseEffect):
+    """
+    shipBonusLargeEnergyTurretMaxRangeAB2
+
+    Used by:
+    Ship: Apocalypse
+    Ship: Apocalypse Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect3678(BaseEffect):
+    """
+    eliteBonusJumpFreighterShieldHP1
+
+    Used by:
+    Ship: Nomad
+    Ship: Rhea
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', ship.getModifiedItemAttr('eliteBonusJumpFreighter1'),
+                               skill='Jump Freighters', **kwargs)
+
+
+class Effect3679(BaseEffect):
+    """
+    eliteBonusJumpFreighterArmorHP1
+
+    Used by:
+    Ship: Anshar
+    Ship: Ark
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', ship.getModifiedItemAttr('eliteBonusJumpFreighter1'), skill='Jump Freighters', **kwargs)
+
+
+class Effect3680(BaseEffect):
+    """
+    freighterAgilityBonusC1
+
+    Used by:
+    Ship: Rhea
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('freighterBonusC1'), skill='Caldari Freighter', **kwargs)
+
+
+class Effect3681(BaseEffect):
+    """
+    freighterAgilityBonusM1
+
+    Used by:
+    Ship: Nomad
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('freighterBonusM1'), skill='Minmatar Freighter', **kwargs)
+
+
+class Effect3682(BaseEffect):
+    """
+    freighterAgilityBonusG1
+
+    Used by:
+    Ship: Anshar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('freighterBonusG1'), skill='Gallente Freighter', **kwargs)
+
+
+class Effect3683(BaseEffect):
+    """
+    freighterAgilityBonusA1
+
+    Used by:
+    Ship: Ark
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('freighterBonusA1'), skill='Amarr Freighter', **kwargs)
+
+
+class Effect3686(BaseEffect):
+    """
+    scriptTrackingComputerFalloffBonusBonus
+
+    Used by:
+    Charges from group: Tracking Disruption Script (2 of 2)
+    Charges from group: Tracking Script (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('falloffBonus', module.getModifiedChargeAttr('falloffBonusBonus'), **kwargs)
+
+
+class Effect3703(BaseEffect):
+    """
+    shipMissileLauncherSpeedBonusMC2
+
+    Used by:
+    Ship: Bellicose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3705(BaseEffect):
+    """
+    shipHybridTurretROFBonusGC2
+
+    Used by:
+    Ship: Phobos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect3706(BaseEffect):
+    """
+    shipBonusProjectileTrackingMC2
+
+    Used by:
+    Ship: Rupture
+    Ship: Stabber Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect3726(BaseEffect):
+    """
+    agilityMultiplierEffectPassive
+
+    Used by:
+    Modules named like: Polycarbon Engine Housing (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', module.getModifiedItemAttr('agilityBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect3727(BaseEffect):
+    """
+    velocityBonusPassive
+
+    Used by:
+    Modules named like: Polycarbon Engine Housing (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('implantBonusVelocity'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3739(BaseEffect):
+    """
+    zColinOrcaTractorRangeBonus
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Outrider
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxRange',
+                                      src.getModifiedItemAttr('roleBonusTractorBeamRange'), **kwargs)
+
+
+class Effect3740(BaseEffect):
+    """
+    zColinOrcaTractorVelocityBonus
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Outrider
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxTractorVelocity',
+                                      ship.getModifiedItemAttr('roleBonusTractorBeamVelocity'), **kwargs)
+
+
+class Effect3744(BaseEffect):
+    """
+    miningForemanBurstBonusICS2
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+                                      src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+                                      src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+                                      src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+                                      src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+                                      src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
+
+
+class Effect3765(BaseEffect):
+    """
+    covertOpsStealthBomberSiegeMissileLauncherPowerNeedBonus
+
+    Used by:
+    Ships from group: Stealth Bomber (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+                                         'power', ship.getModifiedItemAttr('stealthBomberLauncherPower'), **kwargs)
+
+
+class Effect3766(BaseEffect):
+    """
+    interceptorMWDSignatureRadiusBonus
+
+    Used by:
+    Ships from group: Interceptor (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterceptor'),
+                                      skill='Interceptors', **kwargs)
+
+
+class Effect3771(BaseEffect):
+    """
+    armorHPBonusAddPassive
+
+    Used by:
+    Subsystems from group: Defensive Subsystem (9 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('armorHP', module.getModifiedItemAttr('armorHPBonusAdd') or 0, **kwargs)
+
+
+class Effect3773(BaseEffect):
+    """
+    hardPointModifierEffect
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('turretSlotsLeft', module.getModifiedItemAttr('turretHardPointModifier'), **kwargs)
+        fit.ship.increaseItemAttr('launcherSlotsLeft', module.getModifiedItemAttr('launcherHardPointModifier'), **kwargs)
+
+
+class Effect3774(BaseEffect):
+    """
+    slotModifier
+
+    Used by:
+    Items from category: Subsystem (48 of 48)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('hiSlots', module.getModifiedItemAttr('hiSlotModifier'), **kwargs)
+        fit.ship.increaseItemAttr('medSlots', module.getModifiedItemAttr('medSlotModifier'), **kwargs)
+        fit.ship.increaseItemAttr('lowSlots', module.getModifiedItemAttr('lowSlotModifier'), **kwargs)
+
+
+class Effect3782(BaseEffect):
+    """
+    powerOutputAddPassive
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('powerOutput', module.getModifiedItemAttr('powerOutput'), **kwargs)
+
+
+class Effect3783(BaseEffect):
+    """
+    cpuOutputAddCpuOutputPassive
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (8 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('cpuOutput', module.getModifiedItemAttr('cpuOutput'), **kwargs)
+
+
+class Effect3797(BaseEffect):
+    """
+    droneBandwidthAddPassive
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('droneBandwidth', module.getModifiedItemAttr('droneBandwidth'), **kwargs)
+
+
+class Effect3799(BaseEffect):
+    """
+    droneCapacityAdddroneCapacityPassive
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('droneCapacity', module.getModifiedItemAttr('droneCapacity'), **kwargs)
+
+
+class Effect3807(BaseEffect):
+    """
+    maxTargetRangeAddPassive
+
+    Used by:
+    Subsystems named like: Propulsion Interdiction Nullifier (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRange'), **kwargs)
+
+
+class Effect3808(BaseEffect):
+    """
+    signatureRadiusAddPassive
+
+    Used by:
+    Subsystems from group: Defensive Subsystem (8 of 12)
+    Subsystems named like: Propulsion Interdiction Nullifier (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadius'), **kwargs)
+
+
+class Effect3810(BaseEffect):
+    """
+    capacityAddPassive
+
+    Used by:
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    Subsystem: Legion Defensive - Nanobot Injector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, subsystem, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('capacity', subsystem.getModifiedItemAttr('cargoCapacityAdd') or 0, **kwargs)
+
+
+class Effect3811(BaseEffect):
+    """
+    capacitorCapacityAddPassive
+
+    Used by:
+    Items from category: Subsystem (20 of 48)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('capacitorCapacity', module.getModifiedItemAttr('capacitorCapacity') or 0, **kwargs)
+
+
+class Effect3831(BaseEffect):
+    """
+    shieldCapacityAddPassive
+
+    Used by:
+    Subsystems from group: Defensive Subsystem (8 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('shieldCapacity', module.getModifiedItemAttr('shieldCapacity'), **kwargs)
+
+
+class Effect3857(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsionMaxVelocity
+
+    Used by:
+    Subsystem: Legion Propulsion - Intercalated Nanofibers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('subsystemBonusAmarrPropulsion'),
+                               skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect3859(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsionMaxVelocity
+
+    Used by:
+    Subsystem: Tengu Propulsion - Chassis Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
+                               skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect3860(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsionMaxVelocity
+
+    Used by:
+    Subsystem: Loki Propulsion - Intercalated Nanofibers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
+                               skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect3861(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsionAfterburnerSpeedFactor
+
+    Used by:
+    Subsystem: Loki Propulsion - Wake Limiter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
+                                      skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect3863(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsionAfterburnerSpeedFactor
+
+    Used by:
+    Subsystem: Tengu Propulsion - Fuel Catalyst
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
+                                      skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect3864(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsionAfterburnerSpeedFactor
+
+    Used by:
+    Subsystem: Legion Propulsion - Wake Limiter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('subsystemBonusAmarrPropulsion'),
+                                      skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect3865(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsion2Agility
+
+    Used by:
+    Subsystem: Legion Propulsion - Intercalated Nanofibers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
+                               skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect3866(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsion2Agility
+
+    Used by:
+    Subsystem: Tengu Propulsion - Chassis Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
+                               skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect3867(BaseEffect):
+    """
+    subsystemBonusGallentePropulsion2Agility
+
+    Used by:
+    Subsystem: Proteus Propulsion - Hyperspatial Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
+                               skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect3868(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsion2Agility
+
+    Used by:
+    Subsystem: Loki Propulsion - Intercalated Nanofibers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
+                               skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect3869(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsion2MWDPenalty
+
+    Used by:
+    Subsystem: Loki Propulsion - Wake Limiter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
+                                      skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect3872(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsion2MWDPenalty
+
+    Used by:
+    Subsystem: Legion Propulsion - Wake Limiter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
+                                      skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect3875(BaseEffect):
+    """
+    subsystemBonusGallentePropulsionABMWDCapNeed
+
+    Used by:
+    Subsystem: Proteus Propulsion - Localized Injectors
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'capacitorNeed', module.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
+                                      skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect3893(BaseEffect):
+    """
+    subsystemBonusMinmatarCoreScanStrengthLADAR
+
+    Used by:
+    Subsystem: Loki Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanLadarStrength', src.getModifiedItemAttr('subsystemBonusMinmatarCore'),
+                               skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect3895(BaseEffect):
+    """
+    subsystemBonusGallenteCoreScanStrengthMagnetometric
+
+    Used by:
+    Subsystem: Proteus Core - Electronic Efficiency Gate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanMagnetometricStrength', src.getModifiedItemAttr('subsystemBonusGallenteCore'),
+                               skill='Gallente Core Systems', **kwargs)
+
+
+class Effect3897(BaseEffect):
+    """
+    subsystemBonusCaldariCoreScanStrengthGravimetric
+
+    Used by:
+    Subsystem: Tengu Core - Electronic Efficiency Gate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanGravimetricStrength', src.getModifiedItemAttr('subsystemBonusCaldariCore'), skill='Caldari Core Systems', **kwargs)
+
+
+class Effect3900(BaseEffect):
+    """
+    subsystemBonusAmarrCoreScanStrengthRADAR
+
+    Used by:
+    Subsystem: Legion Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanRadarStrength', src.getModifiedItemAttr('subsystemBonusAmarrCore'),
+                               skill='Amarr Core Systems', **kwargs)
+
+
+class Effect3959(BaseEffect):
+    """
+    subsystemBonusAmarrDefensiveArmorRepairAmount
+
+    Used by:
+    Subsystem: Legion Defensive - Covert Reconfiguration
+    Subsystem: Legion Defensive - Nanobot Injector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusAmarrDefensive'),
+                                      skill='Amarr Defensive Systems', **kwargs)
+
+
+class Effect3961(BaseEffect):
+    """
+    subsystemBonusGallenteDefensiveArmorRepairAmount
+
+    Used by:
+    Subsystem: Proteus Defensive - Covert Reconfiguration
+    Subsystem: Proteus Defensive - Nanobot Injector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusGallenteDefensive'),
+                                      skill='Gallente Defensive Systems', **kwargs)
+
+
+class Effect3962(BaseEffect):
+    """
+    subsystemBonusMinmatarDefensiveShieldArmorRepairAmount
+
+    Used by:
+    Subsystem: Loki Defensive - Adaptive Defense Node
+    Subsystem: Loki Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
+                                      skill='Minmatar Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
+                                      skill='Minmatar Defensive Systems', **kwargs)
+
+
+class Effect3964(BaseEffect):
+    """
+    subsystemBonusCaldariDefensiveShieldBoostAmount
+
+    Used by:
+    Subsystem: Tengu Defensive - Amplification Node
+    Subsystem: Tengu Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', module.getModifiedItemAttr('subsystemBonusCaldariDefensive'),
+                                      skill='Caldari Defensive Systems', **kwargs)
+
+
+class Effect3976(BaseEffect):
+    """
+    subsystemBonusCaldariDefensiveShieldHP
+
+    Used by:
+    Subsystem: Tengu Defensive - Supplemental Screening
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', module.getModifiedItemAttr('subsystemBonusCaldariDefensive'),
+                               skill='Caldari Defensive Systems', **kwargs)
+
+
+class Effect3979(BaseEffect):
+    """
+    subsystemBonusMinmatarDefensiveShieldArmorHP
+
+    Used by:
+    Subsystem: Loki Defensive - Augmented Durability
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
+                               skill='Minmatar Defensive Systems', **kwargs)
+        fit.ship.boostItemAttr('armorHP', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
+                               skill='Minmatar Defensive Systems', **kwargs)
+
+
+class Effect3980(BaseEffect):
+    """
+    subsystemBonusGallenteDefensiveArmorHP
+
+    Used by:
+    Subsystem: Proteus Defensive - Augmented Plating
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', module.getModifiedItemAttr('subsystemBonusGallenteDefensive'),
+                               skill='Gallente Defensive Systems', **kwargs)
+
+
+class Effect3982(BaseEffect):
+    """
+    subsystemBonusAmarrDefensiveArmorHP
+
+    Used by:
+    Subsystem: Legion Defensive - Augmented Plating
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', module.getModifiedItemAttr('subsystemBonusAmarrDefensive'),
+                               skill='Amarr Defensive Systems', **kwargs)
+
+
+class Effect3992(BaseEffect):
+    """
+    systemShieldHP
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestial: Republic Stellar Observatory
+    Celestial: State Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('shieldCapacity', beacon.getModifiedItemAttr('shieldCapacityMultiplier'), **kwargs)
+
+
+class Effect3993(BaseEffect):
+    """
+    systemTargetingRange
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    Celestial: Turnur Aftermath
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('maxTargetRange', beacon.getModifiedItemAttr('maxTargetRangeMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect3995(BaseEffect):
+    """
+    systemSignatureRadius
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('signatureRadius', beacon.getModifiedItemAttr('signatureRadiusMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect3996(BaseEffect):
+    """
+    systemArmorEmResistance
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestials named like: Incursion Effect (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', beacon.getModifiedItemAttr('armorEmDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3997(BaseEffect):
+    """
+    systemArmorExplosiveResistance
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestials named like: Incursion Effect (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance',
+                               beacon.getModifiedItemAttr('armorExplosiveDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3998(BaseEffect):
+    """
+    systemArmorKineticResistance
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestials named like: Incursion Effect (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance',
+                               beacon.getModifiedItemAttr('armorKineticDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect3999(BaseEffect):
+    """
+    systemArmorThermalResistance
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestials named like: Incursion Effect (2 of 2)
+    Celestials named like: Volatile Ice Storm (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance',
+                               beacon.getModifiedItemAttr('armorThermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
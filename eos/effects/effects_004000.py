@@ -0,0 +1,2671 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect4002(BaseEffect):
+    """
+    systemMissileVelocity
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'maxVelocity', beacon.getModifiedItemAttr('missileVelocityMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4003(BaseEffect):
+    """
+    systemMaxVelocity
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('maxVelocity', beacon.getModifiedItemAttr('maxVelocityMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4016(BaseEffect):
+    """
+    systemDamageMultiplierGunnery
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect4017(BaseEffect):
+    """
+    systemDamageThermalMissiles
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'thermalDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4018(BaseEffect):
+    """
+    systemDamageEmMissiles
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'emDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4019(BaseEffect):
+    """
+    systemDamageExplosiveMissiles
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'explosiveDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4020(BaseEffect):
+    """
+    systemDamageKineticMissiles
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'kineticDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4021(BaseEffect):
+    """
+    systemDamageDrones
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+                                        'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                        stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4022(BaseEffect):
+    """
+    systemTracking
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                         'trackingSpeed', module.getModifiedItemAttr('trackingSpeedMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4023(BaseEffect):
+    """
+    systemAoeVelocity
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4033(BaseEffect):
+    """
+    systemHeatDamage
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'heatDamage' in mod.itemModifiedAttributes,
+                                         'heatDamage', module.getModifiedItemAttr('heatDamageMultiplier'), **kwargs)
+
+
+class Effect4034(BaseEffect):
+    """
+    systemOverloadArmor
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadArmorDamageAmount' in mod.itemModifiedAttributes,
+                                         'overloadArmorDamageAmount', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4035(BaseEffect):
+    """
+    systemOverloadDamageModifier
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadDamageModifier' in mod.itemModifiedAttributes,
+                                         'overloadDamageModifier', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4036(BaseEffect):
+    """
+    systemOverloadDurationBonus
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadDurationBonus' in mod.itemModifiedAttributes,
+                                         'overloadDurationBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4037(BaseEffect):
+    """
+    systemOverloadEccmStrength
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadECCMStrenghtBonus' in mod.itemModifiedAttributes,
+                                         'overloadECCMStrenghtBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4038(BaseEffect):
+    """
+    systemOverloadEcmStrength
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadECMStrengthBonus' in mod.itemModifiedAttributes,
+                                         'overloadECMStrengthBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4039(BaseEffect):
+    """
+    systemOverloadHardening
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadHardeningBonus' in mod.itemModifiedAttributes,
+                                         'overloadHardeningBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4040(BaseEffect):
+    """
+    systemOverloadRange
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadRangeBonus' in mod.itemModifiedAttributes,
+                                         'overloadRangeBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4041(BaseEffect):
+    """
+    systemOverloadRof
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadRofBonus' in mod.itemModifiedAttributes,
+                                         'overloadRofBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4042(BaseEffect):
+    """
+    systemOverloadSelfDuration
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadSelfDurationBonus' in mod.itemModifiedAttributes,
+                                         'overloadSelfDurationBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4043(BaseEffect):
+    """
+    systemOverloadShieldBonus
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadShieldBonus' in mod.itemModifiedAttributes,
+                                         'overloadShieldBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4044(BaseEffect):
+    """
+    systemOverloadSpeedFactor
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: 'overloadSpeedFactorBonus' in mod.itemModifiedAttributes,
+                                         'overloadSpeedFactorBonus', module.getModifiedItemAttr('overloadBonusMultiplier'), **kwargs)
+
+
+class Effect4045(BaseEffect):
+    """
+    systemSmartBombRange
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                         'empFieldRange', module.getModifiedItemAttr('empFieldRangeMultiplier'), **kwargs)
+
+
+class Effect4046(BaseEffect):
+    """
+    systemSmartBombEmDamage
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                         'emDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
+
+
+class Effect4047(BaseEffect):
+    """
+    systemSmartBombThermalDamage
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                         'thermalDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
+
+
+class Effect4048(BaseEffect):
+    """
+    systemSmartBombKineticDamage
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                         'kineticDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
+
+
+class Effect4049(BaseEffect):
+    """
+    systemSmartBombExplosiveDamage
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                         'explosiveDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
+
+
+class Effect4054(BaseEffect):
+    """
+    systemSmallEnergyDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                         'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect4055(BaseEffect):
+    """
+    systemSmallProjectileDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                         'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect4056(BaseEffect):
+    """
+    systemSmallHybridDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                         'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect4057(BaseEffect):
+    """
+    systemRocketEmDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                           'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4058(BaseEffect):
+    """
+    systemRocketExplosiveDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                           'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4059(BaseEffect):
+    """
+    systemRocketKineticDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                           'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4060(BaseEffect):
+    """
+    systemRocketThermalDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                           'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4061(BaseEffect):
+    """
+    systemStandardMissileThermalDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                           'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4062(BaseEffect):
+    """
+    systemStandardMissileEmDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                           'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4063(BaseEffect):
+    """
+    systemStandardMissileExplosiveDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                           'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4086(BaseEffect):
+    """
+    systemArmorRepairAmount
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Repair Systems') or
+                                                     mod.item.requiresSkill('Capital Repair Systems'),
+                                         'armorDamageAmount', module.getModifiedItemAttr('armorDamageAmountMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4088(BaseEffect):
+    """
+    systemArmorRemoteRepairAmount
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    Celestial: Final Liminality
+    Celestial: Triglavian Minor Victory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
+                        mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'armorDamageAmount', module.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4089(BaseEffect):
+    """
+    systemShieldRemoteRepairAmount
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    Celestial: Final Liminality
+    Celestial: Triglavian Minor Victory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
+                        mod.item.requiresSkill('Capital Shield Emission Systems'),
+            'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplierRemote'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4090(BaseEffect):
+    """
+    systemCapacitorCapacity
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('capacitorCapacity', beacon.getModifiedItemAttr('capacitorCapacityMultiplierSystem'), **kwargs)
+
+
+class Effect4091(BaseEffect):
+    """
+    systemCapacitorRecharge
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('rechargeRate', beacon.getModifiedItemAttr('rechargeRateMultiplier'), **kwargs)
+
+
+class Effect4093(BaseEffect):
+    """
+    subsystemBonusAmarrOffensiveEnergyWeaponDamageMultiplier
+
+    Used by:
+    Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', module.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
+                                      skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4104(BaseEffect):
+    """
+    subsystemBonusCaldariOffensiveHybridWeaponMaxRange
+
+    Used by:
+    Subsystem: Tengu Offensive - Magnetic Infusion Basin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', module.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
+                                      skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4106(BaseEffect):
+    """
+    subsystemBonusGallenteOffensiveHybridWeaponFalloff
+
+    Used by:
+    Subsystem: Proteus Offensive - Hybrid Encoding Platform
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', module.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                      skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect4114(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensiveProjectileWeaponFalloff
+
+    Used by:
+    Subsystem: Loki Offensive - Projectile Scoping Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4115(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensiveProjectileWeaponMaxRange
+
+    Used by:
+    Subsystem: Loki Offensive - Projectile Scoping Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'maxRange', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4122(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive1LauncherROF
+
+    Used by:
+    Subsystem: Tengu Offensive - Accelerated Ejection Bay
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4135(BaseEffect):
+    """
+    systemShieldEmResistance
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', beacon.getModifiedItemAttr('shieldEmDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect4136(BaseEffect):
+    """
+    systemShieldExplosiveResistance
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance',
+                               beacon.getModifiedItemAttr('shieldExplosiveDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect4137(BaseEffect):
+    """
+    systemShieldKineticResistance
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance',
+                               beacon.getModifiedItemAttr('shieldKineticDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect4138(BaseEffect):
+    """
+    systemShieldThermalResistance
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    Celestials named like: Volatile Ice Storm (2 of 2)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance',
+                               beacon.getModifiedItemAttr('shieldThermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect4152(BaseEffect):
+    """
+    subsystemBonusAmarrEngineeringHeatDamageReduction
+
+    Used by:
+    Subsystem: Legion Core - Energy Parasitic Complex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      module.getModifiedItemAttr('subsystemBonusAmarrCore'),
+                                      skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4153(BaseEffect):
+    """
+    subsystemBonusCaldariEngineeringHeatDamageReduction
+
+    Used by:
+    Subsystem: Tengu Core - Obfuscation Manifold
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      module.getModifiedItemAttr('subsystemBonusCaldariCore'),
+                                      skill='Caldari Core Systems', **kwargs)
+
+
+class Effect4154(BaseEffect):
+    """
+    subsystemBonusGallenteEngineeringHeatDamageReduction
+
+    Used by:
+    Subsystem: Proteus Core - Friction Extension Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      module.getModifiedItemAttr('subsystemBonusGallenteCore'),
+                                      skill='Gallente Core Systems', **kwargs)
+
+
+class Effect4155(BaseEffect):
+    """
+    subsystemBonusMinmatarEngineeringHeatDamageReduction
+
+    Used by:
+    Subsystem: Loki Core - Immobility Drivers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      module.getModifiedItemAttr('subsystemBonusMinmatarCore'),
+                                      skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect4158(BaseEffect):
+    """
+    subsystemBonusCaldariCoreCapacitorCapacity
+
+    Used by:
+    Subsystem: Tengu Core - Augmented Graviton Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacitorCapacity', src.getModifiedItemAttr('subsystemBonusCaldariCore'),
+                               skill='Caldari Core Systems', **kwargs)
+
+
+class Effect4159(BaseEffect):
+    """
+    subsystemBonusAmarrCoreCapacitorCapacity
+
+    Used by:
+    Subsystem: Legion Core - Augmented Antimatter Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacitorCapacity', src.getModifiedItemAttr('subsystemBonusAmarrCore'), skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4161(BaseEffect):
+    """
+    baseMaxScanDeviationModifierRequiringAstrometrics
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implants named like: Poteque 'Prospector' Astrometric Pinpointing AP (3 of 3)
+    Implants named like: Poteque 'Prospector' Sharpeye (2 of 2)
+    Implants named like: Serenity Limited 'Sharpeye' Dose (3 of 3)
+    Implant: AIR Astro-Pinpointing II Booster
+    Skill: Astrometric Pinpointing
+    Skill: Astrometrics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            container.getModifiedItemAttr('maxScanDeviationModifier') * level, **kwargs)
+
+
+class Effect4162(BaseEffect):
+    """
+    baseSensorStrengthModifierRequiringAstrometrics
+
+    Used by:
+    Modules from group: Scan Probe Launcher (4 of 7)
+    Implants named like: Chemal Tech Exploration Booster (3 of 3)
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implants named like: Poteque 'Prospector' Astrometric Rangefinding AR (3 of 3)
+    Implants named like: Poteque 'Prospector' Sharpeye (2 of 2)
+    Implants named like: Serenity Limited 'Sharpeye' Dose (3 of 3)
+    Implants named like: grade Virtue (10 of 12)
+    Modules named like: Gravity Capacitor Upgrade (8 of 8)
+    Implant: AIR Astro-Rangefinding II Booster
+    Implant: Serenity YC122.9 Season Booster - Probe Scanning Strength
+    Skill: Astrometric Rangefinding
+    Skill: Astrometrics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', container.getModifiedItemAttr('scanStrengthBonus') * level,
+                                        stackingPenalties=penalized, **kwargs)
+
+
+class Effect4165(BaseEffect):
+    """
+    shipBonusScanProbeStrengthCF2
+
+    Used by:
+    Ships named like: Heron (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+                                        'baseSensorStrength', ship.getModifiedItemAttr('shipBonusCF2'),
+                                        skill='Caldari Frigate', **kwargs)
+
+
+class Effect4166(BaseEffect):
+    """
+    shipBonusScanProbeStrengthMF2
+
+    Used by:
+    Ships named like: Probe (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+                                        'baseSensorStrength', ship.getModifiedItemAttr('shipBonusMF2'),
+                                        skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4167(BaseEffect):
+    """
+    shipBonusScanProbeStrengthGF2
+
+    Used by:
+    Ships named like: Imicus (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+                                        'baseSensorStrength', ship.getModifiedItemAttr('shipBonusGF2'),
+                                        skill='Gallente Frigate', **kwargs)
+
+
+class Effect4168(BaseEffect):
+    """
+    eliteBonusCoverOpsScanProbeStrength2
+
+    Used by:
+    Ships from group: Covert Ops (9 of 9)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+                                        'baseSensorStrength', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect4187(BaseEffect):
+    """
+    shipBonusStrategicCruiserAmarrHeatDamage
+
+    Used by:
+    Ship: Legion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserAmarr1'),
+                                      skill='Amarr Strategic Cruiser', **kwargs)
+
+
+class Effect4188(BaseEffect):
+    """
+    shipBonusStrategicCruiserCaldariHeatDamage
+
+    Used by:
+    Ship: Tengu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserCaldari1'),
+                                      skill='Caldari Strategic Cruiser', **kwargs)
+
+
+class Effect4189(BaseEffect):
+    """
+    shipBonusStrategicCruiserGallenteHeatDamage
+
+    Used by:
+    Ship: Proteus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserGallente1'),
+                                      skill='Gallente Strategic Cruiser', **kwargs)
+
+
+class Effect4190(BaseEffect):
+    """
+    shipBonusStrategicCruiserMinmatarHeatDamage
+
+    Used by:
+    Ship: Loki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserMinmatar1'),
+                                      skill='Minmatar Strategic Cruiser', **kwargs)
+
+
+class Effect4215(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive2EnergyWeaponCapacitorNeed
+
+    Used by:
+    Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'capacitorNeed', module.getModifiedItemAttr('subsystemBonusAmarrOffensive2'),
+                                      skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4216(BaseEffect):
+    """
+    subsystemBonusAmarrCore2EnergyVampireAmount
+
+    Used by:
+    Subsystem: Legion Core - Energy Parasitic Complex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4217(BaseEffect):
+    """
+    subsystemBonusAmarrCore2EnergyDestabilizerAmount
+
+    Used by:
+    Subsystem: Legion Core - Energy Parasitic Complex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4248(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive2MissileLauncherKineticDamage
+
+    Used by:
+    Subsystem: Tengu Offensive - Accelerated Ejection Bay
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
+                                        skill='Caldari Offensive Systems', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
+                                        skill='Caldari Offensive Systems', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
+                                        skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4250(BaseEffect):
+    """
+    subsystemBonusGallenteOffensiveDroneDamageHP
+
+    Used by:
+    Subsystem: Proteus Offensive - Drone Synthesis Projector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'armorHP', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'hp', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'damageMultiplier', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'shieldCapacity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect4251(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive2ProjectileWeaponDamageMultiplier
+
+    Used by:
+    Subsystem: Loki Offensive - Projectile Scoping Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4256(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive2MissileLauncherROF
+
+    Used by:
+    Subsystem: Loki Offensive - Launcher Efficiency Configuration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4264(BaseEffect):
+    """
+    subsystemBonusMinmatarCoreCapacitorRecharge
+
+    Used by:
+    Subsystem: Loki Core - Augmented Nuclear Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('rechargeRate', src.getModifiedItemAttr('subsystemBonusMinmatarCore'),
+                               skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect4265(BaseEffect):
+    """
+    subsystemBonusGallenteCoreCapacitorRecharge
+
+    Used by:
+    Subsystem: Proteus Core - Augmented Fusion Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('rechargeRate', src.getModifiedItemAttr('subsystemBonusGallenteCore'),
+                               skill='Gallente Core Systems', **kwargs)
+
+
+class Effect4269(BaseEffect):
+    """
+    subsystemBonusAmarrCore3ScanResolution
+
+    Used by:
+    Subsystem: Legion Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('subsystemBonusAmarrCore3'),
+                               skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4270(BaseEffect):
+    """
+    subsystemBonusMinmatarCore3ScanResolution
+
+    Used by:
+    Subsystem: Loki Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('subsystemBonusMinmatarCore3'),
+                               skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect4271(BaseEffect):
+    """
+    subsystemBonusCaldariCore2MaxTargetingRange
+
+    Used by:
+    Subsystem: Tengu Core - Electronic Efficiency Gate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+
+
+class Effect4272(BaseEffect):
+    """
+    subsystemBonusGallenteCore2MaxTargetingRange
+
+    Used by:
+    Subsystem: Proteus Core - Electronic Efficiency Gate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', src.getModifiedItemAttr('subsystemBonusGallenteCore2'),
+                               skill='Gallente Core Systems', **kwargs)
+
+
+class Effect4273(BaseEffect):
+    """
+    subsystemBonusGallenteCore2WarpScrambleRange
+
+    Used by:
+    Subsystem: Proteus Core - Friction Extension Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+                                      src.getModifiedItemAttr('subsystemBonusGallenteCore2'), skill='Gallente Core Systems', **kwargs)
+
+
+class Effect4274(BaseEffect):
+    """
+    subsystemBonusMinmatarCore2StasisWebifierRange
+
+    Used by:
+    Subsystem: Loki Core - Immobility Drivers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'), skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect4275(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsion2WarpSpeed
+
+    Used by:
+    Subsystem: Tengu Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
+                               skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect4277(BaseEffect):
+    """
+    subsystemBonusGallentePropulsionWarpCapacitor
+
+    Used by:
+    Subsystem: Proteus Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', src.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
+                               skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect4278(BaseEffect):
+    """
+    subsystemBonusGallentePropulsion2WarpSpeed
+
+    Used by:
+    Subsystem: Proteus Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
+                               skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect4280(BaseEffect):
+    """
+    systemAgility
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('agility', beacon.getModifiedItemAttr('agilityMultiplier'), stackingPenalties=True, **kwargs)
+
+
+class Effect4282(BaseEffect):
+    """
+    subsystemBonusGallenteOffensive2HybridWeaponDamageMultiplier
+
+    Used by:
+    Subsystem: Proteus Offensive - Hybrid Encoding Platform
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', module.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
+                                      skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect4283(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive2HybridWeaponDamageMultiplier
+
+    Used by:
+    Subsystem: Tengu Offensive - Magnetic Infusion Basin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', module.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
+                                      skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4286(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive2RemoteArmorRepairCapUse
+
+    Used by:
+    Subsystem: Legion Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4288(BaseEffect):
+    """
+    subsystemBonusGallenteOffensive2RemoteArmorRepairCapUse
+
+    Used by:
+    Subsystem: Proteus Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'), skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect4290(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive2RemoteRepCapUse
+
+    Used by:
+    Subsystem: Loki Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'capacitorNeed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4292(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive2RemoteShieldBoosterCapUse
+
+    Used by:
+    Subsystem: Tengu Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'capacitorNeed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
+                                      skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4321(BaseEffect):
+    """
+    subsystemBonusCaldariCore2ECMStrengthRange
+
+    Used by:
+    Subsystem: Tengu Core - Obfuscation Manifold
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanLadarStrengthBonus',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanRadarStrengthBonus',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanGravimetricStrengthBonus',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanMagnetometricStrengthBonus',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
+
+
+class Effect4327(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive3DroneDamageHP
+
+    Used by:
+    Subsystem: Legion Offensive - Assault Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'hp', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'armorHP', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'shieldCapacity', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'damageMultiplier', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4330(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive3EnergyWeaponMaxRange
+
+    Used by:
+    Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', module.getModifiedItemAttr('subsystemBonusAmarrOffensive3'),
+                                      skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4331(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive3HMLHAMVelocity
+
+    Used by:
+    Subsystem: Tengu Offensive - Accelerated Ejection Bay
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
+                                        skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect4342(BaseEffect):
+    """
+    subsystemBonusMinmatarCore2MaxTargetingRange
+
+    Used by:
+    Subsystem: Loki Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'),
+                               skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect4343(BaseEffect):
+    """
+    subsystemBonusAmarrCore2MaxTargetingRange
+
+    Used by:
+    Subsystem: Legion Core - Dissolution Sequencer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', src.getModifiedItemAttr('subsystemBonusAmarrCore2'),
+                               skill='Amarr Core Systems', **kwargs)
+
+
+class Effect4347(BaseEffect):
+    """
+    subsystemBonusGallenteOffensive3TurretTracking
+
+    Used by:
+    Subsystem: Proteus Offensive - Drone Synthesis Projector
+    Subsystem: Proteus Offensive - Hybrid Encoding Platform
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'trackingSpeed', module.getModifiedItemAttr('subsystemBonusGallenteOffensive3'),
+                                      skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect4351(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive3TurretTracking
+
+    Used by:
+    Subsystem: Loki Offensive - Projectile Scoping Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'trackingSpeed', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect4358(BaseEffect):
+    """
+    ecmRangeBonusModuleEffect
+
+    Used by:
+    Modules from group: ECM Stabilizer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'maxRange', module.getModifiedItemAttr('ecmRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4360(BaseEffect):
+    """
+    subsystemBonusAmarrOffensiveMissileLauncherROF
+
+    Used by:
+    Subsystem: Legion Offensive - Assault Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4362(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive2MissileDamage
+
+    Used by:
+    Subsystem: Legion Offensive - Assault Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                        'emDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4366(BaseEffect):
+    """
+    shipBonusMediumHybridDmgCC2
+
+    Used by:
+    Ship: Falcon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect4370(BaseEffect):
+    """
+    caldariShipEwFalloffRangeCC2
+
+    Used by:
+    Ship: Blackbird
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCC2'),
+                                      skill='Caldari Cruiser', **kwargs)
+
+
+class Effect4372(BaseEffect):
+    """
+    caldariShipEwFalloffRangeCB3
+
+    Used by:
+    Ship: Scorpion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCB3'),
+                                      skill='Caldari Battleship', **kwargs)
+
+
+class Effect4373(BaseEffect):
+    """
+    subSystemBonusAmarrOffensiveCommandBursts
+
+    Used by:
+    Subsystem: Legion Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
+                                                       mod.item.requiresSkill('Armored Command') or
+                                                       mod.item.requiresSkill('Information Command')),
+                                          attrName, src.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
+                                          skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect4377(BaseEffect):
+    """
+    shipBonusTorpedoVelocityGF2
+
+    Used by:
+    Ship: Nemesis
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4378(BaseEffect):
+    """
+    shipBonusTorpedoVelocityMF2
+
+    Used by:
+    Ship: Hound
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4379(BaseEffect):
+    """
+    shipBonusTorpedoVelocity2AF
+
+    Used by:
+    Ship: Purifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect4380(BaseEffect):
+    """
+    shipBonusTorpedoVelocityCF2
+
+    Used by:
+    Ship: Manticore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect4384(BaseEffect):
+    """
+    eliteReconBonusHeavyMissileVelocity
+
+    Used by:
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
+                                        skill='Recon Ships', **kwargs)
+
+
+class Effect4385(BaseEffect):
+    """
+    eliteReconBonusHeavyAssaultMissileVelocity
+
+    Used by:
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
+                                        skill='Recon Ships', **kwargs)
+
+
+class Effect4393(BaseEffect):
+    """
+    shipBonusEliteCover2TorpedoThermalDamage
+
+    Used by:
+    Ship: Nemesis
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect4394(BaseEffect):
+    """
+    shipBonusEliteCover2TorpedoEMDamage
+
+    Used by:
+    Ship: Purifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'), skill='Covert Ops', **kwargs)
+
+
+class Effect4395(BaseEffect):
+    """
+    shipBonusEliteCover2TorpedoExplosiveDamage
+
+    Used by:
+    Ship: Hound
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect4396(BaseEffect):
+    """
+    shipBonusEliteCover2TorpedoKineticDamage
+
+    Used by:
+    Ship: Manticore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect4398(BaseEffect):
+    """
+    shipBonusMF1TorpedoExplosionVelocity
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4413(BaseEffect):
+    """
+    shipBonusGF1TorpedoFlightTime
+
+    Used by:
+    Ship: Nemesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosionDelay', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4415(BaseEffect):
+    """
+    shipBonusMF1TorpedoFlightTime
+
+    Used by:
+    Ship: Hound
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosionDelay', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4416(BaseEffect):
+    """
+    shipBonusCF1TorpedoFlightTime
+
+    Used by:
+    Ship: Manticore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosionDelay', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect4417(BaseEffect):
+    """
+    shipBonusAF1TorpedoFlightTime
+
+    Used by:
+    Ship: Purifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosionDelay', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect4451(BaseEffect):
+    """
+    ScanRadarStrengthModifierEffect
+
+    Used by:
+    Implants named like: Low grade Grail (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('scanRadarStrength', implant.getModifiedItemAttr('scanRadarStrengthModifier'), **kwargs)
+
+
+class Effect4452(BaseEffect):
+    """
+    ScanLadarStrengthModifierEffect
+
+    Used by:
+    Implants named like: Low grade Jackal (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('scanLadarStrength', implant.getModifiedItemAttr('scanLadarStrengthModifier'), **kwargs)
+
+
+class Effect4453(BaseEffect):
+    """
+    ScanGravimetricStrengthModifierEffect
+
+    Used by:
+    Implants named like: Low grade Talon (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('scanGravimetricStrength', implant.getModifiedItemAttr('scanGravimetricStrengthModifier'), **kwargs)
+
+
+class Effect4454(BaseEffect):
+    """
+    ScanMagnetometricStrengthModifierEffect
+
+    Used by:
+    Implants named like: Low grade Spur (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('scanMagnetometricStrength',
+                                  implant.getModifiedItemAttr('scanMagnetometricStrengthModifier'), **kwargs)
+
+
+class Effect4456(BaseEffect):
+    """
+    federationsetbonus3
+
+    Used by:
+    Implants named like: High grade Spur (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanMagnetometricStrengthPercent',
+                                                 implant.getModifiedItemAttr('implantSetFederationNavy'), **kwargs)
+
+
+class Effect4457(BaseEffect):
+    """
+    imperialsetbonus3
+
+    Used by:
+    Implants named like: High grade Grail (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanRadarStrengthPercent',
+                                                 implant.getModifiedItemAttr('implantSetImperialNavy'), **kwargs)
+
+
+class Effect4458(BaseEffect):
+    """
+    republicsetbonus3
+
+    Used by:
+    Implants named like: High grade Jackal (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanLadarStrengthPercent',
+                                                 implant.getModifiedItemAttr('implantSetRepublicFleet'), **kwargs)
+
+
+class Effect4459(BaseEffect):
+    """
+    caldarisetbonus3
+
+    Used by:
+    Implants named like: High grade Talon (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanGravimetricStrengthPercent',
+                                                 implant.getModifiedItemAttr('implantSetCaldariNavy'), **kwargs)
+
+
+class Effect4460(BaseEffect):
+    """
+    imperialsetLGbonus
+
+    Used by:
+    Implants named like: Low grade Grail (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanRadarStrengthModifier',
+                                                 implant.getModifiedItemAttr('implantSetLGImperialNavy'), **kwargs)
+
+
+class Effect4461(BaseEffect):
+    """
+    federationsetLGbonus
+
+    Used by:
+    Implants named like: Low grade Spur (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanMagnetometricStrengthModifier',
+                                                 implant.getModifiedItemAttr('implantSetLGFederationNavy'), **kwargs)
+
+
+class Effect4462(BaseEffect):
+    """
+    caldarisetLGbonus
+
+    Used by:
+    Implants named like: Low grade Talon (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanGravimetricStrengthModifier',
+                                                 implant.getModifiedItemAttr('implantSetLGCaldariNavy'), **kwargs)
+
+
+class Effect4463(BaseEffect):
+    """
+    republicsetLGbonus
+
+    Used by:
+    Implants named like: Low grade Jackal (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'scanLadarStrengthModifier',
+                                                 implant.getModifiedItemAttr('implantSetLGRepublicFleet'), **kwargs)
+
+
+class Effect4464(BaseEffect):
+    """
+    shipProjectileRofMF
+
+    Used by:
+    Ship: Claw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusMF'), stackingPenalties=True, skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4471(BaseEffect):
+    """
+    shipBonusStasisMF2
+
+    Used by:
+    Ship: Caedes
+    Ship: Cruor
+    Ship: Freki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4472(BaseEffect):
+    """
+    shipProjectileDmgMC
+
+    Used by:
+    Ship: Mimir
+    Ship: Rupture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect4473(BaseEffect):
+    """
+    shipVelocityBonusATC1
+
+    Used by:
+    Ship: Adrestia
+    Ship: Cybele
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
+
+
+class Effect4474(BaseEffect):
+    """
+    shipMTMaxRangeBonusATC
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
+
+
+class Effect4475(BaseEffect):
+    """
+    shipMTFalloffBonusATC
+
+    Used by:
+    Ship: Mimir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
+
+
+class Effect4476(BaseEffect):
+    """
+    shipMTFalloffBonusATF
+
+    Used by:
+    Ship: Freki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4477(BaseEffect):
+    """
+    shipMTMaxRangeBonusATF
+
+    Used by:
+    Ship: Freki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4478(BaseEffect):
+    """
+    shipBonusAfterburnerCapNeedATF
+
+    Used by:
+    Ship: Freki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
+
+
+class Effect4479(BaseEffect):
+    """
+    shipBonusSurveyProbeExplosionDelaySkillSurveyCovertOps3
+
+    Used by:
+    Ships from group: Covert Ops (6 of 9)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Survey Probe',
+                                        'explosionDelay', ship.getModifiedItemAttr('eliteBonusCovertOps3'),
+                                        skill='Covert Ops', **kwargs)
+
+
+class Effect4482(BaseEffect):
+    """
+    shipETOptimalRange2AF
+
+    Used by:
+    Ship: Imperial Navy Slicer
+    Ship: Pacifier
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect4484(BaseEffect):
+    """
+    shipPTurretFalloffBonusGB
+
+    Used by:
+    Ship: Machariel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect4485(BaseEffect):
+    """
+    shipBonusStasisWebSpeedFactorMB
+
+    Used by:
+    Ship: Vindicator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'speedFactor', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect4489(BaseEffect):
+    """
+    superWeaponAmarr
+
+    Used by:
+    Module: 'Judgment' Electromagnetic Doomsday
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect4490(BaseEffect):
+    """
+    superWeaponCaldari
+
+    Used by:
+    Module: 'Oblivion' Kinetic Doomsday
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect4491(BaseEffect):
+    """
+    superWeaponGallente
+
+    Used by:
+    Module: 'Aurora Ominae' Thermal Doomsday
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect4492(BaseEffect):
+    """
+    superWeaponMinmatar
+
+    Used by:
+    Module: 'Gjallarhorn' Explosive Doomsday
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
@@ -0,0 +1,1844 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect4510(BaseEffect):
+    """
+    shipStasisWebStrengthBonusMC2
+
+    Used by:
+    Ship: Victor
+    Ship: Vigilant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'speedFactor', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect4512(BaseEffect):
+    """
+    shipPTurretFalloffBonusGC
+
+    Used by:
+    Ship: Cynabal
+    Ship: Moracha
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect4513(BaseEffect):
+    """
+    shipStasisWebStrengthBonusMF2
+
+    Used by:
+    Ship: Daredevil
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'speedFactor', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4515(BaseEffect):
+    """
+    shipFalloffBonusMF
+
+    Used by:
+    Ship: Chremoas
+    Ship: Dramiel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect4516(BaseEffect):
+    """
+    shipHTurretFalloffBonusGC
+
+    Used by:
+    Ship: Victor
+    Ship: Vigilant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect4527(BaseEffect):
+    """
+    gunneryFalloffBonusOnline
+
+    Used by:
+    Modules from group: Tracking Enhancer (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                      'falloff', module.getModifiedItemAttr('falloffBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4555(BaseEffect):
+    """
+    capitalLauncherSkillCruiseCitadelEmDamage1
+
+    Used by:
+    Skill: XL Cruise Missiles
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+                                        'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect4556(BaseEffect):
+    """
+    capitalLauncherSkillCruiseCitadelExplosiveDamage1
+
+    Used by:
+    Skill: XL Cruise Missiles
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+                                        'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect4557(BaseEffect):
+    """
+    capitalLauncherSkillCruiseCitadelKineticDamage1
+
+    Used by:
+    Skill: XL Cruise Missiles
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+                                        'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect4558(BaseEffect):
+    """
+    capitalLauncherSkillCruiseCitadelThermalDamage1
+
+    Used by:
+    Skill: XL Cruise Missiles
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+                                        'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect4559(BaseEffect):
+    """
+    gunneryMaxRangeFalloffTrackingSpeedBonus
+
+    Used by:
+    Modules from group: Tracking Computer (11 of 11)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for attr in ('maxRange', 'falloff', 'trackingSpeed'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          attr, module.getModifiedItemAttr('%sBonus' % attr),
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect4575(BaseEffect):
+    """
+    industrialCoreEffect2
+
+    Used by:
+    Variations of module: Capital Industrial Core I (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.multiplyItemAttr('mass', src.getModifiedItemAttr('siegeMassMultiplier'), **kwargs)
+        fit.ship.multiplyItemAttr('scanResolution',
+                                  src.getModifiedItemAttr('scanResolutionMultiplier'),
+                                  stackingPenalties=True, **kwargs)
+
+        #  Remote Shield Repper Bonuses
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'duration', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'maxRange', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'capacitorNeed', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        #  Local Shield Repper Bonuses
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+                                      'duration', src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        # Mining Burst Bonuses
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff1Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff2Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff3Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff4Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+
+        #  Command Burst Range Bonus
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+                                      'maxRange', src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
+                                      stackingPenalties=True, **kwargs)
+
+        # Drone Bonuses
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+                                     'duration', src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+                                     'miningAmount', src.getModifiedItemAttr('industrialCoreBonusDroneMining'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
+                                     stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
+                                     stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'shieldCapacity', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'armorHP', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'hp', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+
+        # Remote impedance (no reps, etc)
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+        fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
+        fit.ship.increaseItemAttr('disallowTethering', src.getModifiedItemAttr('disallowTethering'), **kwargs)
+        fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
+        fit.ship.increaseItemAttr('disallowDocking', src.getModifiedItemAttr('disallowDocking'), **kwargs)
+
+
+class Effect4576(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkFalloffBonus1
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect4577(BaseEffect):
+    """
+    eliteBonusLogisticsTrackingLinkFalloffBonus2
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+                                      'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect4579(BaseEffect):
+    """
+    droneRigStasisWebSpeedFactorBonus
+
+    Used by:
+    Modules named like: Stasis Drone Augmentor (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Stasis Webifying Drone',
+                                     'speedFactor', module.getModifiedItemAttr('webSpeedFactorBonus'), **kwargs)
+
+
+class Effect4619(BaseEffect):
+    """
+    shipBonusDroneDamageGF2
+
+    Used by:
+    Ship: Utu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4620(BaseEffect):
+    """
+    shipBonusWarpScramblerMaxRangeGF2
+
+    Used by:
+    Ship: Garmur
+    Ship: Shapash
+    Ship: Utu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4621(BaseEffect):
+    """
+    shipBonusHeatDamageATF1
+
+    Used by:
+    Ship: Cambion
+    Ship: Etana
+    Ship: Shapash
+    Ship: Utu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
+
+
+class Effect4622(BaseEffect):
+    """
+    shipBonusSmallHybridMaxRangeATF2
+
+    Used by:
+    Ship: Utu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4623(BaseEffect):
+    """
+    shipBonusSmallHybridTrackingSpeedATF2
+
+    Used by:
+    Ship: Utu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4624(BaseEffect):
+    """
+    shipBonusHybridTrackingATC2
+
+    Used by:
+    Ship: Adrestia
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
+
+
+class Effect4625(BaseEffect):
+    """
+    shipBonusHybridFalloffATC2
+
+    Used by:
+    Ship: Adrestia
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
+
+
+class Effect4626(BaseEffect):
+    """
+    shipBonusWarpScramblerMaxRangeGC2
+
+    Used by:
+    Ship: Adrestia
+    Ship: Cybele
+    Ship: Orthrus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect4635(BaseEffect):
+    """
+    eliteBonusMaraudersCruiseAndTorpedoDamageRole1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for damageType in damageTypes:
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+                '{0}Damage'.format(damageType), ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect4636(BaseEffect):
+    """
+    shipBonusAoeVelocityCruiseAndTorpedoCB2
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            'aoeVelocity', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect4637(BaseEffect):
+    """
+    shipCruiseAndTorpedoVelocityBonusCB3
+
+    Used by:
+    Ship: Golem
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect4640(BaseEffect):
+    """
+    shipArmorEMAndExpAndkinAndThmResistanceAC2
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Sacrilege
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr('armor{0}DamageResonance'.format(damageType), ship.getModifiedItemAttr('shipBonusAC2'),
+                                   skill='Amarr Cruiser', **kwargs)
+
+
+class Effect4643(BaseEffect):
+    """
+    shipHeavyAssaultMissileEMAndExpAndKinAndThmDmgAC1
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for damageType in damageTypes:
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                            '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusAC'),
+                                            skill='Amarr Cruiser', **kwargs)
+
+
+class Effect4645(BaseEffect):
+    """
+    eliteBonusHeavyGunshipHeavyAndHeavyAssaultAndAssaultMissileLauncherROF
+
+    Used by:
+    Ship: Bestla
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault', 'Missile Launcher Heavy')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect4648(BaseEffect):
+    """
+    eliteBonusBlackOpsECMGravAndLadarAndMagnetometricAndRadarStrength1
+
+    Used by:
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
+        for type in sensorTypes:
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scan{0}StrengthBonus'.format(type),
+                                          ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
+
+
+class Effect4649(BaseEffect):
+    """
+    shipCruiseAndSiegeLauncherROFBonus2CB
+
+    Used by:
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        affectedGroups = ('Missile Launcher Cruise', 'Missile Launcher Torpedo')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in affectedGroups,
+                                      'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect4667(BaseEffect):
+    """
+    shipBonusNoctisSalvageCycle
+
+    Used by:
+    Ship: Noctis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                      'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
+                                      skill='ORE Hauler', **kwargs)
+
+
+class Effect4668(BaseEffect):
+    """
+    shipBonusNoctisTractorCycle
+
+    Used by:
+    Ship: Noctis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+                                      'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
+                                      skill='ORE Hauler', **kwargs)
+
+
+class Effect4669(BaseEffect):
+    """
+    shipBonusNoctisTractorVelocity
+
+    Used by:
+    Ship: Noctis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+                                      'maxTractorVelocity', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
+                                      skill='ORE Hauler', **kwargs)
+
+
+class Effect4670(BaseEffect):
+    """
+    shipBonusNoctisTractorRange
+
+    Used by:
+    Ship: Noctis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
+                                      skill='ORE Hauler', **kwargs)
+
+
+class Effect4728(BaseEffect):
+    """
+    OffensiveDefensiveReduction
+
+    Used by:
+    Celestials named like: Drifter Incursion (6 of 6)
+    Celestials named like: Sansha Incursion System Effects (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        damages = ('em', 'thermal', 'kinetic', 'explosive')
+        for damage in damages:
+            # Nerf missile damage
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                            '{0}Damage'.format(damage),
+                                            beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
+            # Nerf smartbomb damage
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Smart Bomb',
+                                          '{0}Damage'.format(damage),
+                                          beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
+            # Nerf armor resistances
+            fit.ship.boostItemAttr('armor{0}DamageResonance'.format(damage.capitalize()),
+                                   beacon.getModifiedItemAttr('armor{0}DamageResistanceBonus'.format(damage.capitalize())), **kwargs)
+            # Nerf shield resistances
+            fit.ship.boostItemAttr('shield{0}DamageResonance'.format(damage.capitalize()),
+                                   beacon.getModifiedItemAttr('shield{0}DamageResistanceBonus'.format(damage.capitalize())), **kwargs)
+        # Nerf drone damage output
+        fit.drones.filteredItemBoost(lambda drone: True,
+                                     'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
+        # Nerf turret damage output
+        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Gunnery'),
+                                      'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
+
+
+class Effect4760(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsionWarpCapacitor
+
+    Used by:
+    Subsystem: Tengu Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
+                               skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect4775(BaseEffect):
+    """
+    shipEnergyNeutralizerTransferAmountBonusAF2
+
+    Used by:
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonus2AF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect4782(BaseEffect):
+    """
+    shipBonusSmallEnergyWeaponOptimalRangeATF2
+
+    Used by:
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4789(BaseEffect):
+    """
+    shipBonusSmallEnergyTurretDamageATF1
+
+    Used by:
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
+
+
+class Effect4793(BaseEffect):
+    """
+    shipBonusMissileLauncherHeavyROFATC1
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+                                      'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
+
+
+class Effect4794(BaseEffect):
+    """
+    shipBonusMissileLauncherAssaultROFATC1
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+                                      'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
+
+
+class Effect4795(BaseEffect):
+    """
+    shipBonusMissileLauncherHeavyAssaultROFATC1
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+                                      'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
+
+
+class Effect4799(BaseEffect):
+    """
+    eliteBonusBlackOpsECMBurstGravAndLadarAndMagnetoAndRadar
+
+    Used by:
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
+        for type in sensorTypes:
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+                                          'scan{0}StrengthBonus'.format(type),
+                                          ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
+
+
+class Effect4804(BaseEffect):
+    """
+    dataMiningSkillBoostAccessDifficultyBonusAbsolutePercent
+
+    Used by:
+    Skill: Archaeology
+    Skill: Hacking
+    Skill: Salvaging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill(skill), 'accessDifficultyBonus',
+                                         skill.getModifiedItemAttr('accessDifficultyBonusAbsolutePercent') * skill.level, **kwargs)
+
+
+class Effect4809(BaseEffect):
+    """
+    ecmGravimetricStrengthBonusPercent
+
+    Used by:
+    Modules from group: ECM Stabilizer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanGravimetricStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4810(BaseEffect):
+    """
+    ecmLadarStrengthBonusPercent
+
+    Used by:
+    Modules from group: ECM Stabilizer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanLadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4811(BaseEffect):
+    """
+    ecmMagnetometricStrengthBonusPercent
+
+    Used by:
+    Modules from group: ECM Stabilizer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanMagnetometricStrengthBonus',
+                                      module.getModifiedItemAttr('ecmStrengthBonusPercent'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4812(BaseEffect):
+    """
+    ecmRadarStrengthBonusPercent
+
+    Used by:
+    Modules from group: ECM Stabilizer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                      'scanRadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect4814(BaseEffect):
+    """
+    jumpPortalConsumptionBonusPercentSkill
+
+    Used by:
+    Skill: Jump Portal Generation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'consumptionQuantity',
+                                      skill.getModifiedItemAttr('consumptionQuantityBonusPercent') * skill.level, **kwargs)
+
+
+class Effect4817(BaseEffect):
+    """
+    salvagerModuleDurationReduction
+
+    Used by:
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Salvager',
+                                      'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect4820(BaseEffect):
+    """
+    bcLargeEnergyTurretPowerNeedBonus
+
+    Used by:
+    Ship: Oracle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                         'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
+
+
+class Effect4821(BaseEffect):
+    """
+    bcLargeHybridTurretPowerNeedBonus
+
+    Used by:
+    Ship: Naga
+    Ship: Talos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                         'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
+
+
+class Effect4822(BaseEffect):
+    """
+    bcLargeProjectileTurretPowerNeedBonus
+
+    Used by:
+    Ship: Tornado
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                         'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
+
+
+class Effect4823(BaseEffect):
+    """
+    bcLargeEnergyTurretCPUNeedBonus
+
+    Used by:
+    Ship: Oracle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                         'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
+
+
+class Effect4824(BaseEffect):
+    """
+    bcLargeHybridTurretCPUNeedBonus
+
+    Used by:
+    Ship: Naga
+    Ship: Talos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                         'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
+
+
+class Effect4825(BaseEffect):
+    """
+    bcLargeProjectileTurretCPUNeedBonus
+
+    Used by:
+    Ship: Tornado
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                         'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
+
+
+class Effect4826(BaseEffect):
+    """
+    bcLargeEnergyTurretCapacitorNeedBonus
+
+    Used by:
+    Ship: Oracle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                         'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
+
+
+class Effect4827(BaseEffect):
+    """
+    bcLargeHybridTurretCapacitorNeedBonus
+
+    Used by:
+    Ship: Naga
+    Ship: Talos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                         'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
+
+
+class Effect4867(BaseEffect):
+    """
+    setBonusChristmasPowergrid
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'powerEngineeringOutputBonus',
+                                                 implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect4868(BaseEffect):
+    """
+    setBonusChristmasCapacitorCapacity
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'capacitorCapacityBonus',
+                                                 implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect4869(BaseEffect):
+    """
+    setBonusChristmasCPUOutput
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'cpuOutputBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect4871(BaseEffect):
+    """
+    setBonusChristmasCapacitorRecharge2
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'capRechargeBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect4896(BaseEffect):
+    """
+    shipBonusDroneHitpointsGF2
+
+    Used by:
+    Ship: Ishkur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4897(BaseEffect):
+    """
+    shipBonusDroneArmorHitpointsGF2
+
+    Used by:
+    Ship: Ishkur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4898(BaseEffect):
+    """
+    shipBonusDroneShieldHitpointsGF2
+
+    Used by:
+    Ship: Ishkur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect4901(BaseEffect):
+    """
+    shipMissileSpeedBonusAF
+
+    Used by:
+    Ship: Vengeance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect4902(BaseEffect):
+    """
+    MWDSignatureRadiusRoleBonus
+
+    Used by:
+    Ships from group: Assault Frigate (10 of 15)
+    Ships from group: Command Destroyer (6 of 6)
+    Ships from group: Heavy Assault Cruiser (9 of 14)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('MWDSignatureRadiusBonus'), **kwargs)
+
+
+class Effect4906(BaseEffect):
+    """
+    systemDamageFighters
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4911(BaseEffect):
+    """
+    modifyShieldRechargeRatePassive
+
+    Used by:
+    Modules named like: Processor Overclocking Unit (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('shieldRechargeRate', module.getModifiedItemAttr('shieldRechargeRateMultiplier'), **kwargs)
+
+
+class Effect4921(BaseEffect):
+    """
+    microJumpDrive
+
+    Used by:
+    Modules named like: Micro Jump Drive (6 of 6)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonusPercent'), **kwargs)
+
+
+class Effect4923(BaseEffect):
+    """
+    skillMJDdurationBonus
+
+    Used by:
+    Skill: Micro Jump Drive Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+                                      'duration', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
+
+
+class Effect4928(BaseEffect):
+    """
+    adaptiveArmorHardener
+
+    Used by:
+    Modules from group: Armor Resistance Shift Hardener (2 of 2)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # pyfalog = Logger(__name__)
+
+        damagePattern = module.rahPatternOverride if module.rahPatternOverride is not None else fit.damagePattern
+        # pyfalog.debug('==============================')
+
+        if damagePattern == 'disable':
+            for attr in ('armorEmDamageResonance', 'armorThermalDamageResonance', 'armorKineticDamageResonance', 'armorExplosiveDamageResonance'):
+                fit.ship.multiplyItemAttr(attr, module.getModifiedItemAttr(attr), stackingPenalties=True, penaltyGroup='preMul')
+            return
+
+        # Skip if there is no damage pattern. Example: projected ships or fleet boosters
+        if damagePattern:
+
+            # Populate a tuple with the damage profile modified by current armor resists.
+            baseDamageTaken = (
+                damagePattern.emAmount * fit.ship.getModifiedItemAttr('armorEmDamageResonance'),
+                damagePattern.thermalAmount * fit.ship.getModifiedItemAttr('armorThermalDamageResonance'),
+                damagePattern.kineticAmount * fit.ship.getModifiedItemAttr('armorKineticDamageResonance'),
+                damagePattern.explosiveAmount * fit.ship.getModifiedItemAttr('armorExplosiveDamageResonance'),
+            )
+            # pyfalog.debug('Damage Adjusted for Armor Resists: %f/%f/%f/%f' % (baseDamageTaken[0], baseDamageTaken[1], baseDamageTaken[2], baseDamageTaken[3]))
+
+            resistanceShiftAmount = module.getModifiedItemAttr(
+                'resistanceShiftAmount') / 100  # The attribute is in percent and we want a fraction
+            RAHResistance = [
+                module.getModifiedItemAttr('armorEmDamageResonance'),
+                module.getModifiedItemAttr('armorThermalDamageResonance'),
+                module.getModifiedItemAttr('armorKineticDamageResonance'),
+                module.getModifiedItemAttr('armorExplosiveDamageResonance'),
+            ]
+
+            # Simulate RAH cycles until the RAH either stops changing or enters a loop.
+            # The number of iterations is limited to prevent an infinite loop if something goes wrong.
+            cycleList = []
+            loopStart = -20
+            for num in range(50):
+                # pyfalog.debug('Starting cycle %d.' % num)
+                # The strange order is to emulate the ingame sorting when different types have taken the same amount of damage.
+                # This doesn't take into account stacking penalties. In a few cases fitting a Damage Control causes an inaccurate result.
+                damagePattern_tuples = [
+                    (0, baseDamageTaken[0] * RAHResistance[0], RAHResistance[0]),
+                    (3, baseDamageTaken[3] * RAHResistance[3], RAHResistance[3]),
+                    (2, baseDamageTaken[2] * RAHResistance[2], RAHResistance[2]),
+                    (1, baseDamageTaken[1] * RAHResistance[1], RAHResistance[1]),
+                ]
+
+                # Sort the tuple to drop the highest damage value to the bottom
+                sortedDamagePattern_tuples = sorted(damagePattern_tuples, key=lambda damagePattern: damagePattern[1])
+
+                if sortedDamagePattern_tuples[2][1] == 0:
+                    # One damage type: the top damage type takes from the other three
+                    # Since the resistances not taking damage will end up going to the type taking damage we just do the whole thing at once.
+                    change0 = 1 - sortedDamagePattern_tuples[0][2]
+                    change1 = 1 - sortedDamagePattern_tuples[1][2]
+                    change2 = 1 - sortedDamagePattern_tuples[2][2]
+                    change3 = -(change0 + change1 + change2)
+                elif sortedDamagePattern_tuples[1][1] == 0:
+                    # Two damage types: the top two damage types take from the other two
+                    # Since the resistances not taking damage will end up going equally to the types taking damage we just do the whole thing at once.
+                    change0 = 1 - sortedDamagePattern_tuples[0][2]
+                    change1 = 1 - sortedDamagePattern_tuples[1][2]
+                    change2 = -(change0 + change1) / 2
+                    change3 = -(change0 + change1) / 2
+                else:
+                    # Three or four damage types: the top two damage types take from the other two
+                    change0 = min(resistanceShiftAmount, 1 - sortedDamagePattern_tuples[0][2])
+                    change1 = min(resistanceShiftAmount, 1 - sortedDamagePattern_tuples[1][2])
+                    change2 = -(change0 + change1) / 2
+                    change3 = -(change0 + change1) / 2
+
+                RAHResistance[sortedDamagePattern_tuples[0][0]] = sortedDamagePattern_tuples[0][2] + change0
+                RAHResistance[sortedDamagePattern_tuples[1][0]] = sortedDamagePattern_tuples[1][2] + change1
+                RAHResistance[sortedDamagePattern_tuples[2][0]] = sortedDamagePattern_tuples[2][2] + change2
+                RAHResistance[sortedDamagePattern_tuples[3][0]] = sortedDamagePattern_tuples[3][2] + change3
+                # pyfalog.debug('Resistances shifted to %f/%f/%f/%f' % ( RAHResistance[0], RAHResistance[1], RAHResistance[2], RAHResistance[3]))
+
+                # See if the current RAH profile has been encountered before, indicating a loop.
+                for i, val in enumerate(cycleList):
+                    tolerance = 1e-06
+                    if abs(RAHResistance[0] - val[0]) <= tolerance and \
+                                abs(RAHResistance[1] - val[1]) <= tolerance and \
+                                abs(RAHResistance[2] - val[2]) <= tolerance and \
+                                abs(RAHResistance[3] - val[3]) <= tolerance:
+                        loopStart = i
+                        # pyfalog.debug('Loop found: %d-%d' % (loopStart, num))
+                        break
+                if loopStart >= 0:
+                    break
+
+                cycleList.append(list(RAHResistance))
+
+            # if loopStart < 0:
+                # pyfalog.error('Reactive Armor Hardener failed to find equilibrium. Damage profile after armor: {0}/{1}/{2}/{3}'.format(
+                #             baseDamageTaken[0], baseDamageTaken[1], baseDamageTaken[2], baseDamageTaken[3]))
+
+            # Average the profiles in the RAH loop, or the last 20 if it didn't find a loop.
+            loopCycles = cycleList[loopStart:]
+            numCycles = len(loopCycles)
+            average = [0, 0, 0, 0]
+            for cycle in loopCycles:
+                for i in range(4):
+                    average[i] += cycle[i]
+
+            for i in range(4):
+                average[i] = round(average[i] / numCycles, 3)
+
+            # Set the new resistances
+            # pyfalog.debug('Setting new resist profile: %f/%f/%f/%f' % ( average[0], average[1], average[2],average[3]))
+            for i, attr in enumerate((
+                    'armorEmDamageResonance', 'armorThermalDamageResonance', 'armorKineticDamageResonance',
+                    'armorExplosiveDamageResonance')):
+                module.increaseItemAttr(attr, average[i] - module.getModifiedItemAttr(attr))
+                fit.ship.multiplyItemAttr(attr, average[i], stackingPenalties=True, penaltyGroup='preMul', **kwargs)
+
+
+class Effect4934(BaseEffect):
+    """
+    shipArmorRepairingGF2
+
+    Used by:
+    Ship: Incursus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect4936(BaseEffect):
+    """
+    fueledShieldBoosting
+
+    Used by:
+    Modules from group: Ancillary Shield Booster (14 of 14)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        amount = module.getModifiedItemAttr('shieldBonus')
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        fit.extraAttributes.increase('shieldRepair', amount / speed, **kwargs)
+
+
+class Effect4941(BaseEffect):
+    """
+    shipHybridDamageBonusCF2
+
+    Used by:
+    Ship: Griffin Navy Issue
+    Ship: Merlin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect4945(BaseEffect):
+    """
+    skillTargetBreakerDurationBonus2
+
+    Used by:
+    Skill: Signature Masking
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Signature Suppressor',
+                                      'durationHighisGood', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
+
+
+class Effect4950(BaseEffect):
+    """
+    shipBonusShieldBoosterMB1a
+
+    Used by:
+    Ship: Maelstrom
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect4951(BaseEffect):
+    """
+    shieldBoostAmplifierPassiveBooster
+
+    Used by:
+    Implants named like: Agency 'Hardshell' TB Dose (4 of 4)
+    Implants named like: Blue Pill Booster (5 of 5)
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implant: AIR Hardshell Booster II
+    Implant: Antipharmakon Thureo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
+
+
+class Effect4961(BaseEffect):
+    """
+    systemShieldRepairAmountShieldSkills
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Shield Operation') or
+                                                     mod.item.requiresSkill('Capital Shield Operation'),
+                                         'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect4967(BaseEffect):
+    """
+    shieldBoosterDurationBonusShieldSkills
+
+    Used by:
+    Implants named like: Chemal Tech Repair Booster (3 of 3)
+    Modules named like: Core Defense Operational Solidifier (8 of 8)
+    Implant: AIR Repairer Booster III
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            'duration', module.getModifiedItemAttr('durationSkillBonus'), **kwargs)
+
+
+class Effect4970(BaseEffect):
+    """
+    boosterShieldBoostAmountPenaltyShieldSkills
+
+    Used by:
+    Implants named like: Crash Booster (3 of 4)
+    Implants named like: Frentix Booster (3 of 4)
+    Implants named like: Mindflood Booster (3 of 4)
+    """
+
+    attr = 'boosterShieldBoostAmountPenalty'
+    displayName = 'Shield Boost'
+    type = 'boosterSideEffect'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('boosterShieldBoostAmountPenalty'), **kwargs)
+
+
+class Effect4972(BaseEffect):
+    """
+    eliteBonusAssaultShipLightMissileROF
+
+    Used by:
+    Ship: Cambion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Light',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect4973(BaseEffect):
+    """
+    eliteBonusAssaultShipRocketROF
+
+    Used by:
+    Ship: Cambion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect4974(BaseEffect):
+    """
+    eliteBonusMarauderShieldBonus2a
+
+    Used by:
+    Ship: Golem
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders', **kwargs)
+
+
+class Effect4975(BaseEffect):
+    """
+    shipBonusMissileKineticlATF2
+
+    Used by:
+    Ship: Cambion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
+
+
+class Effect4976(BaseEffect):
+    """
+    skillReactiveArmorHardenerDurationBonus
+
+    Used by:
+    Skill: Resistance Phasing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'duration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'duration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect4989(BaseEffect):
+    """
+    missileSkillAoeCloudSizeBonusAllIncludingCapitals
+
+    Used by:
+    Implants named like: Crash Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeCloudSize', implant.getModifiedItemAttr('aoeCloudSizeBonus'), **kwargs)
+
+
+class Effect4990(BaseEffect):
+    """
+    shipEnergyTCapNeedBonusRookie
+
+    Used by:
+    Ship: Hematos
+    Ship: Impairor
+    Ship: Succubus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('rookieSETCapBonus'), **kwargs)
+
+
+class Effect4991(BaseEffect):
+    """
+    shipSETDmgBonusRookie
+
+    Used by:
+    Ship: Hematos
+    Ship: Immolator
+    Ship: Impairor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('rookieSETDamageBonus'), **kwargs)
+
+
+class Effect4994(BaseEffect):
+    """
+    shipArmorEMResistanceRookie
+
+    Used by:
+    Ship: Devoter
+    Ship: Gold Magnate
+    Ship: Impairor
+    Ship: Phobos
+    Ship: Silver Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('rookieArmorResistanceBonus'), **kwargs)
+
+
+class Effect4995(BaseEffect):
+    """
+    shipArmorEXResistanceRookie
+
+    Used by:
+    Ship: Devoter
+    Ship: Gold Magnate
+    Ship: Impairor
+    Ship: Phobos
+    Ship: Silver Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('rookieArmorResistanceBonus'), **kwargs)
+
+
+class Effect4996(BaseEffect):
+    """
+    shipArmorKNResistanceRookie
+
+    Used by:
+    Ship: Devoter
+    Ship: Gold Magnate
+    Ship: Impairor
+    Ship: Phobos
+    Ship: Silver Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('rookieArmorResistanceBonus'), **kwargs)
+
+
+class Effect4997(BaseEffect):
+    """
+    shipArmorTHResistanceRookie
+
+    Used by:
+    Ship: Devoter
+    Ship: Gold Magnate
+    Ship: Impairor
+    Ship: Phobos
+    Ship: Silver Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('rookieArmorResistanceBonus'), **kwargs)
+
+
+class Effect4999(BaseEffect):
+    """
+    shipHybridRangeBonusRookie
+
+    Used by:
+    Ship: Ibis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('rookieSHTOptimalBonus'), **kwargs)
@@ -0,0 +1,3733 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect5000(BaseEffect):
+    """
+    shipMissileKineticDamageRookie
+
+    Used by:
+    Ship: Ibis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('rookieMissileKinDamageBonus'), **kwargs)
+
+
+class Effect5008(BaseEffect):
+    """
+    shipShieldEMResistanceRookie
+
+    Used by:
+    Ships from group: Heavy Interdiction Cruiser (4 of 6)
+    Ship: Ibis
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('rookieShieldResistBonus'), **kwargs)
+
+
+class Effect5009(BaseEffect):
+    """
+    shipShieldExplosiveResistanceRookie
+
+    Used by:
+    Ships from group: Heavy Interdiction Cruiser (4 of 6)
+    Ship: Ibis
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('rookieShieldResistBonus'), **kwargs)
+
+
+class Effect5011(BaseEffect):
+    """
+    shipShieldKineticResistanceRookie
+
+    Used by:
+    Ships from group: Heavy Interdiction Cruiser (4 of 6)
+    Ship: Ibis
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('rookieShieldResistBonus'), **kwargs)
+
+
+class Effect5012(BaseEffect):
+    """
+    shipShieldThermalResistanceRookie
+
+    Used by:
+    Ships from group: Heavy Interdiction Cruiser (4 of 6)
+    Ship: Ibis
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('rookieShieldResistBonus'), **kwargs)
+
+
+class Effect5013(BaseEffect):
+    """
+    shipSHTDmgBonusRookie
+
+    Used by:
+    Ship: Velator
+    Ship: Violator
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('rookieSHTDamageBonus'), **kwargs)
+
+
+class Effect5014(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierRookie
+
+    Used by:
+    Ship: Gnosis
+    Ship: Praxis
+    Ship: Sunesis
+    Ship: Taipan
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
+
+
+class Effect5015(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerMaxTargetRangeBonusRookie
+
+    Used by:
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxTargetRangeBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
+
+
+class Effect5016(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerScanResolutionBonusRookie
+
+    Used by:
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'scanResolutionBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
+
+
+class Effect5017(BaseEffect):
+    """
+    shipArmorRepairingRookie
+
+    Used by:
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('rookieArmorRepBonus'), **kwargs)
+
+
+class Effect5018(BaseEffect):
+    """
+    shipVelocityBonusRookie
+
+    Used by:
+    Ship: Reaper
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', ship.getModifiedItemAttr('rookieShipVelocityBonus'), **kwargs)
+
+
+class Effect5019(BaseEffect):
+    """
+    minmatarShipEwTargetPainterRookie
+
+    Used by:
+    Ship: Reaper
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('rookieTargetPainterStrengthBonus'), **kwargs)
+
+
+class Effect5020(BaseEffect):
+    """
+    shipSPTDmgBonusRookie
+
+    Used by:
+    Ship: Echo
+    Ship: Reaper
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('rookieSPTDamageBonus'), **kwargs)
+
+
+class Effect5021(BaseEffect):
+    """
+    shipShieldBoostRookie
+
+    Used by:
+    Ship: Immolator
+    Ship: Reaper
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('rookieShieldBoostBonus'), **kwargs)
+
+
+class Effect5028(BaseEffect):
+    """
+    shipECMScanStrengthBonusRookie
+
+    Used by:
+    Ship: Ibis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+                                          'scan{0}StrengthBonus'.format(type),
+                                          ship.getModifiedItemAttr('rookieECMStrengthBonus'), **kwargs)
+
+
+class Effect5030(BaseEffect):
+    """
+    shipBonusMiningDroneAmountPercentRookie
+
+    Used by:
+    Ship: Gnosis
+    Ship: Praxis
+    Ship: Taipan
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+                                     'miningAmount', container.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
+
+
+class Effect5035(BaseEffect):
+    """
+    shipBonusDroneHitpointsRookie
+
+    Used by:
+    Ship: Gnosis
+    Ship: Praxis
+    Ship: Sunesis
+    Ship: Taipan
+    Ship: Velator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         type, ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
+
+
+class Effect5036(BaseEffect):
+    """
+    shipBonusSalvageCycleAF
+
+    Used by:
+    Ship: Magnate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                      'duration', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5045(BaseEffect):
+    """
+    shipBonusSalvageCycleCF
+
+    Used by:
+    Ship: Heron
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                      'duration', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5048(BaseEffect):
+    """
+    shipBonusSalvageCycleGF
+
+    Used by:
+    Ship: Imicus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                      'duration', ship.getModifiedItemAttr('shipBonusGF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5051(BaseEffect):
+    """
+    shipBonusSalvageCycleMF
+
+    Used by:
+    Ship: Probe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+                                      'duration', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5058(BaseEffect):
+    """
+    miningYieldMultiplyPassive
+
+    Used by:
+    Ships named like: Venture (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Mining'),
+                                         'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'), **kwargs)
+
+
+class Effect5066(BaseEffect):
+    """
+    shipBonusTargetPainterOptimalMF1
+
+    Used by:
+    Ship: Hyena
+    Ship: Vigil
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5067(BaseEffect):
+    """
+    miningBargeBonusGeneralMiningHoldCapacity
+
+    Used by:
+    Variations of ship: Retriever (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'generalMiningHoldCapacity', ship.getModifiedItemAttr('miningBargeBonusGeneralMiningHoldCapacity'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect5068(BaseEffect):
+    """
+    miningBargeBonusShieldCapacity
+
+    Used by:
+    Variations of ship: Procurer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', ship.getModifiedItemAttr('miningBargeBonusShieldCapacity'), skill='Mining Barge', **kwargs)
+
+
+class Effect5069(BaseEffect):
+    """
+    deepcoreMiningBonus
+
+    Used by:
+    Module: Medium Deep Core Mining Optimization I
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Mercoxit Ore Processing'),
+            'specializationAsteroidYieldMultiplier',
+            module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
+
+
+class Effect5079(BaseEffect):
+    """
+    shipMissileKineticDamageCF2
+
+    Used by:
+    Ship: Garmur
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5080(BaseEffect):
+    """
+    shipMissileVelocityCF
+
+    Used by:
+    Ship: Caldari Navy Hookbill
+    Ship: Crow
+    Ship: Kestrel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5081(BaseEffect):
+    """
+    maxTargetingRangeBonusPostPercentPassive
+
+    Used by:
+    Modules named like: Ionic Field Projector (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect5087(BaseEffect):
+    """
+    shipBonusDroneHitpointsGF
+
+    Used by:
+    Ship: Astero
+    Ship: Imicus Navy Issue
+    Ship: Maulus Navy Issue
+    Ship: Tristan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         layer, ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5090(BaseEffect):
+    """
+    shipShieldBoostMF
+
+    Used by:
+    Ship: Breacher
+    Ship: Geri
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5103(BaseEffect):
+    """
+    shipBonusShieldTransferCapNeedCF
+
+    Used by:
+    Variations of ship: Bantam (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5104(BaseEffect):
+    """
+    shipBonusShieldTransferBoostAmountCF2
+
+    Used by:
+    Variations of ship: Bantam (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5105(BaseEffect):
+    """
+    shipBonusShieldTransferCapNeedMF
+
+    Used by:
+    Variations of ship: Burst (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5106(BaseEffect):
+    """
+    shipBonusShieldTransferBoostAmountMF2
+
+    Used by:
+    Variations of ship: Burst (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5107(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairCapNeedGF
+
+    Used by:
+    Variations of ship: Navitas (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5108(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairAmountGF2
+
+    Used by:
+    Variations of ship: Navitas (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect5109(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairCapNeedAF
+
+    Used by:
+    Ship: Deacon
+    Ship: Inquisitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5110(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairAmount2AF
+
+    Used by:
+    Ship: Deacon
+    Ship: Inquisitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5111(BaseEffect):
+    """
+    shipBonusDroneTrackingGF
+
+    Used by:
+    Ship: Imicus Navy Issue
+    Ship: Maulus Navy Issue
+    Ship: Tristan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5119(BaseEffect):
+    """
+    shipBonusScanProbeStrength2AF
+
+    Used by:
+    Ship: Magnate
+    Ship: Magnate Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+                                        'baseSensorStrength', ship.getModifiedItemAttr('shipBonus2AF'),
+                                        skill='Amarr Frigate', **kwargs)
+
+
+class Effect5121(BaseEffect):
+    """
+    energyTransferArrayTransferAmountBonus
+
+    Used by:
+    Ship: Augoror
+    Ship: Osprey
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('energyTransferAmountBonus'), **kwargs)
+
+
+class Effect5122(BaseEffect):
+    """
+    shipBonusShieldTransferCapneedMC1
+
+    Used by:
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect5123(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairCapNeedAC1
+
+    Used by:
+    Ship: Augoror
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5124(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairAmountAC2
+
+    Used by:
+    Ship: Augoror
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5125(BaseEffect):
+    """
+    shipBonusRemoteArmorRepairAmountGC2
+
+    Used by:
+    Ship: Exequror
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5126(BaseEffect):
+    """
+    shipBonusShieldTransferBoostAmountCC2
+
+    Used by:
+    Ship: Osprey
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5127(BaseEffect):
+    """
+    shipBonusShieldTransferBoostAmountMC2
+
+    Used by:
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect5128(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerOptimalBonusGC1
+
+    Used by:
+    Ship: Celestis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5129(BaseEffect):
+    """
+    minmatarShipEwTargetPainterMC1
+
+    Used by:
+    Ship: Bellicose
+    Ship: Rapier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC'),
+                                      skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect5131(BaseEffect):
+    """
+    shipMissileRofCC
+
+    Used by:
+    Ships named like: Caracal (2 of 2)
+    Ship: Cobra
+    Ship: Enforcer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'speed', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5132(BaseEffect):
+    """
+    shipPTurretFalloffBonusMC2
+
+    Used by:
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Stabber
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect5133(BaseEffect):
+    """
+    shipHTDamageBonusCC
+
+    Used by:
+    Ship: Moa
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5136(BaseEffect):
+    """
+    shipMETCDamageBonusAC
+
+    Used by:
+    Ship: Augoror Navy Issue
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Maller
+    Ship: Omen Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5139(BaseEffect):
+    """
+    miningFrigateBonusOreMiningYield
+
+    Used by:
+    Variations of ship: Venture (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+                                      'miningAmount', module.getModifiedItemAttr('miningFrigatesBonusOreMiningYield'),
+                                      skill='Mining Frigate', **kwargs)
+
+
+class Effect5153(BaseEffect):
+    """
+    shipMissileVelocityPirateFactionRocket
+
+    Used by:
+    Ship: Corax
+    Ship: Talwar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5162(BaseEffect):
+    """
+    skillReactiveArmorHardenerCapNeedBonus
+
+    Used by:
+    Skill: Resistance Phasing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'capacitorNeed',
+                                      src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
+
+
+class Effect5165(BaseEffect):
+    """
+    shipBonusDroneMWDboostrole
+
+    Used by:
+    Ship: Algos
+    Ship: Dragoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5168(BaseEffect):
+    """
+    droneSalvageBonus
+
+    Used by:
+    Skill: Salvage Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemIncrease(
+            lambda drone: drone.item.requiresSkill('Salvage Drone Operation'), 'accessDifficultyBonus',
+            container.getModifiedItemAttr('accessDifficultyBonus') * container.level, **kwargs)
+
+
+class Effect5180(BaseEffect):
+    """
+    sensorCompensationSensorStrengthBonusGravimetric
+
+    Used by:
+    Skill: Gravimetric Sensor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanGravimetricStrength',
+                               container.getModifiedItemAttr('sensorStrengthBonus') * container.level, **kwargs)
+
+
+class Effect5181(BaseEffect):
+    """
+    sensorCompensationSensorStrengthBonusLadar
+
+    Used by:
+    Skill: Ladar Sensor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanLadarStrength', container.getModifiedItemAttr('sensorStrengthBonus') * container.level, **kwargs)
+
+
+class Effect5182(BaseEffect):
+    """
+    sensorCompensationSensorStrengthBonusMagnetometric
+
+    Used by:
+    Skill: Magnetometric Sensor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanMagnetometricStrength',
+                               container.getModifiedItemAttr('sensorStrengthBonus') * container.level, **kwargs)
+
+
+class Effect5183(BaseEffect):
+    """
+    sensorCompensationSensorStrengthBonusRadar
+
+    Used by:
+    Skill: Radar Sensor Compensation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanRadarStrength', container.getModifiedItemAttr('sensorStrengthBonus') * container.level, **kwargs)
+
+
+class Effect5185(BaseEffect):
+    """
+    shipEnergyVampireAmountBonusFixedAF2
+
+    Used by:
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('shipBonus2AF'),
+                                      skill='Amarr Frigate', **kwargs)
+
+
+class Effect5187(BaseEffect):
+    """
+    shipBonusEwRemoteSensorDampenerFalloffBonusGC1
+
+    Used by:
+    Ship: Celestis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5188(BaseEffect):
+    """
+    trackingSpeedBonusEffectHybrids
+
+    Used by:
+    Modules named like: Hybrid Metastasis Adjuster (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+                                      'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect5189(BaseEffect):
+    """
+    trackingSpeedBonusEffectLasers
+
+    Used by:
+    Implants named like: Tetrimon Precision Booster (4 of 4)
+    Implants named like: Wightstorm Manasikara Booster (4 of 4)
+    Modules named like: Energy Metastasis Adjuster (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalties = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+                                      'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
+                                      stackingPenalties=penalties, **kwargs)
+
+
+class Effect5190(BaseEffect):
+    """
+    trackingSpeedBonusEffectProjectiles
+
+    Used by:
+    Modules named like: Projectile Metastasis Adjuster (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        penalize = 'booster' not in context
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+                                      'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
+                                      stackingPenalties=penalize, **kwargs)
+
+
+class Effect5201(BaseEffect):
+    """
+    armorUpgradesMassPenaltyReductionBonus
+
+    Used by:
+    Skills named like: Armor Layering (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plate',
+                                      'massAddition', container.getModifiedItemAttr('massPenaltyReduction') * level, **kwargs)
+
+
+class Effect5205(BaseEffect):
+    """
+    shipSETTrackingBonusRookie
+
+    Used by:
+    Ship: Immolator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('rookieSETTracking'), **kwargs)
+
+
+class Effect5206(BaseEffect):
+    """
+    shipSETOptimalBonusRookie
+
+    Used by:
+    Ship: Immolator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('rookieSETOptimal'), **kwargs)
+
+
+class Effect5207(BaseEffect):
+    """
+    shipNOSTransferAmountBonusRookie
+
+    Used by:
+    Ship: Hematos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', ship.getModifiedItemAttr('rookieNosDrain'), **kwargs)
+
+
+class Effect5208(BaseEffect):
+    """
+    shipNeutDestabilizationAmountBonusRookie
+
+    Used by:
+    Ship: Hematos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', ship.getModifiedItemAttr('rookieNeutDrain'), **kwargs)
+
+
+class Effect5209(BaseEffect):
+    """
+    shipWebVelocityBonusRookie
+
+    Used by:
+    Ship: Hematos
+    Ship: Violator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'speedFactor', ship.getModifiedItemAttr('rookieWebAmount'), **kwargs)
+
+
+class Effect5212(BaseEffect):
+    """
+    shipDroneMWDSpeedBonusRookie
+
+    Used by:
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: True,
+                                     'maxVelocity', ship.getModifiedItemAttr('rookieDroneMWDspeed'), **kwargs)
+
+
+class Effect5213(BaseEffect):
+    """
+    shipRocketMaxVelocityBonusRookie
+
+    Used by:
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        penalties = 'ship' not in context
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Rockets'), 'maxVelocity',
+            ship.getModifiedItemAttr('rookieRocketVelocity'), stackingPenalties=penalties, **kwargs)
+
+
+class Effect5214(BaseEffect):
+    """
+    shipLightMissileMaxVelocityBonusRookie
+
+    Used by:
+    Ship: Taipan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        penalties = 'ship' not in context
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Light Missiles'), 'maxVelocity',
+            ship.getModifiedItemAttr('rookieLightMissileVelocity'), stackingPenalties=penalties, **kwargs)
+
+
+class Effect5215(BaseEffect):
+    """
+    shipSHTTrackingSpeedBonusRookie
+
+    Used by:
+    Ship: Violator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('rookieSHTTracking'), **kwargs)
+
+
+class Effect5216(BaseEffect):
+    """
+    shipSHTFalloffBonusRookie
+
+    Used by:
+    Ship: Violator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('rookieSHTFalloff'), **kwargs)
+
+
+class Effect5217(BaseEffect):
+    """
+    shipSPTTrackingSpeedBonusRookie
+
+    Used by:
+    Ship: Echo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('rookieSPTTracking'), **kwargs)
+
+
+class Effect5218(BaseEffect):
+    """
+    shipSPTFalloffBonusRookie
+
+    Used by:
+    Ship: Echo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('rookieSPTFalloff'), **kwargs)
+
+
+class Effect5219(BaseEffect):
+    """
+    shipSPTOptimalRangeBonusRookie
+
+    Used by:
+    Ship: Echo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('rookieSPTOptimal'), **kwargs)
+
+
+class Effect5220(BaseEffect):
+    """
+    shipProjectileDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5221(BaseEffect):
+    """
+    shipHeavyAssaultMissileEMDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5222(BaseEffect):
+    """
+    shipHeavyAssaultMissileKinDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5223(BaseEffect):
+    """
+    shipHeavyAssaultMissileThermDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5224(BaseEffect):
+    """
+    shipHeavyAssaultMissileExpDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5225(BaseEffect):
+    """
+    shipHeavyMissileEMDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5226(BaseEffect):
+    """
+    shipHeavyMissileExpDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5227(BaseEffect):
+    """
+    shipHeavyMissileKinDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5228(BaseEffect):
+    """
+    shipHeavyMissileThermDmgPirateCruiser
+
+    Used by:
+    Ship: Gnosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5229(BaseEffect):
+    """
+    shipScanProbeStrengthBonusPirateCruiser
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Astero
+    Ship: Gnosis
+    Ship: Odysseus
+    Ship: Praxis
+    Ship: Sunesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', container.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect5230(BaseEffect):
+    """
+    modifyActiveShieldResonancePostPercent
+
+    Used by:
+    Modules from group: Flex Shield Hardener (5 of 5)
+    Modules from group: Shield Hardener (103 of 103)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for damageType in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('shield' + damageType.capitalize() + 'DamageResonance',
+                                   module.getModifiedItemAttr(damageType + 'DamageResistanceBonus'),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect5231(BaseEffect):
+    """
+    modifyActiveArmorResonancePostPercent
+
+    Used by:
+    Modules from group: Armor Hardener (148 of 148)
+    Modules from group: Flex Armor Hardener (4 of 4)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for damageType in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('armor%sDamageResonance' % damageType.capitalize(),
+                                   module.getModifiedItemAttr('%sDamageResistanceBonus' % damageType),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect5234(BaseEffect):
+    """
+    shipSmallMissileExpDmgCF2
+
+    Used by:
+    Ship: Caldari Navy Hookbill
+    Ship: Kestrel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5237(BaseEffect):
+    """
+    shipSmallMissileKinDmgCF2
+
+    Used by:
+    Ship: Kestrel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5240(BaseEffect):
+    """
+    shipSmallMissileThermDmgCF2
+
+    Used by:
+    Ship: Caldari Navy Hookbill
+    Ship: Kestrel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5243(BaseEffect):
+    """
+    shipSmallMissileEMDmgCF2
+
+    Used by:
+    Ship: Caldari Navy Hookbill
+    Ship: Kestrel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            'emDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5259(BaseEffect):
+    """
+    reconShipCloakCpuBonus1
+
+    Used by:
+    Ships from group: Force Recon Ship (7 of 10)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+                                      'cpu', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect5260(BaseEffect):
+    """
+    covertOpsCloakCpuPercentBonus1
+
+    Used by:
+    Ships from group: Covert Ops (6 of 9)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+                                      'cpu', ship.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops', **kwargs)
+
+
+class Effect5261(BaseEffect):
+    """
+    CovertCloakCPUAddition
+
+    Used by:
+    Modules named like: Covert Ops Cloaking Device II (2 of 2)
+    Module: Covert Cynosural Field Generator I
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.increaseItemAttr('cpu', module.getModifiedItemAttr('covertCloakCPUAdd') or 0, **kwargs)
+
+
+class Effect5262(BaseEffect):
+    """
+    covertOpsCloakCpuPenalty
+
+    Used by:
+    Subsystems from group: Defensive Subsystem (8 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cloaking'),
+                                         'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
+
+
+class Effect5263(BaseEffect):
+    """
+    covertCynoCpuPenalty
+
+    Used by:
+    Subsystems from group: Defensive Subsystem (8 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+                                         'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
+
+
+class Effect5264(BaseEffect):
+    """
+    warfareLinkCPUAddition
+
+    Used by:
+    Modules from group: Command Burst (15 of 15)
+    Modules from group: Gang Coordinator (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.increaseItemAttr('cpu', module.getModifiedItemAttr('warfareLinkCPUAdd') or 0, **kwargs)
+
+
+class Effect5265(BaseEffect):
+    """
+    warfareLinkCpuPenalty
+
+    Used by:
+    Subsystems from group: Offensive Subsystem (8 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'),
+                                         'warfareLinkCPUAdd', module.getModifiedItemAttr('warfareLinkCPUPenalty'), **kwargs)
+
+
+class Effect5266(BaseEffect):
+    """
+    blockadeRunnerCloakCpuPercentBonus
+
+    Used by:
+    Ships from group: Blockade Runner (5 of 5)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+                                      'cpu', ship.getModifiedItemAttr('eliteIndustrialCovertCloakBonus'),
+                                      skill='Transport Ships', **kwargs)
+
+
+class Effect5267(BaseEffect):
+    """
+    drawbackRepairSystemsPGNeed
+
+    Used by:
+    Modules named like: Auxiliary Nano Pump (6 of 8)
+    Modules named like: Nanobot Accelerator (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'power', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect5268(BaseEffect):
+    """
+    drawbackCapRepPGNeed
+
+    Used by:
+    Variations of module: Capital Auxiliary Nano Pump I (2 of 2)
+    Variations of module: Capital Nanobot Accelerator I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+                                      'power', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect5275(BaseEffect):
+    """
+    fueledArmorRepair
+
+    Used by:
+    Modules from group: Ancillary Armor Repairer (12 of 12)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if module.charge and module.charge.name == 'Nanite Repair Paste':
+            multiplier = 3
+        else:
+            multiplier = 1
+
+        amount = module.getModifiedItemAttr('armorDamageAmount') * multiplier
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        rps = amount / speed
+        fit.extraAttributes.increase('armorRepair', rps, **kwargs)
+        fit.extraAttributes.increase('armorRepairPreSpool', rps, **kwargs)
+        fit.extraAttributes.increase('armorRepairFullSpool', rps, **kwargs)
+
+
+class Effect5293(BaseEffect):
+    """
+    shipLaserCapNeed2AD1
+
+    Used by:
+    Ship: Coercer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect5294(BaseEffect):
+    """
+    shipLaserTracking2AD2
+
+    Used by:
+    Ship: Coercer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect5295(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierAD1
+
+    Used by:
+    Variations of ship: Dragoon (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect5300(BaseEffect):
+    """
+    shipBonusDroneHitpointsAD1
+
+    Used by:
+    Variations of ship: Dragoon (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+                                     src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+                                     src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+                                     src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect5303(BaseEffect):
+    """
+    shipHybridRange1CD1
+
+    Used by:
+    Ship: Cormorant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5304(BaseEffect):
+    """
+    shipHybridTrackingCD2
+
+    Used by:
+    Ship: Cormorant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5305(BaseEffect):
+    """
+    shipBonusFrigateSizedMissileKineticDamageCD1
+
+    Used by:
+    Ship: Corax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
+                                        skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5306(BaseEffect):
+    """
+    shipRocketKineticDmgCD1
+
+    Used by:
+    Ship: Corax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
+                                        skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5307(BaseEffect):
+    """
+    shipBonusAoeVelocityRocketsCD2
+
+    Used by:
+    Ship: Corax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5308(BaseEffect):
+    """
+    shipBonusAoeVelocityStandardMissilesCD2
+
+    Used by:
+    Ship: Corax
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5309(BaseEffect):
+    """
+    shipHybridFallOff1GD1
+
+    Used by:
+    Ship: Catalyst
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect5310(BaseEffect):
+    """
+    shipHybridTracking1GD2
+
+    Used by:
+    Ship: Algos
+    Ship: Catalyst
+    Ship: Eris
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGD2'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect5311(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierGD1
+
+    Used by:
+    Variations of ship: Algos (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect5316(BaseEffect):
+    """
+    shipBonusDroneHitpointsGD1
+
+    Used by:
+    Variations of ship: Algos (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+                                     src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+                                     src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+                                     src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect5317(BaseEffect):
+    """
+    shipProjectileDamageMD1
+
+    Used by:
+    Ship: Sabre
+    Ship: Thrasher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMD1'),
+                                      skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect5318(BaseEffect):
+    """
+    shipProjectileTracking1MD2
+
+    Used by:
+    Ship: Sabre
+    Ship: Thrasher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusMD2'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect5319(BaseEffect):
+    """
+    shipBonusFrigateSizedLightMissileExplosiveDamageMD1
+
+    Used by:
+    Ship: Talwar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
+                                        skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect5320(BaseEffect):
+    """
+    shipRocketExplosiveDmgMD1
+
+    Used by:
+    Ship: Talwar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
+                                        skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect5321(BaseEffect):
+    """
+    shipBonusMWDSignatureRadiusMD2
+
+    Used by:
+    Ship: Talwar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMD2'),
+                                      skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect5322(BaseEffect):
+    """
+    shipArmorEMResistance1ABC1
+
+    Used by:
+    Ship: Absolution
+    Ship: Damnation
+    Ship: Prophecy
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusABC1'),
+                               skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5323(BaseEffect):
+    """
+    shipArmorExplosiveResistance1ABC1
+
+    Used by:
+    Ship: Absolution
+    Ship: Damnation
+    Ship: Prophecy
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusABC1'),
+                               skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5324(BaseEffect):
+    """
+    shipArmorKineticResistance1ABC1
+
+    Used by:
+    Ship: Absolution
+    Ship: Damnation
+    Ship: Prophecy
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusABC1'),
+                               skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5325(BaseEffect):
+    """
+    shipArmorThermResistance1ABC1
+
+    Used by:
+    Ship: Absolution
+    Ship: Damnation
+    Ship: Prophecy
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusABC1'),
+                               skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5326(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierABC2
+
+    Used by:
+    Ships named like: Prophecy (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
+                                     skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5331(BaseEffect):
+    """
+    shipBonusDroneHitpointsABC2
+
+    Used by:
+    Ships named like: Prophecy (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         layer, ship.getModifiedItemAttr('shipBonusABC2'), skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5332(BaseEffect):
+    """
+    shipLaserCapABC1
+
+    Used by:
+    Ship: Harbinger
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5333(BaseEffect):
+    """
+    shipLaserDamageBonusABC2
+
+    Used by:
+    Ships named like: Harbinger (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5334(BaseEffect):
+    """
+    shipHybridOptimal1CBC1
+
+    Used by:
+    Ship: Ferox
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5335(BaseEffect):
+    """
+    shipShieldEmResistance1CBC2
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('shipBonusCBC2'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5336(BaseEffect):
+    """
+    shipShieldExplosiveResistance1CBC2
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusCBC2'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5337(BaseEffect):
+    """
+    shipShieldKineticResistance1CBC2
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('shipBonusCBC2'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5338(BaseEffect):
+    """
+    shipShieldThermalResistance1CBC2
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('shipBonusCBC2'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5339(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileKineticDamageCBC1
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
+                                        skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5340(BaseEffect):
+    """
+    shipBonusHeavyMissileKineticDamageCBC1
+
+    Used by:
+    Ship: Drake
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
+                                        skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5341(BaseEffect):
+    """
+    shipHybridDmg1GBC1
+
+    Used by:
+    Variations of ship: Brutix (3 of 3)
+    Ship: Myrmidon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
+                                      skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5342(BaseEffect):
+    """
+    shipArmorRepairing1GBC2
+
+    Used by:
+    Ships named like: Myrmidon (2 of 2)
+    Ship: Astarte
+    Ship: Brutix
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGBC2'),
+                                      skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5343(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierGBC1
+
+    Used by:
+    Ships named like: Myrmidon (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
+                                     skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5348(BaseEffect):
+    """
+    shipBonusDroneHitpointsGBC1
+
+    Used by:
+    Ships named like: Myrmidon (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                         layer, ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5349(BaseEffect):
+    """
+    shipBonusHeavyMissileLauncherRofMBC2
+
+    Used by:
+    Variations of ship: Cyclone (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+                                      'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5350(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileLauncherRofMBC2
+
+    Used by:
+    Variations of ship: Cyclone (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+                                      'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5351(BaseEffect):
+    """
+    shipShieldBoost1MBC1
+
+    Used by:
+    Ship: Cyclone
+    Ship: Sleipnir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMBC1'),
+                                      skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5352(BaseEffect):
+    """
+    shipBonusProjectileDamageMBC1
+
+    Used by:
+    Ships named like: Hurricane (2 of 2)
+    Ship: Khizriel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC1'),
+                                      skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5353(BaseEffect):
+    """
+    shipProjectileRof1MBC2
+
+    Used by:
+    Ship: Hurricane
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5354(BaseEffect):
+    """
+    shipLargeLaserCapABC1
+
+    Used by:
+    Ship: Oracle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5355(BaseEffect):
+    """
+    shipLargeLaserDamageBonusABC2
+
+    Used by:
+    Ship: Oracle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5356(BaseEffect):
+    """
+    shipHybridRangeBonusCBC1
+
+    Used by:
+    Ship: Naga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5357(BaseEffect):
+    """
+    shipHybridDamageBonusCBC2
+
+    Used by:
+    Ship: Naga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
+                                      skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5358(BaseEffect):
+    """
+    shipLargeHybridTrackingBonusGBC1
+
+    Used by:
+    Ship: Talos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC1'),
+                                      skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5359(BaseEffect):
+    """
+    shipHybridDamageBonusGBC2
+
+    Used by:
+    Ship: Talos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC2'),
+                                      skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5360(BaseEffect):
+    """
+    shipProjectileRofBonusMBC1
+
+    Used by:
+    Ship: Tornado
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5361(BaseEffect):
+    """
+    shipProjectileFalloffBonusMBC2
+
+    Used by:
+    Ship: Tornado
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5364(BaseEffect):
+    """
+    armorAllRepairSystemsAmountBonusPassive
+
+    Used by:
+    Implants named like: Agency 'Hardshell' TB Dose (4 of 4)
+    Implants named like: Exile Booster (4 of 4)
+    Implants named like: Halcyon R Booster (5 of 5)
+    Implant: AIR Hardshell Booster II
+    Implant: Antipharmakon Kosybo
+    Implant: Wisdom of Gheinok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Capital Repair Systems'),
+            'armorDamageAmount', booster.getModifiedItemAttr('armorDamageAmountBonus') or 0, **kwargs)
+
+
+class Effect5365(BaseEffect):
+    """
+    eliteBonusViolatorsRepairSystemsArmorDamageAmount2
+
+    Used by:
+    Ships from group: Marauder (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('eliteBonusViolators2'),
+                                      skill='Marauders', **kwargs)
+
+
+class Effect5366(BaseEffect):
+    """
+    shipBonusRepairSystemsBonusATC2
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
+
+
+class Effect5367(BaseEffect):
+    """
+    shipBonusRepairSystemsArmorRepairAmountGB2
+
+    Used by:
+    Ship: Hyperion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGB2'),
+                                      skill='Gallente Battleship', **kwargs)
+
+
+class Effect5378(BaseEffect):
+    """
+    shipHeavyMissileAOECloudSizeCBC1
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
+                                        skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5379(BaseEffect):
+    """
+    shipHeavyAssaultMissileAOECloudSizeCBC1
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
+                                        skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect5380(BaseEffect):
+    """
+    shipHybridTrackingGBC2
+
+    Used by:
+    Ship: Brutix Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC2'),
+                                      skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect5381(BaseEffect):
+    """
+    shipEnergyTrackingABC1
+
+    Used by:
+    Ship: Harbinger Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusABC1'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5382(BaseEffect):
+    """
+    shipBonusMETOptimalAC2
+
+    Used by:
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Omen Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5383(BaseEffect):
+    """
+    shipMissileEMDamageCC
+
+    Used by:
+    Ship: Laelaps
+    Ship: Orthrus
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5384(BaseEffect):
+    """
+    shipMissileThermDamageCC
+
+    Used by:
+    Ship: Laelaps
+    Ship: Orthrus
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5385(BaseEffect):
+    """
+    shipMissileExpDamageCC
+
+    Used by:
+    Ship: Laelaps
+    Ship: Orthrus
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5386(BaseEffect):
+    """
+    shipMissileKinDamageCC2
+
+    Used by:
+    Ship: Rook
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5387(BaseEffect):
+    """
+    shipHeavyAssaultMissileAOECloudSizeCC2
+
+    Used by:
+    Ship: Caracal Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5388(BaseEffect):
+    """
+    shipHeavyMissileAOECloudSizeCC2
+
+    Used by:
+    Ship: Caracal Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5397(BaseEffect):
+    """
+    baseMaxScanDeviationModifierModuleOnline2None
+
+    Used by:
+    Variations of module: Scan Pinpointing Array I (3 of 3)
+    Module: Triplot Scan Acquisition Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseMaxScanDeviation',
+                                        module.getModifiedItemAttr('maxScanDeviationModifierModule'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect5398(BaseEffect):
+    """
+    systemScanDurationModuleModifier
+
+    Used by:
+    Modules from group: Scanning Upgrade Time (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+                                      'duration', module.getModifiedItemAttr('scanDurationBonus'), **kwargs)
+
+
+class Effect5399(BaseEffect):
+    """
+    baseSensorStrengthModifierModule
+
+    Used by:
+    Variations of module: Scan Rangefinding Array I (3 of 3)
+    Module: Triplot Scan Acquisition Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', module.getModifiedItemAttr('scanStrengthBonusModule'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect5402(BaseEffect):
+    """
+    shipMissileHeavyAssaultVelocityABC2
+
+    Used by:
+    Ship: Damnation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
+                                        skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5403(BaseEffect):
+    """
+    shipMissileHeavyVelocityABC2
+
+    Used by:
+    Ship: Damnation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
+                                        skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5410(BaseEffect):
+    """
+    shipLaserCap1ABC2
+
+    Used by:
+    Ship: Absolution
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC2'),
+                                      skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect5411(BaseEffect):
+    """
+    shipMissileVelocityCD1
+
+    Used by:
+    Ship: Flycatcher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect5417(BaseEffect):
+    """
+    shipBonusDroneDamageMultiplierAB
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect5418(BaseEffect):
+    """
+    shipBonusDroneArmorHitPointsAB
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect5419(BaseEffect):
+    """
+    shipBonusDroneShieldHitPointsAB
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect5420(BaseEffect):
+    """
+    shipBonusDroneStructureHitPointsAB
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect5424(BaseEffect):
+    """
+    shipLargeHybridTurretRofGB
+
+    Used by:
+    Ship: Megathron
+    Ship: Megathron Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect5427(BaseEffect):
+    """
+    shipBonusDroneTrackingGB
+
+    Used by:
+    Ship: Dominix
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect5428(BaseEffect):
+    """
+    shipBonusDroneOptimalRangeGB
+
+    Used by:
+    Ship: Dominix
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect5429(BaseEffect):
+    """
+    shipBonusMissileAoeVelocityMB2
+
+    Used by:
+    Ship: Typhoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5430(BaseEffect):
+    """
+    shipBonusAoeVelocityCruiseMissilesMB2
+
+    Used by:
+    Ship: Typhoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5433(BaseEffect):
+    """
+    hackingSkillVirusBonus
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Modules named like: Memetic Algorithm Bank (8 of 8)
+    Implant: Neural Lace 'Blackglass' Net Intrusion 920-40
+    Implant: Neural Lace 'Bluefire' Net Ablation 960-10
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    Implant: Poteque 'Prospector' Hacking HC-905
+    Skill: Hacking
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+                                         'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
+
+
+class Effect5437(BaseEffect):
+    """
+    archaeologySkillVirusBonus
+
+    Used by:
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Modules named like: Emission Scope Sharpener (8 of 8)
+    Implant: Poteque 'Prospector' Archaeology AC-905
+    Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+    Skill: Archaeology
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+                                         'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
+
+
+class Effect5440(BaseEffect):
+    """
+    systemStandardMissileKineticDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                           'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5444(BaseEffect):
+    """
+    shipTorpedoAOECloudSize1CB
+
+    Used by:
+    Ship: Raven Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5445(BaseEffect):
+    """
+    shipCruiseMissileAOECloudSize1CB
+
+    Used by:
+    Ship: Raven Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5456(BaseEffect):
+    """
+    shipCruiseMissileROFCB
+
+    Used by:
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+                                      'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5457(BaseEffect):
+    """
+    shipTorpedoROFCB
+
+    Used by:
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+                                      'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5459(BaseEffect):
+    """
+    hackingVirusStrengthBonus
+
+    Used by:
+    Implants named like: Chemal Tech Exploration Booster (3 of 3)
+    Implant: Neural Lace 'Blackglass' Net Intrusion 920-40
+    Implant: Neural Lace 'Bluefire' Net Ablation 960-10
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'), **kwargs)
+
+
+class Effect5460(BaseEffect):
+    """
+    minigameVirusStrengthBonus
+
+    Used by:
+    Ships from group: Covert Ops (8 of 9)
+    Ships named like: Stratios (2 of 2)
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    Variations of ship: Heron (3 of 3)
+    Variations of ship: Imicus (3 of 3)
+    Variations of ship: Magnate (3 of 5)
+    Variations of ship: Probe (3 of 3)
+    Ship: Astero
+    Ship: Metamorphosis
+    Ship: Nestor
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemIncrease(
+            lambda mod: (mod.item.requiresSkill('Hacking') or mod.item.requiresSkill('Archaeology')),
+            'virusStrength', container.getModifiedItemAttr('virusStrengthBonus') * level, **kwargs)
+
+
+class Effect5461(BaseEffect):
+    """
+    shieldOperationRechargeratebonusPostPercentOnline
+
+    Used by:
+    Modules from group: Shield Power Relay (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldRechargeRate', module.getModifiedItemAttr('rechargeratebonus') or 0, **kwargs)
+
+
+class Effect5468(BaseEffect):
+    """
+    shipBonusAgilityCI2
+
+    Used by:
+    Ship: Badger
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Hauler'
+            penalties = False
+        else:
+            skill = None
+            penalties = True
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('shipBonusCI2'),
+                               skill=skill, stackingPenalties=penalties, **kwargs)
+
+
+class Effect5469(BaseEffect):
+    """
+    shipBonusAgilityMI2
+
+    Used by:
+    Ship: Wreathe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('shipBonusMI2'), skill='Minmatar Hauler', **kwargs)
+
+
+class Effect5470(BaseEffect):
+    """
+    shipBonusAgilityGI2
+
+    Used by:
+    Ship: Nereus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('shipBonusGI2'), skill='Gallente Hauler', **kwargs)
+
+
+class Effect5471(BaseEffect):
+    """
+    shipBonusAgilityAI2
+
+    Used by:
+    Ship: Sigil
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('shipBonusAI2'), skill='Amarr Hauler', **kwargs)
+
+
+class Effect5477(BaseEffect):
+    """
+    shipBonusAmmoBayMI2
+
+    Used by:
+    Ship: Hoarder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('specialAmmoHoldCapacity', ship.getModifiedItemAttr('shipBonusMI2'),
+                               skill='Minmatar Hauler', **kwargs)
+
+
+class Effect5478(BaseEffect):
+    """
+    shipBonusPICommoditiesHoldGI2
+
+    Used by:
+    Ship: Epithal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('specialPlanetaryCommoditiesHoldCapacity', ship.getModifiedItemAttr('shipBonusGI2'),
+                               skill='Gallente Hauler', **kwargs)
+
+
+class Effect5479(BaseEffect):
+    """
+    shipBonusMineralBayGI2
+
+    Used by:
+    Ship: Kryos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('specialMineralHoldCapacity', ship.getModifiedItemAttr('shipBonusGI2'),
+                               skill='Gallente Hauler', **kwargs)
+
+
+class Effect5480(BaseEffect):
+    """
+    setBonusChristmasBonusVelocity
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'implantBonusVelocity', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect5482(BaseEffect):
+    """
+    setBonusChristmasAgilityBonus
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'agilityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect5483(BaseEffect):
+    """
+    setBonusChristmasShieldCapacityBonus
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'shieldCapacityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect5484(BaseEffect):
+    """
+    setBonusChristmasArmorHPBonus2
+
+    Used by:
+    Implants named like: Genolution Core Augmentation CA (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+                                                 'armorHpBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
+
+
+class Effect5485(BaseEffect):
+    """
+    shipSPTOptimalBonusMF
+
+    Used by:
+    Ship: Chremoas
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5486(BaseEffect):
+    """
+    shipBonusProjectileDamageMBC2
+
+    Used by:
+    Ship: Sleipnir
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC2'),
+                                      skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect5496(BaseEffect):
+    """
+    eliteBonusCommandShipHAMRoFCS1
+
+    Used by:
+    Ship: Claymore
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
+
+
+class Effect5497(BaseEffect):
+    """
+    eliteBonusCommandShipHMRoFCS1
+
+    Used by:
+    Ship: Claymore
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+                                      'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
+
+
+class Effect5499(BaseEffect):
+    """
+    eliteBonusCommandShipsHeavyAssaultMissileExplosionRadiusCS2
+
+    Used by:
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                        skill='Command Ships', **kwargs)
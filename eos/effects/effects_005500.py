@@ -0,0 +1,2689 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect5500(BaseEffect):
+    """
+    eliteBonusCommandShipsHeavyMissileExplosionRadiusCS2
+
+    Used by:
+    Ship: Nighthawk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                        skill='Command Ships', **kwargs)
+
+
+class Effect5501(BaseEffect):
+    """
+    eliteBonusCommandShipMediumHybridDamageCS2
+
+    Used by:
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                      skill='Command Ships', **kwargs)
+
+
+class Effect5505(BaseEffect):
+    """
+    eliteBonusCommandShipMediumHybridRoFCS1
+
+    Used by:
+    Ship: Astarte
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
+
+
+class Effect5514(BaseEffect):
+    """
+    eliteBonusCommandShipHeavyAssaultMissileDamageCS2
+
+    Used by:
+    Ship: Damnation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for damageType in damageTypes:
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                            '{0}Damage'.format(damageType),
+                                            ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
+
+
+class Effect5521(BaseEffect):
+    """
+    eliteBonusCommandShipHeavyMissileDamageCS2
+
+    Used by:
+    Ship: Damnation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for damageType in damageTypes:
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                            '{0}Damage'.format(damageType),
+                                            ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
+
+
+class Effect5539(BaseEffect):
+    """
+    shipBonusHMLKineticDamageAC
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5540(BaseEffect):
+    """
+    shipBonusHMLEMDamageAC
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5541(BaseEffect):
+    """
+    shipBonusHMLThermDamageAC
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5542(BaseEffect):
+    """
+    shipBonusHMLExploDamageAC
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5552(BaseEffect):
+    """
+    shipBonusHMLVelocityEliteBonusHeavyGunship1
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                        skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect5553(BaseEffect):
+    """
+    shipBonusHAMVelocityEliteBonusHeavyGunship1
+
+    Used by:
+    Ship: Sacrilege
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                        skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect5554(BaseEffect):
+    """
+    shipBonusArmorRepAmountGC2
+
+    Used by:
+    Ship: Deimos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC2'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5555(BaseEffect):
+    """
+    shipBonusHeavyDroneSpeedGC
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'maxVelocity', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5556(BaseEffect):
+    """
+    shipBonusHeavyDRoneTrackingGC
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5557(BaseEffect):
+    """
+    shipBonusSentryDroneOptimalRangeEliteBonusHeavyGunship2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                     skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect5558(BaseEffect):
+    """
+    shipBonusSentryDroneTrackingEliteBonusHeavyGunship2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                     skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect5559(BaseEffect):
+    """
+    shipBonusShieldBoostAmountMC2
+
+    Used by:
+    Ship: Vagabond
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect5560(BaseEffect):
+    """
+    roleBonusMarauderMJDRReactivationDelayBonus
+
+    Used by:
+    Module: Anhinga Tertiary Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        penalties = 'ship' not in context
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Micro Jump Drive', 'moduleReactivationDelay',
+            ship.getModifiedItemAttr('roleBonusMarauder'), stackingPenalties=penalties, **kwargs)
+
+
+class Effect5564(BaseEffect):
+    """
+    subSystemBonusCaldariOffensiveCommandBursts
+
+    Used by:
+    Subsystem: Tengu Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
+                                                       mod.item.requiresSkill('Shield Command') or
+                                                       mod.item.requiresSkill('Information Command')),
+                                          attrName, src.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
+                                          skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect5568(BaseEffect):
+    """
+    subSystemBonusGallenteOffensiveCommandBursts
+
+    Used by:
+    Subsystem: Proteus Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
+                                                       mod.item.requiresSkill('Armored Command') or
+                                                       mod.item.requiresSkill('Information Command')),
+                                          attrName, src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
+                                          skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect5570(BaseEffect):
+    """
+    subSystemBonusMinmatarOffensiveCommandBursts
+
+    Used by:
+    Subsystem: Loki Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
+                                                       mod.item.requiresSkill('Shield Command') or
+                                                       mod.item.requiresSkill('Armored Command')),
+                                          attrName, src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
+                                          skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect5572(BaseEffect):
+    """
+    eliteBonusCommandShipArmoredCS3
+
+    Used by:
+    Ships from group: Command Ship (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
+                                          skill='Command Ships', **kwargs)
+
+
+class Effect5573(BaseEffect):
+    """
+    eliteBonusCommandShipSiegeCS3
+
+    Used by:
+    Ships from group: Command Ship (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
+                                          skill='Command Ships', **kwargs)
+
+
+class Effect5574(BaseEffect):
+    """
+    eliteBonusCommandShipSkirmishCS3
+
+    Used by:
+    Ships from group: Command Ship (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
+                                          skill='Command Ships', **kwargs)
+
+
+class Effect5575(BaseEffect):
+    """
+    eliteBonusCommandShipInformationCS3
+
+    Used by:
+    Ships from group: Command Ship (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
+                                          skill='Command Ships', **kwargs)
+
+
+class Effect5607(BaseEffect):
+    """
+    capacitorEmissionSystemskill
+
+    Used by:
+    Implants named like: Inherent Implants 'Squire' Capacitor Emission Systems ES (6 of 6)
+    Modules named like: Egress Port Maximizer (8 of 8)
+    Skill: Capacitor Emission Systems
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+                                      'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
+
+
+class Effect5610(BaseEffect):
+    """
+    shipBonusLargeEnergyTurretMaxRangeAB
+
+    Used by:
+    Ship: Marshal
+    Ship: Paladin
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect5611(BaseEffect):
+    """
+    shipBonusHTFalloffGB2
+
+    Used by:
+    Ship: Kronos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect5618(BaseEffect):
+    """
+    shipBonusRHMLROF2CB
+
+    Used by:
+    Ship: Raven
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        if 'ship' in context:
+            skill = 'Caldari Battleship'
+            penalties = False
+            penaltyGroup = None
+        else:
+            skill = None
+            penalties = True
+            penaltyGroup = 'postPerc'
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy', 'speed',
+            ship.getModifiedItemAttr('shipBonus2CB'), skill=skill,
+            stackingPenalties=penalties, penaltyGroup=penaltyGroup, **kwargs)
+
+
+class Effect5619(BaseEffect):
+    """
+    shipBonusRHMLROFCB
+
+    Used by:
+    Ship: Scorpion Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+                                      'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5620(BaseEffect):
+    """
+    shipBonusRHMLROFMB
+
+    Used by:
+    Ship: Typhoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+                                      'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5621(BaseEffect):
+    """
+    shipBonusCruiseROFMB
+
+    Used by:
+    Ship: Typhoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+                                      'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5622(BaseEffect):
+    """
+    shipBonusTorpedoROFMB
+
+    Used by:
+    Ship: Typhoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+                                      'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5628(BaseEffect):
+    """
+    shipBonusCruiseMissileEMDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5629(BaseEffect):
+    """
+    shipBonusCruiseMissileThermDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5630(BaseEffect):
+    """
+    shipBonusCruiseMissileKineticDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5631(BaseEffect):
+    """
+    shipBonusCruiseMissileExploDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5632(BaseEffect):
+    """
+    shipBonusTorpedoMissileExploDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5633(BaseEffect):
+    """
+    shipBonusTorpedoMissileEMDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5634(BaseEffect):
+    """
+    shipBonusTorpedoMissileThermDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5635(BaseEffect):
+    """
+    shipBonusTorpedoMissileKineticDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5636(BaseEffect):
+    """
+    shipBonusHeavyMissileEMDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5637(BaseEffect):
+    """
+    shipBonusHeavyMissileThermDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5638(BaseEffect):
+    """
+    shipBonusHeavyMissileKineticDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5639(BaseEffect):
+    """
+    shipBonusHeavyMissileExploDmgMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
+                                        skill='Minmatar Battleship', **kwargs)
+
+
+class Effect5644(BaseEffect):
+    """
+    shipBonusMissileVelocityCC2
+
+    Used by:
+    Ship: Cerberus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5647(BaseEffect):
+    """
+    covertOpsCloakCPUPercentRoleBonus
+
+    Used by:
+    Ships from group: Expedition Frigate (2 of 2)
+    Ship: Astero
+    Ship: Cenotaph
+    Ship: Cobra
+    Ship: Enforcer
+    Ship: Pacifier
+    Ship: Sidewinder
+    Ship: Tholos
+    Ship: Victor
+    Ship: Victorieux Luxury Yacht
+    Ship: Virtuoso
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+                                      'cpu', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5650(BaseEffect):
+    """
+    shipArmorResistanceAF1
+
+    Used by:
+    Ship: Malediction
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr('armor{0}DamageResonance'.format(damageType), ship.getModifiedItemAttr('shipBonusAF'),
+                                   skill='Amarr Frigate', **kwargs)
+
+
+class Effect5657(BaseEffect):
+    """
+    Interceptor2ShieldResist
+
+    Used by:
+    Ship: Raptor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr('shield{0}DamageResonance'.format(damageType),
+                                   ship.getModifiedItemAttr('eliteBonusInterceptor2'), skill='Interceptors', **kwargs)
+
+
+class Effect5673(BaseEffect):
+    """
+    interceptor2ProjectileDamage
+
+    Used by:
+    Ship: Claw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
+                                      skill='Interceptors', **kwargs)
+
+
+class Effect5695(BaseEffect):
+    """
+    eliteBonusInterdictorsArmorResist1
+
+    Used by:
+    Ship: Heretic
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('Em', 'Thermal', 'Explosive', 'Kinetic'):
+            fit.ship.boostItemAttr('armor%sDamageResonance' % damageType,
+                                   ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors', **kwargs)
+
+
+class Effect5717(BaseEffect):
+    """
+    implantSetWarpSpeed
+
+    Used by:
+    Implants named like: grade Ascendancy (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+                                                 'WarpSBonus', implant.getModifiedItemAttr('implantSetWarpSpeed'), **kwargs)
+
+
+class Effect5721(BaseEffect):
+    """
+    shipBonusMETOptimalRangePirateFaction
+
+    Used by:
+    Ships named like: Stratios (2 of 2)
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5723(BaseEffect):
+    """
+    eliteBonusInterdictorsMWDSigRadius2
+
+    Used by:
+    Ships from group: Interdictor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterdictors2'),
+                                      skill='Interdictors', **kwargs)
+
+
+class Effect5724(BaseEffect):
+    """
+    shipSHTOptimalBonusGF
+
+    Used by:
+    Ship: Ares
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5725(BaseEffect):
+    """
+    shipBonusRemoteRepairAmountPirateFaction
+
+    Used by:
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5726(BaseEffect):
+    """
+    shipBonusLETOptimalRangePirateFaction
+
+    Used by:
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5733(BaseEffect):
+    """
+    eliteBonusMaraudersHeavyMissileDamageExpRole1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect5734(BaseEffect):
+    """
+    eliteBonusMaraudersHeavyMissileDamageKinRole1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'kineticDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect5735(BaseEffect):
+    """
+    eliteBonusMaraudersHeavyMissileDamageEMRole1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect5736(BaseEffect):
+    """
+    eliteBonusMaraudersHeavyMissileDamageThermRole1
+
+    Used by:
+    Ship: Golem
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'thermalDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
+
+
+class Effect5737(BaseEffect):
+    """
+    shipScanProbeStrengthBonusPirateFaction
+
+    Used by:
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5738(BaseEffect):
+    """
+    shipBonusRemoteRepairRangePirateFaction2
+
+    Used by:
+    Ship: Nestor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect5754(BaseEffect):
+    """
+    overloadSelfTrackingModuleBonus
+
+    Used by:
+    Modules named like: Tracking Computer (19 of 19)
+    Variations of module: Tracking Disruptor I (6 of 6)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxRangeBonus', module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus'), **kwargs)
+        module.boostItemAttr('falloffBonus', module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus'), **kwargs)
+        module.boostItemAttr('trackingSpeedBonus', module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus'), **kwargs)
+
+
+class Effect5757(BaseEffect):
+    """
+    overloadSelfSensorModuleBonus
+
+    Used by:
+    Modules from group: Remote Sensor Booster (8 of 8)
+    Modules from group: Sensor Booster (16 of 16)
+    Modules from group: Sensor Dampener (6 of 6)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxTargetRangeBonus', module.getModifiedItemAttr('overloadSensorModuleStrengthBonus'), **kwargs)
+        module.boostItemAttr('scanResolutionBonus', module.getModifiedItemAttr('overloadSensorModuleStrengthBonus'),
+                             stackingPenalties=True, **kwargs)
+
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            module.boostItemAttr(
+                'scan{}StrengthPercent'.format(scanType),
+                module.getModifiedItemAttr('overloadSensorModuleStrengthBonus'),
+                stackingPenalties=True, **kwargs)
+
+
+class Effect5758(BaseEffect):
+    """
+    overloadSelfPainterBonus
+
+    Used by:
+    Modules from group: Target Painter (9 of 9)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('signatureRadiusBonus', module.getModifiedItemAttr('overloadPainterStrengthBonus') or 0, **kwargs)
+
+
+class Effect5769(BaseEffect):
+    """
+    repairDroneHullBonusBonus
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Repair Drone Operation DR (3 of 3)
+    Modules named like: Drone Repair Augmentor (8 of 8)
+    Skill: Repair Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+                                     'structureDamageAmount', container.getModifiedItemAttr('damageHP') * level, **kwargs)
+
+
+class Effect5778(BaseEffect):
+    """
+    shipMissileRoFMF2
+
+    Used by:
+    Ship: Breacher
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5779(BaseEffect):
+    """
+    shipBonusSPTFalloffMF2
+
+    Used by:
+    Ship: Pacifier
+    Ship: Rifter
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect5793(BaseEffect):
+    """
+    ewSkillTrackingDisruptionRangeDisruptionBonus
+
+    Used by:
+    Modules named like: Tracking Diagnostic Subroutines (8 of 8)
+    Skill: Weapon Destabilization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        for attr in ('maxRangeBonus', 'falloffBonus'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+                                          attr, container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
+
+
+class Effect5802(BaseEffect):
+    """
+    shipBonusAfterburnerSpeedFactor2CB
+
+    Used by:
+    Ship: Nightmare
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5803(BaseEffect):
+    """
+    shipBonusSentryDroneDamageMultiplierPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5804(BaseEffect):
+    """
+    shipBonusHeavyDroneDamageMultiplierPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5805(BaseEffect):
+    """
+    shipBonusSentryDroneHPPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5806(BaseEffect):
+    """
+    shipBonusSentryDroneArmorHpPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5807(BaseEffect):
+    """
+    shipBonusSentryDroneShieldHpPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5808(BaseEffect):
+    """
+    shipBonusHeavyDroneShieldHpPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5809(BaseEffect):
+    """
+    shipBonusHeavyDroneArmorHpPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5810(BaseEffect):
+    """
+    shipBonusHeavyDroneHPPirateFaction
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5811(BaseEffect):
+    """
+    shipBonusKineticMissileDamageGB2
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusGB2'),
+                                        skill='Gallente Battleship', **kwargs)
+
+
+class Effect5812(BaseEffect):
+    """
+    shipBonusThermalMissileDamageGB2
+
+    Used by:
+    Ship: Rattlesnake
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusGB2'),
+                                        skill='Gallente Battleship', **kwargs)
+
+
+class Effect5813(BaseEffect):
+    """
+    shipBonusAfterburnerSpeedFactorCF2
+
+    Used by:
+    Ship: Imp
+    Ship: Succubus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect5814(BaseEffect):
+    """
+    shipBonusKineticMissileDamageGF
+
+    Used by:
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5815(BaseEffect):
+    """
+    shipBonusThermalMissileDamageGF
+
+    Used by:
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect5816(BaseEffect):
+    """
+    shipBonusLightDroneDamageMultiplierPirateFaction
+
+    Used by:
+    Ship: Mamba
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5817(BaseEffect):
+    """
+    shipBonusLightDroneHPPirateFaction
+
+    Used by:
+    Ship: Mamba
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5818(BaseEffect):
+    """
+    shipBonusLightDroneArmorHPPirateFaction
+
+    Used by:
+    Ship: Mamba
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5819(BaseEffect):
+    """
+    shipBonusLightDroneShieldHPPirateFaction
+
+    Used by:
+    Ship: Mamba
+    Ship: Whiptail
+    Ship: Worm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5820(BaseEffect):
+    """
+    shipBonusAfterburnerSpeedFactorCC2
+
+    Used by:
+    Ship: Fiend
+    Ship: Phantasm
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'speedFactor', module.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect5821(BaseEffect):
+    """
+    shipBonusMediumDroneDamageMultiplierPirateFaction
+
+    Used by:
+    Ship: Alligator
+    Ship: Chameleon
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5822(BaseEffect):
+    """
+    shipBonusMediumDroneHPPirateFaction
+
+    Used by:
+    Ship: Chameleon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5823(BaseEffect):
+    """
+    shipBonusMediumDroneArmorHPPirateFaction
+
+    Used by:
+    Ship: Chameleon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5824(BaseEffect):
+    """
+    shipBonusMediumDroneShieldHPPirateFaction
+
+    Used by:
+    Ship: Chameleon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect5825(BaseEffect):
+    """
+    shipBonusKineticMissileDamageGC2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5826(BaseEffect):
+    """
+    shipBonusThermalMissileDamageGC2
+
+    Used by:
+    Ship: Chameleon
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5827(BaseEffect):
+    """
+    shipBonusTDOptimalBonusAF1
+
+    Used by:
+    Ship: Crucifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5852(BaseEffect):
+    """
+    expeditionFrigateBonusOreMiningYield
+
+    Used by:
+    Ship: Prospect
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            ship.getModifiedItemAttr('expeditionFrigateBonusOreMiningYield'),
+            skill='Expedition Frigates', **kwargs)
+
+
+class Effect5853(BaseEffect):
+    """
+    expeditionFrigateBonusSignatureRadius
+
+    Used by:
+    Ship: Prospect
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', ship.getModifiedItemAttr('expeditionFrigateBonusSignatureRadius'),
+                               skill='Expedition Frigates', **kwargs)
+
+
+class Effect5854(BaseEffect):
+    """
+    shipBonusNosferatuOverride
+
+    Used by:
+    Ship: Ashimmu
+    Ship: Bhaalgorn
+    Ship: Caedes
+    Ship: Chemosh
+    Ship: Cruor
+    Ship: Dagon
+    Ship: Molok
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'nosOverride', ship.getModifiedItemAttr('nosOverride'), **kwargs)
+
+
+class Effect5862(BaseEffect):
+    """
+    shipMissileEMDamageCB
+
+    Used by:
+    Ship: Barghest
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'emDamage', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect5863(BaseEffect):
+    """
+    shipMissileKinDamageCB
+
+    Used by:
+    Ship: Barghest
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCB'),
+                                        skill='Caldari Battleship', **kwargs)
+
+
+class Effect5864(BaseEffect):
+    """
+    shipMissileThermDamageCB
+
+    Used by:
+    Ship: Barghest
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'thermalDamage', ship.getModifiedItemAttr('shipBonusCB'),
+                                        skill='Caldari Battleship', **kwargs)
+
+
+class Effect5865(BaseEffect):
+    """
+    shipMissileExploDamageCB
+
+    Used by:
+    Ship: Barghest
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', ship.getModifiedItemAttr('shipBonusCB'),
+                                        skill='Caldari Battleship', **kwargs)
+
+
+class Effect5866(BaseEffect):
+    """
+    shipBonusWarpScrambleMaxRangeGB
+
+    Used by:
+    Ship: Barghest
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect5867(BaseEffect):
+    """
+    shipBonusMissileExplosionDelayPirateFaction2
+
+    Used by:
+    Ship: Barghest
+    Ship: Garmur
+    Ship: Laelaps
+    Ship: Orthrus
+    Ship: Raiju
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        penalties = 'ship' not in context
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'explosionDelay',
+            ship.getModifiedItemAttr('shipBonusRole8'), stackingPenalties=penalties, **kwargs)
+
+
+class Effect5868(BaseEffect):
+    """
+    drawbackCargoCapacity
+
+    Used by:
+    Modules named like: Transverse Bulkhead (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('capacity', module.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect5869(BaseEffect):
+    """
+    eliteIndustrialWarpSpeedBonus1
+
+    Used by:
+    Ships from group: Blockade Runner (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', ship.getModifiedItemAttr('eliteBonusIndustrial1'),
+                               skill='Transport Ships', **kwargs)
+
+
+class Effect5870(BaseEffect):
+    """
+    shipBonusShieldBoostCI2
+
+    Used by:
+    Ship: Bustard
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusCI2'), skill='Caldari Hauler', **kwargs)
+
+
+class Effect5871(BaseEffect):
+    """
+    shipBonusShieldBoostMI2
+
+    Used by:
+    Ship: Mastodon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', ship.getModifiedItemAttr('shipBonusMI2'), skill='Minmatar Hauler', **kwargs)
+
+
+class Effect5872(BaseEffect):
+    """
+    shipBonusArmorRepairAI2
+
+    Used by:
+    Ship: Impel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusAI2'),
+                                      skill='Amarr Hauler', **kwargs)
+
+
+class Effect5873(BaseEffect):
+    """
+    shipBonusArmorRepairGI2
+
+    Used by:
+    Ship: Occator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGI2'),
+                                      skill='Gallente Hauler', **kwargs)
+
+
+class Effect5874(BaseEffect):
+    """
+    eliteIndustrialFleetCapacity1
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('fleetHangarCapacity', ship.getModifiedItemAttr('eliteBonusIndustrial1'),
+                               skill='Transport Ships', **kwargs)
+
+
+class Effect5881(BaseEffect):
+    """
+    eliteIndustrialShieldResists2
+
+    Used by:
+    Ships from group: Deep Space Transport (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'thermal', 'explosive', 'kinetic'):
+            fit.ship.boostItemAttr('shield{}DamageResonance'.format(damageType.capitalize()),
+                                   ship.getModifiedItemAttr('eliteBonusIndustrial2'), skill='Transport Ships', **kwargs)
+
+
+class Effect5888(BaseEffect):
+    """
+    eliteIndustrialArmorResists2
+
+    Used by:
+    Ship: Impel
+    Ship: Occator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'thermal', 'explosive', 'kinetic'):
+            fit.ship.boostItemAttr('armor{}DamageResonance'.format(damageType.capitalize()),
+                                   ship.getModifiedItemAttr('eliteBonusIndustrial2'), skill='Transport Ships', **kwargs)
+
+
+class Effect5889(BaseEffect):
+    """
+    eliteIndustrialABHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    Ships from group: Interceptor (4 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+                                      'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5890(BaseEffect):
+    """
+    eliteIndustrialMWDHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    Ships from group: Interceptor (4 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5891(BaseEffect):
+    """
+    eliteIndustrialArmorHardenerHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+                                      'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5892(BaseEffect):
+    """
+    eliteIndustrialReactiveArmorHardenerHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+                                      'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5893(BaseEffect):
+    """
+    eliteIndustrialShieldHardenerHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+                                      'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5896(BaseEffect):
+    """
+    eliteIndustrialShieldBoosterHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'overloadShieldBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5899(BaseEffect):
+    """
+    eliteIndustrialArmorRepairHeatBonus
+
+    Used by:
+    Ships from group: Deep Space Transport (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadArmorDamageAmount', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect5900(BaseEffect):
+    """
+    warpSpeedAddition
+
+    Used by:
+    Modules from group: Warp Accelerator (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpSpeedMultiplier', module.getModifiedItemAttr('warpSpeedAdd'), **kwargs)
+
+
+class Effect5901(BaseEffect):
+    """
+    roleBonusBulkheadCPU
+
+    Used by:
+    Ships from group: Freighter (4 of 6)
+    Ships from group: Jump Freighter (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+                                      'cpu', ship.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
+
+
+class Effect5911(BaseEffect):
+    """
+    onlineJumpDriveConsumptionAmountBonusPercentage
+
+    Used by:
+    Modules from group: Jump Drive Economizer (3 of 3)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('jumpDriveConsumptionAmount',
+                               module.getModifiedItemAttr('consumptionQuantityBonusPercentage'), stackingPenalties=True, **kwargs)
+
+
+class Effect5912(BaseEffect):
+    """
+    systemRemoteCapTransmitterAmount
+
+    Used by:
+    Celestials named like: Class Cataclysmic Variable Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                         'powerTransferAmount', beacon.getModifiedItemAttr('energyTransferAmountBonus'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5913(BaseEffect):
+    """
+    systemArmorHP
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    Celestial: Federal Stellar Observatory
+    Celestial: Imperial Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('armorHP', beacon.getModifiedItemAttr('armorHPMultiplier'), **kwargs)
+
+
+class Effect5914(BaseEffect):
+    """
+    systemEnergyNeutMultiplier
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestial: Imperial Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                         'energyNeutralizerAmount',
+                                         beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5915(BaseEffect):
+    """
+    systemEnergyVampireMultiplier
+
+    Used by:
+    Celestials named like: Class Pulsar Effects (6 of 6)
+    Celestial: Imperial Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                         'powerTransferAmount',
+                                         beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5916(BaseEffect):
+    """
+    systemDamageExplosiveBombs
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'explosiveDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5917(BaseEffect):
+    """
+    systemDamageKineticBombs
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'kineticDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5918(BaseEffect):
+    """
+    systemDamageThermalBombs
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'thermalDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5919(BaseEffect):
+    """
+    systemDamageEMBombs
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'emDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5920(BaseEffect):
+    """
+    systemAoeCloudSize
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5921(BaseEffect):
+    """
+    systemTargetPainterMultiplier
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Target Painting'),
+                                         'signatureRadiusBonus',
+                                         beacon.getModifiedItemAttr('targetPainterStrengthMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5922(BaseEffect):
+    """
+    systemWebifierStrengthMultiplier
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    Celestial: Republic Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Stasis Web',
+                                         'speedFactor', beacon.getModifiedItemAttr('stasisWebStrengthMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5923(BaseEffect):
+    """
+    systemNeutBombs
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'energyNeutralizerAmount',
+                                           beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5924(BaseEffect):
+    """
+    systemGravimetricECMBomb
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'scanGravimetricStrengthBonus',
+                                           beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5925(BaseEffect):
+    """
+    systemLadarECMBomb
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'scanLadarStrengthBonus',
+                                           beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5926(BaseEffect):
+    """
+    systemMagnetrometricECMBomb
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'scanMagnetometricStrengthBonus',
+                                           beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5927(BaseEffect):
+    """
+    systemRadarECMBomb
+
+    Used by:
+    Celestials named like: Class Red Giant Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+                                           'scanRadarStrengthBonus',
+                                           beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5929(BaseEffect):
+    """
+    systemDroneTracking
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.drones.filteredItemMultiply(lambda drone: True,
+                                        'trackingSpeed', beacon.getModifiedItemAttr('trackingSpeedMultiplier'),
+                                        stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect5934(BaseEffect):
+    """
+    warpScrambleBlockMWDWithNPCEffect
+
+    Used by:
+    Modules named like: Warp Scrambler (28 of 28)
+    """
+
+    runTime = 'early'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if module.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'))
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+            'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
+
+
+class Effect5939(BaseEffect):
+    """
+    shipRocketRoFBonusAF2
+
+    Used by:
+    Ship: Malediction
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+                                      'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect5944(BaseEffect):
+    """
+    shipMissileLauncherRoFAD1Fixed
+
+    Used by:
+    Ship: Heretic
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect5945(BaseEffect):
+    """
+    cloakingPrototype
+
+    Used by:
+    Modules named like: Prototype Cloaking Device I (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set flag which is used to determine if ship is cloaked or not
+        # This is used to apply cloak-only bonuses, like Black Ops' speed bonus
+        # Doesn't apply to covops cloaks
+        fit.extraAttributes['cloaked'] = True
+        # Apply speed penalty
+        fit.ship.multiplyItemAttr('maxVelocity', module.getModifiedItemAttr('maxVelocityModifier'), **kwargs)
+
+
+class Effect5951(BaseEffect):
+    """
+    drawbackWarpSpeed
+
+    Used by:
+    Modules from group: Rig Anchor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', module.getModifiedItemAttr('drawback'), stackingPenalties=True, **kwargs)
+
+
+class Effect5956(BaseEffect):
+    """
+    shipMETDamageBonusAC2
+
+    Used by:
+    Ship: Devoter
+    Ship: Zealot
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect5957(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorsMETOptimal
+
+    Used by:
+    Ship: Devoter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
+                                      skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect5958(BaseEffect):
+    """
+    shipHybridTrackingGC
+
+    Used by:
+    Ship: Lachesis
+    Ship: Phobos
+    Ship: Vexor Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect5959(BaseEffect):
+    """
+    eliteBonusHeavyInterdictorsHybridOptimal1
+
+    Used by:
+    Ship: Phobos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
+                                      skill='Heavy Interdiction Cruisers', **kwargs)
+
+
+class Effect5994(BaseEffect):
+    """
+    resistanceKillerHullAll
+
+    Used by:
+    Modules named like: Polarized (12 of 15)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            tgtAttr = '{}DamageResonance'.format(dmgType)
+            fit.ship.forceItemAttr(tgtAttr, module.getModifiedItemAttr('resistanceKillerHull'), **kwargs)
+
+
+class Effect5995(BaseEffect):
+    """
+    resistanceKillerShieldArmorAll
+
+    Used by:
+    Modules named like: Polarized (12 of 15)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for layer in ('armor', 'shield'):
+            for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+                tgtAttr = '{}{}DamageResonance'.format(layer, dmgType.capitalize())
+                fit.ship.forceItemAttr(tgtAttr, module.getModifiedItemAttr('resistanceKiller'), **kwargs)
+
+
+class Effect5998(BaseEffect):
+    """
+    freighterSMACapacityBonusO1
+
+    Used by:
+    Ship: Bowhead
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # todo: stacking?
+        fit.ship.boostItemAttr('agility', ship.getModifiedItemAttr('freighterBonusO2'), skill='ORE Freighter',
+                               stackingPenalties=True, **kwargs)
@@ -0,0 +1,4301 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect6001(BaseEffect):
+    """
+    freighterAgilityBonus2O2
+
+    Used by:
+    Ship: Bowhead
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shipMaintenanceBayCapacity', ship.getModifiedItemAttr('freighterBonusO1'),
+                               skill='ORE Freighter', **kwargs)
+
+
+class Effect6006(BaseEffect):
+    """
+    shipSETDamageAmarrTacticalDestroyer1
+
+    Used by:
+    Ship: Confessor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr1'),
+                                      skill='Amarr Tactical Destroyer', **kwargs)
+
+
+class Effect6007(BaseEffect):
+    """
+    shipSETCapNeedAmarrTacticalDestroyer2
+
+    Used by:
+    Ship: Confessor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr2'),
+                                      skill='Amarr Tactical Destroyer', **kwargs)
+
+
+class Effect6008(BaseEffect):
+    """
+    shipHeatDamageAmarrTacticalDestroyer3
+
+    Used by:
+    Ship: Confessor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr3'),
+                                      skill='Amarr Tactical Destroyer', **kwargs)
+
+
+class Effect6009(BaseEffect):
+    """
+    probeLauncherCPUPercentRoleBonusT3
+
+    Used by:
+    Ships from group: Strategic Cruiser (4 of 4)
+    Ships from group: Tactical Destroyer (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu',
+            src.getModifiedItemAttr('roleBonusT3ProbeCPU'), **kwargs)
+
+
+class Effect6010(BaseEffect):
+    """
+    shipModeMaxTargetRangePostDiv
+
+    Used by:
+    Modules named like: Sharpshooter Mode (5 of 5)
+    Module: Anhinga Primary Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr(
+            'maxTargetRange',
+            1 / module.getModifiedItemAttr('modeMaxTargetRangePostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6011(BaseEffect):
+    """
+    shipModeSETOptimalRangePostDiv
+
+    Used by:
+    Module: Confessor Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            'maxRange',
+            1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6012(BaseEffect):
+    """
+    shipModeScanStrengthPostDiv
+
+    Used by:
+    Modules named like: Sharpshooter Mode (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            fit.ship.multiplyItemAttr(
+                'scan{}Strength'.format(scanType),
+                1 / (module.getModifiedItemAttr('mode{}StrengthPostDiv'.format(scanType)) or 1),
+                stackingPenalties=True,
+                penaltyGroup='postDiv',
+                **kwargs)
+
+
+class Effect6014(BaseEffect):
+    """
+    modeSigRadiusPostDiv
+
+    Used by:
+    Modules named like: Defense Mode (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('signatureRadius', 1 / module.getModifiedItemAttr('modeSignatureRadiusPostDiv'),
+                                  stackingPenalties=True, penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6015(BaseEffect):
+    """
+    modeArmorResonancePostDiv
+
+    Used by:
+    Modules named like: Defense Mode (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for srcResType, tgtResType in (
+                ('Em', 'Em'),
+                ('Explosive', 'Explosive'),
+                ('Kinetic', 'Kinetic'),
+                ('Thermic', 'Thermal')
+        ):
+            fit.ship.multiplyItemAttr(
+                'armor{0}DamageResonance'.format(tgtResType),
+                1 / module.getModifiedItemAttr('mode{0}ResistancePostDiv'.format(srcResType)),
+                stackingPenalties=True,
+                penaltyGroup='postDiv',
+                **kwargs)
+
+
+class Effect6016(BaseEffect):
+    """
+    modeAgilityPostDiv
+
+    Used by:
+    Modules named like: Propulsion Mode (5 of 5)
+    Module: Anhinga Tertiary Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr(
+            'agility',
+            1 / module.getModifiedItemAttr('modeAgilityPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6017(BaseEffect):
+    """
+    modeVelocityPostDiv
+
+    Used by:
+    Module: Jackdaw Propulsion Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr(
+            'maxVelocity',
+            1 / module.getModifiedItemAttr('modeVelocityPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6020(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalRS3
+
+    Used by:
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6021(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalRS3
+
+    Used by:
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6025(BaseEffect):
+    """
+    eliteReconBonusMHTOptimalRange1
+
+    Used by:
+    Ship: Lachesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect6027(BaseEffect):
+    """
+    eliteReconBonusMPTdamage1
+
+    Used by:
+    Ship: Huginn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('eliteBonusReconShip1'),
+                                      skill='Recon Ships', **kwargs)
+
+
+class Effect6032(BaseEffect):
+    """
+    remoteCapacitorTransmitterPowerNeedBonusEffect
+
+    Used by:
+    Ships from group: Logistics (3 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+                                      'power', ship.getModifiedItemAttr('powerTransferPowerNeedBonus'), **kwargs)
+
+
+class Effect6036(BaseEffect):
+    """
+    shipHeatDamageMinmatarTacticalDestroyer3
+
+    Used by:
+    Ship: Svipul
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar3'),
+                                      skill='Minmatar Tactical Destroyer', **kwargs)
+
+
+class Effect6037(BaseEffect):
+    """
+    shipSPTDamageMinmatarTacticalDestroyer1
+
+    Used by:
+    Ship: Svipul
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar1'),
+                                      skill='Minmatar Tactical Destroyer', **kwargs)
+
+
+class Effect6038(BaseEffect):
+    """
+    shipSPTOptimalMinmatarTacticalDestroyer2
+
+    Used by:
+    Ship: Svipul
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar2'),
+                                      skill='Minmatar Tactical Destroyer', **kwargs)
+
+
+class Effect6039(BaseEffect):
+    """
+    shipModeSPTTrackingPostDiv
+
+    Used by:
+    Module: Svipul Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            'trackingSpeed',
+            1 / module.getModifiedItemAttr('modeTrackingPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6040(BaseEffect):
+    """
+    modeMWDSigRadiusPostDiv
+
+    Used by:
+    Module: Svipul Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            'signatureRadiusBonus',
+            1 / module.getModifiedItemAttr('modeMWDSigPenaltyPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6041(BaseEffect):
+    """
+    modeShieldResonancePostDiv
+
+    Used by:
+    Modules named like: Defense Mode (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for srcResType, tgtResType in (
+                ('Em', 'Em'),
+                ('Explosive', 'Explosive'),
+                ('Kinetic', 'Kinetic'),
+                ('Thermic', 'Thermal')
+        ):
+            fit.ship.multiplyItemAttr(
+                'shield{0}DamageResonance'.format(tgtResType),
+                1 / module.getModifiedItemAttr('mode{0}ResistancePostDiv'.format(srcResType)),
+                stackingPenalties=True,
+                penaltyGroup='postDiv',
+                **kwargs)
+
+
+class Effect6045(BaseEffect):
+    """
+    shipBonusSentryDamageMultiplierGC3
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6046(BaseEffect):
+    """
+    shipBonusSentryHPGC3
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6047(BaseEffect):
+    """
+    shipBonusSentryArmorHPGC3
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6048(BaseEffect):
+    """
+    shipBonusSentryShieldHPGC3
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6051(BaseEffect):
+    """
+    shipBonusLightDroneDamageMultiplierGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6052(BaseEffect):
+    """
+    shipBonusMediumDroneDamageMultiplierGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6053(BaseEffect):
+    """
+    shipBonusHeavyDroneDamageMultiplierGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6054(BaseEffect):
+    """
+    shipBonusHeavyDroneHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6055(BaseEffect):
+    """
+    shipBonusHeavyDroneArmorHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6056(BaseEffect):
+    """
+    shipBonusHeavyDroneShieldHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6057(BaseEffect):
+    """
+    shipBonusMediumDroneShieldHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6058(BaseEffect):
+    """
+    shipBonusMediumDroneArmorHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6059(BaseEffect):
+    """
+    shipBonusMediumDroneHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6060(BaseEffect):
+    """
+    shipBonusLightDroneHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6061(BaseEffect):
+    """
+    shipBonusLightDroneArmorHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6062(BaseEffect):
+    """
+    shipBonusLightDroneShieldHPGC2
+
+    Used by:
+    Ship: Ishtar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6063(BaseEffect):
+    """
+    entosisLink
+
+    Used by:
+    Modules from group: Entosis Link (6 of 6)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.forceItemAttr('disallowAssistance', module.getModifiedItemAttr('disallowAssistance'))
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            fit.ship.boostItemAttr(
+                'scan{}Strength'.format(scanType),
+                module.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType)),
+                stackingPenalties=True, **kwargs)
+
+
+class Effect6076(BaseEffect):
+    """
+    shipModeMissileVelocityPostDiv
+
+    Used by:
+    Module: Jackdaw Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'maxVelocity',
+            1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6077(BaseEffect):
+    """
+    shipHeatDamageCaldariTacticalDestroyer3
+
+    Used by:
+    Ship: Jackdaw
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari3'),
+                                      skill='Caldari Tactical Destroyer', **kwargs)
+
+
+class Effect6083(BaseEffect):
+    """
+    shipSmallMissileDmgPirateFaction
+
+    Used by:
+    Ship: Jackdaw
+    Ship: Metamorphosis
+    Ship: Skua
+    Ship: Sunesis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect6085(BaseEffect):
+    """
+    shipMissileRoFCaldariTacticalDestroyer1
+
+    Used by:
+    Ship: Jackdaw
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari1'),
+                                      skill='Caldari Tactical Destroyer', **kwargs)
+
+
+class Effect6088(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileAllDamageMC2
+
+    Used by:
+    Ship: Rapier
+    Ship: Scythe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                            '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
+                                            skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6093(BaseEffect):
+    """
+    shipBonusHeavyMissileAllDamageMC2
+
+    Used by:
+    Ship: Rapier
+    Ship: Scythe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                            '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
+                                            skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6096(BaseEffect):
+    """
+    shipBonusLightMissileAllDamageMC2
+
+    Used by:
+    Ship: Rapier
+    Ship: Scythe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                            '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
+                                            skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6098(BaseEffect):
+    """
+    shipMissileReloadTimeCaldariTacticalDestroyer2
+
+    Used by:
+    Ship: Jackdaw
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+                                      'reloadTime', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari2'),
+                                      skill='Caldari Tactical Destroyer', **kwargs)
+
+
+class Effect6104(BaseEffect):
+    """
+    entosisDurationMultiply
+
+    Used by:
+    Ships from group: Carrier (4 of 4)
+    Ships from group: Dreadnought (13 of 13)
+    Ships from group: Force Auxiliary (6 of 6)
+    Ships from group: Lancer Dreadnought (4 of 4)
+    Ships from group: Supercarrier (6 of 6)
+    Ships from group: Titan (8 of 8)
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+                                         'duration', ship.getModifiedItemAttr('entosisDurationMultiplier') or 1, **kwargs)
+
+
+class Effect6110(BaseEffect):
+    """
+    missileVelocityBonusOnline
+
+    Used by:
+    Modules from group: Missile Guidance Enhancer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', module.getModifiedItemAttr('missileVelocityBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6111(BaseEffect):
+    """
+    missileExplosionDelayBonusOnline
+
+    Used by:
+    Modules from group: Missile Guidance Enhancer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosionDelay', module.getModifiedItemAttr('explosionDelayBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6112(BaseEffect):
+    """
+    missileAOECloudSizeBonusOnline
+
+    Used by:
+    Modules from group: Missile Guidance Enhancer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeCloudSize', module.getModifiedItemAttr('aoeCloudSizeBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6113(BaseEffect):
+    """
+    missileAOEVelocityBonusOnline
+
+    Used by:
+    Modules from group: Missile Guidance Enhancer (3 of 3)
+    Module: ML-EKP 'Polybolos' Ballistic Control System
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'aoeVelocity', module.getModifiedItemAttr('aoeVelocityBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6128(BaseEffect):
+    """
+    scriptMissileGuidanceComputerAOECloudSizeBonusBonus
+
+    Used by:
+    Charges from group: Tracking Script (2 of 2)
+    Charges named like: Missile Script (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('aoeCloudSizeBonus', module.getModifiedChargeAttr('aoeCloudSizeBonusBonus'), **kwargs)
+
+
+class Effect6129(BaseEffect):
+    """
+    scriptMissileGuidanceComputerAOEVelocityBonusBonus
+
+    Used by:
+    Charges from group: Tracking Script (2 of 2)
+    Charges named like: Missile Script (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('aoeVelocityBonus', module.getModifiedChargeAttr('aoeVelocityBonusBonus'), **kwargs)
+
+
+class Effect6130(BaseEffect):
+    """
+    scriptMissileGuidanceComputerMissileVelocityBonusBonus
+
+    Used by:
+    Charges named like: Missile Script (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('missileVelocityBonus', module.getModifiedChargeAttr('missileVelocityBonusBonus'), **kwargs)
+
+
+class Effect6131(BaseEffect):
+    """
+    scriptMissileGuidanceComputerExplosionDelayBonusBonus
+
+    Used by:
+    Charges named like: Missile Script (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('explosionDelayBonus', module.getModifiedChargeAttr('explosionDelayBonusBonus'), **kwargs)
+
+
+class Effect6135(BaseEffect):
+    """
+    missileGuidanceComputerBonus4
+
+    Used by:
+    Modules from group: Missile Guidance Computer (3 of 3)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        for srcAttr, tgtAttr in (
+                ('aoeCloudSizeBonus', 'aoeCloudSize'),
+                ('aoeVelocityBonus', 'aoeVelocity'),
+                ('missileVelocityBonus', 'maxVelocity'),
+                ('explosionDelayBonus', 'explosionDelay'),
+        ):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                            tgtAttr, container.getModifiedItemAttr(srcAttr),
+                                            stackingPenalties=True, **kwargs)
+
+
+class Effect6144(BaseEffect):
+    """
+    overloadSelfMissileGuidanceBonus5
+
+    Used by:
+    Modules from group: Missile Guidance Computer (3 of 3)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for tgtAttr in (
+                'aoeCloudSizeBonus',
+                'explosionDelayBonus',
+                'missileVelocityBonus',
+                'maxVelocityModifier',
+                'aoeVelocityBonus'
+        ):
+            module.boostItemAttr(tgtAttr, module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus'), **kwargs)
+
+
+class Effect6148(BaseEffect):
+    """
+    shipHeatDamageGallenteTacticalDestroyer3
+
+    Used by:
+    Ship: Hecate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'heatDamage',
+                                      ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente3'),
+                                      skill='Gallente Tactical Destroyer', **kwargs)
+
+
+class Effect6149(BaseEffect):
+    """
+    shipSHTRoFGallenteTacticalDestroyer1
+
+    Used by:
+    Ship: Hecate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente1'),
+                                      skill='Gallente Tactical Destroyer', **kwargs)
+
+
+class Effect6150(BaseEffect):
+    """
+    shipSHTTrackingGallenteTacticalDestroyer2
+
+    Used by:
+    Ship: Hecate
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente2'),
+                                      skill='Gallente Tactical Destroyer', **kwargs)
+
+
+class Effect6151(BaseEffect):
+    """
+    modeHullResonancePostDiv
+
+    Used by:
+    Module: Hecate Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for srcResType, tgtResType in (
+                ('Em', 'em'),
+                ('Explosive', 'explosive'),
+                ('Kinetic', 'kinetic'),
+                ('Thermic', 'thermal')
+        ):
+            fit.ship.multiplyItemAttr(
+                '{0}DamageResonance'.format(tgtResType),
+                1 / module.getModifiedItemAttr('mode{0}ResistancePostDiv'.format(srcResType)), **kwargs)
+
+
+class Effect6152(BaseEffect):
+    """
+    shipModeSHTOptimalRangePostDiv
+
+    Used by:
+    Module: Hecate Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            'maxRange',
+            1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6153(BaseEffect):
+    """
+    modeMWDCapPostDiv
+
+    Used by:
+    Module: Hecate Propulsion Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            'capacitorNeed',
+            1 / module.getModifiedItemAttr('modeMWDCapPostDiv'),
+            **kwargs)
+
+
+class Effect6154(BaseEffect):
+    """
+    modeMWDBoostPostDiv
+
+    Used by:
+    Module: Hecate Propulsion Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            'speedFactor',
+            1 / module.getModifiedItemAttr('modeMWDVelocityPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv',
+            **kwargs)
+
+
+class Effect6155(BaseEffect):
+    """
+    modeArmorRepDurationPostDiv
+
+    Used by:
+    Module: Hecate Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            'duration',
+            1 / module.getModifiedItemAttr('modeArmorRepDurationPostDiv'),
+            **kwargs)
+
+
+class Effect6163(BaseEffect):
+    """
+    passiveSpeedLimit
+
+    Used by:
+    Modules from group: Entosis Link (6 of 6)
+    """
+
+    runtime = 'late'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.extraAttributes['speedLimit'] = src.getModifiedItemAttr('speedLimit')
+
+
+class Effect6164(BaseEffect):
+    """
+    systemMaxVelocityPercentage
+
+    Used by:
+    Celestials named like: Drifter Incursion (6 of 6)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', beacon.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+
+
+class Effect6166(BaseEffect):
+    """
+    shipBonusWDFGnullPenalties
+
+    Used by:
+    Ship: Fiend
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+                                      'speedFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+                                      'speedBoostFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+                                      'massBonusPercentage', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
+
+
+class Effect6170(BaseEffect):
+    """
+    entosisCPUPenalty
+
+    Used by:
+    Ships from group: Interceptor (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+                                         'entosisCPUAdd', ship.getModifiedItemAttr('entosisCPUPenalty'), **kwargs)
+
+
+class Effect6171(BaseEffect):
+    """
+    entosisCPUAddition
+
+    Used by:
+    Modules from group: Entosis Link (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.increaseItemAttr('cpu', module.getModifiedItemAttr('entosisCPUAdd'), **kwargs)
+
+
+class Effect6172(BaseEffect):
+    """
+    battlecruiserMETRange
+
+    Used by:
+    Ships named like: Harbinger (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect6173(BaseEffect):
+    """
+    battlecruiserMHTRange
+
+    Used by:
+    Ships named like: Brutix (2 of 2)
+    Ships named like: Ferox (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect6174(BaseEffect):
+    """
+    battlecruiserMPTRange
+
+    Used by:
+    Ships named like: Hurricane (2 of 2)
+    Ship: Cenotaph
+    Ship: Khizriel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect6175(BaseEffect):
+    """
+    battlecruiserMissileRange
+
+    Used by:
+    Ships named like: Cyclone (2 of 2)
+    Ships named like: Drake (2 of 2)
+    Ship: Cenotaph
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'maxVelocity', skill.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect6176(BaseEffect):
+    """
+    battlecruiserDroneSpeed
+
+    Used by:
+    Ships named like: Myrmidon (2 of 2)
+    Ships named like: Prophecy (2 of 2)
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect6177(BaseEffect):
+    """
+    shipHybridDmg1CBC2
+
+    Used by:
+    Ships named like: Ferox (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
+                                      skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect6178(BaseEffect):
+    """
+    shipBonusProjectileTrackingMBC2
+
+    Used by:
+    Ship: Hurricane Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusMBC2'),
+                                      skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect6184(BaseEffect):
+    """
+    shipModuleRemoteCapacitorTransmitter
+
+    Used by:
+    Modules from group: Remote Capacitor Transmitter (37 of 37)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        if src.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        amount = src.getModifiedItemAttr('powerTransferAmount')
+        duration = src.getModifiedItemAttr('duration')
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addDrain(src, duration, -amount, 0)
+
+
+class Effect6185(BaseEffect):
+    """
+    shipModuleRemoteHullRepairer
+
+    Used by:
+    Modules from group: Remote Hull Repairer (8 of 8)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        bonus = module.getModifiedItemAttr('structureDamageAmount')
+        bonus *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        duration = module.getModifiedItemAttr('duration') / 1000.0
+        fit._hullRr.append((bonus, duration))
+
+
+class Effect6186(BaseEffect):
+    """
+    shipModuleRemoteShieldBooster
+
+    Used by:
+    Modules from group: Remote Shield Booster (42 of 42)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        bonus = container.getModifiedItemAttr('shieldBonus')
+        bonus *= calculateRangeFactor(
+            srcOptimalRange=container.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=container.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        duration = container.getModifiedItemAttr('duration') / 1000.0
+        fit._shieldRr.append((bonus, duration))
+
+
+class Effect6187(BaseEffect):
+    """
+    energyNeutralizerFalloff
+
+    Used by:
+    Modules from group: Energy Neutralizer (57 of 57)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if not ((hasattr(src, 'state') and src.state >= FittingModuleState.ACTIVE) or hasattr(src, 'amountActive')):
+            return
+        amount = src.getModifiedItemAttr('energyNeutralizerAmount')
+        amount *= calculateRangeFactor(
+            srcOptimalRange=src.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=src.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        time = src.getModifiedItemAttr('duration')
+        fit.addDrain(src, time, amount, 0)
+
+
+class Effect6188(BaseEffect):
+    """
+    shipModuleRemoteArmorRepairer
+
+    Used by:
+    Modules from group: Remote Armor Repairer (43 of 43)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        bonus = container.getModifiedItemAttr('armorDamageAmount')
+        bonus *= calculateRangeFactor(
+            srcOptimalRange=container.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=container.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        duration = container.getModifiedItemAttr('duration') / 1000.0
+        fit._armorRr.append((bonus, duration))
+        fit._armorRrPreSpool.append((bonus, duration))
+        fit._armorRrFullSpool.append((bonus, duration))
+
+
+class Effect6195(BaseEffect):
+    """
+    expeditionFrigateBonusShieldResistance
+
+    Used by:
+    Ship: Endurance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for dmgType in ('Em', 'Thermal', 'Kinetic', 'Explosive'):
+            fit.ship.boostItemAttr('shield{}DamageResonance'.format(dmgType),
+                                   src.getModifiedItemAttr('expeditionFrigateBonusShieldResistance'),
+                                   skill='Expedition Frigates', **kwargs)
+
+
+class Effect6197(BaseEffect):
+    """
+    energyNosferatuFalloff
+
+    Used by:
+    Modules from group: Energy Nosferatu (58 of 58)
+    """
+
+    runTime = 'late'
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        amount = src.getModifiedItemAttr('powerTransferAmount')
+        time = src.getModifiedItemAttr('duration')
+        if 'projected' in context:
+            if 'effect' in kwargs:
+                from eos.modifiedAttributeDict import ModifiedAttributeDict
+                amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+            amount *= calculateRangeFactor(
+                srcOptimalRange=src.getModifiedItemAttr('maxRange'),
+                srcFalloffRange=src.getModifiedItemAttr('falloffEffectiveness'),
+                distance=projectionRange)
+            fit.addDrain(src, time, amount, 0)
+        elif 'module' in context:
+            src.itemModifiedAttributes.force('capacitorNeed', -amount, **kwargs)
+
+
+class Effect6201(BaseEffect):
+    """
+    doomsdaySlash
+
+    Used by:
+    Modules named like: Reaper (4 of 4)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect6208(BaseEffect):
+    """
+    microJumpPortalDrive
+
+    Used by:
+    Module: Micro Jump Field Generator
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonusPercent'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6214(BaseEffect):
+    """
+    roleBonusCDLinksPGReduction
+
+    Used by:
+    Ships from group: Command Destroyer (6 of 6)
+    Ship: Porpoise
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+                                      src.getModifiedItemAttr('roleBonusCD'), **kwargs)
+
+
+class Effect6216(BaseEffect):
+    """
+    structureEnergyNeutralizerFalloff
+
+    Used by:
+    Structure Modules from group: Structure Energy Neutralizer (5 of 5)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        amount = 0
+        if 'projected' not in context:
+            return
+        if not ((hasattr(src, 'state') and src.state >= FittingModuleState.ACTIVE) or hasattr(src, 'amountActive')):
+            return
+        amount = src.getModifiedItemAttr('energyNeutralizerAmount')
+        amount *= calculateRangeFactor(
+            srcOptimalRange=src.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=src.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        time = src.getModifiedItemAttr('duration')
+        fit.addDrain(src, time, amount, 0)
+
+
+class Effect6222(BaseEffect):
+    """
+    structureWarpScrambleBlockMWDWithNPCEffect
+
+    Used by:
+    Structure Modules from group: Structure Warp Scrambler (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if module.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+            'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
+
+
+class Effect6230(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalRS1
+
+    Used by:
+    Ship: Curse
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect6232(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffRS2
+
+    Used by:
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
+
+
+class Effect6233(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffRS3
+
+    Used by:
+    Ship: Curse
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6234(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalRS1
+
+    Used by:
+    Ship: Curse
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect6237(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffRS2
+
+    Used by:
+    Ship: Pilgrim
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
+
+
+class Effect6238(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffRS3
+
+    Used by:
+    Ship: Curse
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6241(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffAD1
+
+    Used by:
+    Ship: Dragoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6242(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalAD2
+
+    Used by:
+    Ship: Dragoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6245(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalAD2
+
+    Used by:
+    Ship: Dragoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6246(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffAD1
+
+    Used by:
+    Ship: Dragoon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6253(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalAB
+
+    Used by:
+    Ship: Armageddon
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect6256(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffAB2
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect6257(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalAB
+
+    Used by:
+    Ship: Armageddon
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect6260(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffAB2
+
+    Used by:
+    Ship: Armageddon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect6267(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalEAF1
+
+    Used by:
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect6272(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffEAF3
+
+    Used by:
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect6273(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalEAF1
+
+    Used by:
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect6278(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffEAF3
+
+    Used by:
+    Ship: Sentinel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
+                                      skill='Electronic Attack Ships', **kwargs)
+
+
+class Effect6281(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalAF2
+
+    Used by:
+    Ship: Cruor
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6285(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffAF3
+
+    Used by:
+    Ship: Cruor
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6287(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalAF2
+
+    Used by:
+    Ship: Cruor
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6291(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffAF3
+
+    Used by:
+    Ship: Cruor
+    Ship: Malice
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6294(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalAC1
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6299(BaseEffect):
+    """
+    shipBonusEnergyNeutFalloffAC3
+
+    Used by:
+    Ship: Ashimmu
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6300(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalAC1
+
+    Used by:
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6301(BaseEffect):
+    """
+    shipBonusNosOptimalFalloffAC2
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6305(BaseEffect):
+    """
+    shipBonusEnergyNosFalloffAC3
+
+    Used by:
+    Ship: Ashimmu
+    Ship: Vangel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6307(BaseEffect):
+    """
+    shipBonusThermMissileDmgMD1
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6308(BaseEffect):
+    """
+    shipBonusEMMissileDmgMD1
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6309(BaseEffect):
+    """
+    shipBonusKineticMissileDmgMD1
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6310(BaseEffect):
+    """
+    shipBonusExplosiveMissileDmgMD1
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', src.getModifiedItemAttr('shipBonusMD1'),
+                                        skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6315(BaseEffect):
+    """
+    eliteBonusCommandDestroyerSkirmish1
+
+    Used by:
+    Ships from group: Command Destroyer (3 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
+                                          skill='Command Destroyers', **kwargs)
+
+
+class Effect6316(BaseEffect):
+    """
+    eliteBonusCommandDestroyerShield1
+
+    Used by:
+    Ships from group: Command Destroyer (3 of 6)
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
+                                          skill='Command Destroyers', **kwargs)
+
+
+class Effect6317(BaseEffect):
+    """
+    eliteBonusCommandDestroyerMJFGspool2
+
+    Used by:
+    Ships from group: Command Destroyer (6 of 6)
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'), 'duration',
+                                      src.getModifiedItemAttr('eliteBonusCommandDestroyer2'), skill='Command Destroyers', **kwargs)
+
+
+class Effect6318(BaseEffect):
+    """
+    shipBonusEMShieldResistanceMD2
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusMD2'),
+                               skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6319(BaseEffect):
+    """
+    shipBonusKineticShieldResistanceMD2
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusMD2'),
+                               skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6320(BaseEffect):
+    """
+    shipBonusThermalShieldResistanceMD2
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusMD2'),
+                               skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6321(BaseEffect):
+    """
+    shipBonusExplosiveShieldResistanceMD2
+
+    Used by:
+    Ship: Bifrost
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusMD2'),
+                               skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect6322(BaseEffect):
+    """
+    scriptscanGravimetricStrengthBonusBonus
+
+    Used by:
+    Charges from group: Structure ECM script (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('scanGravimetricStrengthBonus', src.getModifiedChargeAttr('scanGravimetricStrengthBonusBonus'), **kwargs)
+
+
+class Effect6323(BaseEffect):
+    """
+    scriptscanLadarStrengthBonusBonus
+
+    Used by:
+    Charges from group: Structure ECM script (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('scanLadarStrengthBonus', src.getModifiedChargeAttr('scanLadarStrengthBonusBonus'), **kwargs)
+
+
+class Effect6324(BaseEffect):
+    """
+    scriptscanMagnetometricStrengthBonusBonus
+
+    Used by:
+    Charges from group: Structure ECM script (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('scanMagnetometricStrengthBonus', src.getModifiedChargeAttr('scanMagnetometricStrengthBonusBonus'), **kwargs)
+
+
+class Effect6325(BaseEffect):
+    """
+    scriptscanRadarStrengthBonusBonus
+
+    Used by:
+    Charges from group: Structure ECM script (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('scanRadarStrengthBonus', src.getModifiedChargeAttr('scanRadarStrengthBonusBonus'), **kwargs)
+
+
+class Effect6326(BaseEffect):
+    """
+    shipBonusThermalMissileDamageCD1
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6327(BaseEffect):
+    """
+    shipBonusEMMissileDamageCD1
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6328(BaseEffect):
+    """
+    shipBonusKineticMissileDamageCD1
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6329(BaseEffect):
+    """
+    shipBonusExplosiveMissileDamageCD1
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'explosiveDamage', src.getModifiedItemAttr('shipBonusCD1'),
+                                        skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6330(BaseEffect):
+    """
+    shipBonusShieldEMResistanceCD2
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+                               skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6331(BaseEffect):
+    """
+    shipBonusShieldThermalResistanceCD2
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+                               skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6332(BaseEffect):
+    """
+    shipBonusShieldKineticResistanceCD2
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+                               skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6333(BaseEffect):
+    """
+    shipBonusShieldExplosiveResistanceCD2
+
+    Used by:
+    Ship: Stork
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+                               skill='Caldari Destroyer', **kwargs)
+
+
+class Effect6334(BaseEffect):
+    """
+    eliteBonusCommandDestroyerInfo1
+
+    Used by:
+    Ships from group: Command Destroyer (3 of 6)
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
+                                          skill='Command Destroyers', **kwargs)
+
+
+class Effect6335(BaseEffect):
+    """
+    shipBonusKineticArmorResistanceAD2
+
+    Used by:
+    Ship: Pontifex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('shipBonusAD2'),
+                               skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6336(BaseEffect):
+    """
+    shipBonusThermalArmorResistanceAD2
+
+    Used by:
+    Ship: Pontifex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('shipBonusAD2'),
+                               skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6337(BaseEffect):
+    """
+    shipBonusEMArmorResistanceAD2
+
+    Used by:
+    Ship: Pontifex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6338(BaseEffect):
+    """
+    shipBonusExplosiveArmorResistanceAD2
+
+    Used by:
+    Ship: Pontifex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusAD2'),
+                               skill='Amarr Destroyer', **kwargs)
+
+
+class Effect6339(BaseEffect):
+    """
+    eliteBonusCommandDestroyerArmored1
+
+    Used by:
+    Ship: Magus
+    Ship: Pontifex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+                                          attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
+                                          skill='Command Destroyers', **kwargs)
+
+
+class Effect6340(BaseEffect):
+    """
+    shipBonusKineticArmorResistanceGD2
+
+    Used by:
+    Ship: Magus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('shipBonusGD2'),
+                               skill='Gallente Destroyer', **kwargs)
+
+
+class Effect6341(BaseEffect):
+    """
+    shipBonusEMArmorResistanceGD2
+
+    Used by:
+    Ship: Magus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('shipBonusGD2'),
+                               skill='Gallente Destroyer', **kwargs)
+
+
+class Effect6342(BaseEffect):
+    """
+    shipBonusThermalArmorResistanceGD2
+
+    Used by:
+    Ship: Magus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('shipBonusGD2'),
+                               skill='Gallente Destroyer', **kwargs)
+
+
+class Effect6343(BaseEffect):
+    """
+    shipBonusExplosiveArmorResistanceGD2
+
+    Used by:
+    Ship: Magus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusGD2'),
+                               skill='Gallente Destroyer', **kwargs)
+
+
+class Effect6350(BaseEffect):
+    """
+    shipSmallMissileKinDmgCF3
+
+    Used by:
+    Ship: Caldari Navy Hookbill
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+            src.getModifiedItemAttr('shipBonus3CF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect6351(BaseEffect):
+    """
+    shipMissileKinDamageCC3
+
+    Used by:
+    Ship: Osprey Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusCC3'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect6352(BaseEffect):
+    """
+    roleBonusWDRange
+
+    Used by:
+    Ship: Crucifier Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('roleBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRange',
+                                      src.getModifiedItemAttr('roleBonus'), **kwargs)
+
+
+class Effect6353(BaseEffect):
+    """
+    roleBonusWDCapCPU
+
+    Used by:
+    Ship: Crucifier Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'cpu',
+                                      src.getModifiedItemAttr('roleBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('roleBonus'), **kwargs)
+
+
+class Effect6354(BaseEffect):
+    """
+    shipBonusEwWeaponDisruptionStrengthAF2
+
+    Used by:
+    Variations of ship: Crucifier (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in (
+            'trackingSpeedBonus', 'explosionDelayBonus', 'maxRangeBonus', 'falloffBonus',
+            'missileVelocityBonus', 'aoeVelocityBonus', 'aoeCloudSizeBonus'
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+                                          src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6357(BaseEffect):
+    """
+    shipBonusJustScramblerRangeGF2
+
+    Used by:
+    Ship: Maulus Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Navigation'), 'maxRange',
+                                      src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect6358(BaseEffect):
+    """
+    roleBonusJustScramblerStrength
+
+    Used by:
+    Ship: Maulus Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Navigation'),
+                                         'warpScrambleStrength', ship.getModifiedItemAttr('roleBonus'), **kwargs)
+
+
+class Effect6359(BaseEffect):
+    """
+    shipBonusAoeVelocityRocketsMF
+
+    Used by:
+    Ship: Vigil Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'aoeVelocity',
+                                        src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect6360(BaseEffect):
+    """
+    shipRocketEMThermKinDmgMF2
+
+    Used by:
+    Ship: Vigil Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect6361(BaseEffect):
+    """
+    shipRocketExpDmgMF3
+
+    Used by:
+    Ship: Vigil Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect6362(BaseEffect):
+    """
+    roleBonusStasisRange
+
+    Used by:
+    Ship: Vigil Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+                                      src.getModifiedItemAttr('roleBonus'), **kwargs)
+
+
+class Effect6368(BaseEffect):
+    """
+    shieldTransporterFalloffBonus
+
+    Used by:
+    Variations of ship: Bantam (2 of 2)
+    Variations of ship: Burst (2 of 2)
+    Ship: Osprey
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('falloffBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster',
+                                      'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
+
+
+class Effect6369(BaseEffect):
+    """
+    shipShieldTransferFalloffMC2
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6370(BaseEffect):
+    """
+    shipShieldTransferFalloffCC1
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect6371(BaseEffect):
+    """
+    shipRemoteArmorFalloffGC1
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('shipBonusGC'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect6372(BaseEffect):
+    """
+    shipRemoteArmorFalloffAC2
+
+    Used by:
+    Ship: Guardian
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('shipBonusAC2'),
+                                      skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6373(BaseEffect):
+    """
+    armorRepairProjectorFalloffBonus
+
+    Used by:
+    Variations of ship: Navitas (2 of 2)
+    Ship: Augoror
+    Ship: Deacon
+    Ship: Exequror
+    Ship: Inquisitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'falloffEffectiveness',
+                                      src.getModifiedItemAttr('falloffBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer',
+                                      'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
+
+
+class Effect6374(BaseEffect):
+    """
+    droneHullRepairBonusEffect
+
+    Used by:
+    Ships from group: Logistics (6 of 7)
+    Ship: Exequror
+    Ship: Scythe
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone', 'structureDamageAmount',
+                                     src.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
+
+
+class Effect6377(BaseEffect):
+    """
+    eliteBonusLogiFrigArmorRepSpeedCap1
+
+    Used by:
+    Ship: Deacon
+    Ship: Thalia
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+                                      src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
+
+
+class Effect6378(BaseEffect):
+    """
+    eliteBonusLogiFrigShieldRepSpeedCap1
+
+    Used by:
+    Ship: Kirin
+    Ship: Scalpel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'duration',
+                                      src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
+
+
+class Effect6379(BaseEffect):
+    """
+    eliteBonusLogiFrigArmorHP2
+
+    Used by:
+    Ship: Deacon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', src.getModifiedItemAttr('eliteBonusLogiFrig2'), skill='Logistics Frigates', **kwargs)
+
+
+class Effect6380(BaseEffect):
+    """
+    eliteBonusLogiFrigShieldHP2
+
+    Used by:
+    Ship: Kirin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', src.getModifiedItemAttr('eliteBonusLogiFrig2'), skill='Logistics Frigates', **kwargs)
+
+
+class Effect6381(BaseEffect):
+    """
+    eliteBonusLogiFrigSignature2
+
+    Used by:
+    Ship: Scalpel
+    Ship: Thalia
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', src.getModifiedItemAttr('eliteBonusLogiFrig2'),
+                               skill='Logistics Frigates', **kwargs)
+
+
+class Effect6384(BaseEffect):
+    """
+    overloadSelfMissileGuidanceModuleBonus
+
+    Used by:
+    Variations of module: Guidance Disruptor I (6 of 6)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for tgtAttr in (
+                'aoeCloudSizeBonus',
+                'explosionDelayBonus',
+                'missileVelocityBonus',
+                'aoeVelocityBonus'
+        ):
+            module.boostItemAttr(tgtAttr, module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus'), **kwargs)
+
+
+class Effect6385(BaseEffect):
+    """
+    ignoreCloakVelocityPenalty
+
+    Used by:
+    Ships from group: Expedition Frigate (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+                                      'maxVelocityModifier', src.getModifiedItemAttr('ignoreCloakVelocityPenalty'), **kwargs)
+
+
+class Effect6386(BaseEffect):
+    """
+    ewSkillGuidanceDisruptionBonus
+
+    Used by:
+    Modules named like: Tracking Diagnostic Subroutines (8 of 8)
+    Skill: Weapon Destabilization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        level = src.level if 'skill' in context else 1
+        for attr in (
+                'explosionDelayBonus',
+                'aoeVelocityBonus',
+                'aoeCloudSizeBonus',
+                'missileVelocityBonus'
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+                                          attr, src.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
+
+
+class Effect6395(BaseEffect):
+    """
+    shipBonusEwWeaponDisruptionStrengthAC1
+
+    Used by:
+    Variations of ship: Arbitrator (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in (
+            'missileVelocityBonus', 'aoeVelocityBonus', 'maxRangeBonus', 'explosionDelayBonus',
+            'aoeCloudSizeBonus', 'trackingSpeedBonus', 'falloffBonus'
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+                                          src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect6396(BaseEffect):
+    """
+    skillStructureMissileDamageBonus
+
+    Used by:
+    Skill: Structure Missile Systems
+    """
+
+    type = 'passive', 'structure'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile', 'Guided Bomb')
+        for damageType in ('em', 'thermal', 'explosive', 'kinetic'):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+                                            '%sDamage' % damageType, src.getModifiedItemAttr('damageMultiplierBonus'),
+                                            skill='Structure Missile Systems', **kwargs)
+
+
+class Effect6400(BaseEffect):
+    """
+    skillStructureElectronicSystemsCapNeedBonus
+
+    Used by:
+    Skill: Structure Electronic Systems
+    """
+
+    type = 'passive', 'structure'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Warp Scrambler', 'Structure ECM Battery', 'Structure Stasis Webifier')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
+                                      skill='Structure Electronic Systems', **kwargs)
+
+
+class Effect6401(BaseEffect):
+    """
+    skillStructureEngineeringSystemsCapNeedBonus
+
+    Used by:
+    Skill: Structure Engineering Systems
+    """
+
+    type = 'passive', 'structure'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Energy Neutralizer', 'Structure Area Denial Module')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
+                                      skill='Structure Engineering Systems', **kwargs)
+
+
+class Effect6402(BaseEffect):
+    """
+    structureRigAoeVelocityBonusSingleTargetMissiles
+
+    Used by:
+    Structure Modules named like: Standup Set Missile (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
+
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+                                      'aoeVelocity', src.getModifiedItemAttr('structureRigMissileExploVeloBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6403(BaseEffect):
+    """
+    structureRigVelocityBonusSingleTargetMissiles
+
+    Used by:
+    Structure Modules named like: Standup Set Missile (6 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+                                      'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6404(BaseEffect):
+    """
+    structureRigNeutralizerMaxRangeFalloffEffectiveness
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig XL - Energy Neutralizer and EW (2 of 2)
+    Structure Modules named like: Standup Set Energy Neutralizer (4 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+                                      'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+                                      'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6405(BaseEffect):
+    """
+    structureRigNeutralizerCapacitorNeed
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig XL - Energy Neutralizer and EW (2 of 2)
+    Structure Modules named like: Standup Set Energy Neutralizer (4 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+                                      'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6406(BaseEffect):
+    """
+    structureRigEWMaxRangeFalloff
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig M - EW projection (2 of 2)
+    Structure Modules named like: Standup Set EW (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure ECM Battery', 'Structure Disruption Battery')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'falloff', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6407(BaseEffect):
+    """
+    structureRigEWCapacitorNeed
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig M - EW Cap Reduction (2 of 2)
+    Structure Modules named like: Standup Set EW (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure ECM Battery', 'Structure Disruption Battery')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'), **kwargs)
+
+
+class Effect6408(BaseEffect):
+    """
+    structureRigMaxTargets
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    Structure Modules named like: Standup Set Target (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('maxLockedTargets', src.getModifiedItemAttr('structureRigMaxTargetBonus'), **kwargs)
+
+
+class Effect6409(BaseEffect):
+    """
+    structureRigSensorResolution
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - Max Targets and Sensor Boosting (2 of 2)
+    Structure Modules from group: Structure Combat Rig M - Boosted Sensors (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('structureRigScanResBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6410(BaseEffect):
+    """
+    structureRigExplosionRadiusBonusAoEMissiles
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - AoE Launcher Application and Projection (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Missile and AoE Missile (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Guided Bomb',
+                                        'aoeCloudSize', src.getModifiedItemAttr('structureRigMissileExplosionRadiusBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6411(BaseEffect):
+    """
+    structureRigVelocityBonusAoeMissiles
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - AoE Launcher Application and Projection (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Missile and AoE Missile (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Guided Bomb',
+                                        'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+
+class Effect6412(BaseEffect):
+    """
+    structureRigPDBmaxRange
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - Point Defense Battery Application and Projection (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+                                      'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+
+class Effect6413(BaseEffect):
+    """
+    structureRigPDBCapacitorNeed
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - Point Defense Battery Application and Projection (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+                                      'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'), **kwargs)
+
+
+class Effect6417(BaseEffect):
+    """
+    structureRigDoomsdayDamageLoss
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+                                         'lightningWeaponDamageLossTarget',
+                                         src.getModifiedItemAttr('structureRigDoomsdayDamageLossTargetBonus'), **kwargs)
+
+
+class Effect6422(BaseEffect):
+    """
+    remoteSensorDampFalloff
+
+    Used by:
+    Modules from group: Sensor Dampener (6 of 6)
+    Starbases from group: Sensor Dampening Battery (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus') * rangeFactor,
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionBonus') * rangeFactor,
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6423(BaseEffect):
+    """
+    shipModuleGuidanceDisruptor
+
+    Used by:
+    Variations of module: Guidance Disruptor I (6 of 6)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        for srcAttr, tgtAttr in (
+            ('aoeCloudSizeBonus', 'aoeCloudSize'),
+            ('aoeVelocityBonus', 'aoeVelocity'),
+            ('missileVelocityBonus', 'maxVelocity'),
+            ('explosionDelayBonus', 'explosionDelay')
+        ):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                            tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                            stackingPenalties=True, **kwargs)
+
+
+class Effect6424(BaseEffect):
+    """
+    shipModuleTrackingDisruptor
+
+    Used by:
+    Variations of module: Tracking Disruptor I (6 of 6)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        for srcAttr, tgtAttr in (
+            ('trackingSpeedBonus', 'trackingSpeed'),
+            ('maxRangeBonus', 'maxRange'),
+            ('falloffBonus', 'falloff')
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect6425(BaseEffect):
+    """
+    remoteTargetPaintFalloff
+
+    Used by:
+    Modules from group: Target Painter (9 of 9)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        appliedBoost = container.getModifiedItemAttr('signatureRadiusBonus') * calculateRangeFactor(
+            srcOptimalRange=container.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=container.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('signatureRadius', appliedBoost, stackingPenalties=True, **kwargs)
+
+
+class Effect6426(BaseEffect):
+    """
+    remoteWebifierFalloff
+
+    Used by:
+    Modules from group: Stasis Grappler (8 of 8)
+    Modules from group: Stasis Web (19 of 19)
+    Starbases from group: Stasis Webification Battery (3 of 3)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        appliedBoost = module.getModifiedItemAttr('speedFactor') * calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('maxVelocity', appliedBoost, stackingPenalties=True, **kwargs)
+
+
+class Effect6427(BaseEffect):
+    """
+    remoteSensorBoostFalloff
+
+    Used by:
+    Modules from group: Remote Sensor Booster (8 of 8)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        for srcAttr, tgtAttr in (
+            ('maxTargetRangeBonus', 'maxTargetRange'),
+            ('scanResolutionBonus', 'scanResolution'),
+            ('scanGravimetricStrengthPercent', 'scanGravimetricStrength'),
+            ('scanMagnetometricStrengthPercent', 'scanMagnetometricStrength'),
+            ('scanRadarStrengthPercent', 'scanRadarStrength'),
+            ('scanLadarStrengthPercent', 'scanLadarStrength')
+        ):
+            fit.ship.boostItemAttr(tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect6428(BaseEffect):
+    """
+    shipModuleRemoteTrackingComputer
+
+    Used by:
+    Modules from group: Remote Tracking Computer (8 of 8)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        for srcAttr, tgtAttr in (
+            ('trackingSpeedBonus', 'trackingSpeed'),
+            ('maxRangeBonus', 'maxRange'),
+            ('falloffBonus', 'falloff')
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect6431(BaseEffect):
+    """
+    fighterAbilityMissiles
+
+    Used by:
+    Items from category: Fighter (56 of 94)
+    """
+
+    dealsDamage = True
+    displayName = 'Missile Attack'
+    hasCharges = True
+    prefix = 'fighterAbilityMissiles'
+    type = 'active'
+
+
+class Effect6434(BaseEffect):
+    """
+    fighterAbilityEnergyNeutralizer
+
+    Used by:
+    Fighters named like: Cenobite (5 of 5)
+    """
+
+    displayName = 'Energy Neutralizer'
+    grouped = True
+    prefix = 'fighterAbilityEnergyNeutralizer'
+    type = 'active', 'projected'
+
+    @classmethod
+    def handler(cls, fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        amount = src.getModifiedItemAttr('{}Amount'.format(cls.prefix)) * src.amount
+        amount *= calculateRangeFactor(
+            srcOptimalRange=src.getModifiedItemAttr('{}OptimalRange'.format(cls.prefix)),
+            srcFalloffRange=src.getModifiedItemAttr('{}FalloffRange'.format(cls.prefix)),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        time = src.getModifiedItemAttr('{}Duration'.format(cls.prefix))
+        fit.addDrain(src, time, amount, 0)
+
+
+class Effect6435(BaseEffect):
+    """
+    fighterAbilityStasisWebifier
+
+    Used by:
+    Fighters named like: Dromi (5 of 5)
+    """
+
+    displayName = 'Stasis Webifier'
+    grouped = True
+    prefix = 'fighterAbilityStasisWebifier'
+    type = 'active', 'projected'
+
+    @classmethod
+    def handler(cls, fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        speedBoost = src.getModifiedItemAttr('{}SpeedPenalty'.format(cls.prefix)) * src.amount
+        speedBoost *= calculateRangeFactor(
+            srcOptimalRange=src.getModifiedItemAttr('{}OptimalRange'.format(cls.prefix)),
+            srcFalloffRange=src.getModifiedItemAttr('{}FalloffRange'.format(cls.prefix)),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('maxVelocity', speedBoost, stackingPenalties=True, **kwargs)
+
+
+class Effect6436(BaseEffect):
+    """
+    fighterAbilityWarpDisruption
+
+    Used by:
+    Fighters named like: Siren (5 of 5)
+    """
+
+    displayName = 'Warp Disruption'
+    grouped = True
+    prefix = 'fighterAbilityWarpDisruption'
+    type = 'active', 'projected'
+
+    @classmethod
+    def handler(cls, fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if src.getModifiedItemAttr('{}Range'.format(cls.prefix), 0) < (projectionRange or 0):
+            return
+        fit.ship.increaseItemAttr(
+            'warpScrambleStatus',
+            src.getModifiedItemAttr('{}PointStrength'.format(cls.prefix)) * src.amount,
+            **kwargs)
+
+
+class Effect6437(BaseEffect):
+    """
+    fighterAbilityECM
+
+    Used by:
+    Fighters named like: Scarab (5 of 5)
+    """
+
+    displayName = 'ECM'
+    grouped = True
+    prefix = 'fighterAbilityECM'
+    type = 'projected', 'active'
+
+    @classmethod
+    def handler(cls, fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        strength = src.getModifiedItemAttr('{}Strength{}'.format(cls.prefix, fit.scanType)) * src.amount
+        strength *= calculateRangeFactor(
+            srcOptimalRange=src.getModifiedItemAttr('{}RangeOptimal'.format(cls.prefix)),
+            srcFalloffRange=src.getModifiedItemAttr('{}RangeFalloff'.format(cls.prefix)),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6439(BaseEffect):
+    """
+    fighterAbilityEvasiveManeuvers
+
+    Used by:
+    Fighters from group: Light Fighter (12 of 24)
+    Fighters from group: Structure Light Fighter (8 of 16)
+    """
+
+    displayName = 'Evasive Maneuvers'
+    grouped = True
+    prefix = 'fighterAbilityEvasiveManeuvers'
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        container.boostItemAttr('maxVelocity',
+                                container.getModifiedItemAttr('fighterAbilityEvasiveManeuversSpeedBonus'), **kwargs)
+        container.boostItemAttr('signatureRadius',
+                                container.getModifiedItemAttr('fighterAbilityEvasiveManeuversSignatureRadiusBonus'),
+                                stackingPenalties=True, **kwargs)
+
+        # These may not have stacking penalties, but there's nothing else that affects the attributes yet to check.
+        container.multiplyItemAttr('shieldEmDamageResonance',
+                                   container.getModifiedItemAttr('fighterAbilityEvasiveManeuversEmResonance'),
+                                   stackingPenalties=True, **kwargs)
+        container.multiplyItemAttr('shieldThermalDamageResonance',
+                                   container.getModifiedItemAttr('fighterAbilityEvasiveManeuversThermResonance'),
+                                   stackingPenalties=True, **kwargs)
+        container.multiplyItemAttr('shieldKineticDamageResonance',
+                                   container.getModifiedItemAttr('fighterAbilityEvasiveManeuversKinResonance'),
+                                   stackingPenalties=True, **kwargs)
+        container.multiplyItemAttr('shieldExplosiveDamageResonance',
+                                   container.getModifiedItemAttr('fighterAbilityEvasiveManeuversExpResonance'),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect6440(BaseEffect):
+    """
+    fighterAbilityAfterburner
+
+    Used by:
+    Fighters named like: Shadow (2 of 2)
+    Fighters named like: Siren (5 of 5)
+    """
+
+    displayName = 'Afterburner'
+    grouped = True
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxVelocity', module.getModifiedItemAttr('fighterAbilityAfterburnerSpeedBonus'),
+                             stackingPenalties=True, **kwargs)
+
+
+class Effect6441(BaseEffect):
+    """
+    fighterAbilityMicroWarpDrive
+
+    Used by:
+    Items from category: Fighter (51 of 94)
+    """
+
+    displayName = 'Microwarpdrive'
+    grouped = True
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.boostItemAttr('maxVelocity', module.getModifiedItemAttr('fighterAbilityMicroWarpDriveSpeedBonus'),
+                             stackingPenalties=True, **kwargs)
+        module.boostItemAttr('signatureRadius',
+                             module.getModifiedItemAttr('fighterAbilityMicroWarpDriveSignatureRadiusBonus'),
+                             stackingPenalties=True, **kwargs)
+
+
+class Effect6443(BaseEffect):
+    """
+    pointDefense
+
+    Used by:
+    Structure Modules from group: Structure Area Denial Module (2 of 2)
+    """
+
+    type = 'active'
+
+
+class Effect6447(BaseEffect):
+    """
+    lightningWeapon
+
+    Used by:
+    Structure Module: Standup Arcing Vorton Projector I
+    """
+
+    type = 'active'
+
+
+class Effect6448(BaseEffect):
+    """
+    structureMissileGuidanceEnhancer
+
+    Used by:
+    Variations of structure module: Standup Missile Guidance Enhancer I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        missileGroups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile')
+        for srcAttr, tgtAttr in (
+                ('aoeCloudSizeBonus', 'aoeCloudSize'),
+                ('aoeVelocityBonus', 'aoeVelocity'),
+                ('missileVelocityBonus', 'maxVelocity'),
+                ('explosionDelayBonus', 'explosionDelay'),
+        ):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in missileGroups,
+                                            tgtAttr, container.getModifiedItemAttr(srcAttr),
+                                            stackingPenalties=True, **kwargs)
+
+
+class Effect6449(BaseEffect):
+    """
+    structureBallisticControlSystem
+
+    Used by:
+    Variations of structure module: Standup Ballistic Control System I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        missileGroups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile')
+
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.group.name in missileGroups,
+                                               '%sDamage' % dmgType,
+                                               module.getModifiedItemAttr('missileDamageMultiplierBonus'),
+                                               stackingPenalties=True, **kwargs)
+
+        launcherGroups = ('Structure XL Missile Launcher', 'Structure Multirole Missile Launcher')
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name in launcherGroups,
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect6465(BaseEffect):
+    """
+    fighterAbilityAttackM
+
+    Used by:
+    Items from category: Fighter (54 of 94)
+    """
+
+    dealsDamage = True
+    displayName = 'Turret Attack'
+    prefix = 'fighterAbilityAttackMissile'
+    type = 'active'
+
+
+class Effect6470(BaseEffect):
+    """
+    remoteECMFalloff
+
+    Used by:
+    Modules from group: ECM (43 of 43)
+    Starbases from group: Electronic Warfare Battery (12 of 12)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        strength = module.getModifiedItemAttr('scan{0}StrengthBonus'.format(fit.scanType))
+        strength *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6472(BaseEffect):
+    """
+    doomsdayBeamDOT
+
+    Used by:
+    Module: 'Geiravor' Explosive Lance
+    Module: 'Holy Destiny' Electromagnetic Lance
+    Module: 'Iron Pike' Kinetic Lance
+    Module: 'Phalarica' Thermal Lance
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect6473(BaseEffect):
+    """
+    doomsdayConeDOT
+
+    Used by:
+    Module: Bosonic Field Generator
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect6474(BaseEffect):
+    """
+    doomsdayHOG
+
+    Used by:
+    Module: Gravitational Transportation Field Oscillator
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect6475(BaseEffect):
+    """
+    structureRigDoomsdayTargetAmountBonus
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+                                         'lightningWeaponTargetAmount',
+                                         src.getModifiedItemAttr('structureRigDoomsdayTargetAmountBonus'), **kwargs)
+
+
+class Effect6476(BaseEffect):
+    """
+    doomsdayAOEWeb
+
+    Used by:
+    Module: Stasis Webification Burst Projector
+    Structure Module: Standup Stasis Webification Burst Projector
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('speedFactor'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6477(BaseEffect):
+    """
+    doomsdayAOENeut
+
+    Used by:
+    Module: Energy Neutralization Burst Projector
+    Structure Module: Standup Energy Neutralization Burst Projector
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if not ((hasattr(src, 'state') and src.state >= FittingModuleState.ACTIVE) or hasattr(src, 'amountActive')):
+            return
+        amount = src.getModifiedItemAttr('energyNeutralizerAmount')
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        time = src.getModifiedItemAttr('duration')
+        fit.addDrain(src, time, amount, 0)
+
+
+class Effect6478(BaseEffect):
+    """
+    doomsdayAOEPaint
+
+    Used by:
+    Module: Target Illumination Burst Projector
+    Structure Module: Standup Target Illumination Burst Projector
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        fit.ship.boostItemAttr('signatureRadius', container.getModifiedItemAttr('signatureRadiusBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6479(BaseEffect):
+    """
+    doomsdayAOETrack
+
+    Used by:
+    Module: Weapon Disruption Burst Projector
+    Structure Module: Standup Weapon Disruption Burst Projector
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        for srcAttr, tgtAttr in (
+            ('aoeCloudSizeBonus', 'aoeCloudSize'),
+            ('aoeVelocityBonus', 'aoeVelocity'),
+            ('missileVelocityBonus', 'maxVelocity'),
+            ('explosionDelayBonus', 'explosionDelay')
+        ):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                            tgtAttr, module.getModifiedItemAttr(srcAttr),
+                                            stackingPenalties=True, **kwargs)
+        for srcAttr, tgtAttr in (
+            ('trackingSpeedBonus', 'trackingSpeed'),
+            ('maxRangeBonus', 'maxRange'),
+            ('falloffBonus', 'falloff')
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          tgtAttr, module.getModifiedItemAttr(srcAttr),
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect6481(BaseEffect):
+    """
+    doomsdayAOEDamp
+
+    Used by:
+    Module: Sensor Dampening Burst Projector
+    Structure Module: Standup Sensor Dampening Burst Projector
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6482(BaseEffect):
+    """
+    doomsdayAOEBubble
+
+    Used by:
+    Module: Warp Disruption Burst Projector
+    Structure Module: Standup Warp Disruption Burst Projector
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        return
+
+
+class Effect6484(BaseEffect):
+    """
+    emergencyHullEnergizer
+
+    Used by:
+    Variations of module: Capital Emergency Hull Energizer I (5 of 5)
+    """
+
+    runtime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.multiplyItemAttr('{}DamageResonance'.format(dmgType),
+                                      src.getModifiedItemAttr('hull{}DamageResonance'.format(dmgType.title())),
+                                      stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect6485(BaseEffect):
+    """
+    fighterAbilityLaunchBomb
+
+    Used by:
+    Fighters from group: Heavy Fighter (8 of 17)
+    Fighters from group: Structure Heavy Fighter (8 of 17)
+    """
+
+    dealsDamage = True
+    displayName = 'Bomb'
+    hasCharges = True
+    prefix = 'fighterAbilityLaunchBomb'
+    type = 'active'
+
+
+class Effect6487(BaseEffect):
+    """
+    modifyEnergyWarfareResistance
+
+    Used by:
+    Modules from group: Capacitor Battery (30 of 30)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('energyWarfareResistance',
+                               module.getModifiedItemAttr('energyWarfareResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6488(BaseEffect):
+    """
+    scriptSensorBoosterSensorStrengthBonusBonus
+
+    Used by:
+    Charges from group: Sensor Booster Script (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for scanType in ('Gravimetric', 'Magnetometric', 'Radar', 'Ladar'):
+            module.boostItemAttr('scan{}StrengthPercent'.format(scanType),
+                                 module.getModifiedChargeAttr('sensorStrengthBonusBonus'), **kwargs)
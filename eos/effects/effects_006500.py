@@ -0,0 +1,5986 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect6501(BaseEffect):
+    """
+    shipBonusDreadnoughtA1DamageBonus
+
+    Used by:
+    Ships named like: Revelation (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect6502(BaseEffect):
+    """
+    shipBonusDreadnoughtA2ArmorResists
+
+    Used by:
+    Ships named like: Revelation (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                'armor{}DamageResonance'.format(dmgType.capitalize()),
+                src.getModifiedItemAttr('shipBonusDreadnoughtA2'),
+                skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect6503(BaseEffect):
+    """
+    shipBonusDreadnoughtA3CapNeed
+
+    Used by:
+    Ships named like: Revelation (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtA3'), skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect6504(BaseEffect):
+    """
+    shipBonusDreadnoughtC1DamageBonus
+
+    Used by:
+    Ships named like: Phoenix (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('emDamage', 'thermalDamage', 'kineticDamage', 'explosiveDamage'):
+            fit.modules.filteredChargeBoost(lambda mod: (mod.charge.requiresSkill('XL Torpedoes') or
+                                                         mod.charge.requiresSkill('XL Cruise Missiles') or
+                                                         mod.charge.requiresSkill('Torpedoes')), attrName,
+                                            src.getModifiedItemAttr('shipBonusDreadnoughtC1'),
+                                            skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect6505(BaseEffect):
+    """
+    shipBonusDreadnoughtC2ShieldResists
+
+    Used by:
+    Variations of ship: Phoenix (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusDreadnoughtC2'),
+                               skill='Caldari Dreadnought', **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusDreadnoughtC2'),
+                               skill='Caldari Dreadnought', **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusDreadnoughtC2'),
+                               skill='Caldari Dreadnought', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusDreadnoughtC2'),
+                               skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect6506(BaseEffect):
+    """
+    shipBonusDreadnoughtG1DamageBonus
+
+    Used by:
+    Ship: Moros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect6507(BaseEffect):
+    """
+    shipBonusDreadnoughtG2ROFBonus
+
+    Used by:
+    Variations of ship: Moros (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG2'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect6508(BaseEffect):
+    """
+    shipBonusDreadnoughtG3RepairTime
+
+    Used by:
+    Variations of ship: Moros (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG3'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect6509(BaseEffect):
+    """
+    shipBonusDreadnoughtM1DamageBonus
+
+    Used by:
+    Ships named like: Naglfar (2 of 2)
+    Ship: Sarathiel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect6510(BaseEffect):
+    """
+    shipBonusDreadnoughtM2ROFBonus
+
+    Used by:
+    Ships named like: Naglfar (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect6511(BaseEffect):
+    """
+    shipBonusDreadnoughtM3RepairTime
+
+    Used by:
+    Ship: Naglfar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'duration',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect6513(BaseEffect):
+    """
+    doomsdayAOEECM
+
+    Used by:
+    Module: ECM Jammer Burst Projector
+    Structure Module: Standup ECM Jammer Burst Projector
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        strength = module.getModifiedItemAttr('scan{0}StrengthBonus'.format(fit.scanType))
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6526(BaseEffect):
+    """
+    shipBonusForceAuxiliaryA1RemoteRepairAndCapAmount
+
+    Used by:
+    Ship: Apostle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+                                      'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
+                                      skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
+                                      skill='Amarr Carrier', **kwargs)
+
+
+class Effect6527(BaseEffect):
+    """
+    shipBonusForceAuxiliaryA2ArmorResists
+
+    Used by:
+    Ship: Apostle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryA2'),
+                               skill='Amarr Carrier', **kwargs)
+
+
+class Effect6533(BaseEffect):
+    """
+    shipBonusForceAuxiliaryA4WarfareLinksBonus
+
+    Used by:
+    Ship: Apostle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
+                                                  mod.item.requiresSkill('Information Command'),
+                                      'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
+                                      skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
+                                                  mod.item.requiresSkill('Information Command'),
+                                      'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
+                                      skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
+                                                  mod.item.requiresSkill('Information Command'),
+                                      'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
+                                      skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
+                                                  mod.item.requiresSkill('Information Command'),
+                                      'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
+                                      skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
+                                                  mod.item.requiresSkill('Information Command'),
+                                      'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
+                                      skill='Amarr Carrier', **kwargs)
+
+
+class Effect6534(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM4WarfareLinksBonus
+
+    Used by:
+    Ship: Lif
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6535(BaseEffect):
+    """
+    shipBonusForceAuxiliaryG4WarfareLinksBonus
+
+    Used by:
+    Ship: Ninazu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6536(BaseEffect):
+    """
+    shipBonusForceAuxiliaryC4WarfareLinksBonus
+
+    Used by:
+    Ship: Minokawa
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect6537(BaseEffect):
+    """
+    shipBonusRole1CommandBurstCPUBonus
+
+    Used by:
+    Ships from group: Force Auxiliary (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+                                      src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6545(BaseEffect):
+    """
+    shipBonusForceAuxiliaryC1RemoteBoostAndCapAmount
+
+    Used by:
+    Ship: Minokawa
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        if src.getModifiedItemAttr('shipBonusForceAuxiliaryC1') is None:
+            return  # See GH Issue 1321
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+                                      'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
+                                      skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+                                      'shieldBonus', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
+                                      skill='Caldari Carrier', **kwargs)
+
+
+class Effect6546(BaseEffect):
+    """
+    shipBonusForceAuxiliaryC2ShieldResists
+
+    Used by:
+    Variations of ship: Minokawa (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusForceAuxiliaryC2'),
+                               skill='Caldari Carrier', **kwargs)
+
+
+class Effect6548(BaseEffect):
+    """
+    shipBonusForceAuxiliaryG1RemoteCycleTime
+
+    Used by:
+    Ship: Ninazu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Shield Emission Systems'),
+            'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6549(BaseEffect):
+    """
+    shipBonusForceAuxiliaryG2LocalRepairAmount
+
+    Used by:
+    Ship: Ninazu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+                                      src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+                                      src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6551(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM1RemoteDuration
+
+    Used by:
+    Ship: Lif
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6552(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM2LocalBoostAmount
+
+    Used by:
+    Ship: Lif
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+                                      src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+                                      src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6555(BaseEffect):
+    """
+    moduleBonusDroneNavigationComputer
+
+    Used by:
+    Modules from group: Drone Navigation Computer (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+                                     src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+
+
+class Effect6556(BaseEffect):
+    """
+    moduleBonusDroneDamageAmplifier
+
+    Used by:
+    Modules from group: Drone Damage Modules (12 of 12)
+    Modules named like: C3 'Hivaa Saitsuo' Ballistic Control System (2 of 2)
+    Module: Abyssal Ballistic Control System
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect6557(BaseEffect):
+    """
+    moduleBonusOmnidirectionalTrackingLink
+
+    Used by:
+    Modules from group: Drone Tracking Modules (10 of 10)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionVelocity',
+                                       src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+                                     src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionRadius',
+                                       src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretTrackingSpeed',
+                                       src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionRadius',
+                                       src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+                                       src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+                                     src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionVelocity',
+                                       src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+                                     src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
+                                       stackingPenalties=True, **kwargs)
+
+
+class Effect6558(BaseEffect):
+    """
+    moduleBonusOmnidirectionalTrackingLinkOverload
+
+    Used by:
+    Modules from group: Drone Tracking Modules (10 of 10)
+    """
+
+    type = 'overheat'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        overloadBonus = module.getModifiedItemAttr('overloadTrackingModuleStrengthBonus')
+        module.boostItemAttr('maxRangeBonus', overloadBonus, **kwargs)
+        module.boostItemAttr('falloffBonus', overloadBonus, **kwargs)
+        module.boostItemAttr('trackingSpeedBonus', overloadBonus, **kwargs)
+        module.boostItemAttr('aoeCloudSizeBonus', overloadBonus, **kwargs)
+        module.boostItemAttr('aoeVelocityBonus', overloadBonus, **kwargs)
+
+
+class Effect6559(BaseEffect):
+    """
+    moduleBonusOmnidirectionalTrackingEnhancer
+
+    Used by:
+    Modules from group: Drone Tracking Enhancer (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionRadius',
+                                       src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionRadius',
+                                       src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+                                     src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretTrackingSpeed',
+                                       src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+                                     src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+                                     src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionVelocity',
+                                       src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionVelocity',
+                                       src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+                                       src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect6560(BaseEffect):
+    """
+    skillBonusFighters
+
+    Used by:
+    Skill: Fighters
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6561(BaseEffect):
+    """
+    skillBonusLightFighters
+
+    Used by:
+    Skill: Light Fighters
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+
+
+class Effect6562(BaseEffect):
+    """
+    skillBonusSupportFightersShield
+
+    Used by:
+    Skill: Support Fighters
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('shieldBonus') * lvl, **kwargs)
+
+
+class Effect6563(BaseEffect):
+    """
+    skillBonusHeavyFighters
+
+    Used by:
+    Skill: Heavy Fighters
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6565(BaseEffect):
+    """
+    citadelRigBonus
+
+    Used by:
+    Structures from group: Citadel (9 of 9)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+
+        for attr in [
+            'structureRigDoomsdayDamageLossTargetBonus',
+            'structureRigScanResBonus',
+            'structureRigPDRangeBonus',
+            'structureRigPDCapUseBonus',
+            'structureRigMissileExploVeloBonus',
+            'structureRigMissileVelocityBonus',
+            'structureRigEwarOptimalBonus',
+            'structureRigEwarFalloffBonus',
+            'structureRigEwarCapUseBonus',
+            'structureRigMissileExplosionRadiusBonus'
+        ]:
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Jury Rigging'),
+                                      attr, src.getModifiedItemAttr('structureRoleBonus'), **kwargs)
+
+
+class Effect6566(BaseEffect):
+    """
+    moduleBonusFighterSupportUnit
+
+    Used by:
+    Modules from group: Fighter Support Unit (10 of 10)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('fighterBonusShieldCapacityPercent'), **kwargs)
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('fighterBonusVelocityPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDuration',
+                                       src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
+                                       src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
+                                       src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldRechargeRate',
+                                       src.getModifiedItemAttr('fighterBonusShieldRechargePercent'), **kwargs)
+
+
+class Effect6567(BaseEffect):
+    """
+    moduleBonusNetworkedSensorArray
+
+    Used by:
+    Module: Networked Sensor Array
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('scanResolutionBonus'), stackingPenalties=True, **kwargs)
+
+        for scanType in ('Magnetometric', 'Ladar', 'Gravimetric', 'Radar'):
+            attr = 'scan{}Strength'.format(scanType)
+            bonus = src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType))
+            fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True, **kwargs)
+            fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), attr, bonus,
+                                           stackingPenalties=True, **kwargs)
+
+        # EW cap need increase
+        groups = [
+            'Burst Jammer',
+            'Weapon Disruptor',
+            'ECM',
+            'Stasis Grappler',
+            'Sensor Dampener',
+            'Target Painter']
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups or
+                                                  mod.item.requiresSkill('Propulsion Jamming'),
+                                      'capacitorNeed', src.getModifiedItemAttr('ewCapacitorNeedBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('Capital Micro Jump Drive Operation'), 'activationBlocked',
+            src.getModifiedItemAttr('networkedSensorArrayDisallowCapitalMicroJump'), **kwargs)
+
+
+class Effect6570(BaseEffect):
+    """
+    skillBonusFighterHangarManagement
+
+    Used by:
+    Skill: Fighter Hangar Management
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.ship.boostItemAttr('fighterCapacity', src.getModifiedItemAttr('skillBonusFighterHangarSize') * lvl, **kwargs)
+
+
+class Effect6571(BaseEffect):
+    """
+    skillBonusCapitalAutocannonSpecialization
+
+    Used by:
+    Skill: Capital Autocannon Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Autocannon Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6572(BaseEffect):
+    """
+    skillBonusCapitalArtillerySpecialization
+
+    Used by:
+    Skill: Capital Artillery Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Artillery Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6573(BaseEffect):
+    """
+    skillBonusCapitalBlasterSpecialization
+
+    Used by:
+    Skill: Capital Blaster Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Blaster Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6574(BaseEffect):
+    """
+    skillBonusCapitalRailgunSpecialization
+
+    Used by:
+    Skill: Capital Railgun Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Railgun Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6575(BaseEffect):
+    """
+    skillBonusCapitalPulseLaserSpecialization
+
+    Used by:
+    Skill: Capital Pulse Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Pulse Laser Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6576(BaseEffect):
+    """
+    skillBonusCapitalBeamLaserSpecialization
+
+    Used by:
+    Skill: Capital Beam Laser Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Beam Laser Specialization'),
+                                      'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+
+
+class Effect6577(BaseEffect):
+    """
+    skillBonusXLCruiseMissileSpecialization
+
+    Used by:
+    Skill: XL Cruise Missile Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missile Specialization'), 'speed',
+                                      src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+
+
+class Effect6578(BaseEffect):
+    """
+    skillBonusXLTorpedoSpecialization
+
+    Used by:
+    Skill: XL Torpedo Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedo Specialization'), 'speed',
+                                      src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+
+
+class Effect6580(BaseEffect):
+    """
+    shipBonusRole2LogisticDroneRepAmountBonus
+
+    Used by:
+    Ships from group: Force Auxiliary (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'structureDamageAmount',
+                                     src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'armorDamageAmount',
+                                     src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'shieldBonus',
+                                     src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect6581(BaseEffect):
+    """
+    moduleBonusTriageModule
+
+    Used by:
+    Variations of module: Triage Module I (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        # Remote effect bonuses (duration / amount / range / falloff)
+        for skill, amtAttr, stack in (
+                ('Capital Remote Armor Repair Systems', 'armorDamageAmount', True),
+                ('Capital Shield Emission Systems', 'shieldBonus', True),
+                ('Capital Capacitor Emission Systems', 'powerTransferAmount', False),
+                ('Capital Remote Hull Repair Systems', 'structureDamageAmount', False)):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+                                          src.getModifiedItemAttr('siegeRemoteLogisticsDurationBonus'), **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+                                          src.getModifiedItemAttr('siegeRemoteLogisticsAmountBonus'),
+                                          stackingPenalties=stack, **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'maxRange',
+                                          src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'falloffEffectiveness',
+                                          src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
+
+        # Local armor/shield rep effects (duration / amount)
+        for skill, amtAttr in (
+                ('Capital Shield Operation', 'shieldBonus'),
+                ('Capital Repair Systems', 'armorDamageAmount')):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+                                          src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+                                          src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
+                                          stackingPenalties=True, **kwargs)
+
+        # Speed bonus
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+
+        # Scan resolution multiplier
+        fit.ship.multiplyItemAttr('scanResolution', src.getModifiedItemAttr('scanResolutionMultiplier'),
+                                  stackingPenalties=True, **kwargs)
+
+        # Mass multiplier
+        fit.ship.multiplyItemAttr('mass', src.getModifiedItemAttr('siegeMassMultiplier'), stackingPenalties=True, **kwargs)
+
+        # Max locked targets
+        fit.ship.increaseItemAttr('maxLockedTargets', src.getModifiedItemAttr('maxLockedTargetsBonus'), **kwargs)
+
+        # EW cap need increase
+        groups = [
+            'Burst Jammer',
+            'Weapon Disruptor',
+            'ECM',
+            'Stasis Grappler',
+            'Sensor Dampener',
+            'Target Painter']
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups or
+                                                  mod.item.requiresSkill('Propulsion Jamming'),
+                                      'capacitorNeed', src.getModifiedItemAttr('ewCapacitorNeedBonus'), **kwargs)
+
+        # todo: test for April 2016 release
+        # Block EWAR & projected effects
+        fit.ship.forceItemAttr('disallowOffensiveModifiers', src.getModifiedItemAttr('disallowOffensiveModifiers'), **kwargs)
+        fit.ship.forceItemAttr('disallowAssistance', src.getModifiedItemAttr('disallowAssistance'), **kwargs)
+
+        # new in April 2016 release
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
+
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+        fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
+
+        fit.ship.forceItemAttr('disallowTethering', src.getModifiedItemAttr('disallowTethering'), **kwargs)
+        fit.ship.forceItemAttr('disallowDocking', src.getModifiedItemAttr('disallowDocking'), **kwargs)
+
+
+class Effect6582(BaseEffect):
+    """
+    moduleBonusSiegeModule
+
+    Used by:
+    Modules named like: Siege Module (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        # Turrets
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret') or
+                                                  mod.item.requiresSkill('Capital Hybrid Turret') or
+                                                  mod.item.requiresSkill('Capital Projectile Turret') or
+                                                  mod.item.requiresSkill('Capital Precursor Weapon'),
+                                      'damageMultiplier', src.getModifiedItemAttr('siegeTurretDamageBonus'), **kwargs)
+
+        # Missiles
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes') or
+                                                        mod.charge.requiresSkill('XL Cruise Missiles') or
+                                                        mod.charge.requiresSkill('Torpedoes'),
+                                            '%sDamage' % type, src.getModifiedItemAttr('siegeMissileDamageBonus'), **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes') or
+                                                  mod.item.requiresSkill('XL Cruise Missiles'),
+                                      'speed', src.getModifiedItemAttr('siegeLauncherROFBonus'), **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Torpedo',
+                                      'speed', src.getModifiedItemAttr('siegeHAWMissileROFBonus'),
+                                      stackingPenalties=True, penaltyGroup='postPercent', **kwargs)
+
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+                                        'maxVelocity', src.getModifiedItemAttr('siegeTorpedoVelocityBonus'),
+                                        stackingPenalties=True, **kwargs)
+
+        # Tank
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation') or
+                                                  mod.item.requiresSkill('Capital Repair Systems'),
+                                      'duration', src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        # Mobility & safety penalties
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('speedFactor'), **kwargs)
+        fit.ship.multiplyItemAttr('mass', src.getModifiedItemAttr('siegeMassMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+        fit.ship.forceItemAttr('disallowDocking', src.getModifiedItemAttr('disallowDocking'), **kwargs)
+        fit.ship.forceItemAttr('disallowTethering', src.getModifiedItemAttr('disallowTethering'), **kwargs)
+
+        # Ewar and assistance resistances
+        fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('weaponDisruptionResistance', src.getModifiedItemAttr('weaponDisruptionResistanceBonus'), **kwargs)
+
+
+class Effect6591(BaseEffect):
+    """
+    shipBonusSupercarrierA3WarpStrength
+
+    Used by:
+    Ship: Aeon
+    Ship: Revenant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusSupercarrierA3'),
+                                  skill='Amarr Carrier', **kwargs)
+
+
+class Effect6592(BaseEffect):
+    """
+    shipBonusSupercarrierC3WarpStrength
+
+    Used by:
+    Ship: Revenant
+    Ship: Wyvern
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusSupercarrierC3'),
+                                  skill='Caldari Carrier', **kwargs)
+
+
+class Effect6593(BaseEffect):
+    """
+    shipBonusSupercarrierG3WarpStrength
+
+    Used by:
+    Variations of ship: Nyx (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusSupercarrierG3'),
+                                  skill='Gallente Carrier', **kwargs)
+
+
+class Effect6594(BaseEffect):
+    """
+    shipBonusSupercarrierM3WarpStrength
+
+    Used by:
+    Ship: Hel
+    Ship: Vendetta
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusSupercarrierM3'),
+                                  skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6595(BaseEffect):
+    """
+    shipBonusCarrierA4WarfareLinksBonus
+
+    Used by:
+    Ship: Archon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6596(BaseEffect):
+    """
+    shipBonusCarrierC4WarfareLinksBonus
+
+    Used by:
+    Ship: Chimera
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect6597(BaseEffect):
+    """
+    shipBonusCarrierG4WarfareLinksBonus
+
+    Used by:
+    Ship: Thanatos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6598(BaseEffect):
+    """
+    shipBonusCarrierM4WarfareLinksBonus
+
+    Used by:
+    Ship: Nidhoggur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6599(BaseEffect):
+    """
+    shipBonusCarrierA1ArmorResists
+
+    Used by:
+    Ship: Archon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('shipBonusCarrierA1'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('shipBonusCarrierA1'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusCarrierA1'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('shipBonusCarrierA1'),
+                               skill='Amarr Carrier', **kwargs)
+
+
+class Effect6600(BaseEffect):
+    """
+    shipBonusCarrierC1ShieldResists
+
+    Used by:
+    Ship: Chimera
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusCarrierC1'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusCarrierC1'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusCarrierC1'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusCarrierC1'),
+                               skill='Caldari Carrier', **kwargs)
+
+
+class Effect6601(BaseEffect):
+    """
+    shipBonusCarrierG1FighterDamage
+
+    Used by:
+    Ship: Thanatos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6602(BaseEffect):
+    """
+    shipBonusCarrierM1FighterDamage
+
+    Used by:
+    Ship: Nidhoggur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6603(BaseEffect):
+    """
+    shipBonusSupercarrierA1FighterDamage
+
+    Used by:
+    Ship: Aeon
+    Ship: Revenant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6604(BaseEffect):
+    """
+    shipBonusSupercarrierC1FighterDamage
+
+    Used by:
+    Ship: Revenant
+    Ship: Wyvern
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect6605(BaseEffect):
+    """
+    shipBonusSupercarrierG1FighterDamage
+
+    Used by:
+    Variations of ship: Nyx (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6606(BaseEffect):
+    """
+    shipBonusSupercarrierM1FighterDamage
+
+    Used by:
+    Ship: Hel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6607(BaseEffect):
+    """
+    shipBonusSupercarrierA5WarfareLinksBonus
+
+    Used by:
+    Ship: Aeon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6608(BaseEffect):
+    """
+    shipBonusSupercarrierC5WarfareLinksBonus
+
+    Used by:
+    Ship: Wyvern
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect6609(BaseEffect):
+    """
+    shipBonusSupercarrierG5WarfareLinksBonus
+
+    Used by:
+    Ship: Nyx
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6610(BaseEffect):
+    """
+    shipBonusSupercarrierM5WarfareLinksBonus
+
+    Used by:
+    Ship: Hel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6611(BaseEffect):
+    """
+    shipBonusSupercarrierC2AfterburnerBonus
+
+    Used by:
+    Ship: Revenant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+                                      src.getModifiedItemAttr('shipBonusSupercarrierC2'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect6612(BaseEffect):
+    """
+    shipBonusSupercarrierA2FighterApplicationBonus
+
+    Used by:
+    Ship: Revenant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionVelocity',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionVelocity',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6613(BaseEffect):
+    """
+    shipBonusSupercarrierRole1NumWarfareLinks
+
+    Used by:
+    Ships from group: Supercarrier (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6614(BaseEffect):
+    """
+    shipBonusSupercarrierRole2ArmorShieldModuleBonus
+
+    Used by:
+    Ships from group: Supercarrier (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect6615(BaseEffect):
+    """
+    shipBonusSupercarrierA4BurstProjectorBonus
+
+    Used by:
+    Ship: Aeon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+                                      'durationWeaponDisruptionBurstProjector',
+                                      src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6616(BaseEffect):
+    """
+    shipBonusSupercarrierC4BurstProjectorBonus
+
+    Used by:
+    Ship: Wyvern
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+                                      'durationECMJammerBurstProjector', src.getModifiedItemAttr('shipBonusSupercarrierC4'),
+                                      skill='Caldari Carrier', **kwargs)
+
+
+class Effect6617(BaseEffect):
+    """
+    shipBonusSupercarrierG4BurstProjectorBonus
+
+    Used by:
+    Ship: Nyx
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+                                      'durationSensorDampeningBurstProjector',
+                                      src.getModifiedItemAttr('shipBonusSupercarrierG4'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6618(BaseEffect):
+    """
+    shipBonusSupercarrierM4BurstProjectorBonus
+
+    Used by:
+    Ship: Hel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+                                      'durationTargetIlluminationBurstProjector',
+                                      src.getModifiedItemAttr('shipBonusSupercarrierM4'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6619(BaseEffect):
+    """
+    shipBonusCarrierRole1NumWarfareLinks
+
+    Used by:
+    Ships from group: Carrier (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6620(BaseEffect):
+    """
+    shipBonusDreadnoughtC3ReloadBonus
+
+    Used by:
+    Ships named like: Phoenix (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'reloadTime',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtC3'), skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect6621(BaseEffect):
+    """
+    shipBonusSupercarrierA2ArmorResists
+
+    Used by:
+    Ship: Aeon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierA2'),
+                               skill='Amarr Carrier', **kwargs)
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierA2'),
+                               skill='Amarr Carrier', **kwargs)
+
+
+class Effect6622(BaseEffect):
+    """
+    shipBonusSupercarrierC2ShieldResists
+
+    Used by:
+    Ship: Wyvern
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierC2'),
+                               skill='Caldari Carrier', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusSupercarrierC2'),
+                               skill='Caldari Carrier', **kwargs)
+
+
+class Effect6623(BaseEffect):
+    """
+    shipBonusSupercarrierG2FighterHitpoints
+
+    Used by:
+    Variations of ship: Nyx (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierG2'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6624(BaseEffect):
+    """
+    shipBonusSupercarrierM2FighterVelocity
+
+    Used by:
+    Ship: Hel
+    Ship: Vendetta
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierM2'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6625(BaseEffect):
+    """
+    shipBonusCarrierA2SupportFighterBonusRange
+
+    Used by:
+    Ship: Archon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+                                       'fighterAbilityEnergyNeutralizerOptimalRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6626(BaseEffect):
+    """
+    shipBonusCarrierC2SupportFighterBonusRange
+
+    Used by:
+    Ship: Chimera
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierC2'), skill='Caldari Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+                                       'fighterAbilityECMRangeOptimal', src.getModifiedItemAttr('shipBonusCarrierC2'),
+                                       skill='Caldari Carrier', **kwargs)
+
+
+class Effect6627(BaseEffect):
+    """
+    shipBonusCarrierG2SupportFighterBonusRange
+
+    Used by:
+    Ship: Thanatos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierG2'), skill='Gallente Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+                                       'fighterAbilityWarpDisruptionRange', src.getModifiedItemAttr('shipBonusCarrierG2'),
+                                       skill='Gallente Carrier', **kwargs)
+
+
+class Effect6628(BaseEffect):
+    """
+    shipBonusCarrierM2SupportFighterBonusRange
+
+    Used by:
+    Ship: Nidhoggur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+                                       'fighterAbilityStasisWebifierOptimalRange',
+                                       src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6629(BaseEffect):
+    """
+    scriptResistanceBonusBonus
+
+    Used by:
+    Charges named like: Resistance Script (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('emDamageResistanceBonus', src.getModifiedChargeAttr('emDamageResistanceBonusBonus'), **kwargs)
+        src.boostItemAttr('explosiveDamageResistanceBonus',
+                          src.getModifiedChargeAttr('explosiveDamageResistanceBonusBonus'), **kwargs)
+        src.boostItemAttr('kineticDamageResistanceBonus', src.getModifiedChargeAttr('kineticDamageResistanceBonusBonus'), **kwargs)
+        src.boostItemAttr('thermalDamageResistanceBonus', src.getModifiedChargeAttr('thermalDamageResistanceBonusBonus'), **kwargs)
+
+
+class Effect6634(BaseEffect):
+    """
+    shipBonusTitanA1DamageBonus
+
+    Used by:
+    Ship: Avatar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
+
+
+class Effect6635(BaseEffect):
+    """
+    shipBonusTitanC1KinDamageBonus
+
+    Used by:
+    Ship: Leviathan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+
+
+class Effect6636(BaseEffect):
+    """
+    shipBonusTitanG1DamageBonus
+
+    Used by:
+    Ship: Erebus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
+
+
+class Effect6637(BaseEffect):
+    """
+    shipBonusTitanM1DamageBonus
+
+    Used by:
+    Ship: Azariel
+    Ship: Ragnarok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
+
+
+class Effect6638(BaseEffect):
+    """
+    shipBonusTitanC2ROFBonus
+
+    Used by:
+    Variations of ship: Leviathan (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Cruise', 'speed',
+                                      src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Torpedo', 'speed',
+                                      src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
+
+
+class Effect6639(BaseEffect):
+    """
+    shipBonusSupercarrierA4FighterApplicationBonus
+
+    Used by:
+    Ship: Revenant
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesExplosionRadius',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileExplosionRadius',
+                                       src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6640(BaseEffect):
+    """
+    shipBonusRole1NumWarfareLinks
+
+    Used by:
+    Ships from group: Titan (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6641(BaseEffect):
+    """
+    shipBonusRole2ArmorPlates&ShieldExtendersBonus
+
+    Used by:
+    Ships from group: Titan (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect6642(BaseEffect):
+    """
+    skillBonusDoomsdayRapidFiring
+
+    Used by:
+    Skill: Doomsday Rapid Firing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Doomsday Operation'), 'duration',
+                                      src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+
+
+class Effect6647(BaseEffect):
+    """
+    shipBonusTitanA3WarpStrength
+
+    Used by:
+    Variations of ship: Avatar (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusTitanA3'), skill='Amarr Titan', **kwargs)
+
+
+class Effect6648(BaseEffect):
+    """
+    shipBonusTitanC3WarpStrength
+
+    Used by:
+    Variations of ship: Leviathan (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusTitanC3'), skill='Caldari Titan', **kwargs)
+
+
+class Effect6649(BaseEffect):
+    """
+    shipBonusTitanG3WarpStrength
+
+    Used by:
+    Ships from group: Titan (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusTitanG3'), skill='Gallente Titan', **kwargs)
+
+
+class Effect6650(BaseEffect):
+    """
+    shipBonusTitanM3WarpStrength
+
+    Used by:
+    Ships from group: Titan (4 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('shipBonusTitanM3'), skill='Minmatar Titan', **kwargs)
+
+
+class Effect6651(BaseEffect):
+    """
+    shipModuleAncillaryRemoteArmorRepairer
+
+    Used by:
+    Modules from group: Ancillary Remote Armor Repairer (4 of 4)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        if module.charge and module.charge.name == 'Nanite Repair Paste':
+            multiplier = 3
+        else:
+            multiplier = 1
+        amount = module.getModifiedItemAttr('armorDamageAmount') * multiplier
+        amount *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        fit._armorRr.append((amount, speed))
+        fit._armorRrPreSpool.append((amount, speed))
+        fit._armorRrFullSpool.append((amount, speed))
+
+
+class Effect6652(BaseEffect):
+    """
+    shipModuleAncillaryRemoteShieldBooster
+
+    Used by:
+    Modules from group: Ancillary Remote Shield Booster (4 of 4)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        amount = module.getModifiedItemAttr('shieldBonus')
+        amount *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        speed = module.getModifiedItemAttr('duration') / 1000.0
+        fit._shieldRr.append((amount, speed))
+
+
+class Effect6653(BaseEffect):
+    """
+    shipBonusTitanA2CapNeed
+
+    Used by:
+    Ship: Avatar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusTitanA2'), skill='Amarr Titan', **kwargs)
+
+
+class Effect6654(BaseEffect):
+    """
+    shipBonusTitanG2ROFBonus
+
+    Used by:
+    Variations of ship: Erebus (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
+
+
+class Effect6655(BaseEffect):
+    """
+    shipBonusTitanM2ROFBonus
+
+    Used by:
+    Ship: Azariel
+    Ship: Ragnarok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusTitanM2'), skill='Minmatar Titan', **kwargs)
+
+
+class Effect6657(BaseEffect):
+    """
+    shipBonusTitanC5AllDamageBonus
+
+    Used by:
+    Ship: Leviathan
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
+
+
+class Effect6658(BaseEffect):
+    """
+    moduleBonusBastionModule
+
+    Used by:
+    Module: Bastion Module I
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        # Resistances
+        for layer, attrPrefix in (('shield', 'shield'), ('armor', 'armor'), ('hull', '')):
+            for damageType in ('Kinetic', 'Thermal', 'Explosive', 'Em'):
+                bonus = '%s%sDamageResonance' % (attrPrefix, damageType)
+                bonus = '%s%s' % (bonus[0].lower(), bonus[1:])
+                booster = '%s%sDamageResonance' % (layer, damageType)
+                penalize = False if layer == 'hull' else True
+                fit.ship.multiplyItemAttr(bonus, src.getModifiedItemAttr(booster),
+                                          stackingPenalties=penalize, penaltyGroup='preMul', **kwargs)
+
+        # Turrets
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
+                                                  mod.item.requiresSkill('Large Hybrid Turret') or
+                                                  mod.item.requiresSkill('Large Projectile Turret') or
+                                                  mod.item.requiresSkill('Large Precursor Weapon'),
+                                      'maxRange', src.getModifiedItemAttr('maxRangeBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
+                                                  mod.item.requiresSkill('Large Hybrid Turret') or
+                                                  mod.item.requiresSkill('Large Projectile Turret'),
+                                      'falloff', src.getModifiedItemAttr('falloffBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
+                                                  mod.item.requiresSkill('Large Hybrid Turret') or
+                                                  mod.item.requiresSkill('Large Projectile Turret') or
+                                                  mod.item.requiresSkill('Large Precursor Weapon'),
+                                      'speed', src.getModifiedItemAttr('bastionTurretROFBonus'),
+                                      stackingPenalties=True, penaltyGroup='postPerc', **kwargs)
+
+        # Missiles
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes') or
+                                                    mod.charge.requiresSkill('Cruise Missiles') or
+                                                    mod.charge.requiresSkill('Heavy Missiles'),
+                                        'maxVelocity', src.getModifiedItemAttr('missileVelocityBonus'),
+                                        stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cruise Missiles') or
+                                                  mod.item.requiresSkill('Torpedoes') or
+                                                  mod.item.requiresSkill('Torpedo Specialization') or
+                                                  mod.item.requiresSkill('Cruise Missile Specialization'),
+                                      'speed', src.getModifiedItemAttr('bastionMissileROFBonus'),
+                                      stackingPenalties=True, penaltyGroup='postPerc', **kwargs)
+
+        # Tanking
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('armorDamageAmountBonus'),
+                                      stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('shieldBoostMultiplier'),
+                                      stackingPenalties=True, **kwargs)
+        for attrName in ('duration', 'capacitorNeed'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Repair Systems'),
+                attrName, src.getModifiedItemAttr('bastionModeArmorRepairAndShieldBoosterCapDurationBonus'), **kwargs)
+
+        # Speed penalty
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('speedFactor'), **kwargs)
+
+        # new with April 2016 release
+        for scanType in ('Magnetometric', 'Ladar', 'Gravimetric', 'Radar'):
+            fit.ship.boostItemAttr('scan{}Strength'.format(scanType),
+                                   src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType)),
+                                   stackingPenalties=True, **kwargs)
+
+        fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
+        # This one was removed from expressions, but somehow MJD is still blocked, so leaving it here
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+                                         'activationBlocked', src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
+        fit.ship.boostItemAttr('targetPainterResistance', src.getModifiedItemAttr('targetPainterResistanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('weaponDisruptionResistance', src.getModifiedItemAttr('weaponDisruptionResistanceBonus'), **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+        fit.ship.forceItemAttr('disallowDocking', src.getModifiedItemAttr('disallowDocking'), **kwargs)
+        fit.ship.forceItemAttr('disallowTethering', src.getModifiedItemAttr('disallowTethering'), **kwargs)
+
+
+class Effect6660(BaseEffect):
+    """
+    higgsWarpBubbleImmuneRemoval
+
+    Used by:
+    Modules from group: Burst Jammer (11 of 11)
+    Modules from group: Rig Anchor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.forceItemAttr('warpBubbleImmune', ship.getModifiedItemAttr('warpBubbleImmuneModifier'), **kwargs)
+
+
+class Effect6661(BaseEffect):
+    """
+    shipBonusCarrierM3FighterVelocity
+
+    Used by:
+    Ship: Nidhoggur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('shipBonusCarrierM3'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6662(BaseEffect):
+    """
+    shipBonusCarrierG3FighterHitpoints
+
+    Used by:
+    Ship: Thanatos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('shipBonusCarrierG3'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6663(BaseEffect):
+    """
+    skillBonusDroneInterfacing
+
+    Used by:
+    Skill: Drone Interfacing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
+                                     src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
+
+
+class Effect6664(BaseEffect):
+    """
+    skillBonusDroneSharpshooting
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Drone Sharpshooting DS (3 of 3)
+    Skill: Drone Sharpshooting
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+            src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+            src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretRangeOptimal',
+            src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileRangeOptimal',
+            src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
+
+
+class Effect6665(BaseEffect):
+    """
+    skillBonusDroneDurability
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Drone Durability DD (3 of 3)
+    Implants named like: Halcyon B Booster (5 of 5)
+    Skill: Drone Durability
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+                                     src.getModifiedItemAttr('hullHpBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+                                     src.getModifiedItemAttr('armorHpBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+                                     src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
+
+
+class Effect6667(BaseEffect):
+    """
+    skillBonusDroneNavigation
+
+    Used by:
+    Implants named like: Black Market 'Valdimar' Drone Navigation DN (3 of 3)
+    Skill: Drone Navigation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+                                     src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+
+
+class Effect6669(BaseEffect):
+    """
+    moduleBonusCapitalDroneDurabilityEnhancer
+
+    Used by:
+    Variations of module: Capital Drone Durability Enhancer I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+                                     src.getModifiedItemAttr('hullHpBonus'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+                                     src.getModifiedItemAttr('hullHpBonus'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+                                     src.getModifiedItemAttr('hullHpBonus'), **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('hullHpBonus'), **kwargs)
+        fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect6670(BaseEffect):
+    """
+    moduleBonusCapitalDroneScopeChip
+
+    Used by:
+    Variations of module: Capital Drone Scope Chip I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+                                     src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+                                       src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('rangeSkillBonus'),
+                                       stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+                                       'fighterAbilityAttackMissileRangeOptimal',
+                                       src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect6671(BaseEffect):
+    """
+    moduleBonusCapitalDroneSpeedAugmentor
+
+    Used by:
+    Variations of module: Capital Drone Speed Augmentor I (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+                                     src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+                                       src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
+
+
+class Effect6672(BaseEffect):
+    """
+    structureCombatRigSecurityModification
+
+    Used by:
+    Items from market group: Structure Modifications > Structure Combat Rigs (32 of 34)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        secMap = {
+            FitSystemSecurity.HISEC: 'hiSecModifier',
+            FitSystemSecurity.LOWSEC: 'lowSecModifier',
+            FitSystemSecurity.NULLSEC: 'nullSecModifier',
+            FitSystemSecurity.WSPACE: 'nullSecModifier'}
+        fitSec = fit.getSystemSecurity()
+        attrName = secMap[fitSec]
+        secModifier = module.getModifiedItemAttr(attrName)
+        module.multiplyItemAttr('structureRigDoomsdayDamageLossTargetBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigScanResBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigPDRangeBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigPDCapUseBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigMissileExploVeloBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigMissileVelocityBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigEwarOptimalBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigEwarFalloffBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigEwarCapUseBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigMissileExplosionRadiusBonus', secModifier, **kwargs)
+        module.multiplyItemAttr('structureRigMaxTargetRangeBonus', secModifier, **kwargs)
+
+
+class Effect6679(BaseEffect):
+    """
+    skillStructureDoomsdayDurationBonus
+
+    Used by:
+    Skill: Structure Doomsday Operation
+    """
+
+    type = 'passive', 'structure'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+                                      'duration', src.getModifiedItemAttr('durationBonus'),
+                                      skill='Structure Doomsday Operation', **kwargs)
+
+
+class Effect6681(BaseEffect):
+    """
+    shipBonusRole3NumWarfareLinks
+
+    Used by:
+    Ships from group: Force Auxiliary (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect6682(BaseEffect):
+    """
+    structureModuleEffectStasisWebifier
+
+    Used by:
+    Structure Modules from group: Structure Stasis Webifier (2 of 2)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        speedBoost = module.getModifiedItemAttr('speedFactor')
+        speedBoost *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('maxVelocity', speedBoost, stackingPenalties=True, **kwargs)
+
+
+class Effect6683(BaseEffect):
+    """
+    structureModuleEffectTargetPainter
+
+    Used by:
+    Variations of structure module: Standup Target Painter I (2 of 2)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        appliedBoost = container.getModifiedItemAttr('signatureRadiusBonus')
+        appliedBoost *= calculateRangeFactor(
+            srcOptimalRange=container.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=container.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('signatureRadius', appliedBoost, stackingPenalties=True, **kwargs)
+
+
+class Effect6684(BaseEffect):
+    """
+    structureModuleEffectRemoteSensorDampener
+
+    Used by:
+    Variations of structure module: Standup Remote Sensor Dampener I (2 of 2)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('maxTargetRangeBonus') * rangeFactor,
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', module.getModifiedItemAttr('scanResolutionBonus') * rangeFactor,
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6685(BaseEffect):
+    """
+    structureModuleEffectECM
+
+    Used by:
+    Structure Modules from group: Structure ECM Battery (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        strength = module.getModifiedItemAttr('scan{0}StrengthBonus'.format(fit.scanType))
+        strength *= calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6686(BaseEffect):
+    """
+    structureModuleEffectWeaponDisruption
+
+    Used by:
+    Variations of structure module: Standup Weapon Disruptor I (2 of 2)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        rangeFactor = calculateRangeFactor(
+            srcOptimalRange=module.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=module.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        for srcAttr, tgtAttr in (
+            ('aoeCloudSizeBonus', 'aoeCloudSize'),
+            ('aoeVelocityBonus', 'aoeVelocity'),
+            ('missileVelocityBonus', 'maxVelocity'),
+            ('explosionDelayBonus', 'explosionDelay')
+        ):
+            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                            tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                            stackingPenalties=True, **kwargs)
+        for srcAttr, tgtAttr in (
+            ('trackingSpeedBonus', 'trackingSpeed'),
+            ('maxRangeBonus', 'maxRange'),
+            ('falloffBonus', 'falloff')
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect6687(BaseEffect):
+    """
+    npcEntityRemoteArmorRepairer
+
+    Used by:
+    Drones named like: Armor Maintenance Bot (6 of 6)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        if container.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        bonus = container.getModifiedItemAttr('armorDamageAmount')
+        duration = container.getModifiedItemAttr('duration') / 1000.0
+        fit._armorRr.append((bonus, duration))
+        fit._armorRrPreSpool.append((bonus, duration))
+        fit._armorRrFullSpool.append((bonus, duration))
+
+
+class Effect6688(BaseEffect):
+    """
+    npcEntityRemoteShieldBooster
+
+    Used by:
+    Drones named like: Shield Maintenance Bot (6 of 6)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        if container.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        bonus = container.getModifiedItemAttr('shieldBonus')
+        duration = container.getModifiedItemAttr('duration') / 1000.0
+        fit._shieldRr.append((bonus, duration))
+
+
+class Effect6689(BaseEffect):
+    """
+    npcEntityRemoteHullRepairer
+
+    Used by:
+    Drones named like: Hull Maintenance Bot (6 of 6)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        if module.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        bonus = module.getModifiedItemAttr('structureDamageAmount')
+        duration = module.getModifiedItemAttr('duration') / 1000.0
+        fit._hullRr.append((bonus, duration))
+
+
+class Effect6690(BaseEffect):
+    """
+    remoteWebifierEntity
+
+    Used by:
+    Drones from group: Stasis Webifying Drone (3 of 3)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if module.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.boostItemAttr('maxVelocity', module.getModifiedItemAttr('speedFactor'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6691(BaseEffect):
+    """
+    entityEnergyNeutralizerFalloff
+
+    Used by:
+    Drones from group: Energy Neutralizer Drone (3 of 3)
+    """
+
+    type = 'active', 'projected'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if not ((hasattr(src, 'state') and src.state >= FittingModuleState.ACTIVE) or hasattr(src, 'amountActive')):
+            return
+        if src.getModifiedItemAttr('energyNeutralizerRangeOptimal', 0) < (projectionRange or 0):
+            return
+        amount = src.getModifiedItemAttr('energyNeutralizerAmount')
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            amount *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        time = src.getModifiedItemAttr('energyNeutralizerDuration')
+        fit.addDrain(src, time, amount, 0)
+
+
+class Effect6692(BaseEffect):
+    """
+    remoteTargetPaintEntity
+
+    Used by:
+    Drones named like: TP (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if container.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.boostItemAttr('signatureRadius', container.getModifiedItemAttr('signatureRadiusBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6693(BaseEffect):
+    """
+    remoteSensorDampEntity
+
+    Used by:
+    Drones named like: SD (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if container.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        fit.ship.boostItemAttr('maxTargetRange', container.getModifiedItemAttr('maxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', container.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6694(BaseEffect):
+    """
+    npcEntityWeaponDisruptor
+
+    Used by:
+    Drones named like: TD (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if container.getModifiedItemAttr('maxRange', 0) < (projectionRange or 0):
+            return
+        for srcAttr, tgtAttr in (
+            ('trackingSpeedBonus', 'trackingSpeed'),
+            ('maxRangeBonus', 'maxRange'),
+            ('falloffBonus', 'falloff')
+        ):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                          tgtAttr, container.getModifiedItemAttr(srcAttr),
+                                          stackingPenalties=True, **kwargs)
+
+
+class Effect6695(BaseEffect):
+    """
+    entityECMFalloff
+
+    Used by:
+    Drones named like: EC (3 of 3)
+    """
+
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if container.getModifiedItemAttr('ECMRangeOptimal', 0) < (projectionRange or 0):
+            return
+        strength = container.getModifiedItemAttr('scan{0}StrengthBonus'.format(fit.scanType))
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6697(BaseEffect):
+    """
+    rigDrawbackReductionArmor
+
+    Used by:
+    Skill: Armor Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Armor', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Resource Processing', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6698(BaseEffect):
+    """
+    rigDrawbackReductionAstronautics
+
+    Used by:
+    Skill: Astronautics Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Navigation', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Anchor', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6699(BaseEffect):
+    """
+    rigDrawbackReductionDrones
+
+    Used by:
+    Skill: Drones Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Drones', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6700(BaseEffect):
+    """
+    rigDrawbackReductionElectronic
+
+    Used by:
+    Skill: Electronic Superiority Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Electronic Systems', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Scanning', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Targeting', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6701(BaseEffect):
+    """
+    rigDrawbackReductionProjectile
+
+    Used by:
+    Skill: Projectile Weapon Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Projectile Weapon', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6702(BaseEffect):
+    """
+    rigDrawbackReductionEnergyWeapon
+
+    Used by:
+    Skill: Energy Weapon Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Energy Weapon', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6703(BaseEffect):
+    """
+    rigDrawbackReductionHybrid
+
+    Used by:
+    Skill: Hybrid Weapon Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Hybrid Weapon', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6704(BaseEffect):
+    """
+    rigDrawbackReductionLauncher
+
+    Used by:
+    Skill: Launcher Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Launcher', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6705(BaseEffect):
+    """
+    rigDrawbackReductionShield
+
+    Used by:
+    Skill: Shield Rigging
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Shield', 'drawback',
+                                      src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
+
+
+class Effect6706(BaseEffect):
+    """
+    setBonusAsklepian
+
+    Used by:
+    Implants named like: grade Asklepian (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Cybernetics'),
+                                                 'armorRepairBonus', src.getModifiedItemAttr('implantSetSerpentis2'), **kwargs)
+
+
+class Effect6708(BaseEffect):
+    """
+    armorRepairAmountBonusSubcap
+
+    Used by:
+    Implants named like: grade Asklepian (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('armorRepairBonus'), **kwargs)
+
+
+class Effect6709(BaseEffect):
+    """
+    shipBonusRole1CapitalHybridDamageBonus
+
+    Used by:
+    Ship: Vehement
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6710(BaseEffect):
+    """
+    shipBonusDreadnoughtM1WebStrengthBonus
+
+    Used by:
+    Ship: Vehement
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect6711(BaseEffect):
+    """
+    shipBonusRole3CapitalHybridDamageBonus
+
+    Used by:
+    Ship: Vanquisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect6712(BaseEffect):
+    """
+    shipBonusTitanM1WebStrengthBonus
+
+    Used by:
+    Ship: Vanquisher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+                                      src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
+
+
+class Effect6713(BaseEffect):
+    """
+    shipBonusSupercarrierM1BurstProjectorWebBonus
+
+    Used by:
+    Ship: Vendetta
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'), 'speedFactor',
+                                      src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6714(BaseEffect):
+    """
+    ECMBurstJammer
+
+    Used by:
+    Modules from group: Burst Jammer (11 of 11)
+    """
+
+    type = 'projected', 'active'
+    runTime = 'late'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowOffensiveModifiers'):
+            return
+        if module.getModifiedItemAttr('ecmBurstRange', 0) < (projectionRange or 0):
+            return
+        strength = module.getModifiedItemAttr('scan{0}StrengthBonus'.format(fit.scanType))
+        if 'effect' in kwargs:
+            from eos.modifiedAttributeDict import ModifiedAttributeDict
+            strength *= ModifiedAttributeDict.getResistance(fit, kwargs['effect'])
+        fit.addProjectedEcm(strength)
+
+
+class Effect6720(BaseEffect):
+    """
+    shipBonusDroneRepairMC1
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldBonus',
+                                     src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'structureDamageAmount',
+                                     src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorDamageAmount',
+                                     src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6721(BaseEffect):
+    """
+    eliteBonusLogisticRemoteArmorRepairOptimalFalloff1
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'falloffEffectiveness',
+                                      src.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusLogistics1'),
+                                      skill='Logistics Cruisers', **kwargs)
+
+
+class Effect6722(BaseEffect):
+    """
+    roleBonusRemoteArmorRepairOptimalFalloff
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'falloffEffectiveness',
+                                      src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+                                      'maxRange',
+                                      src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
+
+
+class Effect6723(BaseEffect):
+    """
+    shipBonusCloakCpuMC2
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+                                      src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect6724(BaseEffect):
+    """
+    eliteBonusLogisticRemoteArmorRepairDuration3
+
+    Used by:
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+                                      src.getModifiedItemAttr('eliteBonusLogistics3'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect6725(BaseEffect):
+    """
+    shipBonusSETFalloffAF2
+
+    Used by:
+    Ship: Caedes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+                                      src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect6726(BaseEffect):
+    """
+    shipBonusCloakCpuMF1
+
+    Used by:
+    Ship: Caedes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+                                      src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect6727(BaseEffect):
+    """
+    eliteBonusCoverOpsNOSNeutFalloff1
+
+    Used by:
+    Ship: Caedes
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('eliteBonusCovertOps1'),
+                                      stackingPenalties=True, skill='Covert Ops', **kwargs)
+
+
+class Effect6730(BaseEffect):
+    """
+    moduleBonusMicrowarpdrive
+
+    Used by:
+    Modules from group: Propulsion Module (73 of 147)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('mass', module.getModifiedItemAttr('massAddition'), **kwargs)
+        speedBoost = module.getModifiedItemAttr('speedFactor')
+        mass = fit.ship.getModifiedItemAttr('mass')
+        thrust = module.getModifiedItemAttr('speedBoostFactor')
+        # It is actually a postMul, see black hole speed interactions
+        fit.ship.boostItemAttr('maxVelocity', speedBoost * thrust / mass,
+                               stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect6731(BaseEffect):
+    """
+    moduleBonusAfterburner
+
+    Used by:
+    Modules from group: Propulsion Module (74 of 147)
+    """
+
+    runTime = 'late'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('mass', module.getModifiedItemAttr('massAddition'), **kwargs)
+        speedBoost = module.getModifiedItemAttr('speedFactor')
+        mass = fit.ship.getModifiedItemAttr('mass')
+        thrust = module.getModifiedItemAttr('speedBoostFactor')
+        # It is actually a postMul, see black hole speed interactions
+        fit.ship.boostItemAttr('maxVelocity', speedBoost * thrust / mass,
+                               stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect6732(BaseEffect):
+    """
+    moduleBonusWarfareLinkArmor
+
+    Used by:
+    Variations of module: Armor Command Burst I (3 of 3)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedChargeAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedChargeAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6733(BaseEffect):
+    """
+    moduleBonusWarfareLinkShield
+
+    Used by:
+    Variations of module: Shield Command Burst I (3 of 3)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedChargeAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedChargeAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6734(BaseEffect):
+    """
+    moduleBonusWarfareLinkSkirmish
+
+    Used by:
+    Variations of module: Skirmish Command Burst I (2 of 2)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedChargeAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedChargeAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6735(BaseEffect):
+    """
+    moduleBonusWarfareLinkInfo
+
+    Used by:
+    Variations of module: Expedition Command Burst I (3 of 3)
+    Variations of module: Information Command Burst I (2 of 2)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedChargeAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedChargeAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6736(BaseEffect):
+    """
+    moduleBonusWarfareLinkMining
+
+    Used by:
+    Variations of module: Mining Foreman Burst I (2 of 2)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedChargeAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedChargeAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6737(BaseEffect):
+    """
+    chargeBonusWarfareCharge
+
+    Used by:
+    Items from market group: Ammunition & Charges > Command Burst Charges (19 of 19)
+    """
+
+    type = 'offline'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 4):
+            value = module.getModifiedChargeAttr('warfareBuff{}Multiplier'.format(x))
+            module.multiplyItemAttr('warfareBuff{}Value'.format(x), value, **kwargs)
+
+
+class Effect6753(BaseEffect):
+    """
+    moduleTitanEffectGenerator
+
+    Used by:
+    Modules from group: Titan Phenomena Generator (4 of 4)
+    """
+
+    type = 'active', 'gang'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if module.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = module.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = module.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, module, kwargs['effect'])
+
+
+class Effect6762(BaseEffect):
+    """
+    miningDroneSpecBonus
+
+    Used by:
+    Skill: Mining Drone Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'miningAmount',
+                                     src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'maxVelocity',
+                                     src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+
+
+class Effect6763(BaseEffect):
+    """
+    iceHarvestingDroneOperationDurationBonus
+
+    Used by:
+    Modules named like: Drone Mining Augmentor (8 of 8)
+    Skill: Ice Harvesting Drone Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level if 'skill' in context else 1
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+
+
+class Effect6764(BaseEffect):
+    """
+    iceHarvestingDroneSpecBonus
+
+    Used by:
+    Skill: Ice Harvesting Drone Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'), 'duration',
+                                     src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'),
+                                     'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+
+
+class Effect6765(BaseEffect):
+    """
+    spatialPhenomenaGenerationDurationBonus
+
+    Used by:
+    Skill: Spatial Phenomena Generation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Spatial Phenomena Generation'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6766(BaseEffect):
+    """
+    commandProcessorEffect
+
+    Used by:
+    Modules named like: Command Processor I (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+                                         src.getModifiedItemAttr('maxGangModules'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+                                         src.getModifiedItemAttr('maxGangModules'), **kwargs)
+
+
+class Effect6769(BaseEffect):
+    """
+    commandBurstAoEBonus
+
+    Used by:
+    Skill: Fleet Command
+    Skill: Leadership
+    Skill: Wing Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+                                      src.getModifiedItemAttr('areaOfEffectBonus') * src.level, **kwargs)
+
+
+class Effect6770(BaseEffect):
+    """
+    armoredCommandDurationBonus
+
+    Used by:
+    Skill: Armored Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6771(BaseEffect):
+    """
+    shieldCommandDurationBonus
+
+    Used by:
+    Skill: Shield Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6772(BaseEffect):
+    """
+    informationCommandDurationBonus
+
+    Used by:
+    Skill: Information Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6773(BaseEffect):
+    """
+    skirmishCommandDurationBonus
+
+    Used by:
+    Skill: Skirmish Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6774(BaseEffect):
+    """
+    miningForemanDurationBonus
+
+    Used by:
+    Skill: Mining Foreman
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6776(BaseEffect):
+    """
+    armoredCommandStrengthBonus
+
+    Used by:
+    Skill: Armored Command Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect6777(BaseEffect):
+    """
+    shieldCommandStrengthBonus
+
+    Used by:
+    Skill: Shield Command Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect6778(BaseEffect):
+    """
+    informationCommandStrengthBonus
+
+    Used by:
+    Skill: Information Command Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect6779(BaseEffect):
+    """
+    skirmishCommandStrengthBonus
+
+    Used by:
+    Skill: Skirmish Command Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+                                        src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect6780(BaseEffect):
+    """
+    miningForemanStrengthBonus
+
+    Used by:
+    Skill: Mining Director
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect6782(BaseEffect):
+    """
+    commandBurstReloadTimeBonus
+
+    Used by:
+    Skill: Command Burst Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+                                      'reloadTime',
+                                      src.getModifiedItemAttr('reloadTimeBonus') * lvl, **kwargs)
+
+
+class Effect6783(BaseEffect):
+    """
+    commandBurstAoERoleBonus
+
+    Used by:
+    Ships from group: Carrier (4 of 4)
+    Ships from group: Combat Battlecruiser (21 of 21)
+    Ships from group: Command Ship (8 of 8)
+    Ships from group: Force Auxiliary (6 of 6)
+    Ships from group: Supercarrier (6 of 6)
+    Ships from group: Titan (8 of 8)
+    Subsystems named like: Offensive Support Processor (4 of 4)
+    Ship: Odysseus
+    Ship: Orca
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+                                      src.getModifiedItemAttr('roleBonusCommandBurstAoERange'), **kwargs)
+
+
+class Effect6786(BaseEffect):
+    """
+    shieldCommandBurstBonusICS3
+
+    Used by:
+    Ship: Orca
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+                                      src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+                                      src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+                                      src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+                                      src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
+
+
+class Effect6789(BaseEffect):
+    """
+    industrialBonusDroneDamage
+
+    Used by:
+    Ships from group: Blockade Runner (5 of 5)
+    Ships from group: Deep Space Transport (5 of 5)
+    Ships from group: Hauler (18 of 18)
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Hulk
+    Ship: Mackinaw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier',
+                                     src.getModifiedItemAttr('industrialBonusDroneDamage'), **kwargs)
+
+
+class Effect6793(BaseEffect):
+    """
+    miningForemanBurstBonusORECapital2
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+                                      src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect6794(BaseEffect):
+    """
+    shieldCommandBurstBonusORECapital3
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+                                      src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+                                      src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect6796(BaseEffect):
+    """
+    shipModeSHTDamagePostDiv
+
+    Used by:
+    Module: Hecate Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            'damageMultiplier',
+            1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6797(BaseEffect):
+    """
+    shipModeSPTDamagePostDiv
+
+    Used by:
+    Module: Svipul Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            'damageMultiplier',
+            1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6798(BaseEffect):
+    """
+    shipModeSETDamagePostDiv
+
+    Used by:
+    Module: Confessor Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            'damageMultiplier',
+            1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6799(BaseEffect):
+    """
+    shipModeSmallMissileDamagePostDiv
+
+    Used by:
+    Module: Jackdaw Sharpshooter Mode
+    Module: Skua Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        types = ('thermal', 'em', 'explosive', 'kinetic')
+        for type in types:
+            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                                               '{}Damage'.format(type),
+                                               1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
+                                               stackingPenalties=True,
+                                               penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6800(BaseEffect):
+    """
+    modeDampTDResistsPostDiv
+
+    Used by:
+    Modules named like: Sharpshooter Mode (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('weaponDisruptionResistance', 1 / module.getModifiedItemAttr('modeEwarResistancePostDiv'), **kwargs)
+        fit.ship.multiplyItemAttr('sensorDampenerResistance', 1 / module.getModifiedItemAttr('modeEwarResistancePostDiv'), **kwargs)
+
+
+class Effect6801(BaseEffect):
+    """
+    modeMWDandABBoostPostDiv
+
+    Used by:
+    Modules named like: Propulsion Mode (3 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Afterburner'),
+            'speedFactor',
+            1 / module.getModifiedItemAttr('modeVelocityPostDiv'),
+            stackingPenalties=True,
+            penaltyGroup='postDiv', **kwargs)
+
+
+class Effect6807(BaseEffect):
+    """
+    invulnerabilityCoreDurationBonus
+
+    Used by:
+    Skill: Invulnerability Core Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'buffDuration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'duration',
+                                      src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect6844(BaseEffect):
+    """
+    skillMultiplierDefenderMissileVelocity
+
+    Used by:
+    Skill: Defender Missiles
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+                                        'maxVelocity', skill.getModifiedItemAttr('missileVelocityBonus') * skill.level, **kwargs)
+
+
+class Effect6845(BaseEffect):
+    """
+    shipBonusCommandDestroyerRole1DefenderBonus
+
+    Used by:
+    Ships from group: Command Destroyer (5 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+                                      'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6851(BaseEffect):
+    """
+    shipBonusRole3CapitalEnergyDamageBonus
+
+    Used by:
+    Ship: Chemosh
+    Ship: Molok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect6852(BaseEffect):
+    """
+    shipBonusTitanM1WebRangeBonus
+
+    Used by:
+    Ship: Molok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
+
+
+class Effect6853(BaseEffect):
+    """
+    shipBonusTitanA1EnergyWarfareAmountBonus
+
+    Used by:
+    Ship: Molok
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
+
+
+class Effect6855(BaseEffect):
+    """
+    shipBonusDreadnoughtA1EnergyWarfareAmountBonus
+
+    Used by:
+    Ship: Chemosh
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+                                      'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect6856(BaseEffect):
+    """
+    shipBonusDreadnoughtM1WebRangeBonus
+
+    Used by:
+    Ship: Chemosh
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'maxRange', src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect6857(BaseEffect):
+    """
+    shipBonusForceAuxiliaryA1NosferatuRangeBonus
+
+    Used by:
+    Ship: Dagon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'maxRange', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'falloffEffectiveness', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6858(BaseEffect):
+    """
+    shipBonusForceAuxiliaryA1NosferatuDrainAmount
+
+    Used by:
+    Ship: Dagon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+                                      'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect6859(BaseEffect):
+    """
+    shipBonusRole4NosferatuCPUBonus
+
+    Used by:
+    Ship: Dagon
+    Ship: Rabisu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'cpu', src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+
+
+class Effect6860(BaseEffect):
+    """
+    shipBonusRole5RemoteArmorRepairPowergridBonus
+
+    Used by:
+    Ships from group: Logistics (3 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'power',
+                                      src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
+
+
+class Effect6861(BaseEffect):
+    """
+    shipBonusRole5CapitalRemoteArmorRepairPowergridBonus
+
+    Used by:
+    Ship: Dagon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
+
+
+class Effect6862(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM1RemoteArmorRepairDuration
+
+    Used by:
+    Ship: Dagon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+                                      'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6865(BaseEffect):
+    """
+    eliteBonusCoverOpsWarpVelocity1
+
+    Used by:
+    Ship: Pacifier
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops', **kwargs)
+
+
+class Effect6866(BaseEffect):
+    """
+    shipBonusSmallMissileFlightTimeCF1
+
+    Used by:
+    Ship: Pacifier
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+                                        'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+                                        'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect6867(BaseEffect):
+    """
+    shipBonusSPTRoFMF
+
+    Used by:
+    Ship: Pacifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'speed', src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect6871(BaseEffect):
+    """
+    concordSecStatusTankBonus
+
+    Used by:
+    Ship: Enforcer
+    Ship: Marshal
+    Ship: Pacifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+
+        # Get pilot sec status bonus directly here, instead of going through the intermediary effects
+        # via https://forums.eveonline.com/default.aspx?g=posts&t=515826
+        try:
+            sec_status = ship.owner.getPilotSecurity(low_limit=0, high_limit=5)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            return
+
+        bonus = sec_status * 10
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            'armorDamageAmount', bonus, **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'),
+            'shieldBonus', bonus, **kwargs)
+
+
+class Effect6872(BaseEffect):
+    """
+    eliteReconStasisWebBonus1
+
+    Used by:
+    Ship: Enforcer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect6873(BaseEffect):
+    """
+    eliteBonusReconWarpVelocity3
+
+    Used by:
+    Ship: Cobra
+    Ship: Enforcer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6874(BaseEffect):
+    """
+    shipBonusMedMissileFlightTimeCC2
+
+    Used by:
+    Ship: Cobra
+    Ship: Enforcer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect6877(BaseEffect):
+    """
+    eliteBonusBlackOpsWarpVelocity1
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('eliteBonusBlackOps1'), stackingPenalties=True, skill='Black Ops', **kwargs)
+
+
+class Effect6878(BaseEffect):
+    """
+    eliteBonusBlackOpsScramblerRange4
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusBlackOps4'), skill='Black Ops', **kwargs)
+
+
+class Effect6879(BaseEffect):
+    """
+    eliteBonusBlackOpsWebRange3
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+                                      src.getModifiedItemAttr('eliteBonusBlackOps3'), skill='Black Ops', **kwargs)
+
+
+class Effect6880(BaseEffect):
+    """
+    shipBonusLauncherRoF2CB
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise', 'speed',
+                                      src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed',
+                                      src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy', 'speed',
+                                      src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect6881(BaseEffect):
+    """
+    shipBonusLargeMissileFlightTimeCB1
+
+    Used by:
+    Ship: Marshal
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosionDelay',
+                                        src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosionDelay',
+                                        src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
+
+
+class Effect6883(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM2LocalRepairAmount
+
+    Used by:
+    Ship: Dagon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect6894(BaseEffect):
+    """
+    subsystemEnergyNeutFittingReduction
+
+    Used by:
+    Subsystem: Legion Core - Energy Parasitic Complex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        'cpu', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+                                      'power', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
+
+
+class Effect6895(BaseEffect):
+    """
+    subsystemMETFittingReduction
+
+    Used by:
+    Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'cpu', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+                                      'power', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
+
+
+class Effect6896(BaseEffect):
+    """
+    subsystemMHTFittingReduction
+
+    Used by:
+    Subsystem: Proteus Offensive - Drone Synthesis Projector
+    Subsystem: Proteus Offensive - Hybrid Encoding Platform
+    Subsystem: Tengu Offensive - Magnetic Infusion Basin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'cpu', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+                                      'power', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
+
+
+class Effect6897(BaseEffect):
+    """
+    subsystemMPTFittingReduction
+
+    Used by:
+    Subsystem: Loki Offensive - Projectile Scoping Array
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'power', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+                                      'cpu', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
+
+
+class Effect6898(BaseEffect):
+    """
+    subsystemMRARFittingReduction
+
+    Used by:
+    Subsystems named like: Offensive Support Processor (3 of 4)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+            'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRARFittingReduction'), **kwargs)
+
+
+class Effect6899(BaseEffect):
+    """
+    subsystemMRSBFittingReduction
+
+    Used by:
+    Subsystem: Loki Offensive - Support Processor
+    Subsystem: Tengu Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+            'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRSBFittingReduction'), **kwargs)
+
+
+class Effect6900(BaseEffect):
+    """
+    subsystemMMissileFittingReduction
+
+    Used by:
+    Subsystem: Legion Offensive - Assault Optimization
+    Subsystem: Loki Offensive - Launcher Efficiency Configuration
+    Subsystem: Tengu Offensive - Accelerated Ejection Bay
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'cpu', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                      'power', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
+
+
+class Effect6908(BaseEffect):
+    """
+    shipBonusStrategicCruiserCaldariNaniteRepairTime2
+
+    Used by:
+    Ship: Tengu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'moduleRepairRate',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserCaldari2'),
+                                      skill='Caldari Strategic Cruiser', **kwargs)
+
+
+class Effect6909(BaseEffect):
+    """
+    shipBonusStrategicCruiserAmarrNaniteRepairTime2
+
+    Used by:
+    Ship: Legion
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'moduleRepairRate',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserAmarr2'),
+                                      skill='Amarr Strategic Cruiser', **kwargs)
+
+
+class Effect6910(BaseEffect):
+    """
+    shipBonusStrategicCruiserGallenteNaniteRepairTime2
+
+    Used by:
+    Ship: Proteus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'moduleRepairRate',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserGallente2'),
+                                      skill='Gallente Strategic Cruiser', **kwargs)
+
+
+class Effect6911(BaseEffect):
+    """
+    shipBonusStrategicCruiserMinmatarNaniteRepairTime2
+
+    Used by:
+    Ship: Loki
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: True, 'moduleRepairRate',
+                                      ship.getModifiedItemAttr('shipBonusStrategicCruiserMinmatar2'),
+                                      skill='Minmatar Strategic Cruiser', **kwargs)
+
+
+class Effect6920(BaseEffect):
+    """
+    structureHPBonusAddPassive
+
+    Used by:
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    Subsystem: Loki Defensive - Adaptive Defense Node
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('hp', module.getModifiedItemAttr('structureHPBonusAdd') or 0, **kwargs)
+
+
+class Effect6921(BaseEffect):
+    """
+    subSystemBonusAmarrDefensive2ScanProbeStrength
+
+    Used by:
+    Subsystem: Legion Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'),
+                                        skill='Amarr Defensive Systems', **kwargs)
+
+
+class Effect6923(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive1HMLHAMVelo
+
+    Used by:
+    Subsystem: Loki Offensive - Launcher Efficiency Configuration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                      'maxVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect6924(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive3MissileExpVelo
+
+    Used by:
+    Subsystem: Loki Offensive - Launcher Efficiency Configuration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                      'aoeVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
+                                      skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect6925(BaseEffect):
+    """
+    subsystemBonusGallenteOffensive2DroneVeloTracking
+
+    Used by:
+    Subsystem: Proteus Offensive - Drone Synthesis Projector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'maxVelocity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'trackingSpeed', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
+                                     skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect6926(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsionWarpCapacitor
+
+    Used by:
+    Subsystem: Legion Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion'), skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect6927(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsionWarpCapacitor
+
+    Used by:
+    Subsystem: Loki Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
+                               skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect6928(BaseEffect):
+    """
+    subsystemBonusCaldariPropulsion2PropModHeatBenefit
+
+    Used by:
+    Subsystem: Tengu Propulsion - Fuel Catalyst
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
+                                      skill='Caldari Propulsion Systems', **kwargs)
+
+
+class Effect6929(BaseEffect):
+    """
+    subsystemBonusGallentePropulsion2PropModHeatBenefit
+
+    Used by:
+    Subsystem: Proteus Propulsion - Localized Injectors
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+                                      'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
+                                      skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect6930(BaseEffect):
+    """
+    subsystemBonusAmarrCore2EnergyResistance
+
+    Used by:
+    Subsystem: Legion Core - Augmented Antimatter Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('energyWarfareResistance', src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
+
+
+class Effect6931(BaseEffect):
+    """
+    subsystemBonusMinmatarCore2EnergyResistance
+
+    Used by:
+    Subsystem: Loki Core - Augmented Nuclear Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('energyWarfareResistance', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'),
+                               skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect6932(BaseEffect):
+    """
+    subsystemBonusGallenteCore2EnergyResistance
+
+    Used by:
+    Subsystem: Proteus Core - Augmented Fusion Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('energyWarfareResistance', src.getModifiedItemAttr('subsystemBonusGallenteCore2'),
+                               skill='Gallente Core Systems', **kwargs)
+
+
+class Effect6933(BaseEffect):
+    """
+    subsystemBonusCaldariCore2EnergyResistance
+
+    Used by:
+    Subsystem: Tengu Core - Augmented Graviton Reactor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('energyWarfareResistance', src.getModifiedItemAttr('subsystemBonusCaldariCore2'),
+                               skill='Caldari Core Systems', **kwargs)
+
+
+class Effect6934(BaseEffect):
+    """
+    shipMaxLockedTargetsBonusAddPassive
+
+    Used by:
+    Subsystems named like: Core Dissolution Sequencer (2 of 2)
+    Subsystems named like: Core Electronic Efficiency Gate (2 of 2)
+    Subsystems named like: Offensive Support Processor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('maxLockedTargets', src.getModifiedItemAttr('maxLockedTargetsBonus'), **kwargs)
+
+
+class Effect6935(BaseEffect):
+    """
+    subsystemBonusAmarrCore3EnergyWarHeatBonus
+
+    Used by:
+    Subsystem: Legion Core - Energy Parasitic Complex
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'), 'overloadSelfDurationBonus',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrCore3'), skill='Amarr Core Systems', **kwargs)
+
+
+class Effect6936(BaseEffect):
+    """
+    subsystemBonusMinmatarCore3StasisWebHeatBonus
+
+    Used by:
+    Subsystem: Loki Core - Immobility Drivers
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+                                      'overloadRangeBonus', src.getModifiedItemAttr('subsystemBonusMinmatarCore3'),
+                                      skill='Minmatar Core Systems', **kwargs)
+
+
+class Effect6937(BaseEffect):
+    """
+    subsystemBonusGallenteCore3WarpScramHeatBonus
+
+    Used by:
+    Subsystem: Proteus Core - Friction Extension Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'overloadRangeBonus',
+                                      src.getModifiedItemAttr('subsystemBonusGallenteCore3'), skill='Gallente Core Systems', **kwargs)
+
+
+class Effect6938(BaseEffect):
+    """
+    subsystemBonusCaldariCore3ECMHeatBonus
+
+    Used by:
+    Subsystem: Tengu Core - Obfuscation Manifold
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'overloadECMStrengthBonus',
+                                      src.getModifiedItemAttr('subsystemBonusCaldariCore3'), skill='Caldari Core Systems', **kwargs)
+
+
+class Effect6939(BaseEffect):
+    """
+    subsystemBonusAmarrDefensive2HardenerHeat
+
+    Used by:
+    Subsystem: Legion Defensive - Augmented Plating
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+                                      src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
+
+
+class Effect6940(BaseEffect):
+    """
+    subsystemBonusGallenteDefensive2HardenerHeat
+
+    Used by:
+    Subsystem: Proteus Defensive - Augmented Plating
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+                                      src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+                                      src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
+
+
+class Effect6941(BaseEffect):
+    """
+    subsystemBonusCaldariDefensive2HardenerHeat
+
+    Used by:
+    Subsystem: Tengu Defensive - Supplemental Screening
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+                                      'overloadHardeningBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
+                                      skill='Caldari Defensive Systems', **kwargs)
+
+
+class Effect6942(BaseEffect):
+    """
+    subsystemBonusMinmatarDefensive2HardenerHeat
+
+    Used by:
+    Subsystem: Loki Defensive - Augmented Durability
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+                                      src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+                                      src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
+                                      src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
+
+
+class Effect6943(BaseEffect):
+    """
+    subsystemBonusAmarrDefensive3ArmorRepHeat
+
+    Used by:
+    Subsystem: Legion Defensive - Covert Reconfiguration
+    Subsystem: Legion Defensive - Nanobot Injector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
+                                      skill='Amarr Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
+                                      skill='Amarr Defensive Systems', **kwargs)
+
+
+class Effect6944(BaseEffect):
+    """
+    subsystemBonusGallenteDefensive3ArmorRepHeat
+
+    Used by:
+    Subsystem: Proteus Defensive - Covert Reconfiguration
+    Subsystem: Proteus Defensive - Nanobot Injector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
+                                      skill='Gallente Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
+                                      skill='Gallente Defensive Systems', **kwargs)
+
+
+class Effect6945(BaseEffect):
+    """
+    subsystemBonusCaldariDefensive3ShieldBoostHeat
+
+    Used by:
+    Subsystem: Tengu Defensive - Amplification Node
+    Subsystem: Tengu Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
+                                      skill='Caldari Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
+                                      skill='Caldari Defensive Systems', **kwargs)
+
+
+class Effect6946(BaseEffect):
+    """
+    subsystemBonusMinmatarDefensive3LocalRepHeat
+
+    Used by:
+    Subsystem: Loki Defensive - Adaptive Defense Node
+    Subsystem: Loki Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
+                                      skill='Minmatar Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
+                                      skill='Minmatar Defensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+                                      'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
+                                      skill='Minmatar Defensive Systems', **kwargs)
+
+
+class Effect6947(BaseEffect):
+    """
+    subSystemBonusCaldariDefensive2ScanProbeStrength
+
+    Used by:
+    Subsystem: Tengu Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
+                                        skill='Caldari Defensive Systems', **kwargs)
+
+
+class Effect6949(BaseEffect):
+    """
+    subSystemBonusGallenteDefensive2ScanProbeStrength
+
+    Used by:
+    Subsystem: Proteus Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+                                        src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
+
+
+class Effect6951(BaseEffect):
+    """
+    subSystemBonusMinmatarDefensive2ScanProbeStrength
+
+    Used by:
+    Subsystem: Loki Defensive - Covert Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+                                        src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
+
+
+class Effect6953(BaseEffect):
+    """
+    mediumRemoteRepFittingAdjustment
+
+    Used by:
+    Variations of module: Medium Remote Armor Repairer I (14 of 14)
+    Variations of module: Medium Remote Shield Booster I (13 of 13)
+    Module: Medium Ancillary Remote Armor Repairer
+    Module: Medium Ancillary Remote Shield Booster
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('power', module.getModifiedItemAttr('mediumRemoteRepFittingMultiplier'), **kwargs)
+        module.multiplyItemAttr('cpu', module.getModifiedItemAttr('mediumRemoteRepFittingMultiplier'), **kwargs)
+
+
+class Effect6954(BaseEffect):
+    """
+    subsystemBonusCommandBurstFittingReduction
+
+    Used by:
+    Subsystems named like: Offensive Support Processor (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+                                      src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+                                      src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
+
+
+class Effect6955(BaseEffect):
+    """
+    subsystemRemoteShieldBoostFalloffBonus
+
+    Used by:
+    Subsystem: Loki Offensive - Support Processor
+    Subsystem: Tengu Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Shield Booster', 'Ancillary Remote Shield Booster'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('remoteShieldBoosterFalloffBonus'), **kwargs)
+
+
+class Effect6956(BaseEffect):
+    """
+    subsystemRemoteArmorRepairerOptimalBonus
+
+    Used by:
+    Subsystems named like: Offensive Support Processor (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+                                      'maxRange', src.getModifiedItemAttr('remoteArmorRepairerOptimalBonus'), **kwargs)
+
+
+class Effect6957(BaseEffect):
+    """
+    subsystemRemoteArmorRepairerFalloffBonus
+
+    Used by:
+    Subsystems named like: Offensive Support Processor (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+                                      'falloffEffectiveness', src.getModifiedItemAttr('remoteArmorRepairerFalloffBonus'), **kwargs)
+
+
+class Effect6958(BaseEffect):
+    """
+    subsystemBonusAmarrOffensive3RemoteArmorRepairHeat
+
+    Used by:
+    Subsystem: Legion Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attr in ('overloadSelfDurationBonus', 'overloadArmorDamageAmount'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), attr,
+                src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
+
+
+class Effect6959(BaseEffect):
+    """
+    subsystemBonusGallenteOffensive3RemoteArmorRepairHeat
+
+    Used by:
+    Subsystem: Proteus Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attr in ('overloadSelfDurationBonus', 'overloadArmorDamageAmount'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), attr,
+                src.getModifiedItemAttr('subsystemBonusGallenteOffensive3'), skill='Gallente Offensive Systems', **kwargs)
+
+
+class Effect6960(BaseEffect):
+    """
+    subsystemBonusCaldariOffensive3RemoteShieldBoosterHeat
+
+    Used by:
+    Subsystem: Tengu Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attr in ('overloadSelfDurationBonus', 'overloadShieldBonus'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Shield Emission Systems'), attr,
+                src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'), skill='Caldari Offensive Systems', **kwargs)
+
+
+class Effect6961(BaseEffect):
+    """
+    subsystemBonusMinmatarOffensive3RemoteRepHeat
+
+    Used by:
+    Subsystem: Loki Offensive - Support Processor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+            'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
+            skill='Minmatar Offensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'overloadShieldBonus',
+            src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'), skill='Minmatar Offensive Systems', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadArmorDamageAmount',
+            src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'), skill='Minmatar Offensive Systems', **kwargs)
+
+
+class Effect6962(BaseEffect):
+    """
+    subsystemBonusAmarrPropulsion2WarpSpeed
+
+    Used by:
+    Subsystem: Legion Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
+                               skill='Amarr Propulsion Systems', **kwargs)
+
+
+class Effect6963(BaseEffect):
+    """
+    subsystemBonusMinmatarPropulsion2WarpSpeed
+
+    Used by:
+    Subsystem: Loki Propulsion - Interdiction Nullifier
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
+                               skill='Minmatar Propulsion Systems', **kwargs)
+
+
+class Effect6964(BaseEffect):
+    """
+    subsystemBonusGallentePropulsionWarpSpeed
+
+    Used by:
+    Subsystem: Proteus Propulsion - Hyperspatial Optimization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('baseWarpSpeed', module.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
+                               skill='Gallente Propulsion Systems', **kwargs)
+
+
+class Effect6965(BaseEffect):
+    """
+    surveyProbeExplosionDelayOnline
+
+    Used by:
+    Module: Survey Probe Launcher II
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Survey'), 'explosionDelay',
+            container.getModifiedItemAttr('surveyProbeDurationBonus'), **kwargs)
+
+
+class Effect6981(BaseEffect):
+    """
+    shipBonusTitanG1KinThermDamageBonus
+
+    Used by:
+    Ship: Komodo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
+
+
+class Effect6982(BaseEffect):
+    """
+    shipBonusTitanG2EMExplosiveDamageBonus
+
+    Used by:
+    Ship: Komodo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'emDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'emDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+                                      src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
+
+
+class Effect6983(BaseEffect):
+    """
+    shipBonusTitanC1ShieldResists
+
+    Used by:
+    Ship: Komodo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
+
+
+class Effect6984(BaseEffect):
+    """
+    shipBonusRole4FighterDamageAndHitpoints
+
+    Used by:
+    Ship: Caiman
+    Ship: Komodo
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+                                       src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
+                                       src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+
+
+class Effect6985(BaseEffect):
+    """
+    shipBonusDreadnoughtG1KinThermDamageBonus
+
+    Used by:
+    Ship: Caiman
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect6986(BaseEffect):
+    """
+    shipBonusForceAuxiliaryG1RemoteShieldBoostAmount
+
+    Used by:
+    Ship: Loggerhead
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
+                                      src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect6987(BaseEffect):
+    """
+    shipBonusRole2LogisticDroneRepAmountAndHitpointBonus
+
+    Used by:
+    Ship: Loggerhead
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'structureDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'shieldBonus', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'armorDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'armorHP', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'shieldCapacity', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+                                        'hp', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect6992(BaseEffect):
+    """
+    roleBonusMHTDamage1
+
+    Used by:
+    Ship: Victor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect6993(BaseEffect):
+    """
+    roleBonus2BoosterPenaltyReduction
+
+    Used by:
+    Ship: Victor
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect6994(BaseEffect):
+    """
+    eliteReconBonusMHTDamage1
+
+    Used by:
+    Ship: Victor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+
+
+class Effect6995(BaseEffect):
+    """
+    targetDisintegratorAttack
+
+    Used by:
+    Modules from group: Precursor Weapon (19 of 19)
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        # Set reload time to 1 second
+        module.reloadTime = 1000
+
+
+class Effect6996(BaseEffect):
+    """
+    eliteReconBonusArmorRepAmount3
+
+    Used by:
+    Ship: Victor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+                                      src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect6997(BaseEffect):
+    """
+    eliteCovertOpsBonusArmorRepAmount4
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+                                      src.getModifiedItemAttr('eliteBonusCovertOps4'), skill='Covert Ops', **kwargs)
+
+
+class Effect6999(BaseEffect):
+    """
+    covertOpsStealthBomberSiegeMissileLauncherCPUNeedBonus
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+                                         'cpu', ship.getModifiedItemAttr('stealthBomberLauncherCPU'), **kwargs)
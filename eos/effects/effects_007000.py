@@ -0,0 +1,2232 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect7000(BaseEffect):
+    """
+    shipBonusSHTFalloffGF1
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+                                      src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect7001(BaseEffect):
+    """
+    roleBonusTorpRoF1
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect7002(BaseEffect):
+    """
+    roleBonusBombLauncherPWGCPU3
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect7003(BaseEffect):
+    """
+    eliteBonusCovertOpsSHTDamage3
+
+    Used by:
+    Ship: Virtuoso
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
+
+
+class Effect7008(BaseEffect):
+    """
+    structureFullPowerStateHitpointModifier
+
+    Used by:
+    Items from category: Structure (18 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('shieldCapacity', src.getModifiedItemAttr('structureFullPowerStateHitpointMultiplier') or 0, **kwargs)
+        fit.ship.multiplyItemAttr('armorHP', src.getModifiedItemAttr('structureFullPowerStateHitpointMultiplier') or 0, **kwargs)
+
+
+class Effect7009(BaseEffect):
+    """
+    serviceModuleFullPowerHitpointPostAssign
+
+    Used by:
+    Structure Modules from group: Structure Citadel Service Module (2 of 2)
+    Structure Modules from group: Structure Engineering Service Module (6 of 6)
+    Structure Modules from group: Structure FLEX Service Module (4 of 4)
+    Structure Modules from group: Structure Resource Processing Service Module (4 of 4)
+    Structure Module: Standup Moon Drill I
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.forceItemAttr('structureFullPowerStateHitpointMultiplier', src.getModifiedItemAttr('serviceModuleFullPowerStateHitpointMultiplier'), **kwargs)
+
+
+class Effect7012(BaseEffect):
+    """
+    moduleBonusAssaultDamageControl
+
+    Used by:
+    Variations of module: Assault Damage Control I (6 of 6)
+    Module: Abyssal Assault Damage Control
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for layer, attrPrefix in (('shield', 'shield'), ('armor', 'armor'), ('hull', '')):
+            for damageType in ('Kinetic', 'Thermal', 'Explosive', 'Em'):
+                booster = '%s%sDamageResonance' % (layer, damageType)
+
+                src.forceItemAttr(booster, src.getModifiedItemAttr('resistanceMultiplier'), **kwargs)
+
+
+class Effect7013(BaseEffect):
+    """
+    eliteBonusGunshipKineticMissileDamage1
+
+    Used by:
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+                                        src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect7014(BaseEffect):
+    """
+    eliteBonusGunshipThermalMissileDamage1
+
+    Used by:
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+                                        src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect7015(BaseEffect):
+    """
+    eliteBonusGunshipEMMissileDamage1
+
+    Used by:
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+                                        src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect7016(BaseEffect):
+    """
+    eliteBonusGunshipExplosiveMissileDamage1
+
+    Used by:
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect7017(BaseEffect):
+    """
+    eliteBonusGunshipExplosionVelocity2
+
+    Used by:
+    Ship: Geri
+    Ship: Jaguar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'aoeVelocity',
+                                        src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
+
+
+class Effect7018(BaseEffect):
+    """
+    shipSETROFAF
+
+    Used by:
+    Ship: Retribution
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusAF'), stackingPenalties=False, skill='Amarr Frigate', **kwargs)
+
+
+class Effect7020(BaseEffect):
+    """
+    remoteWebifierMaxRangeBonus
+
+    Used by:
+    Implants named like: Inquest 'Eros' Stasis Webifier MR (3 of 3)
+    Implants named like: Inquest 'Hedone' Entanglement Optimizer WS (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+                                      src.getModifiedItemAttr('stasisWebRangeBonus'), stackingPenalties=False, **kwargs)
+
+
+class Effect7021(BaseEffect):
+    """
+    structureRigMaxTargetRange
+
+    Used by:
+    Structure Modules from group: Structure Combat Rig L - Max Targets and Sensor Boosting (2 of 2)
+    Structure Modules from group: Structure Combat Rig M - Boosted Sensors (2 of 2)
+    Structure Modules from group: Structure Combat Rig XL - Doomsday and Targeting (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxTargetRange', module.getModifiedItemAttr('structureRigMaxTargetRangeBonus'), **kwargs)
+
+
+class Effect7026(BaseEffect):
+    """
+    scriptStandupWarpScram
+
+    Used by:
+    Charge: Standup Focused Warp Scrambling Script
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        src.boostItemAttr('maxRange', src.getModifiedChargeAttr('warpScrambleRangeBonus'), **kwargs)
+        src.forceItemAttr('activationBlockedStrenght', src.getModifiedChargeAttr('activationBlockedStrenght'), **kwargs)
+
+
+class Effect7027(BaseEffect):
+    """
+    structureCapacitorCapacityBonus
+
+    Used by:
+    Structure Modules from group: Structure Capacitor Battery (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('capacitorCapacity', ship.getModifiedItemAttr('capacitorBonus'), **kwargs)
+
+
+class Effect7028(BaseEffect):
+    """
+    structureModifyPowerRechargeRate
+
+    Used by:
+    Structure Modules from group: Structure Capacitor Power Relay (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('rechargeRate', module.getModifiedItemAttr('capacitorRechargeRateMultiplier'), **kwargs)
+
+
+class Effect7029(BaseEffect):
+    """
+    structureArmorHPBonus
+
+    Used by:
+    Structure Modules from group: Structure Armor Reinforcer (2 of 2)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('hiddenArmorHPMultiplier', src.getModifiedItemAttr('armorHpBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect7030(BaseEffect):
+    """
+    structureAoERoFRoleBonus
+
+    Used by:
+    Items from category: Structure (11 of 18)
+    Structures from group: Citadel (8 of 9)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Guided Bomb Launcher',
+                                      'speed', ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
+        for attr in ['duration', 'durationTargetIlluminationBurstProjector', 'durationWeaponDisruptionBurstProjector',
+                     'durationECMJammerBurstProjector', 'durationSensorDampeningBurstProjector', 'capacitorNeed']:
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Burst Projector',
+                                          attr, ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
+
+
+class Effect7031(BaseEffect):
+    """
+    shipBonusHeavyMissileKineticDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7032(BaseEffect):
+    """
+    shipBonusHeavyMissileThermalDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7033(BaseEffect):
+    """
+    shipBonusHeavyMissileEMDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+                                        'emDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7034(BaseEffect):
+    """
+    shipBonusHeavyMissileExplosiveDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7035(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileExplosiveDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7036(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileEMDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7037(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileThermalDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'thermalDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7038(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileKineticDamageCBC2
+
+    Used by:
+    Ship: Drake Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'kineticDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect7039(BaseEffect):
+    """
+    structureHiddenMissileDamageMultiplier
+
+    Used by:
+    Items from category: Structure (14 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeMultiply(lambda mod: mod.item.group.name in groups,
+                                               '%sDamage' % dmgType,
+                                               src.getModifiedItemAttr('hiddenMissileDamageMultiplier'), **kwargs)
+
+
+class Effect7040(BaseEffect):
+    """
+    structureHiddenArmorHPMultiplier
+
+    Used by:
+    Items from category: Structure (18 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('armorHP', src.getModifiedItemAttr('hiddenArmorHPMultiplier') or 0, **kwargs)
+
+
+class Effect7042(BaseEffect):
+    """
+    shipArmorHitPointsAC1
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect7043(BaseEffect):
+    """
+    shipShieldHitpointsCC1
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
+
+
+class Effect7044(BaseEffect):
+    """
+    shipAgilityBonusGC1
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect7045(BaseEffect):
+    """
+    shipSignatureRadiusMC1
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect7046(BaseEffect):
+    """
+    eliteBonusFlagCruiserAllResistances1
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('explosiveDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('armorThermalDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('thermalDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('armorEmDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('kineticDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('armorKineticDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+        fit.ship.boostItemAttr('emDamageResonance', src.getModifiedItemAttr('eliteBonusFlagCruisers1'), skill='Flag Cruisers', **kwargs)
+
+
+class Effect7047(BaseEffect):
+    """
+    roleBonusFlagCruiserModuleFittingReduction
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+                                      'power', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+                                      'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+                                      'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+                                      'power', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
+
+
+class Effect7050(BaseEffect):
+    """
+    aoe_beacon_bioluminescence_cloud
+
+    Used by:
+    Celestials named like: Bioluminescence Cloud (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7051(BaseEffect):
+    """
+    aoe_beacon_caustic_cloud
+
+    Used by:
+    Celestials named like: Caustic Cloud (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7052(BaseEffect):
+    """
+    roleBonusFlagCruiserTargetPainterModifications
+
+    Used by:
+    Ship: Monitor
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+                                      src.getModifiedItemAttr('targetPainterStrengthModifierFlagCruisers'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'maxRange',
+                                      src.getModifiedItemAttr('targetPainterRangeModifierFlagCruisers'), **kwargs)
+
+
+class Effect7055(BaseEffect):
+    """
+    shipLargeWeaponsDamageBonus
+
+    Used by:
+    Ship: Praxis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'thermalDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosiveDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'kineticDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'emDamage',
+                                        src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect7058(BaseEffect):
+    """
+    aoe_beacon_filament_cloud
+
+    Used by:
+    Celestials named like: Filament Cloud (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7059(BaseEffect):
+    """
+    weather_caustic_toxin
+
+    Used by:
+    Celestial: caustic_toxin_weather_1
+    Celestial: caustic_toxin_weather_2
+    Celestial: caustic_toxin_weather_3
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7060(BaseEffect):
+    """
+    weather_darkness
+
+    Used by:
+    Celestial: darkness_weather_1
+    Celestial: darkness_weather_2
+    Celestial: darkness_weather_3
+    Celestial: pvp_weather_1
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 5):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7061(BaseEffect):
+    """
+    weather_electric_storm
+
+    Used by:
+    Celestial: electric_storm_weather_1
+    Celestial: electric_storm_weather_2
+    Celestial: electric_storm_weather_3
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7062(BaseEffect):
+    """
+    weather_infernal
+
+    Used by:
+    Celestial: infernal_weather_1
+    Celestial: infernal_weather_2
+    Celestial: infernal_weather_3
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7063(BaseEffect):
+    """
+    weather_xenon_gas
+
+    Used by:
+    Celestial: xenon_gas_weather_1
+    Celestial: xenon_gas_weather_2
+    Celestial: xenon_gas_weather_3
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive', 'gang')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for x in range(1, 3):
+            if beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x)):
+                value = beacon.getModifiedItemAttr('warfareBuff{}Value'.format(x))
+                id = beacon.getModifiedItemAttr('warfareBuff{}ID'.format(x))
+
+                if id:
+                    fit.addCommandBonus(id, value, beacon, kwargs['effect'], 'early')
+
+
+class Effect7064(BaseEffect):
+    """
+    weather_basic
+
+    Used by:
+    Celestial: basic_weather
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+
+class Effect7071(BaseEffect):
+    """
+    smallPrecursorTurretDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Small Precursor Weapon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7072(BaseEffect):
+    """
+    mediumPrecursorTurretDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Medium Precursor Weapon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7073(BaseEffect):
+    """
+    largePrecursorTurretDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Large Precursor Weapon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7074(BaseEffect):
+    """
+    smallDisintegratorSkillDmgBonus
+
+    Used by:
+    Skill: Small Disintegrator Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Disintegrator Specialization'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7075(BaseEffect):
+    """
+    mediumDisintegratorSkillDmgBonus
+
+    Used by:
+    Skill: Medium Disintegrator Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Disintegrator Specialization'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7076(BaseEffect):
+    """
+    largeDisintegratorSkillDmgBonus
+
+    Used by:
+    Skill: Large Disintegrator Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Disintegrator Specialization'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7077(BaseEffect):
+    """
+    disintegratorWeaponDamageMultiply
+
+    Used by:
+    Modules from group: Entropic Radiation Sink (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect7078(BaseEffect):
+    """
+    disintegratorWeaponSpeedMultiply
+
+    Used by:
+    Modules from group: Entropic Radiation Sink (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect7079(BaseEffect):
+    """
+    shipPCBSSPeedBonusPCBS1
+
+    Used by:
+    Ship: Leshak
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusPBS1'), skill='Precursor Battleship', **kwargs)
+
+
+class Effect7080(BaseEffect):
+    """
+    shipPCBSDmgBonusPCBS2
+
+    Used by:
+    Ship: Leshak
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBS2'), skill='Precursor Battleship', **kwargs)
+
+
+class Effect7085(BaseEffect):
+    """
+    shipbonusPCTDamagePC1
+
+    Used by:
+    Variations of ship: Vedmak (2 of 2)
+    Ship: Tiamat
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect7086(BaseEffect):
+    """
+    shipbonusPCTTrackingPC2
+
+    Used by:
+    Ship: Ikitursa
+    Ship: Tiamat
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect7087(BaseEffect):
+    """
+    shipbonusPCTOptimalPF2
+
+    Used by:
+    Ship: Hydra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7088(BaseEffect):
+    """
+    shipbonusPCTDamagePF1
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    Ship: Hydra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusPF1'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7091(BaseEffect):
+    """
+    shipBonusNosNeutCapNeedRoleBonus2
+
+    Used by:
+    Variations of ship: Rodiva (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect7092(BaseEffect):
+    """
+    shipBonusRemoteRepCapNeedRoleBonus2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    Variations of ship: Kikimora (2 of 2)
+    Variations of ship: Leshak (2 of 2)
+    Variations of ship: Vedmak (2 of 2)
+    Ship: Drekavac
+    Ship: Hydra
+    Ship: Tiamat
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect7093(BaseEffect):
+    """
+    shipBonusSmartbombCapNeedRoleBonus2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    Variations of ship: Kikimora (2 of 2)
+    Variations of ship: Leshak (2 of 2)
+    Variations of ship: Rodiva (2 of 2)
+    Variations of ship: Vedmak (2 of 2)
+    Ship: Drekavac
+    Ship: Hydra
+    Ship: Tiamat
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect7094(BaseEffect):
+    """
+    shipBonusRemoteRepMaxRangeRoleBonus1
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    Variations of ship: Kikimora (2 of 2)
+    Variations of ship: Leshak (2 of 2)
+    Variations of ship: Vedmak (2 of 2)
+    Ship: Drekavac
+    Ship: Hydra
+    Ship: Tiamat
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'maxRange', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect7097(BaseEffect):
+    """
+    surgicalStrikeDamageMultiplierBonusPostPercentDamageMultiplierLocationShipGroupPrecursorTurret
+
+    Used by:
+    Skill: Surgical Strike
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Precursor Weapon',
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect7098(BaseEffect):
+    """
+    structureConversionRigBasicBonuses
+
+    Used by:
+    Structure Modules from group: Outpost Conversion Rigs (104 of 104)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attr in ('hp', 'armorHP', 'shieldCapacity', 'capacitorCapacity'):
+            fit.ship.boostItemAttr(attr, src.getModifiedItemAttr('conversionRigHPCapBonus'), **kwargs)
+        fit.ship.boostItemAttr('maxTargetRange', src.getModifiedItemAttr('structureRigMaxTargetRangeBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('structureRigScanResBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('maxLockedTargets', src.getModifiedItemAttr('structureRigMaxTargetBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+                                      'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+                                      'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'), **kwargs)
+        for attr in ('structureRigMaxTargetBonus', 'structureRigMaxTargetRangeBonus', 'structureRigScanResBonus'):
+            fit.modules.filteredItemForce(
+                lambda mod: mod.item.group.name == 'Structure Combat Rig L - Max Targets and Sensor Boosting',
+                attr, src.getModifiedItemAttr('constantZero'), **kwargs)
+        for attr in ('structureRigPDCapUseBonus', 'structureRigPDRangeBonus'):
+            fit.modules.filteredItemForce(
+                lambda mod: mod.item.group.name == 'Structure Combat Rig L - Point Defense Battery Application and Projection',
+                attr, src.getModifiedItemAttr('constantZero'), **kwargs)
+
+
+class Effect7111(BaseEffect):
+    """
+    systemSmallPrecursorTurretDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                         'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect7112(BaseEffect):
+    """
+    shipBonusNeutCapNeedRoleBonus2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    Variations of ship: Kikimora (2 of 2)
+    Variations of ship: Leshak (2 of 2)
+    Variations of ship: Vedmak (2 of 2)
+    Ship: Drekavac
+    Ship: Hydra
+    Ship: Tiamat
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect7116(BaseEffect):
+    """
+    eliteBonusReconScanProbeStrength2
+
+    Used by:
+    Ship: Tiamat
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+                                        src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
+
+
+class Effect7117(BaseEffect):
+    """
+    roleBonusWarpSpeed
+
+    Used by:
+    Ships from group: Blockade Runner (5 of 5)
+    Ships from group: Covert Ops (9 of 9)
+    Ships from group: Hauler (5 of 18)
+    Ships from group: Interceptor (10 of 10)
+    Ships from group: Interdictor (4 of 4)
+    Ship: Azariel
+    Ship: Cynabal
+    Ship: Dramiel
+    Ship: Khizriel
+    Ship: Leopard
+    Ship: Machariel
+    Ship: Mekubal
+    Ship: Sarathiel
+    Ship: Victorieux Luxury Yacht
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('shipRoleBonusWarpSpeed'), **kwargs)
+
+
+class Effect7118(BaseEffect):
+    """
+    eliteBonusCovertOps3PCTdamagePerCycle
+
+    Used by:
+    Ship: Hydra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+                                         src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
+
+
+class Effect7119(BaseEffect):
+    """
+    eliteBonusReconShip3PCTdamagePerCycle
+
+    Used by:
+    Ship: Tiamat
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+                                         src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
+
+
+class Effect7142(BaseEffect):
+    """
+    massEntanglerEffect5
+
+    Used by:
+    Module: Zero-Point Mass Entangler
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
+        fit.ship.boostItemAttr('mass', src.getModifiedItemAttr('massBonusPercentage'), stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+                                      src.getModifiedItemAttr('speedFactorBonus'), stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedBoostFactor',
+                                      src.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'activationBlocked',
+                                         src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('maxVelocityBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect7154(BaseEffect):
+    """
+    shipBonusPD1DisintegratorDamage
+
+    Used by:
+    Variations of ship: Kikimora (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusPD1'),
+                                      skill='Precursor Destroyer', **kwargs)
+
+
+class Effect7155(BaseEffect):
+    """
+    shipBonusPBC1DisintegratorDamage
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBC1'),
+                                      skill='Precursor Battlecruiser', **kwargs)
+
+
+class Effect7156(BaseEffect):
+    """
+    smallDisintegratorMaxRangeBonus
+
+    Used by:
+    Ship: Kikimora
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect7157(BaseEffect):
+    """
+    shipBonusPD2DisintegratorMaxRange
+
+    Used by:
+    Variations of ship: Kikimora (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusPD2'),
+                                      skill='Precursor Destroyer', **kwargs)
+
+
+class Effect7158(BaseEffect):
+    """
+    shipArmorKineticResistancePBC2
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusPBC2'),
+                               skill='Precursor Battlecruiser', **kwargs)
+
+
+class Effect7159(BaseEffect):
+    """
+    shipArmorThermalResistancePBC2
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusPBC2'),
+                               skill='Precursor Battlecruiser', **kwargs)
+
+
+class Effect7160(BaseEffect):
+    """
+    shipArmorEMResistancePBC2
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusPBC2'),
+                               skill='Precursor Battlecruiser', **kwargs)
+
+
+class Effect7161(BaseEffect):
+    """
+    shipArmorExplosiveResistancePBC2
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusPBC2'),
+                               skill='Precursor Battlecruiser', **kwargs)
+
+
+class Effect7162(BaseEffect):
+    """
+    shipRoleDisintegratorMaxRangeCBC
+
+    Used by:
+    Ship: Drekavac
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
+
+
+class Effect7166(BaseEffect):
+    """
+    ShipModuleRemoteArmorMutadaptiveRepairer
+
+    Used by:
+    Modules from group: Mutadaptive Remote Armor Repairer (5 of 5)
+    """
+
+    runTime = 'late'
+    type = 'projected', 'active'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if 'projected' not in context:
+            return
+        if fit.ship.getModifiedItemAttr('disallowAssistance'):
+            return
+        repAmountBase = container.getModifiedItemAttr('armorDamageAmount')
+        repAmountBase *= calculateRangeFactor(
+            srcOptimalRange=container.getModifiedItemAttr('maxRange'),
+            srcFalloffRange=container.getModifiedItemAttr('falloffEffectiveness'),
+            distance=projectionRange)
+        cycleTime = container.getModifiedItemAttr('duration') / 1000.0
+        repSpoolMax = container.getModifiedItemAttr('repairMultiplierBonusMax')
+        repSpoolPerCycle = container.getModifiedItemAttr('repairMultiplierBonusPerCycle')
+        defaultSpoolValue = eos.config.settings['globalDefaultSpoolupPercentage']
+        spoolType, spoolAmount = resolveSpoolOptions(SpoolOptions(SpoolType.SPOOL_SCALE, defaultSpoolValue, False), container)
+        amount = repAmountBase * (1 + calculateSpoolup(repSpoolMax, repSpoolPerCycle, cycleTime, spoolType, spoolAmount)[0])
+        amountPreSpool = repAmountBase * (1 + calculateSpoolup(repSpoolMax, repSpoolPerCycle, cycleTime, SpoolType.SPOOL_SCALE, 0)[0])
+        amountFullSpool = repAmountBase * (1 + calculateSpoolup(repSpoolMax, repSpoolPerCycle, cycleTime, SpoolType.SPOOL_SCALE, 1)[0])
+        fit._armorRr.append((amount, cycleTime))
+        fit._armorRrPreSpool.append((amountPreSpool, cycleTime))
+        fit._armorRrFullSpool.append((amountFullSpool, cycleTime))
+
+
+class Effect7167(BaseEffect):
+    """
+    shipBonusRemoteCapacitorTransferRangeRole1
+
+    Used by:
+    Variations of ship: Rodiva (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter', 'maxRange', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect7168(BaseEffect):
+    """
+    shipBonusMutadaptiveRemoteRepairRangeRole3
+
+    Used by:
+    Ship: Rodiva
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect7169(BaseEffect):
+    """
+    shipBonusMutadaptiveRepAmountPC1
+
+    Used by:
+    Ship: Rodiva
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect7170(BaseEffect):
+    """
+    shipBonusMutadaptiveRepCapNeedPC2
+
+    Used by:
+    Ship: Rodiva
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect7171(BaseEffect):
+    """
+    shipBonusMutadaptiveRemoteRepRangePC1
+
+    Used by:
+    Ship: Zarmazd
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect7172(BaseEffect):
+    """
+    shipBonusMutadaptiveRemoteRepCapNeedeliteBonusLogisitics1
+
+    Used by:
+    Ship: Zarmazd
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect7173(BaseEffect):
+    """
+    shipBonusMutadaptiveRemoteRepAmounteliteBonusLogisitics2
+
+    Used by:
+    Ship: Zarmazd
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect7176(BaseEffect):
+    """
+    skillBonusDroneInterfacingNotFighters
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Implant: CreoDron 'Bumblebee' Drone Tuner T10-5D
+    Implant: CreoDron 'Yellowjacket' Drone Tuner D5-10T
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+                                     src.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect7177(BaseEffect):
+    """
+    skillBonusDroneDurabilityNotFighters
+
+    Used by:
+    Implants named like: Drone Tuner (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+                                     src.getModifiedItemAttr('hullHpBonus'))
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+                                     src.getModifiedItemAttr('armorHpBonus'))
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+                                     src.getModifiedItemAttr('shieldCapacityBonus'), **kwargs)
+
+
+class Effect7183(BaseEffect):
+    """
+    implantWarpScrambleRangeBonus
+
+    Used by:
+    Implants named like: Inquest 'Hedone' Entanglement Optimizer WS (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Warp Scrambler',
+            'maxRange', src.getModifiedItemAttr('warpScrambleRangeBonus'), **kwargs)
+
+
+class Effect7184(BaseEffect):
+    """
+    shipBonusMediumDroneHProle8
+
+    Used by:
+    Ship: Alligator
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'hp', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect7185(BaseEffect):
+    """
+    shipBonusMediumDroneShieldHProle8
+
+    Used by:
+    Ship: Alligator
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect7186(BaseEffect):
+    """
+    shipBonusMediumDroneArmorHProle8
+
+    Used by:
+    Ship: Alligator
+    Ship: Gila
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                                     'armorHP', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect7193(BaseEffect):
+    """
+    systemMiningCycleTimeBonus
+
+    Used by:
+    Celestials from group: Destructible Effect Beacon (4 of 6)
+    Celestials named like: Triglavian Invasion System Effects (3 of 3)
+    Celestials named like: War HQ (4 of 4)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+                                      beacon.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
+
+
+class Effect7202(BaseEffect):
+    """
+    systemDroneSpeedBonusPercent
+
+    Used by:
+    Celestials named like: Triglavian Invasion System Effects (3 of 3)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', beacon.getModifiedItemAttr('droneMaxVelocityBonus'),
+                                     stackingPenalties=True, **kwargs)
+
+
+class Effect7203(BaseEffect):
+    """
+    systemDroneDamageBonusPercent
+
+    Used by:
+    Celestials named like: Triglavian Invasion System Effects (3 of 3)
+    Celestial: Drifter Crisis
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', beacon.getModifiedItemAttr('droneDamageBonus'),
+                                     stackingPenalties=True, **kwargs)
+
+
+class Effect7204(BaseEffect):
+    """
+    shipArmorEMResistancePF2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorEmDamageResonance', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7205(BaseEffect):
+    """
+    shipArmorKinResistancePF2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorKineticDamageResonance', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7206(BaseEffect):
+    """
+    shipArmorThermResistancePF2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorThermalDamageResonance', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7207(BaseEffect):
+    """
+    shipArmorExpResistancePF2
+
+    Used by:
+    Variations of ship: Damavik (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
+
+
+class Effect7209(BaseEffect):
+    """
+    shipPCTOptimalBonusEliteGunship2
+
+    Used by:
+    Ship: Nergal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusGunship2'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect7210(BaseEffect):
+    """
+    shipBonusCommandDestroyerRole2DefenderBonus
+
+    Used by:
+    Ship: Draugur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+                                      'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect7211(BaseEffect):
+    """
+    shipDmgMultiMaxEliteHeavyGunship1
+
+    Used by:
+    Ship: Ikitursa
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect7216(BaseEffect):
+    """
+    shipDmgMultiMaxEliteGunship1
+
+    Used by:
+    Ship: Nergal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+                                      'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusGunship1'),
+                                      skill='Assault Frigates', **kwargs)
+
+
+class Effect7223(BaseEffect):
+    """
+    systemAgilityBonusPercentItem
+
+    Used by:
+    Celestials named like: Triglavian Invasion System Effects (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('agility', beacon.getModifiedItemAttr('agilityBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect7227(BaseEffect):
+    """
+    systemHullHPBonusPercentItem
+
+    Used by:
+    Celestials named like: Triglavian Invasion System Effects (3 of 3)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('hp', beacon.getModifiedItemAttr('hullHpBonus'), **kwargs)
+
+
+class Effect7228(BaseEffect):
+    """
+    shipMediumPrecursorWeaponOptimalEliteHeavyGunship2
+
+    Used by:
+    Ship: Ikitursa
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
+                                      skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect7230(BaseEffect):
+    """
+    shipBonusDroneTrackingGC2
+
+    Used by:
+    Ship: Vexor Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+                                     'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
+                                     skill='Gallente Cruiser', **kwargs)
+
+
+class Effect7231(BaseEffect):
+    """
+    shipBonusArmorRepAmountGC3
+
+    Used by:
+    Ship: Vexor Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+                                      'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC3'),
+                                      skill='Gallente Cruiser', **kwargs)
+
+
+class Effect7232(BaseEffect):
+    """
+    modifyDamageMultiplierBonusMax
+
+    Used by:
+    Implants named like: grade Mimesis (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Precursor Weapon', 'damageMultiplierBonusMax',
+            implant.getModifiedItemAttr('damageMultiplierBonusMaxModifier'), **kwargs)
+
+
+class Effect7233(BaseEffect):
+    """
+    modifyDamageMultiplierBonusPerCycle
+
+    Used by:
+    Implants named like: grade Mimesis (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Precursor Weapon', 'damageMultiplierBonusPerCycle',
+            implant.getModifiedItemAttr('damageMultiplierBonusPerCycleModifier'), **kwargs)
+
+
+class Effect7234(BaseEffect):
+    """
+    implantSetMimesis
+
+    Used by:
+    Implants named like: grade Mimesis (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(
+            lambda imp: imp.item.group.name == 'Cyberimplant', 'damageMultiplierBonusMaxModifier',
+            implant.getModifiedItemAttr('setBonusMimesis'), **kwargs)
+        fit.appliedImplants.filteredItemMultiply(
+            lambda imp: imp.item.group.name == 'Cyberimplant', 'damageMultiplierBonusPerCycleModifier',
+            implant.getModifiedItemAttr('setBonusMimesis'), **kwargs)
+
+
+class Effect7237(BaseEffect):
+    """
+    systemWarpSpeedBonus
+
+    Used by:
+    Celestial: Drifter Crisis
+    Celestial: Final Liminality
+    Celestial: Turnur Aftermath
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpSpeedMultiplier', beacon.getModifiedItemAttr('warpSpeedBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect7238(BaseEffect):
+    """
+    shipBonusDreadnoughtPC1DamageMultMax
+
+    Used by:
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'), 'damageMultiplier',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtPC1'), skill='Precursor Dreadnought', **kwargs)
+
+
+class Effect7239(BaseEffect):
+    """
+    shipBonusDreadnoughtPC2ArmorResists
+
+    Used by:
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for type in ('Em', 'Explosive', 'Kinetic', 'Thermal'):
+            fit.ship.boostItemAttr('armor{0}DamageResonance'.format(type), src.getModifiedItemAttr('shipBonusDreadnoughtPC2'),
+                                   skill='Precursor Dreadnought', **kwargs)
+
+
+class Effect7240(BaseEffect):
+    """
+    shipBonusDreadnoughtPC3WeaponSpeed
+
+    Used by:
+    Ship: Zirnitra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'), 'speed',
+                                      src.getModifiedItemAttr('shipBonusDreadnoughtPC3'), skill='Precursor Dreadnought', **kwargs)
+
+
+class Effect7242(BaseEffect):
+    """
+    capitalPrecursorTurretDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Capital Precursor Weapon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'),
+                                      'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
+
+
+class Effect7247(BaseEffect):
+    """
+    shipBonusHAMHMLAoeVelocityMC
+
+    Used by:
+    Ship: Bellicose
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: (mod.charge.requiresSkill('Heavy Missiles') or
+                                                     mod.charge.requiresSkill('Heavy Assault Missiles')),
+                                        'aoeVelocity', ship.getModifiedItemAttr('shipBonusMC'),
+                                        skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect7248(BaseEffect):
+    """
+    shipPBonusROFMF
+
+    Used by:
+    Ship: Rifter
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
@@ -0,0 +1,2632 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect8011(BaseEffect):
+    """
+    shieldHpBonusPostPercentHpLocationShip
+
+    Used by:
+    Implants named like: grade Nirvana (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', container.getModifiedItemAttr('shieldHpBonus'), **kwargs)
+
+
+class Effect8013(BaseEffect):
+    """
+    setBonusNirvana
+
+    Used by:
+    Implants named like: grade Nirvana (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+                                                 'shieldHpBonus', implant.getModifiedItemAttr('ImplantSetNirvana') or 1, **kwargs)
+
+
+class Effect8017(BaseEffect):
+    """
+    saviorSetBonus
+
+    Used by:
+    Implants named like: grade Savior (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(
+            lambda implant: implant.item.requiresSkill('Cybernetics'),
+            'remoteRepDurationCapBonus', implant.getModifiedItemAttr('implantSetSavior'), **kwargs)
+
+
+class Effect8018(BaseEffect):
+    """
+    subcapRemoteArmorShieldRepDurationCapBonus
+
+    Used by:
+    Implants named like: grade Savior (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        for attr in ('duration', 'capacitorNeed'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Shield Emission Systems')
+                            or mod.item.requiresSkill('Remote Armor Repair Systems'),
+                attr, implant.getModifiedItemAttr('remoteRepDurationCapBonus'), **kwargs)
+
+
+class Effect8020(BaseEffect):
+    """
+    systemWarpSpeedAddition
+
+    Used by:
+    Celestial: System-Wide Warp Speed Bonus
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpSpeedMultiplier', src.getModifiedItemAttr('warpSpeedAdd'), **kwargs)
+
+
+class Effect8021(BaseEffect):
+    """
+    hydraSetBonus
+
+    Used by:
+    Implants named like: grade Hydra (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        for attr in ('hydraDroneTrackingBonus', 'hydraDroneRangeBonus', 'hydraMissileFlightTimeBonus', 'hydraMissileExplosionVelocityBonus'):
+            fit.appliedImplants.filteredItemMultiply(
+                lambda implant: implant.item.requiresSkill('Cybernetics'),
+                attr, implant.getModifiedItemAttr('implantSetHydra'), **kwargs)
+
+
+class Effect8023(BaseEffect):
+    """
+    hydraDroneTrackingEffect
+
+    Used by:
+    Implants named like: grade Hydra (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'),
+            'trackingSpeed', implant.getModifiedItemAttr('hydraDroneTrackingBonus'), **kwargs)
+
+
+class Effect8024(BaseEffect):
+    """
+    hydraDroneRangeEffect
+
+    Used by:
+    Implants named like: grade Hydra (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        for attr in ('maxRange', 'falloff'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'),
+                attr, implant.getModifiedItemAttr('hydraDroneRangeBonus'), **kwargs)
+
+
+class Effect8025(BaseEffect):
+    """
+    hydraMissileFlightTimeEffect
+
+    Used by:
+    Implants named like: grade Hydra (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'explosionDelay', implant.getModifiedItemAttr('hydraMissileFlightTimeBonus'), **kwargs)
+
+
+class Effect8026(BaseEffect):
+    """
+    hydraMissileExplosionVelocityEffect
+
+    Used by:
+    Implants named like: grade Hydra (15 of 18)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'aoeVelocity', implant.getModifiedItemAttr('hydraMissileExplosionVelocityBonus'), **kwargs)
+
+
+class Effect8029(BaseEffect):
+    """
+    roleBonus7CapBoosterGroupRestriction
+
+    Used by:
+    Ships from group: Force Auxiliary (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('maxGroupOnline', 'maxGroupFitted'):
+            fit.modules.filteredItemForce(
+                lambda mod: mod.item.group.name == 'Capacitor Booster',
+                attr, ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect8031(BaseEffect):
+    """
+    systemMaxTargets
+
+    Used by:
+    Celestial: Final Liminality
+    Celestial: Triglavian Minor Victory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('maxLockedTargets', beacon.getModifiedItemAttr('maxLockedTargetsMultiplier'), **kwargs)
+
+
+class Effect8032(BaseEffect):
+    """
+    systemWarpScrambleStrengthBonus
+
+    Used by:
+    Celestial: Federal Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.group.name == 'Warp Scrambler',
+            'warpScrambleStrength', beacon.getModifiedItemAttr('warpScrambleStrengthBonus'), **kwargs)
+
+
+class Effect8033(BaseEffect):
+    """
+    systemEcmRangeMultiplier
+
+    Used by:
+    Celestial: State Stellar Observatory
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+            beacon.getModifiedItemAttr('ecmRangeBonus'), stackingPenalties=True, **kwargs)
+
+
+class Effect8034(BaseEffect):
+    """
+    smallUpwellWeaponDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Small Vorton Projector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Vorton Projector'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8035(BaseEffect):
+    """
+    mediumUpwellWeaponDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Medium Vorton Projector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Vorton Projector'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8036(BaseEffect):
+    """
+    largeUpwellWeaponDmgBonusRequiredSkill
+
+    Used by:
+    Skill: Large Vorton Projector
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Vorton Projector'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8037(BaseEffect):
+    """
+    ChainLightning
+
+    Used by:
+    Modules from group: Vorton Projector (15 of 15)
+    """
+
+    type = 'active'
+
+
+class Effect8039(BaseEffect):
+    """
+    upwellSkillaoeVelocityaoeCloudSizeBonus
+
+    Used by:
+    Implants named like: Halcyon G Booster (5 of 5)
+    Skill: Vorton Arc Guidance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        level = container.level if 'skill' in context else 1
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+                                      'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level, **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+                                      'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level, **kwargs)
+
+
+class Effect8041(BaseEffect):
+    """
+    upwellSkillDamageMuliplierBonus
+
+    Used by:
+    Skill: Vorton Power Amplification
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Vorton Projector',
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8042(BaseEffect):
+    """
+    upwellSkillSpeedBonus
+
+    Used by:
+    Skill: Vorton Projector Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+                                      'speed', skill.getModifiedItemAttr('turretSpeeBonus') * skill.level, **kwargs)
+
+
+class Effect8044(BaseEffect):
+    """
+    smallVortonProjectorSkillDmgBonus
+
+    Used by:
+    Skill: Small Vorton Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Vorton Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8045(BaseEffect):
+    """
+    mediumVortonProjectorSkillDmgBonus
+
+    Used by:
+    Skill: Medium Vorton Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Vorton Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8046(BaseEffect):
+    """
+    largeVortonProjectorSkillDmgBonus
+
+    Used by:
+    Skill: Large Vorton Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Vorton Specialization'),
+                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
+
+
+class Effect8047(BaseEffect):
+    """
+    shipBonusUF1shieldResistance
+
+    Used by:
+    Ship: Skybreaker
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('shield%sDamageResonance' % type.capitalize(),
+                                   ship.getModifiedItemAttr('shipBonusUF1'),
+                                   skill='EDENCOM Frigate', **kwargs)
+
+
+class Effect8048(BaseEffect):
+    """
+    shipBonusUF2damage
+
+    Used by:
+    Ship: Skybreaker
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Vorton Projector'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusUF2'), skill='EDENCOM Frigate', **kwargs)
+
+
+class Effect8052(BaseEffect):
+    """
+    shipBonusUC2ShieldResistance
+
+    Used by:
+    Ship: Stormbringer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr('shield%sDamageResonance' % type.capitalize(),
+                                   ship.getModifiedItemAttr('shipBonusUC2'),
+                                   skill='EDENCOM Cruiser', **kwargs)
+
+
+class Effect8053(BaseEffect):
+    """
+    shipBonusUC1maxRange
+
+    Used by:
+    Ship: Stormbringer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Vorton Projector'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusUC1'), skill='EDENCOM Cruiser', **kwargs)
+
+
+class Effect8054(BaseEffect):
+    """
+    shipBonusUB1upwellDamage
+
+    Used by:
+    Ship: Thunderchild
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Vorton Projector'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusUB1'), skill='EDENCOM Battleship', **kwargs)
+
+
+class Effect8056(BaseEffect):
+    """
+    shipBonusUB2upwellROF
+
+    Used by:
+    Ship: Thunderchild
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Vorton Projector'), 'speed',
+            ship.getModifiedItemAttr('shipBonusUB2'), skill='EDENCOM Battleship', **kwargs)
+
+
+class Effect8057(BaseEffect):
+    """
+    vortonWeaponDamageSpeedMultiply
+
+    Used by:
+    Modules from group: Vorton Projector Upgrade (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Vorton Projector',
+                                         'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Vorton Projector',
+                                         'speed', module.getModifiedItemAttr('speedMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+
+
+class Effect8062(BaseEffect):
+    """
+    ammoAOEvelocityMultiplier
+
+    Used by:
+    Charges from group: Advanced Condenser Pack (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('aoeVelocity', module.getModifiedChargeAttr('aoeVelocityBonus') or 0, **kwargs)
+
+
+class Effect8064(BaseEffect):
+    """
+    vortonProjectorOptimalRangeBonus
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'maxRange',
+            booster.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+
+
+class Effect8065(BaseEffect):
+    """
+    vortonProjectorSkillRangeBonus
+
+    Used by:
+    Skill: Vorton Arc Extension
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+                                      'maxRange', skill.getModifiedItemAttr('rangeSkillBonus') * skill.level, **kwargs)
+
+
+class Effect8066(BaseEffect):
+    """
+    vortonProjectorDamageBonus
+
+    Used by:
+    Implants named like: Agency 'Pyrolancea' DB Dose (4 of 4)
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implant: AIR Pyrolancea Booster II
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'damageMultiplier',
+            booster.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
+
+
+class Effect8068(BaseEffect):
+    """
+    shipShieldResistanceBonusMBC1
+
+    Used by:
+    Ship: Claymore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr(f'shield{damageType}DamageResonance', ship.getModifiedItemAttr('shipBonusMBC1'),
+                                   skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect8070(BaseEffect):
+    """
+    eliteBonusCommandShipsHeavyHAMvelocityCS2
+
+    Used by:
+    Ship: Claymore
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or
+                                                    mod.charge.requiresSkill('Heavy Assault Missiles'),
+                                        'maxVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+                                        skill='Command Ships', **kwargs)
+
+
+class Effect8071(BaseEffect):
+    """
+    eliteBonusCommandShipDroneRangeCS1
+
+    Used by:
+    Ship: Eos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxRange', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
+                                     skill='Command Ships', **kwargs)
+
+
+class Effect8072(BaseEffect):
+    """
+    shipArmorResistanceBonusGBC2
+
+    Used by:
+    Ship: Eos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr(f'armor{damageType}DamageResonance', ship.getModifiedItemAttr('shipBonusGBC2'),
+                                   skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect8073(BaseEffect):
+    """
+    eliteBonusCommandShipShieldHPCS1
+
+    Used by:
+    Ship: Vulture
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
+                               skill='Command Ships', **kwargs)
+
+
+class Effect8074(BaseEffect):
+    """
+    shipBonusPC2maxRange
+
+    Used by:
+    Ship: Vedmak
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+                                      'maxRange', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
+
+
+class Effect8076(BaseEffect):
+    """
+    systemHullThermalResistance
+
+    Used by:
+    Celestials named like: Volatile Ice Storm (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('thermalDamageResonance', beacon.getModifiedItemAttr('thermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect8082(BaseEffect):
+    """
+    systemScanResolutionBonus
+
+    Used by:
+    Celestial: Turnur Aftermath
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', beacon.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect8091(BaseEffect):
+    """
+    shipBonusForceAuxiliaryG2CapBoosterStrength
+
+    Used by:
+    Ship: Ninazu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.group.name == 'Capacitor Booster Charge',
+            'capacitorBonus', ship.getModifiedItemAttr('shipBonusForceAuxiliaryG2'),
+            skill='Gallente Carrier', **kwargs)
+
+
+class Effect8092(BaseEffect):
+    """
+    shipBonusForceAuxiliaryM2CapBoosterStrength
+
+    Used by:
+    Ship: Lif
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.group.name == 'Capacitor Booster Charge',
+            'capacitorBonus', ship.getModifiedItemAttr('shipBonusForceAuxiliaryM2'),
+            skill='Minmatar Carrier', **kwargs)
+
+
+class Effect8094(BaseEffect):
+    """
+    shipBonusHybridROFGD1
+
+    Used by:
+    Ship: Eris
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'speed', ship.getModifiedItemAttr('shipBonusGD1'),
+                                      skill='Gallente Destroyer', **kwargs)
+
+
+class Effect8095(BaseEffect):
+    """
+    eliteBonusInterdictors1massAddition
+
+    Used by:
+    Ship: Eris
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plate',
+                                      'massAddition', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
+                                      skill='Interdictors', **kwargs)
+
+
+class Effect8096(BaseEffect):
+    """
+    shipBonusKinMissileDamageCD2
+
+    Used by:
+    Ship: Flycatcher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                        'kineticDamage', ship.getModifiedItemAttr('shipBonusCD2'),
+                                        skill='Caldari Destroyer', **kwargs)
+
+
+class Effect8097(BaseEffect):
+    """
+    eliteBonusInterdictors1ShieldCapacity
+
+    Used by:
+    Ship: Flycatcher
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
+                               skill='Interdictors', **kwargs)
+
+
+class Effect8098(BaseEffect):
+    """
+    shipBonusArmorHPAD2
+
+    Used by:
+    Ship: Heretic
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('armorHP', ship.getModifiedItemAttr('shipBonusAD2'),
+                               skill='Amarr Destroyer', **kwargs)
+
+
+class Effect8099(BaseEffect):
+    """
+    systemHeatDamageBonus
+
+    Used by:
+    Celestials named like: Metaliminal Yoiul Festival YC 122 Storm (4 of 4)
+    Celestials named like: Volatile Ice Storm (2 of 2)
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, source, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: 'heatDamage' in mod.itemModifiedAttributes,
+            'heatDamage', source.getModifiedItemAttr('thermodynamicsHeatDamage'), **kwargs)
+
+
+class Effect8100(BaseEffect):
+    """
+    shipBonusECMJamDroneDurationCF
+
+    Used by:
+    Ship: Griffin Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'),
+            'ecmJamDuration', ship.getModifiedItemAttr('shipBonusCF'),
+            skill='Caldari Frigate', **kwargs)
+
+
+class Effect8101(BaseEffect):
+    """
+    roleBonusDroneDamage
+
+    Used by:
+    Ship: Griffin Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'),
+                f'{dmgType}Damage', ship.getModifiedItemAttr('roleBonus'), **kwargs)
+
+
+class Effect8102(BaseEffect):
+    """
+    shipBonusRole1DroneHitpointsDroneControlRange
+
+    Used by:
+    Ship: Griffin Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.extraAttributes.boost(
+            'droneControlRange', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        for attr in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'),
+                attr, ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect8103(BaseEffect):
+    """
+    setBonusRapture
+
+    Used by:
+    Implants named like: grade Rapture (18 of 18)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Cybernetics'),
+            'capRechargeBonus', src.getModifiedItemAttr('ImplantSetRapture'), **kwargs)
+
+
+class Effect8104(BaseEffect):
+    """
+    salvageDroneSpecBonus
+
+    Used by:
+    Skill: Salvage Drone Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.drones.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('Salvage Drone Specialization'),
+            'accessDifficultyBonus', src.getModifiedItemAttr('specAccessDifficultyBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Salvage Drone Specialization'),
+            'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
+
+
+class Effect8106(BaseEffect):
+    """
+    shipPTdamageBonusMB2
+
+    Used by:
+    Ship: Maelstrom
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB2'),
+                                      skill='Minmatar Battleship', **kwargs)
+
+
+class Effect8107(BaseEffect):
+    """
+    shipBonusLETcapNeedAB2
+
+    Used by:
+    Ship: Paladin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+                                      'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB2'),
+                                      skill='Amarr Battleship', **kwargs)
+
+
+class Effect8108(BaseEffect):
+    """
+    signatureRadiusBonusOnline
+
+    Used by:
+    Modules from group: Signature Suppressor (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('signatureRadius', src.getModifiedItemAttr('signatureSuppressorSignatureRadiusBonusPassive'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect8109(BaseEffect):
+    """
+    targetSpectrumBreakerBonus
+
+    Used by:
+    Modules from group: Signature Suppressor (5 of 5)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('signatureRadius', src.getModifiedItemAttr('signatureSuppressorSignatureRadiusBonusActive'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect8111(BaseEffect):
+    """
+    systemElectricalStorm
+
+    Used by:
+    Celestial: Strong Metaliminal Electrical Storm
+    Celestial: Weak Metaliminal Electrical Storm
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('disallowCloaking', beacon.getModifiedItemAttr('disallowCloaking'), **kwargs)
+        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+                                        'baseSensorStrength', beacon.getModifiedItemAttr('scanProbeStrengthBonus'),
+                                        stackingPenalties=True, **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+                                         'virusCoherence', beacon.getModifiedItemAttr('virusCoherenceBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+                                         'virusCoherence', beacon.getModifiedItemAttr('virusCoherenceBonus'), **kwargs)
+        fit.ship.boostItemAttr('shieldEmDamageResonance', beacon.getModifiedItemAttr('shieldEmDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('armorEmDamageResonance', beacon.getModifiedItemAttr('armorEmDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('emDamageResonance', beacon.getModifiedItemAttr('emDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.multiplyItemAttr('rechargeRate', beacon.getModifiedItemAttr('rechargeRateMultiplier'), **kwargs)
+
+
+class Effect8112(BaseEffect):
+    """
+    systemExoticStorm
+
+    Used by:
+    Celestial: Strong Metaliminal Exotic Matter Storm
+    Celestial: Weak Metaliminal Exotic Matter Storm
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or
+                                                  mod.item.requiresSkill('Capital Repair Systems'),
+                                      'duration', beacon.getModifiedItemAttr('armorRepairDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation') or
+                                                  mod.item.requiresSkill('Capital Shield Operation'),
+                                      'duration', beacon.getModifiedItemAttr('shieldBoosterDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+                                      beacon.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
+        fit.ship.boostItemAttr('warpSpeedMultiplier', beacon.getModifiedItemAttr('warpSpeedBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('scanResolution', beacon.getModifiedItemAttr('scanResolutionBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('shieldKineticDamageResonance',
+                               beacon.getModifiedItemAttr('shieldKineticDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('armorKineticDamageResonance',
+                               beacon.getModifiedItemAttr('armorKineticDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('kineticDamageResonance', beacon.getModifiedItemAttr('kineticDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect8113(BaseEffect):
+    """
+    systemGammaStorm
+
+    Used by:
+    Celestial: Strong Metaliminal Gamma Ray Storm
+    Celestial: Weak Metaliminal Gamma Ray Storm
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
+                        mod.item.requiresSkill('Capital Shield Emission Systems'),
+            'shieldBonus', beacon.getModifiedItemAttr('shieldBonusMultiplierRemote'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
+                        mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            'armorDamageAmount', beacon.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.multiplyItemAttr('shieldCapacity', beacon.getModifiedItemAttr('shieldCapacityMultiplier'), **kwargs)
+        fit.ship.multiplyItemAttr('capacitorCapacity', beacon.getModifiedItemAttr('capacitorCapacityMultiplierSystem'), **kwargs)
+        fit.ship.multiplyItemAttr('signatureRadius', beacon.getModifiedItemAttr('signatureRadiusMultiplier'),
+                                  stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance',
+                               beacon.getModifiedItemAttr('shieldExplosiveDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('armorExplosiveDamageResonance',
+                               beacon.getModifiedItemAttr('armorExplosiveDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('explosiveDamageResonance', beacon.getModifiedItemAttr('explosiveDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect8114(BaseEffect):
+    """
+    systemPlasmaStorm
+
+    Used by:
+    Celestial: Strong Metaliminal Plasma Firestorm
+    Celestial: Weak Metaliminal Plasma Firestorm
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                         stackingPenalties=True, **kwargs)
+        for attr in ('emDamage', 'explosiveDamage', 'kineticDamage', 'thermalDamage'):
+            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                               attr, beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                               stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+                                        'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                        stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.fighters.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+                                         'trackingSpeed', beacon.getModifiedItemAttr('trackingSpeedMultiplier'),
+                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.drones.filteredItemMultiply(lambda drone: True,
+                                        'trackingSpeed', beacon.getModifiedItemAttr('trackingSpeedMultiplier'),
+                                        stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        for attr in ('fighterAbilityAttackMissileExplosionRadius', 'fighterAbilityMissilesExplosionRadius'):
+            fit.fighters.filteredItemMultiply(
+                lambda mod: mod.item.requiresSkill('Fighters'),
+                attr, beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
+                stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.multiplyItemAttr('armorHP', beacon.getModifiedItemAttr('armorHPMultiplier'), **kwargs)
+        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                                           'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
+                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+        fit.ship.boostItemAttr('shieldThermalDamageResonance',
+                               beacon.getModifiedItemAttr('shieldThermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('armorThermalDamageResonance',
+                               beacon.getModifiedItemAttr('armorThermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+        fit.ship.boostItemAttr('thermalDamageResonance', beacon.getModifiedItemAttr('thermalDamageResistanceBonus'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect8117(BaseEffect):
+    """
+    interdictionNullifierBonus
+
+    Used by:
+    Modules from group: Interdiction Nullifier (4 of 4)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.preAssignItemAttr('warpBubbleImmune', module.getModifiedItemAttr('warpBubbleImmuneBonus'), **kwargs)
+
+
+class Effect8119(BaseEffect):
+    """
+    industrialCompactCoreEffect2
+
+    Used by:
+    Modules named like: Industrial Core (4 of 6)
+    """
+
+    runTime = 'early'
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.multiplyItemAttr('mass', src.getModifiedItemAttr('siegeMassMultiplier'), **kwargs)
+
+        #  Local Shield Repper Bonuses
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'duration', src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+                                      'shieldBonus', src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
+                                      stackingPenalties=True, **kwargs)
+
+        # Mining Burst Bonuses
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff1Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff2Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff3Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+                                      'warfareBuff4Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
+
+        #  Command Burst Range Bonus
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+                                      'maxRange', src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
+                                      stackingPenalties=True, **kwargs)
+
+        # Drone Bonuses
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+                                     'duration', src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+                                     'miningAmount', src.getModifiedItemAttr('industrialCoreBonusDroneMining'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'maxVelocity', src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
+                                     stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'damageMultiplier', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
+                                     stackingPenalties=True, **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'shieldCapacity', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'armorHP', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+                                     'hp', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
+
+        # Remote impedance (no reps, etc)
+        fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+        fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
+        fit.ship.increaseItemAttr('disallowTethering', src.getModifiedItemAttr('disallowTethering'), **kwargs)
+        fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
+        fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
+        fit.ship.increaseItemAttr('disallowDocking', src.getModifiedItemAttr('disallowDocking'), **kwargs)
+        fit.ship.increaseItemAttr('gateScrambleStatus', src.getModifiedItemAttr('gateScrambleStrength'), **kwargs)
+        fit.ship.forceItemAttr('ECMResistance', src.getModifiedItemAttr('ECMResistance'), **kwargs)
+
+
+class Effect8120(BaseEffect):
+    """
+    interceptorNullificationRoleBonus
+
+    Used by:
+    Ships from group: Interceptor (6 of 10)
+    Subsystems named like: Propulsion Interdiction Nullifier (4 of 4)
+    Ship: Victorieux Luxury Yacht
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+                                      'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+                                      'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+                                      'durationHighisGood', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+                                      'scanResolutionMultiplier', ship.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+
+
+class Effect8121(BaseEffect):
+    """
+    warpCoreStabilizerActive
+
+    Used by:
+    Modules from group: Warp Core Stabilizer (8 of 8)
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
+
+
+class Effect8123(BaseEffect):
+    """
+    droneBandWidthPenaltyOnline
+
+    Used by:
+    Modules from group: Interdiction Nullifier (4 of 4)
+    Modules from group: Warp Core Stabilizer (8 of 8)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('droneBandwidth', module.getModifiedItemAttr('droneBandwidthPercentage'), **kwargs)
+
+
+class Effect8128(BaseEffect):
+    """
+    miningLaserRangeBonusLRSM
+
+    Used by:
+    Implants named like: AIR Mining Range Booster (2 of 2)
+    Implants named like: Chemal Tech Mining Booster (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, source, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'maxRange',
+                                      source.getModifiedItemAttr('maxRangeBonus'), **kwargs)
+
+
+class Effect8129(BaseEffect):
+    """
+    shipBonusCloakVelocityBonusGF
+
+    Used by:
+    Ship: Helios
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if fit.extraAttributes['cloaked']:
+            fit.ship.boostItemAttr(
+                'maxVelocity', container.getModifiedItemAttr('shipBonusGF'),
+                skill='Gallente Frigate', **kwargs)
+
+
+class Effect8130(BaseEffect):
+    """
+    shipBonusWarpCapacityNeedGF2
+
+    Used by:
+    Ship: Helios
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', container.getModifiedItemAttr('shipBonusGF2'),
+                               skill='Gallente Frigate', **kwargs)
+
+
+class Effect8131(BaseEffect):
+    """
+    shipBonusWarpCapacitorNeedAF
+
+    Used by:
+    Ship: Anathema
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', container.getModifiedItemAttr('shipBonusAF'),
+                               skill='Amarr Frigate', **kwargs)
+
+
+class Effect8132(BaseEffect):
+    """
+    shipBonusScanProbeDeviationA2F
+
+    Used by:
+    Ship: Anathema
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            container.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
+
+
+class Effect8133(BaseEffect):
+    """
+    shipBonusCloakVelocityMF
+
+    Used by:
+    Ship: Cheetah
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        if fit.extraAttributes['cloaked']:
+            fit.ship.boostItemAttr('maxVelocity', container.getModifiedItemAttr('shipBonusMF'),
+                                   skill='Minmatar Frigate', **kwargs)
+
+
+class Effect8134(BaseEffect):
+    """
+    shipBonusWarpCapacitorNeedCF2
+
+    Used by:
+    Ship: Buzzard
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', container.getModifiedItemAttr('shipBonusCF2'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect8135(BaseEffect):
+    """
+    shipBonusScanProbeDeviationCF
+
+    Used by:
+    Ship: Buzzard
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            container.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect8136(BaseEffect):
+    """
+    shipBonusWarpCapacitorNeedMF2
+
+    Used by:
+    Ship: Cheetah
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('warpCapacitorNeed', container.getModifiedItemAttr('shipBonusMF2'),
+                               skill='Minmatar Frigate', **kwargs)
+
+
+class Effect8151(BaseEffect):
+    """
+    shipBonusCloakedVelocityRole1
+
+    Used by:
+    Ships from group: Black Ops (6 of 6)
+    """
+
+    type = 'passive'
+    runTime = 'early'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Cloaking'), 'maxVelocityModifier',
+            ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect8152(BaseEffect):
+    """
+    eliteBonusEnergyDrainAmountBlackOps2
+
+    Used by:
+    Ship: Redeemer
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+            ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+            ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
+
+
+class Effect8154(BaseEffect):
+    """
+    eliteBonusDroneTrackingOptimalBlackOps2
+
+    Used by:
+    Ship: Sin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'maxRange',
+            ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
+
+
+class Effect8155(BaseEffect):
+    """
+    eliteBonusLPTtrackingBlackOps1
+
+    Used by:
+    Ship: Panther
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+            'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
+
+
+class Effect8156(BaseEffect):
+    """
+    eliteBonusLPTfalloffBlackOps2
+
+    Used by:
+    Ship: Panther
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+            'falloff', ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
+
+
+class Effect8157(BaseEffect):
+    """
+    eliteBonusShieldResistancesBlackOps2
+
+    Used by:
+    Ship: Widow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr(
+                'shield{0}DamageResonance'.format(damageType), ship.getModifiedItemAttr('eliteBonusBlackOps2'),
+                skill='Black Ops', **kwargs)
+
+
+class Effect8158(BaseEffect):
+    """
+    stabilizeCloakDurationBonus
+
+    Used by:
+    Implant: Strong Veilguard Booster
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Cloaking'), 'stabilizeCloakDuration',
+            booster.getModifiedItemAttr('stabilizeCloakDurationBonus'), **kwargs)
+
+
+class Effect8199(BaseEffect):
+    """
+    gallenteIndustrialBonusIceHoldCapacity
+
+    Used by:
+    Ship: Kryos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'specialIceHoldCapacity', ship.getModifiedItemAttr('gallenteIndustrialBonusIceHoldCapacity'),
+            skill='Gallente Hauler', **kwargs)
+
+
+class Effect8206(BaseEffect):
+    """
+    specializationAsteroidDurationMultiplierEffect
+
+    Used by:
+    Charges from group: Mercoxit Mining Crystal (6 of 6)
+    Charges from group: Mining Crystal (66 of 66)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.multiplyItemAttr('duration', module.getModifiedChargeAttr('specializationAsteroidDurationMultiplier'), **kwargs)
+
+
+class Effect8210(BaseEffect):
+    """
+    expeditionFrigateBonusIceHarvestingDuration
+
+    Used by:
+    Ship: Endurance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            ship.getModifiedItemAttr('expeditionFrigateBonusIceHarvestingDuration'),
+            skill='Expedition Frigates', **kwargs)
+
+
+class Effect8223(BaseEffect):
+    """
+    shipRoleBonusOreMiningYield
+
+    Used by:
+    Ships from group: Expedition Frigate (2 of 2)
+    Ship: Retriever
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            ship.getModifiedItemAttr('shipRoleBonusOreMiningYield'), **kwargs)
+
+
+class Effect8224(BaseEffect):
+    """
+    shipRoleBonusIceHarvestingDuration
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    Variations of ship: Retriever (2 of 2)
+    Ship: Endurance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            ship.getModifiedItemAttr('shipRoleBonusIceHarvestingDuration'), **kwargs)
+
+
+class Effect8225(BaseEffect):
+    """
+    shipRoleBonusDroneDamage
+
+    Used by:
+    Variations of ship: Procurer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipRoleBonusDroneDamage'), **kwargs)
+
+
+class Effect8226(BaseEffect):
+    """
+    shipRoleBonusDroneHitPoints
+
+    Used by:
+    Variations of ship: Procurer (2 of 2)
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                ship.getModifiedItemAttr('shipRoleBonusDroneHitPoints'), **kwargs)
+
+
+class Effect8227(BaseEffect):
+    """
+    miningBargeBonusOreMiningYield
+
+    Used by:
+    Ships from group: Exhumer (3 of 3)
+    Ships from group: Mining Barge (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            ship.getModifiedItemAttr('miningBargeBonusOreMiningYield'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect8228(BaseEffect):
+    """
+    miningBargeBonusIceHarvestingDuration
+
+    Used by:
+    Ships from group: Exhumer (3 of 3)
+    Ships from group: Mining Barge (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            ship.getModifiedItemAttr('miningBargeBonusIceHarvestingDuration'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect8229(BaseEffect):
+    """
+    miningBargeBonusGasHarvestingDuration
+
+    Used by:
+    Ships from group: Mining Barge (3 of 3)
+    Ship: Hulk
+    Ship: Mackinaw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            ship.getModifiedItemAttr('miningBargeBonusGasHarvestingDuration'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect8230(BaseEffect):
+    """
+    miningBargeBonusOreMiningRange
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'maxRange',
+            ship.getModifiedItemAttr('miningBargeBonusOreMiningRange'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect8231(BaseEffect):
+    """
+    miningBargeBonusIceHarvestingRange
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'maxRange',
+            ship.getModifiedItemAttr('miningBargeBonusIceHarvestingRange'),
+            skill='Mining Barge', **kwargs)
+
+
+class Effect8243(BaseEffect):
+    """
+    exhumersBonusOreMiningDuration
+
+    Used by:
+    Ship: Hulk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+            ship.getModifiedItemAttr('exhumersBonusOreMiningDuration'),
+            skill='Exhumers', **kwargs)
+
+
+class Effect8244(BaseEffect):
+    """
+    exhumersBonusIceHarvestingDuration
+
+    Used by:
+    Ship: Hulk
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            ship.getModifiedItemAttr('exhumersBonusIceHarvestingDuration'),
+            skill='Exhumers', **kwargs)
+
+
+class Effect8249(BaseEffect):
+    """
+    exhumersBonusOreMiningYield
+
+    Used by:
+    Ships from group: Exhumer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            ship.getModifiedItemAttr('exhumersBonusOreMiningYield'),
+            skill='Exhumers', **kwargs)
+
+
+class Effect8251(BaseEffect):
+    """
+    exhumersBonusGeneralMiningHoldCapacity
+
+    Used by:
+    Ship: Mackinaw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'generalMiningHoldCapacity', ship.getModifiedItemAttr('exhumersBonusGeneralMiningHoldCapacity'),
+            skill='Exhumers', **kwargs)
+
+
+class Effect8253(BaseEffect):
+    """
+    exhumersBonusShieldResistance
+
+    Used by:
+    Ships from group: Exhumer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr(
+                'shield{}DamageResonance'.format(damageType),
+                ship.getModifiedItemAttr('exhumersBonusShieldResistance'),
+                skill='Exhumers', **kwargs)
+
+
+class Effect8261(BaseEffect):
+    """
+    industrialCommandBonusDroneDamage
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            ship.getModifiedItemAttr('industrialCommandBonusDroneDamage'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8263(BaseEffect):
+    """
+    industrialCommandBonusFuelConsuptionCompactIndustrialCore
+
+    Used by:
+    Ship: Orca
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'), 'consumptionQuantity',
+            ship.getModifiedItemAttr('industrialCommandBonusFuelConsuptionCompactIndustrialCore'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8264(BaseEffect):
+    """
+    industrialCommandBonusMiningForemanBurstRange
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining Foreman'), 'maxRange',
+            ship.getModifiedItemAttr('industrialCommandBonusMiningForemanBurstRange'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8267(BaseEffect):
+    """
+    weaponDisruptorResistanceBonusPassive
+
+    Used by:
+    Implants named like: Harvest Anti Disruptor Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'weaponDisruptionResistance',
+            container.getModifiedItemAttr('weaponDisruptionResistanceBonus'), **kwargs)
+
+
+class Effect8268(BaseEffect):
+    """
+    nosferatuDurationBonusPassive
+
+    Used by:
+    Implants named like: Harvest Nosferatu Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'duration',
+            module.getModifiedItemAttr('durationBonus'), **kwargs)
+
+
+class Effect8269(BaseEffect):
+    """
+    stasisWebifierMaxRangeAddPassive
+
+    Used by:
+    Implants named like: Harvest Webifier Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+            module.getModifiedItemAttr('stasisWebRangeAdd'), **kwargs)
+
+
+class Effect8270(BaseEffect):
+    """
+    capacitorWarfareResistanceBonusPassive
+
+    Used by:
+    Implants named like: Halcyon Y Booster (5 of 5)
+    Implants named like: Tetrimon Anti Drain Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'energyWarfareResistance',
+            container.getModifiedItemAttr('energyWarfareResistanceBonus'), **kwargs)
+
+
+class Effect8275(BaseEffect):
+    """
+    minmatarIndustrialBonusGasHoldCapacity
+
+    Used by:
+    Ship: Hoarder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'specialGasHoldCapacity', ship.getModifiedItemAttr('minmatarIndustrialBonusGasHoldCapacity'),
+            skill='Minmatar Hauler', **kwargs)
+
+
+class Effect8278(BaseEffect):
+    """
+    industrialCommandBonusGeneralMiningHoldCapacity
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'generalMiningHoldCapacity', ship.getModifiedItemAttr('industrialCommandBonusGeneralMiningHoldCapacity'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8279(BaseEffect):
+    """
+    industrialCommandBonusShipHoldCapacity
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'capacity', ship.getModifiedItemAttr('industrialCommandBonusShipCargoCapacity'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8291(BaseEffect):
+    """
+    afterburnerSpeedBoostBonusPassive
+
+    Used by:
+    Implants named like: Wightstorm Cetana Booster (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+            booster.getModifiedItemAttr('speedFBonus'), **kwargs)
+
+
+class Effect8294(BaseEffect):
+    """
+    industrialCommandBonusDroneOreMiningYield
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningAmount',
+            ship.getModifiedItemAttr('industrialCommandBonusDroneOreMiningYield'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8295(BaseEffect):
+    """
+    industrialCommandBonusDroneIceHarvestingCycleTime
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+            ship.getModifiedItemAttr('industrialCommandBonusDroneIceHarvestingCycleTime'),
+            skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8296(BaseEffect):
+    """
+    capitalIndustrialShipBonusDroneOreMiningYield
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningAmount',
+            ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneOreMiningYield'),
+            skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect8297(BaseEffect):
+    """
+    capitalIndustrialShipBonusDroneIceCycleTime
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+            ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneIceCycleTime'),
+            skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect8300(BaseEffect):
+    """
+    shipRoleBonusGasHarvestingDuration
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    Variations of ship: Retriever (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            ship.getModifiedItemAttr('shipRoleBonusGasHarvesterDuration'), **kwargs)
+
+
+class Effect8301(BaseEffect):
+    """
+    exhumersBonusGasHarvestingDuration
+
+    Used by:
+    Ships from group: Exhumer (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            ship.getModifiedItemAttr('exhumersBonusGasHarvestingDuration'),
+            skill='Exhumers', **kwargs)
+
+
+class Effect8303(BaseEffect):
+    """
+    shipRoleBonusStripMinerActivationCost
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipRoleBonusStripMinerActivationCost'), **kwargs)
+
+
+class Effect8304(BaseEffect):
+    """
+    shipRoleBonusIceHarvestingActivationCost
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipRoleBonusIceHarvesterActivationCost'), **kwargs)
+
+
+class Effect8305(BaseEffect):
+    """
+    shipRoleBonusOreMiningDuration
+
+    Used by:
+    Variations of ship: Covetor (2 of 2)
+    Ship: Mackinaw
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+            ship.getModifiedItemAttr('shipRoleBonusOreMiningDuration'), **kwargs)
+
+
+class Effect8306(BaseEffect):
+    """
+    industrialReconfigurationBonusConsumptionQuantity
+
+    Used by:
+    Skill: Industrial Reconfiguration
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
+        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+                                         'consumptionQuantity', amount * skill.level, **kwargs)
+
+
+class Effect8309(BaseEffect):
+    """
+    capitalIndustrialShipBonusDroneHitPoints
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneHitPoints'),
+                skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect8311(BaseEffect):
+    """
+    industrialCommandBonusDroneHitPoints
+
+    Used by:
+    Ships from group: Industrial Command Ship (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                ship.getModifiedItemAttr('industrialCommandBonusDroneHitPoints'),
+                skill='Industrial Command Ships', **kwargs)
+
+
+class Effect8313(BaseEffect):
+    """
+    miningFrigateBonusGasCloudHarvestingDuration
+
+    Used by:
+    Variations of ship: Venture (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            ship.getModifiedItemAttr('miningFrigateBonusGasCloudHarvestingDuration'),
+            skill='Mining Frigate', **kwargs)
+
+
+class Effect8315(BaseEffect):
+    """
+    shipRoleBonusGasHarvestingYield
+
+    Used by:
+    Variations of ship: Venture (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'miningAmount',
+            ship.getModifiedItemAttr('shipRoleBonusGasHarvestingYield'), **kwargs)
+
+
+class Effect8317(BaseEffect):
+    """
+    miningFrigateBonusIceHarvestingDuration
+
+    Used by:
+    Ship: Endurance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            ship.getModifiedItemAttr('miningFrigateBonusIceHarvestingDuration'),
+            skill='Mining Frigate', **kwargs)
+
+
+class Effect8323(BaseEffect):
+    """
+    gallenteIndustrialBonusMiningHoldCapacity
+
+    Used by:
+    Ship: Miasmos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'generalMiningHoldCapacity',
+            ship.getModifiedItemAttr('gallenteIndustrialBonusMiningHoldCapacity'),
+            skill='Gallente Hauler', **kwargs)
+
+
+class Effect8360(BaseEffect):
+    """
+    shipBonusMissileReloadTimeGC2
+
+    Used by:
+    Ship: Laelaps
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+            'reloadTime', ship.getModifiedItemAttr('shipBonusGC2'),
+            skill='Gallente Cruiser', **kwargs)
+
+
+class Effect8362(BaseEffect):
+    """
+    shipBonusWarpDisruptionFieldGeneratorSignatureRadius
+
+    Used by:
+    Ship: Laelaps
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+            'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors3'), **kwargs)
+
+
+class Effect8364(BaseEffect):
+    """
+    industrialItemCompression
+
+    Used by:
+    Modules from group: Compressors (12 of 12)
+    """
+
+    type = 'active'
+
+
+class Effect8372(BaseEffect):
+    """
+    fleetCompressionLogisticsRangeBonus
+
+    Used by:
+    Skill: Fleet Compression Logistics
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shipboard Compression Technology')
+                        or mod.item.requiresSkill('Capital Shipboard Compression Technology'),
+            'maxRange', skill.getModifiedItemAttr('fleetCompressionLogisticsRangeBonus') * skill.level, **kwargs)
+
+
+class Effect8377(BaseEffect):
+    """
+    BattleshipRoleBonusArmorPlate&ShieldExtenderHP
+
+    Used by:
+    Ships from group: Battleship (34 of 35)
+    Ships from group: Black Ops (6 of 6)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Shield Extender',
+            'capacityBonus', ship.getModifiedItemAttr('battleshipExtenderHPBonus'), **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate',
+            'armorHPBonusAdd', ship.getModifiedItemAttr('battleshipPlateHPBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+            'structureHPMultiplier', ship.getModifiedItemAttr('battleshipBulkheadHPModifierBonus'), **kwargs)
+
+
+class Effect8467(BaseEffect):
+    """
+    modifyJumpConduitPassengerRequired
+
+    Used by:
+    Module: Covert Jump Portal Generator I
+    Module: Industrial Jump Portal Generator I
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.forceItemAttr(
+            'jumpConduitPassengerRequiredAttributeID',
+            module.getModifiedChargeAttr('jumpConduitPassengerRequiredAttributeID'), **kwargs)
+
+
+class Effect8468(BaseEffect):
+    """
+    subsystemBonusBlackOpsJumpPassenger
+
+    Used by:
+    Subsystems named like: Defensive Covert Reconfiguration (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        module.forceItemAttr(
+            'isBlackOpsJumpPortalPassenger', module.getModifiedChargeAttr('isBlackOpsJumpPortalPassenger'), **kwargs)
+        module.forceItemAttr(
+            'isBlackOpsJumpConduitPassenger', module.getModifiedChargeAttr('isBlackOpsJumpConduitPassenger'), **kwargs)
+
+
+class Effect8470(BaseEffect):
+    """
+    capitalIndustrialCommandBonusDroneDamage
+
+    Used by:
+    Ship: Rorqual
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            container.getModifiedItemAttr('capitalIndustrialCommandBonusDroneDamage'),
+            skill='Capital Industrial Ships', **kwargs)
+
+
+class Effect8474(BaseEffect):
+    """
+    subsystemBonusMassAddition
+
+    Used by:
+    Subsystem: Proteus Defensive - Augmented Plating
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('subsystemBonusMassAddition'), **kwargs)
+
+
+class Effect8477(BaseEffect):
+    """
+    droneTrackingBonusPassive
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            container.getModifiedItemAttr('droneTrackingBonus'), **kwargs)
+
+
+class Effect8478(BaseEffect):
+    """
+    miningAndIceHarvestingCycleTimeBonusPassive
+
+    Used by:
+    Implants named like: Halcyon B Booster (5 of 5)
+    Implants named like: Halcyon G Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting') or mod.item.requiresSkill('Mining'),
+            'duration', skill.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
+
+
+class Effect8479(BaseEffect):
+    """
+    droneOptimalFalloffBonusPassive
+
+    Used by:
+    Implants named like: Halcyon Y Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'maxRange',
+            container.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'falloff',
+            container.getModifiedItemAttr('falloffBonus'), **kwargs)
@@ -0,0 +1,1215 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect11055(BaseEffect):
+    """
+    shipBonusBattlecruiserHeavyMissileAoeVelocityMBC1
+
+    Used by:
+    Ship: Cyclone Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'aoeVelocity',
+            ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect11056(BaseEffect):
+    """
+    shipBonusBattlecruiserHeavyAssaultMissileAoeVelocityMBC1
+
+    Used by:
+    Ship: Cyclone Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'aoeVelocity',
+            ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect11057(BaseEffect):
+    """
+    shipBonusShieldBoostCapacitorCBC3
+
+    Used by:
+    Ship: Ferox Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipBonusCBC3'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11059(BaseEffect):
+    """
+    shipBonusMediumHybridTrackingCBC1
+
+    Used by:
+    Ship: Ferox Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11060(BaseEffect):
+    """
+    shipBonusDroneWebStrengthAndHitpointsGBC3
+
+    Used by:
+    Ship: Myrmidon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'speedFactor',
+            ship.getModifiedItemAttr('shipBonusGBC3'), skill='Gallente Battlecruiser', **kwargs)
+        for attr in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Propulsion Jamming'), attr,
+                ship.getModifiedItemAttr('shipBonusGBC3'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11061(BaseEffect):
+    """
+    roleBonusMHTRangeCBC2
+
+    Used by:
+    Ship: Myrmidon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('maxRange', 'falloff'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), attr,
+                ship.getModifiedItemAttr('roleBonusCBC2'), **kwargs)
+
+
+class Effect11063(BaseEffect):
+    """
+    shipBonusMediumEnergyWeaponDamageABC3
+
+    Used by:
+    Ship: Prophecy Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Energy Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusABC3'), skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect11064(BaseEffect):
+    """
+    shipBonusMediumEnergyWeaponRangeABC1
+
+    Used by:
+    Ship: Prophecy Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Energy Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusABC1'), skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect11065(BaseEffect):
+    """
+    shipBonusArmorHitpointsABC1
+
+    Used by:
+    Ship: Prophecy Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'armorHP', implant.getModifiedItemAttr('shipBonusABC1'),
+            skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect11067(BaseEffect):
+    """
+    battlecruiserMETRange2
+
+    Used by:
+    Ship: Prophecy Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attr in ('maxRange', 'falloff'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Medium Energy Turret'), attr,
+                src.getModifiedItemAttr('roleBonusCBC2'), **kwargs)
+
+
+class Effect11068(BaseEffect):
+    """
+    shipMissileRoFMF
+
+    Used by:
+    Ship: Probe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'speed',
+            ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect11069(BaseEffect):
+    """
+    shipRoleBonusScanProbeLauncherCPU
+
+    Used by:
+    Ship: Heron Navy Issue
+    Ship: Imicus Navy Issue
+    Ship: Magnate Navy Issue
+    Ship: Probe Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu',
+            src.getModifiedItemAttr('shipRoleBonusScanProbeLauncherCPU'), **kwargs)
+
+
+class Effect11070(BaseEffect):
+    """
+    shipBonusMissileDamageCF
+
+    Used by:
+    Ship: Heron Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
+
+
+class Effect11072(BaseEffect):
+    """
+    shipBonusSmallHybridDamageGF2
+
+    Used by:
+    Ship: Imicus Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'),
+                                      skill='Gallente Frigate', **kwargs)
+
+
+class Effect11358(BaseEffect):
+    """
+    shipBonusBattlecruiserSignatureRadiusMBC3
+
+    Used by:
+    Ship: Cyclone Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'signatureRadius', implant.getModifiedItemAttr('shipBonusMBC3'),
+            skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect11359(BaseEffect):
+    """
+    shipBonusShieldBoostFittingCBC4
+
+    Used by:
+    Ship: Ferox Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('cpu', 'power'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Shield Operation'), attr,
+                ship.getModifiedItemAttr('shipBonusCBC4'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11373(BaseEffect):
+    """
+    shipBonusDreadnoughtM1ArmorBoostAmount&ShieldBoostAmount
+
+    Used by:
+    Ship: Naglfar Fleet Issue
+    Ship: Valravn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+            src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect11374(BaseEffect):
+    """
+    shipBonusDreadnoughtA4EnergyWarfareRangeAmountBonus
+
+    Used by:
+    Ship: Revelation Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('powerTransferAmount', 'maxRange'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.group.name == 'Energy Nosferatu', attr,
+                ship.getModifiedItemAttr('shipBonusDreadnoughtA4'), skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect11376(BaseEffect):
+    """
+    shipBonusDreadnoughtG1OptimalRangeBonus
+
+    Used by:
+    Ship: Moros Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'maxRange',
+            src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11380(BaseEffect):
+    """
+    shipBonusDreadnoughtG1ArmorBoostAmount
+
+    Used by:
+    Ship: Moros Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+            src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11381(BaseEffect):
+    """
+    shipBonusWarpScramblerRangeBonusG5
+
+    Used by:
+    Ship: Moros Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+            ship.getModifiedItemAttr('shipBonusDreadnoughtG5'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11382(BaseEffect):
+    """
+    shipBonusDreadnoughtC1EwTargetPainter
+
+    Used by:
+    Ship: Phoenix Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+            src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect11387(BaseEffect):
+    """
+    shipHybridDamageBonusGalNavyDestroyer
+
+    Used by:
+    Ship: Catalyst Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11388(BaseEffect):
+    """
+    shipBonusArmorRepairGalNavyDestroyer
+
+    Used by:
+    Ship: Catalyst Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente2'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11390(BaseEffect):
+    """
+    armorUpgradesMassPenaltyReductionBonusGalNavyDestroyer
+
+    Used by:
+    Ship: Catalyst Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente3'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11391(BaseEffect):
+    """
+    shipHybridDamageBonusCalNavyDestroyer
+
+    Used by:
+    Ship: Cormorant Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11392(BaseEffect):
+    """
+    shipHybridRangeBonusCalNavyDestroyer
+
+    Used by:
+    Ship: Cormorant Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari2'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11393(BaseEffect):
+    """
+    shipHybridRangeBonusGalNavyDestroyer
+
+    Used by:
+    Ship: Catalyst Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente4'), **kwargs)
+
+
+class Effect11394(BaseEffect):
+    """
+    shipHybridFallOffGalNavyDestroyer
+
+    Used by:
+    Ship: Catalyst Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente5'), **kwargs)
+
+
+class Effect11395(BaseEffect):
+    """
+    shipBonusShieldBoosterCalNavyDestroyer
+
+    Used by:
+    Ship: Cormorant Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('shipBonusNavyDestroyerCaldari3'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11396(BaseEffect):
+    """
+    shipHybridRangeBonus2CalNavyDestroyer
+
+    Used by:
+    Ship: Cormorant Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari4'), **kwargs)
+
+
+class Effect11397(BaseEffect):
+    """
+    shipHybridFallOffCalNavyDestroyer
+
+    Used by:
+    Ship: Cormorant Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari5'), **kwargs)
+
+
+class Effect11398(BaseEffect):
+    """
+    shipProjectileDamageMinNavyDestroyer
+
+    Used by:
+    Ship: Thrasher Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar1'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect11399(BaseEffect):
+    """
+    shipProjectileRofMinNavyDestroyer
+
+    Used by:
+    Ship: Thrasher Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar2'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect11400(BaseEffect):
+    """
+    shipBonusMWDSignatureRadiusMinNavyDestroyer
+
+    Used by:
+    Ship: Thrasher Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'signatureRadiusBonus',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar3'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect11401(BaseEffect):
+    """
+    shipProjectileRangeBonusMinNavyDestroyer
+
+    Used by:
+    Ship: Thrasher Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar4'), **kwargs)
+
+
+class Effect11402(BaseEffect):
+    """
+    shipProjectileFallOffMinNavyDestroyer
+
+    Used by:
+    Ship: Thrasher Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar5'), **kwargs)
+
+
+class Effect11404(BaseEffect):
+    """
+    shipArmorHpAmaNavyDestroyer
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'armorHP', implant.getModifiedItemAttr('shipBonusNavyDestroyerAmarr1'),
+            skill='Amarr Destroyer', **kwargs)
+
+
+class Effect11405(BaseEffect):
+    """
+    shipBonusSmallEnergyTurretDamageAmaNavyDestroyer
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr2'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect11406(BaseEffect):
+    """
+    shipLaserCap1AmaNavyIssue
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr3'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect11407(BaseEffect):
+    """
+    shipNeutCap1AmaNavyDestroyer
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr4'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect11408(BaseEffect):
+    """
+    shipEnergyNeutralizerTransferAmountBonusAmaNavyDestroyer
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr5'), skill='Amarr Destroyer', **kwargs)
+
+
+class Effect11410(BaseEffect):
+    """
+    shipBonusSETFalloffAmaNavyDestroyer
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr7'), **kwargs)
+
+
+class Effect11411(BaseEffect):
+    """
+    shipMissileDmgMC2
+
+    Used by:
+    Ship: Bestla
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect11412(BaseEffect):
+    """
+    shipBonusShieldArmorResonanceMC
+
+    Used by:
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                'armor{}DamageResonance'.format(dmgType.capitalize()),
+                ship.getModifiedItemAttr('shipBonusMC'),
+                skill='Minmatar Cruiser', **kwargs)
+            fit.ship.boostItemAttr(
+                'shield{}DamageResonance'.format(dmgType.capitalize()),
+                ship.getModifiedItemAttr('shipBonusMC'),
+                skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect11413(BaseEffect):
+    """
+    eliteBonusHeavyGunshipMissileExplosionVelocity1
+
+    Used by:
+    Ship: Bestla
+    Ship: Muninn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: (
+                mod.charge.requiresSkill('Heavy Assault Missiles')
+                or mod.charge.requiresSkill('Heavy Missiles')),
+            'aoeVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
+            skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect11414(BaseEffect):
+    """
+    eliteBonusShieldBoosterAmount1
+
+    Used by:
+    Ship: Cerberus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect11415(BaseEffect):
+    """
+    eliteBonusHybridTracking1
+
+    Used by:
+    Ship: Eagle
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect11416(BaseEffect):
+    """
+    shipBonusHybridFalloffGC2
+
+    Used by:
+    Ship: Exequror Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'falloff',
+            src.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect11417(BaseEffect):
+    """
+    shipBonusArmorPlateMassGC3
+
+    Used by:
+    Ship: Exequror Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect11419(BaseEffect):
+    """
+    shipBonusDroneTrackingGB2
+
+    Used by:
+    Ship: Dominix Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            container.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect11420(BaseEffect):
+    """
+    shipBonusRepairAmountGB3
+
+    Used by:
+    Ship: Dominix Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            ship.getModifiedItemAttr('shipBonusGB3'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect11421(BaseEffect):
+    """
+    shipBonusTorpedoDamageAB
+
+    Used by:
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Torpedoes'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11422(BaseEffect):
+    """
+    shipBonusCruiseMissileDamageAB
+
+    Used by:
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Cruise Missiles'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11423(BaseEffect):
+    """
+    shipBonusHeavyMissileDamageAB
+
+    Used by:
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Heavy Missiles'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11424(BaseEffect):
+    """
+    shipBonusLargeEnergyTurretDamageAB
+
+    Used by:
+    Ship: Apocalypse
+    Ship: Apocalypse Navy Issue
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+            ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11425(BaseEffect):
+    """
+    shipBonusDroneHitpointsAB
+
+    Used by:
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11426(BaseEffect):
+    """
+    shipBonusDroneDamageAB
+
+    Used by:
+    Ship: Armageddon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            container.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect11428(BaseEffect):
+    """
+    shipBonusCruiseMissileExplosionVelocityMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'aoeVelocity',
+            ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect11429(BaseEffect):
+    """
+    shipBonusTorpedoMissileExplosionVelocityMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Torpedoes'), 'aoeVelocity',
+            ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect11430(BaseEffect):
+    """
+    shipBonusLargeProjectileTrackingMB
+
+    Used by:
+    Ship: Typhoon Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'trackingSpeed',
+            ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
+
+
+class Effect11431(BaseEffect):
+    """
+    shipBonusShieldHpCF2
+
+    Used by:
+    Ship: Crow
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldCapacity', ship.getModifiedItemAttr('shipBonusCF2'),
+                               skill='Caldari Frigate', **kwargs)
+
+
+class Effect11432(BaseEffect):
+    """
+    shipBonusArmorRepairEliteGunship2
+
+    Used by:
+    Ship: Ishkur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            ship.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
+
+
+class Effect11445(BaseEffect):
+    """
+    systemSensorStrengthBonus
+
+    Used by:
+    Celestial: Turnur Aftermath
+    """
+
+    runTime = 'early'
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        for sensor_type in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
+            fit.ship.boostItemAttr(f'scan{sensor_type}Strength', beacon.getModifiedItemAttr('sensorStrengthBonus'),
+                                   stackingPenalties=True, **kwargs)
+
+
+class Effect11446(BaseEffect):
+    """
+    shipBonusDreadnoughtG4DamageBonus
+
+    Used by:
+    Ship: Moros Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+            src.getModifiedItemAttr('shipBonusDreadnoughtG4'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11450(BaseEffect):
+    """
+    shipBonusSETOptimalAmarNavyDestroyer6
+
+    Used by:
+    Ship: Coercer Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr6'), **kwargs)
+
+
+class Effect11452(BaseEffect):
+    """
+    shipBonusWarpScramblerStrengthG5
+
+    Used by:
+    Ship: Moros Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Warp Scrambler', 'warpScrambleStrength',
+            ship.getModifiedItemAttr('shipBonusDreadnoughtG5'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11454(BaseEffect):
+    """
+    shipBonusGrapplerFalloffM4
+
+    Used by:
+    Ship: Naglfar Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Stasis Grappler', 'falloffEffectiveness',
+            ship.getModifiedItemAttr('shipBonusDreadnoughtM4'), skill='Minmatar Dreadnought', **kwargs)
@@ -0,0 +1,1030 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect11512(BaseEffect):
+    """
+    eliteBonusGunshipLightMissileAndRocketROF
+
+    Used by:
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name in ('Missile Launcher Light', 'Missile Launcher Rocket'),
+            'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect11513(BaseEffect):
+    """
+    shipBonusMissileDamageMF2
+
+    Used by:
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect11514(BaseEffect):
+    """
+    shipBonusArmorRepairAmountMF
+
+    Used by:
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect11515(BaseEffect):
+    """
+    shipBonusArmorRepairAmountMC
+
+    Used by:
+    Ship: Bestla
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect11516(BaseEffect):
+    """
+    shipBonusShieldBoostAmountMC
+
+    Used by:
+    Ship: Bestla
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect11517(BaseEffect):
+    """
+    shipBonusStasisWebDroneHitpointsAT
+
+    Used by:
+    Ship: Bestla
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for layer in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Propulsion Jamming'),
+                layer, ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
+
+
+class Effect11518(BaseEffect):
+    """
+    shipBonusStasisWebDroneVelocityAT2
+
+    Used by:
+    Ship: Bestla
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Propulsion Jamming'),
+            'maxVelocity', ship.getModifiedItemAttr('shipBonusAT2'), **kwargs)
+
+
+class Effect11519(BaseEffect):
+    """
+    shipBonusStasisWebDroneWebStrengthAT3
+
+    Used by:
+    Ship: Bestla
+    Ship: Geri
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'),
+            'speedFactor', ship.getModifiedItemAttr('shipBonusAT3'), **kwargs)
+
+
+class Effect11528(BaseEffect):
+    """
+    covopsCloakCPURole1Bonus
+
+    Used by:
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Cloaking'),
+            'cpu', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect11529(BaseEffect):
+    """
+    shipRole8BonusCoreProbeStrength
+
+    Used by:
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Science'),
+            'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
+
+
+class Effect11530(BaseEffect):
+    """
+    shipRole6BonusCoreProbeDeviation
+
+    Used by:
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Science'),
+            'baseMaxScanDeviation', ship.getModifiedItemAttr('shipBonusRole6'), **kwargs)
+
+
+class Effect11531(BaseEffect):
+    """
+    probeLauncherCPURole1Bonus
+
+    Used by:
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Scan Probe Launcher', 'cpu',
+            ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect11532(BaseEffect):
+    """
+    dataMinerCPURole1Bonus
+
+    Used by:
+    Ship: Metamorphosis
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Data Miners', 'cpu',
+            ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect11691(BaseEffect):
+    """
+    debuffLance
+
+    Used by:
+    Modules named like: Disruptive Lance (4 of 4)
+    """
+
+    dealsDamage = True
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('maxVelocity', mod.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
+        fit.ship.increaseItemAttr('warpScrambleStatus', mod.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
+
+
+class Effect11696(BaseEffect):
+    """
+    shipBonusDreadnoughtC1HybridTracking
+
+    Used by:
+    Ship: Karura
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect11697(BaseEffect):
+    """
+    shipBonusDreadnoughtC2HybridOptimalRange
+
+    Used by:
+    Ship: Karura
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'maxRange',
+            src.getModifiedItemAttr('shipBonusDreadnoughtC2'), skill='Caldari Dreadnought', **kwargs)
+
+
+class Effect11698(BaseEffect):
+    """
+    shipBonusDisruptionLanceDamage
+
+    Used by:
+    Ships from group: Lancer Dreadnought (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredItemBoost(
+                lambda module: module.item.requiresSkill('Disruptive Lance Operation'), f'{dmgType}Damage',
+                ship.getModifiedItemAttr('shipBonusAdvancedDreadnought1'), skill='Lancer Dreadnoughts', **kwargs)
+
+
+class Effect11700(BaseEffect):
+    """
+    skillDisruptionLanceCapacitorUseBonus
+
+    Used by:
+    Skill: Disruptive Lance Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda module: module.item.requiresSkill('Disruptive Lance Operation'), 'capacitorNeed',
+            skill.getModifiedItemAttr('disruptionLanceSkillBoostCapacitorCost') * skill.level, **kwargs)
+
+
+class Effect11701(BaseEffect):
+    """
+    shipBonusDisruptionLanceRange
+
+    Used by:
+    Ships from group: Lancer Dreadnought (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda module: module.item.requiresSkill('Disruptive Lance Operation'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusAdvancedDreadnought2'), skill='Lancer Dreadnoughts', **kwargs)
+
+
+class Effect11702(BaseEffect):
+    """
+    eliteBonusMarauderArmourBonus2a
+
+    Used by:
+    Ship: Vargur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            src.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders', **kwargs)
+
+
+class Effect11704(BaseEffect):
+    """
+    shipBonusDreadnoughtM2CapitalProjectileFalloff
+
+    Used by:
+    Ship: Valravn
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'falloff',
+            src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
+
+
+class Effect11705(BaseEffect):
+    """
+    shipBonusDreadnoughtA1MissileDamage
+
+    Used by:
+    Ship: Bane
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: (
+                        mod.charge.requiresSkill('XL Torpedoes')
+                        or mod.charge.requiresSkill('XL Cruise Missiles')
+                        or mod.charge.requiresSkill('Torpedoes')),
+                f'{dmgType}Damage',
+                src.getModifiedItemAttr('shipBonusDreadnoughtA1'),
+                skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect11706(BaseEffect):
+    """
+    shipBonusDreadnoughtA2MissileExplosionRadius
+
+    Used by:
+    Ship: Bane
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: (
+                    mod.charge.requiresSkill('XL Torpedoes')
+                    or mod.charge.requiresSkill('XL Cruise Missiles')
+                    or mod.charge.requiresSkill('Torpedoes')),
+            'aoeCloudSize', src.getModifiedItemAttr('shipBonusDreadnoughtA2'),
+            skill='Amarr Dreadnought', **kwargs)
+
+
+class Effect11707(BaseEffect):
+    """
+    shipBonusDreadnoughtG1HullResonance
+
+    Used by:
+    Ship: Hubris
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                f'{dmgType}DamageResonance', src.getModifiedItemAttr('shipBonusDreadnoughtG1'),
+                skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11714(BaseEffect):
+    """
+    disruptionLanceDisallowCloaking
+
+    Used by:
+    Modules named like: Disruptive Lance (4 of 4)
+    """
+
+    runTime = 'early'
+    type = 'offline'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('Cloaking'), 'activationBlocked',
+            module.getModifiedItemAttr('disruptionLanceDisallowCloaking'), **kwargs)
+
+
+class Effect11743(BaseEffect):
+    """
+    shipProjectileTrackingGD
+
+    Used by:
+    Ship: Mekubal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'trackingSpeed',
+            ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11745(BaseEffect):
+    """
+    shipShieldEmResistanceGuristasAlligatorCBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldEmDamageResonance', ship.getModifiedItemAttr('shipBonusCBC1'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11746(BaseEffect):
+    """
+    shipShieldThermalResistanceGuristasAlligatorCBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldThermalDamageResonance', ship.getModifiedItemAttr('shipBonusCBC1'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11747(BaseEffect):
+    """
+    shipShieldKineticResistanceGuristasAlligatorCBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldKineticDamageResonance', ship.getModifiedItemAttr('shipBonusCBC1'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11748(BaseEffect):
+    """
+    shipShieldExplosiveResistanceGuristasAlligatorCBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('shieldExplosiveDamageResonance', ship.getModifiedItemAttr('shipBonusCBC1'),
+                               skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect11750(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileKineticDamageGuristasAlligatorGBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'kineticDamage',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11751(BaseEffect):
+    """
+    shipBonusHeavyAssaultMissileThermalDamageGuristasAlligatorGBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'thermalDamage',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11752(BaseEffect):
+    """
+    shipBonusHeavyMissileKineticDamageGuristasAlligatorGBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11753(BaseEffect):
+    """
+    shipBonusHeavyMissileThermalDamageGuristasAlligatorGBC
+
+    Used by:
+    Ship: Alligator
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11763(BaseEffect):
+    """
+    shipBonusProjectileTurretFalloffBonusGBC
+
+    Used by:
+    Ship: Khizriel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect11764(BaseEffect):
+    """
+    shipRoleBonusProjectileRofPirateBattlecruiser
+
+    Used by:
+    Ship: Khizriel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+            'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
+
+
+class Effect11767(BaseEffect):
+    """
+    shipBonusHybridTrackingATC3
+
+    Used by:
+    Ship: Cybele
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect11919(BaseEffect):
+    """
+    shipBonusDestroyerMD1Falloff
+
+    Used by:
+    Ship: Mekubal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect11938(BaseEffect):
+    """
+    shipShieldEMResistanceCD2
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'shieldEmDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+            skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11939(BaseEffect):
+    """
+    shipShieldThermalResistanceCD2
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'shieldThermalDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+            skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11940(BaseEffect):
+    """
+    shipShieldKineticResistanceCD2
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'shieldKineticDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+            skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11941(BaseEffect):
+    """
+    shipShieldExplosiveResistanceCD2
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'shieldExplosiveDamageResonance', src.getModifiedItemAttr('shipBonusCD2'),
+            skill='Caldari Destroyer', **kwargs)
+
+
+class Effect11942(BaseEffect):
+    """
+    shipBonusKineticMissileDamageGD
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+            ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11943(BaseEffect):
+    """
+    shipBonusThermalMissileDamageGD
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+            ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
+
+
+class Effect11944(BaseEffect):
+    """
+    shipBonusTitanG2ProjectileFalloff
+
+    Used by:
+    Ship: Azariel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'falloff',
+            src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11945(BaseEffect):
+    """
+    shipBonusTitanG1ProjectileTracking
+
+    Used by:
+    Ship: Azariel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect11946(BaseEffect):
+    """
+    systemSmallUpwellTurretDamage
+
+    Used by:
+    Celestials named like: Class Wolf Rayet Effects (6 of 6)
+    """
+
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Small Vorton Projector'),
+            'damageMultiplier', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
+            stackingPenalties=True, **kwargs)
+
+
+class Effect11947(BaseEffect):
+    """
+    systemUpwellAoeCloudSize
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect11948(BaseEffect):
+    """
+    systemUpwellDamageMultiplier
+
+    Used by:
+    Celestials named like: Class Magnetar Effects (6 of 6)
+    """
+
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect11953(BaseEffect):
+    """
+    systemUpwellAoeVelocity
+
+    Used by:
+    Celestials named like: Class Black Hole Effects (6 of 6)
+    """
+
+    type = ('projected', 'passive')
+
+    @staticmethod
+    def handler(fit, beacon, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'),
+            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
+
+
+class Effect11992(BaseEffect):
+    """
+    shipBonusArmorPlateMassAT
+
+    Used by:
+    Ship: Cybele
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('shipBonusATF3'), **kwargs)
+
+
+class Effect11993(BaseEffect):
+    """
+    shipBonusRepairSystemsBonusATC3
+
+    Used by:
+    Ship: Cybele
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            src.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
+
+
+class Effect11994(BaseEffect):
+    """
+    shipBonusHybridFalloffATC3
+
+    Used by:
+    Ship: Cybele
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'falloff',
+            src.getModifiedItemAttr('eliteBonusHeavyGunship2'), skill='Heavy Assault Cruisers', **kwargs)
+
+
+class Effect11995(BaseEffect):
+    """
+    shipBonusHeatAfterburnerATGF
+
+    Used by:
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Afterburner'), 'overloadSpeedFactorBonus',
+            src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect11996(BaseEffect):
+    """
+    shipBonusMWDHeatATGF
+
+    Used by:
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'overloadSpeedFactorBonus',
+            src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
+
+
+class Effect11997(BaseEffect):
+    """
+    shipBonusArmorRepATGF
+
+    Used by:
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
+
+
+class Effect11998(BaseEffect):
+    """
+    shipBonusSmallHybridMaxRangeATF3
+
+    Used by:
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
+
+
+class Effect11999(BaseEffect):
+    """
+    shipBonusSmallHybridTrackingSpeedATF3
+
+    Used by:
+    Ship: Shapash
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'trackingSpeed',
+            src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
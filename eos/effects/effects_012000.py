@@ -0,0 +1,1248 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect12003(BaseEffect):
+    """
+    vortonTurretSpeeBonusPostPercentSpeedLocationShipModulesRequiringVortonProjectorOperation
+
+    Used by:
+    Implants named like: Halcyon R Booster (5 of 5)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, booster, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'speed',
+            booster.getModifiedItemAttr('turretSpeeBonus'), **kwargs)
+
+
+class Effect12038(BaseEffect):
+    """
+    shipBonusSPTFalloffMF3
+
+    Used by:
+    Ship: Republic Fleet Firetail
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate', **kwargs)
+
+
+class Effect12050(BaseEffect):
+    """
+    shipBonusColonyResourcesHoldCapacityUH1
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'specialColonyResourcesHoldCapacity', src.getModifiedItemAttr('shipBonusUH1'),
+            skill='Upwell Hauler', **kwargs)
+
+
+class Effect12051(BaseEffect):
+    """
+    shipMissileEMDamageUH2
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'emDamage', container.getModifiedItemAttr('shipBonusUH2'),
+            skill='Upwell Hauler', **kwargs)
+
+
+class Effect12052(BaseEffect):
+    """
+    shipMissileThermalDamageUH2
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'thermalDamage', container.getModifiedItemAttr('shipBonusUH2'),
+            skill='Upwell Hauler', **kwargs)
+
+
+class Effect12053(BaseEffect):
+    """
+    shipMissileExplosiveDamageUH2
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'explosiveDamage', container.getModifiedItemAttr('shipBonusUH2'),
+            skill='Upwell Hauler', **kwargs)
+
+
+class Effect12054(BaseEffect):
+    """
+    shipMissileKineticDamageUH2
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'kineticDamage', container.getModifiedItemAttr('shipBonusUH2'),
+            skill='Upwell Hauler', **kwargs)
+
+
+class Effect12057(BaseEffect):
+    """
+    shipBonusColonyResourcesHoldCapacityUFreighter1
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'specialColonyResourcesHoldCapacity', src.getModifiedItemAttr('shipBonusUFreighter1'),
+            skill='Upwell Freighter', **kwargs)
+
+
+class Effect12058(BaseEffect):
+    """
+    shipMissileEMDamageUFreighter2
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'emDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
+            skill='Upwell Freighter', **kwargs)
+
+
+class Effect12060(BaseEffect):
+    """
+    shipMissileThermalDamageUFreighter2
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'thermalDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
+            skill='Upwell Freighter', **kwargs)
+
+
+class Effect12061(BaseEffect):
+    """
+    shipMissileExplosiveDamageUFreighter2
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'explosiveDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
+            skill='Upwell Freighter', **kwargs)
+
+
+class Effect12062(BaseEffect):
+    """
+    shipMissileKineticDamageUFreighter2
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'kineticDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
+            skill='Upwell Freighter', **kwargs)
+
+
+class Effect12063(BaseEffect):
+    """
+    shipRoleBonusUpwellFreighterCloakCPUPenalty
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.group.name == 'Cloaking Device',
+            'cpu', ship.getModifiedItemAttr('upwellFreightercloakCPUPenalty'), **kwargs)
+
+
+class Effect12069(BaseEffect):
+    """
+    shipBonusAutoTargetingMissilesUFreighter3
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
+        for dmgType in damageTypes:
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Auto-Targeting Missiles'),
+                f'{dmgType}Damage', container.getModifiedItemAttr('shipBonusUFreighter3'),
+                skill='Upwell Freighter', **kwargs)
+
+
+class Effect12071(BaseEffect):
+    """
+    shipRoleBonusUpwellFreighterCapitalFlexHardenerFittingCapBonus
+
+    Used by:
+    Ship: Avalanche
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name == 'Flex Shield Hardener',
+            'power', ship.getModifiedItemAttr('upwellFreighterCapitalFlexHardenerFittingCapBonus'), **kwargs)
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name == 'Flex Shield Hardener',
+            'capacitorNeed', ship.getModifiedItemAttr('upwellFreighterCapitalFlexHardenerFittingCapBonus'), **kwargs)
+
+
+class Effect12072(BaseEffect):
+    """
+    eliteIndustrialUpwellNeutNosHeatBonus
+
+    Used by:
+    Ship: Torrent
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name in ('Energy Neutralizer', 'Energy Nosferatu'),
+            'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
+
+
+class Effect12098(BaseEffect):
+    """
+    jumpPortalPassengerBonusPercentSkill
+
+    Used by:
+    Ships from group: Carrier (4 of 4)
+    Ships from group: Supercarrier (6 of 6)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'conduitJumpPassengerCount', src.getModifiedItemAttr('conduitPassengerBonusPercent'),
+            skill='Capital Jump Portal Generation', **kwargs)
+
+
+class Effect12102(BaseEffect):
+    """
+    capitalMJDSkillCapReductionBonus
+
+    Used by:
+    Skill: Capital Micro Jump Drive Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Micro Jump Drive Operation'), 'capacitorNeed',
+            skill.getModifiedItemAttr('capitalMJDCapReductionBonus') * skill.level, **kwargs)
+
+
+class Effect12126(BaseEffect):
+    """
+    microJumpPortalDriveCapital
+
+    Used by:
+    Module: Capital Micro Jump Field Generator
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonusPercent'),
+                               stackingPenalties=True, **kwargs)
+
+
+class Effect12127(BaseEffect):
+    """
+    shipRoleBonusUpwellHaulersMediumMissileFittingBonus
+
+    Used by:
+    Variations of ship: Squall (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('cpu', 'power'):
+            fit.modules.filteredItemMultiply(
+                lambda mod: mod.item.group.name in (
+                    'Missile Launcher Heavy Assault',
+                    'Missile Launcher Heavy',
+                    'Missile Launcher Rapid Light'),
+                attr, ship.getModifiedItemAttr('upwellHaulersMediumMissileFittingBonus'), **kwargs)
+
+
+class Effect12165(BaseEffect):
+    """
+    ATFrigDmgBonus
+
+    Used by:
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # Get pilot sec status bonus directly here, instead of going through the intermediary effects
+        try:
+            sec_status = ship.owner.getPilotSecurity(low_limit=-10, high_limit=0)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            return
+        bonus = ship.getModifiedItemAttr('ATFrigDmgBonus') * sec_status
+        fit.modules.filteredItemBoost(
+            lambda mod: (mod.item.requiresSkill('Small Energy Turret')
+                         or mod.item.requiresSkill('Small Hybrid Turret')
+                         or mod.item.requiresSkill('Small Projectile Turret')),
+            'damageMultiplier', bonus, **kwargs)
+        for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                f'{dmgType}Damage', bonus, **kwargs)
+
+
+class Effect12176(BaseEffect):
+    """
+    shipBonusAllShieldresistATCC1
+
+    Used by:
+    Ship: Cobra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                'shield{}DamageResonance'.format(dmgType.capitalize()),
+                ship.getModifiedItemAttr('shipBonusCC3'),
+                skill='Caldari Cruiser', **kwargs)
+
+
+class Effect12179(BaseEffect):
+    """
+    ShipBonusAllShieldResistATCF1
+
+    Used by:
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                'shield{}DamageResonance'.format(dmgType.capitalize()),
+                ship.getModifiedItemAttr('shipBonus3CF'),
+                skill='Caldari Frigate', **kwargs)
+
+
+class Effect12180(BaseEffect):
+    """
+    roleBonusATCruiserMJDFittingReduction
+
+    Used by:
+    Ship: Cobra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Micro Jump Drive',
+            'cpu', ship.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Micro Jump Drive',
+            'power', ship.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
+
+
+class Effect12181(BaseEffect):
+    """
+    ATcruiserTackleBonus1
+
+    Used by:
+    Ship: Cobra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # Get pilot sec status bonus directly here, instead of going through the intermediary effects
+        try:
+            sec_status = ship.owner.getPilotSecurity(low_limit=-10, high_limit=0)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            return
+        bonus = ship.getModifiedItemAttr('ATcruiserStasisWebifierBonus') * sec_status
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', bonus, **kwargs)
+
+
+class Effect12183(BaseEffect):
+    """
+    shipBonusATpropDuration
+
+    Used by:
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name in ('Propulsion Module', 'Microwarpdrive'),
+            'duration', ship.getModifiedItemAttr('shipBonusATprobDuration'), **kwargs)
+
+
+class Effect12184(BaseEffect):
+    """
+    shipBonusATAllShieldResistCB3
+
+    Used by:
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for dmgType in ('em', 'thermal', 'kinetic', 'explosive'):
+            fit.ship.boostItemAttr(
+                'shield{}DamageResonance'.format(dmgType.capitalize()),
+                ship.getModifiedItemAttr('shipBonusCB3'),
+                skill='Caldari Battleship', **kwargs)
+
+
+class Effect12185(BaseEffect):
+    """
+    shipBonusBurstJammer ATB
+
+    Used by:
+    Ship: Python
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # Get pilot sec status bonus directly here, instead of going through the intermediary effects
+        try:
+            sec_status = ship.owner.getPilotSecurity(low_limit=-10, high_limit=0)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            return
+        bonus = ship.getModifiedItemAttr('ATBurstJammerStrengthBonus') * sec_status
+        for attr in ('ecmBurstRange', 'scanRadarStrengthBonus', 'scanGravimetricStrengthBonus', 'scanLadarStrengthBonus', 'scanMagnetometricStrengthBonus'):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer', attr, bonus, **kwargs)
+
+
+class Effect12188(BaseEffect):
+    """
+    shipRoleBonusSPTDamage
+
+    Used by:
+    Ship: Tholos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'damageMultiplier',
+            container.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect12189(BaseEffect):
+    """
+    shipRoleBonusMPTDamage
+
+    Used by:
+    Ship: Cenotaph
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'damageMultiplier',
+            container.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect12190(BaseEffect):
+    """
+    shipRoleBonusRocketDamage
+
+    Used by:
+    Ship: Tholos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Rockets'), f'{damageType}Damage',
+                ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect12191(BaseEffect):
+    """
+    shipRoleBonusHAMDamage
+
+    Used by:
+    Ship: Cenotaph
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), f'{damageType}Damage',
+                ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+
+
+class Effect12192(BaseEffect):
+    """
+    stasisWebifierResistanceBonusMD1
+
+    Used by:
+    Ship: Tholos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'stasisWebifierResistance', ship.getModifiedItemAttr('shipBonusMD1'),
+            skill='Minmatar Destroyer', **kwargs)
+
+
+class Effect12193(BaseEffect):
+    """
+    stasisWebifierResistanceBonusMBC1
+
+    Used by:
+    Ship: Cenotaph
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr(
+            'stasisWebifierResistance', ship.getModifiedItemAttr('shipBonusMBC1'),
+            skill='Minmatar Battlecruiser', **kwargs)
+
+
+class Effect12194(BaseEffect):
+    """
+    shipBonusShieldBoostCD1
+
+    Used by:
+    Ship: Tholos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
+
+
+class Effect12195(BaseEffect):
+    """
+    shipBonusShieldBoostCBC1
+
+    Used by:
+    Ship: Cenotaph
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect12202(BaseEffect):
+    """
+    ATcruiserTackleBonus2
+
+    Used by:
+    Ship: Cobra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        # Get pilot sec status bonus directly here, instead of going through the intermediary effects
+        try:
+            sec_status = ship.owner.getPilotSecurity(low_limit=-10, high_limit=0)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            return
+        bonus = ship.getModifiedItemAttr('ATcruiserScramblerDisruptorBonus') * sec_status
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange', bonus, **kwargs)
+
+
+class Effect12203(BaseEffect):
+    """
+    ATfrigDroneBonus
+
+    Used by:
+    Ship: Sidewinder
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('shieldCapacity', 'armorHP', 'hp', 'damageMultiplier'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                attr, ship.getModifiedItemAttr('ATfrigDroneBonus'), **kwargs)
+
+
+class Effect12213(BaseEffect):
+    """
+    shipBonusMPTFalloffMC3
+
+    Used by:
+    Ship: Stabber Fleet Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('ShipBonusMC3'), skill='Minmatar Cruiser', **kwargs)
+
+
+class Effect12214(BaseEffect):
+    """
+    AtcruiserDroneBonus
+
+    Used by:
+    Ship: Cobra
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('shieldCapacity', 'armorHP', 'hp', 'damageMultiplier'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                attr, ship.getModifiedItemAttr('ATcruiserDroneBonus'), **kwargs)
+
+
+class Effect12217(BaseEffect):
+    """
+    skillDotMaxHPPercentagePerTickBonus
+
+    Used by:
+    Skill: Breacher Pod Launcher Operation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotMaxHPPercentagePerTick',
+            skill.getModifiedItemAttr('dotMaxHPPercentagePerTickBonus') * skill.level, **kwargs)
+
+
+class Effect12218(BaseEffect):
+    """
+    skillDotMaxDamagePerTickBonus
+
+    Used by:
+    Skill: Breacher Pod Clone Efficacity
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotMaxDamagePerTick',
+            skill.getModifiedItemAttr('dotMaxDamagePerTickBonus') * skill.level, **kwargs)
+
+
+class Effect12219(BaseEffect):
+    """
+    skillDotPodVelocityBonus
+
+    Used by:
+    Skill: Breacher Pod Projection
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'maxVelocity',
+            skill.getModifiedItemAttr('speedFactor') * skill.level, **kwargs)
+
+
+class Effect12220(BaseEffect):
+    """
+    skillDotLauncherRoFBonus
+
+    Used by:
+    Skill: Breacher Pod Rapid Firing
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Breacher Pod Launcher Operation'),
+            'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
+
+
+class Effect12221(BaseEffect):
+    """
+    skillDotDurationBonus
+
+    Used by:
+    Skill: Breacher Pod Clone Longevity
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, skill, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotDuration',
+            skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
+
+
+class Effect12244(BaseEffect):
+    """
+    shipBonusRole1CapitalProjectileDamageBonus
+
+    Used by:
+    Ship: Sarathiel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'),
+            'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+
+
+class Effect12245(BaseEffect):
+    """
+    shipBonusDreadnoughtG1FalloffBonus
+
+    Used by:
+    Ship: Sarathiel
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
+
+
+class Effect12246(BaseEffect):
+    """
+    shipBonusRoleAngelDreadMoveWhileSieged
+
+    Used by:
+    Ship: Sarathiel
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Siege Module', 'speedFactor',
+            ship.getModifiedItemAttr('shipBonusSiegeSpeedMultiplier'), **kwargs)
+
+
+class Effect12249(BaseEffect):
+    """
+    shipBonusDroneDamageHeavyMediumLightMultiplierGBC1
+
+    Used by:
+    Ship: Eos
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: (
+                drone.item.requiresSkill('Light Drone Operation')
+                or drone.item.requiresSkill('Medium Drone Operation')
+                or drone.item.requiresSkill('Heavy Drone Operation')),
+            'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
+            skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect12250(BaseEffect):
+    """
+    shipBonusSentryDroneDamageAndSentryHPMultiplierGBC3
+
+    Used by:
+    Ship: Eos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attrName in ('damageMultiplier', 'shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'), attrName,
+                ship.getModifiedItemAttr('shipBonusGBC3'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect12251(BaseEffect):
+    """
+    shipBonusDroneHPHeavyMediumLightGBC1
+
+    Used by:
+    Ship: Eos
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attrName in ('shieldCapacity', 'armorHP', 'hp'):
+            fit.drones.filteredItemBoost(
+                lambda drone: (
+                    drone.item.requiresSkill('Light Drone Operation')
+                    or drone.item.requiresSkill('Medium Drone Operation')
+                    or drone.item.requiresSkill('Heavy Drone Operation')),
+                attrName, ship.getModifiedItemAttr('shipBonusGBC1'),
+                skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect12252(BaseEffect):
+    """
+    eliteBonusCommandShipDroneTrackingHeavyMediumLightCS2
+
+    Used by:
+    Ship: Eos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: (
+                drone.item.requiresSkill('Light Drone Operation')
+                or drone.item.requiresSkill('Medium Drone Operation')
+                or drone.item.requiresSkill('Heavy Drone Operation')),
+            'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
+            skill='Command Ships', **kwargs)
+
+
+class Effect12253(BaseEffect):
+    """
+    eliteBonusCommandShipDroneTrackingSentryCS4
+
+    Used by:
+    Ship: Eos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+            'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips4'),
+            skill='Command Ships', **kwargs)
+
+
+class Effect12267(BaseEffect):
+    """
+    shipBloodRaiderCapitalNosNeutralizationSignatureResolutionReduction
+
+    Used by:
+    Ship: Chemosh
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'energyNeutralizerSignatureResolution',
+            ship.getModifiedItemAttr('shipBloodRaiderCapitalNosSignatureReductionMultiplyer'), **kwargs)
+
+
+class Effect12275(BaseEffect):
+    """
+    shipBonusArmorPlateMassEliteBonusLogistics4
+
+    Used by:
+    Ship: Oneiros
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('eliteBonusLogistics4'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect12276(BaseEffect):
+    """
+    shipBonusShieldExtenderSigEliteBonusLogistics4
+
+    Used by:
+    Ship: Scimitar
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Shield Extender', 'signatureRadiusAdd',
+            ship.getModifiedItemAttr('eliteBonusLogistics4'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect12278(BaseEffect):
+    """
+    shipBonusArmorPlateHitpointAmountEliteBonusLogistics4
+
+    Used by:
+    Ships from group: Logistics (3 of 7)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'armorHPBonusAdd',
+            ship.getModifiedItemAttr('eliteBonusLogistics4'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect12279(BaseEffect):
+    """
+    shipBonusShieldExtenderCapacityBonusEliteBonusLogistics4
+
+    Used by:
+    Ship: Basilisk
+    Ship: Etana
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Shield Extender', 'capacityBonus',
+            ship.getModifiedItemAttr('eliteBonusLogistics4'), skill='Logistics Cruisers', **kwargs)
+
+
+class Effect12283(BaseEffect):
+    """
+    implantSetHackingVirusCoheranceEffect
+
+    Used by:
+    Implants named like: grade Wedge (12 of 12)
+    """
+
+    runTime = 'early'
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.appliedImplants.filteredItemMultiply(
+            lambda imp: imp.item.requiresSkill('Cybernetics'), 'implantSetHackingVirusCoherenceModifier',
+            implant.getModifiedItemAttr('implantSetHackingVirusCoherenceOmegaSetBonus'), **kwargs)
+
+
+class Effect12284(BaseEffect):
+    """
+    implantSetHackingVirusCoheranceModifierEffect
+
+    Used by:
+    Implants named like: grade Wedge (12 of 12)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Data Miners', 'virusCoherence',
+            implant.getModifiedItemAttr('implantSetHackingVirusCoherenceModifier'), **kwargs)
+
+
+class Effect12286(BaseEffect):
+    """
+    shipLPWRangeBonusPCBS1
+
+    Used by:
+    Ship: Babaroga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Precursor Weapon'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusPBS1'), skill='Precursor Battleship', **kwargs)
+
+
+class Effect12287(BaseEffect):
+    """
+    shipLPWTrackingBonusPCBS1
+
+    Used by:
+    Ship: Babaroga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Precursor Weapon'), 'trackingSpeed',
+            ship.getModifiedItemAttr('shipBonusPBS2'), skill='Precursor Battleship', **kwargs)
+
+
+class Effect12288(BaseEffect):
+    """
+    eliteBonusViolatorsLPWDmgMultiMax1
+
+    Used by:
+    Ship: Babaroga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Precursor Weapon'), 'damageMultiplierBonusMax',
+            ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
+
+
+class Effect12296(BaseEffect):
+    """
+    shipLaserCapABC3
+
+    Used by:
+    Ship: Harbinger Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Medium Energy Turret'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipBonusABC3'), skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect12329(BaseEffect):
+    """
+    shipMiningYieldBonusOreDestroyer1
+
+    Used by:
+    Variations of ship: Pioneer (3 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            src.getModifiedItemAttr('shipBonusOreDestroyer1'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12330(BaseEffect):
+    """
+    shipMiningRangeBonusOreDestroyer2
+
+    Used by:
+    Ships named like: Pioneer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'maxRange',
+            src.getModifiedItemAttr('shipBonusOreDestroyer2'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12331(BaseEffect):
+    """
+    shipGasCloudDurationBonusOreDestroyer3
+
+    Used by:
+    Ships named like: Pioneer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            src.getModifiedItemAttr('shipBonusOreDestroyer3'), skill='Mining Destroyer', **kwargs)
@@ -0,0 +1,1072 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+
+
+class Effect12529(BaseEffect):
+    """
+    shipBonusArmorResistsUniformSOEABC1
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        damageTypes = ('Em', 'Explosive', 'Kinetic', 'Thermal')
+        for damageType in damageTypes:
+            fit.ship.boostItemAttr(
+                f'armor{damageType}DamageResonance', ship.getModifiedItemAttr('shipBonusABC1'),
+                skill='Amarr Battlecruiser', **kwargs)
+
+
+class Effect12530(BaseEffect):
+    """
+    expeditionCommandDurationBonus
+
+    Used by:
+    Skill: Expedition Command
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Expedition Command'), 'buffDuration',
+            src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
+
+
+class Effect12531(BaseEffect):
+    """
+    expeditionCommandStrengthBonus
+
+    Used by:
+    Skill: Expedition Command Specialist
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        lvl = src.level
+        for i in (1, 2, 3, 4):
+            fit.modules.filteredChargeBoost(
+                lambda mod: mod.item.requiresSkill('Expedition Command'), f'warfareBuff{i}Multiplier',
+                src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+
+
+class Effect12537(BaseEffect):
+    """
+    shipBonusAnalyzerRangeECS1
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, implant, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Data Miners', 'maxRange',
+            implant.getModifiedItemAttr('shipBonusSoEECS1'), skill='Expedition Command Ships', **kwargs)
+
+
+class Effect12538(BaseEffect):
+    """
+    shipBonusGasCloudScoopDurationECS2
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            src.getModifiedItemAttr('shipBonusSoEECS2'), skill='Expedition Command Ships', **kwargs)
+
+
+class Effect12539(BaseEffect):
+    """
+    shipBonusExplorationCommandStrengthDurationECS3
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Expedition Command'), attrName,
+                src.getModifiedItemAttr('shipBonusSoEECS3'), skill='Expedition Command Ships', **kwargs)
+
+
+class Effect12540(BaseEffect):
+    """
+    shipBonusArmorCommandStrengthDurationECS4
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Armored Command'), attrName,
+                src.getModifiedItemAttr('shipBonusSoEECS4'), skill='Expedition Command Ships', **kwargs)
+
+
+class Effect12541(BaseEffect):
+    """
+    shipBonusGasCloudScoopCPUreductionSOEECSrole
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'cpu',
+            src.getModifiedItemAttr('shipBonusGasCloudScoopCPUreductionSOEECSrole'), **kwargs)
+
+
+class Effect12542(BaseEffect):
+    """
+    expeditionCommandMindlink
+
+    Used by:
+    Implants named like: Expedition Command Mindlink (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Expedition Command'), attrName,
+                src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
+
+
+class Effect12543(BaseEffect):
+    """
+    shipBonusRole6ExpeditionBurstDurationSOEECS
+
+    Used by:
+    Ship: Odysseus
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Expedition Command'), 'buffDuration',
+            src.getModifiedItemAttr('shipBonusRole6'), **kwargs)
+
+
+class Effect12554(BaseEffect):
+    """
+    shipDroneHPandDamageOreDestroyer2
+
+    Used by:
+    Ship: Outrider
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for attr in ('shieldCapacity', 'armorHP', 'hp', 'damageMultiplier'):
+            fit.drones.filteredItemBoost(
+                lambda drone: drone.item.requiresSkill('Drones'), attr,
+                ship.getModifiedItemAttr('shipBonusOreDestroyer2'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12555(BaseEffect):
+    """
+    shipBonusShieldAllResistancesOreDestroyer3
+
+    Used by:
+    Ship: Outrider
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        for type in ('kinetic', 'thermal', 'explosive', 'em'):
+            fit.ship.boostItemAttr(
+                f'shield{type.capitalize()}DamageResonance', ship.getModifiedItemAttr('shipBonusOreDestroyer3'),
+                skill='Mining Destroyer', **kwargs)
+
+
+class Effect12556(BaseEffect):
+    """
+    eliteBonusCommandDestroyerMining1
+
+    Used by:
+    Ship: Outrider
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
+            fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Mining Foreman'), attrName,
+                src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers', **kwargs)
+
+
+class Effect12557(BaseEffect):
+    """
+    shipBonusGasCloudDurationRoleBonusOreMiningDestroyer
+
+    Used by:
+    Ships named like: Pioneer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            src.getModifiedItemAttr('shipBonusGasCloudDurationRoleBonusOreMiningDestroyer'), **kwargs)
+
+
+class Effect12559(BaseEffect):
+    """
+    shipShieldBoosterBonusOreExecutiveDestroyer4
+
+    Used by:
+    Ship: Pioneer Consortium Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('shipBonusOreDestroyer4'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12560(BaseEffect):
+    """
+    oreExecutiveRoleBonusSalvageDroneAdditionalAccessDifficultyRoleBonus
+
+    Used by:
+    Ships named like: Consortium Issue (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, container, context, projectionRange, **kwargs):
+        fit.drones.filteredItemIncrease(
+            lambda drone: drone.item.requiresSkill('Salvage Drone Operation'), 'accessDifficultyBonus',
+            container.getModifiedItemAttr('oreExecutiveRoleBonusSalvageDroneAdditionalAccessDifficulty'), **kwargs)
+
+
+class Effect12563(BaseEffect):
+    """
+    shipShieldBoosterBonusOreExecutiveFrigate
+
+    Used by:
+    Ship: Venture Consortium Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            src.getModifiedItemAttr('OreMiningFrigateExecutiveShieldBoosterShipBonus'),
+            skill='Mining Frigate', **kwargs)
+
+
+class Effect12565(BaseEffect):
+    """
+    shipBonusDroneTrackingSpeedGBC1
+
+    Used by:
+    Ship: Myrmidon Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
+
+
+class Effect12566(BaseEffect):
+    """
+    shipBonusDroneMWDboostrole6
+
+    Used by:
+    Ship: Mamba
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda drone: drone.item.requiresSkill('Drones'), 'maxVelocity',
+            ship.getModifiedItemAttr('shipBonusRole6'), **kwargs)
+
+
+class Effect12567(BaseEffect):
+    """
+    shipBonusSmallProjectileFalloffRole6
+
+    Used by:
+    Ship: Mekubal
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            ship.getModifiedItemAttr('shipBonusRole6'), **kwargs)
+
+
+class Effect12568(BaseEffect):
+    """
+    eliteBonusJustWarpScramblerRangeBonusBlops1
+
+    Used by:
+    Ship: Sin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Navigation'), 'maxRange',
+            src.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
+
+
+class Effect12569(BaseEffect):
+    """
+    eliteBonusJustWarpScramblerStrengthBonusBlops3
+
+    Used by:
+    Ship: Sin
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemIncrease(
+            lambda mod: mod.item.requiresSkill('Navigation'), 'warpScrambleStrength',
+            ship.getModifiedItemAttr('eliteBonusBlackOps3'), skill='Black Ops', **kwargs)
+
+
+class Effect12573(BaseEffect):
+    """
+    shipBonusLargeEnergyTurretCapReductionAB3
+
+    Used by:
+    Ship: Apocalypse
+    Ship: Apocalypse Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'capacitorNeed',
+            ship.getModifiedItemAttr('shipBonusAB3'), skill='Amarr Battleship', **kwargs)
+
+
+class Effect12575(BaseEffect):
+    """
+    modeRemoteArmorRepairCapacitorCostPostDiv
+
+    Used by:
+    Module: Confessor Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+            1 / ship.getModifiedItemAttr('modeRemoteRepairCapacitorCostPostDiv'), **kwargs)
+
+
+class Effect12576(BaseEffect):
+    """
+    modeRemoteShieldRepairCapacitorCostPostDiv
+
+    Used by:
+    Module: Svipul Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+            1 / ship.getModifiedItemAttr('modeRemoteRepairCapacitorCostPostDiv'), **kwargs)
+
+
+class Effect12577(BaseEffect):
+    """
+    modeRemoteRepairAmountArmorPostDiv
+
+    Used by:
+    Module: Confessor Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'armorDamageAmount',
+            1 / ship.getModifiedItemAttr('modeRemoteRepairBonusPostDiv'), **kwargs)
+
+
+class Effect12578(BaseEffect):
+    """
+    modeRemoteRepairAmountShieldPostDiv
+
+    Used by:
+    Module: Svipul Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'shieldBonus',
+            1 / ship.getModifiedItemAttr('modeRemoteRepairBonusPostDiv'), **kwargs)
+
+
+class Effect12579(BaseEffect):
+    """
+    shipBonusArmorPlateMassGB3
+
+    Used by:
+    Ship: Megathron Navy Issue
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            ship.getModifiedItemAttr('shipBonusGB3'), skill='Gallente Battleship', **kwargs)
+
+
+class Effect12591(BaseEffect):
+    """
+    miningSensorArrayScannerUpgrade
+
+    Used by:
+    Modules from group: Mining Survey Chipset (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, mod, context, projectionRange, **kwargs):
+        fit.ship.increaseItemAttr('miningScannerUpgrade', mod.getModifiedItemAttr('miningScannerUpgrade'), **kwargs)
+
+
+class Effect12592(BaseEffect):
+    """
+    shipBonusCarrierA5SupportFighterBonusEffect
+
+    Used by:
+    Ship: Archon
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterAbilityEnergyNeutralizerAmount',
+            src.getModifiedItemAttr('shipBonusCarrierA5'), skill='Amarr Carrier', **kwargs)
+
+
+class Effect12593(BaseEffect):
+    """
+    shipBonusCarrierC5SupportFighterBonusEffect
+
+    Used by:
+    Ship: Chimera
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        for sensorType in ('Radar', 'Magnetometric', 'Ladar', 'Gravimetric'):
+            fit.fighters.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill('Support Fighters'), f'fighterAbilityECMStrength{sensorType}',
+                src.getModifiedItemAttr('shipBonusCarrierC5'), skill='Caldari Carrier', **kwargs)
+
+
+class Effect12594(BaseEffect):
+    """
+    shipBonusCarrierG5SupportFighterBonusSpeed
+
+    Used by:
+    Ship: Thanatos
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterAbilityAfterburnerSpeedBonus',
+            src.getModifiedItemAttr('shipBonusCarrierG5'), skill='Gallente Carrier', **kwargs)
+
+
+class Effect12595(BaseEffect):
+    """
+    shipBonusCarrierM5SupportFighterBonusEffect
+
+    Used by:
+    Ship: Nidhoggur
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.fighters.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterAbilityStasisWebifierSpeedPenalty',
+            src.getModifiedItemAttr('shipBonusCarrierM5'), skill='Minmatar Carrier', **kwargs)
+
+
+class Effect12596(BaseEffect):
+    """
+    shipMiningBonusYieldOreDestroyerRoleBonus
+
+    Used by:
+    Ships named like: Pioneer (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            src.getModifiedItemAttr('shipMiningBonusYieldOreDestroyerRoleBonus'), **kwargs)
+
+
+class Effect12597(BaseEffect):
+    """
+    moduleBonusIntegratedSensorArray
+
+    Used by:
+    Module: Integrated Sensor Array
+    """
+
+    type = 'active'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('scanResolutionBonus'), stackingPenalties=True, **kwargs)
+        fit.ship.multiplyItemAttr('maxTargetRange', src.getModifiedItemAttr('maxTargetRangeMultiplier'), stackingPenalties=True, **kwargs)
+        fit.ship.forceItemAttr('maximumRangeCap', src.getModifiedItemAttr('maximumRangeCap'), **kwargs)
+
+        for scanType in ('Magnetometric', 'Ladar', 'Gravimetric', 'Radar'):
+            attr = 'scan{}Strength'.format(scanType)
+            bonus = src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType))
+            fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True, **kwargs)
+            fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), attr, bonus,
+                                           stackingPenalties=True, **kwargs)
+
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Shield Operation') or mod.item.requiresSkill('Capital Repair Systems'),
+            'duration', src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Capital Shield Operation') or mod.item.requiresSkill('Capital Repair Systems'),
+            'capacitorNeed', src.getModifiedItemAttr('siegeLocalLogisticsCapacitorNeedBonus'), **kwargs)
+
+
+class Effect12739(BaseEffect):
+    """
+    shipBonusEnergyNeutOptimalAC2
+
+    Used by:
+    Ship: Ashimmu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+            src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect12740(BaseEffect):
+    """
+    shipBonusEnergyNosOptimalAC2
+
+    Used by:
+    Ship: Ashimmu
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+            src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
+
+
+class Effect12753(BaseEffect):
+    """
+    shipRoleBonusOREExecutiveIssueMiningCriticalHitChanceBonus
+
+    Used by:
+    Ships named like: Consortium Issue (2 of 2)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining'), 'miningCritChance',
+            ship.getModifiedItemAttr('shipRoleBonusOREExecutiveIssueMiningCriticalHitChance'), **kwargs)
+
+
+class Effect12755(BaseEffect):
+    """
+    miningCritChanceSkillPostPercentLRSMBonus
+
+    Used by:
+    Skill: Mining Precision
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            'miningCritChance', src.getModifiedItemAttr('miningCritChanceBonus') * src.level, **kwargs)
+
+
+class Effect12757(BaseEffect):
+    """
+    miningCritYieldSkillPostPercentLRSMBonus
+
+    Used by:
+    Skill: Mining Exploitation
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            'miningCritBonusYield', src.getModifiedItemAttr('miningCritBonusYieldBonus') * src.level, **kwargs)
+
+
+class Effect12758(BaseEffect):
+    """
+    shipRoleBonusAnhingaLargeMissilePowerFittingBonus
+
+    Used by:
+    Ship: Anhinga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name in (
+                'Missile Launcher Rapid Heavy',
+                'Missile Launcher Cruise',
+                'Missile Launcher Torpedo'),
+            'power', ship.getModifiedItemAttr('AnhingaLargeMissilePowerFittingBonus'), **kwargs)
+
+
+class Effect12759(BaseEffect):
+    """
+    miningCritChanceBonusOreIceOnline
+
+    Used by:
+    Modules from group: Mining Survey Chipset (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            'miningCritChance', src.getModifiedItemAttr('miningCritChanceBonus'), **kwargs)
+
+
+class Effect12760(BaseEffect):
+    """
+    miningCritBonusYieldBonusOreIceOnline
+
+    Used by:
+    Modules from group: Mining Survey Chipset (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            'miningCritBonusYield', src.getModifiedItemAttr('miningCritBonusYieldBonus'), **kwargs)
+
+
+class Effect12761(BaseEffect):
+    """
+    miningWasteChanceBonusOreIceOnline
+
+    Used by:
+    Modules from group: Mining Survey Chipset (4 of 4)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: (mod.item.requiresSkill('Mining')
+                         or mod.item.requiresSkill('Ice Harvesting')
+                         or mod.item.requiresSkill('Gas Cloud Harvesting')),
+            'miningWasteProbability', src.getModifiedItemAttr('miningWasteProbabilityBonus'),
+            stackingPenalties=True, **kwargs)
+
+
+class Effect12764(BaseEffect):
+    """
+    shipRoleBonusAnhingaLargeMissileCpuFittingBonus
+
+    Used by:
+    Ship: Anhinga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name in (
+                'Missile Launcher Rapid Heavy',
+                'Missile Launcher Cruise',
+                'Missile Launcher Torpedo'),
+            'cpu', ship.getModifiedItemAttr('AnhingaLargeMissileCpuFittingBonus'), **kwargs)
+
+
+class Effect12766(BaseEffect):
+    """
+    shipBonusTorpedoAndCruiseMissileExplosionRadiusCBC1
+
+    Used by:
+    Ship: Anhinga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Torpedoes') or mod.charge.requiresSkill('Cruise Missiles'),
+            'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect12767(BaseEffect):
+    """
+    tacticalBonusSkuaDefensiveShieldRechargeRate
+
+    Used by:
+    Module: Skua Defense Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.ship.multiplyItemAttr('shieldRechargeRate', 1 / module.getModifiedItemAttr('modeShieldRechargePostDiv'), **kwargs)
+
+
+class Effect12771(BaseEffect):
+    """
+    shipRoleBonusPerseveranceIceMiningCriticalHitChanceBonus
+
+    Used by:
+    Ship: Perseverance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'miningCritChance',
+            ship.getModifiedItemAttr('shipRoleBonusPerseveranceIceMiningCriticalHitChance'), **kwargs)
+
+
+class Effect12772(BaseEffect):
+    """
+    shipIceMiningCriticalHitChanceBonusOreDestroyer1
+
+    Used by:
+    Ship: Perseverance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'miningCritChance',
+            ship.getModifiedItemAttr('shipBonusOreDestroyer1'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12773(BaseEffect):
+    """
+    shipIceMiningCriticalHitYieldBonusOreDestroyer2
+
+    Used by:
+    Ship: Perseverance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'miningCritBonusYield',
+            ship.getModifiedItemAttr('shipBonusOreDestroyer2'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12774(BaseEffect):
+    """
+    shipIceMiningRangeBonusOreDestroyer3
+
+    Used by:
+    Ship: Perseverance
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'maxRange',
+            ship.getModifiedItemAttr('shipBonusOreDestroyer3'), skill='Mining Destroyer', **kwargs)
+
+
+class Effect12777(BaseEffect):
+    """
+    roleBonusCDLinksPGCPUReductionSkua
+
+    Used by:
+    Ship: Skua
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+                                      src.getModifiedItemAttr('roleBonusCD'), **kwargs)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+                                      src.getModifiedItemAttr('roleBonusCD'), **kwargs)
+
+
+class Effect12790(BaseEffect):
+    """
+    shipBonusTorpedoAndCruiseMissileExplosionVelocityCBC2
+
+    Used by:
+    Ship: Anhinga
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeBoost(
+            lambda mod: mod.charge.requiresSkill('Torpedoes') or mod.charge.requiresSkill('Cruise Missiles'),
+            'aoeVelocity', ship.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
+
+
+class Effect12794(BaseEffect):
+    """
+    shipRocketMaxVelocityBonusPostDivSkua
+
+    Used by:
+    Module: Skua Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Rockets'),
+            'maxVelocity', 1 / module.getModifiedItemAttr('modeRocketMissileMaxVelocityBonusPostDivSkua'),
+            stackingPenalties=True, penaltyGroup='postDiv', **kwargs)
+
+
+class Effect12795(BaseEffect):
+    """
+    shipLightMissileMaxVelocityBonusPostDivSkua
+
+    Used by:
+    Module: Skua Sharpshooter Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Light Missiles'),
+            'maxVelocity', 1 / module.getModifiedItemAttr('modeLightMissileMaxVelocityBonusPostDivSkua'),
+            stackingPenalties=True, penaltyGroup='postDiv', **kwargs)
+
+
+class Effect12796(BaseEffect):
+    """
+    shipModeMissileFlightTimePostDiv
+
+    Used by:
+    Module: Anhinga Primary Mode
+    Module: Anhinga Secondary Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'explosionDelay', 1 / ship.getModifiedItemAttr('modeAnhingaMissileFlightTimePostDiv'),
+            stackingPenalties=True, penaltyGroup='postDiv', **kwargs)
+
+
+class Effect12798(BaseEffect):
+    """
+    shipModeMissileVelocityPostDiv
+
+    Used by:
+    Module: Anhinga Primary Mode
+    Module: Anhinga Tertiary Mode
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, module, context, projectionRange, **kwargs):
+        fit.modules.filteredChargeMultiply(
+            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            'maxVelocity', 1 / module.getModifiedItemAttr('modeAnhingaMissileMaxVelocityPostDiv'),
+            stackingPenalties=True, penaltyGroup='postDiv', **kwargs)
+
+
+class Effect12799(BaseEffect):
+    """
+    shipModeAnhingaCruiseLauncherTorpedoLauncherRapidHeavyLauncherROFPostDiv
+
+    Used by:
+    Modules named like: Anhinga Mode (3 of 3)
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, ship, context, projectionRange, **kwargs):
+        fit.modules.filteredItemMultiply(
+            lambda mod: mod.item.group.name in (
+                'Missile Launcher Rapid Heavy',
+                'Missile Launcher Cruise',
+                'Missile Launcher Torpedo'),
+            'speed', 1 / ship.getModifiedItemAttr('modeAnhingaCruiseLauncherTorpedoLauncherRapidHeavyLauncherROFPostDiv'),
+            stackingPenalties=True, penaltyGroup='postDiv',**kwargs)
+
+
+class Effect12802(BaseEffect):
+    """
+    MutatedMiningDroneOperationMiningAmountBonusPostPercentMiningDroneAmountPercentChar
+
+    Used by:
+    Skill: Mutated Drone Specialization
+    """
+
+    type = 'passive'
+
+    @staticmethod
+    def handler(fit, src, context, projectionRange, **kwargs):
+        fit.drones.filteredItemBoost(
+            lambda mod: mod.item.requiresSkill('Mutated Drone Specialization'), 'miningAmount',
+            src.getModifiedItemAttr('miningAmountBonus') * src.level, **kwargs)
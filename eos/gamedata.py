@@ -26,6 +26,7 @@ from sqlalchemy.orm import reconstructor
 
 import eos.effects
 import eos.db
+from eos.recalcProfiler import recalcProfiler
 from eos.saveddata.price import Price as types_Price
 from .eqBase import EqBase
 
@@ -68,6 +69,8 @@ class Effect(EqBase):
             pyfalog.debug("Generating effect: {0} ({1}) [runTime: {2}]", self.name, self.effectID, self.runTime)
             self.__generateHandler()
 
+        if recalcProfiler.enabled:
+            return recalcProfiler.wrapHandler(self, self.__handler)
         return self.__handler
 
     @property
@@ -465,6 +468,31 @@ class Item(EqBase):
 
         return self.__priceObj
 
+    @classmethod
+    def preloadPrices(cls, items):
+        """Fetch price objects for many items at once, instead of one query per item."""
+        missing = {}
+        for item in items:
+            priceObj = item.__priceObj
+            if priceObj is not None and getattr(priceObj, '_sa_instance_state', None) and priceObj._sa_instance_state.deleted:
+                item.__priceObj = priceObj = None
+            if priceObj is None:
+                missing.setdefault(item.ID, []).append(item)
+        if not missing:
+            return
+        db_prices = eos.db.getPrices(missing)
+        created = False
+        for typeID, typeItems in missing.items():
+            priceObj = db_prices.get(typeID)
+            if priceObj is None:
+                priceObj = types_Price(typeID)
+                eos.db.add(priceObj)
+                created = True
+            for item in typeItems:
+                item.__priceObj = priceObj
+        if created:
+            eos.db.flush()
+
     @property
     def isAbyssal(self):
         if Item.ABYSSAL_TYPES is None:
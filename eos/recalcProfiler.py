@@ -0,0 +1,146 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import json
+import threading
+from time import perf_counter
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+REPORT_FORMAT = 1
+
+
+class RecalcProfiler:
+    """
+    Opt-in instrumentation of fit calculation. While enabled, collects call counts
+    and cumulative time of effect handlers (per effect and run time, and per item
+    which runs them), of command boosts (per warfare buff and run time) and of
+    whole recalcs. Disabled profiler costs a single attribute check per handler
+    lookup.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self.lock:
+            # Format: {(effect ID, run time): [calls, time]}
+            self.effects = {}
+            # Format: {item type ID: [calls, time]}
+            self.items = {}
+            # Format: {(warfare buff ID, run time): [calls, time]}
+            self.commandBoosts = {}
+            # Format: [calls, time]
+            self.recalcs = [0, 0]
+            self.effectNames = {}
+            self.itemNames = {}
+
+    def __record(self, container, key, startTime):
+        elapsed = perf_counter() - startTime
+        with self.lock:
+            stats = container.get(key)
+            if stats is None:
+                stats = container[key] = [0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def wrapHandler(self, effect, handler):
+        """Return effect handler which records time spent in it"""
+        def profiledHandler(fit, item, *args, **kwargs):
+            startTime = perf_counter()
+            try:
+                return handler(fit, item, *args, **kwargs)
+            finally:
+                self.__record(self.effects, (effect.ID, effect.runTime), startTime)
+                self.effectNames[effect.ID] = effect.name
+                itemType = getattr(item, 'item', None)
+                if itemType is not None:
+                    self.__record(self.items, itemType.ID, startTime)
+                    self.itemNames[itemType.ID] = itemType.name
+
+        return profiledHandler
+
+    def recordCommandBoost(self, warfareBuffID, runTime, startTime):
+        self.__record(self.commandBoosts, (warfareBuffID, runTime), startTime)
+
+    def recordRecalc(self, startTime):
+        elapsed = perf_counter() - startTime
+        with self.lock:
+            self.recalcs[0] += 1
+            self.recalcs[1] += elapsed
+
+    def getReport(self):
+        """Return collected data, every section sorted by cumulative time, times in ms"""
+        with self.lock:
+            effects = [
+                {'effectID': effectID, 'name': self.effectNames.get(effectID), 'runTime': runTime,
+                 'calls': calls, 'time': elapsed * 1000}
+                for (effectID, runTime), (calls, elapsed) in self.effects.items()]
+            items = [
+                {'typeID': typeID, 'name': self.itemNames.get(typeID), 'calls': calls, 'time': elapsed * 1000}
+                for typeID, (calls, elapsed) in self.items.items()]
+            commandBoosts = [
+                {'warfareBuffID': buffID, 'runTime': runTime, 'calls': calls, 'time': elapsed * 1000}
+                for (buffID, runTime), (calls, elapsed) in self.commandBoosts.items()]
+            recalcs = {'calls': self.recalcs[0], 'time': self.recalcs[1] * 1000}
+        for section in (effects, items, commandBoosts):
+            section.sort(key=lambda r: r['time'], reverse=True)
+        return {
+            'format': REPORT_FORMAT,
+            'recalcs': recalcs,
+            'effects': effects,
+            'items': items,
+            'commandBoosts': commandBoosts}
+
+    def writeReport(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.getReport(), f, indent=2)
+
+    def summary(self, limit=10):
+        """Return human-readable lines with the most expensive effects, items and command boosts"""
+        report = self.getReport()
+        lines = ['{} recalcs took {:.1f}ms'.format(report['recalcs']['calls'], report['recalcs']['time'])]
+        if report['effects']:
+            lines.append('Slowest effects (calls/cumulative):')
+            for r in report['effects'][:limit]:
+                lines.append('  {} {} [{}]: {}/{:.1f}ms'.format(r['effectID'], r['name'], r['runTime'], r['calls'], r['time']))
+        if report['items']:
+            lines.append('Slowest items (calls/cumulative):')
+            for r in report['items'][:limit]:
+                lines.append('  {} {}: {}/{:.1f}ms'.format(r['typeID'], r['name'], r['calls'], r['time']))
+        if report['commandBoosts']:
+            lines.append('Slowest command boosts (calls/cumulative):')
+            for r in report['commandBoosts'][:limit]:
+                lines.append('  {} [{}]: {}/{:.1f}ms'.format(r['warfareBuffID'], r['runTime'], r['calls'], r['time']))
+        return lines
+
+
+# Process-wide instance, enabled by pyfa.py --recalc-report or from dev tools
+recalcProfiler = RecalcProfiler()
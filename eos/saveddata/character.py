@@ -131,6 +131,24 @@ class Character:
             self.addSkill(Skill(self, skillRow["typeID"], skillRow["level"]))
         self.secStatus = float(secStatus)
 
+    def apiUpdateSkills(self, skills):
+        """
+        Make character have exactly passed {skill type ID: level}, other skills
+        become unlearned. Unlike clearing skills and adding them again, skills which
+        did not change are left alone, so re-syncing a character touches only the
+        rows which differ.
+        """
+        for skill in self.__skills:
+            if skill.itemID not in skills and (skill.activeLevel is not None or skill.isDirty):
+                skill.setLevel(None, persist=True, ignoreRestrict=True)
+        for skillID, level in skills.items():
+            skill = self.__skillIdMap.get(skillID)
+            if skill is None:
+                self.addSkill(Skill(self, skillID, level))
+            elif skill.activeLevel != level or skill.isDirty:
+                skill.setLevel(level, persist=True, ignoreRestrict=True)
+        self.dirtySkills.clear()
+
     def clearSkills(self):
         del self.__skills[:]
         self.__skillIdMap.clear()
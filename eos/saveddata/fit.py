@@ -32,7 +32,8 @@ from eos.calc import calculateLockTime, calculateMultiplier
 from eos.const import CalcType, FitSystemSecurity, FittingHardpoint, FittingModuleState, FittingSlot, ImplantLocation
 from eos.effectHandlerHelpers import (
     HandledBoosterList, HandledDroneCargoList, HandledImplantList,
-    HandledModuleList, HandledProjectedDroneList, HandledProjectedModList)
+    HandledModuleList, HandledProjectedDroneList, HandledProjectedModList, revisionCounter)
+from eos.recalcProfiler import recalcProfiler
 from eos.saveddata.character import Character
 from eos.saveddata.citadel import Citadel
 from eos.saveddata.damagePattern import DamagePattern
@@ -40,7 +41,9 @@ from eos.saveddata.module import Module
 from eos.saveddata.ship import Ship
 from eos.saveddata.targetProfile import TargetProfile
 from eos.utils.float import floatUnerr
+from eos.utils.statCache import fitStat
 from eos.utils.stats import DmgTypes, RRTypes
+from eos.warfareBuffs import applyWarfareBuff
 
 pyfalog = Logger(__name__)
 
@@ -154,6 +157,10 @@ class Fit:
         self.__capRecharge = None
         self.__savedCapSimData = {}
         self.__calculatedTargets = []
+        self.__revision = next(revisionCounter)
+        # Results of methods decorated with fitStat, valid for _statCacheRevision
+        self._statCache = {}
+        self._statCacheRevision = None
         self.factorReload = False
         self.boostsFits = set()
         self.gangBoosts = None
@@ -284,6 +291,18 @@ class Fit:
         # todo: brief explaination hwo this works
         self.__calculated = bool
 
+    @property
+    def revision(self):
+        """
+        Revision of calculated state of the fit, changes on every recalc and every
+        change to item lists of the fit. None if fit is not calculated.
+        """
+        if not self.__calculated:
+            return None
+        return max(self.__revision, *(l.revision for l in (
+            self.modules, self.drones, self.fighters, self.cargo, self.implants, self.boosters,
+            self.projectedModules, self.projectedDrones, self.projectedFighters)))
+
     @property
     def ship(self):
         return self.__ship
@@ -525,6 +544,7 @@ class Fit:
         return True
 
     def clear(self, projected=False, command=False):
+        self.__revision = next(revisionCounter)
         self.__effectiveTank = None
         self.__weaponDpsMap = {}
         self.__weaponVolleyMap = {}
@@ -618,6 +638,8 @@ class Fit:
 
     def __runCommandBoosts(self, runTime="normal"):
         pyfalog.debug("Applying gang boosts for {0}", repr(self))
+        # Holders matched by buff target filters, shared by all buffs applied in this run
+        targetCache = {}
         for warfareBuffID in list(self.commandBonuses.keys()):
             # Unpack all data required to run effect properly
             effect_runTime, value, thing, effect = self.commandBonuses[warfareBuffID]
@@ -625,346 +647,15 @@ class Fit:
             if runTime != effect_runTime:
                 continue
 
+            profileStartTime = time.perf_counter() if recalcProfiler.enabled else None
+
             # This should always be a gang effect, otherwise it wouldn't be added to commandBonuses
             if effect.isType("gang"):
                 self.register(thing)
+                applyWarfareBuff(self, warfareBuffID, value, targetCache)
 
-                if warfareBuffID == 10:  # Shield Burst: Shield Harmonizing: Shield Resistance
-                    for damageType in ("Em", "Explosive", "Thermal", "Kinetic"):
-                        self.ship.boostItemAttr("shield%sDamageResonance" % damageType, value, stackingPenalties=True)
-
-                if warfareBuffID == 11:  # Shield Burst: Active Shielding: Repair Duration/Capacitor
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or
-                                        mod.item.requiresSkill("Shield Emission Systems") or
-                                        mod.item.requiresSkill("Capital Shield Emission Systems"),
-                            "capacitorNeed", value)
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or
-                                        mod.item.requiresSkill("Shield Emission Systems") or
-                                        mod.item.requiresSkill("Capital Shield Emission Systems"),
-                            "duration", value)
-
-                if warfareBuffID == 12:  # Shield Burst: Shield Extension: Shield HP
-                    self.ship.boostItemAttr("shieldCapacity", value)
-
-                if warfareBuffID == 13:  # Armor Burst: Armor Energizing: Armor Resistance
-                    for damageType in ("Em", "Thermal", "Explosive", "Kinetic"):
-                        self.ship.boostItemAttr("armor%sDamageResonance" % damageType, value, stackingPenalties=True)
-
-                if warfareBuffID == 14:  # Armor Burst: Rapid Repair: Repair Duration/Capacitor
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                        mod.item.requiresSkill("Repair Systems") or
-                                        mod.item.requiresSkill("Capital Remote Armor Repair Systems"),
-                            "capacitorNeed", value)
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                        mod.item.requiresSkill("Repair Systems") or
-                                        mod.item.requiresSkill("Capital Remote Armor Repair Systems"),
-                            "duration", value)
-
-                if warfareBuffID == 15:  # Armor Burst: Armor Reinforcement: Armor HP
-                    self.ship.boostItemAttr("armorHP", value)
-
-                if warfareBuffID == 16:  # Information Burst: Sensor Optimization: Scan Resolution
-                    self.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
-
-                if warfareBuffID == 17:  # Information Burst: Electronic Superiority: EWAR Range and Strength
-                    groups = ("ECM", "Sensor Dampener", "Weapon Disruptor", "Target Painter")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
-                                                   stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
-                                                   "falloffEffectiveness", value, stackingPenalties=True)
-
-                    for scanType in ("Magnetometric", "Radar", "Ladar", "Gravimetric"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
-                                                       "scan%sStrengthBonus" % scanType, value,
-                                                       stackingPenalties=True)
-
-                    for attr in ("missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus", "falloffBonus",
-                                 "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor",
-                                                       attr, value)
-
-                    for attr in ("maxTargetRangeBonus", "scanResolutionBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
-                                                       attr, value)
-
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
-                                                   "signatureRadiusBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 18:  # Information Burst: Electronic Hardening: Scan Strength
-                    for scanType in ("Gravimetric", "Radar", "Ladar", "Magnetometric"):
-                        self.ship.boostItemAttr("scan%sStrength" % scanType, value, stackingPenalties=True)
-
-                if warfareBuffID == 19:  # Information Burst: Electronic Hardening: RSD/RWD Resistance
-                    self.ship.boostItemAttr("sensorDampenerResistance", value)
-                    self.ship.boostItemAttr("weaponDisruptionResistance", value)
-
-                if warfareBuffID == 20:  # Skirmish Burst: Evasive Maneuvers: Signature Radius
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 21:  # Skirmish Burst: Interdiction Maneuvers: Tackle Range
-                    groups = ("Stasis Web", "Warp Scrambler")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
-                                                   stackingPenalties=True)
-
-                if warfareBuffID == 22:  # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner") or
-                                                               mod.item.requiresSkill("High Speed Maneuvering"),
-                                                   "speedFactor", value, stackingPenalties=True)
-
-                if warfareBuffID == 23:  # Mining Burst: Mining Laser Field Enhancement: Mining Range
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "maxRange", value, stackingPenalties=True)
-
-                if warfareBuffID == 24:  # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "capacitorNeed", value, stackingPenalties=True)
-
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "duration", value, stackingPenalties=True)
-
-                if warfareBuffID == 25:  # Mining Burst: Mining Equipment Preservation: Crystal Volatility
-                    self.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill("Mining"),
-                                                     "crystalVolatilityChance", value, stackingPenalties=True)
-
-                if warfareBuffID == 26:  # Information Burst: Sensor Optimization: Targeting Range
-                    self.ship.boostItemAttr("maxTargetRange", value, stackingPenalties=True)
-
-                if warfareBuffID == 60:  # Skirmish Burst: Evasive Maneuvers: Agility
-                    self.ship.boostItemAttr("agility", value, stackingPenalties=True)
-
-                # Titan effects
-
-                if warfareBuffID == 39:  # Avatar Effect Generator : Capacitor Recharge bonus
-                    self.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
-
-                if warfareBuffID == 40:  # Avatar Effect Generator : Kinetic resistance bonus
-                    for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 41:  # Avatar Effect Generator : EM resistance penalty
-                    for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 42:  # Erebus Effect Generator : Armor HP bonus
-                    self.ship.boostItemAttr("armorHP", value)
-
-                if warfareBuffID == 43:  # Erebus Effect Generator : Explosive resistance bonus
-                    for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 44:  # Erebus Effect Generator : Thermal resistance penalty
-                    for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 45:  # Ragnarok Effect Generator : Signature Radius bonus
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 46:  # Ragnarok Effect Generator : Thermal resistance bonus
-                    for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 47:  # Ragnarok Effect Generator : Explosive resistance penaly
-                    for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 48:  # Leviathan Effect Generator : Shield HP bonus
-                    self.ship.boostItemAttr("shieldCapacity", value)
-
-                if warfareBuffID == 49:  # Leviathan Effect Generator : EM resistance bonus
-                    for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 50:  # Leviathan Effect Generator : Kinetic resistance penalty
-                    for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 51:  # Avatar Effect Generator : Velocity penalty
-                    self.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
-
-                if warfareBuffID == 52:  # Erebus Effect Generator : Shield RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 53:  # Leviathan Effect Generator : Armor RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
-                                                   "armorDamageAmount", value, stackingPenalties=True)
-
-                if warfareBuffID == 54:  # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
-                    groups = ("Energy Weapon", "Hybrid Weapon")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value, stackingPenalties=True)
-
-                # Localized environment effects
-
-                if warfareBuffID == 79:  # AOE_Beacon_bioluminescence_cloud
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 80:  # AOE_Beacon_caustic_cloud_inertia
-                    self.ship.boostItemAttr("agility", value, stackingPenalties=True)
-
-                if warfareBuffID == 81:  # AOE_Beacon_caustic_cloud_velocity
-                    self.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
-
-                if warfareBuffID == 88:  # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
-                                                   "shieldBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 89:  # AOE_Beacon_filament_cloud_shield_booster_duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
-                                                   "duration", value, stackingPenalties=True)
-
-                # Abyssal Weather Effects
-
-                if warfareBuffID == 90:  # Weather_electric_storm_EM_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}EmDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                            "{}EmDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("emDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "emDamageResonance", value)  #for hull
-
-                if warfareBuffID == 92:  # Weather_electric_storm_capacitor_recharge_bonus
-                    self.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
-
-                if warfareBuffID == 93:  # Weather_xenon_gas_explosive_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}ExplosiveDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                            "{}ExplosiveDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("explosiveDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "explosiveDamageResonance", value)  # for hull
-
-                if warfareBuffID == 94:  # Weather_xenon_gas_shield_hp_bonus
-                    self.ship.boostItemAttr("shieldCapacity", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "shieldCapacity", value)
-
-                if warfareBuffID == 95:  # Weather_infernal_thermal_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}ThermalDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                            "{}ThermalDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("thermalDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "thermalDamageResonance", value)  # for hull
-
-                if warfareBuffID == 96:  # Weather_infernal_armor_hp_bonus
-                    self.ship.boostItemAttr("armorHP", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "armorHP", value)
-
-                if warfareBuffID == 97:  # Weather_darkness_turret_range_penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
-                                                   "maxRange", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "maxRange", value, stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
-                                                   "falloff", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "falloff", value, stackingPenalties=True)
-
-                if warfareBuffID == 98:  # Weather_darkness_velocity_bonus
-                    self.ship.boostItemAttr("maxVelocity", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "maxVelocity", value)
-
-                if warfareBuffID == 99:  # Weather_caustic_toxin_kinetic_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}KineticDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                            "{}KineticDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("kineticDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
-                        "kineticDamageResonance", value)  # for hull
-
-                if warfareBuffID == 100:  # Weather_caustic_toxin_scan_resolution_bonus
-                    self.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
-
-                if warfareBuffID == 2405:  # Insurgency Suppression Bonus: Interdiction Range
-                    self.modules.filteredItemBoost(
-                        lambda mod: mod.item.requiresSkill("Navigation"),
-                        "maxRange", value, stackingPenalties=True)
-                    self.modules.filteredItemBoost(
-                        lambda mod: mod.item.group.name == "Stasis Web",
-                        "maxRange", value, stackingPenalties=True)
-
-                # Sov upgrades buffs
-                if warfareBuffID == 2433:  # Sov System Modifier Shield HP Bonus
-                    self.ship.boostItemAttr("shieldCapacity", value)
-                if warfareBuffID == 2434:  # Sov System Modifier Capacitor Capacity Bonus
-                    self.ship.boostItemAttr("capacitorCapacity", value)
-                if warfareBuffID == 2435:  # Sov System Modifier Armor HP Bonus
-                    self.ship.boostItemAttr("armorHP", value)
-                if warfareBuffID == 2436:  # Sov System Modifier Overheating Bonus - Includes Ewar
-                    for attr in (
-                        'overloadDurationBonus', 'overloadRofBonus', 'overloadSelfDurationBonus',
-                        'overloadHardeningBonus', 'overloadDamageModifier', 'overloadRangeBonus',
-                        'overloadSpeedFactorBonus', 'overloadECMStrengthBonus', 'overloadECCMStrenghtBonus',
-                        'overloadArmorDamageAmount', 'overloadShieldBonus', 'overloadTrackingModuleStrengthBonus',
-                        'overloadSensorModuleStrengthBonus', 'overloadPainterStrengthBonus',
-                    ):
-                        self.modules.filteredItemBoost(lambda mod: attr in mod.itemModifiedAttributes, attr, value)
-                if warfareBuffID == 2437:  # Sov System Modifier Capacitor Recharge Bonus
-                    self.ship.boostItemAttr("rechargeRate", value)
-                if warfareBuffID == 2438:  # Sov System Modifier Targeting and DScan Range Bonus
-                    self.ship.boostItemAttr("maxTargetRange", value)
-                    self.ship.boostItemAttr("maxDirectionalScanRange", value)
-                if warfareBuffID == 2439:  # Sov System Modifier Scan Resolution Bonus
-                    self.ship.boostItemAttr("scanResolution", value)
-                if warfareBuffID == 2440:  # Sov System Modifier Warp Speed Addition
-                    self.ship.increaseItemAttr('warpSpeedMultiplier', value)
-                if warfareBuffID == 2441:  # Sov System Modifier Shield Booster Bonus
-                    self.modules.filteredItemBoost(
-                        lambda mod: (mod.item.requiresSkill("Shield Operation")
-                                     or mod.item.requiresSkill("Capital Shield Operation")),
-                        "shieldBonus", value, stackingPenalties=True)
-                if warfareBuffID == 2442:  # Sov System Modifier Armor Repairer Bonus
-                    self.modules.filteredItemBoost(
-                        lambda mod: (mod.item.requiresSkill("Repair Systems")
-                                     or mod.item.requiresSkill("Capital Repair Systems")),
-                        "armorDamageAmount", value, stackingPenalties=True)
-                if warfareBuffID == 2464:  # Expedition Burst: Probe Strength
-                    self.modules.filteredChargeBoost(
-                        lambda mod: mod.charge.requiresSkill('Astrometrics'),
-                        'baseSensorStrength', value, stackingPenalties=True)
-                if warfareBuffID == 2465:  # Expedition Burst: Directional Scanner, Hacking and Salvager Range
-                    self.ship.boostItemAttr("maxDirectionalScanRange", value)
-                    self.modules.filteredItemBoost(
-                        lambda mod: mod.item.group.name in ("Data Miners", "Salvager"), "maxRange", value, stackingPenalties=True)
-                if warfareBuffID == 2466:  # Expedition Burst: Maximum Scan Deviation Modifier
-                    self.modules.filteredChargeBoost(
-                        lambda mod: mod.charge.requiresSkill('Astrometrics'),
-                        'baseMaxScanDeviation', value, stackingPenalties=True)
-                if warfareBuffID == 2468:  # Expedition Burst: Virus Coherence
-                    self.modules.filteredItemIncrease(
-                        lambda mod: mod.item.group.name == "Data Miners", "virusCoherence", value)
-                if warfareBuffID == 2474:  # Mining burst charges
-                    self.ship.forceItemAttr("miningScannerUpgrade", value)
-                if warfareBuffID == 2481:  # Expedition Burst: Salvager duration bonus
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Salvaging"), "duration", value)
-                if warfareBuffID == 2516:  # Mining Burst: Mining Crit Chance
-                    self.modules.filteredItemBoost(
-                        lambda mod: mod.item.requiresSkill("Mining") or mod.item.requiresSkill("Ice Harvesting"),
-                        "miningCritChance", value)
-                if warfareBuffID == 2517:  # Mining Burst: Mining Residue Chance Reduction
-                    self.modules.filteredItemBoost(
-                        lambda mod: (
-                                mod.item.requiresSkill("Mining")
-                                or mod.item.requiresSkill("Ice Harvesting")
-                                or mod.item.requiresSkill("Gas Cloud Harvesting")),
-                        "miningWasteProbability", value, stackingPenalties=True)
+            if profileStartTime is not None:
+                recalcProfiler.recordCommandBoost(warfareBuffID, runTime, profileStartTime)
 
             del self.commandBonuses[warfareBuffID]
 
@@ -1124,6 +815,8 @@ class Fit:
                     else:
                         fit.calculateModifiedAttributes(self, type=CalcType.PROJECTED)
 
+        # Stats memoized during calculation are outdated
+        self.__revision = next(revisionCounter)
         pyfalog.debug('Done with fit calculation')
 
     def __runProjectionEffects(self, runTime, targetFit, projectionInfo):
@@ -1225,6 +918,7 @@ class Fit:
 
         return amount
 
+    @fitStat
     def getHardpointsUsed(self, type):
         amount = 0
         for mod in self.modules:
@@ -1233,6 +927,7 @@ class Fit:
 
         return amount
 
+    @fitStat
     def getSlotsUsed(self, type, countDummies=False):
         amount = 0
 
@@ -1283,18 +978,22 @@ class Fit:
             raise ValueError("%d is not a valid value for Hardpoint Enum", type)
 
     @property
+    @fitStat
     def calibrationUsed(self):
         return self.getItemAttrOnlineSum(self.modules, 'upgradeCost')
 
     @property
+    @fitStat
     def pgUsed(self):
         return round(self.getItemAttrOnlineSum(self.modules, "power"), 2)
 
     @property
+    @fitStat
     def cpuUsed(self):
         return round(self.getItemAttrOnlineSum(self.modules, "cpu"), 2)
 
     @property
+    @fitStat
     def droneBandwidthUsed(self):
         amount = 0
         for d in self.drones:
@@ -1303,6 +1002,7 @@ class Fit:
         return amount
 
     @property
+    @fitStat
     def droneBayUsed(self):
         amount = 0
         for d in self.drones:
@@ -1311,6 +1011,7 @@ class Fit:
         return amount
 
     @property
+    @fitStat
     def fighterBayUsed(self):
         amount = 0
         for f in self.fighters:
@@ -1319,6 +1020,7 @@ class Fit:
         return amount
 
     @property
+    @fitStat
     def fighterTubesUsed(self):
         amount = 0
         for f in self.fighters:
@@ -1331,6 +1033,7 @@ class Fit:
         return self.ship.getModifiedItemAttr("fighterTubes")
 
     @property
+    @fitStat
     def cargoBayUsed(self):
         amount = 0
         for c in self.cargo:
@@ -1339,6 +1042,7 @@ class Fit:
         return amount
 
     @property
+    @fitStat
     def activeDrones(self):
         amount = 0
         for d in self.drones:
@@ -1555,6 +1259,7 @@ class Fit:
         return self.__remoteRepMap[spoolOptions]
 
     @property
+    @fitStat
     def hp(self):
         hp = {}
         for (type, attr) in (('shield', 'shieldCapacity'), ('armor', 'armorHP'), ('hull', 'hp')):
@@ -1574,6 +1279,7 @@ class Fit:
         return self.__ehp
 
     @property
+    @fitStat
     def tank(self):
         reps = {
             "passiveShield": self.calculateShieldRecharge(),
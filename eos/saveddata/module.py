@@ -23,6 +23,7 @@ from logbook import Logger
 from sqlalchemy.orm import reconstructor, validates
 
 import eos.db
+from eos.chargeIndex import chargeIndex
 from eos.const import FittingHardpoint, FittingModuleState, FittingSlot
 from eos.effectHandlerHelpers import HandledCharge, HandledItem
 from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, ModifiedAttributeDict
@@ -831,18 +832,15 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, M
         return False
 
     def getValidCharges(self):
-        validCharges = set()
+        chargeGroups = set()
         for i in range(5):
             itemChargeGroup = self.getModifiedItemAttr('chargeGroup' + str(i), None)
             if itemChargeGroup:
-                g = eos.db.getGroup(int(itemChargeGroup), eager="items.attributes")
-                if g is None:
-                    continue
-                for singleItem in g.items:
-                    if singleItem.published and self.isValidCharge(singleItem):
-                        validCharges.add(singleItem)
-
-        return validCharges
+                chargeGroups.add(int(itemChargeGroup))
+        if not chargeGroups:
+            return set()
+        capacity = self.item.attributes['capacity'].value if 'capacity' in self.item.attributes else None
+        return set(chargeIndex.getCharges(tuple(sorted(chargeGroups)), self.getModifiedItemAttr("chargeSize"), capacity))
 
     @staticmethod
     def __calculateHardpoint(item):
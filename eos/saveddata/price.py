@@ -48,6 +48,13 @@ class Price:
         self.time = 0
         self.price = 0
         self.status = PriceStatus.initialized
+        # ID of price snapshot this price comes from, None if it was fetched on demand
+        self.snapshotID = None
+
+    @property
+    def age(self):
+        """Seconds since price was last updated"""
+        return time() - self.time
 
     def isValid(self, validityOverride=None):
         # Always attempt to update prices which were just initialized, and prices
@@ -72,3 +79,12 @@ class Price:
         self.time = time()
         self.price = price
         self.status = status
+
+
+class PriceSnapshot:
+    """Prices for all market types, fetched at once; ID doubles as snapshot version"""
+
+    def __init__(self, time, source, typeCount=0):
+        self.time = time
+        self.source = source
+        self.typeCount = typeCount
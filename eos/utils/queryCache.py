@@ -0,0 +1,179 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import sys
+import threading
+from collections import OrderedDict
+
+from logbook import Logger
+
+import eos.config
+
+
+pyfalog = Logger(__name__)
+
+# Limit of results cached per query function, unless overridden in LIMITS or by
+# eos.config.gamedataCacheLimits
+DEFAULT_LIMIT = 2000
+# Format: {query function name: max amount of cached results}
+LIMITS = {
+    'getItem': 50000,
+    'getAttributeInfo': 10000,
+    'getGroup': 5000,
+    'getCategory': 500,
+    'getMetaGroup': 100,
+    'getMarketGroup': 5000,
+    'getDynamicItem': 5000}
+
+
+def estimateSize(value):
+    """
+    Rough size of cached value in bytes: the object with its instance dictionary,
+    plus the same for elements of containers. Objects referenced by attributes are
+    not followed, as they are mostly shared with other cached results.
+    """
+    size = sys.getsizeof(value)
+    instanceDict = getattr(value, '__dict__', None)
+    if instanceDict is not None:
+        size += sys.getsizeof(instanceDict)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        for element in value:
+            size += sys.getsizeof(element)
+            elementDict = getattr(element, '__dict__', None)
+            if elementDict is not None:
+                size += sys.getsizeof(elementDict)
+    return size
+
+
+class QueryCache:
+    """LRU cache of results of one query function, with usage counters"""
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+        self.lock = threading.Lock()
+        # Format: {cache key: (result, estimated size)}
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return (True, result) if result is cached, (False, None) otherwise"""
+        with self.lock:
+            try:
+                value, _ = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key, value):
+        size = estimateSize(key) + estimateSize(value)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self.entries[key] = (value, size)
+            self.size += size
+            self.__trim()
+
+    def setLimit(self, limit):
+        with self.lock:
+            self.limit = limit
+            self.__trim()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def resetCounters(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __trim(self):
+        while len(self.entries) > self.limit:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def getStats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'limit': self.limit,
+                'size': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hitRate': self.hits / lookups if lookups else None}
+
+
+class QueryCaches:
+    """Registry of caches of all cached gamedata query functions"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Format: {query function name: cache}
+        self.caches = {}
+
+    def register(self, name):
+        limits = getattr(eos.config, 'gamedataCacheLimits', None) or {}
+        limit = limits.get(name, LIMITS.get(name, DEFAULT_LIMIT))
+        with self.lock:
+            cache = self.caches.get(name)
+            if cache is None:
+                cache = self.caches[name] = QueryCache(name, limit)
+        return cache
+
+    def get(self, name):
+        return self.caches.get(name)
+
+    def setLimit(self, name, limit):
+        self.register(name).setLimit(limit)
+
+    def clear(self):
+        for cache in list(self.caches.values()):
+            cache.clear()
+
+    def resetCounters(self):
+        for cache in list(self.caches.values()):
+            cache.resetCounters()
+
+    def getReport(self):
+        """Return {query function name: stats}, see QueryCache.getStats"""
+        return {name: cache.getStats() for name, cache in list(self.caches.items())}
+
+    def logReport(self):
+        for name, stats in sorted(self.getReport().items()):
+            pyfalog.debug(
+                "Gamedata query cache {}: {}/{} entries, ~{} KiB, {} hits, {} misses, {} evictions",
+                name, stats['entries'], stats['limit'], stats['size'] // 1024,
+                stats['hits'], stats['misses'], stats['evictions'])
+
+
+queryCaches = QueryCaches()
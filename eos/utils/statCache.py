@@ -0,0 +1,88 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from collections import defaultdict
+from functools import wraps
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+
+class StatCacheCounters:
+    """Hit and miss counts of memoized fit stats, per stat"""
+
+    def __init__(self):
+        # Format: {stat name: [hits, misses]}
+        self.counts = defaultdict(lambda: [0, 0])
+
+    def hit(self, name):
+        self.counts[name][0] += 1
+
+    def miss(self, name):
+        self.counts[name][1] += 1
+
+    def reset(self):
+        self.counts.clear()
+
+    def getReport(self):
+        """Return {stat name: (hits, misses, hit rate)}"""
+        report = {}
+        for name, (hits, misses) in self.counts.items():
+            report[name] = (hits, misses, hits / (hits + misses))
+        return report
+
+    def logReport(self):
+        for name, (hits, misses, hitRate) in sorted(self.getReport().items()):
+            pyfalog.debug("Fit stat {}: {} hits, {} misses, hit rate {:.1%}", name, hits, misses, hitRate)
+
+
+statCacheCounters = StatCacheCounters()
+
+
+def fitStat(method):
+    """
+    Memoize result of fit method for current revision of the fit, separately for
+    each set of arguments. Fits which are not calculated are not memoized, as
+    attributes stats rely on are in flux.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(fit, *args):
+        revision = fit.revision
+        if revision is None:
+            return method(fit, *args)
+        cache = fit._statCache
+        if fit._statCacheRevision != revision:
+            cache.clear()
+            fit._statCacheRevision = revision
+        key = (name, *args)
+        try:
+            value = cache[key]
+        except KeyError:
+            statCacheCounters.miss(name)
+            value = cache[key] = method(fit, *args)
+        else:
+            statCacheCounters.hit(name)
+        return value
+
+    return wrapper
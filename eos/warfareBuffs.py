@@ -0,0 +1,319 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Table of warfare buffs (command bursts, titan effect generators, environment
+effects and such) and their application to a fit.
+
+Every buff maps to a list of modifiers. Modifier says which holders of the fit it
+applies to (ship, modules or drones, optionally filtered), which attributes it
+changes and how. Operations mirror operationName of buffs in dbuffcollections:
+PostPercent is a boost, ModAdd is an increase, PostAssignment is a force.
+"""
+
+from collections import namedtuple
+
+BOOST = 'boost'
+INCREASE = 'increase'
+FORCE = 'force'
+
+RESIST_DAMAGE_TYPES = ('Em', 'Thermal', 'Kinetic', 'Explosive')
+
+
+class TargetFilter:
+    """
+    Filter of holders a modifier applies to. Filters with a key depend only on
+    holder's items, and their results are shared between buffs of a command boost run.
+    """
+
+    def __init__(self, key, match):
+        self.key = key
+        self.match = match
+
+    def getTargets(self, holders, targetCache):
+        if self.key is not None:
+            targets = targetCache.get(self.key)
+            if targets is not None:
+                return targets
+        targets = []
+        for holder in holders:
+            try:
+                if self.match(holder):
+                    targets.append(holder)
+            # Empty slots and modules without charges are just skipped
+            except AttributeError:
+                pass
+        if self.key is not None:
+            targetCache[self.key] = targets
+        return targets
+
+
+def skillFilter(*skills):
+    return TargetFilter(('skill', skills), lambda holder: any(holder.item.requiresSkill(s) for s in skills))
+
+
+def chargeSkillFilter(*skills):
+    return TargetFilter(('chargeSkill', skills), lambda holder: any(holder.charge.requiresSkill(s) for s in skills))
+
+
+def groupFilter(*groups):
+    return TargetFilter(('group', groups), lambda holder: holder.item.group.name in groups)
+
+
+def attributeFilter(attr):
+    # Modified attributes of a holder can change while boosts are applied, so no key
+    return TargetFilter(None, lambda holder: attr in holder.itemModifiedAttributes)
+
+
+DRONES = skillFilter('Drones')
+
+
+BuffModifier = namedtuple('BuffModifier', ('location', 'filter', 'attrs', 'operation', 'stackingPenalties', 'charge'))
+
+
+def ship(*attrs, operation=BOOST, stackingPenalties=False):
+    return BuffModifier('ship', None, attrs, operation, stackingPenalties, False)
+
+
+def modules(filter, *attrs, operation=BOOST, stackingPenalties=False, charge=False):
+    return BuffModifier('modules', filter, attrs, operation, stackingPenalties, charge)
+
+
+def drones(*attrs, stackingPenalties=False):
+    return BuffModifier('drones', DRONES, attrs, BOOST, stackingPenalties, False)
+
+
+def resists(layer):
+    """Resonance attribute names of all damage types of the tank layer"""
+    return tuple('{}{}DamageResonance'.format(layer, damageType) for damageType in RESIST_DAMAGE_TYPES)
+
+
+def resist(damageType, *layers):
+    """Resonance attribute names of the damage type of passed tank layers, 'hull' being the ship itself"""
+    return tuple(
+        '{}DamageResonance'.format(damageType.lower()) if layer == 'hull' else
+        '{}{}DamageResonance'.format(layer, damageType)
+        for layer in layers)
+
+
+SHIELD_BOOSTING = skillFilter('Shield Operation', 'Shield Emission Systems', 'Capital Shield Emission Systems')
+ARMOR_REPAIRING = skillFilter('Remote Armor Repair Systems', 'Repair Systems', 'Capital Remote Armor Repair Systems')
+HARVESTING = skillFilter('Mining', 'Ice Harvesting', 'Gas Cloud Harvesting')
+EWAR = groupFilter('ECM', 'Sensor Dampener', 'Weapon Disruptor', 'Target Painter')
+
+# Format: {warfare buff ID: (modifier, ...)}
+WARFARE_BUFFS = {
+    # Shield Burst: Shield Harmonizing: Shield Resistance
+    10: (ship(*resists('shield'), stackingPenalties=True),),
+    # Shield Burst: Active Shielding: Repair Duration/Capacitor
+    11: (modules(SHIELD_BOOSTING, 'capacitorNeed', 'duration'),),
+    # Shield Burst: Shield Extension: Shield HP
+    12: (ship('shieldCapacity'),),
+    # Armor Burst: Armor Energizing: Armor Resistance
+    13: (ship(*resists('armor'), stackingPenalties=True),),
+    # Armor Burst: Rapid Repair: Repair Duration/Capacitor
+    14: (modules(ARMOR_REPAIRING, 'capacitorNeed', 'duration'),),
+    # Armor Burst: Armor Reinforcement: Armor HP
+    15: (ship('armorHP'),),
+    # Information Burst: Sensor Optimization: Scan Resolution
+    16: (ship('scanResolution', stackingPenalties=True),),
+    # Information Burst: Electronic Superiority: EWAR Range and Strength
+    17: (
+        modules(EWAR, 'maxRange', 'falloffEffectiveness', stackingPenalties=True),
+        modules(groupFilter('ECM'), *('scan{}StrengthBonus'.format(t) for t in ('Magnetometric', 'Radar', 'Ladar', 'Gravimetric')),
+                stackingPenalties=True),
+        modules(groupFilter('Weapon Disruptor'),
+                'missileVelocityBonus', 'explosionDelayBonus', 'aoeVelocityBonus', 'falloffBonus',
+                'maxRangeBonus', 'aoeCloudSizeBonus', 'trackingSpeedBonus'),
+        modules(groupFilter('Sensor Dampener'), 'maxTargetRangeBonus', 'scanResolutionBonus'),
+        modules(groupFilter('Target Painter'), 'signatureRadiusBonus', stackingPenalties=True)),
+    # Information Burst: Electronic Hardening: Scan Strength
+    18: (ship(*('scan{}Strength'.format(t) for t in ('Gravimetric', 'Radar', 'Ladar', 'Magnetometric')), stackingPenalties=True),),
+    # Information Burst: Electronic Hardening: RSD/RWD Resistance
+    19: (ship('sensorDampenerResistance', 'weaponDisruptionResistance'),),
+    # Skirmish Burst: Evasive Maneuvers: Signature Radius
+    20: (ship('signatureRadius', stackingPenalties=True),),
+    # Skirmish Burst: Interdiction Maneuvers: Tackle Range
+    21: (modules(groupFilter('Stasis Web', 'Warp Scrambler'), 'maxRange', stackingPenalties=True),),
+    # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
+    22: (modules(skillFilter('Afterburner', 'High Speed Maneuvering'), 'speedFactor', stackingPenalties=True),),
+    # Mining Burst: Mining Laser Field Enhancement: Mining Range
+    23: (modules(HARVESTING, 'maxRange', stackingPenalties=True),),
+    # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
+    24: (modules(HARVESTING, 'capacitorNeed', 'duration', stackingPenalties=True),),
+    # Mining Burst: Mining Equipment Preservation: Crystal Volatility
+    25: (modules(skillFilter('Mining'), 'crystalVolatilityChance', stackingPenalties=True, charge=True),),
+    # Information Burst: Sensor Optimization: Targeting Range
+    26: (ship('maxTargetRange', stackingPenalties=True),),
+    # Skirmish Burst: Evasive Maneuvers: Agility
+    60: (ship('agility', stackingPenalties=True),),
+
+    # Titan effects
+
+    # Avatar Effect Generator : Capacitor Recharge bonus
+    39: (ship('rechargeRate', stackingPenalties=True),),
+    # Avatar Effect Generator : Kinetic resistance bonus
+    40: (ship(*resist('Kinetic', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Avatar Effect Generator : EM resistance penalty
+    41: (ship(*resist('Em', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Erebus Effect Generator : Armor HP bonus
+    42: (ship('armorHP'),),
+    # Erebus Effect Generator : Explosive resistance bonus
+    43: (ship(*resist('Explosive', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Erebus Effect Generator : Thermal resistance penalty
+    44: (ship(*resist('Thermal', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Ragnarok Effect Generator : Signature Radius bonus
+    45: (ship('signatureRadius', stackingPenalties=True),),
+    # Ragnarok Effect Generator : Thermal resistance bonus
+    46: (ship(*resist('Thermal', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Ragnarok Effect Generator : Explosive resistance penaly
+    47: (ship(*resist('Explosive', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Leviathan Effect Generator : Shield HP bonus
+    48: (ship('shieldCapacity'),),
+    # Leviathan Effect Generator : EM resistance bonus
+    49: (ship(*resist('Em', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Leviathan Effect Generator : Kinetic resistance penalty
+    50: (ship(*resist('Kinetic', 'armor', 'shield', 'hull'), stackingPenalties=True),),
+    # Avatar Effect Generator : Velocity penalty
+    51: (ship('maxVelocity', stackingPenalties=True),),
+    # Erebus Effect Generator : Shield RR penalty
+    52: (modules(skillFilter('Shield Emission Systems'), 'shieldBonus', stackingPenalties=True),),
+    # Leviathan Effect Generator : Armor RR penalty
+    53: (modules(skillFilter('Remote Armor Repair Systems'), 'armorDamageAmount', stackingPenalties=True),),
+    # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
+    54: (modules(groupFilter('Energy Weapon', 'Hybrid Weapon'), 'maxRange', stackingPenalties=True),),
+
+    # Localized environment effects
+
+    # AOE_Beacon_bioluminescence_cloud
+    79: (ship('signatureRadius', stackingPenalties=True), drones('signatureRadius', stackingPenalties=True)),
+    # AOE_Beacon_caustic_cloud_inertia
+    80: (ship('agility', stackingPenalties=True),),
+    # AOE_Beacon_caustic_cloud_velocity
+    81: (ship('maxVelocity', stackingPenalties=True),),
+    # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
+    88: (modules(skillFilter('Shield Operation'), 'shieldBonus', stackingPenalties=True),),
+    # AOE_Beacon_filament_cloud_shield_booster_duration
+    89: (modules(skillFilter('Shield Operation'), 'duration', stackingPenalties=True),),
+
+    # Abyssal Weather Effects
+
+    # Weather_electric_storm_EM_resistance_penalty
+    90: (ship(*resist('Em', 'shield', 'armor', 'hull')), drones(*resist('Em', 'shield', 'armor', 'hull'))),
+    # Weather_electric_storm_capacitor_recharge_bonus
+    92: (ship('rechargeRate', stackingPenalties=True),),
+    # Weather_xenon_gas_explosive_resistance_penalty
+    93: (ship(*resist('Explosive', 'shield', 'armor', 'hull')), drones(*resist('Explosive', 'shield', 'armor', 'hull'))),
+    # Weather_xenon_gas_shield_hp_bonus
+    94: (ship('shieldCapacity'), drones('shieldCapacity')),
+    # Weather_infernal_thermal_resistance_penalty
+    95: (ship(*resist('Thermal', 'shield', 'armor', 'hull')), drones(*resist('Thermal', 'shield', 'armor', 'hull'))),
+    # Weather_infernal_armor_hp_bonus
+    96: (ship('armorHP'), drones('armorHP')),
+    # Weather_darkness_turret_range_penalty
+    97: (modules(skillFilter('Gunnery'), 'maxRange', 'falloff', stackingPenalties=True),
+         drones('maxRange', 'falloff', stackingPenalties=True)),
+    # Weather_darkness_velocity_bonus
+    98: (ship('maxVelocity'), drones('maxVelocity')),
+    # Weather_caustic_toxin_kinetic_resistance_penalty
+    99: (ship(*resist('Kinetic', 'shield', 'armor', 'hull')), drones(*resist('Kinetic', 'shield', 'armor', 'hull'))),
+    # Weather_caustic_toxin_scan_resolution_bonus
+    100: (ship('scanResolution', stackingPenalties=True),),
+
+    # Insurgency Suppression Bonus: Interdiction Range
+    2405: (modules(skillFilter('Navigation'), 'maxRange', stackingPenalties=True),
+           modules(groupFilter('Stasis Web'), 'maxRange', stackingPenalties=True)),
+
+    # Sov upgrades buffs
+
+    # Sov System Modifier Shield HP Bonus
+    2433: (ship('shieldCapacity'),),
+    # Sov System Modifier Capacitor Capacity Bonus
+    2434: (ship('capacitorCapacity'),),
+    # Sov System Modifier Armor HP Bonus
+    2435: (ship('armorHP'),),
+    # Sov System Modifier Overheating Bonus - Includes Ewar
+    2436: tuple(modules(attributeFilter(attr), attr) for attr in (
+        'overloadDurationBonus', 'overloadRofBonus', 'overloadSelfDurationBonus',
+        'overloadHardeningBonus', 'overloadDamageModifier', 'overloadRangeBonus',
+        'overloadSpeedFactorBonus', 'overloadECMStrengthBonus', 'overloadECCMStrenghtBonus',
+        'overloadArmorDamageAmount', 'overloadShieldBonus', 'overloadTrackingModuleStrengthBonus',
+        'overloadSensorModuleStrengthBonus', 'overloadPainterStrengthBonus')),
+    # Sov System Modifier Capacitor Recharge Bonus
+    2437: (ship('rechargeRate'),),
+    # Sov System Modifier Targeting and DScan Range Bonus
+    2438: (ship('maxTargetRange', 'maxDirectionalScanRange'),),
+    # Sov System Modifier Scan Resolution Bonus
+    2439: (ship('scanResolution'),),
+    # Sov System Modifier Warp Speed Addition
+    2440: (ship('warpSpeedMultiplier', operation=INCREASE),),
+    # Sov System Modifier Shield Booster Bonus
+    2441: (modules(skillFilter('Shield Operation', 'Capital Shield Operation'), 'shieldBonus', stackingPenalties=True),),
+    # Sov System Modifier Armor Repairer Bonus
+    2442: (modules(skillFilter('Repair Systems', 'Capital Repair Systems'), 'armorDamageAmount', stackingPenalties=True),),
+
+    # Expedition Burst: Probe Strength
+    2464: (modules(chargeSkillFilter('Astrometrics'), 'baseSensorStrength', stackingPenalties=True, charge=True),),
+    # Expedition Burst: Directional Scanner, Hacking and Salvager Range
+    2465: (ship('maxDirectionalScanRange'),
+           modules(groupFilter('Data Miners', 'Salvager'), 'maxRange', stackingPenalties=True)),
+    # Expedition Burst: Maximum Scan Deviation Modifier
+    2466: (modules(chargeSkillFilter('Astrometrics'), 'baseMaxScanDeviation', stackingPenalties=True, charge=True),),
+    # Expedition Burst: Virus Coherence
+    2468: (modules(groupFilter('Data Miners'), 'virusCoherence', operation=INCREASE),),
+    # Mining burst charges
+    2474: (ship('miningScannerUpgrade', operation=FORCE),),
+    # Expedition Burst: Salvager duration bonus
+    2481: (modules(skillFilter('Salvaging'), 'duration'),),
+    # Mining Burst: Mining Crit Chance
+    2516: (modules(skillFilter('Mining', 'Ice Harvesting'), 'miningCritChance'),),
+    # Mining Burst: Mining Residue Chance Reduction
+    2517: (modules(HARVESTING, 'miningWasteProbability', stackingPenalties=True),),
+}
+
+
+def _applyModifier(holder, modifier, value):
+    # E.g. boostItemAttr or increaseChargeAttr
+    method = getattr(holder, '{}{}Attr'.format(modifier.operation, 'Charge' if modifier.charge else 'Item'))
+    for attr in modifier.attrs:
+        if modifier.stackingPenalties:
+            method(attr, value, stackingPenalties=True)
+        else:
+            method(attr, value)
+
+
+def applyWarfareBuff(fit, warfareBuffID, value, targetCache):
+    """
+    Apply buff to fit. Source of the buff has to be registered on the fit already.
+    Pass the same target cache for all buffs applied to the fit in one go, so that
+    filters shared by buffs are evaluated once.
+    """
+    modifiers = WARFARE_BUFFS.get(warfareBuffID)
+    if modifiers is None:
+        return
+    for modifier in modifiers:
+        if modifier.location == 'ship':
+            _applyModifier(fit.ship, modifier, value)
+            continue
+        holders = fit.modules if modifier.location == 'modules' else fit.drones
+        for holder in modifier.filter.getTargets(holders, targetCache.setdefault(modifier.location, {})):
+            try:
+                _applyModifier(holder, modifier, value)
+            except AttributeError:
+                pass
@@ -31,6 +31,8 @@ class ItemView(Display):
         marketBrowser.Bind(wx.EVT_TREE_SEL_CHANGED, self.treeSelectionChanged)
 
         self.unfilteredStore = set()
+        # If items in store are already in market browser order
+        self.unfilteredStoreSorted = False
         self.filteredStore = set()
         self.sMkt = marketBrowser.sMkt
         self.sFit = Fit.getInstance()
@@ -97,6 +99,7 @@ class ItemView(Display):
         if sel.IsOk():
             # Get data field of the selected item (which is a marketGroup ID if anything was selected)
             seldata = self.marketView.GetItemData(sel)
+            presorted = False
             if seldata == RECENTLY_USED_MODULES:
                 items = self.sMkt.getRecentlyUsed()
             elif seldata == CHARGES_FOR_FIT:
@@ -105,18 +108,16 @@ class ItemView(Display):
                 # If market group treeview item doesn't have children (other market groups or dummies),
                 # then it should have items in it and we want to request them
                 if self.marketView.ItemHasChildren(sel) is False:
-                    sMkt = self.sMkt
-                    # Get current market group
-                    mg = sMkt.getMarketGroup(seldata, eager=("items", "items.metaGroup"))
-                    # Get all its items
-                    items = sMkt.getItemsByMarketGroup(mg)
+                    # Get all items of current market group, already sorted
+                    items = list(self.sMkt.getMarketTreeNode(seldata).items)
+                    presorted = True
                 else:
                     items = set()
             else:
                 items = set()
 
             # Fill store
-            self.updateItemStore(items)
+            self.updateItemStore(items, presorted=presorted)
 
             # Set toggle buttons / use search mode flag if recently used modules category is selected (in order to have all modules listed and not filtered)
             if seldata == RECENTLY_USED_MODULES:
@@ -167,8 +168,9 @@ class ItemView(Display):
         self.updateItemStore(items)
         self.filterItemStore()
 
-    def updateItemStore(self, items):
+    def updateItemStore(self, items, presorted=False):
         self.unfilteredStore = items
+        self.unfilteredStoreSorted = presorted
 
     def filterItemStore(self):
         filteredItems = self.filterItems()
@@ -269,7 +271,7 @@ class ItemView(Display):
             # Clear selection
             self.unselectAll()
             # Perform sorting, using item's meta levels besides other stuff
-            if self.marketBrowser.mode != 'recent':
+            if self.marketBrowser.mode != 'recent' and not self.unfilteredStoreSorted:
                 items.sort(key=self.sMkt.itemSort)
         # Mark current item list as active
         self.active = items
@@ -279,7 +281,7 @@ class ItemView(Display):
     def refresh(self, items):
         if len(items) > 1:
             # Re-sort stuff
-            if self.marketBrowser.mode != 'recent':
+            if self.marketBrowser.mode != 'recent' and not self.unfilteredStoreSorted:
                 items.sort(key=self.sMkt.itemSort)
         for i, item in enumerate(items[:9]):
             # set shortcut info for first 9 modules
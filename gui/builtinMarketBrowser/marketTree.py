@@ -24,9 +24,12 @@ class MarketTree(wx.TreeCtrl):
 
         # Form market tree root
         sMkt = self.sMkt
-        for mktGrp in sMkt.getMarketRoot():
-            iconId = self.addImage(sMkt.getIconByMarketGroup(mktGrp))
-            childId = self.AppendItem(self.root, mktGrp.name, iconId, data=mktGrp.ID)
+        for mgID in sMkt.ROOT_MARKET_GROUPS:
+            node = sMkt.getMarketTreeNode(mgID)
+            if node is None:
+                continue
+            iconId = self.addImage(node.icon)
+            childId = self.AppendItem(self.root, node.name, iconId, data=node.ID)
             # All market groups which were never expanded are dummies, here we assume
             # that all root market groups are expandable
             self.AppendItem(childId, "dummy")
@@ -58,23 +61,22 @@ class MarketTree(wx.TreeCtrl):
             self.Delete(child)
             # And add real market group contents
             sMkt = self.sMkt
-            currentMktGrp = sMkt.getMarketGroup(self.GetItemData(root), eager="children")
+            currentNode = sMkt.getMarketTreeNode(self.GetItemData(root))
 
-            for childMktGrp in sMkt.getMarketGroupChildren(currentMktGrp):
-                # If market should have items but it doesn't, do not show it
-                if sMkt.marketGroupValidityCheck(childMktGrp) is False:
-                    continue
-                icon = sMkt.getIconByMarketGroup(childMktGrp)
-                iconId = -1 if icon is None else self.addImage(icon)
+            # Node lists only valid children, market groups which should have items
+            # but don't are not shown
+            for childID in currentNode.childIDs:
+                childNode = sMkt.getMarketTreeNode(childID)
+                iconId = -1 if childNode.icon is None else self.addImage(childNode.icon)
                 try:
-                    childId = self.AppendItem(root, childMktGrp.name, iconId, data=childMktGrp.ID)
+                    childId = self.AppendItem(root, childNode.name, iconId, data=childNode.ID)
                 except (KeyboardInterrupt, SystemExit):
                     raise
                 except Exception as e:
                     pyfalog.debug("Error appending item.")
                     pyfalog.debug(e)
                     continue
-                if sMkt.marketGroupHasTypesCheck(childMktGrp) is False:
+                if not childNode.hasItems:
                     self.AppendItem(childId, "dummy")
 
             self.SortChildren(root)
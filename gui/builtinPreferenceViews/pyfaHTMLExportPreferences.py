@@ -20,6 +20,8 @@ class PFHTMLExportPref(PreferenceView):
         self.desc = _t("HTML Export (File > Export HTML) allows you to export your entire fitting "
                        "database into an HTML file at the specified location. This file can be "
                        "used to easily open your fits in a web-based fitting program")
+        self.desc2 = _t("Export fittings automatically every time a fit is changed. Only changed "
+                        "fits are rendered again, rest of the file is reused from previous export")
         self.desc4 = _t("Export Fittings in a minimal HTML Version, just containing the fittings links "
                         "without any visual styling")
         self.mainFrame = gui.mainFrame.MainFrame.getInstance()
@@ -54,6 +56,16 @@ class PFHTMLExportPref(PreferenceView):
         self.fileSelectButton.Bind(wx.EVT_BUTTON, self.selectHTMLExportFilePath)
         mainSizer.Add(self.fileSelectButton, 0, wx.ALL, 5)
 
+        self.stDesc2 = wx.StaticText(panel, wx.ID_ANY, self.desc2, wx.DefaultPosition, wx.DefaultSize, 0)
+        self.stDesc2.Wrap(dlgWidth - 50)
+        mainSizer.Add(self.stDesc2, 0, wx.ALL, 5)
+
+        self.exportEnabled = wx.CheckBox(panel, wx.ID_ANY, _t("Enable automatic export"), wx.DefaultPosition,
+                                         wx.DefaultSize, 0)
+        self.exportEnabled.SetValue(self.HTMLExportSettings.getEnabled())
+        self.exportEnabled.Bind(wx.EVT_CHECKBOX, self.OnEnabledChange)
+        mainSizer.Add(self.exportEnabled, 0, wx.ALL | wx.EXPAND, 5)
+
         self.stDesc4 = wx.StaticText(panel, wx.ID_ANY, self.desc4, wx.DefaultPosition, wx.DefaultSize, 0)
         self.stDesc4.Wrap(dlgWidth - 50)
         mainSizer.Add(self.stDesc4, 0, wx.ALL, 5)
@@ -79,6 +91,9 @@ class PFHTMLExportPref(PreferenceView):
             self.dirtySettings = True
             self.setPathLinkCtrlValues(self.HTMLExportSettings.getPath())
 
+    def OnEnabledChange(self, event):
+        self.HTMLExportSettings.setEnabled(self.exportEnabled.GetValue())
+
     def OnMinimalEnabledChange(self, event):
         self.HTMLExportSettings.setMinimalEnabled(self.exportMinimal.GetValue())
 
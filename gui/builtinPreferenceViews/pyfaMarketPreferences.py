@@ -1,5 +1,6 @@
 # noinspection PyPackageRequirements
 import wx
+from logbook import Logger
 from wx.lib.intctrl import IntCtrl
 
 from gui.preferenceView import PreferenceView
@@ -10,8 +11,10 @@ import gui.globalEvents as GE
 from service.settings import MarketPriceSettings
 from service.fit import Fit
 from service.price import Price
+from service.priceSnapshot import PriceSnapshot
 
 _t = wx.GetTranslation
+pyfalog = Logger(__name__)
 
 
 class PFMarketPref(PreferenceView):
@@ -23,6 +26,7 @@ class PFMarketPref(PreferenceView):
         self.title = _t("Market & Prices")
         self.mainFrame = gui.mainFrame.MainFrame.getInstance()
         self.sFit = Fit.getInstance()
+        self.snapshotWildcard = _t("Price snapshot") + " (*.json)|*.json"
 
         helpCursor = wx.Cursor(wx.CURSOR_QUESTION_ARROW)
         mainSizer = wx.BoxSizer(wx.VERTICAL)
@@ -73,6 +77,45 @@ class PFMarketPref(PreferenceView):
         self.chPriceSystem.SetStringSelection(self.sFit.serviceFittingOptions["priceSystem"])
         self.chPriceSystem.Bind(wx.EVT_CHOICE, self.onPriceSelection)
 
+        snapshotSizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.stSnapshotInterval = wx.StaticText(panel, wx.ID_ANY, _t("Price Snapshot Interval (hours):"), wx.DefaultPosition, wx.DefaultSize, 0)
+        self.stSnapshotInterval.Wrap(-1)
+        if "wxGTK" not in wx.PlatformInfo:
+            self.stSnapshotInterval.SetCursor(helpCursor)
+        self.stSnapshotInterval.SetToolTip(wx.ToolTip(
+                _t('Fetch prices of all market items in background every this many hours, instead of fetching them when needed. '
+                   '0 disables snapshots.')))
+        snapshotSizer.Add(self.stSnapshotInterval, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        self.intSnapshotInterval = IntCtrl(panel, min=0, max=24 * 7, limited=True)
+        snapshotSizer.Add(self.intSnapshotInterval, 0, wx.ALL, 5)
+        mainSizer.Add(snapshotSizer, 0, wx.EXPAND | wx.TOP | wx.RIGHT, 10)
+        self.intSnapshotInterval.SetValue(self.priceSettings.get("snapshotInterval"))
+        self.intSnapshotInterval.Bind(wx.lib.intctrl.EVT_INT, self.onSnapshotIntervalChange)
+
+        snapshotFileSizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.stSnapshotPath = wx.StaticText(panel, wx.ID_ANY, _t("Price Snapshot File:"), wx.DefaultPosition, wx.DefaultSize, 0)
+        self.stSnapshotPath.Wrap(-1)
+        if "wxGTK" not in wx.PlatformInfo:
+            self.stSnapshotPath.SetCursor(helpCursor)
+        self.stSnapshotPath.SetToolTip(wx.ToolTip(
+                _t('Load prices from snapshot file exported by another pyfa (e.g. on a shared drive) whenever it gets updated, '
+                   'instead of fetching them. Leave empty to fetch prices.')))
+        snapshotFileSizer.Add(self.stSnapshotPath, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        self.fpSnapshotPath = wx.FilePickerCtrl(panel, wx.ID_ANY, self.priceSettings.get("snapshotPath"), _t("Select Price Snapshot File"),
+                                                self.snapshotWildcard, style=wx.FLP_OPEN | wx.FLP_FILE_MUST_EXIST | wx.FLP_USE_TEXTCTRL)
+        snapshotFileSizer.Add(self.fpSnapshotPath, 1, wx.ALL | wx.EXPAND, 5)
+        mainSizer.Add(snapshotFileSizer, 0, wx.EXPAND | wx.TOP | wx.RIGHT, 10)
+        self.fpSnapshotPath.Bind(wx.EVT_FILEPICKER_CHANGED, self.onSnapshotPathChange)
+
+        snapshotBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.btnExportSnapshot = wx.Button(panel, wx.ID_ANY, _t("Export Price Snapshot..."), wx.DefaultPosition, wx.DefaultSize, 0)
+        snapshotBtnSizer.Add(self.btnExportSnapshot, 0, wx.ALL, 5)
+        self.btnExportSnapshot.Bind(wx.EVT_BUTTON, self.onExportSnapshot)
+        self.btnImportSnapshot = wx.Button(panel, wx.ID_ANY, _t("Import Price Snapshot..."), wx.DefaultPosition, wx.DefaultSize, 0)
+        snapshotBtnSizer.Add(self.btnImportSnapshot, 0, wx.ALL, 5)
+        self.btnImportSnapshot.Bind(wx.EVT_BUTTON, self.onImportSnapshot)
+        mainSizer.Add(snapshotBtnSizer, 0, wx.EXPAND | wx.RIGHT, 10)
+
         self.tbTotalPriceBox = wx.StaticBoxSizer(wx.VERTICAL, panel, _t("Total Price Includes"))
         self.tbTotalPriceDrones = wx.CheckBox(panel, -1, _t("Drones"), wx.DefaultPosition, wx.DefaultSize, 1)
         self.tbTotalPriceDrones.SetValue(self.priceSettings.get("drones"))
@@ -143,6 +186,62 @@ class PFMarketPref(PreferenceView):
         source = self.chPriceSource.GetString(self.chPriceSource.GetSelection())
         self.sFit.serviceFittingOptions["priceSource"] = source
 
+    def onSnapshotIntervalChange(self, event):
+        self.priceSettings.set('snapshotInterval', self.intSnapshotInterval.GetValue())
+        if self.priceSettings.get('snapshotInterval'):
+            PriceSnapshot.getInstance().startScheduler()
+        event.Skip()
+
+    def onSnapshotPathChange(self, event):
+        self.priceSettings.set('snapshotPath', self.fpSnapshotPath.GetPath())
+        if self.priceSettings.get('snapshotPath'):
+            PriceSnapshot.getInstance().startScheduler()
+        event.Skip()
+
+    def onExportSnapshot(self, event):
+        with wx.FileDialog(
+                self.mainFrame,
+                _t("Export Price Snapshot As..."),
+                wildcard=self.snapshotWildcard,
+                defaultFile="prices.json",
+                style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
+        ) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            path = dlg.GetPath()
+        try:
+            exported = PriceSnapshot.exportFile(path)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to export price snapshot to {}: {}", path, e)
+            wx.MessageBox("{}".format(e), _t("Error"), wx.OK | wx.ICON_ERROR)
+            return
+        if not exported:
+            wx.MessageBox(_t("There is no price snapshot to export yet."), _t("Export Price Snapshot"), wx.OK | wx.ICON_INFORMATION)
+
+    def onImportSnapshot(self, event):
+        with wx.FileDialog(
+                self.mainFrame,
+                _t("Import Price Snapshot"),
+                wildcard=self.snapshotWildcard,
+                style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+        ) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            path = dlg.GetPath()
+        try:
+            # Explicit import replaces prices even if we have a newer snapshot
+            PriceSnapshot.importFile(path, force=True)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to import price snapshot from {}: {}", path, e)
+            wx.MessageBox("{}".format(e), _t("Error"), wx.OK | wx.ICON_ERROR)
+            return
+        fitID = self.mainFrame.getActiveFit()
+        wx.PostEvent(self.mainFrame, GE.FitChanged(fitIDs=(fitID,)))
+
     def OnTotalPriceDroneChange(self, event):
         self.priceSettings.set('drones', event.GetInt())
         fitID = self.mainFrame.getActiveFit()
@@ -29,9 +29,13 @@ from service.market import Market
 
 _t = wx.GetTranslation
 
+# EM, thermal, kinetic and explosive bombs
+BOMB_IDS = (27920, 27916, 27912, 27918)
+
 
 class BombingViewFull(StatsView):
     name = "bombingViewFull"
+    expensive = True
 
     def __init__(self, parent):
         StatsView.__init__(self)
@@ -87,16 +91,19 @@ class BombingViewFull(StatsView):
                 setattr(self, "labelDamagetypeCovertlevel%s%s" % (damageType.capitalize(), covertLevel), label)
                 sizerBombing.Add(label, 0, wx.ALIGN_CENTER)
 
+    def precalculate(self, fit):
+        # Bomb items have to be loaded from game database on first refresh
+        mkt = Market.getInstance()
+        for bombID in BOMB_IDS:
+            mkt.getItem(bombID)
+
     def refreshPanel(self, fit):
         # If we did anything interesting, we'd update our labels to reflect the new fit's stats here
         if fit is None:
             return
 
         mkt = Market.getInstance()
-        emBomb = mkt.getItem(27920)
-        thermalBomb = mkt.getItem(27916)
-        kineticBomb = mkt.getItem(27912)
-        explosiveBomb = mkt.getItem(27918)
+        emBomb, thermalBomb, kineticBomb, explosiveBomb = (mkt.getItem(bombID) for bombID in BOMB_IDS)
         environementBombDamageModifier = 1.0
 
         # list all environmental effects affecting bomb damage
@@ -28,6 +28,7 @@ _t = wx.GetTranslation
 
 class CapacitorViewFull(StatsView):
     name = "capacitorViewFull"
+    expensive = True
 
     def __init__(self, parent):
         StatsView.__init__(self)
@@ -105,6 +106,10 @@ class CapacitorViewFull(StatsView):
         setattr(self, "label%sCapacitorResist" % panel.capitalize(), lbl)
         chargeSizer.Add(lbl, 0, wx.ALIGN_CENTER)
 
+    def precalculate(self, fit):
+        # Runs capacitor simulation, result is cached on fit
+        fit.capState
+
     def refreshPanel(self, fit):
         # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
         stats = (
@@ -19,6 +19,7 @@
 
 # noinspection PyPackageRequirements
 import wx
+from eos.gamedata import Item
 from gui.statsView import StatsView
 from gui.bitmap_loader import BitmapLoader
 from gui.utils.numberFormatter import formatAmount
@@ -95,6 +96,7 @@ class PriceViewMinimal(StatsView):
         implant_price = 0
 
         if fit:
+            Item.preloadPrices(Fit.fitItemIter(fit))
             ship_price = fit.ship.item.price.price
 
             if fit.modules:
@@ -32,6 +32,7 @@ _t = wx.GetTranslation
 
 class RechargeViewFull(StatsView):
     name = "rechargeViewFull"
+    expensive = True
 
     def __init__(self, parent):
         StatsView.__init__(self)
@@ -109,6 +110,12 @@ class RechargeViewFull(StatsView):
 
         contentPanel.Layout()
 
+    def precalculate(self, fit):
+        if self.effective:
+            fit.effectiveSustainableTank
+        else:
+            fit.sustainableTank
+
     def refreshPanel(self, fit):
         # If we did anything interesting, we'd update our labels to reflect the new fit's stats here
         unit = " EHP/s" if self.effective else " HP/s"
@@ -814,6 +814,11 @@ class APIView(wx.Panel):
 
         pmainSizer.Add(fgSizerInput, 0, wx.EXPAND, 5)
 
+        self.fetchAllButton = wx.Button(self, wx.ID_ANY, _t("Get Skills of All Characters"), wx.DefaultPosition, wx.DefaultSize, 0)
+        self.fetchAllButton.SetToolTip(_t("Update skills of every character linked to an EVE character"))
+        self.fetchAllButton.Bind(wx.EVT_BUTTON, self.fetchAllSkills)
+        pmainSizer.Add(self.fetchAllButton, 0, wx.LEFT | wx.RIGHT | wx.ALIGN_RIGHT, 10)
+
         pmainSizer.AddStretchSpacer()
 
         self.m_staticline1 = wx.StaticLine(self, wx.ID_ANY, wx.DefaultPosition, wx.DefaultSize, wx.LI_HORIZONTAL)
@@ -858,6 +863,10 @@ class APIView(wx.Panel):
         char = self.charEditor.entityEditor.getActiveEntity()
         sChar.apiFetch(char.ID, APIView.fetchCallback)
 
+    def fetchAllSkills(self, evt):
+        sChar = Character.getInstance()
+        sChar.apiFetchAll(APIView.fetchAllCallback)
+
     def addCharacter(self, event):
         sEsi = Esi.getInstance()
         sEsi.login()
@@ -888,6 +897,8 @@ class APIView(wx.Panel):
 
         ssoChars = sEsi.getSsoCharacters()
 
+        self.fetchAllButton.Enable(len(ssoChars) > 0)
+
         self.charChoice.Clear()
 
         noneID = self.charChoice.Append(_t("None"), None)
@@ -931,6 +942,19 @@ class APIView(wx.Panel):
             wx.MessageBox(
                 _t("Successfully fetched skills"), _t("Success"), wx.ICON_INFORMATION | wx.STAY_ON_TOP)
 
+    @staticmethod
+    def fetchAllCallback(e=None):
+        # Either exception info if the whole sync failed, or {SSO character name: exception}
+        if isinstance(e, tuple):
+            pyfalog.warn("Error fetching skill information for all characters")
+            SkillFetchExceptionHandler(e)
+        elif e:
+            wx.MessageBox(
+                _t("Failed to fetch skills of:") + "\n" + "\n".join(sorted(e)), _t("Error"), wx.ICON_ERROR | wx.STAY_ON_TOP)
+        else:
+            wx.MessageBox(
+                _t("Successfully fetched skills"), _t("Success"), wx.ICON_INFORMATION | wx.STAY_ON_TOP)
+
 
 class SecStatusDialog(wx.Dialog):
 
@@ -26,6 +26,7 @@ import wx
 from logbook import Logger
 
 import eos.db
+from eos.recalcProfiler import recalcProfiler
 from gui.auxWindow import AuxiliaryFrame
 from gui.builtinShipBrowser.events import FitSelected
 
@@ -39,7 +40,7 @@ class DevTools(AuxiliaryFrame):
     def __init__(self, parent):
         super().__init__(
             parent, id=wx.ID_ANY, title="Development Tools", resizeable=True,
-            size=wx.Size(400, 320) if "wxGTK" in wx.PlatformInfo else wx.Size(400, 240))
+            size=wx.Size(400, 360) if "wxGTK" in wx.PlatformInfo else wx.Size(400, 280))
         self.mainFrame = parent
         self.block = False
         self.SetSizeHints(wx.DefaultSize, wx.DefaultSize)
@@ -68,6 +69,11 @@ class DevTools(AuxiliaryFrame):
 
         self.cmdPrint.Bind(wx.EVT_BUTTON, self.cmd_print)
 
+        self.recalcProfile = wx.ToggleButton(self, wx.ID_ANY, "Profile Recalcs", wx.DefaultPosition, wx.DefaultSize, 0)
+        mainSizer.Add(self.recalcProfile, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 5)
+
+        self.recalcProfile.Bind(wx.EVT_TOGGLEBUTTON, self.recalc_profile)
+
         self.SetSizer(mainSizer)
 
         self.Layout()
@@ -96,6 +102,16 @@ class DevTools(AuxiliaryFrame):
         for x in self.mainFrame.command.GetCommands():
             print("{}{} {}".format("==> " if x == self.mainFrame.command.GetCurrentCommand() else "", x.GetName(), x))
 
+    def recalc_profile(self, evt):
+        if self.recalcProfile.GetValue():
+            recalcProfiler.reset()
+            recalcProfiler.enable()
+            return
+        recalcProfiler.disable()
+        print("=" * 20)
+        for line in recalcProfiler.summary():
+            print(line)
+
     def gc_collect(self, evt):
         print(gc.collect())
         print(gc.get_debug())
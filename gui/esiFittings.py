@@ -6,12 +6,14 @@ import wx
 from logbook import Logger
 
 import config
+import eos.db
 import gui.globalEvents as GE
 from eos.db import getItem
 from eos.saveddata.cargo import Cargo
 import gui.mainFrame
 from gui.auxWindow import AuxiliaryFrame
 from gui.display import Display
+from gui.utils.progressHelper import ProgressHelper
 from gui.characterEditor import APIView
 from service.character import Character
 from service.esi import Esi
@@ -191,40 +193,64 @@ class EveFittings(AuxiliaryFrame):
         if activeChar is None:
             return
         charName = sEsi.getSsoCharacter(activeChar).characterName
-        anyDeleted = False
+        fittingIDs = [fit['fitting_id'] for fit in self.fittings or () if fit['fitting_id'] not in sEsi.fittings_deleted]
+        if not fittingIDs:
+            return
         with wx.MessageDialog(
                 self, "Do you really want to delete all fits from %s in EVE?"%(charName),
                 "Confirm Delete", wx.YES | wx.NO | wx.ICON_QUESTION
                 ) as dlg:
             if dlg.ShowModal() == wx.ID_YES:
-                try:
-                    try:
-                        for fit in self.fittings:
-                            sEsi.delFitting(activeChar, fit['fitting_id'])
-                            anyDeleted = True
-                    except APIException as ex:
-                        pyfalog.error(ex)
-                        if anyDeleted:
-                            msg = "Some fits were not deleted: ESI error {} received - {}".format(ex.status_code,
-                                                                                          ex.response["error"])
-                        else:
-                            msg = "Failed to delete fits: ESI error {} received - {}".format(ex.status_code,
-                                                                                          ex.response["error"])
-                        pyfalog.error(msg)
-                        self.statusbar.SetStatusText(msg)
-                        try:
-                            ESIExceptionHandler(ex)
-                        except:
-                            # don't need to do anything - we should already have error code in the status
-                            pass
-                except requests.exceptions.ConnectionError:
-                    msg = "Connection error, please check your internet connection"
-                    pyfalog.error(msg)
-                    self.statusbar.SetStatusText(msg)
+                progress = ProgressHelper(
+                    message=_t("Deleting {} fits of {}").format(len(fittingIDs), charName),
+                    maximum=len(fittingIDs),
+                    callback=self.deleteAllFittingsDone,
+                    deferCallback=True)
+                call = (sEsi.delFittingsThreaded, [[(activeChar, fittingID) for fittingID in fittingIDs], progress], {})
+                self.mainFrame.handleProgress(
+                    title=_t("Deleting fits"),
+                    style=wx.PD_CAN_ABORT | wx.PD_SMOOTH | wx.PD_ELAPSED_TIME | wx.PD_APP_MODAL | wx.PD_AUTO_HIDE,
+                    call=call,
+                    progress=progress)
+
+    def deleteAllFittingsDone(self, results=None, error=None):
+        # Tokens might have been refreshed
+        eos.db.commit()
+        Esi.getInstance().applyDeletedFittings(results)
+        # Callback is deferred until deletion stops if user cancelled it, frame might be gone by then
+        if not self:
+            return
+        failed = [r for r in results or () if r is not None and r.error is not None]
+        # Jobs skipped after user cancelled deletion have no result
+        skipped = [r for r in results or () if r is None]
+        if error is not None:
+            msg = "Failed to delete fits: {}".format(error)
+        elif failed:
+            ex = failed[0].error
+            if isinstance(ex, APIException):
+                msg = "{} fits were not deleted: ESI error {} received - {}".format(
+                    len(failed), ex.status_code, ex.response.get("error"))
+            elif isinstance(ex, requests.exceptions.ConnectionError):
+                msg = "Connection error, please check your internet connection"
+            else:
+                msg = "{} fits were not deleted: {}".format(len(failed), ex)
+        elif skipped:
+            msg = "Deletion cancelled, {} of {} fits deleted".format(len(results) - len(skipped), len(results))
+        else:
+            msg = ""
+        if error is not None or failed:
+            pyfalog.error(msg)
+        self.statusbar.SetStatusText(msg)
 
         # repopulate the fitting list
         self.fitTree.populateSkillTree(self.fittings)
         self.fitView.update([])
+        if failed and isinstance(failed[0].error, APIException):
+            try:
+                ESIExceptionHandler(failed[0].error)
+            except:
+                # don't need to do anything - we should already have error code in the status
+                pass
 
 
 class ESIExceptionHandler:
@@ -300,6 +326,9 @@ class ExportToEve(AuxiliaryFrame):
         self.exportBoostersCb.Bind(wx.EVT_CHECKBOX, self.OnBoostersExportChange)
         mainSizer.Add(self.exportBoostersCb, 0, 0, 5)
 
+        self.exportAllCharsCb = wx.CheckBox(self, wx.ID_ANY, _t('Export to All Characters'), wx.DefaultPosition, wx.DefaultSize, 0)
+        mainSizer.Add(self.exportAllCharsCb, 0, 0, 5)
+
         self.exportBtn.Bind(wx.EVT_BUTTON, self.exportFitting)
 
         self.statusbar = wx.StatusBar(self)
@@ -381,29 +410,52 @@ class ExportToEve(AuxiliaryFrame):
             self.statusbar.SetStatusText(msg, 1)
             return
 
-        try:
-            res = sEsi.postFitting(activeChar, data)
-            res.raise_for_status()
+        if self.exportAllCharsCb.GetValue():
+            charIDs = [self.charChoice.GetClientData(i) for i in range(self.charChoice.GetCount())]
+        else:
+            charIDs = [activeChar]
+        progress = ProgressHelper(
+            message=_t("Exporting fit to {} characters").format(len(charIDs)),
+            maximum=len(charIDs),
+            callback=self.exportFittingDone,
+            deferCallback=True)
+        call = (sEsi.postFittingsThreaded, [[(charID, data) for charID in charIDs], progress], {})
+        self.mainFrame.handleProgress(
+            title=_t("Exporting fit to EVE"),
+            style=wx.PD_CAN_ABORT | wx.PD_SMOOTH | wx.PD_APP_MODAL | wx.PD_AUTO_HIDE,
+            call=call,
+            progress=progress)
+
+    def exportFittingDone(self, results=None, error=None):
+        # Tokens might have been refreshed
+        eos.db.commit()
+        if not self:
+            return
+        if error is not None:
+            self.statusbar.SetStatusText(_t("ERROR"), 0)
+            self.statusbar.SetStatusText("Unknown error", 1)
+            return
+        done = [r for r in results or () if r is not None]
+        failed = [r for r in done if r.error is not None]
+        if not failed:
             self.statusbar.SetStatusText("", 0)
-            self.statusbar.SetStatusText(res.reason, 1)
-        except requests.exceptions.ConnectionError:
+            self.statusbar.SetStatusText(_t("Created") if len(done) == 1 else _t("Exported to {} characters").format(len(done)), 1)
+            return
+        ex = failed[0].error
+        self.statusbar.SetStatusText(_t("ERROR"), 0)
+        if isinstance(ex, requests.exceptions.ConnectionError):
             msg = _t("Connection error, please check your internet connection")
             pyfalog.error(msg)
-            self.statusbar.SetStatusText(_t("ERROR"), 0)
             self.statusbar.SetStatusText(msg, 1)
-        except APIException as ex:
-            pyfalog.error(ex)
-            self.statusbar.SetStatusText(_t("ERROR"), 0)
-            self.statusbar.SetStatusText("HTTP {} - {}".format(ex.status_code, ex.response["error"]), 1)
+        elif isinstance(ex, APIException):
+            self.statusbar.SetStatusText("HTTP {} - {}".format(ex.status_code, ex.response.get("error")), 1)
             try:
                 ESIExceptionHandler(ex)
             except:
                 # don't need to do anything - we should already get the error in ex.response
                 pass
-        except Exception as ex:
-            self.statusbar.SetStatusText(_t("ERROR"), 0)
+        else:
             self.statusbar.SetStatusText("Unknown error", 1)
-            pyfalog.error(ex)
 
 
 class SsoCharacterMgmt(AuxiliaryFrame):
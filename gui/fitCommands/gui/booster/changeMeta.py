@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.booster.add import CalcAddBoosterCommand
-from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory
+from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -28,15 +26,12 @@ class GuiChangeBoosterMetaCommand(wx.Command):
         info.itemID = self.newItemID
         cmd = CalcAddBoosterCommand(fitID=self.fitID, boosterInfo=info)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         self.newPosition = cmd.newPosition
         newBooster = fit.boosters[self.newPosition]
-        mainFrame = gui.mainFrame.MainFrame.getInstance()
-        wx.PostEvent(mainFrame, GE.FitChanged(fitIDs=(self.fitID,)))
-        wx.PostEvent(mainFrame, GE.ItemChangedInplace(old=booster, new=newBooster))
+        scheduleFitRecalc(
+            self.fitID,
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            GE.ItemChangedInplace(old=booster, new=newBooster))
         return success
 
     def Undo(self):
@@ -44,12 +39,9 @@ class GuiChangeBoosterMetaCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         oldBooster = fit.boosters[self.newPosition]
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         newBooster = fit.boosters[self.position]
-        mainFrame = gui.mainFrame.MainFrame.getInstance()
-        wx.PostEvent(mainFrame, GE.FitChanged(fitIDs=(self.fitID,)))
-        wx.PostEvent(mainFrame, GE.ItemChangedInplace(old=oldBooster, new=newBooster))
+        scheduleFitRecalc(
+            self.fitID,
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            GE.ItemChangedInplace(old=oldBooster, new=newBooster))
         return success
@@ -1,11 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.booster.remove import CalcRemoveBoosterCommand
-from gui.fitCommands.helpers import InternalCommandHistory
-from service.fit import Fit
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from service.market import Market
 
 
@@ -25,20 +22,10 @@ class GuiRemoveBoostersCommand(wx.Command):
             results.append(self.internalHistory.submit(cmd))
             sMkt.storeRecentlyUsed(cmd.savedBoosterInfo.itemID)
         success = any(results)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
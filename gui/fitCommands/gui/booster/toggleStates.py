@@ -1,11 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.booster.toggleStates import CalcToggleBoosterStatesCommand
-from gui.fitCommands.helpers import InternalCommandHistory
-from service.fit import Fit
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 
 
 class GuiToggleBoosterStatesCommand(wx.Command):
@@ -20,20 +17,10 @@ class GuiToggleBoosterStatesCommand(wx.Command):
     def Do(self):
         cmd = CalcToggleBoosterStatesCommand(fitID=self.fitID, mainPosition=self.mainPosition, positions=self.positions)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
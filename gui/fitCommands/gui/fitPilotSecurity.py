@@ -1,10 +1,7 @@
 import wx
-from service.fit import Fit
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from gui.fitCommands.calc.fitPilotSecurity import CalcChangeFitPilotSecurityCommand
 
 
@@ -19,18 +16,10 @@ class GuiChangeFitPilotSecurityCommand(wx.Command):
     def Do(self):
         cmd = CalcChangeFitPilotSecurityCommand(fitID=self.fitID, secStatus=self.secStatus)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -1,10 +1,8 @@
 import wx
 from service.fit import Fit
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
 
 
@@ -30,11 +28,7 @@ class GuiToggleFittingRestrictionsCommand(wx.Command):
             if len(results) > 0:
                 success = any(results)
 
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
@@ -42,9 +36,5 @@ class GuiToggleFittingRestrictionsCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         fit.ignoreRestrictions = not fit.ignoreRestrictions
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
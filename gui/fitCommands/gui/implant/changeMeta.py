@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.implant.add import CalcAddImplantCommand
-from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory
+from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -28,15 +26,12 @@ class GuiChangeImplantMetaCommand(wx.Command):
         info.itemID = self.newItemID
         cmd = CalcAddImplantCommand(fitID=self.fitID, implantInfo=info)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         self.newPosition = cmd.newPosition
         newImplant = fit.implants[self.newPosition]
-        mainFrame = gui.mainFrame.MainFrame.getInstance()
-        wx.PostEvent(mainFrame, GE.FitChanged(fitIDs=(self.fitID,)))
-        wx.PostEvent(mainFrame, GE.ItemChangedInplace(old=implant, new=newImplant))
+        scheduleFitRecalc(
+            self.fitID,
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            GE.ItemChangedInplace(old=implant, new=newImplant))
         return success
 
     def Undo(self):
@@ -44,13 +39,9 @@ class GuiChangeImplantMetaCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         oldImplant = fit.implants[self.newPosition]
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         newImplant = fit.implants[self.position]
-        mainFrame = gui.mainFrame.MainFrame.getInstance()
-        wx.PostEvent(mainFrame, GE.FitChanged(fitIDs=(self.fitID,)))
-        wx.PostEvent(mainFrame, GE.ItemChangedInplace(old=oldImplant, new=newImplant))
+        scheduleFitRecalc(
+            self.fitID,
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            GE.ItemChangedInplace(old=oldImplant, new=newImplant))
         return success
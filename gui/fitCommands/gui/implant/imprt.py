@@ -1,12 +1,10 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from eos.const import ImplantLocation
 from gui import globalEvents as GE
 from gui.fitCommands.calc.implant.add import CalcAddImplantCommand
 from gui.fitCommands.calc.implant.changeLocation import CalcChangeImplantLocationCommand
-from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory
+from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -36,20 +34,10 @@ class GuiImportImplantsCommand(wx.Command):
         # Acceptable behavior when we already have passed implant and just switch source, or
         # when we have source and add implant, but not if we do not change anything
         success = successSource or successImplants
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -1,10 +1,7 @@
 import wx
-from service.fit import Fit
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from gui.fitCommands.calc.implant.remove import CalcRemoveImplantCommand
 from service.market import Market
 
@@ -25,20 +22,10 @@ class GuiRemoveImplantsCommand(wx.Command):
             results.append(self.internalHistory.submit(cmd))
             sMkt.storeRecentlyUsed(cmd.savedImplantInfo.itemID)
         success = any(results)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
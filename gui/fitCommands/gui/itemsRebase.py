@@ -1,9 +1,7 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
-from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory
+from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 from gui.fitCommands.calc.cargo.add import CalcAddCargoCommand
 from gui.fitCommands.calc.cargo.remove import CalcRemoveCargoCommand
@@ -60,19 +58,10 @@ class GuiRebaseItemsCommand(wx.Command):
                     fitID=self.fitID,
                     cargoInfo=CargoInfo(itemID=self.rebaseMap[cargo.itemID], amount=amount))
                 self.internalHistory.submitBatch(cmdRemove, cmdAdd)
-        eos.db.flush()
-        sFit.recalc(fit)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return len(self.internalHistory) > 0
 
     def Undo(self):
-        sFit = Fit.getInstance()
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -2,12 +2,10 @@ import math
 
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.drone.localAdd import CalcAddLocalDroneCommand
 from gui.fitCommands.calc.drone.localRemove import CalcRemoveLocalDroneCommand
-from gui.fitCommands.helpers import DroneInfo, InternalCommandHistory
+from gui.fitCommands.helpers import DroneInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -47,19 +45,10 @@ class GuiConvertMutatedLocalDroneCommand(wx.Command):
             forceNewStack=True,
             ignoreRestrictions=True)
         success = self.internalHistory.submitBatch(cmdRemove, cmdAdd)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -1,11 +1,9 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.fighter.localAdd import CalcAddLocalFighterCommand
 from gui.fitCommands.calc.fighter.localRemove import CalcRemoveLocalFighterCommand
-from gui.fitCommands.helpers import FighterInfo, InternalCommandHistory
+from gui.fitCommands.helpers import FighterInfo, InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -37,19 +35,10 @@ class GuiChangeLocalFighterMetasCommand(wx.Command):
                 ignoreRestrictions=True)
             results.append(self.internalHistory.submitBatch(cmdRemove, cmdAdd))
         success = any(results)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
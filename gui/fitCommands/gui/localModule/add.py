@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 from service.market import Market
 
@@ -22,17 +20,13 @@ class GuiAddLocalModuleCommand(wx.Command):
         cmd = CalcAddLocalModuleCommand(fitID=self.fitID, newModInfo=ModuleInfo(itemID=self.itemID))
         success = self.internalHistory.submit(cmd)
         Market.getInstance().storeRecentlyUsed(self.itemID)
-        sFit = Fit.getInstance()
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.itemID)
             if success else
-            GE.FitChanged(fitIDs=(self.fitID,)))
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            recalc=cmd.needsGuiRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -40,12 +34,8 @@ class GuiAddLocalModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.itemID)
             if success else
             GE.FitChanged(fitIDs=(self.fitID,)))
@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localReplace import CalcReplaceLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -45,12 +43,6 @@ class GuiChangeLocalModuleMetasCommand(wx.Command):
                 self.replacedItemIDs.add(module.itemID)
                 lastSuccessfulCmd = cmd
         success = any(results)
-        if lastSuccessfulCmd is not None and lastSuccessfulCmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        newModMap = self._getPositionMap(fit)
         events = []
         if success and self.replacedItemIDs:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.replacedItemIDs))
@@ -58,14 +50,22 @@ class GuiChangeLocalModuleMetasCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.newItemID))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        if success:
-            for position in self.positions:
-                oldMod = oldModMap.get(position)
-                newMod = newModMap.get(position)
-                if oldMod is not newMod:
-                    events.append(GE.ItemChangedInplace(old=oldMod, new=newMod))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+
+        def getEvents():
+            # Module positions can be changed only once fit is filled
+            if not success:
+                return []
+            newModMap = self._getPositionMap(fit)
+            return [
+                GE.ItemChangedInplace(old=oldModMap.get(position), new=newModMap.get(position))
+                for position in self.positions
+                if oldModMap.get(position) is not newModMap.get(position)]
+
+        scheduleFitRecalc(
+            self.fitID, *events,
+            recalc=lastSuccessfulCmd is not None and lastSuccessfulCmd.needsGuiRecalc,
+            command=self,
+            getEvents=getEvents)
         return success
 
     def Undo(self):
@@ -76,11 +76,6 @@ class GuiChangeLocalModuleMetasCommand(wx.Command):
             oldModMap[position] = fit.modules[position]
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        newModMap = self._getPositionMap(fit)
         events = []
         if success:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.newItemID))
@@ -88,14 +83,17 @@ class GuiChangeLocalModuleMetasCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.replacedItemIDs))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        if success:
-            for position in self.positions:
-                oldMod = oldModMap.get(position)
-                newMod = newModMap.get(position)
-                if oldMod is not newMod:
-                    events.append(GE.ItemChangedInplace(fitID=self.fitID, old=oldMod, new=newMod))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+
+        def getEvents():
+            if not success:
+                return []
+            newModMap = self._getPositionMap(fit)
+            return [
+                GE.ItemChangedInplace(fitID=self.fitID, old=oldModMap.get(position), new=newModMap.get(position))
+                for position in self.positions
+                if oldModMap.get(position) is not newModMap.get(position)]
+
+        scheduleFitRecalc(self.fitID, *events, getEvents=getEvents)
         return success
 
     def _getPositionMap(self, fit):
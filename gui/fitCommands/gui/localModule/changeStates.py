@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localChangeStates import CalcChangeLocalModuleStatesCommand
-from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -26,13 +24,7 @@ class GuiChangeLocalModuleStatesCommand(wx.Command):
             positions=self.positions,
             click=self.click)
         success = self.internalHistory.submit(cmd)
-        sFit = Fit.getInstance()
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)), recalc=cmd.needsGuiRecalc, command=self)
         return success
 
     def Undo(self):
@@ -40,9 +32,5 @@ class GuiChangeLocalModuleStatesCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localClone import CalcCloneLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -26,17 +24,13 @@ class GuiCloneLocalModuleCommand(wx.Command):
         cmd = CalcCloneLocalModuleCommand(fitID=self.fitID, srcPosition=self.srcPosition, dstPosition=self.dstPosition)
         success = self.internalHistory.submit(cmd)
         fit = sFit.getFit(self.fitID)
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
+        # Source module position is not affected by dummies added or removed by fill
         self.savedItemID = fit.modules[self.srcPosition].itemID
         if success and self.savedItemID is not None:
             event = GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.savedItemID)
         else:
             event = GE.FitChanged(fitIDs=(self.fitID,))
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, event, recalc=cmd.needsGuiRecalc, command=self)
         return success
 
     def Undo(self):
@@ -44,13 +38,9 @@ class GuiCloneLocalModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         if success and self.savedItemID is not None:
             event = GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.savedItemID)
         else:
             event = GE.FitChanged(fitIDs=(self.fitID,))
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, event)
         return success
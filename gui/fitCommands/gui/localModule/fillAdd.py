@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 from service.market import Market
 
@@ -27,19 +25,15 @@ class GuiFillWithNewLocalModulesCommand(wx.Command):
                 break
             added_modules += 1
         Market.getInstance().storeRecentlyUsed(self.itemID)
-        sFit = Fit.getInstance()
-        # Only last command decides if we need to recalc here or not
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
         success = added_modules > 0
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        # Only last command decides if we need to recalc here or not
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.itemID)
             if success else
-            GE.FitChanged(fitIDs=(self.fitID,)))
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            recalc=cmd.needsGuiRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -47,12 +41,8 @@ class GuiFillWithNewLocalModulesCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.itemID)
             if success else
             GE.FitChanged(fitIDs=(self.fitID,)))
@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -30,17 +28,14 @@ class GuiFillWithClonedLocalModulesCommand(wx.Command):
             if not self.internalHistory.submit(cmd):
                 break
             added_modules += 1
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
         success = added_modules > 0
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.savedItemID)
             if success else
-            GE.FitChanged(fitIDs=(self.fitID,)))
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            recalc=cmd.needsGuiRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -48,12 +43,8 @@ class GuiFillWithClonedLocalModulesCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.savedItemID)
             if success else
             GE.FitChanged(fitIDs=(self.fitID,)))
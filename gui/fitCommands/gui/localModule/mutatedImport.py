@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -24,15 +22,11 @@ class GuiImportLocalMutatedModuleCommand(wx.Command):
     def Do(self):
         cmd = CalcAddLocalModuleCommand(fitID=self.fitID, newModInfo=self.newModInfo)
         success = self.internalHistory.submit(cmd)
-        sFit = Fit.getInstance()
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
-            GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.newModInfo.itemID))
+        scheduleFitRecalc(
+            self.fitID,
+            GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.newModInfo.itemID),
+            recalc=cmd.needsGuiRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -40,11 +34,7 @@ class GuiImportLocalMutatedModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.newModInfo.itemID))
         return success
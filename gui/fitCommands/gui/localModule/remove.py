@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
-from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 from service.market import Market
 
@@ -30,16 +28,13 @@ class GuiRemoveLocalModuleCommand(wx.Command):
             for position in sorted(container, reverse=True):
                 modInfo = container[position]
                 sMkt.storeRecentlyUsed(modInfo.itemID)
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.savedTypeIDs)
             if success and self.savedTypeIDs else
-            GE.FitChanged(fitIDs=(self.fitID,)))
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            recalc=cmd.needsGuiRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -47,12 +42,8 @@ class GuiRemoveLocalModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.savedTypeIDs)
             if success and self.savedTypeIDs else
             GE.FitChanged(fitIDs=(self.fitID,)))
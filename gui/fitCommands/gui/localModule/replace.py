@@ -1,10 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localReplace import CalcReplaceLocalModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 from service.market import Market
 
@@ -32,17 +30,13 @@ class GuiReplaceLocalModuleCommand(wx.Command):
             needRecalc = cmd.needsGuiRecalc
         success = any(results)
         Market.getInstance().storeRecentlyUsed(self.itemID)
-        sFit = Fit.getInstance()
-        if needRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.itemID)
             if success else
-            GE.FitChanged(fitIDs=(self.fitID,)))
+            GE.FitChanged(fitIDs=(self.fitID,)),
+            recalc=needRecalc,
+            command=self)
         return success
 
     def Undo(self):
@@ -50,12 +44,8 @@ class GuiReplaceLocalModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(
-            gui.mainFrame.MainFrame.getInstance(),
+        scheduleFitRecalc(
+            self.fitID,
             GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.itemID)
             if success else
             GE.FitChanged(fitIDs=(self.fitID,)))
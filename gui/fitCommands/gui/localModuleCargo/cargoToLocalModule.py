@@ -1,13 +1,11 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.cargo.add import CalcAddCargoCommand
 from gui.fitCommands.calc.cargo.remove import CalcRemoveCargoCommand
 from gui.fitCommands.calc.module.changeCharges import CalcChangeModuleChargesCommand
 from gui.fitCommands.calc.module.localReplace import CalcReplaceLocalModuleCommand
-from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -129,10 +127,6 @@ class GuiCargoToLocalModuleCommand(wx.Command):
                 self.internalHistory.undoAll()
         else:
             return False
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
         events = []
         if self.removedModItemID is not None:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.removedModItemID))
@@ -140,8 +134,7 @@ class GuiCargoToLocalModuleCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.addedModItemID))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, *events, command=self)
         return success
 
     def Undo(self):
@@ -149,10 +142,6 @@ class GuiCargoToLocalModuleCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         events = []
         if self.addedModItemID is not None:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.addedModItemID))
@@ -160,6 +149,5 @@ class GuiCargoToLocalModuleCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.removedModItemID))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, *events)
         return success
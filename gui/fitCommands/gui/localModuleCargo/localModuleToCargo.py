@@ -1,13 +1,11 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.cargo.add import CalcAddCargoCommand
 from gui.fitCommands.calc.cargo.remove import CalcRemoveCargoCommand
 from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
 from gui.fitCommands.calc.module.localReplace import CalcReplaceLocalModuleCommand
-from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, ModuleInfo, restoreRemovedDummies
+from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, ModuleInfo, restoreRemovedDummies, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -108,11 +106,6 @@ class GuiLocalModuleToCargoCommand(wx.Command):
                     fitID=self.fitID,
                     positions=[self.srcModPosition]))
             success = self.internalHistory.submitBatch(*commands)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        self.savedRemovedDummies = sFit.fill(self.fitID)
-        eos.db.commit()
         events = []
         if self.removedModItemID is not None:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.removedModItemID))
@@ -120,8 +113,7 @@ class GuiLocalModuleToCargoCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.addedModItemID))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, *events, command=self)
         return success
 
     def Undo(self):
@@ -129,10 +121,6 @@ class GuiLocalModuleToCargoCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
         events = []
         if self.addedModItemID is not None:
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='moddel', typeID=self.addedModItemID))
@@ -140,6 +128,5 @@ class GuiLocalModuleToCargoCommand(wx.Command):
             events.append(GE.FitChanged(fitIDs=(self.fitID,), action='modadd', typeID=self.removedModItemID))
         if not events:
             events.append(GE.FitChanged(fitIDs=(self.fitID,)))
-        for event in events:
-            wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), event)
+        scheduleFitRecalc(self.fitID, *events)
         return success
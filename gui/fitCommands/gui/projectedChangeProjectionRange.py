@@ -1,7 +1,5 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from eos.saveddata.drone import Drone as EosDrone
 from eos.saveddata.fighter import Fighter as EosFighter
 from eos.saveddata.fit import Fit as EosFit
@@ -11,7 +9,7 @@ from gui.fitCommands.calc.drone.projectedChangeProjectionRange import CalcChange
 from gui.fitCommands.calc.fighter.projectedChangeProjectionRange import CalcChangeProjectedFighterProjectionRangeCommand
 from gui.fitCommands.calc.module.projectedChangeProjectionRange import CalcChangeProjectedModuleProjectionRangeCommand
 from gui.fitCommands.calc.projectedFit.changeProjectionRange import CalcChangeProjectedFitProjectionRangeCommand
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -71,21 +69,10 @@ class GuiChangeProjectedItemsProjectionRangeCommand(wx.Command):
             results.append(self.internalHistory.submit(cmd))
             needRecalc = cmd.needsGuiRecalc
         success = any(results)
-        sFit = Fit.getInstance()
-        if needRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)), recalc=needRecalc)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -1,7 +1,5 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from eos.const import FittingModuleState
 from eos.saveddata.drone import Drone as EosDrone
 from eos.saveddata.fighter import Fighter as EosFighter
@@ -12,7 +10,7 @@ from gui.fitCommands.calc.drone.projectedChangeState import CalcChangeProjectedD
 from gui.fitCommands.calc.fighter.projectedChangeState import CalcChangeProjectedFighterStateCommand
 from gui.fitCommands.calc.module.projectedChangeStates import CalcChangeProjectedModuleStatesCommand
 from gui.fitCommands.calc.projectedFit.changeState import CalcChangeProjectedFitStateCommand
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, scheduleFitRecalc
 from service.fit import Fit
 
 
@@ -88,21 +86,10 @@ class GuiChangeProjectedItemStatesCommand(wx.Command):
             results.append(self.internalHistory.submit(cmd))
             needRecalc = cmd.needsGuiRecalc
         success = any(results)
-        sFit = Fit.getInstance()
-        if needRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)), recalc=needRecalc)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
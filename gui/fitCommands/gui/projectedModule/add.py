@@ -1,11 +1,8 @@
 import wx
 
-import eos.db
-import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.projectedAdd import CalcAddProjectedModuleCommand
-from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo
-from service.fit import Fit
+from gui.fitCommands.helpers import InternalCommandHistory, ModuleInfo, scheduleFitRecalc
 
 
 class GuiAddProjectedModuleCommand(wx.Command):
@@ -19,21 +16,10 @@ class GuiAddProjectedModuleCommand(wx.Command):
     def Do(self):
         cmd = CalcAddProjectedModuleCommand(fitID=self.fitID, modInfo=ModuleInfo(itemID=self.itemID))
         success = self.internalHistory.submit(cmd)
-        sFit = Fit.getInstance()
-        if cmd.needsGuiRecalc:
-            eos.db.flush()
-            sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)), recalc=cmd.needsGuiRecalc)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        scheduleFitRecalc(self.fitID, GE.FitChanged(fitIDs=(self.fitID,)))
         return success
@@ -4,6 +4,7 @@ import wx
 from logbook import Logger
 
 import eos.db
+import gui.mainFrame
 from eos.const import FittingModuleState
 from eos.saveddata.booster import Booster
 from eos.saveddata.cargo import Cargo
@@ -11,6 +12,7 @@ from eos.saveddata.drone import Drone
 from eos.saveddata.fighter import Fighter
 from eos.saveddata.implant import Implant
 from eos.saveddata.module import Module
+from service.fit import Fit
 from service.market import Market
 from utils.repr import makeReprStr
 
@@ -384,6 +386,35 @@ def restoreCheckedStates(fit, stateInfo, ignoreModPoss=()):
         fit.projectedDrones[pos].amountActive = amountActive
 
 
+def scheduleFitRecalc(fitID, *events, recalc=True, command=None, getEvents=None):
+    """
+    Flush changes done to fit, recalculate it in background, then fill it, commit
+    and post passed events to main frame.
+
+    If command is passed, dummy slots removed by fill are stored in its
+    savedRemovedDummies attribute. getEvents is called after fill and can return
+    events which depend on filled fit.
+    """
+    def onDone(removedDummies):
+        if command is not None:
+            command.savedRemovedDummies = removedDummies
+        mainFrame = gui.mainFrame.MainFrame.getInstance()
+        for event in events:
+            wx.PostEvent(mainFrame, event)
+        if getEvents is not None:
+            for event in getEvents():
+                wx.PostEvent(mainFrame, event)
+
+    sFit = Fit.getInstance()
+    if recalc:
+        eos.db.flush()
+        sFit.scheduleRecalc(fitID, onDone)
+    else:
+        removedDummies = sFit.fill(fitID)
+        eos.db.commit()
+        onDone(removedDummies)
+
+
 def restoreRemovedDummies(fit, dummyInfo):
     if dummyInfo is None:
         return
@@ -35,6 +35,7 @@ from wx.lib.inspection import InspectionTool
 import config
 import gui.fitCommands as cmd
 import gui.globalEvents as GE
+import eos.db
 from eos.config import gamedata_date, gamedata_version
 from eos.modifiedAttributeDict import ModifiedAttributeDict
 from graphs import GraphFrame
@@ -236,6 +237,11 @@ class MainFrame(wx.Frame):
 
         self.Bind(GE.EVT_SSO_LOGIN, self.onSSOLogin)
 
+        # Keep HTML export up to date when it's set to be exported automatically
+        self.Bind(GE.FIT_CHANGED, self.onFitsEdited)
+        self.Bind(GE.FIT_RENAMED, self.onFitsEdited)
+        self.Bind(GE.FIT_REMOVED, self.onFitsEdited)
+
     @property
     def command(self) -> wx.CommandProcessor:
         return Fit.getCommandProcessor(self.getActiveFit())
@@ -396,6 +402,7 @@ class MainFrame(wx.Frame):
 
         # save all teh settingz
         SettingsProvider.getInstance().saveAll()
+        eos.db.sync()
         event.Skip()
 
     def ExitApp(self, event):
@@ -674,6 +681,11 @@ class MainFrame(wx.Frame):
         menu.Enable(menu.eveFittingsId, True)
         menu.Enable(menu.exportToEveId, True)
 
+    def onFitsEdited(self, event):
+        event.Skip()
+        from gui.utils.exportHtml import exportHtml
+        exportHtml.getInstance().refreshFittingHtml()
+
     def updateEsiMenus(self, type):
         menu = self.GetMenuBar()
         sEsi = Esi.getInstance()
@@ -770,16 +782,16 @@ class MainFrame(wx.Frame):
         try:
             importType, importData = Port().importFitFromBuffer(clipboard, activeFit)
             if importType == "FittingItem":
-                baseItem, mutaplasmidItem, mutations = importData[0]
-                if mutaplasmidItem:
-                    if baseItem.isDrone:
-                        self.command.Submit(cmd.GuiImportLocalMutatedDroneCommand(
-                            activeFit, baseItem, mutaplasmidItem, mutations, amount=1))
+                for baseItem, mutaplasmidItem, mutations in importData:
+                    if mutaplasmidItem:
+                        if baseItem.isDrone:
+                            self.command.Submit(cmd.GuiImportLocalMutatedDroneCommand(
+                                activeFit, baseItem, mutaplasmidItem, mutations, amount=1))
+                        else:
+                            self.command.Submit(cmd.GuiImportLocalMutatedModuleCommand(
+                                activeFit, baseItem, mutaplasmidItem, mutations))
                     else:
-                        self.command.Submit(cmd.GuiImportLocalMutatedModuleCommand(
-                            activeFit, baseItem, mutaplasmidItem, mutations))
-                else:
-                    self.command.Submit(cmd.GuiAddLocalModuleCommand(activeFit, baseItem.ID))
+                        self.command.Submit(cmd.GuiAddLocalModuleCommand(activeFit, baseItem.ID))
                 return
             if importType == "AdditionsDrones":
                 if self.command.Submit(cmd.GuiImportLocalDronesCommand(activeFit, [(i.ID, a, m) for i, a, m in importData[0]])):
@@ -948,8 +960,8 @@ class MainFrame(wx.Frame):
                     errMsgLbl, wx.OK | wx.ICON_ERROR
             ) as dlg:
                 dlg.ShowModal()
-        elif progress.callback:
-            progress.callback(*progress.cbArgs)
+        else:
+            progress.dialogDone()
 
     def _openAfterImport(self, fits):
         if len(fits) > 0:
@@ -17,6 +17,8 @@
 # along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
 # =============================================================================
 
+import threading
+
 # noinspection PyPackageRequirements
 import wx
 
@@ -34,6 +36,79 @@ from logbook import Logger
 pyfalog = Logger(__name__)
 
 
+class StatsWorkerThread(threading.Thread):
+    """
+    Calculates expensive stats of a fit for stats views outside of main thread.
+
+    Only the latest request is of interest, so a request which was not picked up
+    yet is replaced by the next one.
+
+    Fit is not locked while stats are calculated, so that commands and recalcs in
+    main thread never wait for capacitor simulation and alike. Revision of the fit
+    is checked instead: if fit changed meanwhile, whatever was calculated is thrown
+    away and request is calculated again, unless a newer one replaced it.
+    """
+
+    def __init__(self, callback):
+        threading.Thread.__init__(self)
+        self.name = "StatsWorker"
+        self.daemon = True
+        self.callback = callback
+        self.running = True
+        self.cv = threading.Condition()
+        # (request ID, fit, views)
+        self.request = None
+
+    def run(self):
+        sFit = Fit.getInstance()
+        while True:
+            with self.cv:
+                while self.running and self.request is None:
+                    self.cv.wait()
+                if not self.running:
+                    break
+                requestID, fit, views = self.request
+                self.request = None
+            # Commands change fits under calculation lock (see FitCommandProcessor)
+            with sFit.calcLock:
+                revision = fit.revision
+            error = None
+            # Fit which is not calculated is left for views to handle in main thread
+            if revision is not None:
+                try:
+                    for view in views:
+                        view.precalculate(fit)
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except Exception as e:
+                    error = e
+            with sFit.calcLock:
+                changed = fit.revision != revision
+                if changed:
+                    # Stats cached on fit might come from its half-changed state
+                    fit.clearFactorReloadDependentData()
+            if changed:
+                with self.cv:
+                    if self.request is None:
+                        self.request = (requestID, fit, views)
+                continue
+            if error is not None:
+                # Views will try again in main thread and report the error there
+                pyfalog.error("Failed to calculate stats for fit {}", fit.ID)
+                pyfalog.error(error)
+            wx.CallAfter(self.callback, requestID, fit, views)
+
+    def schedule(self, requestID, fit, views):
+        with self.cv:
+            self.request = (requestID, fit, views)
+            self.cv.notify()
+
+    def stop(self):
+        with self.cv:
+            self.running = False
+            self.cv.notify()
+
+
 class StatsPane(wx.Panel):
     AVAILIBLE_VIEWS = [
         "resources",
@@ -75,9 +150,49 @@ class StatsPane(wx.Panel):
         if activeFitID is not None and activeFitID not in event.fitIDs:
             return
         sFit = Fit.getInstance()
-        fit = sFit.getFit(activeFitID)
+        self.fit = sFit.getFit(activeFitID)
+        self.requestID += 1
+        self.staleViews.update(self.views)
+        self.calculatingViews.clear()
+        self.refreshViews()
+
+    def refreshViews(self):
+        """
+        Refresh outdated views which are expanded. Views with expensive stats keep
+        showing old values until stats are calculated in background.
+        """
+        fit = self.fit
+        expensiveViews = []
         for view in self.views:
-            view.refreshPanel(fit)
+            # Content panel of a view is in its toggle panel
+            if view not in self.staleViews or view.panel.GetParent().IsCollapsed():
+                continue
+            self.staleViews.discard(view)
+            if view.expensive and fit is not None:
+                expensiveViews.append(view)
+            else:
+                view.refreshPanel(fit)
+        if not expensiveViews:
+            return
+        self.calculatingViews.update(expensiveViews)
+        if self.statsWorkerThread is None:
+            self.statsWorkerThread = StatsWorkerThread(self.statsCalculated)
+            self.statsWorkerThread.start()
+        # Views of request which is not picked up yet are included, as it gets replaced
+        self.statsWorkerThread.schedule(self.requestID, fit, [v for v in self.views if v in self.calculatingViews])
+
+    def statsCalculated(self, requestID, fit, views):
+        # Fit has changed since, results are outdated
+        if requestID != self.requestID or fit is not self.fit:
+            return
+        for view in views:
+            if view in self.calculatingViews:
+                self.calculatingViews.discard(view)
+                view.refreshPanel(fit)
+
+    def panelToggled(self, expanded):
+        if expanded:
+            self.refreshViews()
 
     def __init__(self, parent):
         wx.Panel.__init__(self, parent)
@@ -96,10 +211,17 @@ class StatsPane(wx.Panel):
 
         self.views = []
         self.nameViewMap = {}
+        # Views which were not refreshed since last fit change
+        self.staleViews = set()
+        # Views waiting for their stats to be calculated in background
+        self.calculatingViews = set()
+        self.fit = None
+        self.requestID = 0
+        self.statsWorkerThread = None
         maxviews = len(self.DEFAULT_VIEWS)
         i = 0
         for viewName in self.DEFAULT_VIEWS:
-            tp = TogglePanel(self)
+            tp = TogglePanel(self, toggle_callback=self.panelToggled)
             contentPanel = tp.GetContentPanel()
             contentPanel.viewName = viewName
 
@@ -20,6 +20,9 @@
 
 class StatsView:
     views = {}
+    # Views which show stats expensive to calculate (e.g. capacitor simulation) get
+    # them calculated by precalculate() outside of main thread before refreshPanel()
+    expensive = False
 
     def __init__(self):
         pass
@@ -41,6 +44,9 @@ class StatsView:
     def refreshPanel(self, fit):
         raise NotImplementedError()
 
+    def precalculate(self, fit):
+        pass
+
 
 # noinspection PyUnresolvedReferences
 from gui.builtinStatsViews import (  # noqa: E402, F401
@@ -16,12 +16,14 @@ import wx
 
 
 class TogglePanel(wx.Panel):
-    def __init__(self, parent, force_layout=False, *args, **kargs):
+    def __init__(self, parent, force_layout=False, toggle_callback=None, *args, **kargs):
         super().__init__(parent, *args, **kargs)
 
         self._toggled = True
         self.parent = parent
         self.force_layout = force_layout
+        # Called with new expanded state each time panel is toggled
+        self.toggle_callback = toggle_callback
 
         # Create the main sizer of this panel
         self.main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -141,3 +143,6 @@ class TogglePanel(wx.Panel):
             self.parent.Layout()
         else:
             self.OnStateChange(self.GetBestSize())
+
+        if self.toggle_callback is not None:
+            self.toggle_callback(self._toggled)
@@ -1,8 +1,9 @@
+import os
 import threading
 import time
 # noinspection PyPackageRequirements
 import wx
-from service.const import PortEftOptions
+from service.const import PortDnaOptions, PortEftOptions
 from service.settings import HTMLExportSettings
 from service.fit import Fit
 from service.port import Port
@@ -12,6 +13,16 @@ from eos.db import getFit
 
 pyfalog = Logger(__name__)
 
+EFT_OPTIONS = {
+    PortEftOptions.IMPLANTS: True,
+    PortEftOptions.MUTATIONS: True,
+    PortEftOptions.LOADED_CHARGES: True,
+    PortEftOptions.BOOSTERS: True,
+    PortEftOptions.CARGO: True}
+
+DNA_OPTIONS = {
+    PortDnaOptions.FORMATTING: False}
+
 
 class exportHtml:
     _instance = None
@@ -25,22 +36,28 @@ class exportHtml:
 
     def __init__(self):
         self.thread = exportHtmlThread()
+        # Fits rendered by previous exports, so that next export has to render only
+        # changed fits. Format: {(fit ID, format): (change stamp, text)}
+        self.renderCache = {}
 
     def refreshFittingHtml(self, force=False, progress=None):
         settings = HTMLExportSettings.getInstance()
 
         if force or settings.getEnabled():
             self.thread.stop()
-            self.thread = exportHtmlThread(progress)
+            self.thread = exportHtmlThread(progress, self.renderCache)
             self.thread.start()
 
 
 class exportHtmlThread(threading.Thread):
-    def __init__(self, progress=False):
+    def __init__(self, progress=False, renderCache=None):
         threading.Thread.__init__(self)
         self.name = "HTMLExport"
         self.progress = progress
+        self.renderCache = renderCache if renderCache is not None else {}
         self.stopRunning = False
+        # Amount of fits which had to be rendered anew during this export
+        self.rendered = 0
 
     def stop(self):
         self.stopRunning = True
@@ -57,18 +74,28 @@ class exportHtmlThread(threading.Thread):
 
         minimal = settings.getMinimalEnabled()
         dnaUrl = "https://o.smium.org/loadout/dna/"
-
-        if minimal:
-            HTML = self.generateMinimalHTML(sMkt, sFit, dnaUrl)
-        else:
-            HTML = self.generateFullHTML(sMkt, sFit, dnaUrl)
+        path = settings.getPath()
+        # Write into temporary file first, so that export which fails or gets
+        # stopped midway doesn't leave incomplete page behind. Stopped export
+        # may still be writing when the next one starts, hence name per thread
+        tmpPath = '{}.{}.tmp'.format(path, self.ident)
 
         try:
-            FILE = open(settings.getPath(), "w", encoding='utf-8')
-            FILE.write(HTML)
-            FILE.close()
+            shipGroups = self.getShipGroups(sMkt, sFit)
+            if minimal:
+                chunks = self.generateMinimalHTML(shipGroups, dnaUrl)
+            else:
+                chunks = self.generateFullHTML(shipGroups, dnaUrl)
+            with open(tmpPath, "w", encoding='utf-8') as FILE:
+                for chunk in chunks:
+                    FILE.write(chunk)
+            if self.stopRunning:
+                return
+            os.replace(tmpPath, path)
+            self.pruneRenderCache(shipGroups)
+            pyfalog.debug("Exported fits to HTML, {} fits rendered", self.rendered)
         except IOError as ex:
-            pyfalog.warning("Failed to write to " + settings.getPath())
+            pyfalog.warning("Failed to write to " + path)
             pass
         except (KeyboardInterrupt, SystemExit):
             raise
@@ -76,16 +103,72 @@ class exportHtmlThread(threading.Thread):
             if self.progress:
                 self.progress.error = f'{e}'
         finally:
+            if os.path.exists(tmpPath):
+                try:
+                    os.remove(tmpPath)
+                except OSError:
+                    pass
             if self.progress:
                 self.progress.current += 1
                 self.progress.workerWorking = False
 
-    def generateFullHTML(self, sMkt, sFit, dnaUrl):
-        """ Generate the complete HTML with styling and javascript """
+    @staticmethod
+    def getShipGroups(sMkt, sFit):
+        """
+        Fetch all fits of current vault in one query and group them by market group
+        and ship: [(group, [(ship, [(fit ID, fit name, change stamp), ...]), ...]), ...].
+        Groups and ships without fits are left out.
+        """
+        fitsByShip = {}
+        for fitID, fitName, shipID, changed in sFit.getAllFitChanges():
+            # Name is part of the stamp as it's rendered as part of the fit
+            fitsByShip.setdefault(shipID, []).append((fitID, fitName, (changed, fitName)))
+
+        shipGroups = []
+        categoryList = list(sMkt.getShipRoot())
+        categoryList.sort(key=lambda _ship: _ship.name)
+        for group in categoryList:
+            ships = [ship for ship in sMkt.getShipList(group.ID) if ship.ID in fitsByShip]
+            if not ships:
+                continue
+            ships.sort(key=lambda _ship: _ship.name)
+            shipGroups.append((group, [(ship, fitsByShip[ship.ID]) for ship in ships]))
+        return shipGroups
+
+    def renderFit(self, fitID, stamp, format):
+        """ Return fit exported in passed format, rendering it only if it changed since previous export """
+        key = (fitID, format)
+        cached = self.renderCache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # Fit is taken as it's stored, exports do not need calculated attributes
+        fit = getFit(fitID)
+        if fit is None:
+            raise ValueError("Fit {} is invalid".format(fitID))
+        if format == 'eft':
+            text = Port.exportEft(fit, options=EFT_OPTIONS)
+        else:
+            text = Port.exportDna(fit, options=DNA_OPTIONS)
+        self.renderCache[key] = (stamp, text)
+        self.rendered += 1
+        return text
+
+    def pruneRenderCache(self, shipGroups):
+        """ Forget rendered fits which do not exist anymore """
+        fitIDs = set()
+        for group, ships in shipGroups:
+            for ship, fits in ships:
+                fitIDs.update(fit[0] for fit in fits)
+        for key in list(self.renderCache):
+            if key[0] not in fitIDs:
+                self.renderCache.pop(key, None)
+
+    def generateFullHTML(self, shipGroups, dnaUrl):
+        """ Generate the complete HTML with styling and javascript, piece by piece """
         timestamp = time.localtime(time.time())
         localDate = "%d/%02d/%02d %02d:%02d" % (timestamp[0], timestamp[1], timestamp[2], timestamp[3], timestamp[4])
 
-        HTML = """
+        yield """
 <!DOCTYPE html>
 <html>
   <head>
@@ -179,178 +262,111 @@ class exportHtmlThread(threading.Thread):
   </div>
   <div data-role="content">
 """ % (time.time(), dnaUrl, localDate)
-        
-        HTML += '  <ul data-role="listview" class="ui-listview-outer" data-inset="true" data-filter="true">\n'
-        categoryList = list(sMkt.getShipRoot())
-        categoryList.sort(key=lambda _ship: _ship.name)
 
-        count = 0
+        yield '  <ul data-role="listview" class="ui-listview-outer" data-inset="true" data-filter="true">\n'
 
-        for group in categoryList:
-            # init market group string to give ships something to attach to
-            HTMLgroup = ''
-
-            ships = list(sMkt.getShipList(group.ID))
-            ships.sort(key=lambda _ship: _ship.name)
+        # Fits which failed to render are left out of both lists
+        eftFits = {}
+        count = 0
 
-            # Keep track of how many ships per group
+        for group, ships in shipGroups:
+            # Render whole group first, as its header contains amount of exported fits
+            HTMLgroup = []
             groupFits = 0
-            for ship in ships:
-                fits = sFit.getFitsWithShip(ship.ID)
+            for ship, fits in ships:
+                HTMLship = []
+                for fitID, fitName, stamp in fits:
+                    if self.stopRunning:
+                        return
+                    try:
+                        eftFit = eftFits[fitID] = self.renderFit(fitID, stamp, 'eft')
+                        HTMLship.append(
+                            '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
+                            'data-corners="false">\n'
+                            '           <h2>' + fitName + '</h2>\n'
+                            '               <ul data-role="listview" data-shadow="false" data-inset="true" '
+                            'data-corners="false">\n'
+                            '                   <li><pre>' + eftFit + '\n                   </pre></li>\n'
+                            '              </ul>\n          </li>\n')
+                    except (KeyboardInterrupt, SystemExit):
+                        raise
+                    except:
+                        pyfalog.warning("Failed to export line")
+                        continue
+                    finally:
+                        if self.progress:
+                            self.progress.current = count
+                        count += 1
 
-                if len(fits) > 0:
-                    groupFits += len(fits)
-                    HTMLship = (
+                if HTMLship:
+                    groupFits += len(HTMLship)
+                    HTMLgroup.append(
                         '        <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
                         'data-corners="false">\n'
-                        '        <h2>' + ship.name + ' <span class="ui-li-count">' + str(
-                            len(fits)) + '</span></h2>\n'
-                                         '          <ul data-role="listview" data-shadow="false" data-inset="true" '
-                                         'data-corners="false">\n'
-                    )
-
-                    for fit in fits:
-                        if self.stopRunning:
-                            return
-                        try:
-                            eftFit = Port.exportEft(getFit(fit[0]), options={
-                                PortEftOptions.IMPLANTS: True,
-                                PortEftOptions.MUTATIONS: True,
-                                PortEftOptions.LOADED_CHARGES: True,
-                                PortEftOptions.BOOSTERS: True,
-                                PortEftOptions.CARGO: True})
-
-                            HTMLfit = (
-                                    '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
-                                    'data-corners="false">\n'
-                                    '           <h2>' + fit[1] + '</h2>\n'
-                                    '               <ul data-role="listview" data-shadow="false" data-inset="true" '
-                                                                 'data-corners="false">\n'
-                            )
-
-                            HTMLfit += '                   <li><pre>' + eftFit + '\n                   </pre></li>\n'
-
-                            HTMLfit += '              </ul>\n          </li>\n'
-                            HTMLship += HTMLfit
-                        except (KeyboardInterrupt, SystemExit):
-                            raise
-                        except:
-                            pyfalog.warning("Failed to export line")
-                            continue
-                        finally:
-                            if self.progress:
-                                self.progress.current = count
-                            count += 1
-                    HTMLgroup += HTMLship + ('          </ul>\n'
-                                             '        </li>\n')
+                        '        <h2>' + ship.name + ' <span class="ui-li-count">' + str(len(HTMLship)) + '</span></h2>\n'
+                        '          <ul data-role="listview" data-shadow="false" data-inset="true" '
+                        'data-corners="false">\n')
+                    HTMLgroup.extend(HTMLship)
+                    HTMLgroup.append('          </ul>\n'
+                                     '        </li>\n')
 
             if groupFits > 0:
                 # Market group header
-                HTML += (
+                yield (
                     '    <li data-role="collapsible" data-iconpos="right" data-shadow="false" data-corners="false">\n'
                     '      <h2>' + group.name + ' <span class="ui-li-count">' + str(groupFits) + '</span></h2>\n'
-                    '      <ul data-role="listview" data-shadow="false" data-inset="true" data-corners="false">\n' +
-                    HTMLgroup +
-                    '      </ul>\n'
-                    '    </li>'
-                )
+                    '      <ul data-role="listview" data-shadow="false" data-inset="true" data-corners="false">\n')
+                yield ''.join(HTMLgroup)
+                yield ('      </ul>\n'
+                       '    </li>')
 
-        HTML += """
+        yield """
   </ul>
  </div>
   <div data-role="header">
     <h1>Pyfa fits by Name</h1>
   </div>
   <div data-role="content">
-""" 
-        HTML += '  <ul data-role="listview" class="ui-listview-outer" data-inset="true" data-filter="true">\n'
-        categoryList = list(sMkt.getShipRoot())
-        categoryList.sort(key=lambda _ship: _ship.name)
+"""
+        yield '  <ul data-role="listview" class="ui-listview-outer" data-inset="true" data-filter="true">\n'
 
-        count = 0
-
-        for group in categoryList:
-            # init market group string to give ships something to attach to
-            HTMLgroup = ''
-
-            ships = list(sMkt.getShipList(group.ID))
-            ships.sort(key=lambda _ship: _ship.name)
+        for group, ships in shipGroups:
+            for ship, fits in ships:
+                for fitID, fitName, stamp in fits:
+                    if self.stopRunning:
+                        return
+                    eftFit = eftFits.get(fitID)
+                    if eftFit is None:
+                        continue
+                    yield (
+                        '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
+                        'data-corners="false">\n'
+                        '           <h2>' + ship.name + " - " + fitName + '</h2>\n'
+                        '               <ul data-role="listview" data-shadow="false" data-inset="true" '
+                        'data-corners="false">\n'
+                        '                   <li><pre>' + eftFit + '\n                   </pre></li>\n'
+                        '              </ul>\n          </li>\n')
 
-            # Keep track of how many ships per group
-            groupFits = 0
-            for ship in ships:
-                fits = sFit.getFitsWithShip(ship.ID)
-
-                if len(fits) > 0:
-                    groupFits += len(fits)
-
-                    for fit in fits:
-                        if self.stopRunning:
-                            return
-                        try:
-                            eftFit = Port.exportEft(getFit(fit[0]), options={
-                                PortEftOptions.IMPLANTS: True,
-                                PortEftOptions.MUTATIONS: True,
-                                PortEftOptions.LOADED_CHARGES: True,
-                                PortEftOptions.BOOSTERS: True,
-                                PortEftOptions.CARGO: True})
-
-                            HTMLfit = (
-                                    '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
-                                    'data-corners="false">\n'
-                                    '           <h2>' + ship.name + " - " + fit[1] + '</h2>\n'
-                                    '               <ul data-role="listview" data-shadow="false" data-inset="true" '
-                                                                 'data-corners="false">\n'
-                            )
-
-                            HTMLfit += '                   <li><pre>' + eftFit + '\n                   </pre></li>\n'
-
-                            HTMLfit += '              </ul>\n          </li>\n'
-                            HTML += HTMLfit
-                        except (KeyboardInterrupt, SystemExit):
-                            raise
-                        except:
-                            pyfalog.warning("Failed to export line")
-                            continue
-                        finally:
-                            if self.progress:
-                                self.progress.current = count
-                            count += 1
-
-        HTML += """
+        yield """
   </ul>
  </div>
 </div>
 </body>
 </html>"""
 
-        return HTML
-
-    def generateMinimalHTML(self, sMkt, sFit, dnaUrl):
-        """ Generate a minimal HTML version of the fittings, without any javascript or styling"""
-        categoryList = list(sMkt.getShipRoot())
-        categoryList.sort(key=lambda _ship: _ship.name)
-
+    def generateMinimalHTML(self, shipGroups, dnaUrl):
+        """ Generate a minimal HTML version of the fittings, without any javascript or styling, piece by piece """
         count = 0
-        HTML = ''
-        for group in categoryList:
-            # init market group string to give ships something to attach to
-
-            ships = list(sMkt.getShipList(group.ID))
-            ships.sort(key=lambda _ship: _ship.name)
-
-            ships.sort(key=lambda _ship: _ship.name)
-
-            for ship in ships:
-                fits = sFit.getFitsWithShip(ship.ID)
-                for fit in fits:
+        for group, ships in shipGroups:
+            for ship, fits in ships:
+                for fitID, fitName, stamp in fits:
                     if self.stopRunning:
                         return
                     try:
-                        dnaFit = Port.exportDna(getFit(fit[0]))
-                        HTML += '<a class="outOfGameBrowserLink" target="_blank" href="' + dnaUrl + dnaFit + '">' \
-                                + ship.name + ': ' + \
-                                fit[1] + '</a><br> \n'
+                        dnaFit = self.renderFit(fitID, stamp, 'dna')
+                        yield '<a class="outOfGameBrowserLink" target="_blank" href="' + dnaUrl + dnaFit + '">' \
+                              + ship.name + ': ' + \
+                              fitName + '</a><br> \n'
                     except (KeyboardInterrupt, SystemExit):
                         raise
                     except:
@@ -360,4 +376,3 @@ class exportHtmlThread(threading.Thread):
                         if self.progress:
                             self.progress.current = count
                         count += 1
-        return HTML
@@ -1,6 +1,11 @@
+import threading
+
+import wx
+
+
 class ProgressHelper:
 
-    def __init__(self, message, maximum=None, callback=None):
+    def __init__(self, message, maximum=None, callback=None, deferCallback=False):
         self.message = message
         self.current = 0
         self.maximum = maximum
@@ -9,6 +14,11 @@ class ProgressHelper:
         self.error = None
         self.callback = callback
         self.cbArgs = []
+        # If dialog gets closed while worker is still running, callback is ran by worker
+        # once it is done, with its results; worker has to report them via workerDone()
+        self.deferCallback = deferCallback
+        self.callbackPending = False
+        self.lock = threading.Lock()
 
     @property
     def working(self):
@@ -17,3 +27,22 @@ class ProgressHelper:
     @property
     def userCancelled(self):
         return not self.dlgWorking
+
+    def workerDone(self, *cbArgs):
+        """Called from worker thread with arguments for callback"""
+        with self.lock:
+            self.cbArgs = list(cbArgs)
+            self.workerWorking = False
+            runCallback = self.callbackPending
+        if runCallback:
+            wx.CallAfter(self.callback, *self.cbArgs)
+
+    def dialogDone(self):
+        """Called from main thread once progress dialog is closed"""
+        if self.callback is None:
+            return
+        with self.lock:
+            if self.deferCallback and self.workerWorking:
+                self.callbackPending = True
+                return
+        self.callback(*self.cbArgs)
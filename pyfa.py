@@ -24,9 +24,16 @@ import os
 import sys
 from optparse import AmbiguousOptionError, BadOptionError, OptionParser
 
-import config
-from service.prereqsCheck import PreCheckException, PreCheckMessage, version_block, version_precheck
-from db_update import db_needs_update, update_db
+from utils.startupProfiler import startupProfiler
+
+# Record everything from the very beginning, profiler is thrown away once we know
+# that no startup report was requested
+startupProfiler.start()
+
+with startupProfiler.phase('bootstrap imports'):
+    import config
+    from service.prereqsCheck import PreCheckException, PreCheckMessage, version_block, version_precheck
+    from db_update import db_needs_update, update_db
 
 
 # ascii_text = '''
@@ -74,21 +81,37 @@ parser.add_option("-s", "--savepath", action="store", dest="savepath", help="Set
 parser.add_option("-l", "--logginglevel", action="store", dest="logginglevel", help="Set desired logging level [Critical|Error|Warning|Info|Debug]", default="Error")
 parser.add_option("-p", "--profile", action="store", dest="profile_path", help="Set location to save profileing.", default=None)
 parser.add_option("-i", "--language", action="store", dest="language", help="Sets the language for pyfa. Overrides user's saved settings. Format: xx_YY (eg: en_US). If translation doesn't exist, defaults to en_US", default=None)
+parser.add_option("--startup-report", action="store", dest="startup_report", help="Write wall time of startup phases and imports into this JSON file", default=None)
+parser.add_option("--recalc-report", action="store", dest="recalc_report", default=None,
+                  help="Profile fit recalculations and write time spent per effect, item and command boost into this JSON file on exit")
+parser.add_option("--headless", action="store_true", dest="headless", help="Initialize services without GUI and exit (use with --startup-report)", default=False)
+parser.add_option("--serve", action="store", type="int", dest="serve_port", help="Run without GUI as fit evaluation HTTP server on this port", default=None)
+parser.add_option("--serve-host", action="store", dest="serve_host", help="Address for the fit server to listen on", default="127.0.0.1")
+parser.add_option("--serve-workers", action="store", type="int", dest="serve_workers", help="Amount of fit server worker processes", default=None)
 
 (options, args) = parser.parse_args()
 
+if not options.startup_report:
+    startupProfiler.disable()
+
 if __name__ == "__main__":
 
+    # Fit server workers of frozen builds are started through this very script
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     try:
         # first and foremost - check required libraries
-        version_precheck()
+        with startupProfiler.phase('version precheck'):
+            version_precheck()
     except PreCheckException as ex:
         # do not pass GO, go directly to jail (and then die =/)
         PreCheckMessage(str(ex))
         sys.exit()
 
     # from here, we can assume we have the libraries that we need, including wx
-    import wx
+    with startupProfiler.phase('wx import'):
+        import wx
 
     from logbook import Logger
 
@@ -107,8 +130,9 @@ if __name__ == "__main__":
 
     config.language = options.language
 
-    config.defPaths(options.savepath)
-    config.defLogging()
+    with startupProfiler.phase('paths and logging'):
+        config.defPaths(options.savepath)
+        config.defLogging()
 
     with config.logging_setup.threadbound():
 
@@ -122,33 +146,70 @@ if __name__ == "__main__":
         else:
             pyfalog.info("Running in a thawed state.")
 
-        if db_needs_update() is True:
-            update_db()
+        with startupProfiler.phase('gamedata update'):
+            if db_needs_update() is True:
+                update_db()
 
         # Lets get to the good stuff, shall we?
-        import eos.db
-        import eos.events  # todo: move this to eos initialization?
+        with startupProfiler.phase('eos.db import'):
+            import eos.db
+            import eos.events  # todo: move this to eos initialization?
+
+        if options.recalc_report:
+            from eos.recalcProfiler import recalcProfiler
+            recalcProfiler.enable()
 
         # noinspection PyUnresolvedReferences
-        import service.prefetch  # noqa: F401
+        with startupProfiler.phase('saveddata migration'):
+            import service.prefetch  # noqa: F401
 
         # Make sure the saveddata db exists
         if not os.path.exists(config.savePath):
             os.mkdir(config.savePath)
 
         eos.db.saveddata_meta.create_all()
-        from gui.app import PyfaApp
 
-        # set title if it wasn't supplied by argument
-        if options.title is None:
-            options.title = "pyfa %s - Python Fitting Assistant" % (config.getVersion())
+        def finishStartupReport():
+            startupProfiler.stop()
+            if not options.startup_report:
+                return
+            startupProfiler.writeReport(options.startup_report, version=config.getVersion(), headless=options.headless)
+            for line in startupProfiler.summary():
+                pyfalog.info(line)
+            pyfalog.info("Startup report written to: {0}", options.startup_report)
+
+        if options.serve_port is not None:
+            # Workers load gamedata on their own, server process only passes fits around
+            finishStartupReport()
+            from service.fitServer import serveFits
+            serveFits(options.serve_host, options.serve_port, workers=options.serve_workers, savePath=options.savepath)
+            sys.exit()
+
+        if options.headless:
+            # Build everything GUI would request on its first draw, then bail out
+            from service.market import Market
+            with startupProfiler.phase('market'):
+                Market.getInstance()
+            finishStartupReport()
+            sys.exit()
+
+        with startupProfiler.phase('wx app'):
+            from gui.app import PyfaApp
 
-        pyfa = PyfaApp(False)
+            # set title if it wasn't supplied by argument
+            if options.title is None:
+                options.title = "pyfa %s - Python Fitting Assistant" % (config.getVersion())
 
-        from gui.mainFrame import MainFrame
+            pyfa = PyfaApp(False)
 
-        mf = MainFrame(options.title)
-        ErrorHandler.SetParent(mf)
+        with startupProfiler.phase('main frame'):
+            from gui.mainFrame import MainFrame
+
+            mf = MainFrame(options.title)
+            ErrorHandler.SetParent(mf)
+
+        # Commit saveddata changes in batches instead of after every edit
+        eos.db.writeBehind.enable(lambda delay, func: wx.CallAfter(wx.CallLater, int(delay * 1000), func))
 
         # Start ESI token validation, this helps avoid token expiry
         try:
@@ -161,6 +222,15 @@ if __name__ == "__main__":
         except Exception as e:
             pyfalog.warning(f"failed to start ESI token validation thread:\n{e}")
 
+        # Full price snapshots are refreshed in background, if enabled
+        from service.priceSnapshot import PriceSnapshot
+        PriceSnapshot.getInstance().startScheduler()
+
+        # Database corruption checks are not needed to show the UI
+        service.prefetch.startDeferredValidation()
+
+        finishStartupReport()
+
         if options.profile_path:
             profile_path = os.path.join(options.profile_path, 'pyfa-{}.profile'.format(datetime.datetime.now().strftime('%Y%m%d_%H%M%S')))
             pyfalog.debug("Starting pyfa with a profiler, saving to {}".format(profile_path))
@@ -183,5 +253,19 @@ if __name__ == "__main__":
         for t in stoppableThreads:
             t.join(timeout=timer.remainder())
 
+        # Everything has to be on disk before DB state is remembered
+        eos.db.writeBehind.disable()
+        service.prefetch.storeValidationState()
+
+        # Logged on debug level only
+        from eos.utils.statCache import statCacheCounters
+        statCacheCounters.logReport()
+        from eos.utils.queryCache import queryCaches
+        queryCaches.logReport()
+
+        if options.recalc_report:
+            recalcProfiler.writeReport(options.recalc_report)
+            pyfalog.info("Recalc report written to: {0}", options.recalc_report)
+
         # Nah, just kidding, no way to terminate threads - just try to exit
         sys.exit()
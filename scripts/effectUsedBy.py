@@ -60,7 +60,7 @@ from optparse import OptionParser
 script_dir = os.path.dirname(__file__)
 
 # Form list of effects for processing
-effects_path = os.path.join(script_dir, "..", "eos", "effects.py")
+effects_dir = os.path.join(script_dir, "..", "eos", "effects")
 
 usage = "usage: %prog --database=DB [--debug=DEBUG]"
 parser = OptionParser(usage=usage)
@@ -392,13 +392,19 @@ for typeid in publishedtypes:
 # Stage 2
 
 effectids_eos = set()
+# Format: {effect ID: path to file with its definition}
+effectpaths_eos = {}
 
-with open(effects_path) as f:
-    for line in f:
-        m = re.match(r"class Effect(\d+)\(", line)
-        if m:
-            effectid = int(m.group(1))
-            effectids_eos.add(effectid)
+for effects_file in os.listdir(effects_dir):
+    if not effects_file.endswith(".py"):
+        continue
+    with open(os.path.join(effects_dir, effects_file)) as f:
+        for line in f:
+            m = re.match(r"class Effect(\d+)\(", line)
+            if m:
+                effectid = int(m.group(1))
+                effectids_eos.add(effectid)
+                effectpaths_eos[effectid] = os.path.join(effects_dir, effects_file)
 
 # Go through effect definitions
 for effectid in effectids_eos:
@@ -1038,6 +1044,7 @@ inner score: {5:.3})"
     docstring_new = [f'    {l}' if l else '' for l in docstring_new]
     # If we're not debugging - write changes to the file
     if DEBUG_LEVEL == 0:
+        effects_path = effectpaths_eos[effectid]
         with open(effects_path) as f:
             data = f.read()
         lines = data.splitlines()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Distribute effect classes into shard modules of eos.effects package and regenerate
+the registry which maps effect IDs to shards.
+
+Effect classes are grouped by ID range, so that only few shards have to be imported
+when fits are calculated. Run this script after adding, removing or moving effects
+around; classes can be added to any shard (or to a new module in the package), the
+script will put them where they belong.
+"""
+
+import os
+import re
+from optparse import OptionParser
+
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+effects_dir = os.path.realpath(os.path.join(script_dir, '..', 'eos', 'effects'))
+# Pre-split location of effect classes; picked up if it exists
+legacy_path = os.path.realpath(os.path.join(script_dir, '..', 'eos', 'effects.py'))
+registry_path = os.path.join(effects_dir, '_registry.py')
+
+SHARD_PREFIX = 'effects_'
+
+LICENSE_HEADER = '''\
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+'''
+
+SHARD_IMPORTS = '''\
+import eos.config
+from eos.calc import calculateRangeFactor
+from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effects import BaseEffect
+from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
+'''
+
+
+def iter_effect_classes(path):
+    """Yield (effect ID, class source) for all effect classes defined in the file."""
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    effect_id = None
+    class_lines = []
+    for line in lines + ['<EOF>']:
+        # Any top-level statement terminates previous class
+        if line and not line[0].isspace() and not line.startswith('#'):
+            if effect_id is not None:
+                while class_lines and not class_lines[-1].strip():
+                    class_lines.pop()
+                yield effect_id, '\n'.join(class_lines)
+                effect_id = None
+            m = re.match(r'class Effect(\d+)\(', line)
+            if m:
+                effect_id = int(m.group(1))
+                class_lines = []
+        if effect_id is not None:
+            class_lines.append(line)
+
+
+def shard_name(effect_id, range_size):
+    return '{}{:06d}'.format(SHARD_PREFIX, effect_id // range_size * range_size)
+
+
+def main():
+    parser = OptionParser(usage='usage: %prog [--range=SIZE]')
+    parser.add_option('-r', '--range', help='amount of effect IDs covered by single shard',
+                      type='int', default=500)
+    (options, args) = parser.parse_args()
+
+    sources = []
+    if os.path.isfile(legacy_path):
+        sources.append(legacy_path)
+    sources.extend(
+        os.path.join(effects_dir, fname) for fname in sorted(os.listdir(effects_dir))
+        if fname.endswith('.py') and not fname.startswith('_'))
+
+    effects = {}
+    for path in sources:
+        for effect_id, source in iter_effect_classes(path):
+            if effect_id in effects:
+                raise ValueError('Effect {} is defined more than once'.format(effect_id))
+            effects[effect_id] = source
+
+    shards = {}
+    for effect_id in sorted(effects):
+        shards.setdefault(shard_name(effect_id, options.range), []).append(effect_id)
+
+    for path in sources:
+        if path != legacy_path and os.path.splitext(os.path.basename(path))[0] not in shards:
+            os.remove(path)
+    for name, effect_ids in shards.items():
+        with open(os.path.join(effects_dir, '{}.py'.format(name)), 'w', encoding='utf-8') as f:
+            f.write(LICENSE_HEADER)
+            f.write('\n\n')
+            f.write(SHARD_IMPORTS)
+            for effect_id in effect_ids:
+                f.write('\n\n')
+                f.write(effects[effect_id])
+                f.write('\n')
+
+    with open(registry_path, 'w', encoding='utf-8') as f:
+        f.write('# Generated by scripts/effect_shards.py, do not edit manually\n')
+        f.write('# Format: {effect ID: name of eos.effects module which defines its class}\n')
+        f.write('effectShards = {\n')
+        for name, effect_ids in shards.items():
+            for effect_id in effect_ids:
+                f.write("    {}: '{}',\n".format(effect_id, name))
+        f.write('}\n')
+
+    if os.path.isfile(legacy_path):
+        os.remove(legacy_path)
+    print('{} effects written into {} shards'.format(len(effects), len(shards)))
+
+
+if __name__ == '__main__':
+    main()
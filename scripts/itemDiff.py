@@ -56,14 +56,17 @@ def main(old, new, groups=True, effects=True, attributes=True, renames=True):
 
     # Initialization of few things used by both changed/renamed effects list
     script_dir = os.path.dirname(__file__)
-    effectspath = os.path.join(script_dir, "..", "eos", "effects.py")
+    effectsdir = os.path.join(script_dir, "..", "eos", "effects")
     implemented = set()
 
-    with open(effectspath) as f:
-        for line in f:
-            for m in re.finditer(r'class Effect(?P<eid>\d+)\(BaseEffect\):', line):
-                effectid = int(m.group('eid'))
-                implemented.add(effectid)
+    for effectsfile in os.listdir(effectsdir):
+        if not effectsfile.endswith(".py"):
+            continue
+        with open(os.path.join(effectsdir, effectsfile)) as f:
+            for line in f:
+                for m in re.finditer(r'class Effect(?P<eid>\d+)\(BaseEffect\):', line):
+                    effectid = int(m.group('eid'))
+                    implemented.add(effectid)
 
     # Effects' names are used w/o any special symbols by eos
     stripspec = "[^A-Za-z0-9]"
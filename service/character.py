@@ -34,6 +34,7 @@ import wx
 import config
 import eos.db
 from service.esi import Esi
+from service.esiSync import EsiCharacterSync
 
 from eos.saveddata.implant import Implant as es_Implant
 from eos.saveddata.character import Character as es_Character, Skill
@@ -384,6 +385,14 @@ class Character:
         thread = UpdateAPIThread(charID, (self.apiFetchCallback, callback))
         thread.start()
 
+    def apiFetchAll(self, callback):
+        """
+        Fetch skills of all SSO characters at once. Callback gets {SSO character name: exception}
+        for characters which failed to sync, or exception info if the whole sync failed.
+        """
+        thread = UpdateAllAPIThread((self.apiFetchCallback, callback))
+        thread.start()
+
     def apiFetchCallback(self, guiCallback, e=None):
         eos.db.commit()
         wx.CallAfter(guiCallback, e)
@@ -508,21 +517,27 @@ class UpdateAPIThread(threading.Thread):
             if not self.running:
                 self.callback[0](self.callback[1])
                 return
-            resp = sEsi.getSkills(ssoChar.ID)
+            result = EsiCharacterSync(sEsi).fetch(ssoChar)
+            if result.error is not None:
+                raise result.error
 
             if not self.running:
                 self.callback[0](self.callback[1])
                 return
-            # todo: check if alpha. if so, pop up a question if they want to apply it as alpha. Use threading events to set the answer?
-            char.clearSkills()
-            for skillRow in resp["skills"]:
-                char.addSkill(Skill(char, skillRow["skill_id"], skillRow["trained_skill_level"]))
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            pyfalog.warn(ex)
+            self.callback[0](self.callback[1], sys.exc_info())
+            return
+        # Characters are shared with the rest of pyfa, change them in main thread only
+        wx.CallAfter(self.applyResult, char, result)
 
-            if not self.running:
-                self.callback[0](self.callback[1])
-                return
-            resp = sEsi.getSecStatus(ssoChar.ID)
-            char.secStatus = resp['security_status']
+    def applyResult(self, char, result):
+        try:
+            # todo: check if alpha. if so, pop up a question if they want to apply it as alpha. Use threading events to set the answer?
+            char.apiUpdateSkills(result.skills)
+            char.secStatus = result.secStatus
             self.callback[0](self.callback[1])
         except (KeyboardInterrupt, SystemExit):
             raise
@@ -532,3 +547,53 @@ class UpdateAPIThread(threading.Thread):
 
     def stop(self):
         self.running = False
+
+
+class UpdateAllAPIThread(threading.Thread):
+    """Sync skills of all characters linked to SSO characters, see service.esiSync"""
+
+    def __init__(self, callback):
+        threading.Thread.__init__(self)
+
+        self.name = "CheckUpdateAll"
+        self.callback = callback
+        self.running = True
+
+    def run(self):
+        try:
+            sEsi = Esi.getInstance()
+            ssoChars = [c for c in sEsi.getSsoCharacters() if c.characters]
+            results = EsiCharacterSync(sEsi).fetchAll(ssoChars, running=lambda: self.running)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            pyfalog.warn(ex)
+            self.callback[0](self.callback[1], sys.exc_info())
+            return
+        # Characters are shared with the rest of pyfa, change them in main thread only
+        wx.CallAfter(self.applyResults, results)
+
+    def applyResults(self, results):
+        try:
+            failed = {}
+            # Everything is applied in one go, with single commit in callback
+            for result in results:
+                if result is None:
+                    continue
+                if result.error is not None:
+                    failed[result.ssoChar.characterName] = result.error
+                    continue
+                for char in result.ssoChar.characters:
+                    if char.ro:
+                        continue
+                    char.apiUpdateSkills(result.skills)
+                    char.secStatus = result.secStatus
+            self.callback[0](self.callback[1], failed)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            pyfalog.warn(ex)
+            self.callback[0](self.callback[1], sys.exc_info())
+
+    def stop(self):
+        self.running = False
@@ -17,6 +17,8 @@ from gui.ssoLogin import SsoLogin
 from service.server import StoppableHTTPServer, AuthHandler
 from service.settings import EsiSettings
 from service.esiAccess import EsiAccess
+from service.esiBulk import EsiBulkFittings
+from service.esiSync import EsiCharacterSync
 import gui.mainFrame
 
 from requests import Session
@@ -37,21 +39,15 @@ class EsiTokenValidationThread(threading.Thread):
             try:
                 esi = Esi.getInstance()
                 chars = esi.getSsoCharacters()
+                expired = [char for char in chars if char.is_token_expired()]
+                pyfalog.debug(f"{len(chars) - len(expired)} tokens valid, refreshing {len(expired)}")
 
-                for char in chars:
-                    if not self.running:
-                        return
-
-                    if char.is_token_expired():
-                        pyfalog.info(f"Token expired for {char.characterName}, attempting refresh")
-                        try:
-                            esi.refresh(char)
-                            eos.db.save(char)
-                            pyfalog.info(f"Successfully refreshed token for {char.characterName}")
-                        except Exception as e:
-                            pyfalog.error(f"Failed to refresh token for {char.characterName}: {e}")
-                    else:
-                        pyfalog.debug(f"Token valid for {char.characterName}")
+                # Refreshes run in parallel, saving stays in this thread
+                failed = EsiCharacterSync(esi).refreshTokens(expired, running=lambda: self.running)
+                for char in expired:
+                    if char not in failed and not char.is_token_expired():
+                        eos.db.save(char)
+                        pyfalog.info(f"Successfully refreshed token for {char.characterName}")
 
             except Exception as e:
                 pyfalog.error(f"Error validating ESI tokens: {e}")
@@ -139,6 +135,56 @@ class Esi(EsiAccess):
         super().delFitting(char, fittingID)
         self.fittings_deleted.add(fittingID)
 
+    def __runBulkFittings(self, action, jobs, progress):
+        # Characters are looked up here, worker threads only talk to ESI
+        ssoChars = {}
+        for charID, _ in jobs:
+            if charID not in ssoChars:
+                ssoChars[charID] = self.getSsoCharacter(charID)
+        jobs = [(ssoChars[charID], arg) for charID, arg in jobs]
+
+        def bulkFittingsWorkerFunc():
+            results = error = None
+            try:
+                results = getattr(EsiBulkFittings(self), action)(jobs, progress)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.error(e)
+                error = e
+            finally:
+                progress.workerDone(results, error)
+
+        threading.Thread(target=bulkFittingsWorkerFunc, name="EsiBulkFittings", daemon=True).start()
+
+    def postFittingsThreaded(self, jobs, progress):
+        """
+        Upload fittings in background, see service.esiBulk.EsiBulkFittings.upload.
+
+        :param jobs: list of (SSO character ID, ESI fitting JSON string)
+        :param progress: ProgressHelper, its callback gets list of results (None if whole upload
+        failed) and exception or None; results are reported via workerDone(), so that callback
+        can be deferred until worker is done if user cancels
+        """
+        self.__runBulkFittings('upload', jobs, progress)
+
+    def delFittingsThreaded(self, jobs, progress):
+        """
+        Delete fittings in background, see service.esiBulk.EsiBulkFittings.delete.
+
+        :param jobs: list of (SSO character ID, fitting ID)
+        :param progress: ProgressHelper, its callback gets list of results (None if whole deletion
+        failed) and exception or None; results are reported via workerDone(), so that callback
+        can be deferred until worker is done if user cancels
+        """
+        self.__runBulkFittings('delete', jobs, progress)
+
+    def applyDeletedFittings(self, results):
+        """Hide successfully deleted fittings in fitting browser"""
+        for result in results or ():
+            if result is not None and result.error is None:
+                self.fittings_deleted.add(result.fittingID)
+
     def login(self):
         start_server = self.settings.get('loginMode') == EsiLoginMethod.SERVER and self.server_base.supports_auto_login
         with gui.ssoLogin.SsoLogin(self.server_base, start_server) as dlg:
@@ -1,4 +1,6 @@
 # noinspection PyPackageRequirements
+import copy
+import threading
 from collections import namedtuple
 
 import requests
@@ -21,10 +23,14 @@ from datetime import timedelta
 from requests_cache import CachedSession
 
 from requests import Session
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
 
 pyfalog = Logger(__name__)
 
+# Connections kept open per host, should cover the most parallel requests done (see service.esiBulk)
+ESI_POOL_SIZE = 16
+
 scopes = [
     'esi-skills.read_skills.v1',
     'esi-fittings.read_fittings.v1',
@@ -39,10 +45,11 @@ class GenericSsoError(Exception):
 class APIException(Exception):
     """ Exception for API related errors """
 
-    def __init__(self, url, code, json_response):
+    def __init__(self, url, code, json_response, headers=None):
         self.url = url
         self.status_code = code
         self.response = json_response
+        self.headers = headers if headers is not None else {}
         super(APIException, self).__init__(str(self))
 
 
@@ -71,10 +78,17 @@ class EsiAccess:
             )
         }
         self._session.headers.update(self._basicHeaders)
+        for prefix in ('https://', 'http://'):
+            self._session.mount(prefix, HTTPAdapter(pool_connections=ESI_POOL_SIZE, pool_maxsize=ESI_POOL_SIZE))
         self._session.proxies = NetworkSettings.getInstance().getProxySettingsInRequestsFormat()
 
         self.mem_cached_session = {}
 
+        # Conditional request cache for endpoints which send ETags. Format: {url: (ETag, response)}
+        self.etagCache = {}
+        # Requests may come from several threads at once (see service.esiSync), guards server switching
+        self.serverLock = threading.Lock()
+
         # Set up cached session. This is only used for SSO meta data for now, but can be expanded to actually handle
         # various ESI caching (using ETag, for example) in the future
         self.cached_session = CachedSession(
@@ -114,6 +128,9 @@ class EsiAccess:
 
     @property
     def esi_url(self):
+        # Full URLs are allowed for ESI mocks
+        if '://' in self.server_base.esi:
+            return self.server_base.esi
         return 'https://%s' % self.server_base.esi
 
     @property
@@ -198,17 +215,21 @@ class EsiAccess:
         return json_res, decoded_jwt
 
     def refresh(self, ssoChar):
+        json_res = self.refresh_call(ssoChar.refreshToken)
+        self.update_token(ssoChar, json_res)
+        return json_res
+
+    def refresh_call(self, refresh_token):
+        """ request new tokens for encrypted refresh token, without touching the character it belongs to """
         # todo: properly handle invalid refresh token
         values = {
             "grant_type": "refresh_token",
-            "refresh_token": config.cipher.decrypt(ssoChar.refreshToken).decode(),
+            "refresh_token": config.cipher.decrypt(refresh_token).decode(),
             "client_id": self.client_id,
         }
 
         res = self.token_call(values)
-        json_res = res.json()
-        self.update_token(ssoChar, json_res)
-        return json_res
+        return res.json()
 
     def token_call(self, values):
         headers = {
@@ -270,51 +291,81 @@ class EsiAccess:
             raise GenericSsoError("The issuer claim was not from login.eveonline.com or "
                 "https://login.eveonline.com: {}".format(str(e)))
 
+    def select_server(self, ssoChar):
+        """ Switch to server of the character, or to the default one if no character is passed """
+        server_base = config.supported_servers[ssoChar.server] if ssoChar else self.default_server_base
+        with self.serverLock:
+            if server_base != self.server_base:
+                self.init(server_base)
+
     def _before_request(self, ssoChar):
-        if ssoChar:
-            self.init(config.supported_servers[ssoChar.server])
-        else:
-            self.init(self.default_server_base)
+        """ Switch to server of the character if needed, refresh its token if expired
 
-        self._session.headers.clear()
-        self._session.headers.update(self._basicHeaders)
+        :return: a dict with headers for the request. Authorization is passed per request
+        instead of being set on the session, so that requests for several characters can run at once
+        """
+        self.select_server(ssoChar)
+
+        headers = dict(self._basicHeaders)
         if ssoChar is None:
-            return
+            return headers
 
         if ssoChar.is_token_expired():
             pyfalog.info("Refreshing token for {}".format(ssoChar.characterName))
             self.refresh(ssoChar)
 
         if ssoChar.accessToken is not None:
-            self._session.headers.update(self.get_oauth_header(ssoChar.accessToken))
+            headers.update(self.get_oauth_header(ssoChar.accessToken))
+        return headers
 
     def _after_request(self, resp):
         if "warning" in resp.headers:
             pyfalog.warn("{} - {}".format(resp.headers["warning"], resp.url))
 
         if resp.status_code >= 400:
+            try:
+                data = resp.json()
+            except ValueError:
+                # Proxies and gateways in front of ESI do not always reply with JSON
+                data = {'error': resp.text}
             raise APIException(
                 resp.url,
                 resp.status_code,
-                resp.json()
+                data,
+                resp.headers
             )
 
         return resp
 
-    def get(self, ssoChar, endpoint, **kwargs):
-        self._before_request(ssoChar)
+    def get(self, ssoChar, endpoint, conditional=False, **kwargs):
+        """ GET the endpoint. Conditional requests send ETag of the last response from the same URL, if there was
+        any, and get that response back if ESI replies that nothing has changed; its from_cache attribute is set then.
+        """
+        headers = self._before_request(ssoChar)
         endpoint = endpoint.format(**kwargs)
-        return self._after_request(self._session.get("{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower())))
+        url = "{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower())
+        cached = self.etagCache.get(url) if conditional else None
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        resp = self._after_request(self._session.get(url, headers=headers))
+        if cached is not None and resp.status_code == 304:
+            resp = copy.copy(cached[1])
+            resp.from_cache = True
+            return resp
+        resp.from_cache = False
+        if conditional and 'ETag' in resp.headers:
+            self.etagCache[url] = (resp.headers['ETag'], resp)
+        return resp
 
     def post(self, ssoChar, endpoint, json, **kwargs):
-        self._before_request(ssoChar)
+        headers = self._before_request(ssoChar)
         endpoint = endpoint.format(**kwargs)
-        return self._after_request(self._session.post("{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower()), data=json))
+        return self._after_request(self._session.post("{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower()), data=json, headers=headers))
 
     def delete(self, ssoChar, endpoint, **kwargs):
-        self._before_request(ssoChar)
+        headers = self._before_request(ssoChar)
         endpoint = endpoint.format(**kwargs)
-        return self._after_request(self._session.delete("{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower())))
+        return self._after_request(self._session.delete("{}{}?datasource={}".format(self.esi_url, endpoint, self.server_name.lower()), headers=headers))
 
     # todo: move these off to another class which extends this one. This class should only handle the low level
     # authentication and
@@ -322,13 +373,13 @@ class EsiAccess:
         return self.get(None, EsiEndpoints.DYNAMIC_ITEM.value, type_id=typeID, item_id=itemID)
 
     def getSkills(self, char):
-        return self.get(char, EsiEndpoints.CHAR_SKILLS.value, character_id=char.characterID)
+        return self.get(char, EsiEndpoints.CHAR_SKILLS.value, conditional=True, character_id=char.characterID)
 
     def getSecStatus(self, char):
         return self.get(char, EsiEndpoints.CHAR.value, character_id=char.characterID)
 
     def getFittings(self, char):
-        return self.get(char, EsiEndpoints.CHAR_FITTINGS.value, character_id=char.characterID)
+        return self.get(char, EsiEndpoints.CHAR_FITTINGS.value, conditional=True, character_id=char.characterID)
 
     def postFitting(self, char, json_str):
         # @todo: new fitting ID can be recovered from resp.data,
@@ -0,0 +1,233 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import threading
+import time
+
+import requests
+from logbook import Logger
+from urllib3.exceptions import NewConnectionError
+
+from service.const import EsiEndpoints
+from service.esiAccess import APIException
+from service.esiSync import EsiCharacterSync, runPerServer
+
+
+pyfalog = Logger(__name__)
+
+
+class EsiErrorLimiter:
+    """
+    Keeps requests within ESI error limit. ESI reports errors left in current window
+    and seconds until the window resets in X-ESI-Error-Limit-* headers of every
+    response; once only safety margin is left, requests wait for the reset instead
+    of getting the client banned.
+    """
+
+    safetyMargin = 10
+
+    def __init__(self, clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.remain = None
+        self.resetAt = None
+
+    def wait(self):
+        while True:
+            with self.lock:
+                if self.remain is None or self.remain > self.safetyMargin:
+                    return
+                delay = self.resetAt - self.clock()
+                if delay <= 0:
+                    # New window, headers of next response will tell the truth
+                    self.remain = None
+                    return
+            pyfalog.info("ESI error limit nearly reached, waiting {:.1f}s", delay)
+            self.sleep(delay)
+
+    def update(self, headers):
+        try:
+            remain = int(headers['X-ESI-Error-Limit-Remain'])
+            reset = int(headers['X-ESI-Error-Limit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self.lock:
+            self.remain = remain
+            self.resetAt = self.clock() + reset
+
+    def block(self, reset):
+        """Wait reset seconds before next request, as ESI refuses them (HTTP 420)"""
+        with self.lock:
+            self.remain = 0
+            self.resetAt = self.clock() + reset
+
+
+class BulkFittingResult:
+    """Outcome of one upload or deletion"""
+
+    __slots__ = ('ssoChar', 'data', 'fittingID', 'error')
+
+    def __init__(self, ssoChar, data=None, fittingID=None):
+        self.ssoChar = ssoChar
+        # ESI JSON of uploaded fitting
+        self.data = data
+        # ID of uploaded or deleted fitting
+        self.fittingID = fittingID
+        self.error = None
+
+
+class EsiBulkFittings:
+    """
+    Uploads and deletes many ESI fittings, possibly of several characters, at once.
+    Requests share pooled session of passed ESI access, run in parallel and are
+    retried with exponential backoff. Deletions are retried on connection errors,
+    server errors and when ESI error limit is hit. Creating a fitting is not
+    idempotent, ESI could have stored it before failing, so uploads are retried only
+    when they were refused or never got to the server.
+    """
+
+    maxWorkers = 8
+    maxRetries = 3
+    backoff = 1.0
+    # HTTP codes worth retrying, others mean request itself is wrong
+    retryCodes = frozenset((420, 429, 500, 502, 503, 504))
+    # HTTP codes meaning request was refused without being processed
+    refusedCodes = frozenset((420, 429))
+
+    def __init__(self, esi, maxWorkers=None, limiter=None, sleep=time.sleep):
+        """
+        :param esi: service.esiAccess.EsiAccess (or subclass) to do requests with
+        """
+        self.esi = esi
+        if maxWorkers is not None:
+            self.maxWorkers = maxWorkers
+        self.limiter = limiter if limiter is not None else EsiErrorLimiter()
+        self.sleep = sleep
+
+    @staticmethod
+    def isNotSent(ex):
+        """True if connection error happened before request could get to the server"""
+        if isinstance(ex, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(ex.args[0], 'reason', None) if ex.args else None
+        return isinstance(ex, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def __request(self, call, idempotent=True):
+        """
+        :param idempotent: if False, request is not retried when it might have been processed
+        """
+        retryCodes = self.retryCodes if idempotent else self.refusedCodes
+        attempt = 0
+        while True:
+            self.limiter.wait()
+            try:
+                resp = call()
+            except APIException as ex:
+                self.limiter.update(ex.headers)
+                if ex.status_code not in retryCodes or attempt >= self.maxRetries:
+                    raise
+                if ex.status_code == 420:
+                    self.limiter.block(int(ex.headers.get('X-ESI-Error-Limit-Reset', 60)))
+                pyfalog.warning("ESI request failed with HTTP {}, retrying", ex.status_code)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as ex:
+                if attempt >= self.maxRetries or not (idempotent or self.isNotSent(ex)):
+                    raise
+                pyfalog.warning("ESI request failed: {}, retrying", ex)
+            else:
+                self.limiter.update(resp.headers)
+                return resp
+            self.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    def __run(self, jobs, function, progress):
+        """Run function for every (SSO character, argument) job, reporting to ProgressHelper if passed"""
+        jobs = list(jobs)
+        progressLock = threading.Lock()
+
+        def running():
+            return progress is None or not progress.userCancelled
+
+        def runJob(job):
+            result = function(*job)
+            if progress is not None:
+                with progressLock:
+                    progress.current += 1
+            return result
+
+        # Refresh expired tokens once per character, rather than in every worker using it
+        ssoChars = list({id(c): c for c, _ in jobs}.values())
+        tokenErrors = EsiCharacterSync(self.esi, self.maxWorkers).refreshTokens(ssoChars, running)
+        results = runPerServer(runJob, [j for j in jobs if j[0] not in tokenErrors], self.maxWorkers, running, lambda j: j[0])
+        results = iter(results)
+        out = []
+        for ssoChar, arg in jobs:
+            if ssoChar in tokenErrors:
+                result = BulkFittingResult(ssoChar)
+                result.error = tokenErrors[ssoChar]
+            else:
+                result = next(results)
+            out.append(result)
+        return out
+
+    def __upload(self, ssoChar, data):
+        result = BulkFittingResult(ssoChar, data=data)
+        try:
+            resp = self.__request(lambda: self.esi.post(
+                ssoChar, EsiEndpoints.CHAR_FITTINGS.value, data, character_id=ssoChar.characterID), idempotent=False)
+            result.fittingID = resp.json().get('fitting_id')
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to upload fitting for {}: {}", ssoChar.characterName, e)
+            result.error = e
+        return result
+
+    def __delete(self, ssoChar, fittingID):
+        result = BulkFittingResult(ssoChar, fittingID=fittingID)
+        try:
+            self.__request(lambda: self.esi.delete(
+                ssoChar, EsiEndpoints.CHAR_DEL_FIT.value, character_id=ssoChar.characterID, fitting_id=fittingID))
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to delete fitting {} of {}: {}", fittingID, ssoChar.characterName, e)
+            result.error = e
+        return result
+
+    def upload(self, jobs, progress=None):
+        """
+        Upload fittings.
+
+        :param jobs: iterable of (SSO character, ESI fitting JSON string)
+        :param progress: ProgressHelper; gets one step per job and stops remaining jobs when cancelled
+        :return: list of BulkFittingResult in order of jobs, None for jobs skipped after cancellation
+        """
+        return self.__run(jobs, self.__upload, progress)
+
+    def delete(self, jobs, progress=None):
+        """
+        Delete fittings.
+
+        :param jobs: iterable of (SSO character, fitting ID)
+        :param progress: ProgressHelper; gets one step per job and stops remaining jobs when cancelled
+        :return: list of BulkFittingResult in order of jobs, None for jobs skipped after cancellation
+        """
+        return self.__run(jobs, self.__delete, progress)
@@ -0,0 +1,164 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+
+from logbook import Logger
+
+import eos.db
+from service.const import EsiEndpoints
+
+
+pyfalog = Logger(__name__)
+
+
+def runPerServer(function, items, maxWorkers, running=lambda: True, getSsoChar=lambda item: item):
+    """
+    Run function for every item, in parallel for items of the same server. Servers
+    are done one after another, as switching them re-inits ESI access.
+
+    :param running: callable, remaining items are skipped once it returns False
+    :param getSsoChar: callable returning SSO character of item
+    :return: list of function results in the same order as passed items, None for skipped ones
+    """
+    items = list(items)
+    results = [None] * len(items)
+    order = sorted(range(len(items)), key=lambda i: getSsoChar(items[i]).server or '')
+    for server, indices in groupby(order, key=lambda i: getSsoChar(items[i]).server or ''):
+        if not running():
+            break
+        with ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='EsiSync') as executor:
+            futures = [(i, executor.submit(lambda item=items[i]: function(item) if running() else None)) for i in indices]
+            for i, future in futures:
+                results[i] = future.result()
+    return results
+
+
+class CharacterSyncResult:
+    """Data fetched for one SSO character"""
+
+    __slots__ = ('ssoChar', 'skills', 'secStatus', 'fittings', 'modified', 'error')
+
+    def __init__(self, ssoChar):
+        self.ssoChar = ssoChar
+        # Format: {skill type ID: trained level}
+        self.skills = None
+        self.secStatus = None
+        self.fittings = None
+        # False when ESI reported that neither skills nor fittings changed since last sync
+        self.modified = False
+        self.error = None
+
+
+class EsiCharacterSync:
+    """
+    Fetches data of many SSO characters from ESI at once. Characters of the same
+    server are requested in parallel, up to maxWorkers at a time; skills and
+    fittings are requested conditionally, so unchanged data costs a 304. Workers
+    only talk to ESI, applying results to characters is left to the caller's thread.
+    """
+
+    maxWorkers = 8
+
+    def __init__(self, esi, maxWorkers=None):
+        """
+        :param esi: service.esiAccess.EsiAccess (or subclass) to do requests with
+        """
+        self.esi = esi
+        if maxWorkers is not None:
+            self.maxWorkers = maxWorkers
+
+    def fetch(self, ssoChar, skills=True, fittings=False):
+        result = CharacterSyncResult(ssoChar)
+        try:
+            if skills:
+                resp = self.esi.get(ssoChar, EsiEndpoints.CHAR_SKILLS.value, conditional=True, character_id=ssoChar.characterID)
+                result.skills = {r['skill_id']: r['trained_skill_level'] for r in resp.json()['skills']}
+                result.modified = result.modified or not resp.from_cache
+                resp = self.esi.get(ssoChar, EsiEndpoints.CHAR.value, character_id=ssoChar.characterID)
+                result.secStatus = resp.json().get('security_status')
+            if fittings:
+                resp = self.esi.get(ssoChar, EsiEndpoints.CHAR_FITTINGS.value, conditional=True, character_id=ssoChar.characterID)
+                result.fittings = resp.json()
+                result.modified = result.modified or not resp.from_cache
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.warning("Failed to sync {}: {}", ssoChar.characterName, e)
+            result.error = e
+        return result
+
+    def requestToken(self, ssoChar, refreshToken):
+        """Request new token of character, return SSO response or exception if request failed"""
+        try:
+            self.esi.select_server(ssoChar)
+            return self.esi.refresh_call(refreshToken)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to refresh token for {}: {}", ssoChar.characterName, e)
+            return e
+
+    def fetchAll(self, ssoChars, skills=True, fittings=False, running=lambda: True):
+        """
+        Fetch data of all passed SSO characters.
+
+        :param running: callable, remaining characters are skipped once it returns False
+        :return: list of CharacterSyncResult in the same order as passed characters, None for skipped ones
+        """
+        ssoChars = list(ssoChars)
+        # Expired tokens are refreshed up front, so that workers do not update characters
+        tokenErrors = self.refreshTokens(ssoChars, running)
+        results = iter(runPerServer(
+            lambda c: self.fetch(c, skills=skills, fittings=fittings),
+            [c for c in ssoChars if c not in tokenErrors], self.maxWorkers, running))
+        out = []
+        for ssoChar in ssoChars:
+            if ssoChar in tokenErrors:
+                result = CharacterSyncResult(ssoChar)
+                result.error = tokenErrors[ssoChar]
+            else:
+                result = next(results)
+            out.append(result)
+        return out
+
+    def refreshTokens(self, ssoChars, running=lambda: True):
+        """
+        Refresh expired tokens of all passed characters, return {character: exception} for failed ones.
+        Tokens are requested in parallel, characters get them in caller's thread.
+        """
+        # Characters are saveddata objects, workers get their refresh tokens but never touch them
+        jobs = [(c, c.refreshToken) for c in ssoChars if c.is_token_expired()]
+        responses = runPerServer(lambda job: self.requestToken(*job), jobs, self.maxWorkers, running, lambda job: job[0])
+        errors = {}
+        with eos.db.sd_lock:
+            for (ssoChar, _), resp in zip(jobs, responses):
+                if isinstance(resp, Exception):
+                    errors[ssoChar] = resp
+                elif resp is not None:
+                    try:
+                        self.esi.update_token(ssoChar, resp)
+                    except (KeyboardInterrupt, SystemExit):
+                        raise
+                    except Exception as e:
+                        pyfalog.error("Failed to refresh token for {}: {}", ssoChar.characterName, e)
+                        errors[ssoChar] = e
+        return errors
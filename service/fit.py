@@ -19,7 +19,8 @@
 
 import copy
 import datetime
-from time import time
+import threading
+from time import perf_counter, time
 from weakref import WeakSet
 
 import wx
@@ -27,6 +28,7 @@ from logbook import Logger
 
 import eos.db
 from eos.const import FittingModuleState, ImplantLocation
+from eos.recalcProfiler import recalcProfiler
 from eos.saveddata.character import Character as saveddata_Character
 from eos.saveddata.citadel import Citadel as es_Citadel
 from eos.saveddata.damagePattern import DamagePattern as es_DamagePattern
@@ -55,6 +57,144 @@ class DeferRecalc:
         self.sFit.recalc(self.fitID)
 
 
+class RecalcBatch:
+    """Fits recalculated together by RecalcWorkerThread, and callbacks of requests for them"""
+
+    __slots__ = ('fits', 'callbacks', 'handled')
+
+    def __init__(self, fits, callbacks):
+        self.fits = fits
+        # [(fitID, callback)]
+        self.callbacks = callbacks
+        # Set once fits are filled and callbacks are called
+        self.handled = False
+
+
+class RecalcWorkerThread(threading.Thread):
+    """
+    Recalculates fits requested by GUI commands outside of main thread.
+
+    Requests which arrive within COALESCE_DELAY from each other are merged, so that
+    several commands applied to the same fit in quick succession cause single recalc.
+    Once recalc is done, fits are filled and changes are committed in main thread,
+    and request callbacks are called there. Recalc runs under calculation lock, which
+    commands take as well (see FitCommandProcessor), so commands never change fits
+    which are being calculated.
+    """
+
+    # Seconds to wait for more requests before starting recalc
+    COALESCE_DELAY = 0.05
+
+    def __init__(self, sFit):
+        threading.Thread.__init__(self)
+        self.name = "RecalcWorker"
+        self.daemon = True
+        self.sFit = sFit
+        self.running = True
+        self.cv = threading.Condition()
+        # {fitID: fit}, fits pending recalc
+        self.pendingFits = {}
+        # [(fitID, callback)], callbacks of pending requests
+        self.pendingCallbacks = []
+        self.lastRequestTime = 0
+        # Batch being recalculated
+        self.inFlight = None
+        # Batches recalculated, but maybe not handled in main thread yet
+        self.calculated = []
+
+    def run(self):
+        while True:
+            with self.cv:
+                while self.running and not self.pendingFits:
+                    self.cv.wait()
+                if not self.running:
+                    break
+                # Wait until requests stop coming in
+                while True:
+                    remaining = self.lastRequestTime + self.COALESCE_DELAY - time()
+                    if remaining <= 0:
+                        break
+                    self.cv.wait(remaining)
+            # Locks are taken before requests, so that main thread holding them never
+            # has to wait for batch in flight. Lazy loads of saveddata happen during
+            # recalc as well, hence the session lock
+            with self.sFit.calcLock, eos.db.sd_lock:
+                with self.cv:
+                    if not self.pendingFits:
+                        # Main thread took requests over
+                        continue
+                    batch = self.inFlight = self.__takePending()
+                self.sFit._recalcBatch(batch)
+                with self.cv:
+                    self.inFlight = None
+                    self.calculated.append(batch)
+                    self.cv.notify_all()
+            wx.CallAfter(self.sFit._recalcDone, batch)
+
+    def __takePending(self):
+        batch = RecalcBatch(list(self.pendingFits.values()), self.pendingCallbacks)
+        self.pendingFits = {}
+        self.pendingCallbacks = []
+        return batch
+
+    def scheduleRecalc(self, fit, callback):
+        with self.cv:
+            self.pendingFits[fit.ID] = fit
+            self.pendingCallbacks.append((fit.ID, callback))
+            self.lastRequestTime = time()
+            self.cv.notify_all()
+
+    def finish(self, takePending=True):
+        """
+        Wait for recalc in progress. Returns batches which are recalculated and batch
+        of requests which were not started yet (None if there are none, or if they
+        are left to the worker); caller becomes responsible for both.
+        """
+        with self.cv:
+            while self.inFlight is not None:
+                self.cv.wait()
+            calculated = self.calculated
+            self.calculated = []
+            pending = self.__takePending() if takePending and self.pendingFits else None
+        return calculated, pending
+
+    def stop(self):
+        with self.cv:
+            self.running = False
+            self.cv.notify_all()
+
+
+class FitCommandProcessor(wx.CommandProcessor):
+    """
+    Command processor of a fit. Commands run under calculation lock, which keeps
+    background recalculation off fits while they are changed; new command waits
+    for recalc in flight only, and gets results of finished recalcs applied before
+    it runs. Recalcs which were not started yet stay with the worker, so quick
+    succession of commands is recalculated once.
+
+    Undo and redo finish all scheduled recalcs first, as commands need state left
+    by them (e.g. dummy slots removed by fill, which undo restores).
+    """
+
+    def Submit(self, command, storeIt=True):
+        sFit = Fit.getInstance()
+        with sFit.calcLock:
+            sFit.finishRecalcs(pending=False)
+            return super().Submit(command, storeIt)
+
+    def Undo(self):
+        sFit = Fit.getInstance()
+        with sFit.calcLock:
+            sFit.finishRecalcs()
+            return super().Undo()
+
+    def Redo(self):
+        sFit = Fit.getInstance()
+        with sFit.calcLock:
+            sFit.finishRecalcs()
+            return super().Redo()
+
+
 class Fit:
     instance = None
     processors = {}
@@ -73,6 +213,10 @@ class Fit:
         self.character = saveddata_Character.getAll5()
         self.booster = False
         self._loadedFits = WeakSet()
+        # Guards calculated state of fits; projected and command fits are calculated
+        # as a part of their target's recalc, so we do not lock fits one by one
+        self.calcLock = threading.RLock()
+        self.recalcWorkerThread = None
 
         serviceFittingDefaultOptions = {
             "useGlobalCharacter": False,
@@ -132,6 +276,15 @@ class Fit:
             fits.remove(fit)
         return fits
 
+    @staticmethod
+    def getAllFitChanges(vaultID=None):
+        """ Lists (ID, name, ship ID, time of last change) of all fits, used with HTML export """
+        if vaultID is None:
+            vaultID = VaultService.getInstance().getCurrentVaultID()
+        if vaultID is None:
+            return []
+        return eos.db.getFitListChanges(vaultID=vaultID)
+
     @staticmethod
     def getFitsWithShip(shipID, vaultID=None):
         """ Lists fits of shipID, used with shipBrowser """
@@ -257,12 +410,12 @@ class Fit:
         for fit in refreshFits:
             eos.db.saveddata_session.refresh(fit)
 
-        eos.db.saveddata_session.commit()
+        eos.db.commit()
 
     @classmethod
     def getCommandProcessor(cls, fitID):
         if fitID not in cls.processors:
-            cls.processors[fitID] = wx.CommandProcessor(maxCommands=100)
+            cls.processors[fitID] = FitCommandProcessor(maxCommands=100)
         return cls.processors[fitID]
 
     @staticmethod
@@ -566,12 +719,88 @@ class Fit:
             fit = self.getFit(fit)
         start_time = time()
         pyfalog.info("=" * 10 + "recalc: {0}" + "=" * 10, fit.name)
-
-        fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
-        fit.clear()
-        fit.calculateModifiedAttributes()
+        profileStartTime = perf_counter() if recalcProfiler.enabled else None
+
+        with self.calcLock:
+            fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
+            fit.clear()
+            fit.calculateModifiedAttributes()
+        if profileStartTime is not None:
+            recalcProfiler.recordRecalc(profileStartTime)
         pyfalog.info("=" * 10 + "recalc time: " + str(time() - start_time) + "=" * 10)
 
+    def scheduleRecalc(self, fitID, callback=None):
+        """
+        Recalculate fit in background, then fill it and commit changes.
+
+        Callback is called in main thread with dummy slots removed by fill (or with
+        empty dict if fill was attributed to a later request for the same fit). If
+        there is no wx app running, everything is done right away.
+        """
+        fit = self.getFit(fitID)
+        if fit is None:
+            return
+        if wx.GetApp() is None:
+            batch = RecalcBatch([fit], [(fit.ID, callback)])
+            self._recalcBatch(batch)
+            self._recalcDone(batch)
+            return
+        if self.recalcWorkerThread is None:
+            self.recalcWorkerThread = RecalcWorkerThread(self)
+            self.recalcWorkerThread.start()
+        self.recalcWorkerThread.scheduleRecalc(fit, callback)
+
+    def finishRecalcs(self, pending=True):
+        """
+        Apply results of background recalculations, calling their callbacks. If pending
+        is True, recalculations which were not started yet are done right away as well.
+        Has to be called from main thread.
+        """
+        if self.recalcWorkerThread is None:
+            return
+        batches, pending = self.recalcWorkerThread.finish(takePending=pending)
+        if pending is not None:
+            self._recalcBatch(pending)
+            batches.append(pending)
+        for batch in batches:
+            self._recalcDone(batch)
+
+    def _recalcBatch(self, batch):
+        for fit in batch.fits:
+            try:
+                # Call through class to not be affected by DeferRecalc in main thread
+                Fit.recalc(self, fit)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.critical("Failed to recalculate fit {}", fit.ID)
+                pyfalog.critical(e)
+                continue
+
+    def _recalcDone(self, batch):
+        # Batch might be finished by main thread before its CallAfter came through
+        if batch.handled:
+            return
+        batch.handled = True
+        removedDummies = {}
+        with self.calcLock:
+            for fit in batch.fits:
+                removedDummies[fit.ID] = self.fill(fit)
+        eos.db.commit()
+        # Undo of the last command restores removed dummies, so it is the only one
+        # which should know about them
+        lastCallbacks = {fitID: callback for fitID, callback in batch.callbacks}
+        for fitID, callback in batch.callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(removedDummies.get(fitID, {}) if lastCallbacks[fitID] is callback else {})
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.error("Recalc callback for fit {} failed", fitID)
+                pyfalog.error(e)
+
     def fill(self, fit):
         if isinstance(fit, int):
             fit = self.getFit(fit)
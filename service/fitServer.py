@@ -0,0 +1,310 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import http.server
+import json
+import multiprocessing
+import os
+import socketserver
+import threading
+import traceback
+
+from logbook import Logger
+
+import config
+
+
+pyfalog = Logger(__name__)
+
+
+# Worker process side. Everything heavy is imported here rather than on module level,
+# so that the HTTP part does not need gamedata or GUI libraries to be loaded.
+
+def initWorker(savePath, saveInRoot):
+    """Initialize pyfa in freshly spawned worker process, once for its whole life"""
+    config.saveInRoot = saveInRoot
+    config.defPaths(savePath)
+    import eos.config
+    # defPaths turns gamedata query caching off, as GUI does not need it; workers
+    # live long and evaluate the same items over and over, so they do. Has to be
+    # set before eos.db import, which picks caching implementation
+    eos.config.gamedataCache = True
+    import eos.db  # noqa: F401
+    import eos.events  # noqa: F401
+    from eos.db.gamedata.queries import warmUpCache
+    from service.fit import Fit
+    from service.market import Market
+    warmUpCache()
+    Market.getInstance()
+    Fit.getInstance()
+    pyfalog.info("Fit server worker {} ready", os.getpid())
+
+
+def evaluateFit(fitString):
+    """
+    Import fit(s) from string in any format pyfa auto-detects (EFT, DNA, ESI JSON, ...),
+    calculate them and return their stats in EFS format. Fits are never saved.
+
+    :return: {'type': detected format, 'fits': [stats]} or {'error': message}
+    """
+    import eos.db
+    from eos.const import ImplantLocation
+    from service.fit import Fit
+    from service.port import Port
+    from service.port.efs import EfsPort
+
+    sFit = Fit.getInstance()
+    try:
+        importType, makesNewFits, fits = Port.importAuto(fitString)
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except Exception as e:
+        pyfalog.warning("Fit server failed to parse fit: {}", e)
+        return {'error': 'Could not parse fit: {}'.format(e)}
+    if not makesNewFits or not fits or any(f is None for f in fits):
+        return {'error': 'Could not parse fit'}
+    stats = []
+    try:
+        for fit in fits:
+            fit.character = sFit.character
+            fit.damagePattern = sFit.pattern
+            fit.targetProfile = sFit.targetProfile
+            if len(fit.implants) > 0:
+                fit.implantLocation = ImplantLocation.FIT
+            else:
+                useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
+                fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+            sFit.recalc(fit)
+            fit.fill()
+            stats.append(json.loads(EfsPort.exportEfs(fit, 0, None)))
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except Exception as e:
+        pyfalog.error("Fit server failed to calculate fit: {}", e)
+        return {'error': 'Could not calculate fit: {}'.format(e)}
+    finally:
+        # Assigning character puts fit into session via backref, get rid of it
+        # before anything gets a chance to commit it
+        for fit in fits:
+            if fit is None:
+                continue
+            fit.character = None
+            if fit in eos.db.saveddata_session:
+                eos.db.saveddata_session.expunge(fit)
+    return {'type': importType, 'fits': stats}
+
+
+class FitEvaluatorPool:
+    """
+    Pool of worker processes evaluating fits. Processes are spawned and get
+    gamedata loaded when the pool is created, so requests never pay for it.
+    """
+
+    # Seconds one request (possibly a batch) may take
+    timeout = 60
+
+    def __init__(self, workers=None, savePath=None, saveInRoot=False):
+        self.workers = workers or os.cpu_count() or 1
+        # Forking a process with open SQLite connections is not safe, start clean ones instead
+        context = multiprocessing.get_context('spawn')
+        self.pool = context.Pool(self.workers, initializer=initWorker, initargs=(savePath, saveInRoot))
+
+    def evaluate(self, fitStrings):
+        """
+        :param fitStrings: list of fit strings
+        :return: list of evaluateFit results in the same order
+        """
+        if not fitStrings:
+            return []
+        # Large batches are sent to workers in chunks to cut on IPC round trips
+        chunksize = max(1, len(fitStrings) // (self.workers * 4))
+        return self.pool.map_async(evaluateFit, fitStrings, chunksize).get(self.timeout)
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+
+
+class FitServerError(Exception):
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def parseFitRequest(body):
+    """
+    Split request body into fit strings.
+
+    Body is either a single fit (EFT or DNA text, or ESI JSON object) or a batch:
+    JSON list of fits or {"fits": [...]} object; ESI fits in a batch may be passed
+    as JSON objects as well as strings.
+
+    :return: (list of fit strings, True if request is a batch)
+    """
+    try:
+        text = body.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise FitServerError(400, 'Body is not valid UTF-8')
+    if not text.strip():
+        raise FitServerError(400, 'No fit passed')
+    # EFT starts with bracket too, whatever is not JSON is a single fit
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return [text], False
+    if isinstance(data, dict) and 'fits' in data:
+        data = data['fits']
+    elif isinstance(data, dict):
+        return [text], False
+    if not isinstance(data, list):
+        raise FitServerError(400, 'Batch of fits must be a list')
+    fitStrings = []
+    for fit in data:
+        if isinstance(fit, dict):
+            fit = json.dumps(fit)
+        elif not isinstance(fit, str):
+            raise FitServerError(400, 'Fits must be strings or ESI JSON objects')
+        fitStrings.append(fit)
+    return fitStrings, True
+
+
+class FitRequestHandler(http.server.BaseHTTPRequestHandler):
+    # Keep connections alive between requests, every response has to carry Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    def version_string(self):
+        return 'pyfa/{}'.format(config.version)
+
+    def do_GET(self):
+        if self.path != '/status':
+            self.reply(404, {'error': 'Not found'})
+            return
+        self.reply(200, self.server.getStatus())
+
+    def do_POST(self):
+        if self.path.split('?')[0] != '/fits':
+            self.discardBody()
+            self.reply(404, {'error': 'Not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > self.server.maxBodySize:
+            self.close_connection = True
+            self.reply(413, {'error': 'Body is too large'})
+            return
+        try:
+            fitStrings, batch = parseFitRequest(self.rfile.read(length))
+            results = self.server.evaluate(fitStrings)
+        except FitServerError as e:
+            self.reply(e.code, {'error': str(e)})
+            return
+        except multiprocessing.TimeoutError:
+            self.reply(504, {'error': 'Evaluation timed out'})
+            return
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            pyfalog.error("Fit server failed to handle request:\n{}", traceback.format_exc())
+            self.reply(500, {'error': 'Internal error'})
+            return
+        if batch:
+            self.reply(200, {'results': results})
+        else:
+            result = results[0]
+            self.reply(422 if 'error' in result else 200, result)
+
+    def discardBody(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = 0
+        if length > self.server.maxBodySize:
+            self.close_connection = True
+        elif length > 0:
+            self.rfile.read(length)
+
+    def reply(self, code, data):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pyfalog.debug("{} - {}", self.address_string(), format % args)
+
+
+class FitServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    HTTP server evaluating fits. POST fits to /fits, see parseFitRequest for body
+    format; single fit gets its result back, batch gets {"results": [...]} in order.
+    GET /status reports pool size and request counters.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    maxBodySize = 16 * 1024 * 1024
+
+    def __init__(self, address, evaluator, handler=FitRequestHandler):
+        """
+        :param evaluator: object with evaluate(list of fit strings) -> list of results
+        and workers attribute, normally FitEvaluatorPool
+        """
+        self.evaluator = evaluator
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.fits = 0
+        socketserver.TCPServer.__init__(self, address, handler)
+
+    def server_bind(self):
+        # Same as in StoppableHTTPServer, avoid socket.getfqdn() of HTTPServer
+        socketserver.TCPServer.server_bind(self)
+        host, port = self.server_address[:2]
+        self.server_name = host
+        self.server_port = port
+
+    def evaluate(self, fitStrings):
+        with self.lock:
+            self.requests += 1
+            self.fits += len(fitStrings)
+        return self.evaluator.evaluate(fitStrings)
+
+    def getStatus(self):
+        with self.lock:
+            return {'version': config.version, 'workers': self.evaluator.workers, 'requests': self.requests, 'fits': self.fits}
+
+
+def serveFits(host, port, workers=None, savePath=None):
+    """Run fit server until interrupted"""
+    pyfalog.info("Starting {} fit server workers", workers or os.cpu_count())
+    evaluator = FitEvaluatorPool(workers, savePath=savePath, saveInRoot=config.saveInRoot)
+    try:
+        with FitServer((host, port), evaluator) as httpd:
+            pyfalog.info("Fit server listening on {}:{}", *httpd.server_address[:2])
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                pyfalog.info("Fit server stopped")
+    finally:
+        evaluator.close()
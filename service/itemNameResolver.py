@@ -0,0 +1,197 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import hashlib
+import json
+import os
+import threading
+
+from logbook import Logger
+
+import config
+import eos.config
+import eos.db
+from eos.gamedata import Item
+from service import conversions
+
+
+pyfalog = Logger(__name__)
+
+# Bump when layout of persisted file or compilation rules change
+NAME_INDEX_FORMAT = 1
+NOT_LOADED = object()
+
+
+def getConversionsDigest(conversionMap):
+    return hashlib.sha1(json.dumps(sorted(conversionMap.items())).encode('utf-8')).hexdigest()
+
+
+def compileItemNames(rows, languages, conversionMap):
+    """
+    Compile name -> type ID map.
+
+    English names of all types come first, so translations never shadow them; of
+    types sharing a name, the one with lowest ID wins.
+    Translations are added for published types only, in order of languages.
+    Conversions map old names to type ID of their new English name, taking
+    precedence over everything else as they did when applied to lookup string.
+
+    :param rows: iterable of (type ID, published, {language suffix: name})
+    :param languages: language suffixes to add translations of, in priority order
+    :param conversionMap: {old name: new name}
+    """
+    rows = sorted(rows, key=lambda r: r[0])
+    english = {}
+    for typeID, published, typeNames in rows:
+        name = typeNames.get('')
+        if name:
+            english.setdefault(name, typeID)
+    names = dict(english)
+    for lang in languages:
+        if lang == '':
+            continue
+        for typeID, published, typeNames in rows:
+            name = typeNames.get(lang)
+            if published and name:
+                names.setdefault(name, typeID)
+    for oldName, newName in conversionMap.items():
+        typeID = english.get(newName)
+        if typeID is None:
+            # Lookup of converted name would have found nothing as well
+            names.pop(oldName, None)
+        else:
+            names[oldName] = typeID
+    return names
+
+
+class ItemNameResolver:
+    """
+    Resolves item names, as used by fit import formats, to type IDs with one dict
+    lookup. Map covers English and translated names, and has item conversions
+    folded in. It is compiled once per gamedata version (and set of conversions)
+    and persisted in pyfa's save folder, so following starts only load it.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = ItemNameResolver()
+
+        return cls._instance
+
+    def __init__(self, cachePath=None, conversionMap=None):
+        """
+        :param cachePath: path of persisted map, defaults to one in pyfa's save folder
+        :param conversionMap: {old name: new name}, defaults to all conversion packs
+        """
+        self.cachePath = cachePath
+        self.conversionMap = conversions.all if conversionMap is None else conversionMap
+        self.conversionsDigest = getConversionsDigest(self.conversionMap)
+        self.lock = threading.Lock()
+        # Gamedata version map was loaded for
+        self.gamedataVersion = NOT_LOADED
+        # Format: {name: type ID}
+        self.names = None
+
+    def getCachePath(self):
+        if self.cachePath is not None:
+            return self.cachePath
+        if config.savePath is None:
+            return None
+        return os.path.join(config.savePath, config.ITEM_NAME_CACHE)
+
+    @staticmethod
+    def getLanguages():
+        suffixes = list(eos.config.translation_mapping.values())
+        # Names in language pyfa runs with are preferred over other translations
+        return sorted(suffixes, key=lambda s: (s != '', s != eos.config.lang))
+
+    @staticmethod
+    def fetchRows(languages):
+        columns = [getattr(Item, 'typeName{}'.format(lang)) for lang in languages]
+        query = eos.db.get_gamedata_session().query(Item.ID, Item.published, *columns)
+        return [(row[0], row[1], dict(zip(languages, row[2:]))) for row in query]
+
+    def getNames(self):
+        """
+        :return: {name: type ID}, None if map cannot be compiled (no gamedata)
+        """
+        version = eos.config.gamedata_version
+        if self.gamedataVersion == version:
+            return self.names
+        with self.lock:
+            if self.gamedataVersion != version:
+                self.names = self.__load(version)
+                self.gamedataVersion = version
+            return self.names
+
+    def resolve(self, name):
+        """
+        :return: type ID of item with this name, None if there is none
+        :raises LookupError: if map is not available
+        """
+        names = self.getNames()
+        if names is None:
+            raise LookupError("Item name map is not available")
+        return names.get(name)
+
+    def __load(self, version):
+        path = self.getCachePath()
+        if version and path is not None and os.path.isfile(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                header = (data.get('format'), data.get('gamedataVersion'), data.get('conversions'))
+                if header == (NAME_INDEX_FORMAT, version, self.conversionsDigest):
+                    pyfalog.debug("Loaded {} item names from {}", len(data['names']), path)
+                    return data['names']
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.warning("Failed to load item name map from {}: {}", path, e)
+        languages = self.getLanguages()
+        try:
+            names = compileItemNames(self.fetchRows(languages), languages, self.conversionMap)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Failed to compile item name map: {}", e)
+            return None
+        pyfalog.info("Compiled {} item names", len(names))
+        if version and path is not None:
+            self.__store(path, version, names)
+        return names
+
+    def __store(self, path, version, names):
+        data = {
+            'format': NAME_INDEX_FORMAT,
+            'gamedataVersion': version,
+            'conversions': self.conversionsDigest,
+            'names': names}
+        # Fit server workers may store it at the same time
+        tmpPath = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            with open(tmpPath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmpPath, path)
+        except OSError as e:
+            pyfalog.warning("Failed to store item name map to {}: {}", path, e)
@@ -29,10 +29,12 @@ from logbook import Logger
 from sqlalchemy.sql import or_
 
 import config
+import eos.config
 import eos.db
 from eos.gamedata import Category as types_Category, Group as types_Group, Item as types_Item, MarketGroup as types_MarketGroup, \
     MetaGroup as types_MetaGroup
 from service import conversions
+from service.itemNameResolver import ItemNameResolver
 from service.jargon import JargonLoader
 from service.settings import SettingsProvider
 from utils.cjk import isStringCjk
@@ -43,6 +45,13 @@ _t = wx.GetTranslation
 # Event which tells threads dependent on Market that it's initialized
 mktRdy = threading.Event()
 
+# Parts of implant names which distinguish grades and ranks within one implant
+# family, e.g. "Low-grade " of pirate sets or "-805" of hardwirings
+IMPLANT_FAMILY_AFFIXES = frozenset((
+    "Low-Grade ", "Low-grade ", "Mid-Grade ", "Mid-grade ", "High-Grade ", "High-grade ", "Limited ",
+    " - Advanced", " - Basic", " - Elite", " - Improved", " - Standard",
+    *("{}{:02d}".format(prefix, i) for prefix in ("-6", "-7", "-8", "-9", "-10") for i in range(50))))
+
 
 class RegexTokenizationError(Exception):
     pass
@@ -241,6 +250,223 @@ class SearchWorkerThread(threading.Thread):
         return tokens
 
 
+class VariationIndex:
+    """
+    Item variations, built once per gamedata version: children of variation
+    parents, items of groups used as variations of drones, fighters and implants,
+    implant family keys and meta groups of items. Results of variation and market
+    group lookups are kept as well, so repeated requests do not touch database.
+    """
+
+    # If item belongs to these categories, its group is used to find "variations"
+    GROUP_VARIATION_CATEGORIES = ('Drone', 'Fighter', 'Implant')
+
+    def __init__(self, market):
+        self.market = market
+        self.lock = threading.RLock()
+        self.gamedataVersion = None
+        self.__reset()
+
+    def __reset(self):
+        # Format: {parent type ID: [child items]}
+        self.children = None
+        # Format: {group ID: [items]}
+        self.groupItems = {}
+        # Format: {type ID: (family key, ...)}
+        self.implantFamilyKeys = {}
+        # Format: {type ID: meta group}
+        self.metaGroups = {}
+        # Format: {parent name: [items forced to be its variations]}
+        self.forcedVariations = {}
+        # Format: {(frozenset of type IDs, alreadyparent): frozenset of items}
+        self.variations = {}
+        # Format: {(market group ID, vars_): frozenset of items}
+        self.marketGroupItems = {}
+
+    def __validate(self):
+        if self.gamedataVersion != eos.config.gamedata_version:
+            self.gamedataVersion = eos.config.gamedata_version
+            self.__reset()
+
+    def getVariations(self, items, alreadyparent):
+        key = (frozenset(item.ID for item in items), alreadyparent)
+        with self.lock:
+            self.__validate()
+            variations = self.variations.get(key)
+            if variations is None:
+                variations = self.variations[key] = frozenset(self.__findVariations(items, alreadyparent))
+        return variations
+
+    def getMarketGroupItems(self, mg, vars_, find):
+        key = (mg.ID, vars_)
+        with self.lock:
+            self.__validate()
+            items = self.marketGroupItems.get(key)
+            if items is None:
+                items = self.marketGroupItems[key] = frozenset(find(mg, vars_))
+        return items
+
+    def getMetaGroup(self, item, find):
+        with self.lock:
+            self.__validate()
+            try:
+                return self.metaGroups[item.ID]
+            except KeyError:
+                metaGroup = self.metaGroups[item.ID] = find(item)
+                return metaGroup
+
+    def __findVariations(self, items, alreadyparent):
+        # Set for IDs of parent items
+        parents = set()
+        # Set-container for variables
+        variations = set()
+        variations_limiter = set()
+
+        for item in items:
+            if item.category.ID == 20 and item.group.ID != 303:  # Implants not Boosters
+                variations_limiter.update(self.__getImplantFamilyKeys(item))
+
+            # Get parent item
+            if alreadyparent is False:
+                parent = self.market.getParentItemByItem(item)
+            else:
+                parent = item
+            # Combine both in the same set
+            parents.add(parent)
+            # Check for overrides and add them if any
+            variations.update(self.__getForcedVariations(parent))
+        # Add all parents to variations set
+        variations.update(parents)
+        # Add all variations of parents to the set
+        variations_list = self.__getChildren(parents)
+
+        if variations_limiter:
+            for limit in variations_limiter:
+                trimmed_variations_list = [variation_item for variation_item in variations_list if limit in variation_item.name]
+            if trimmed_variations_list:
+                variations_list = trimmed_variations_list
+
+        # If the items are boosters then filter variations to only include boosters for the same slot.
+        BOOSTER_GROUP_ID = 303
+        if all(map(lambda i: i.group.ID == BOOSTER_GROUP_ID, items)) and len(items) > 0:
+            # 'boosterness' is the database's attribute name for Booster Slot
+            reqSlot = next(items.__iter__()).getAttribute('boosterness')
+            # If the item and it's variation both have a marketGroupID it should match for the variation to be considered valid.
+            marketGroupID = [next(filter(None, map(lambda i: i.marketGroupID, items)), None), None]
+            matchSlotAndMktGrpID = lambda v: v.getAttribute('boosterness') == reqSlot and v.marketGroupID in marketGroupID
+            variations_list = list(filter(matchSlotAndMktGrpID, variations_list))
+
+        variations.update(variations_list)
+        return variations
+
+    def __getChildren(self, parents):
+        """Same as eos.db.getVariations: children of parents, or items of their groups if there are no children"""
+        if self.children is None:
+            self.children = {}
+            for child in eos.db.getAllVariations():
+                self.children.setdefault(child.variationParentTypeID, []).append(child)
+        children = [child for parent in parents for child in self.children.get(parent.ID, ())]
+        if children:
+            return children
+        groupIDs = set(parent.group.ID for parent in parents if parent.category.name in self.GROUP_VARIATION_CATEGORIES)
+        return [item for groupID in groupIDs for item in self.__getGroupItems(groupID)]
+
+    def __getGroupItems(self, groupID):
+        groupItems = self.groupItems.get(groupID)
+        if groupItems is None:
+            group = eos.db.getGroup(groupID)
+            groupItems = self.groupItems[groupID] = list(group.items) if group is not None else []
+        return groupItems
+
+    def __getImplantFamilyKeys(self, item):
+        keys = self.implantFamilyKeys.get(item.ID)
+        if keys is None:
+            keys = self.implantFamilyKeys[item.ID] = tuple(
+                item.name.replace(affix, "") for affix in IMPLANT_FAMILY_AFFIXES if affix in item.name)
+        return keys
+
+    def __getForcedVariations(self, parent):
+        forced = self.forcedVariations.get(parent.name)
+        if forced is None:
+            forced = self.forcedVariations[parent.name] = []
+            for itemName in self.market.ITEMS_FORCEDMETAGROUP_R.get(parent.name, ()):
+                item = self.market.getItem(itemName)
+                if item:
+                    forced.append(item)
+        return forced
+
+
+class MarketTreeNode:
+    """Market group with everything market browser needs to show it"""
+
+    __slots__ = ('ID', 'name', 'icon', 'valid', 'hasItems', 'childIDs', 'items')
+
+    def __init__(self, ID, name, icon, valid, hasItems, childIDs, items):
+        self.ID = ID
+        self.name = name
+        self.icon = icon
+        # Group which should have items but has none is not shown
+        self.valid = valid
+        # Leaf group, its items are shown instead of child groups
+        self.hasItems = hasItems
+        # IDs of valid child groups
+        self.childIDs = childIDs
+        # Published items including variations, in market browser order
+        self.items = items
+
+
+class MarketTreeIndex:
+    """
+    Materialised market tree: every shown market group as a MarketTreeNode, with
+    forced market groups, publicity and variations applied. Nodes are built on first
+    request, and the whole tree is filled in background after market is initialized.
+    """
+
+    def __init__(self, market):
+        self.market = market
+        self.lock = threading.RLock()
+        self.gamedataVersion = None
+        # Format: {market group ID: node}
+        self.nodes = {}
+
+    def getNode(self, mgID):
+        with self.lock:
+            if self.gamedataVersion != eos.config.gamedata_version:
+                self.gamedataVersion = eos.config.gamedata_version
+                self.nodes.clear()
+            node = self.nodes.get(mgID)
+            if node is None:
+                node = self.nodes[mgID] = self.__buildNode(mgID)
+        return node
+
+    def build(self):
+        """Build nodes of all shown market groups"""
+        for mgID in sorted(self.market.SHOWN_MARKET_GROUPS):
+            try:
+                self.getNode(mgID)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.warning("Failed to build market tree node {}: {}", mgID, e)
+        pyfalog.debug("Market tree built, {} nodes", len(self.nodes))
+
+    def __buildNode(self, mgID):
+        market = self.market
+        mg = market.getMarketGroup(mgID, eager="children")
+        if mg is None:
+            return None
+        hasItems = market.marketGroupHasTypesCheck(mg)
+        childIDs = tuple(
+            child.ID for child in sorted(market.getMarketGroupChildren(mg), key=lambda c: c.name)
+            if market.marketGroupValidityCheck(child))
+        items = ()
+        if hasItems:
+            items = tuple(sorted(market.getItemsByMarketGroup(mg), key=market.itemSort))
+        return MarketTreeNode(
+            ID=mg.ID, name=mg.name, icon=market.getIconByMarketGroup(mg), valid=market.marketGroupValidityCheck(mg),
+            hasItems=hasItems, childIDs=childIDs, items=items)
+
+
 class Market:
     instance = None
 
@@ -465,11 +691,25 @@ class Market:
                                    2456  # Filaments
                                    )
         self.SHOWN_MARKET_GROUPS = eos.db.getMarketTreeNodeIds(self.ROOT_MARKET_GROUPS)
+        self.variationIndex = VariationIndex(self)
         self.FIT_CATEGORIES = ['Ship']
         self.FIT_GROUPS = ['Citadel', 'Engineering Complex', 'Refinery']
+
+        # Market browser tree, filled in background so that expanding nodes doesn't
+        # have to query market groups and items
+        self.marketTree = MarketTreeIndex(self)
+        self.marketTreeBuilderThread = threading.Thread(target=self.__buildIndices, name="MarketTreeBuilder")
+        self.marketTreeBuilderThread.daemon = True
+        self.marketTreeBuilderThread.start()
+
         # Tell other threads that Market is at their service
         mktRdy.set()
 
+    def __buildIndices(self):
+        self.marketTree.build()
+        # Have item name map loaded before first fit import needs it
+        ItemNameResolver.getInstance().getNames()
+
     @classmethod
     def getInstance(cls):
         if cls.instance is None:
@@ -505,9 +745,14 @@ class Market:
                 item = eos.db.getItem(identity, *args, **kwargs)
             elif isinstance(identity, str):
                 # We normally lookup with string when we are using import/export
-                # features. Check against overrides
-                identity = conversions.all.get(identity, identity)
-                item = eos.db.getItem(identity, *args, **kwargs)
+                # features. Compiled name map has translations and overrides in it
+                try:
+                    typeID = ItemNameResolver.getInstance().resolve(identity)
+                except LookupError:
+                    identity = conversions.all.get(identity, identity)
+                    item = eos.db.getItem(identity, *args, **kwargs)
+                else:
+                    item = eos.db.getItem(typeID, *args, **kwargs) if typeID is not None else None
 
             elif isinstance(identity, float):
                 id_ = int(identity)
@@ -601,6 +846,9 @@ class Market:
 
     def getMetaGroupByItem(self, item):
         """Get meta group by item"""
+        return self.variationIndex.getMetaGroup(item, self.__findMetaGroupByItem)
+
+    def __findMetaGroupByItem(self, item):
         # Check if item is in forced metagroup map
         if item.name in self.ITEMS_FORCEDMETAGROUP:
             metaGroupName = self.ITEMS_FORCEDMETAGROUP[item.name][0]
@@ -657,77 +905,7 @@ class Market:
 
     def getVariationsByItems(self, items, alreadyparent=False):
         """Get item variations by item, its ID or name"""
-        # Set for IDs of parent items
-        parents = set()
-        # Set-container for variables
-        variations = set()
-        variations_limiter = set()
-
-        # if item belongs to these categories, use their group to find "variations"
-        categories = ['Drone', 'Fighter', 'Implant']
-
-        for item in items:
-            if item.category.ID == 20 and item.group.ID != 303:  # Implants not Boosters
-                implant_remove_list = set()
-                implant_remove_list.add("Low-Grade ")
-                implant_remove_list.add("Low-grade ")
-                implant_remove_list.add("Mid-Grade ")
-                implant_remove_list.add("Mid-grade ")
-                implant_remove_list.add("High-Grade ")
-                implant_remove_list.add("High-grade ")
-                implant_remove_list.add("Limited ")
-                implant_remove_list.add(" - Advanced")
-                implant_remove_list.add(" - Basic")
-                implant_remove_list.add(" - Elite")
-                implant_remove_list.add(" - Improved")
-                implant_remove_list.add(" - Standard")
-
-                for implant_prefix in ("-6", "-7", "-8", "-9", "-10"):
-                    for i in range(50):
-                        implant_remove_list.add(implant_prefix + str("%02d" % i))
-
-                for text_to_remove in implant_remove_list:
-                    if text_to_remove in item.name:
-                        variations_limiter.add(item.name.replace(text_to_remove, ""))
-
-            # Get parent item
-            if alreadyparent is False:
-                parent = self.getParentItemByItem(item)
-            else:
-                parent = item
-            # Combine both in the same set
-            parents.add(parent)
-            # Check for overrides and add them if any
-            if parent.name in self.ITEMS_FORCEDMETAGROUP_R:
-                for _item in self.ITEMS_FORCEDMETAGROUP_R[parent.name]:
-                    i = self.getItem(_item)
-                    if i:
-                        variations.add(i)
-        # Add all parents to variations set
-        variations.update(parents)
-        # Add all variations of parents to the set
-        parentids = tuple(item.ID for item in parents)
-        groupids = tuple(item.group.ID for item in parents if item.category.name in categories)
-        variations_list = eos.db.getVariations(parentids, groupids)
-
-        if variations_limiter:
-            for limit in variations_limiter:
-                trimmed_variations_list = [variation_item for variation_item in variations_list if limit in variation_item.name]
-            if trimmed_variations_list:
-                variations_list = trimmed_variations_list
-
-        # If the items are boosters then filter variations to only include boosters for the same slot.
-        BOOSTER_GROUP_ID = 303
-        if all(map(lambda i: i.group.ID == BOOSTER_GROUP_ID, items)) and len(items) > 0:
-            # 'boosterness' is the database's attribute name for Booster Slot
-            reqSlot = next(items.__iter__()).getAttribute('boosterness')
-            # If the item and it's variation both have a marketGroupID it should match for the variation to be considered valid.
-            marketGroupID = [next(filter(None, map(lambda i: i.marketGroupID, items)), None), None]
-            matchSlotAndMktGrpID = lambda v: v.getAttribute('boosterness') == reqSlot and v.marketGroupID in marketGroupID
-            variations_list = list(filter(matchSlotAndMktGrpID, variations_list))
-
-        variations.update(variations_list)
-        return variations
+        return set(self.variationIndex.getVariations(items, alreadyparent))
 
     def getGroupsByCategory(self, cat):
         """Get groups from given category"""
@@ -757,6 +935,9 @@ class Market:
 
     def getItemsByMarketGroup(self, mg, vars_=True):
         """Get items in the given market group"""
+        return set(self.variationIndex.getMarketGroupItems(mg, vars_, self.__findItemsByMarketGroup))
+
+    def __findItemsByMarketGroup(self, mg, vars_):
         result = set()
         # Get items from eos market group
         baseitms = set(mg.items)
@@ -854,6 +1035,10 @@ class Market:
             pub = group.published
         return pub
 
+    def getMarketTreeNode(self, mgID):
+        """Get materialised market tree node by market group ID"""
+        return self.marketTree.getNode(mgID)
+
     def getMarketRoot(self):
         """
         Get the root of the market tree.
@@ -37,6 +37,8 @@ class EveTycoon:
 
     name = 'evetycoon'
     group = 'tranquility'
+    # One request per type, spread them over more workers
+    chunkSize = 10
 
     def __init__(self, priceMap, system, fetchTimeout):
         # Try selected system first
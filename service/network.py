@@ -20,6 +20,7 @@
 
 import requests
 import socket
+from requests.adapters import HTTPAdapter
 from logbook import Logger
 
 import config
@@ -31,6 +32,9 @@ pyfalog = Logger(__name__)
 timeout = 3
 socket.setdefaulttimeout(timeout)
 
+# Connections kept alive per host; price fetches send several requests to the same host concurrently
+poolSize = 10
+
 
 class Error(Exception):
     def __init__(self, msg=None):
@@ -70,6 +74,13 @@ class Network:
 
         return cls._instance
 
+    def __init__(self):
+        # Reuse connections (and TLS sessions) between requests instead of opening new one every time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def get(self, url, type, **kwargs):
         self.__networkAccessCheck(type)
 
@@ -77,7 +88,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.get(url, headers=headers, proxies=proxies, **kwargs)
+            resp = self.session.get(url, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
@@ -104,7 +115,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
+            resp = self.session.post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
@@ -18,12 +18,23 @@
 # =============================================================================
 
 
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from logbook import Logger
+from requests_cache import NEVER_EXPIRE, CachedSession
+
+import config
 from eos.db.gamedata.queries import getAttributeInfo, getDynamicItem
 from eos.utils.float import floatUnerr
+from service.const import EsiEndpoints
 from service.port.shared import fetchItem
-from service.esiAccess import EsiAccess
+from service.settings import EsiSettings, NetworkSettings
+
+
+pyfalog = Logger(__name__)
 
 
 def renderMutant(mutant, firstPrefix='', prefix=''):
@@ -90,8 +101,11 @@ def parseMutantAttrs(line):
     return mutations
 
 
+DYNAMIC_ITEM_PATTERN = re.compile(r'<url=showinfo:(?P<typeid>\d+)//(?P<itemid>\d+)>.+?</url>')
+
+
 def parseDynamicItemString(text):
-    m = re.search(r'<url=showinfo:(?P<typeid>\d+)//(?P<itemid>\d+)>.+</url>', text)
+    m = DYNAMIC_ITEM_PATTERN.search(text)
     if m:
         typeID = int(m.group('typeid'))
         itemID = int(m.group('itemid'))
@@ -99,12 +113,111 @@ def parseDynamicItemString(text):
     return None
 
 
+def parseDynamicItemStrings(text):
+    """Return (type ID, item ID) of all dynamic item links in text, without repeats"""
+    found = {}
+    for m in DYNAMIC_ITEM_PATTERN.finditer(text):
+        found[(int(m.group('typeid')), int(m.group('itemid')))] = None
+    return list(found)
+
+
+class DynamicItemResolver:
+    """
+    Fetches data of dynamic (mutated) items from ESI. Data of an item never changes
+    once it exists, so every answer is kept in a persistent local cache and the same
+    item is never requested twice; items missing there are requested in parallel
+    over one pooled session.
+    """
+
+    _instance = None
+    maxWorkers = 8
+    timeout = 10
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = DynamicItemResolver()
+
+        return cls._instance
+
+    def __init__(self, cachePath=None, server=None):
+        """
+        :param cachePath: path of the cache database, defaults to one in pyfa's save folder
+        :param server: config.ApiServer to request, defaults to server selected in ESI settings
+        """
+        self.cachePath = cachePath
+        self.server = server
+        self.lock = threading.Lock()
+        self.session = None
+        # Format: {(type ID, item ID): ESI data}
+        self.data = {}
+
+    def getSession(self):
+        with self.lock:
+            if self.session is None:
+                self.session = CachedSession(
+                    self.cachePath or os.path.join(config.savePath, config.ESI_DYNAMIC_ITEM_CACHE),
+                    backend="sqlite",
+                    cache_control=False,
+                    expire_after=NEVER_EXPIRE,
+                    allowable_codes=(200,))
+                self.session.headers.update({'Accept': 'application/json', 'User-Agent': 'pyfa v{}'.format(config.version)})
+                self.session.proxies = NetworkSettings.getInstance().getProxySettingsInRequestsFormat()
+            return self.session
+
+    def getUrl(self, typeID, itemID):
+        server = self.server or config.supported_servers[EsiSettings.getInstance().get('server')]
+        base = server.esi if '://' in server.esi else 'https://%s' % server.esi
+        endpoint = EsiEndpoints.DYNAMIC_ITEM.value.format(type_id=typeID, item_id=itemID)
+        return "{}{}?datasource={}".format(base, endpoint, server.name.lower())
+
+    def fetch(self, typeID, itemID):
+        try:
+            resp = self.getSession().get(self.getUrl(typeID, itemID), timeout=self.timeout)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.warning("Failed to fetch dynamic item {}/{}: {}", typeID, itemID, e)
+            return None
+        if resp.status_code != 200:
+            pyfalog.warning("Failed to fetch dynamic item {}/{}: HTTP {}", typeID, itemID, resp.status_code)
+            return None
+        return resp.json()
+
+    def resolve(self, dynamicItemDataList):
+        """
+        :param dynamicItemDataList: iterable of (type ID, item ID)
+        :return: {(type ID, item ID): ESI data}, None for items which could not be fetched
+        """
+        pairs = list(dict.fromkeys(tuple(d) for d in dynamicItemDataList))
+        missing = [p for p in pairs if p not in self.data]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.maxWorkers, len(missing)), thread_name_prefix='DynamicItem') as executor:
+                for pair, esiData in zip(missing, executor.map(lambda p: self.fetch(*p), missing)):
+                    if esiData is not None:
+                        self.data[pair] = esiData
+        return {p: self.data.get(p) for p in pairs}
+
+
+def fetchDynamicItems(dynamicItemDataList):
+    """
+    :param dynamicItemDataList: iterable of (type ID, item ID)
+    :return: {(type ID, item ID): (base item, mutaplasmid, {attribute ID: value})}, None for items
+    which could not be fetched
+    """
+    mutaplasmids = {}
+    items = {}
+    for pair, esiData in DynamicItemResolver.getInstance().resolve(dynamicItemDataList).items():
+        if esiData is None:
+            items[pair] = None
+            continue
+        mutaplasmidID = esiData['mutator_type_id']
+        if mutaplasmidID not in mutaplasmids:
+            mutaplasmids[mutaplasmidID] = getDynamicItem(mutaplasmidID)
+        attrs = {i['attribute_id']: i['value'] for i in esiData['dogma_attributes']}
+        items[pair] = (fetchItem(esiData['source_type_id']), mutaplasmids[mutaplasmidID], attrs)
+    return items
+
+
 def fetchDynamicItem(dynamicItemData):
-    typeID, itemID = dynamicItemData
-    esiData = EsiAccess().getDynamicItem(typeID, itemID).json()
-    baseItemID = esiData['source_type_id']
-    mutaplasmidID = esiData['mutator_type_id']
-    attrs = {i['attribute_id']: i['value'] for i in esiData['dogma_attributes']}
-    baseItem = fetchItem(baseItemID)
-    mutaplasmid = getDynamicItem(mutaplasmidID)
-    return baseItem, mutaplasmid, attrs
+    return fetchDynamicItems([dynamicItemData])[tuple(dynamicItemData)]
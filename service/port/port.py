@@ -41,7 +41,7 @@ from service.port.esi import exportESI, importESI
 from service.port.multibuy import exportMultiBuy
 from service.port.shipstats import exportFitStats
 from service.port.xml import importXml, exportXml
-from service.port.muta import parseMutant, parseDynamicItemString, fetchDynamicItem
+from service.port.muta import parseMutant, parseDynamicItemStrings, fetchDynamicItems
 
 
 pyfalog = Logger(__name__)
@@ -75,6 +75,8 @@ class Port:
     @staticmethod
     def backupFits(path, progress):
         pyfalog.debug("Starting backup fits thread.")
+        # Backup has to match what's stored on disk
+        db.sync()
 
         def backupFitsWorkerFunc(path, progress):
             try:
@@ -262,13 +264,12 @@ class Port:
 
         if activeFit is not None:
 
-            # Try to import mutated item from network
-            dynData = parseDynamicItemString(string)
-            if dynData is not None:
-                itemData = fetchDynamicItem(dynData)
-                if itemData is not None:
-                    baseItem, mutaplasmidItem, mutations = itemData
-                    return "FittingItem", False, ((baseItem, mutaplasmidItem, mutations),)
+            # Try to import mutated items from network, all links at once
+            dynData = parseDynamicItemStrings(string)
+            if dynData:
+                itemData = [i for i in fetchDynamicItems(dynData).values() if i is not None]
+                if itemData:
+                    return "FittingItem", False, tuple(itemData)
 
             # Try to import mutated module
             try:
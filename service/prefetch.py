@@ -18,16 +18,113 @@
 # =============================================================================
 
 import os
+import threading
 
 import config
 from eos import db
 from eos.db import migration
 from eos.db.saveddata.databaseRepair import DatabaseCleanup
+from service.settings import SettingsProvider
 
 from logbook import Logger
 
 pyfalog = Logger(__name__)
 
+# DatabaseCleanup methods ran against saveddata, in order
+VALIDATION_CHECKS = (
+    'OrphanedCharacterSkills',
+    'OrphanedFitCharacterIDs',
+    'OrphanedFitDamagePatterns',
+    'NullDamagePatternNames',
+    'NullTargetResistNames',
+    'OrphanedFitIDItemID',
+    'NullDamageTargetPatternValues',
+    'DuplicateSelectedAmmoName')
+
+# Checks which passed against DB state described by fingerprint stored along with them;
+# pyfa keeps the data they cover consistent on its own, so only changes made outside of
+# it (other tools, older versions, restored backups) change the fingerprint between runs
+validationSettings = SettingsProvider.getInstance().getSettings(
+    'pyfaDatabaseValidation', {'fingerprint': None, 'checks': ()})
+
+
+def getFingerprint():
+    """
+    Return value which changes whenever saveddata DB is modified.
+
+    PRAGMA data_version is only meaningful within single connection, so we use
+    file change counter from DB header instead, plus file stats to catch writes
+    which do not update it (e.g. in WAL mode). WAL is checkpointed first, so that
+    the main file holds all committed data and is not changed later when the last
+    connection gets closed.
+    """
+    db.saveddata_engine.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    with open(config.saveDB, 'rb') as f:
+        header = f.read(100)
+    stat = os.stat(config.saveDB)
+    changeCounter = int.from_bytes(header[24:28], 'big')
+    return migration.getVersion(db.saveddata_engine), changeCounter, stat.st_size, stat.st_mtime_ns
+
+
+class DatabaseValidationThread(threading.Thread):
+
+    def __init__(self, checks):
+        super().__init__(name='DatabaseValidation', daemon=True)
+        self.checks = checks
+        self.running = True
+
+    def run(self):
+        pyfalog.debug("Starting database validation.")
+        for check in self.checks:
+            if not self.running:
+                return
+            # Hold session lock, so that cleanups do not interfere with data being saved
+            with db.sd_lock:
+                # Cleanups work on their own connections, make sure session's transaction
+                # with deferred changes does not hold the database locked
+                db.sync()
+                getattr(DatabaseCleanup, check)(db.saveddata_engine)
+                validatedChecks.add(check)
+        pyfalog.debug("Completed database validation.")
+
+    def stop(self):
+        self.running = False
+
+
+def loadValidationState():
+    """Return checks which passed in earlier session, if DB was not modified since then."""
+    if validationSettings['fingerprint'] == getFingerprint():
+        return set(validationSettings['checks'])
+    return set()
+
+
+def startDeferredValidation():
+    """Run checks which were not validated against current DB state in background."""
+    pendingChecks = [c for c in VALIDATION_CHECKS if c not in validatedChecks]
+    if not pendingChecks:
+        pyfalog.debug("Database validation is up to date, skipping.")
+        return None
+    thread = DatabaseValidationThread(pendingChecks)
+    thread.start()
+    return thread
+
+
+def storeValidationState():
+    """
+    Remember DB state on exit, so that checks are not re-ran if it does not change
+    until next start. Has to be called after pyfa's own last write, as fingerprint
+    taken here is what changes made outside of pyfa are detected against.
+    """
+    if not config.saveDB or not os.path.isfile(config.saveDB):
+        return
+    if any(c not in validatedChecks for c in VALIDATION_CHECKS):
+        pyfalog.debug("Database validation did not complete, not storing validation state.")
+        return
+    validationSettings['fingerprint'] = getFingerprint()
+    validationSettings['checks'] = tuple(VALIDATION_CHECKS)
+    validationSettings.save()
+
+
 # Make sure the saveddata db exists
 if config.savePath and not os.path.exists(config.savePath):
     os.mkdir(config.savePath)
@@ -38,18 +135,9 @@ if config.saveDB and os.path.isfile(config.saveDB):
     db.saveddata_meta.create_all()
     migration.update(db.saveddata_engine)
 
-    # Finds and fixes database corruption issues.
-    pyfalog.debug("Starting database validation.")
-    database_cleanup_instance = DatabaseCleanup()
-    database_cleanup_instance.OrphanedCharacterSkills(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitCharacterIDs(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitDamagePatterns(db.saveddata_engine)
-    database_cleanup_instance.NullDamagePatternNames(db.saveddata_engine)
-    database_cleanup_instance.NullTargetResistNames(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitIDItemID(db.saveddata_engine)
-    database_cleanup_instance.NullDamageTargetPatternValues(db.saveddata_engine)
-    database_cleanup_instance.DuplicateSelectedAmmoName(db.saveddata_engine)
-    pyfalog.debug("Completed database validation.")
+    # Corruption checks are expensive on big databases; skip those which already
+    # passed if DB has not been touched since then, others are ran once GUI is up
+    validatedChecks = loadValidationState()
 
 else:
     # If database does not exist, do not worry about migration. Simply
@@ -57,3 +145,4 @@ else:
     pyfalog.debug("Existing database not found, creating new database.")
     db.saveddata_meta.create_all()
     db.saveddata_engine.execute('PRAGMA user_version = {}'.format(migration.getAppVersion()))
+    validatedChecks = set(VALIDATION_CHECKS)
@@ -21,13 +21,16 @@
 import queue
 import threading
 import timeit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from itertools import chain
 
 import math
 import wx
 from logbook import Logger
 
+import eos.config
 from eos import db
+from eos.gamedata import Item
 from eos.saveddata.price import PriceStatus
 from service.fit import Fit
 from service.market import Market
@@ -50,7 +53,18 @@ class Price:
 
     sources = {}
 
+    # Amount of types requested from a price source at once, sources can override it
+    # via chunkSize attribute
+    fetchChunkSize = 100
+    # Part of fetch timeout after which next price source is started, unless everything is fetched
+    hedgeDelayShare = 0.2
+    fetchWorkers = 8
+    # Service keeping prices up to date with scheduled snapshots, it sets itself here
+    snapshots = None
+
     def __init__(self):
+        if eos.config.priceTableCache:
+            db.loadPriceTable()
         # Start price fetcher
         self.priceWorkerThread = PriceWorkerThread()
         self.priceWorkerThread.daemon = True
@@ -109,48 +123,14 @@ class Price:
         # When we have picked primary source, make sure to include only sources from the same group to avoid fetching
         # tranquility data for serenity or vice versa
         sourceAll = list(n for n, s in cls.sources.items() if s.group == cls.sources[sourcePrimary].group)
-
-        # Format: {source name: timeout weight}
-        sources = {sourcePrimary: len(sourceAll)}
-        for source in sourceAll:
-            if source == sourcePrimary:
-                continue
-            sources[source] = min(sources.values()) - 1
+        sourceOrder = [sourcePrimary] + [s for s in sourceAll if s != sourcePrimary]
 
         # Record timeouts as it will affect our final decision
-        timedOutSources = {}
-
-        remainingTime = fetchTimeout
-
-        for source in sorted(sources, key=sources.get, reverse=True):
-            timeBefore = timeit.default_timer()
-            pyfalog.info('Trying {}'.format(source))
-            timedOutSources[source] = False
-            # Time we allocate for a source depends on source weight and remaining time
-            sourceFetchTimeout = remainingTime * sources[source] / sum(sources.values())
-            try:
-                sourceCls = cls.sources.get(source)
-                sourceCls(priceMap, cls.systemsList[sFit.serviceFittingOptions["priceSystem"]], sourceFetchTimeout)
-            except TimeoutError:
-                pyfalog.warning("Price fetch timeout for source {}".format(source))
-                timedOutSources[source] = True
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception as e:
-                pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(source, e))
-            # Sources remove price map items as they fetch info, if none remain then we're done
-            if not priceMap:
-                break
-            timeAfter = timeit.default_timer()
-            # Remove source so it doesn't affect time weights of sources we're going to use next
-            del sources[source]
-            remainingTime -= timeAfter - timeBefore
-            # No time remaining (should not happen) - mark remaining sources as timeout
-            if remainingTime <= 0:
-                for source in sources:
-                    timedOutSources[source] = True
-                break
+        timedOutSources = cls.fetchFromSources(
+            priceMap, sourceOrder, cls.systemsList[sFit.serviceFittingOptions["priceSystem"]], fetchTimeout)
 
+        if not priceMap:
+            return
 
         # If we get to this point, then we've failed to get price with all our sources
         # If all sources failed due to timeouts, set one status
@@ -163,6 +143,72 @@ class Price:
             for typeID in priceMap.keys():
                 priceMap[typeID].update(PriceStatus.fetchFail)
 
+    @classmethod
+    def fetchFromSources(cls, priceMap, sourceOrder, system, fetchTimeout):
+        """
+        Fetch prices for {typeID: price} map from sources, in order of preference. Types are
+        split into chunks which are requested in parallel. Next source is raced against the
+        ones already running if they fail, or do not deliver all prices within hedge delay;
+        first successful answer for a type wins. Fetched types are removed from the map.
+
+        :return: {source name: True if source timed out} for all sources which were needed
+        """
+        resolver = PriceResolver(priceMap)
+        deadline = timeit.default_timer() + fetchTimeout
+        hedgeDelay = fetchTimeout * cls.hedgeDelayShare
+        timedOutSources = {}
+        futures = {}
+        executor = ThreadPoolExecutor(max_workers=cls.fetchWorkers, thread_name_prefix='PriceFetch')
+        try:
+            for source in sourceOrder:
+                typeIDs = resolver.getPending()
+                remainingTime = deadline - timeit.default_timer()
+                if not typeIDs or remainingTime <= 0:
+                    break
+                pyfalog.info('Trying {}'.format(source))
+                timedOutSources[source] = False
+                sourceCls = cls.sources[source]
+                chunkSize = getattr(sourceCls, 'chunkSize', cls.fetchChunkSize)
+                sourceFutures = []
+                for i in range(0, len(typeIDs), chunkSize):
+                    future = executor.submit(sourceCls, resolver.getClaims(typeIDs[i:i + chunkSize]), system, remainingTime)
+                    futures[future] = source
+                    sourceFutures.append(future)
+                # Give the source a head start before racing it with the next one
+                wait(sourceFutures, timeout=min(hedgeDelay, remainingTime))
+            # Wait until everything is fetched, or there's nothing left to wait for
+            while resolver.getPending():
+                running = [f for f in futures if not f.done()]
+                remainingTime = deadline - timeit.default_timer()
+                if not running or remainingTime <= 0:
+                    break
+                wait(running, timeout=remainingTime, return_when=FIRST_COMPLETED)
+        finally:
+            # Late answers are of no use anymore
+            executor.shutdown(wait=False, cancel_futures=True)
+            resolver.close()
+
+        failedSources = {}
+        for future, source in futures.items():
+            if not future.done():
+                # Requests still running do not matter if we got everything from elsewhere
+                if priceMap:
+                    timedOutSources[source] = True
+            elif isinstance(future.exception(), TimeoutError):
+                timedOutSources[source] = True
+            elif future.exception() is not None:
+                failedSources.setdefault(source, future.exception())
+        for source, timedOut in timedOutSources.items():
+            if timedOut:
+                pyfalog.warning("Price fetch timeout for source {}".format(source))
+            elif source in failedSources:
+                pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(source, failedSources[source]))
+        # Sources we had no time for
+        if priceMap:
+            for source in sourceOrder:
+                timedOutSources.setdefault(source, True)
+        return timedOutSources
+
     def getPriceNow(self, objitem):
         """Get price for provided typeID"""
         sMkt = Market.getInstance()
@@ -172,11 +218,10 @@ class Price:
 
     def getPrices(self, objitems, callback, fetchTimeout=30, waitforthread=False, validityOverride=None):
         """Get prices for multiple typeIDs"""
-        requests = []
         sMkt = Market.getInstance()
-        for objitem in objitems:
-            item = sMkt.getItem(objitem)
-            requests.append(item.price)
+        items = [sMkt.getItem(objitem) for objitem in objitems]
+        Item.preloadPrices(items)
+        requests = [item.price for item in items]
 
         def cb():
             try:
@@ -191,7 +236,12 @@ class Price:
         if waitforthread:
             self.priceWorkerThread.setToWait(requests, cb)
         else:
-            self.priceWorkerThread.trigger(requests, cb, fetchTimeout, validityOverride)
+            # Prices kept up to date by scheduled snapshots are not fetched on demand
+            if self.snapshots is not None and self.snapshots.enabled:
+                fetchRequests = [p for p in requests if p.snapshotID is None]
+            else:
+                fetchRequests = requests
+            self.priceWorkerThread.trigger(fetchRequests, cb, fetchTimeout, validityOverride)
 
     def clearPriceCache(self):
         pyfalog.debug("Clearing Prices")
@@ -229,6 +279,46 @@ class Price:
         self.getPrices(itemsToFetch, makeCheapMapCb, fetchTimeout=fetchTimeout, validityOverride=validityOverride)
 
 
+class PriceResolver:
+    """
+    Collects prices fetched concurrently. Price sources get maps of claims instead of
+    actual price objects; first claim updated with successful fetch wins, others are
+    ignored, as is everything coming in after close().
+    """
+
+    def __init__(self, priceMap):
+        self.priceMap = priceMap
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def getPending(self):
+        with self.lock:
+            return list(self.priceMap)
+
+    def getClaims(self, typeIDs):
+        return {typeID: PriceClaim(self, typeID) for typeID in typeIDs}
+
+    def resolve(self, typeID, status, price):
+        with self.lock:
+            if self.closed or typeID not in self.priceMap:
+                return
+            self.priceMap.pop(typeID).update(status, price)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+
+
+class PriceClaim:
+
+    def __init__(self, resolver, typeID):
+        self.resolver = resolver
+        self.typeID = typeID
+
+    def update(self, status, price=0):
+        # Failures are decided on once all sources had their chance
+        if status == PriceStatus.fetchSuccess:
+            self.resolver.resolve(self.typeID, status, price)
 
 
 class PriceWorkerThread(threading.Thread):
@@ -0,0 +1,229 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import json
+import os
+import threading
+from time import time
+
+import wx
+from logbook import Logger
+
+import config
+from eos import db
+from eos.saveddata.price import Price as types_Price, PriceSnapshot as types_PriceSnapshot, PriceStatus
+from service.fit import Fit
+from service.price import Price
+from service.settings import MarketPriceSettings
+
+
+pyfalog = Logger(__name__)
+
+SNAPSHOT_FORMAT = 1
+# Seconds between checks whether snapshot needs a refresh
+CHECK_INTERVAL = 10 * 60
+
+
+class PriceSnapshot:
+    """
+    Prices of all market types, refreshed by a scheduled job instead of on demand.
+
+    Snapshots are fetched from regular price sources via price worker thread, or
+    loaded from a file exported on another machine. Prices which came from a
+    snapshot are not re-fetched on demand while snapshots are enabled.
+    """
+    instance = None
+
+    # Catalogue is fetched in batches queued one after another, so that on-demand price
+    # requests do not wait for the whole of it; network budget is per batch
+    fetchBatchSize = 1000
+    fetchTimeout = 60
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = PriceSnapshot()
+        return cls.instance
+
+    def __init__(self):
+        self.settings = MarketPriceSettings.getInstance()
+        self.schedulerThread = None
+        self.refreshing = False
+        Price.snapshots = self
+
+    @property
+    def enabled(self):
+        return bool(self.settings.get('snapshotInterval') or self.settings.get('snapshotPath'))
+
+    @staticmethod
+    def getPriceObjects(typeIDs):
+        """Return {typeID: price} for all passed types, creating missing price objects"""
+        prices = db.getPrices(typeIDs)
+        for typeID in typeIDs:
+            if typeID not in prices:
+                price = types_Price(typeID)
+                db.add(price)
+                prices[typeID] = price
+        return prices
+
+    def startScheduler(self):
+        if self.schedulerThread is not None:
+            return
+        self.schedulerThread = PriceSnapshotThread(self)
+        self.schedulerThread.daemon = True
+        self.schedulerThread.start()
+
+    def refreshIfDue(self):
+        if self.refreshing:
+            return
+        path = self.settings.get('snapshotPath')
+        if path:
+            if os.path.isfile(path):
+                try:
+                    self.importFile(path)
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except Exception as e:
+                    pyfalog.error("Failed to import price snapshot from {}: {}", path, e)
+            return
+        interval = self.settings.get('snapshotInterval')
+        if not interval:
+            return
+        latest = db.getLatestPriceSnapshot()
+        if latest is not None and time() - latest.time < interval * 60 * 60:
+            return
+        self.refresh()
+
+    def refresh(self, callback=None):
+        """Fetch prices of all market types in background and store them as a new snapshot"""
+        if self.refreshing:
+            return
+        self.refreshing = True
+        startTime = time()
+        sFit = Fit.getInstance()
+        source = sFit.serviceFittingOptions["priceSource"]
+        prices = list(self.getPriceObjects(db.getMarketTypeIDs()).values())
+        db.flush()
+        pyfalog.info("Refreshing price snapshot for {} types", len(prices))
+        batches = [prices[i:i + self.fetchBatchSize] for i in range(0, len(prices), self.fetchBatchSize)]
+
+        def cb():
+            if batches:
+                # Next batch is queued only now, behind requests which came in meanwhile
+                # Zero validity override makes worker re-fetch everything which was fetched successfully before
+                Price.getInstance().priceWorkerThread.trigger(batches.pop(0), cb, self.fetchTimeout, 0)
+                return
+            try:
+                snapshot = self.storeSnapshot(prices, startTime, source)
+            finally:
+                self.refreshing = False
+            if callback is not None:
+                callback(snapshot)
+
+        cb()
+
+    @staticmethod
+    def storeSnapshot(prices, startTime, source):
+        fetched = [p for p in prices if p.status == PriceStatus.fetchSuccess and p.time >= startTime]
+        snapshot = types_PriceSnapshot(int(startTime), source, len(fetched))
+        db.add(snapshot)
+        db.flush()
+        for price in fetched:
+            price.snapshotID = snapshot.ID
+        # Prices which failed this time are no longer kept fresh by snapshots, let
+        # them be fetched on demand again
+        for price in prices:
+            if price.snapshotID is not None and price.snapshotID != snapshot.ID:
+                price.snapshotID = None
+        db.commit()
+        pyfalog.info("Stored price snapshot {} with {} prices", snapshot.ID, len(fetched))
+        return snapshot
+
+    @staticmethod
+    def exportFile(path):
+        """Write latest snapshot into file; returns False if there is nothing to export"""
+        snapshot = db.getLatestPriceSnapshot()
+        if snapshot is None:
+            return False
+        # Make sure file reflects what's stored
+        db.sync()
+        data = {
+            'format': SNAPSHOT_FORMAT,
+            'version': config.getVersion(),
+            'time': snapshot.time,
+            'source': snapshot.source,
+            # Format: {typeID: [price, time of fetch]}
+            'prices': {str(p.typeID): [p.price, int(p.time)] for p in db.getSnapshotPrices(snapshot.ID)}}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return True
+
+    @classmethod
+    def importFile(cls, path, force=False):
+        """
+        Load snapshot from file, if it is newer than the latest one we have (or if forced).
+        Returns new snapshot or None if file was skipped.
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError('Unsupported price snapshot format: {}'.format(data.get('format')))
+        latest = db.getLatestPriceSnapshot()
+        if not force and latest is not None and latest.time >= data['time']:
+            return None
+        snapshotPrices = {int(typeID): v for typeID, v in data['prices'].items()}
+        snapshot = types_PriceSnapshot(data['time'], 'file: {}'.format(data['source']), len(snapshotPrices))
+        db.add(snapshot)
+        db.flush()
+        prices = cls.getPriceObjects(list(snapshotPrices))
+        for typeID, (value, fetchTime) in snapshotPrices.items():
+            price = prices[typeID]
+            # Keep prices we fetched ourselves if they are fresher
+            if price.status == PriceStatus.fetchSuccess and price.time > fetchTime:
+                continue
+            price.update(PriceStatus.fetchSuccess, value)
+            price.time = fetchTime
+            price.snapshotID = snapshot.ID
+        db.commit()
+        pyfalog.info("Imported price snapshot {} with {} prices from {}", snapshot.ID, len(snapshotPrices), path)
+        return snapshot
+
+
+class PriceSnapshotThread(threading.Thread):
+
+    def __init__(self, snapshotService):
+        threading.Thread.__init__(self)
+        self.name = "PriceSnapshot"
+        self.snapshotService = snapshotService
+        self.cv = threading.Condition()
+        self.running = True
+
+    def run(self):
+        while self.running:
+            # Database work is done on the main thread
+            if self.snapshotService.enabled:
+                wx.CallAfter(self.snapshotService.refreshIfDue)
+            with self.cv:
+                self.cv.wait(CHECK_INTERVAL)
+
+    def stop(self):
+        self.running = False
+        with self.cv:
+            self.cv.notify()
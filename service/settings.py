@@ -300,13 +300,20 @@ class HTMLExportSettings:
     def __init__(self):
         serviceHTMLExportDefaultSettings = {
             "path"   : config.savePath + os.sep + 'pyfaFits.html',
-            "minimal": False
+            "minimal": False,
+            "enabled": False
         }
         self.serviceHTMLExportSettings = SettingsProvider.getInstance().getSettings(
                 "pyfaServiceHTMLExportSettings",
                 serviceHTMLExportDefaultSettings
         )
 
+    def getEnabled(self):
+        return self.serviceHTMLExportSettings["enabled"]
+
+    def setEnabled(self, enabled):
+        self.serviceHTMLExportSettings["enabled"] = enabled
+
     def getMinimalEnabled(self):
         return self.serviceHTMLExportSettings["minimal"]
 
@@ -455,7 +462,11 @@ class MarketPriceSettings:
             "marketMGJumpMode": 0,
             "marketMGEmptyMode": 1,
             "marketMGSearchMode": 0,
-            "marketMGMarketSelectMode": 0
+            "marketMGMarketSelectMode": 0,
+            # Hours between full price snapshot refreshes, 0 - disabled
+            "snapshotInterval": 0,
+            # Snapshot file to load prices from instead of fetching them (e.g. shared by other machine)
+            "snapshotPath": ""
         }
 
         self.PriceMenuDefaultSettings = SettingsProvider.getInstance().getSettings("pyfaPriceMenuSettings",
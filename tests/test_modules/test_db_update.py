@@ -0,0 +1,147 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..')))
+
+import json
+
+import pytest
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, create_engine, text
+
+import db_update
+from db_update import findRemovedTypes, _insertRows, _iterJsonEntries, _normalizeRows, _syncTable
+
+
+GROUP_ROWS = [
+    {'groupID': 1, 'categoryID': 30},
+    {'groupID': 2, 'categoryID': 30},
+    {'groupID': 3, 'categoryID': 6},
+]
+ITEM_ROWS = {
+    100: {'typeID': 100, 'groupID': 1},
+    101: {'typeID': 101, 'groupID': 2, 'variationParentTypeID': None},
+    # Variations of removed types go away even if they are in other groups,
+    # and so do their own variations
+    200: {'typeID': 200, 'groupID': 3, 'variationParentTypeID': 100},
+    201: {'typeID': 201, 'groupID': 3, 'variationParentTypeID': 200},
+    300: {'typeID': 300, 'groupID': 3},
+    301: {'typeID': 301, 'groupID': 3, 'variationParentTypeID': 300},
+}
+
+
+def test_findRemovedTypes():
+    assert findRemovedTypes((30,), GROUP_ROWS, ITEM_ROWS) == {100, 101, 200, 201}
+    assert findRemovedTypes((6,), GROUP_ROWS, ITEM_ROWS) == {200, 201, 300, 301}
+    assert findRemovedTypes((), GROUP_ROWS, ITEM_ROWS) == set()
+
+
+JSON_ENTRIES = [
+    {'typeID': 587, 'typeName': 'Rifter', 'attributes': {'mass': 1067000.0, 'capacity': 140}},
+    {'typeID': 588, 'typeName': 'Say "hi" \\o/, {not: [a], "container"}', 'published': True, 'marketGroupID': None},
+    {'typeID': 589, 'description': 'Línea\nnext\ttab \u2013 dash', 'traits': [[1, -2.5e-3], [], {}]},
+    12345678901234567890,
+    'trailing "string" ]',
+]
+
+
+@pytest.mark.parametrize('chunkSize', [1, 2, 7, 1024 * 1024])
+def test_iterJsonEntries_list(monkeypatch, tmp_path, chunkSize):
+    path = tmp_path / 'entries.json'
+    path.write_text(json.dumps(JSON_ENTRIES, indent=1, ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setattr(db_update, 'JSON_READ_CHUNK', chunkSize)
+    assert list(_iterJsonEntries(str(path))) == JSON_ENTRIES
+
+
+@pytest.mark.parametrize('chunkSize', [1, 5, 1024 * 1024])
+def test_iterJsonEntries_dict(monkeypatch, tmp_path, chunkSize):
+    path = tmp_path / 'entries.json'
+    data = {str(i): entry for i, entry in enumerate(JSON_ENTRIES)}
+    data['key with \\ "escapes" :'] = {}
+    path.write_text(json.dumps(data), encoding='utf-8')
+    monkeypatch.setattr(db_update, 'JSON_READ_CHUNK', chunkSize)
+    assert list(_iterJsonEntries(str(path))) == list(data.items())
+
+
+def test_iterJsonEntries_empty(tmp_path):
+    path = tmp_path / 'entries.json'
+    path.write_text(' [ ] ', encoding='utf-8')
+    assert list(_iterJsonEntries(str(path))) == []
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1 2]', '{"a" 1}', '[{"a": 1]'])
+def test_iterJsonEntries_malformed(monkeypatch, tmp_path, text):
+    path = tmp_path / 'entries.json'
+    path.write_text(text, encoding='utf-8')
+    monkeypatch.setattr(db_update, 'JSON_READ_CHUNK', 2)
+    with pytest.raises(json.JSONDecodeError):
+        list(_iterJsonEntries(str(path)))
+
+
+@pytest.fixture
+def SyncDB():
+    engine = create_engine('sqlite://')
+    meta = MetaData()
+    # Per-type table, rows of one type are compared and rewritten together
+    typeAttributes = Table(
+        'dgmtypeattribs', meta,
+        Column('typeID', Integer, primary_key=True),
+        Column('attributeID', Integer, primary_key=True),
+        Column('value', Float))
+    # Other tables are compared row by row, by their primary key
+    groups = Table(
+        'invgroups', meta,
+        Column('groupID', Integer, primary_key=True),
+        Column('name', String))
+    meta.create_all(engine)
+    with engine.begin() as conn:
+        _insertRows(conn, typeAttributes, [(587, 4, 1067000.0), (587, 38, 140.0), (588, 4, 1000.0), (589, 4, 2000.0)])
+        _insertRows(conn, groups, [(25, 'Frigate'), (26, 'Cruiser'), (27, 'Battleship')])
+    yield engine, typeAttributes, groups
+    engine.dispose()
+
+
+def fetchRows(conn, table):
+    """Return {row: rowid} of all rows in the table, rowid changes whenever row gets rewritten"""
+    return {tuple(row[1:]): row[0] for row in conn.execute(text('SELECT rowid, * FROM {}'.format(table.name)))}
+
+
+def test_syncTable_unchanged(SyncDB):
+    engine, typeAttributes, groups = SyncDB
+    with engine.begin() as conn:
+        before = fetchRows(conn, typeAttributes)
+        rows = [{'typeID': 588, 'attributeID': 4, 'value': 1000}, {'typeID': 587, 'attributeID': 38, 'value': '140'},
+                {'typeID': 589, 'attributeID': 4, 'value': 2000.0}, {'typeID': 587, 'attributeID': 4, 'value': 1067000}]
+        assert _syncTable(conn, typeAttributes, _normalizeRows(typeAttributes, rows)) == 0
+        assert fetchRows(conn, typeAttributes) == before
+
+
+def test_syncTable_typeGroups(SyncDB):
+    engine, typeAttributes, groups = SyncDB
+    with engine.begin() as conn:
+        before = fetchRows(conn, typeAttributes)
+        rows = [
+            # Changed value; whole type is rewritten
+            (587, 4, 1067000.0), (587, 38, 150.0),
+            # Unchanged
+            (588, 4, 1000.0),
+            # 589 is removed, 590 is added
+            (590, 4, 3000.0)]
+        assert _syncTable(conn, typeAttributes, rows) == 3
+        after = fetchRows(conn, typeAttributes)
+    assert set(after) == set(rows)
+    # Rows of unchanged type are left untouched
+    assert after[(588, 4, 1000.0)] == before[(588, 4, 1000.0)]
+    assert after[(587, 4, 1067000.0)] != before[(587, 4, 1067000.0)]
+
+
+def test_syncTable_primaryKey(SyncDB):
+    engine, typeAttributes, groups = SyncDB
+    with engine.begin() as conn:
+        before = fetchRows(conn, groups)
+        rows = [(25, 'Frigate'), (26, 'Cruisers'), (28, 'Titan')]
+        assert _syncTable(conn, groups, rows) == 3
+        after = fetchRows(conn, groups)
+    assert set(after) == set(rows)
+    assert after[(25, 'Frigate')] == before[(25, 'Frigate')]
@@ -0,0 +1,60 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeCharge:
+
+    def __init__(self, typeID, volume, chargeSize, published=True):
+        self.ID = typeID
+        self.published = published
+        self.attributes = {'volume': SimpleNamespace(value=volume), 'chargeSize': SimpleNamespace(value=chargeSize)}
+
+    def getAttribute(self, key, default=None):
+        return self.attributes[key].value if key in self.attributes else default
+
+
+@pytest.fixture
+def ChargeIndex(DB, monkeypatch):
+    from eos.chargeIndex import ChargeIndex
+    groups = {
+        83: SimpleNamespace(items=[
+            FakeCharge(1, 0.01, 1), FakeCharge(2, 0.01, 2), FakeCharge(3, 0.01, 1, published=False)]),
+        85: SimpleNamespace(items=[FakeCharge(4, 0.5, 1)])}
+    requests = []
+
+    def getGroup(groupID, eager=None):
+        requests.append(groupID)
+        return groups.get(groupID)
+
+    monkeypatch.setattr(DB['db'], 'getGroup', getGroup)
+    return ChargeIndex(), requests
+
+
+def test_getCharges_size(ChargeIndex):
+    index, requests = ChargeIndex
+    assert {c.ID for c in index.getCharges((83,), 1, 1)} == {1}
+    assert {c.ID for c in index.getCharges((83,), 0, 1)} == {1, 2}
+
+
+def test_getCharges_capacity(ChargeIndex):
+    index, requests = ChargeIndex
+    assert {c.ID for c in index.getCharges((83, 85), 1, 0.1)} == {1}
+    assert {c.ID for c in index.getCharges((83, 85), 1, None)} == {1, 4}
+
+
+def test_getCharges_cached(ChargeIndex):
+    index, requests = ChargeIndex
+    first = index.getCharges((83, 85), 1, 1)
+    assert index.getCharges((83, 85), 1, 1) is first
+    index.getCharges((83,), 2, 1)
+    # Each group is loaded once
+    assert sorted(requests) == [83, 85]
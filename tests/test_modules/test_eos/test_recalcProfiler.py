@@ -0,0 +1,51 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+import time
+from types import SimpleNamespace
+
+from eos.recalcProfiler import RecalcProfiler
+
+
+def makeEffect(effectID, name, runTime='normal', duration=0):
+    def handler(fit, item, context, projectionRange, effect=None):
+        time.sleep(duration)
+        return context
+
+    return SimpleNamespace(ID=effectID, name=name, runTime=runTime), handler
+
+
+def test_wrapHandler():
+    profiler = RecalcProfiler()
+    slowEffect, slowHandler = makeEffect(11, 'slow', duration=0.01)
+    fastEffect, fastHandler = makeEffect(12, 'fast', runTime='late')
+    module = SimpleNamespace(item=SimpleNamespace(ID=587, name='Rifter'))
+    for _ in range(2):
+        assert profiler.wrapHandler(slowEffect, slowHandler)(None, module, ('module',), None, effect=slowEffect) == ('module',)
+    profiler.wrapHandler(fastEffect, fastHandler)(None, module, ('module',), None, effect=fastEffect)
+    report = profiler.getReport()
+    assert [(r['effectID'], r['runTime'], r['calls']) for r in report['effects']] == [(11, 'normal', 2), (12, 'late', 1)]
+    assert report['effects'][0]['time'] >= 20
+    assert report['effects'][0]['name'] == 'slow'
+    assert [(r['typeID'], r['name'], r['calls']) for r in report['items']] == [(587, 'Rifter', 3)]
+
+
+def test_recordCommandBoost(tmp_path):
+    profiler = RecalcProfiler()
+    profiler.recordCommandBoost(10, 'normal', time.perf_counter())
+    profiler.recordRecalc(time.perf_counter() - 0.5)
+    path = str(tmp_path / 'recalc.json')
+    profiler.writeReport(path)
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    assert [(r['warfareBuffID'], r['runTime'], r['calls']) for r in report['commandBoosts']] == [(10, 'normal', 1)]
+    assert report['recalcs']['calls'] == 1
+    assert report['recalcs']['time'] >= 500
+    profiler.reset()
+    assert profiler.getReport()['commandBoosts'] == []
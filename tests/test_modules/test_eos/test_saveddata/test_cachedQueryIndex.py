@@ -0,0 +1,63 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class Thing:
+
+    def __init__(self, ID):
+        self.ID = ID
+
+
+@pytest.fixture
+def Queries(DB):
+    queries = DB['db'].saveddata.queries
+    if not hasattr(queries, 'keyIndex'):
+        pytest.skip('saveddata cache is disabled')
+    things = {ID: Thing(ID) for ID in range(5)}
+    calls = []
+
+    @queries.cachedQuery(Thing, 1, "lookfor")
+    def getThings(lookfor):
+        calls.append(lookfor)
+        return [things[ID] for ID in lookfor]
+
+    yield SimpleNamespace(queries=queries, getThings=getThings, things=things, calls=calls)
+    for ID in things:
+        queries.removeCachedEntry(Thing, ID)
+    del queries.queryCache[Thing]
+    del queries.itemCache[Thing]
+    del queries.keyIndex[Thing]
+
+
+def test_removeCachedEntry(Queries):
+    getThings = Queries.getThings
+    assert len(getThings((0, 1))) == 2
+    assert len(getThings((2, 3))) == 2
+    assert len(getThings((0, 1))) == 2
+    assert Queries.calls == [(0, 1), (2, 3)]
+    Queries.queries.removeCachedEntry(Thing, 1)
+    assert 1 not in Queries.queries.keyIndex[Thing]
+    # Other IDs of dropped query do not point to it anymore
+    assert 0 not in Queries.queries.keyIndex[Thing]
+    assert Queries.queries.keyIndex[Thing][2]
+    getThings((0, 1))
+    getThings((2, 3))
+    assert Queries.calls == [(0, 1), (2, 3), (0, 1)]
+
+
+def test_recache(Queries):
+    getThings = Queries.getThings
+    getThings((0, 1))
+    getThings((0, 1), useCache=False)
+    assert len(Queries.queries.keyIndex[Thing][0]) == 1
+    Queries.queries.removeCachedEntry(Thing, 4)
+    assert Queries.queries.keyIndex[Thing][1]
@@ -0,0 +1,49 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+import pytest
+
+from eos.saveddata.price import Price, PriceStatus
+
+
+@pytest.fixture
+def Prices(DB):
+    db = DB['db']
+    prices = [Price(typeID) for typeID in (587, 588, 589)]
+    for price in prices:
+        price.update(PriceStatus.fetchSuccess, price.typeID * 10)
+        db.add(price)
+    db.commit()
+    yield prices
+    db.priceTable.unload()
+    db.clearPrices()
+
+
+def test_getPrices(DB, Prices):
+    prices = DB['db'].getPrices([587, 589, 590])
+    assert set(prices) == {587, 589}
+    assert prices[589].price == 5890
+
+
+def test_getPrices_chunked(DB, Prices, monkeypatch):
+    monkeypatch.setattr(DB['db'].saveddata.queries, 'PRICE_QUERY_CHUNK', 2)
+    assert set(DB['db'].getPrices(range(580, 600))) == {587, 588, 589}
+
+
+def test_priceTable(DB, Prices):
+    db = DB['db']
+    assert isinstance(db.priceTable, db.saveddata.queries.PriceTable)
+    db.loadPriceTable()
+    assert db.getPrice(588) is Prices[1]
+    assert db.getPrice(590) is None
+    # New prices are picked up by the table
+    price = Price(590)
+    db.add(price)
+    assert db.getPrices([587, 590]) == {587: Prices[0], 590: price}
+    db.clearPrices()
+    assert db.getPrice(587) is None
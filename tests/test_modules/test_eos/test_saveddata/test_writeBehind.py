@@ -0,0 +1,133 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+import pytest
+
+
+@pytest.fixture
+def WriteBehind(DB):
+    """Write-behind enabled with scheduler which just remembers timers, so that tests can fire them."""
+    timers = []
+    writeBehind = DB['db'].writeBehind
+    writeBehind.enable(lambda delay, func: timers.append(func), delay=0.5, maxDelay=5)
+    yield writeBehind, timers
+    writeBehind.disable()
+
+
+def _addPattern(DB, name):
+    from eos.saveddata.damagePattern import DamagePattern
+    pattern = DamagePattern(10, 20, 30, 40)
+    pattern.rawName = name
+    DB['db'].save(pattern)
+    return pattern
+
+
+def test_commit_deferred(DB, WriteBehind):
+    writeBehind, timers = WriteBehind
+    pattern = _addPattern(DB, 'writeBehindDeferred')
+    # Changes are flushed, i.e. visible to queries, but transaction is still open
+    assert pattern.ID is not None
+    assert DB['saveddata_session'].in_transaction()
+    assert writeBehind.pending
+    assert len(timers) == 1
+    timers.pop()()
+    assert not writeBehind.pending
+    assert not DB['saveddata_session'].in_transaction()
+
+
+def test_commit_batched(DB, WriteBehind):
+    writeBehind, timers = WriteBehind
+    commits = writeBehind.commits
+    for i in range(5):
+        _addPattern(DB, 'writeBehindBatched{}'.format(i))
+    # Only the latest timer commits
+    for timer in timers:
+        timer()
+    assert not writeBehind.pending
+    assert writeBehind.commits == commits + 1
+
+
+def test_sync(DB, WriteBehind):
+    writeBehind, timers = WriteBehind
+    _addPattern(DB, 'writeBehindSync')
+    DB['db'].sync()
+    assert not writeBehind.pending
+    assert not DB['saveddata_session'].in_transaction()
+    # Timer has nothing to do afterwards
+    commits = writeBehind.commits
+    timers.pop()()
+    assert writeBehind.commits == commits
+
+
+def test_commit_disabled(DB):
+    writeBehind = DB['db'].writeBehind
+    assert not writeBehind.enabled
+    _addPattern(DB, 'writeBehindDisabled')
+    assert not writeBehind.pending
+    assert not DB['saveddata_session'].in_transaction()
+
+
+def test_failedFlush_keepsPending(DB, WriteBehind):
+    from eos.saveddata.damagePattern import DamagePattern
+    writeBehind, timers = WriteBehind
+    session = DB['saveddata_session']
+    pattern = _addPattern(DB, 'writeBehindKept')
+    _addPattern(DB, 'writeBehindKept2')
+    assert writeBehind.pending
+    # Another row with the same primary key can't be flushed
+    clash = DamagePattern(1, 1, 1, 1)
+    clash.rawName = 'writeBehindClash'
+    clash.ID = pattern.ID
+    DB['db'].add(clash)
+    with pytest.raises(Exception):
+        DB['db'].commit()
+    # Change which was already reported as committed made it to disk
+    assert not writeBehind.pending
+    assert not session.in_transaction()
+    assert clash not in session
+    assert session.query(DamagePattern).filter(DamagePattern.rawName.in_(['writeBehindKept', 'writeBehindKept2'])).count() == 2
+    # Session is usable afterwards
+    _addPattern(DB, 'writeBehindAfterFailure')
+    DB['db'].sync()
+    assert session.query(DamagePattern).filter(DamagePattern.rawName == 'writeBehindAfterFailure').count() == 1
+
+
+def test_fileDB_notCommittedEarly(DB, tmp_path):
+    import sqlite3
+    import threading
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from eos.db.saveddata.writeBehind import WriteBehind
+    from eos.saveddata.damagePattern import DamagePattern
+    path = str(tmp_path / 'saveddata.db')
+    engine = create_engine('sqlite:///' + path)
+    DB['db'].saveddata_meta.create_all(bind=engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    timers = []
+    writeBehind = WriteBehind(session, threading.RLock())
+    writeBehind.enable(lambda delay, func: timers.append(func))
+
+    def onDisk():
+        conn = sqlite3.connect(path)
+        try:
+            return [r[0] for r in conn.execute('SELECT name FROM damagePatterns ORDER BY name')]
+        finally:
+            conn.close()
+
+    # Commit with nothing to flush must not leave changes which follow it outside of transaction
+    writeBehind.commit()
+    for name in ('first', 'second', 'third'):
+        pattern = DamagePattern(10, 20, 30, 40)
+        pattern.rawName = name
+        session.add(pattern)
+        writeBehind.commit()
+        assert onDisk() == []
+    timers[-1]()
+    assert onDisk() == ['first', 'second', 'third']
+    session.close()
+    engine.dispose()
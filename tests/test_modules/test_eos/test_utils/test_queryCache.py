@@ -0,0 +1,50 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+from eos.utils.queryCache import QueryCache, QueryCaches
+
+
+def test_queryCache_lru():
+    cache = QueryCache('getItem', 2)
+    cache.set((1, None), 'a')
+    cache.set((2, None), 'b')
+    assert cache.get((1, None)) == (True, 'a')
+    cache.set((3, None), 'c')
+    assert cache.get((2, None)) == (False, None)
+    assert cache.get((1, None)) == (True, 'a')
+    assert cache.get((3, None)) == (True, 'c')
+    stats = cache.getStats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['evictions']) == (2, 3, 1, 1)
+    assert stats['hitRate'] == 0.75
+    assert stats['size'] > 0
+
+
+def test_queryCache_limit():
+    cache = QueryCache('getGroup', 3)
+    for i in range(3):
+        cache.set((i, None), [i])
+    size = cache.getStats()['size']
+    cache.setLimit(1)
+    stats = cache.getStats()
+    assert (stats['entries'], stats['evictions']) == (1, 2)
+    assert 0 < stats['size'] < size
+    cache.clear()
+    assert cache.getStats()['size'] == 0
+
+
+def test_queryCaches_report():
+    caches = QueryCaches()
+    cache = caches.register('getAttributeInfo')
+    assert caches.register('getAttributeInfo') is cache
+    cache.get(('cpu', None))
+    caches.setLimit('getAttributeInfo', 5)
+    report = caches.getReport()
+    assert report['getAttributeInfo']['misses'] == 1
+    assert report['getAttributeInfo']['limit'] == 5
+    caches.resetCounters()
+    assert caches.getReport()['getAttributeInfo']['misses'] == 0
@@ -0,0 +1,84 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+import pytest
+from eos.effectHandlerHelpers import HandledList, revisionCounter
+from eos.utils.statCache import fitStat, statCacheCounters
+
+
+class FakeFit:
+
+    def __init__(self):
+        self.modules = HandledList()
+        self.calculated = True
+        self.calcRevision = next(revisionCounter)
+        self._statCache = {}
+        self._statCacheRevision = None
+        self.calls = 0
+
+    @property
+    def revision(self):
+        if not self.calculated:
+            return None
+        return max(self.calcRevision, self.modules.revision)
+
+    @property
+    @fitStat
+    def moduleCount(self):
+        self.calls += 1
+        return len(self.modules)
+
+    @fitStat
+    def getModulesOver(self, value):
+        self.calls += 1
+        return len([m for m in self.modules if m > value])
+
+
+@pytest.fixture
+def Fit():
+    statCacheCounters.reset()
+    return FakeFit()
+
+
+def test_fitStat_memoized(Fit):
+    Fit.modules.extend([1, 2, 3])
+    assert Fit.moduleCount == 3
+    assert Fit.moduleCount == 3
+    assert Fit.getModulesOver(1) == 2
+    assert Fit.getModulesOver(1) == 2
+    assert Fit.getModulesOver(2) == 1
+    assert Fit.calls == 3
+    assert statCacheCounters.getReport() == {'moduleCount': (1, 1, 0.5), 'getModulesOver': (1, 2, 1 / 3)}
+
+
+def test_fitStat_listMutation(Fit):
+    Fit.modules.append(1)
+    assert Fit.moduleCount == 1
+    Fit.modules.append(2)
+    assert Fit.moduleCount == 2
+    Fit.modules.pop(0)
+    assert Fit.moduleCount == 1
+    del Fit.modules[0]
+    assert Fit.moduleCount == 0
+    assert Fit.calls == 4
+
+
+def test_fitStat_recalc(Fit):
+    Fit.modules.append(1)
+    assert Fit.moduleCount == 1
+    Fit.calcRevision = next(revisionCounter)
+    assert Fit.moduleCount == 1
+    assert Fit.calls == 2
+
+
+def test_fitStat_notCalculated(Fit):
+    Fit.calculated = False
+    assert Fit.moduleCount == 0
+    assert Fit.moduleCount == 0
+    assert Fit.calls == 2
+    assert statCacheCounters.getReport() == {}
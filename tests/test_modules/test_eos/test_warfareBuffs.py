@@ -0,0 +1,88 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+from types import SimpleNamespace
+
+from eos.warfareBuffs import BOOST, FORCE, INCREASE, WARFARE_BUFFS, applyWarfareBuff
+
+OPERATIONS = {BOOST: 'PostPercent', INCREASE: 'ModAdd', FORCE: 'PostAssignment'}
+
+
+class Item:
+
+    def __init__(self, skills=(), group='Other'):
+        self.skills = skills
+        self.group = SimpleNamespace(name=group)
+        self.skillChecks = 0
+
+    def requiresSkill(self, skill):
+        self.skillChecks += 1
+        return skill in self.skills
+
+
+class Holder:
+
+    def __init__(self, item=None, charge=None):
+        self.item = item
+        self.charge = charge
+        self.itemModifiedAttributes = {}
+        self.calls = []
+
+    def boostItemAttr(self, attr, value, stackingPenalties=False):
+        self.calls.append(('boostItemAttr', attr, value, stackingPenalties))
+
+    def boostChargeAttr(self, attr, value, stackingPenalties=False):
+        self.calls.append(('boostChargeAttr', attr, value, stackingPenalties))
+
+    def increaseItemAttr(self, attr, value):
+        self.calls.append(('increaseItemAttr', attr, value))
+
+    def forceItemAttr(self, attr, value):
+        self.calls.append(('forceItemAttr', attr, value))
+
+
+def makeFit(modules=(), drones=()):
+    return SimpleNamespace(ship=Holder(), modules=list(modules), drones=list(drones))
+
+
+def test_applyWarfareBuff_ship():
+    fit = makeFit()
+    applyWarfareBuff(fit, 10, 5, {})
+    assert fit.ship.calls == [('boostItemAttr', 'shield{}DamageResonance'.format(t), 5, True) for t in ('Em', 'Thermal', 'Kinetic', 'Explosive')]
+
+
+def test_applyWarfareBuff_modules():
+    booster = Holder(Item(skills=('Shield Operation',)))
+    gun = Holder(Item(skills=('Gunnery',)))
+    fit = makeFit(modules=(booster, gun, Holder()))
+    targetCache = {}
+    applyWarfareBuff(fit, 11, -10, targetCache)
+    applyWarfareBuff(fit, 11, -10, targetCache)
+    assert booster.calls == 2 * [('boostItemAttr', 'capacitorNeed', -10, False), ('boostItemAttr', 'duration', -10, False)]
+    assert gun.calls == []
+    # Filter is evaluated once per target cache
+    assert gun.item.skillChecks == 3
+
+
+def test_applyWarfareBuff_unknown():
+    fit = makeFit(modules=(Holder(Item()),))
+    applyWarfareBuff(fit, -1, 5, {})
+    assert fit.ship.calls == []
+    assert fit.modules[0].calls == []
+
+
+def test_warfareBuffsMatchBuffCollections():
+    path = os.path.realpath(os.path.join(script_dir, '..', '..', '..', 'staticdata', 'fsd_lite', 'dbuffcollections.0.json'))
+    with open(path, encoding='utf-8') as f:
+        buffCollections = json.load(f)
+    for warfareBuffID, modifiers in WARFARE_BUFFS.items():
+        buff = buffCollections.get(str(warfareBuffID))
+        assert buff is not None, warfareBuffID
+        for modifier in modifiers:
+            assert OPERATIONS[modifier.operation] == buff['operationName'], warfareBuffID
@@ -0,0 +1,115 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from gui.utils import exportHtml as exportHtmlModule
+from gui.utils.exportHtml import exportHtmlThread
+
+
+class FakeMarket:
+
+    def __init__(self):
+        self.groups = {
+            1: SimpleNamespace(ID=1, name='Frigate'),
+            2: SimpleNamespace(ID=2, name='Cruiser')}
+        self.ships = {
+            1: [SimpleNamespace(ID=587, name='Rifter'), SimpleNamespace(ID=603, name='Merlin')],
+            2: [SimpleNamespace(ID=620, name='Osprey')]}
+
+    def getShipRoot(self):
+        return self.groups.values()
+
+    def getShipList(self, groupID):
+        return self.ships[groupID]
+
+
+class FakeFitService:
+
+    def __init__(self, fits):
+        self.fits = fits
+
+    def getAllFitChanges(self):
+        return self.fits
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    renders = []
+
+    def getFit(fitID):
+        renders.append(fitID)
+        return SimpleNamespace(ID=fitID)
+
+    monkeypatch.setattr(exportHtmlModule, 'getFit', getFit)
+    monkeypatch.setattr(exportHtmlModule.Port, 'exportEft', lambda fit, options: 'EFT {}'.format(fit.ID))
+    monkeypatch.setattr(exportHtmlModule.Port, 'exportDna', lambda fit, options: 'DNA{}'.format(fit.ID))
+    return renders
+
+
+def test_getShipGroups():
+    sFit = FakeFitService([(1, 'Brawler', 603, 10), (2, 'Kiter', 587, 10), (3, 'Tackle', 603, 11)])
+    shipGroups = exportHtmlThread.getShipGroups(FakeMarket(), sFit)
+    assert [(group.name, [(ship.name, [fit[0] for fit in fits]) for ship, fits in ships]) for group, ships in shipGroups] == [
+        ('Frigate', [('Merlin', [1, 3]), ('Rifter', [2])])]
+
+
+def test_generateHTML_incremental(renders):
+    renderCache = {}
+    fits = [(1, 'Brawler', 603, 10), (2, 'Kiter', 587, 10)]
+    thread = exportHtmlThread(renderCache=renderCache)
+    html = ''.join(thread.generateFullHTML(thread.getShipGroups(FakeMarket(), FakeFitService(fits)), 'url/'))
+    assert renders == [1, 2]
+    assert html.count('<pre>EFT 1\n') == 2
+    assert 'Merlin - Brawler' in html
+
+    # Only changed fit is rendered again, removed fits are forgotten
+    fits = [(1, 'Brawler', 603, 12)]
+    thread = exportHtmlThread(renderCache=renderCache)
+    shipGroups = thread.getShipGroups(FakeMarket(), FakeFitService(fits))
+    html = ''.join(thread.generateMinimalHTML(shipGroups, 'url/'))
+    html += ''.join(thread.generateFullHTML(shipGroups, 'url/'))
+    thread.pruneRenderCache(shipGroups)
+    assert renders == [1, 2, 1, 1]
+    assert 'href="url/DNA1">Merlin: Brawler' in html
+    assert 'Kiter' not in html
+    assert set(renderCache) == {(1, 'eft'), (1, 'dna')}
+
+
+def test_run_overlappingExports(monkeypatch, tmp_path):
+    path = str(tmp_path / 'fits.html')
+    settings = SimpleNamespace(getMinimalEnabled=lambda: False, getPath=lambda: path)
+    monkeypatch.setattr(exportHtmlModule.HTMLExportSettings, 'getInstance', lambda: settings)
+    monkeypatch.setattr(exportHtmlModule.Market, 'getInstance', lambda: FakeMarket())
+    monkeypatch.setattr(exportHtmlModule.Fit, 'getInstance', lambda: FakeFitService([]))
+    monkeypatch.setattr(exportHtmlModule.time, 'sleep', lambda seconds: None)
+    newer = exportHtmlThread()
+
+    def generateFullHTML(thread, shipGroups, dnaUrl):
+        if thread is newer:
+            yield 'newer'
+            return
+        yield 'older'
+        # Newer export starts and completes while older one is still writing
+        thread.stop()
+        newer.start()
+        newer.join()
+        yield ' stopped'
+
+    monkeypatch.setattr(exportHtmlThread, 'generateFullHTML', generateFullHTML)
+    older = exportHtmlThread()
+    older.start()
+    older.join()
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'newer'
+    assert os.listdir(str(tmp_path)) == ['fits.html']
@@ -0,0 +1,64 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import threading
+
+import pytest
+
+wx = pytest.importorskip('wx')
+
+from gui.utils.progressHelper import ProgressHelper
+
+
+@pytest.fixture
+def CallAfter(monkeypatch):
+    calls = []
+    monkeypatch.setattr(wx, 'CallAfter', lambda func, *args: calls.append((func, args)))
+    return calls
+
+
+def test_dialogDone_runsCallback(CallAfter):
+    called = []
+    progress = ProgressHelper('', callback=lambda *args: called.append(args))
+    progress.workerDone(['result'], None)
+    progress.dialogDone()
+    assert called == [(['result'], None)]
+    assert CallAfter == []
+
+
+def test_dialogDone_cancelledNotDeferred(CallAfter):
+    called = []
+    progress = ProgressHelper('', callback=lambda *args: called.append(args))
+    progress.dlgWorking = False
+    progress.dialogDone()
+    # Callback does not wait for worker which does not report through workerDone
+    assert called == [()]
+
+
+def test_dialogDone_cancelledDeferred(CallAfter):
+    called = []
+    progress = ProgressHelper('', callback=lambda *args: called.append(args), deferCallback=True)
+    cancelled = threading.Event()
+
+    def worker():
+        cancelled.wait(5)
+        # Jobs which were not started after cancellation have no result
+        progress.workerDone(['result', None], None)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    # User cancels while worker is still running
+    progress.dlgWorking = False
+    progress.dialogDone()
+    assert called == []
+    cancelled.set()
+    thread.join()
+    # Callback gets partial results, in main thread
+    assert len(CallAfter) == 1
+    func, args = CallAfter[0]
+    func(*args)
+    assert called == [(['result', None], None)]
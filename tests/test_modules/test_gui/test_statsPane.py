@@ -0,0 +1,129 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+wx = pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from gui.statsPane import StatsPane, StatsWorkerThread
+from service.fit import Fit
+
+
+class StubFit:
+
+    def __init__(self):
+        self.ID = 1
+        self.revision = 1
+        self.cleared = 0
+
+    def clearFactorReloadDependentData(self):
+        self.cleared += 1
+
+
+class StubView:
+
+    def __init__(self, expensive=False, collapsed=False, onPrecalculate=None):
+        self.expensive = expensive
+        parent = SimpleNamespace(IsCollapsed=lambda: collapsed)
+        self.panel = SimpleNamespace(GetParent=lambda: parent)
+        self.onPrecalculate = onPrecalculate
+        self.precalculated = 0
+        self.refreshed = []
+
+    def precalculate(self, fit):
+        self.precalculated += 1
+        if self.onPrecalculate is not None:
+            self.onPrecalculate()
+
+    def refreshPanel(self, fit):
+        self.refreshed.append(fit)
+
+
+def makeStatsPane(views, fit):
+    pane = object.__new__(StatsPane)
+    pane.views = views
+    pane.staleViews = set(views)
+    pane.calculatingViews = set()
+    pane.fit = fit
+    pane.requestID = 1
+    pane.statsWorkerThread = SimpleNamespace(requests=[])
+    pane.statsWorkerThread.schedule = lambda *args: pane.statsWorkerThread.requests.append(args)
+    return pane
+
+
+def test_refreshViews_skipsCollapsed():
+    fit = StubFit()
+    cheap = StubView()
+    collapsed = StubView(expensive=True, collapsed=True)
+    expensive = StubView(expensive=True)
+    pane = makeStatsPane([cheap, collapsed, expensive], fit)
+    pane.refreshViews()
+    assert cheap.refreshed == [fit]
+    # Collapsed view is neither refreshed nor calculated, but stays outdated
+    assert collapsed.refreshed == []
+    assert collapsed in pane.staleViews
+    # Expensive view waits for background calculation
+    assert expensive.refreshed == []
+    assert pane.statsWorkerThread.requests == [(1, fit, [expensive])]
+
+
+def test_statsCalculated_dropsStale():
+    fit = StubFit()
+    view = StubView(expensive=True)
+    pane = makeStatsPane([view], fit)
+    pane.refreshViews()
+    # Fit changed before results came back
+    pane.requestID = 2
+    pane.statsCalculated(1, fit, [view])
+    assert view.refreshed == []
+    pane.requestID = 1
+    pane.statsCalculated(1, StubFit(), [view])
+    assert view.refreshed == []
+    pane.statsCalculated(1, fit, [view])
+    assert view.refreshed == [fit]
+
+
+def test_worker_recalculatesChangedFit(monkeypatch):
+    sFit = SimpleNamespace(calcLock=threading.RLock())
+    monkeypatch.setattr(Fit, 'instance', sFit)
+    calledAfter = []
+    monkeypatch.setattr(wx, 'CallAfter', lambda func, *args: calledAfter.append(args))
+    fit = StubFit()
+    lockHeld = []
+
+    def change():
+        # Commands get calculation lock while stats are being calculated
+        acquired = sFit.calcLock.acquire(blocking=False)
+        if acquired:
+            sFit.calcLock.release()
+        lockHeld.append(not acquired)
+        # Fit is changed by a command during the first calculation only
+        if view.precalculated == 1:
+            fit.revision += 1
+
+    view = StubView(expensive=True, onPrecalculate=change)
+    worker = StatsWorkerThread(None)
+    worker.start()
+    try:
+        worker.schedule(1, fit, [view])
+        deadline = time.time() + 5
+        while not calledAfter and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+        worker.join()
+    # Stats of changed fit are thrown away and calculated again
+    assert view.precalculated == 2
+    assert fit.cleared == 1
+    assert calledAfter == [(1, fit, [view])]
+    assert lockHeld == [False, False]
@@ -0,0 +1,81 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+import config
+from service.port.muta import DynamicItemResolver, parseDynamicItemStrings
+
+
+class StubEsiHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        typeID, itemID = map(int, re.search(r'/dynamic/items/(\d+)/(\d+)/', self.path).groups())
+        if itemID == 404:
+            body = json.dumps({'error': 'Item not found'}).encode()
+            self.send_response(404)
+        else:
+            body = json.dumps({
+                'source_type_id': typeID - 1,
+                'mutator_type_id': 47408,
+                'dogma_attributes': [{'attribute_id': 20, 'value': itemID / 1000}]}).encode()
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def StubEsi():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubEsiHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.apiServer = config.ApiServer('Stub', 'sso.invalid', 'http://127.0.0.1:{}'.format(httpd.server_address[1]), 'client', 'callback', False)
+    yield httpd
+    httpd.shutdown()
+
+
+def test_parseDynamicItemStrings():
+    text = ('<url=showinfo:47820//1001>Abyssal Stasis Webifier</url> '
+            '<url=showinfo:47820//1002>Abyssal Stasis Webifier</url> '
+            '<url=showinfo:47820//1001>Abyssal Stasis Webifier</url>')
+    assert parseDynamicItemStrings(text) == [(47820, 1001), (47820, 1002)]
+
+
+def test_resolve(StubEsi, tmp_path):
+    cachePath = str(tmp_path / 'dynamic')
+    resolver = DynamicItemResolver(cachePath=cachePath, server=StubEsi.apiServer)
+    data = resolver.resolve([(47820, 1001), (47820, 1002), (47820, 1001), (47820, 404)])
+    assert list(data) == [(47820, 1001), (47820, 1002), (47820, 404)]
+    assert data[(47820, 1002)]['source_type_id'] == 47819
+    assert data[(47820, 404)] is None
+    assert len(StubEsi.requests) == 3
+    resolver.resolve([(47820, 1002)])
+    assert len(StubEsi.requests) == 3
+    # Fetched items survive restart, missing ones are requested again
+    StubEsi.requests.clear()
+    resolver = DynamicItemResolver(cachePath=cachePath, server=StubEsi.apiServer)
+    data = resolver.resolve([(47820, 1001), (47820, 1002), (47820, 404)])
+    assert data[(47820, 1001)]['dogma_attributes'] == [{'attribute_id': 20, 'value': 1.001}]
+    assert len(StubEsi.requests) == 1
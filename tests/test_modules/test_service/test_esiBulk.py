@@ -0,0 +1,176 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+import config
+from service.esiAccess import APIException, EsiAccess
+from service.esiBulk import EsiBulkFittings, EsiErrorLimiter
+
+
+class StubEsiHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        with server.lock:
+            server.requests.append(('POST', self.path, body.decode()))
+            server.nextID += 1
+            fittingID = server.nextID
+            fail = server.failures > 0
+            server.failures -= 1
+        if fail:
+            self.reply(server.failureCode, {'error': 'Failed'})
+            return
+        self.reply(201, {'fitting_id': fittingID})
+
+    def do_DELETE(self):
+        with self.server.lock:
+            self.server.requests.append(('DELETE', self.path, None))
+        fittingID = int(re.search(r'/fittings/(\d+)/', self.path).group(1))
+        if fittingID == 404:
+            self.reply(404, {'error': 'Fitting not found'})
+            return
+        self.reply(204, None)
+
+    def reply(self, code, data):
+        body = json.dumps(data).encode() if data is not None else b''
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('X-ESI-Error-Limit-Remain', '100')
+        self.send_header('X-ESI-Error-Limit-Reset', '30')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubSsoChar:
+
+    def __init__(self, characterID):
+        self.characterID = characterID
+        self.characterName = 'Char {}'.format(characterID)
+        self.server = 'Stub'
+        self.accessToken = 'token'
+
+    @staticmethod
+    def is_token_expired():
+        return False
+
+
+@pytest.fixture
+def StubEsi(tmp_path, monkeypatch):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubEsiHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.nextID = 0
+    httpd.failures = 0
+    httpd.failureCode = 429
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    server = config.ApiServer('Stub', 'sso.invalid', 'http://127.0.0.1:{}'.format(httpd.server_address[1]), 'client', 'callback', False)
+    monkeypatch.setattr(config, 'savePath', str(tmp_path))
+    monkeypatch.setitem(config.supported_servers, 'Stub', server)
+
+    def init(self, server_base):
+        self.server_base = server_base
+        self.server_name = server_base.name
+
+    monkeypatch.setattr(EsiAccess, 'init', init)
+    yield SimpleNamespace(esi=EsiAccess(), httpd=httpd)
+    httpd.shutdown()
+
+
+def test_upload(StubEsi):
+    chars = [StubSsoChar(90000001), StubSsoChar(90000002)]
+    jobs = [(char, json.dumps({'name': 'Fit {}'.format(i)})) for char in chars for i in range(5)]
+    StubEsi.httpd.failures = 2
+    sleeps = []
+    progress = SimpleNamespace(current=0, userCancelled=False)
+    results = EsiBulkFittings(StubEsi.esi, maxWorkers=4, sleep=sleeps.append).upload(jobs, progress)
+    assert [r.error for r in results] == [None] * 10
+    assert len({r.fittingID for r in results}) == 10
+    assert [(r.ssoChar, r.data) for r in results] == jobs
+    assert progress.current == 10
+    # 10 uploads and 2 retries
+    assert len(StubEsi.httpd.requests) == 12
+    assert len(sleeps) == 2
+
+
+def test_upload_notRetried(StubEsi):
+    char = StubSsoChar(90000001)
+    jobs = [(char, json.dumps({'name': 'Fit'}))]
+    # Fitting might have been stored before gateway failed, retry could duplicate it
+    StubEsi.httpd.failures = 1
+    StubEsi.httpd.failureCode = 502
+    results = EsiBulkFittings(StubEsi.esi, sleep=lambda d: None).upload(jobs)
+    assert isinstance(results[0].error, APIException)
+    assert results[0].error.status_code == 502
+    assert len(StubEsi.httpd.requests) == 1
+
+
+def test_upload_notConnected(StubEsi):
+    # Nothing listens on the port anymore, so requests never get sent
+    StubEsi.httpd.shutdown()
+    StubEsi.httpd.server_close()
+    sleeps = []
+    results = EsiBulkFittings(StubEsi.esi, sleep=sleeps.append).upload([(StubSsoChar(90000001), json.dumps({'name': 'Fit'}))])
+    assert EsiBulkFittings.isNotSent(results[0].error)
+    assert len(sleeps) == EsiBulkFittings.maxRetries
+
+
+def test_delete(StubEsi):
+    char = StubSsoChar(90000001)
+    results = EsiBulkFittings(StubEsi.esi).delete([(char, 1), (char, 404), (char, 2)])
+    assert [r.fittingID for r in results] == [1, 404, 2]
+    assert results[0].error is None
+    assert isinstance(results[1].error, APIException)
+    assert results[1].error.status_code == 404
+    # Not found is not worth retrying
+    assert len(StubEsi.httpd.requests) == 3
+
+
+def test_cancelled(StubEsi):
+    progress = SimpleNamespace(current=0, userCancelled=True)
+    results = EsiBulkFittings(StubEsi.esi).delete([(StubSsoChar(90000001), 1)], progress)
+    assert results == [None]
+    assert StubEsi.httpd.requests == []
+
+
+def test_errorLimiter():
+    now = [100]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    limiter = EsiErrorLimiter(clock=lambda: now[0], sleep=sleep)
+    limiter.wait()
+    limiter.update({'X-ESI-Error-Limit-Remain': '50', 'X-ESI-Error-Limit-Reset': '20'})
+    limiter.wait()
+    assert sleeps == []
+    limiter.update({'X-ESI-Error-Limit-Remain': '5', 'X-ESI-Error-Limit-Reset': '20'})
+    limiter.wait()
+    assert sleeps == [20]
+    limiter.block(7)
+    limiter.wait()
+    assert sleeps == [20, 7]
+    # Responses without the headers change nothing
+    limiter.update({})
+    limiter.wait()
+    assert sleeps == [20, 7]
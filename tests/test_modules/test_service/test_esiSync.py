@@ -0,0 +1,168 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+import config
+from service.esiAccess import EsiAccess
+from service.esiSync import EsiCharacterSync
+
+
+class MockEsiHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.inFlight += 1
+            server.maxInFlight = max(server.maxInFlight, server.inFlight)
+            server.requests.append((self.path, self.headers.get('If-None-Match'), self.headers.get('Authorization')))
+        try:
+            time.sleep(0.02)
+            match = re.match(r'/v4/characters/(\d+)/skills/', self.path)
+            if match:
+                charID = int(match.group(1))
+                etag = '"skills{}-{}"'.format(charID, server.skillsVersion)
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.reply({'skills': [{'skill_id': 3300, 'trained_skill_level': charID % 6}]}, etag)
+                return
+            match = re.match(r'/v5/characters/(\d+)/', self.path)
+            self.reply({'security_status': int(match.group(1)) / 10})
+        finally:
+            with server.lock:
+                server.inFlight -= 1
+
+    def reply(self, data, etag=None):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def MockEsi(tmp_path, monkeypatch):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), MockEsiHandler)
+    httpd.lock = threading.Lock()
+    httpd.inFlight = httpd.maxInFlight = 0
+    httpd.requests = []
+    httpd.skillsVersion = 1
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    server = config.ApiServer('Mock', 'sso.invalid', 'http://127.0.0.1:{}'.format(httpd.server_address[1]), 'client', 'callback', False)
+    monkeypatch.setattr(config, 'savePath', str(tmp_path))
+    monkeypatch.setitem(config.supported_servers, 'Mock', server)
+
+    def init(self, server_base):
+        self.server_base = server_base
+        self.server_name = server_base.name
+
+    monkeypatch.setattr(EsiAccess, 'init', init)
+    esi = EsiAccess()
+    yield SimpleNamespace(esi=esi, httpd=httpd)
+    httpd.shutdown()
+
+
+class MockSsoChar(SimpleNamespace):
+    # Characters are used as dict keys, as SSO characters are
+    __hash__ = object.__hash__
+
+
+def makeChars(amount):
+    return [
+        MockSsoChar(
+            characterID=90000000 + i, characterName='Char {}'.format(i), server='Mock',
+            accessToken='token{}'.format(i), is_token_expired=lambda: False)
+        for i in range(amount)]
+
+
+def test_fetchAll(MockEsi):
+    chars = makeChars(12)
+    results = EsiCharacterSync(MockEsi.esi, maxWorkers=4).fetchAll(chars)
+    assert [r.ssoChar for r in results] == chars
+    for char, result in zip(chars, results):
+        assert result.error is None
+        assert result.modified
+        assert result.skills == {3300: char.characterID % 6}
+        assert result.secStatus == char.characterID / 10
+    assert 1 < MockEsi.httpd.maxInFlight <= 4
+    # Every request carries token of its own character
+    for path, _, auth in MockEsi.httpd.requests:
+        charID = int(re.search(r'/characters/(\d+)/', path).group(1))
+        assert auth == 'Bearer token{}'.format(charID - 90000000)
+
+
+def test_fetchAll_conditional(MockEsi):
+    chars = makeChars(3)
+    sync = EsiCharacterSync(MockEsi.esi)
+    sync.fetchAll(chars)
+    MockEsi.httpd.requests.clear()
+    results = sync.fetchAll(chars)
+    assert [r.modified for r in results] == [False] * 3
+    assert results[1].skills == {3300: chars[1].characterID % 6}
+    assert all(etag is not None for path, etag, _ in MockEsi.httpd.requests if 'skills' in path)
+    MockEsi.httpd.skillsVersion = 2
+    assert [r.modified for r in sync.fetchAll(chars)] == [True] * 3
+
+
+def test_fetchAll_stopped(MockEsi):
+    results = EsiCharacterSync(MockEsi.esi).fetchAll(makeChars(3), running=lambda: False)
+    assert results == [None] * 3
+    assert MockEsi.httpd.requests == []
+
+
+class TokenEsi:
+    """Hands out new tokens, remembering in which thread characters got them"""
+
+    def __init__(self):
+        self.requestThreads = []
+        self.updates = []
+
+    def select_server(self, ssoChar):
+        pass
+
+    def refresh_call(self, refreshToken):
+        self.requestThreads.append(threading.current_thread())
+        if refreshToken == 'revoked':
+            raise ValueError('invalid_grant')
+        return {'access_token': 'new-{}'.format(refreshToken), 'expires_in': 1200}
+
+    def update_token(self, char, tokenResponse):
+        self.updates.append((char.characterID, tokenResponse['access_token'], threading.current_thread()))
+
+
+def test_refreshTokens():
+    chars = makeChars(3)
+    for char, refreshToken in zip(chars, ('refresh0', 'revoked')):
+        char.refreshToken = refreshToken
+        char.is_token_expired = lambda: True
+    esi = TokenEsi()
+    errors = EsiCharacterSync(esi, maxWorkers=2).refreshTokens(chars)
+    assert list(errors) == [chars[1]]
+    assert isinstance(errors[chars[1]], ValueError)
+    # Valid token is not refreshed; requests go to workers, characters are only updated here
+    assert len(esi.requestThreads) == 2
+    assert threading.current_thread() not in esi.requestThreads
+    assert esi.updates == [(chars[0].characterID, 'new-refresh0', threading.current_thread())]
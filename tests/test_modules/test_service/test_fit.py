@@ -31,3 +31,16 @@ def test_getFitsWithShip_RifterFit(DB, RifterFit):
     assert Fit.getFitsWithShip(587)[0][1] == 'My Rifter Fit'
 
     DB['db'].remove(RifterFit)
+
+
+def test_scheduleRecalc_withoutApp(DB, RifterFit):
+    DB['db'].save(RifterFit)
+
+    # Without running wx app, recalc is done right away
+    results = []
+    Fit.getInstance().scheduleRecalc(RifterFit.ID, results.append)
+    assert len(results) == 1
+    assert results[0] == {}
+    assert RifterFit.ship.getModifiedItemAttr('hp') is not None
+
+    DB['db'].remove(RifterFit)
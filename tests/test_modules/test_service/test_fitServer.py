@@ -0,0 +1,106 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import http.client
+import json
+import threading
+
+import pytest
+
+pytest.importorskip('wx')
+
+from service.fitServer import FitServer, FitServerError, parseFitRequest
+
+
+EFT_FIT = '[Rifter, Test]\n200mm AutoCannon II, EMP S\n'
+DNA_FIT = '587:2873;3::'
+ESI_FIT = {'ship_type_id': 587, 'name': 'Test', 'description': '', 'items': []}
+
+
+class LengthEvaluator:
+    """Evaluates fits to their length, fails on fits saying so"""
+
+    workers = 2
+
+    def __init__(self):
+        self.calls = []
+
+    def evaluate(self, fitStrings):
+        self.calls.append(fitStrings)
+        return [{'error': 'Could not parse fit'} if f == 'fail' else {'type': 'Test', 'fits': [{'length': len(f)}]} for f in fitStrings]
+
+
+@pytest.fixture
+def Server():
+    httpd = FitServer(('127.0.0.1', 0), LengthEvaluator())
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(conn, body, path='/fits'):
+    if not isinstance(body, bytes):
+        body = body.encode()
+    conn.request('POST', path, body=body)
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+def test_parseFitRequest():
+    assert parseFitRequest(EFT_FIT.encode()) == ([EFT_FIT], False)
+    assert parseFitRequest(DNA_FIT.encode()) == ([DNA_FIT], False)
+    esiFit = json.dumps(ESI_FIT)
+    assert parseFitRequest(esiFit.encode()) == ([esiFit], False)
+    assert parseFitRequest(json.dumps({'fits': [EFT_FIT, ESI_FIT]}).encode()) == ([EFT_FIT, esiFit], True)
+    assert parseFitRequest(json.dumps([DNA_FIT]).encode()) == ([DNA_FIT], True)
+
+
+@pytest.mark.parametrize('body', [b'', b'  \n', b'\xff\xfe', b'{"fits": "x"}', b'[1]', b'42'])
+def test_parseFitRequest_invalid(body):
+    with pytest.raises(FitServerError) as excinfo:
+        parseFitRequest(body)
+    assert excinfo.value.code == 400
+
+
+def test_single(Server):
+    conn = http.client.HTTPConnection(*Server.server_address)
+    assert post(conn, EFT_FIT) == (200, {'type': 'Test', 'fits': [{'length': len(EFT_FIT)}]})
+    assert post(conn, 'fail') == (422, {'error': 'Could not parse fit'})
+    conn.close()
+
+
+def test_batch(Server):
+    conn = http.client.HTTPConnection(*Server.server_address)
+    status, data = post(conn, json.dumps({'fits': [EFT_FIT, 'fail', DNA_FIT]}))
+    assert status == 200
+    assert data['results'] == [
+        {'type': 'Test', 'fits': [{'length': len(EFT_FIT)}]},
+        {'error': 'Could not parse fit'},
+        {'type': 'Test', 'fits': [{'length': len(DNA_FIT)}]}]
+    # Whole batch goes to evaluator at once
+    assert Server.evaluator.calls == [[EFT_FIT, 'fail', DNA_FIT]]
+    conn.close()
+
+
+def test_keepAlive(Server):
+    conn = http.client.HTTPConnection(*Server.server_address)
+    post(conn, EFT_FIT)
+    sock = conn.sock
+    assert sock is not None
+    assert post(conn, 'x', path='/unknown')[0] == 404
+    assert post(conn, b'')[0] == 400
+    post(conn, DNA_FIT)
+    # All requests went over the same connection
+    assert conn.sock is sock
+    conn.request('GET', '/status')
+    resp = conn.getresponse()
+    status = json.loads(resp.read())
+    assert (status['workers'], status['requests'], status['fits']) == (2, 2, 2)
+    assert conn.sock is sock
+    conn.close()
@@ -0,0 +1,88 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import pytest
+
+pytest.importorskip('wx')
+
+import eos.config
+from service.itemNameResolver import ItemNameResolver, compileItemNames
+
+
+ROWS = [
+    (587, True, {'': 'Rifter', '_fr': 'Rifter', '_ru': 'Рифтер'}),
+    (2873, True, {'': '125mm Gatling AutoCannon II', '_fr': 'Autocanon Gatling de 125 mm II', '_ru': None}),
+    (3000, False, {'': 'Unpublished Thing', '_fr': 'Chose', '_ru': None}),
+    # Translation equal to English name of another type must not shadow it
+    (3001, True, {'': 'Other Thing', '_fr': 'Rifter', '_ru': 'Другое'}),
+    (3002, True, {'': 'Other Thing', '_fr': None, '_ru': None}),
+]
+LANGUAGES = ['', '_fr', '_ru']
+CONVERSIONS = {'Old Gatling': '125mm Gatling AutoCannon II', 'Other Thing': 'Rifter', 'Removed Thing': 'Nothing'}
+
+
+def test_compileItemNames():
+    names = compileItemNames(ROWS, LANGUAGES, CONVERSIONS)
+    assert names['Rifter'] == 587
+    assert names['Рифтер'] == 587
+    assert names['Autocanon Gatling de 125 mm II'] == 2873
+    assert names['Другое'] == 3001
+    assert names['Unpublished Thing'] == 3000
+    # Translations are only kept for published types
+    assert 'Chose' not in names
+    # Conversions go through new English name and win over current names
+    assert names['Old Gatling'] == 2873
+    assert names['Other Thing'] == 587
+    assert 'Removed Thing' not in names
+
+
+@pytest.fixture
+def Resolver(tmp_path, monkeypatch):
+    fetches = []
+
+    def fetchRows(languages):
+        fetches.append(languages)
+        return ROWS
+
+    monkeypatch.setattr(ItemNameResolver, 'fetchRows', staticmethod(fetchRows))
+    monkeypatch.setattr(ItemNameResolver, 'getLanguages', staticmethod(lambda: LANGUAGES))
+    monkeypatch.setattr(eos.config, 'gamedata_version', '2000000')
+    cachePath = str(tmp_path / 'item_names.json')
+    yield lambda: ItemNameResolver(cachePath=cachePath, conversionMap=CONVERSIONS), fetches
+
+
+def test_resolve_persisted(Resolver, monkeypatch):
+    makeResolver, fetches = Resolver
+    resolver = makeResolver()
+    assert resolver.resolve('Old Gatling') == 2873
+    assert resolver.resolve('Autocanon Gatling de 125 mm II') == 2873
+    assert resolver.resolve('Nothing') is None
+    assert len(fetches) == 1
+    # Next start loads compiled map instead of querying gamedata
+    resolver = makeResolver()
+    assert resolver.resolve('Рифтер') == 587
+    assert len(fetches) == 1
+    # New gamedata gets map recompiled, also in running resolver
+    monkeypatch.setattr(eos.config, 'gamedata_version', '2000001')
+    assert resolver.resolve('Rifter') == 587
+    assert len(fetches) == 2
+
+
+def test_resolve_unavailable(Resolver, monkeypatch):
+    makeResolver, fetches = Resolver
+
+    def fetchRows(languages):
+        fetches.append(languages)
+        raise RuntimeError('no gamedata')
+
+    monkeypatch.setattr(ItemNameResolver, 'fetchRows', staticmethod(fetchRows))
+    resolver = makeResolver()
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            resolver.resolve('Rifter')
+    # Failure is not retried until gamedata changes
+    assert len(fetches) == 1
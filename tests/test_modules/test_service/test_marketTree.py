@@ -0,0 +1,77 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from service.market import MarketTreeIndex
+
+
+class FakeMarket:
+
+    def __init__(self):
+        leafA = SimpleNamespace(ID=3, name='Small', items=['Gun II', 'Gun I'], children=[], iconID=10)
+        leafB = SimpleNamespace(ID=4, name='Broken', items=[], children=[], iconID=None)
+        root = SimpleNamespace(ID=2, name='Turrets', items=[], children=[leafB, leafA], iconID=20)
+        self.marketGroups = {mg.ID: mg for mg in (root, leafA, leafB)}
+        self.SHOWN_MARKET_GROUPS = set(self.marketGroups)
+        self.requests = []
+
+    def getMarketGroup(self, mgID, eager=None):
+        self.requests.append(mgID)
+        return self.marketGroups.get(mgID)
+
+    @staticmethod
+    def getMarketGroupChildren(mg):
+        return list(mg.children)
+
+    @staticmethod
+    def marketGroupHasTypesCheck(mg):
+        return len(mg.items) > 0 and len(mg.children) == 0
+
+    @staticmethod
+    def marketGroupValidityCheck(mg):
+        return mg.ID != 4
+
+    @staticmethod
+    def getIconByMarketGroup(mg):
+        return mg.iconID
+
+    @staticmethod
+    def getItemsByMarketGroup(mg):
+        return set(mg.items)
+
+    @staticmethod
+    def itemSort(item):
+        return item
+
+
+def test_getNode():
+    market = FakeMarket()
+    index = MarketTreeIndex(market)
+    root = index.getNode(2)
+    assert (root.name, root.icon, root.hasItems, root.childIDs, root.items) == ('Turrets', 20, False, (3,), ())
+    leaf = index.getNode(3)
+    assert (leaf.hasItems, leaf.valid, leaf.items) == (True, True, ('Gun I', 'Gun II'))
+    assert index.getNode(4).valid is False
+    assert index.getNode(3) is leaf
+    assert index.getNode(99) is None
+    assert market.requests == [2, 3, 4, 99]
+
+
+def test_build():
+    market = FakeMarket()
+    index = MarketTreeIndex(market)
+    index.build()
+    assert set(index.nodes) == {2, 3, 4}
+    index.getNode(3)
+    assert market.requests == [2, 3, 4]
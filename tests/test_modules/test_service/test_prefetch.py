@@ -0,0 +1,59 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+import config
+from service import prefetch
+
+
+class StubSettings(dict):
+
+    def save(self):
+        self.saved = True
+
+
+@pytest.fixture
+def DBState(monkeypatch, tmp_path):
+    """Saveddata file whose fingerprint is controlled by test, with empty validation state"""
+    saveDB = tmp_path / 'saveddata.db'
+    saveDB.write_bytes(b'')
+    state = {'fingerprint': 1}
+    monkeypatch.setattr(config, 'saveDB', str(saveDB))
+    monkeypatch.setattr(prefetch, 'getFingerprint', lambda: state['fingerprint'])
+    monkeypatch.setattr(prefetch, 'validationSettings', StubSettings(fingerprint=None, checks=()))
+    monkeypatch.setattr(prefetch, 'validatedChecks', set())
+    return state
+
+
+def test_storeValidationState_afterOwnWrites(DBState):
+    for check in prefetch.VALIDATION_CHECKS:
+        prefetch.validatedChecks.add(check)
+        # pyfa's own writes between and after checks
+        DBState['fingerprint'] += 1
+    prefetch.storeValidationState()
+    assert prefetch.validationSettings.saved
+    assert prefetch.validationSettings['fingerprint'] == DBState['fingerprint']
+    assert prefetch.loadValidationState() == set(prefetch.VALIDATION_CHECKS)
+
+
+def test_storeValidationState_incomplete(DBState):
+    prefetch.validatedChecks.update(prefetch.VALIDATION_CHECKS[:-1])
+    prefetch.storeValidationState()
+    assert not hasattr(prefetch.validationSettings, 'saved')
+    assert prefetch.loadValidationState() == set()
+
+
+def test_loadValidationState_modifiedOutside(DBState):
+    prefetch.validatedChecks.update(prefetch.VALIDATION_CHECKS)
+    prefetch.storeValidationState()
+    DBState['fingerprint'] += 1
+    assert prefetch.loadValidationState() == set()
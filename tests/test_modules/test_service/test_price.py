@@ -0,0 +1,154 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from eos.saveddata.price import Price as PriceObj, PriceStatus
+from service.network import Network
+from service.price import Price
+
+
+class StubMarketHandler(BaseHTTPRequestHandler):
+    """Fuzzwork-like aggregates endpoint: /<source name>?types=1,2,3"""
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        config = server.sourceConfig[url.path.strip('/')]
+        with server.lock:
+            server.requests.append(url.path)
+            server.active += 1
+            server.maxActive = max(server.maxActive, server.active)
+        try:
+            time.sleep(config.get('delay', 0))
+            if config.get('fail'):
+                self.send_response(500)
+                self.end_headers()
+                return
+            typeIDs = [int(t) for t in parse_qs(url.query)['types'][0].split(',')]
+            data = {str(t): {'sell': {'percentile': config['price']}} for t in typeIDs}
+            body = json.dumps(data).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def StubServer():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubMarketHandler)
+    server.sourceConfig = {}
+    server.requests = []
+    server.lock = threading.Lock()
+    server.active = 0
+    server.maxActive = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def makeSource(server, name, **config):
+    server.sourceConfig[name] = config
+    baseurl = 'http://127.0.0.1:{}/{}'.format(server.server_address[1], name)
+
+    class StubSource:
+
+        def __init__(self, priceMap, system, fetchTimeout):
+            network = Network.getInstance()
+            params = {'types': ','.join(str(typeID) for typeID in priceMap)}
+            resp = network.get(url=baseurl, type=network.PRICES, params=params, timeout=fetchTimeout)
+            for typeID, typeData in resp.json().items():
+                priceMap[int(typeID)].update(PriceStatus.fetchSuccess, typeData['sell']['percentile'])
+                del priceMap[int(typeID)]
+
+    StubSource.name = name
+    StubSource.group = 'stub'
+    return StubSource
+
+
+@pytest.fixture
+def StubSources(StubServer, monkeypatch):
+    sources = {}
+    monkeypatch.setattr(Price, 'sources', sources)
+
+    def register(name, **config):
+        sources[name] = makeSource(StubServer, name, **config)
+    return register
+
+
+def getPriceMap(typeIDs):
+    return {typeID: PriceObj(typeID) for typeID in typeIDs}
+
+
+def test_fetchFromSources_chunks(StubServer, StubSources, monkeypatch):
+    monkeypatch.setattr(Price, 'fetchChunkSize', 100)
+    StubSources('primary', price=5, delay=0.2)
+    priceMap = getPriceMap(range(1, 251))
+    prices = list(priceMap.values())
+    timedOut = Price.fetchFromSources(priceMap, ['primary'], None, 10)
+    assert priceMap == {}
+    assert timedOut == {'primary': False}
+    assert all(p.status == PriceStatus.fetchSuccess and p.price == 5 for p in prices)
+    assert len(StubServer.requests) == 3
+    assert StubServer.maxActive > 1
+
+
+def test_fetchFromSources_fallbackOnFailure(StubServer, StubSources):
+    StubSources('primary', fail=True)
+    StubSources('fallback', price=7)
+    priceMap = getPriceMap([34, 35])
+    prices = list(priceMap.values())
+    timedOut = Price.fetchFromSources(priceMap, ['primary', 'fallback'], None, 10)
+    assert priceMap == {}
+    assert timedOut == {'primary': False, 'fallback': False}
+    assert all(p.price == 7 for p in prices)
+
+
+def test_fetchFromSources_hedge(StubServer, StubSources):
+    # Primary is slower than hedge delay, so fallback is started and wins
+    StubSources('primary', price=5, delay=3)
+    StubSources('fallback', price=7)
+    priceMap = getPriceMap([34])
+    price = priceMap[34]
+    start = time.monotonic()
+    Price.fetchFromSources(priceMap, ['primary', 'fallback'], None, 10)
+    assert priceMap == {}
+    assert price.price == 7
+    # Slow primary is not waited for once everything is fetched
+    assert time.monotonic() - start < 3
+
+
+def test_fetchFromSources_timeout(StubServer, StubSources):
+    StubSources('primary', price=5, delay=2)
+    StubSources('fallback', price=7, delay=2)
+    priceMap = getPriceMap([34])
+    price = priceMap[34]
+    timedOut = Price.fetchFromSources(priceMap, ['primary', 'fallback'], None, 0.5)
+    assert list(priceMap) == [34]
+    assert timedOut == {'primary': True, 'fallback': True}
+    # Answers which arrive too late are ignored
+    time.sleep(2)
+    assert price.status == PriceStatus.initialized
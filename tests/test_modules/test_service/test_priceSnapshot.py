@@ -0,0 +1,101 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import json
+from time import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from eos.saveddata.price import PriceStatus
+from service import priceSnapshot
+from service.priceSnapshot import PriceSnapshot, SNAPSHOT_FORMAT
+
+
+@pytest.fixture
+def SnapshotFile(DB, tmp_path):
+    path = str(tmp_path / 'prices.json')
+    snapshotTime = int(time()) - 60
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'format': SNAPSHOT_FORMAT,
+            'time': snapshotTime,
+            'source': 'fuzzwork market',
+            'prices': {'587': [350000.0, snapshotTime], '34': [5.5, snapshotTime - 60]}}, f)
+    yield path, snapshotTime
+    DB['db'].clearPrices()
+
+
+def test_importFile(DB, SnapshotFile):
+    path, snapshotTime = SnapshotFile
+    snapshot = PriceSnapshot.importFile(path)
+    assert snapshot.typeCount == 2
+    assert DB['db'].getLatestPriceSnapshot() is snapshot
+    price = DB['db'].getPrice(34)
+    assert price.status == PriceStatus.fetchSuccess
+    assert price.price == 5.5
+    assert price.snapshotID == snapshot.ID
+    assert price.age >= 120
+    # Same snapshot is not imported twice
+    assert PriceSnapshot.importFile(path) is None
+
+
+def test_exportFile(DB, SnapshotFile, tmp_path):
+    path, snapshotTime = SnapshotFile
+    PriceSnapshot.importFile(path)
+    exportPath = str(tmp_path / 'exported.json')
+    assert PriceSnapshot.exportFile(exportPath) is True
+    with open(exportPath, encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['time'] == snapshotTime
+    assert data['prices'] == {'587': [350000.0, snapshotTime], '34': [5.5, snapshotTime - 60]}
+
+
+def test_storeSnapshot_clearsFailed(DB, SnapshotFile):
+    path, snapshotTime = SnapshotFile
+    PriceSnapshot.importFile(path)
+    prices = [DB['db'].getPrice(587), DB['db'].getPrice(34)]
+    startTime = time()
+    prices[0].update(PriceStatus.fetchSuccess, 360000.0)
+    prices[1].update(PriceStatus.fetchFail)
+    snapshot = PriceSnapshot.storeSnapshot(prices, startTime, 'fuzzwork market')
+    assert snapshot.typeCount == 1
+    assert prices[0].snapshotID == snapshot.ID
+    # Price which failed to refresh is fetched on demand again
+    assert prices[1].snapshotID is None
+
+
+def test_refresh_batches(DB, monkeypatch):
+    triggered = []
+    worker = SimpleNamespace(trigger=lambda prices, cb, fetchTimeout, validityOverride: triggered.append((prices, cb)))
+    monkeypatch.setattr(priceSnapshot.Price, 'getInstance', lambda: SimpleNamespace(priceWorkerThread=worker))
+    monkeypatch.setattr(priceSnapshot.Fit, 'getInstance', lambda: SimpleNamespace(serviceFittingOptions={'priceSource': 'fuzzwork market'}))
+    monkeypatch.setattr(DB['db'], 'getMarketTypeIDs', lambda: [587, 34, 35, 36, 37])
+    monkeypatch.setattr(PriceSnapshot, 'fetchBatchSize', 2)
+    snapshots = []
+    sPriceSnapshot = object.__new__(PriceSnapshot)
+    sPriceSnapshot.refreshing = False
+    try:
+        sPriceSnapshot.refresh(snapshots.append)
+        # Each batch is queued only once the previous one was fetched
+        for batchCount, typeIDs in enumerate(([587, 34], [35, 36], [37]), 1):
+            assert len(triggered) == batchCount
+            prices, cb = triggered[-1]
+            assert [p.typeID for p in prices] == typeIDs
+            for price in prices:
+                price.update(PriceStatus.fetchSuccess, 100.0)
+            assert not snapshots
+            cb()
+        assert len(triggered) == 3
+        assert sPriceSnapshot.refreshing is False
+        assert snapshots[0].typeCount == 5
+    finally:
+        DB['db'].clearPrices()
@@ -0,0 +1,204 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+wx = pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+import eos.db
+from service.fit import Fit, FitCommandProcessor, RecalcWorkerThread
+
+
+def makeFitService(monkeypatch, worker=None):
+    """Fit service without database: recalc and fill only record what they got"""
+    sFit = object.__new__(Fit)
+    sFit.calcLock = threading.RLock()
+    sFit.recalcWorkerThread = worker
+    sFit.recalculated = []
+    sFit.recalcThreads = []
+    sFit.filled = []
+
+    def recalc(self, fit):
+        if fit.ID == 666:
+            raise ValueError('broken fit')
+        self.recalculated.append(fit.ID)
+        self.recalcThreads.append(threading.current_thread())
+
+    def fill(fit):
+        sFit.filled.append(fit.ID)
+        return {0: 'dummy of {}'.format(fit.ID)}
+
+    monkeypatch.setattr(Fit, 'recalc', recalc)
+    sFit.fill = fill
+    monkeypatch.setattr(eos.db, 'commit', lambda: None)
+    monkeypatch.setattr(Fit, 'instance', sFit)
+    return sFit
+
+
+def test_finish_takesPending(monkeypatch):
+    worker = RecalcWorkerThread(None)
+    fit1 = SimpleNamespace(ID=1)
+    fit2 = SimpleNamespace(ID=2)
+    worker.scheduleRecalc(fit1, 'a')
+    worker.scheduleRecalc(fit2, 'b')
+    worker.scheduleRecalc(fit1, 'c')
+    calculated, pending = worker.finish()
+    assert calculated == []
+    assert pending.fits == [fit1, fit2]
+    assert pending.callbacks == [(1, 'a'), (2, 'b'), (1, 'c')]
+    # Nothing is left for worker
+    assert worker.finish() == ([], None)
+
+
+def test_finish_waitsForBatchInFlight():
+    worker = RecalcWorkerThread(None)
+    batch = worker.inFlight = object()
+
+    def complete():
+        time.sleep(0.05)
+        with worker.cv:
+            worker.inFlight = None
+            worker.calculated.append(batch)
+            worker.cv.notify_all()
+
+    thread = threading.Thread(target=complete)
+    thread.start()
+    calculated, pending = worker.finish()
+    thread.join()
+    assert calculated == [batch]
+    assert pending is None
+
+
+def test_finishRecalcs(monkeypatch):
+    worker = RecalcWorkerThread(None)
+    sFit = makeFitService(monkeypatch, worker)
+    results = []
+    worker.scheduleRecalc(SimpleNamespace(ID=1), lambda d: results.append(('first', d)))
+    worker.scheduleRecalc(SimpleNamespace(ID=1), lambda d: results.append(('second', d)))
+    sFit.finishRecalcs()
+    assert sFit.recalculated == [1]
+    assert sFit.filled == [1]
+    # Only the last request for a fit gets removed dummies
+    assert results == [('first', {}), ('second', {0: 'dummy of 1'})]
+
+
+def test_recalcErrors_logged(monkeypatch):
+    worker = RecalcWorkerThread(None)
+    sFit = makeFitService(monkeypatch, worker)
+    results = []
+
+    def brokenCallback(removedDummies):
+        raise RuntimeError('broken callback')
+
+    worker.scheduleRecalc(SimpleNamespace(ID=666), brokenCallback)
+    worker.scheduleRecalc(SimpleNamespace(ID=2), results.append)
+    worker.scheduleRecalc(SimpleNamespace(ID=3), None)
+    # Neither failed recalc nor failed callback propagate, and other fits of the
+    # batch are still recalculated
+    sFit.finishRecalcs()
+    assert sFit.recalculated == [2, 3]
+    assert sFit.filled == [666, 2, 3]
+    assert results == [{0: 'dummy of 2'}]
+
+
+def test_recalcDone_once(monkeypatch):
+    worker = RecalcWorkerThread(None)
+    sFit = makeFitService(monkeypatch, worker)
+    results = []
+    worker.scheduleRecalc(SimpleNamespace(ID=1), results.append)
+    calculated, batch = worker.finish()
+    sFit._recalcBatch(batch)
+    sFit._recalcDone(batch)
+    # Late CallAfter of batch finished by main thread does nothing
+    sFit._recalcDone(batch)
+    assert len(results) == 1
+    assert sFit.filled == [1]
+
+
+class RecordingCommand(wx.Command):
+
+    def __init__(self, sFit, log):
+        wx.Command.__init__(self, True, 'Recording')
+        self.sFit = sFit
+        self.log = log
+
+    def lockedElsewhere(self):
+        result = []
+
+        def probe():
+            acquired = self.sFit.calcLock.acquire(blocking=False)
+            if acquired:
+                self.sFit.calcLock.release()
+            result.append(not acquired)
+
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def Do(self):
+        self.log.append(('do', list(self.sFit.filled), self.lockedElsewhere()))
+        return True
+
+    def Undo(self):
+        self.log.append(('undo', list(self.sFit.filled), self.lockedElsewhere()))
+        return True
+
+
+def test_commandProcessor(monkeypatch):
+    worker = RecalcWorkerThread(None)
+    sFit = makeFitService(monkeypatch, worker)
+    log = []
+    processor = FitCommandProcessor(maxCommands=100)
+    worker.scheduleRecalc(SimpleNamespace(ID=1), None)
+    processor.Submit(RecordingCommand(sFit, log))
+    worker.scheduleRecalc(SimpleNamespace(ID=2), None)
+    processor.Undo()
+    # New command leaves pending recalcs to the worker, undo needs their results
+    # and finishes them; both run with calculation lock held
+    assert log == [('do', [], True), ('undo', [1, 2], True)]
+
+
+class SchedulingCommand(wx.Command):
+
+    def __init__(self, worker, fitID):
+        wx.Command.__init__(self, True, 'Scheduling')
+        self.worker = worker
+        self.fitID = fitID
+
+    def Do(self):
+        self.worker.scheduleRecalc(SimpleNamespace(ID=self.fitID), None)
+        return True
+
+
+def test_commandProcessor_coalesces(monkeypatch):
+    calledAfter = []
+    monkeypatch.setattr(wx, 'CallAfter', lambda func, *args: calledAfter.append((func, args)))
+    worker = RecalcWorkerThread(None)
+    sFit = makeFitService(monkeypatch, worker)
+    worker.sFit = sFit
+    worker.start()
+    try:
+        processor = FitCommandProcessor(maxCommands=100)
+        for _ in range(5):
+            processor.Submit(SchedulingCommand(worker, 1))
+        deadline = time.time() + 5
+        while not calledAfter and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+        worker.join()
+    # Burst of commands is recalculated once, and never in main thread
+    assert sFit.recalculated == [1]
+    assert sFit.recalcThreads == [worker]
+    assert len(calledAfter) == 1
@@ -0,0 +1,89 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from service.market import VariationIndex
+
+
+class FakeItem:
+
+    def __init__(self, typeID, name, parentID=None, groupID=53, categoryID=7, categoryName='Module'):
+        self.ID = typeID
+        self.name = name
+        self.variationParentTypeID = parentID
+        self.group = SimpleNamespace(ID=groupID)
+        self.category = SimpleNamespace(ID=categoryID, name=categoryName)
+        self.marketGroupID = None
+
+    def __repr__(self):
+        return self.name
+
+
+@pytest.fixture
+def Index(DB, monkeypatch):
+    gun = FakeItem(1, 'Gun I')
+    gun2 = FakeItem(2, 'Gun II', parentID=1)
+    gunFaction = FakeItem(3, 'Faction Gun', parentID=1)
+    implantA = FakeItem(10, "Low-grade Snake Alpha", groupID=300, categoryID=20, categoryName='Implant')
+    implantB = FakeItem(11, "High-grade Snake Alpha", groupID=300, categoryID=20, categoryName='Implant')
+    implantC = FakeItem(12, "Low-grade Snake Beta", groupID=300, categoryID=20, categoryName='Implant')
+    parents = {2: gun, 3: gun}
+    items = {i.ID: i for i in (gun, gun2, gunFaction, implantA, implantB, implantC)}
+    requests = []
+
+    def getAllVariations():
+        requests.append('variations')
+        return [gun2, gunFaction]
+
+    def getGroup(groupID):
+        requests.append(groupID)
+        return SimpleNamespace(items=[implantA, implantB, implantC])
+
+    monkeypatch.setattr(DB['db'], 'getAllVariations', getAllVariations, raising=False)
+    monkeypatch.setattr(DB['db'], 'getGroup', getGroup)
+    market = SimpleNamespace(
+        ITEMS_FORCEDMETAGROUP_R={},
+        getParentItemByItem=lambda item: parents.get(item.ID, item),
+        getItem=lambda name: None)
+    return VariationIndex(market), items, requests
+
+
+def test_getVariations(Index):
+    index, items, requests = Index
+    assert index.getVariations((items[3],), False) == {items[1], items[2], items[3]}
+    assert index.getVariations((items[1],), True) == {items[1], items[2], items[3]}
+    assert index.getVariations((items[3],), False) == {items[1], items[2], items[3]}
+    assert requests == ['variations']
+
+
+def test_getVariations_implantFamily(Index):
+    index, items, requests = Index
+    assert index.getVariations((items[10],), False) == {items[10], items[11]}
+    assert index.getVariations((items[12],), False) == {items[12]}
+    assert requests == ['variations', 300]
+
+
+def test_getMarketGroupItems(Index):
+    index, items, requests = Index
+    calls = []
+
+    def find(mg, vars_):
+        calls.append((mg.ID, vars_))
+        return {items[1]}
+
+    mg = SimpleNamespace(ID=5)
+    assert index.getMarketGroupItems(mg, True, find) == {items[1]}
+    assert index.getMarketGroupItems(mg, True, find) == {items[1]}
+    assert index.getMarketGroupItems(mg, False, find) == {items[1]}
+    assert calls == [(5, True), (5, False)]
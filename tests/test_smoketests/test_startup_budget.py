@@ -0,0 +1,45 @@
+"""
+Startup time budget: run pyfa in headless mode with startup report enabled and make
+sure cold start (without one-off gamedata DB build) fits into the budget.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('wx')
+
+_root = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+# Seconds; override via environment for slow CI machines
+STARTUP_BUDGET = float(os.environ.get('PYFA_STARTUP_BUDGET', 15))
+
+
+@pytest.fixture(scope='module')
+def startupReport(tmp_path_factory):
+    tmpDir = tmp_path_factory.mktemp('startup')
+    reportPath = str(tmpDir / 'startup.json')
+    subprocess.run(
+        [sys.executable, os.path.join(_root, 'pyfa.py'), '--headless',
+         '--savepath', str(tmpDir / 'savedata'), '--startup-report', reportPath],
+        cwd=_root, check=True, timeout=600)
+    with open(reportPath, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_startupReport_headless(startupReport):
+    phaseNames = [p['name'] for p in startupReport['phases']]
+    assert startupReport['headless'] is True
+    assert 'eos.db import' in phaseNames
+    assert 'saveddata migration' in phaseNames
+    assert 'market' in phaseNames
+    assert all(p['duration'] is not None for p in startupReport['phases'])
+    assert any(i['module'] == 'eos.db' for i in startupReport['imports'])
+
+
+def test_startupReport_withinBudget(startupReport):
+    durations = {p['name']: p['duration'] for p in startupReport['phases']}
+    elapsed = (startupReport['total'] - durations.get('gamedata update', 0)) / 1000
+    assert elapsed <= STARTUP_BUDGET, 'Startup took {:.2f}s, budget is {:.2f}s'.format(elapsed, STARTUP_BUDGET)
@@ -0,0 +1,168 @@
+"""
+Wall time instrumentation for pyfa startup.
+
+Records duration of named startup phases and of every module imported while the
+profiler is active, and dumps them as JSON report, e.g.:
+
+    profiler = StartupProfiler()
+    profiler.start()
+    with profiler.phase('eos.db'):
+        import eos.db
+    profiler.stop()
+    profiler.writeReport('startup.json')
+
+Import times are collected by wrapping builtins.__import__ and importlib.import_module
+(which is used to load eos effects, migrations and such); time spent in nested
+imports is subtracted from the importing module's own time, same way as python's
+-X importtime does it.
+"""
+
+import builtins
+import importlib
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+
+
+REPORT_FORMAT = 1
+
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.startTime = None
+        self.stopTime = None
+        self.phases = []
+        self.imports = []
+        self.__phaseStack = []
+        self.__importStack = []
+        self.__origImport = None
+        self.__origImportModule = None
+
+    @property
+    def elapsed(self):
+        # :return: time since start, in ms
+        if self.startTime is None:
+            return 0.0
+        endTime = self.stopTime if self.stopTime is not None else time.perf_counter()
+        return (endTime - self.startTime) * 1000
+
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        if self.startTime is None:
+            self.startTime = time.perf_counter()
+        self.stopTime = None
+        self.__origImport = builtins.__import__
+        self.__origImportModule = importlib.import_module
+        builtins.__import__ = self.__import
+        importlib.import_module = self.__importModule
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.stopTime = time.perf_counter()
+        if builtins.__import__ == self.__import:
+            builtins.__import__ = self.__origImport
+        if importlib.import_module == self.__importModule:
+            importlib.import_module = self.__origImportModule
+        self.__origImport = None
+        self.__origImportModule = None
+
+    def disable(self):
+        """Stop profiler and drop everything recorded so far."""
+        self.stop()
+        self.startTime = None
+        self.stopTime = None
+        self.phases.clear()
+        self.imports.clear()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        record = {
+            'name': name,
+            'parent': self.__phaseStack[-1]['name'] if self.__phaseStack else None,
+            'start': self.elapsed,
+            'duration': None}
+        self.phases.append(record)
+        self.__phaseStack.append(record)
+        try:
+            yield
+        finally:
+            self.__phaseStack.pop()
+            record['duration'] = self.elapsed - record['start']
+
+    def __import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Relative and already imported modules are not worth the bookkeeping
+        if level or name in sys.modules:
+            return self.__origImport(name, globals, locals, fromlist, level)
+        return self.__timeImport(name, self.__origImport, name, globals, locals, fromlist, level)
+
+    def __importModule(self, name, package=None):
+        if name.startswith('.') or name in sys.modules:
+            return self.__origImportModule(name, package)
+        return self.__timeImport(name, self.__origImportModule, name, package)
+
+    def __timeImport(self, name, importFunc, *args):
+        record = {
+            'module': name,
+            'phase': self.__phaseStack[-1]['name'] if self.__phaseStack else None,
+            'start': self.elapsed,
+            'cumulative': None,
+            'self': None}
+        self.imports.append(record)
+        self.__importStack.append(0.0)
+        startTime = time.perf_counter()
+        try:
+            return importFunc(*args)
+        finally:
+            cumulative = (time.perf_counter() - startTime) * 1000
+            nested = self.__importStack.pop()
+            if self.__importStack:
+                self.__importStack[-1] += cumulative
+            record['cumulative'] = cumulative
+            record['self'] = cumulative - nested
+
+    def report(self):
+        return {
+            'format': REPORT_FORMAT,
+            'python': platform.python_version(),
+            'platform': sys.platform,
+            'frozen': hasattr(sys, 'frozen'),
+            'total': self.elapsed,
+            'phases': list(self.phases),
+            'imports': list(self.imports)}
+
+    def writeReport(self, path, **extra):
+        report = self.report()
+        report.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def summary(self, limit=10):
+        """Return human-readable lines with top-level phases and slowest imports."""
+        lines = ['Startup took {:.1f}ms'.format(self.elapsed)]
+        for record in self.phases:
+            if record['parent'] is None and record['duration'] is not None:
+                lines.append('  {}: {:.1f}ms'.format(record['name'], record['duration']))
+        slowest = sorted(
+            (r for r in self.imports if r['self'] is not None),
+            key=lambda r: r['self'], reverse=True)[:limit]
+        if slowest:
+            lines.append('Slowest imports (self/cumulative):')
+            for record in slowest:
+                lines.append('  {}: {:.1f}ms/{:.1f}ms'.format(record['module'], record['self'], record['cumulative']))
+        return lines
+
+
+# Process-wide instance, started by pyfa.py before anything heavy gets imported
+startupProfiler = StartupProfiler()